@@ -111,6 +111,10 @@ from .road_network import (
     create_road_segment,
     ROAD_PRESETS,
 )
+from .road_graph import (
+    RoadGraph,
+    ContractionHierarchy,
+)
 
 # Phase 3: Buildings
 from .buildings import (
@@ -148,6 +152,11 @@ from .traffic_ai import (
     setup_traffic,
     TRAFFIC_PRESETS,
 )
+from .traffic_sim import (
+    TrafficSimulation,
+    TrafficBake,
+    UniformGrid,
+)
 
 # Phase 6: Chase Coordinator
 from .chase_coordinator import (
@@ -234,6 +243,8 @@ __all__ = [
     'create_road_network',
     'create_road_segment',
     'ROAD_PRESETS',
+    'RoadGraph',
+    'ContractionHierarchy',
 
     # === PHASE 3: BUILDINGS ===
     'BuildingGenerator',
@@ -265,6 +276,9 @@ __all__ = [
     'AgentState',
     'setup_traffic',
     'TRAFFIC_PRESETS',
+    'TrafficSimulation',
+    'TrafficBake',
+    'UniformGrid',
 
     # === PHASE 6: CHASE COORDINATOR ===
     'ChaseDirector',
@@ -158,8 +158,8 @@ class PathPlanner:
         Returns:
             List of waypoints
         """
-        # Get base route from road network
-        base_route = self.road_network.find_route(start, end)
+        # Get base route from road network as waypoints
+        base_route = self.road_network.find_route_waypoints(start, end)
 
         if not base_route:
             # Generate procedural route
@@ -0,0 +1,625 @@
+"""
+Road Graph - Indexed Routing for Road Networks
+
+Segment-level routing graph used by RoadNetwork.find_route.
+
+- Nodes are road segments; two segments are adjacent when the end of
+  one lies within the junction tolerance of the start of the other.
+- Adjacency is maintained incrementally as segments are added or
+  removed, using spatial hashes of segment endpoints.
+- Nearest-segment lookups use a 2D KD-tree over segment endpoints,
+  rebuilt lazily after edits.
+- Routes minimize driven length with A* (binary heap, straight-line
+  heuristic between segment midpoints).
+- An optional contraction hierarchy answers repeated queries with two
+  small upward searches instead of a full graph search.
+
+Edge weights are the mean of the two segment lengths, so a path's
+weight is its total length minus half the first and last segments;
+both are fixed for a query, so the shortest path is unchanged.
+
+Usage:
+    from lib.animation.city.road_graph import RoadGraph
+
+    graph = RoadGraph()
+    for segment in segments:
+        graph.add(segment)
+
+    start_id = graph.nearest_segment(0.0, 0.0)
+    end_id = graph.nearest_segment(500.0, 300.0)
+    route_ids = graph.shortest_path(start_id, end_id)
+
+    hierarchy = graph.build_contraction_hierarchy()
+    route_ids = hierarchy.shortest_path(start_id, end_id)
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+
+# Segments connect when endpoints are within this distance on x and y
+JUNCTION_TOLERANCE = 1.0
+
+# Witness searches in the contraction hierarchy stop after this many nodes
+WITNESS_SETTLE_LIMIT = 64
+
+Point2D = Tuple[float, float]
+Cell = Tuple[int, int]
+
+
+class EndpointKDTree:
+    """
+    Static 2D KD-tree over labelled points.
+
+    Ties are broken by the smaller label, so for integer labels in
+    insertion order the earliest point wins.
+    """
+
+    def __init__(self, points: Sequence[Tuple[float, float, int]]):
+        """
+        Build the tree.
+
+        Args:
+            points: (x, y, label) tuples
+        """
+        # Flat node storage: (x, y, label, axis, left, right)
+        self._nodes: List[Tuple[float, float, int, int, int, int]] = []
+        self._root = self._build(list(points), 0)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _build(self, points: List[Tuple[float, float, int]], depth: int) -> int:
+        if not points:
+            return -1
+        axis = depth % 2
+        points.sort(key=lambda p: (p[axis], p[2]))
+        mid = len(points) // 2
+
+        index = len(self._nodes)
+        self._nodes.append((0.0, 0.0, 0, 0, -1, -1))
+        left = self._build(points[:mid], depth + 1)
+        right = self._build(points[mid + 1:], depth + 1)
+        x, y, label = points[mid]
+        self._nodes[index] = (x, y, label, axis, left, right)
+        return index
+
+    def nearest(self, x: float, y: float) -> Optional[Tuple[int, float]]:
+        """
+        Find the closest point.
+
+        Args:
+            x: Query X
+            y: Query Y
+
+        Returns:
+            (label, distance), or None if the tree is empty
+        """
+        if self._root < 0:
+            return None
+
+        nodes = self._nodes
+        best_d2 = math.inf
+        best_label = -1
+        stack = [self._root]
+
+        while stack:
+            index = stack.pop()
+            px, py, label, axis, left, right = nodes[index]
+
+            d2 = (px - x) ** 2 + (py - y) ** 2
+            if d2 < best_d2 or (d2 == best_d2 and label < best_label):
+                best_d2 = d2
+                best_label = label
+
+            diff = (x - px) if axis == 0 else (y - py)
+            near, far = (left, right) if diff < 0 else (right, left)
+            # Far side can only hold a closer (or tied) point within |diff|
+            if far >= 0 and diff * diff <= best_d2:
+                stack.append(far)
+            if near >= 0:
+                stack.append(near)
+
+        return best_label, math.sqrt(best_d2)
+
+
+class RoadGraph:
+    """
+    Adjacency-indexed segment graph with A* routing.
+
+    Attributes:
+        tolerance: Junction snapping distance
+        version: Incremented on every edit
+    """
+
+    def __init__(self, tolerance: float = JUNCTION_TOLERANCE):
+        """
+        Initialize an empty graph.
+
+        Args:
+            tolerance: Maximum x and y distance between connected endpoints
+        """
+        self.tolerance = tolerance
+        self.version = 0
+
+        # Per-node columns, indexed by node; removed nodes become None
+        self._ids: List[Optional[str]] = []
+        self._starts: List[Point2D] = []
+        self._ends: List[Point2D] = []
+        self._mids: List[Point2D] = []
+        self._lengths: List[float] = []
+        self._adjacency: List[Dict[int, float]] = []
+        self._index: Dict[str, int] = {}
+
+        # Endpoint spatial hashes: cell -> nodes
+        self._start_cells: Dict[Cell, Set[int]] = {}
+        self._end_cells: Dict[Cell, Set[int]] = {}
+
+        self._kdtree: Optional[EndpointKDTree] = None
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, segment_id: str) -> bool:
+        return segment_id in self._index
+
+    def _cell(self, point: Point2D) -> Cell:
+        return (math.floor(point[0] / self.tolerance), math.floor(point[1] / self.tolerance))
+
+    def _near(self, cells: Dict[Cell, Set[int]], points: List[Point2D], point: Point2D) -> Iterator[int]:
+        """Nodes whose hashed endpoint is within tolerance of point."""
+        cx, cy = self._cell(point)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for node in cells.get((cx + dx, cy + dy), ()):
+                    other = points[node]
+                    if (abs(other[0] - point[0]) < self.tolerance and
+                            abs(other[1] - point[1]) < self.tolerance):
+                        yield node
+
+    def add(self, segment: Any) -> int:
+        """
+        Add (or replace) a segment.
+
+        Args:
+            segment: Object with id, start and end (x, y, ...) attributes
+
+        Returns:
+            Node index
+        """
+        if segment.id in self._index:
+            self.remove(segment.id)
+
+        start = (float(segment.start[0]), float(segment.start[1]))
+        end = (float(segment.end[0]), float(segment.end[1]))
+        length = math.hypot(end[0] - start[0], end[1] - start[1])
+        if len(segment.start) > 2 and len(segment.end) > 2:
+            length = math.sqrt(length ** 2 + (float(segment.end[2]) - float(segment.start[2])) ** 2)
+
+        node = len(self._ids)
+        self._ids.append(segment.id)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._mids.append(((start[0] + end[0]) / 2, (start[1] + end[1]) / 2))
+        self._lengths.append(length)
+        self._adjacency.append({})
+        self._index[segment.id] = node
+
+        # Connect end -> other starts and start -> other ends
+        neighbors = set(self._near(self._start_cells, self._starts, end))
+        neighbors.update(self._near(self._end_cells, self._ends, start))
+        neighbors.discard(node)
+        for other in neighbors:
+            weight = (length + self._lengths[other]) / 2
+            self._adjacency[node][other] = weight
+            self._adjacency[other][node] = weight
+
+        self._start_cells.setdefault(self._cell(start), set()).add(node)
+        self._end_cells.setdefault(self._cell(end), set()).add(node)
+
+        self._kdtree = None
+        self.version += 1
+        return node
+
+    def remove(self, segment_id: str) -> bool:
+        """
+        Remove a segment.
+
+        Args:
+            segment_id: Segment ID
+
+        Returns:
+            True if the segment was present
+        """
+        node = self._index.pop(segment_id, None)
+        if node is None:
+            return False
+
+        for other in self._adjacency[node]:
+            del self._adjacency[other][node]
+        self._adjacency[node] = {}
+        self._start_cells[self._cell(self._starts[node])].discard(node)
+        self._end_cells[self._cell(self._ends[node])].discard(node)
+        self._ids[node] = None
+
+        self._kdtree = None
+        self.version += 1
+        return True
+
+    def neighbors(self, segment_id: str) -> List[str]:
+        """
+        Get segments connected to a segment.
+
+        Args:
+            segment_id: Segment ID
+
+        Returns:
+            Connected segment IDs in insertion order
+        """
+        node = self._index.get(segment_id)
+        if node is None:
+            return []
+        return [self._ids[other] for other in sorted(self._adjacency[node])]
+
+    def successors(self, segment_id: str) -> List[str]:
+        """
+        Get segments starting where a segment ends.
+
+        Args:
+            segment_id: Segment ID
+
+        Returns:
+            Segment IDs in insertion order
+        """
+        node = self._index.get(segment_id)
+        if node is None:
+            return []
+        found = set(self._near(self._start_cells, self._starts, self._ends[node]))
+        found.discard(node)
+        return [self._ids[other] for other in sorted(found)]
+
+    def nearest_segment(self, x: float, y: float) -> Optional[str]:
+        """
+        Find the segment with an endpoint closest to a point.
+
+        Args:
+            x: X coordinate
+            y: Y coordinate
+
+        Returns:
+            Segment ID, or None if the graph is empty
+        """
+        if self._kdtree is None:
+            points = []
+            for node in self._index.values():
+                points.append((self._starts[node][0], self._starts[node][1], node))
+                points.append((self._ends[node][0], self._ends[node][1], node))
+            self._kdtree = EndpointKDTree(points)
+
+        found = self._kdtree.nearest(x, y)
+        if found is None:
+            return None
+        return self._ids[found[0]]
+
+    def route_length(self, segment_ids: Sequence[str]) -> float:
+        """Total length of a list of segments."""
+        return sum(self._lengths[self._index[segment_id]] for segment_id in segment_ids)
+
+    def shortest_path(self, start_id: str, end_id: str) -> List[str]:
+        """
+        Find the shortest route between two segments with A*.
+
+        Args:
+            start_id: First segment
+            end_id: Last segment
+
+        Returns:
+            Segment IDs from start to end, or [] if unreachable
+        """
+        start = self._index.get(start_id)
+        goal = self._index.get(end_id)
+        if start is None or goal is None:
+            return []
+
+        mids = self._mids
+        gx, gy = mids[goal]
+        adjacency = self._adjacency
+
+        best = {start: 0.0}
+        parent = {start: -1}
+        heap = [(math.hypot(mids[start][0] - gx, mids[start][1] - gy), 0.0, start)]
+
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if node == goal:
+                return self._path_ids(parent, goal)
+            if cost > best[node]:
+                continue  # Stale entry
+
+            for other, weight in adjacency[node].items():
+                new_cost = cost + weight
+                if new_cost < best.get(other, math.inf):
+                    best[other] = new_cost
+                    parent[other] = node
+                    mx, my = mids[other]
+                    heapq.heappush(heap, (new_cost + math.hypot(mx - gx, my - gy), new_cost, other))
+
+        return []
+
+    def _path_ids(self, parent: Dict[int, int], goal: int) -> List[str]:
+        path = []
+        node = goal
+        while node >= 0:
+            path.append(self._ids[node])
+            node = parent[node]
+        path.reverse()
+        return path
+
+    def build_contraction_hierarchy(
+        self,
+        witness_settle_limit: int = WITNESS_SETTLE_LIMIT,
+    ) -> "ContractionHierarchy":
+        """
+        Precompute a contraction hierarchy for repeated queries.
+
+        Args:
+            witness_settle_limit: Node budget for each witness search
+
+        Returns:
+            ContractionHierarchy for the current graph version
+        """
+        return ContractionHierarchy(self, witness_settle_limit)
+
+
+class ContractionHierarchy:
+    """
+    Contraction hierarchy over a RoadGraph snapshot.
+
+    Nodes are contracted in edge-difference order; shortcuts are added
+    only when no witness path of equal or lower weight exists. Queries
+    run an interleaved upward Dijkstra from both ends (with
+    stall-on-demand) and unpack shortcuts along the best meeting node.
+
+    Attributes:
+        version: RoadGraph version the hierarchy was built from
+        shortcuts: Number of shortcut edges added
+    """
+
+    def __init__(self, graph: RoadGraph, witness_settle_limit: int = WITNESS_SETTLE_LIMIT):
+        """
+        Build the hierarchy.
+
+        Args:
+            graph: Graph to contract
+            witness_settle_limit: Node budget for each witness search
+        """
+        self.version = graph.version
+        self.shortcuts = 0
+        self._ids = list(graph._ids)
+        self._index = dict(graph._index)
+        self._witness_settle_limit = witness_settle_limit
+
+        size = len(self._ids)
+        self._rank = [0] * size
+        self._up: List[List[Tuple[int, float]]] = [[] for _ in range(size)]
+        self._middle: Dict[Tuple[int, int], int] = {}
+        self._contract([dict(edges) for edges in graph._adjacency])
+
+    def _witness_distances(
+        self,
+        graph: List[Dict[int, float]],
+        source: int,
+        excluded: int,
+        targets: Set[int],
+        max_cost: float,
+        settle_limit: int,
+    ) -> Dict[int, float]:
+        """Bounded Dijkstra from source that avoids the node being contracted."""
+        dist = {source: 0.0}
+        heap = [(0.0, source)]
+        remaining = set(targets)
+        settled = 0
+        while heap and remaining and settled < settle_limit:
+            cost, node = heapq.heappop(heap)
+            if cost > dist[node]:
+                continue
+            remaining.discard(node)
+            settled += 1
+            for other, weight in graph[node].items():
+                if other == excluded:
+                    continue
+                new_cost = cost + weight
+                if new_cost <= max_cost and new_cost < dist.get(other, math.inf):
+                    dist[other] = new_cost
+                    heapq.heappush(heap, (new_cost, other))
+        return dist
+
+    def _shortcuts_for(
+        self,
+        graph: List[Dict[int, float]],
+        node: int,
+        settle_limit: int,
+    ) -> List[Tuple[int, int, float]]:
+        """Shortcuts needed to contract a node (over-estimated for small limits)."""
+        neighbors = sorted(graph[node].items())
+        if len(neighbors) < 2:
+            return []
+
+        shortcuts = []
+        for i, (u, weight_u) in enumerate(neighbors[:-1]):
+            later = neighbors[i + 1:]
+            max_out = max(weight for _, weight in later)
+            dist = self._witness_distances(
+                graph, u, node, {w for w, _ in later}, weight_u + max_out, settle_limit
+            )
+            for w, weight_w in later:
+                via = weight_u + weight_w
+                if dist.get(w, math.inf) > via:
+                    shortcuts.append((u, w, via))
+        return shortcuts
+
+    def _contract(self, graph: List[Dict[int, float]]) -> None:
+        """Contract all live nodes, recording ranks, upward edges and shortcuts."""
+        live = [node for node, segment_id in enumerate(self._ids) if segment_id is not None]
+        deleted_neighbors = [0] * len(self._ids)
+        levels = [0] * len(self._ids)
+
+        def priority(shortcuts: List[Tuple[int, int, float]], node: int) -> int:
+            # Edge difference, spread out by contracted neighbours and level
+            edge_difference = len(shortcuts) - len(graph[node])
+            return 2 * edge_difference + deleted_neighbors[node] + levels[node]
+
+        # Priorities use cheap witness searches; contraction uses the full budget
+        estimate_limit = max(1, self._witness_settle_limit // 4)
+        heap = [
+            (priority(self._shortcuts_for(graph, node, estimate_limit), node), node)
+            for node in live
+        ]
+        heapq.heapify(heap)
+        contracted = [False] * len(self._ids)
+        order = 0
+
+        while heap:
+            _, node = heapq.heappop(heap)
+            if contracted[node]:
+                continue
+
+            # Lazy update: re-queue if the node is no longer the cheapest
+            current = priority(self._shortcuts_for(graph, node, estimate_limit), node)
+            if heap and current > heap[0][0]:
+                heapq.heappush(heap, (current, node))
+                continue
+
+            shortcuts = self._shortcuts_for(graph, node, self._witness_settle_limit)
+            for u, w, weight in shortcuts:
+                if weight < graph[u].get(w, math.inf):
+                    graph[u][w] = weight
+                    graph[w][u] = weight
+                    self._middle[(min(u, w), max(u, w))] = node
+                    self.shortcuts += 1
+
+            for other, weight in graph[node].items():
+                self._up[node].append((other, weight))
+                del graph[other][node]
+                deleted_neighbors[other] += 1
+                levels[other] = max(levels[other], levels[node] + 1)
+            graph[node] = {}
+
+            contracted[node] = True
+            self._rank[node] = order
+            order += 1
+
+    def _bidirectional_search(self, start: int, goal: int) -> Tuple[int, List[Dict[int, int]]]:
+        """
+        Upward Dijkstra from both ends with stall-on-demand.
+
+        Returns:
+            (meeting node or -1, [forward parents, backward parents])
+        """
+        dist: List[Dict[int, float]] = [{start: 0.0}, {goal: 0.0}]
+        parents: List[Dict[int, int]] = [{start: -1}, {goal: -1}]
+        heaps: List[List[Tuple[float, int]]] = [[(0.0, start)], [(0.0, goal)]]
+        up = self._up
+        best = math.inf
+        meet = -1
+
+        while heaps[0] or heaps[1]:
+            # Expand the side with the smaller tentative distance
+            if not heaps[1] or (heaps[0] and heaps[0][0][0] <= heaps[1][0][0]):
+                side = 0
+            else:
+                side = 1
+            heap = heaps[side]
+            if heap[0][0] >= best:
+                break
+
+            cost, node = heapq.heappop(heap)
+            own = dist[side]
+            if cost > own[node]:
+                continue
+
+            total = cost + dist[1 - side].get(node, math.inf)
+            if total < best:
+                best = total
+                meet = node
+
+            edges = up[node]
+            stalled = False
+            for other, weight in edges:
+                if own.get(other, math.inf) + weight < cost:
+                    stalled = True  # A higher node reaches this one more cheaply
+                    break
+            if stalled:
+                continue
+
+            parent = parents[side]
+            for other, weight in edges:
+                new_cost = cost + weight
+                if new_cost < own.get(other, math.inf):
+                    own[other] = new_cost
+                    parent[other] = node
+                    heapq.heappush(heap, (new_cost, other))
+
+        return meet, parents
+
+    def _unpack(self, u: int, w: int, out: List[int]) -> None:
+        """Append the original nodes after u on the edge u -> w."""
+        stack = [(u, w)]
+        while stack:
+            a, b = stack.pop()
+            middle = self._middle.get((min(a, b), max(a, b)))
+            if middle is None:
+                out.append(b)
+            else:
+                stack.append((middle, b))
+                stack.append((a, middle))
+
+    def shortest_path(self, start_id: str, end_id: str) -> List[str]:
+        """
+        Find the shortest route between two segments.
+
+        Args:
+            start_id: First segment
+            end_id: Last segment
+
+        Returns:
+            Segment IDs from start to end, or [] if unreachable
+        """
+        start = self._index.get(start_id)
+        goal = self._index.get(end_id)
+        if start is None or goal is None:
+            return []
+        if start == goal:
+            return [start_id]
+
+        meet, (forward_parent, backward_parent) = self._bidirectional_search(start, goal)
+        if meet < 0:
+            return []
+
+        # Up-down node sequence: start .. meet .. goal
+        up = []
+        node = meet
+        while node >= 0:
+            up.append(node)
+            node = forward_parent[node]
+        up.reverse()
+        node = backward_parent[meet]
+        while node >= 0:
+            up.append(node)
+            node = backward_parent[node]
+
+        path = [up[0]]
+        for a, b in zip(up, up[1:]):
+            self._unpack(a, b, path)
+        return [self._ids[node] for node in path]
+
+
+__all__ = [
+    "JUNCTION_TOLERANCE",
+    "EndpointKDTree",
+    "RoadGraph",
+    "ContractionHierarchy",
+]
@@ -27,15 +27,24 @@ Usage:
 
     # Generate Blender curves
     network.generate_blender_curves()
+
+    # Route between two points (A* over the indexed segment graph)
+    route = network.find_route((0, 0), (500, 300))
+
+    # Precompute a contraction hierarchy for many repeated queries
+    network.build_contraction_hierarchy()
 """
 
 from __future__ import annotations
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 from pathlib import Path
 import math
 import random
 
+from .road_graph import ContractionHierarchy, RoadGraph
+
 # Guarded bpy import
 try:
     import bpy
@@ -134,9 +143,12 @@ class RoadSegment:
         max_speed: float = 50.0,  # km/h
         control_points: Optional[List[Tuple[float, float, float]]] = None
     ):
-        self.id = id
-        self.start = Vector(start) if Vector else start
-        self.end = Vector(end) if Vector else end
+        # Bumped whenever id, start or end is reassigned; RoadNetwork
+        # compares it to notice edits to its own segments
+        self.routing_version = 0
+        self._id = id
+        self._start = Vector(start) if Vector else start
+        self._end = Vector(end) if Vector else end
         self.lanes_forward = lanes_forward
         self.lanes_backward = lanes_backward
         self.style_name = style
@@ -149,6 +161,36 @@ class RoadSegment:
         self.lanes: List[LaneConfig] = []
         self._build_lanes()
 
+    @property
+    def id(self) -> str:
+        """Segment ID."""
+        return self._id
+
+    @id.setter
+    def id(self, value: str) -> None:
+        self._id = value
+        self.routing_version += 1
+
+    @property
+    def start(self) -> Any:
+        """Start point."""
+        return self._start
+
+    @start.setter
+    def start(self, value: Any) -> None:
+        self._start = value
+        self.routing_version += 1
+
+    @property
+    def end(self) -> Any:
+        """End point."""
+        return self._end
+
+    @end.setter
+    def end(self, value: Any) -> None:
+        self._end = value
+        self.routing_version += 1
+
     def _build_lanes(self) -> None:
         """Build lane configuration list."""
         self.lanes.clear()
@@ -390,18 +432,45 @@ class RoadNetwork:
     - Road segments with lanes
     - Intersections with traffic control
     - Bridges and overpasses
-    - Path finding for navigation
+    - Path finding for navigation (indexed A*, optional contraction
+      hierarchy, cached routes)
     """
 
+    # Maximum number of cached (start segment, end segment) routes
+    ROUTE_CACHE_SIZE = 1024
+
     def __init__(self, name: str = "RoadNetwork"):
         self.name = name
-        self.segments: Dict[str, RoadSegment] = {}
+        self._segments = SegmentDict()
         self.intersections: Dict[str, Intersection] = {}
         self.bridges: List[Dict[str, Any]] = []
 
         # Navigation graph
         self._graph: Dict[str, List[str]] = {}  # node -> connected nodes
 
+        # Segment routing graph, maintained by add_segment/remove_segment
+        self._road_graph = RoadGraph()
+        self._hierarchy: Optional[ContractionHierarchy] = None
+        self._use_hierarchy = False
+        self._route_cache: OrderedDict[Tuple[str, str], Tuple[str, ...]] = OrderedDict()
+        self._graph_state = self._segments_state()
+
+    @property
+    def segments(self) -> SegmentDict:
+        """Road segments by ID."""
+        return self._segments
+
+    @segments.setter
+    def segments(self, segments: Dict[str, RoadSegment]) -> None:
+        self._segments = SegmentDict(segments)
+
+    def _segments_state(self) -> Tuple[int, int, int]:
+        """Identify the segment set and geometry the routing graph reflects."""
+        # Versions only grow, so the sum changes whenever one of this
+        # network's segments is edited
+        edits = sum(segment.routing_version for segment in self._segments.values())
+        return (id(self._segments), self._segments.version, edits)
+
     @classmethod
     def from_osm(cls, osm_data: Any, scale: float = 1000.0) -> 'RoadNetwork':
         """Create road network from imported OSM data."""
@@ -454,6 +523,7 @@ class RoadNetwork:
 
     def add_segment(self, segment: RoadSegment) -> None:
         """Add a road segment to the network."""
+        self._sync_road_graph()
         self.segments[segment.id] = segment
 
         # Update navigation graph
@@ -468,6 +538,76 @@ class RoadNetwork:
         self._graph[start_key].append(end_key)
         self._graph[end_key].append(start_key)
 
+        self._road_graph.add(segment)
+        self._invalidate_routes()
+        self._graph_state = self._segments_state()
+
+    def remove_segment(self, segment_id: str) -> bool:
+        """
+        Remove a road segment from the network.
+
+        Args:
+            segment_id: Segment ID
+
+        Returns:
+            True if the segment existed
+        """
+        self._sync_road_graph()
+        segment = self.segments.pop(segment_id, None)
+        if segment is None:
+            return False
+
+        start_key = f"{segment.start[0]:.1f}_{segment.start[1]:.1f}"
+        end_key = f"{segment.end[0]:.1f}_{segment.end[1]:.1f}"
+        if end_key in self._graph.get(start_key, []):
+            self._graph[start_key].remove(end_key)
+        if start_key in self._graph.get(end_key, []):
+            self._graph[end_key].remove(start_key)
+
+        self._road_graph.remove(segment_id)
+        self._invalidate_routes()
+        self._graph_state = self._segments_state()
+        return True
+
+    def _invalidate_routes(self) -> None:
+        """Drop cached routes and the contraction hierarchy after an edit."""
+        self._route_cache.clear()
+        self._hierarchy = None
+
+    def _sync_road_graph(self) -> RoadGraph:
+        """
+        Rebuild the routing graph if segments were edited directly.
+
+        Catches segments added, replaced or removed through the segments
+        mapping, and id/start/end reassigned on existing segments.
+        Mutating a Blender Vector in place (segment.start.x = ...) is not
+        detected; assign a new start or end instead.
+        """
+        graph = self._road_graph
+        state = self._segments_state()
+        if state != self._graph_state:
+            graph = RoadGraph(graph.tolerance)
+            for segment in self.segments.values():
+                graph.add(segment)
+            self._road_graph = graph
+            self._invalidate_routes()
+            self._graph_state = state
+        return graph
+
+    def build_contraction_hierarchy(self) -> ContractionHierarchy:
+        """
+        Precompute a contraction hierarchy for repeated route queries.
+
+        Once enabled, find_route answers queries from the hierarchy. Edits
+        to the network discard it; it is rebuilt on the next query.
+
+        Returns:
+            The hierarchy
+        """
+        self._hierarchy = self._sync_road_graph().build_contraction_hierarchy()
+        self._use_hierarchy = True
+        return self._hierarchy
+
     def add_road_segment(
         self,
         start: Tuple[float, float, float],
@@ -530,61 +670,96 @@ class RoadNetwork:
     def find_route(
         self,
         start: Tuple[float, float],
-        end: Tuple[float, float]
+        end: Tuple[float, float],
+        use_cache: bool = True,
     ) -> List[RoadSegment]:
         """
         Find a route through the road network.
 
-        Uses A* pathfinding for optimal route.
+        The start and end segments are the ones with an endpoint closest
+        to each point (KD-tree lookup). The shortest route between them by
+        driven length is found with A*, or with the contraction hierarchy
+        when one has been built. Results are cached per segment pair until
+        the network is edited.
+
+        Args:
+            start: Start position (x, y)
+            end: End position (x, y)
+            use_cache: Reuse previously computed routes
+
+        Returns:
+            Road segments from start to end, or [] if unreachable
         """
-        # Simple implementation - would use full A* in production
-        route = []
-
-        # Find nearest segments to start and end
-        start_seg = min(
-            self.segments.values(),
-            key=lambda s: min(
-                math.sqrt((s.start[0]-start[0])**2 + (s.start[1]-start[1])**2),
-                math.sqrt((s.end[0]-start[0])**2 + (s.end[1]-start[1])**2)
-            )
-        )
+        graph = self._sync_road_graph()
+        start_id = graph.nearest_segment(start[0], start[1])
+        end_id = graph.nearest_segment(end[0], end[1])
+        if start_id is None or end_id is None:
+            return []
+
+        key = (start_id, end_id)
+        route_ids = self._route_cache.get(key) if use_cache else None
+        if route_ids is not None:
+            self._route_cache.move_to_end(key)
+        else:
+            if self._use_hierarchy:
+                if self._hierarchy is None or self._hierarchy.version != graph.version:
+                    self._hierarchy = graph.build_contraction_hierarchy()
+                route_ids = tuple(self._hierarchy.shortest_path(start_id, end_id))
+            else:
+                route_ids = tuple(graph.shortest_path(start_id, end_id))
 
-        end_seg = min(
-            self.segments.values(),
-            key=lambda s: min(
-                math.sqrt((s.start[0]-end[0])**2 + (s.start[1]-end[1])**2),
-                math.sqrt((s.end[0]-end[0])**2 + (s.end[1]-end[1])**2)
-            )
-        )
+            self._route_cache[key] = route_ids
+            if len(self._route_cache) > self.ROUTE_CACHE_SIZE:
+                self._route_cache.popitem(last=False)
 
-        # BFS to find path
-        visited = set()
-        queue = [(start_seg.id, [start_seg])]
+        return [self.segments[segment_id] for segment_id in route_ids]
 
-        while queue:
-            current_id, path = queue.pop(0)
+    def find_route_waypoints(
+        self,
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+    ) -> List[Tuple[float, float, float]]:
+        """
+        Find a route and return it as a polyline.
 
-            if current_id == end_seg.id:
-                return path
+        Each segment is oriented in the direction of travel and shared
+        junction points appear once.
 
-            if current_id in visited:
-                continue
+        Args:
+            start: Start position (x, y)
+            end: End position (x, y)
 
-            visited.add(current_id)
+        Returns:
+            Waypoints (x, y, z), or [] if unreachable
+        """
+        route = self.find_route(start, end)
+        waypoints: List[Tuple[float, float, float]] = []
+
+        for i, segment in enumerate(route):
+            points = [tuple(segment.start)] + [tuple(p) for p in segment.control_points] + [tuple(segment.end)]
+
+            if waypoints:
+                previous = waypoints[-1]
+                forward = _distance_2d(points[0], previous) <= _distance_2d(points[-1], previous)
+            elif i + 1 < len(route):
+                following = route[i + 1]
+                forward = min(
+                    _distance_2d(points[-1], following.start),
+                    _distance_2d(points[-1], following.end),
+                ) <= min(
+                    _distance_2d(points[0], following.start),
+                    _distance_2d(points[0], following.end),
+                )
+            else:
+                forward = True
 
-            # Find connected segments
-            current = self.segments[current_id]
-            for seg_id, seg in self.segments.items():
-                if seg_id not in visited:
-                    # Check if segments connect
-                    if (abs(seg.start[0] - current.end[0]) < 1.0 and
-                        abs(seg.start[1] - current.end[1]) < 1.0):
-                        queue.append((seg_id, path + [seg]))
-                    elif (abs(seg.end[0] - current.start[0]) < 1.0 and
-                          abs(seg.end[1] - current.start[1]) < 1.0):
-                        queue.append((seg_id, path + [seg]))
+            if not forward:
+                points.reverse()
+            if waypoints and _distance_2d(points[0], waypoints[-1]) < self._road_graph.tolerance:
+                points = points[1:]
+            waypoints.extend((float(p[0]), float(p[1]), float(p[2])) for p in points)
 
-        return route
+        return waypoints
 
     def get_route(
         self,
@@ -644,6 +819,7 @@ class RoadNetwork:
         # Pick random start segment
         import random
         start_seg = random.choice(list(self.segments.values()))
+        graph = self._sync_road_graph()
 
         route = [tuple(start_seg.start)]
         current = start_seg
@@ -655,10 +831,8 @@ class RoadNetwork:
 
             # Find next connected segment
             connected = [
-                seg for seg in self.segments.values()
-                if (abs(seg.start[0] - current.end[0]) < 1.0 and
-                    abs(seg.start[1] - current.end[1]) < 1.0 and
-                    seg.id != current.id)
+                self.segments[seg_id]
+                for seg_id in graph.successors(current.id)
             ]
 
             if not connected:
@@ -669,6 +843,64 @@ class RoadNetwork:
         return route
 
 
+class SegmentDict(dict):
+    """
+    Segment mapping that counts changes.
+
+    Lets RoadNetwork notice segments added, replaced or removed directly
+    through network.segments and rebuild its routing graph.
+
+    Attributes:
+        version: Incremented on every change
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: str, value: RoadSegment) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def pop(self, key: str, *default: Any) -> Any:
+        had_key = key in self
+        value = super().pop(key, *default)
+        if had_key:
+            self.version += 1
+        return value
+
+    def popitem(self) -> Tuple[str, RoadSegment]:
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def __ior__(self, other: Any) -> SegmentDict:
+        self.update(other)
+        return self
+
+
+def _distance_2d(a: Any, b: Any) -> float:
+    """Planar distance between two points."""
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
 def create_road_segment(
     start: Tuple[float, float, float],
     end: Tuple[float, float, float],
@@ -41,6 +41,15 @@ except ImportError:
     Matrix = None
     BLENDER_AVAILABLE = False
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from .traffic_sim import TrafficBake, TrafficSimulation
+
 
 class AgentState(Enum):
     """Vehicle agent state."""
@@ -514,16 +523,135 @@ class TrafficController:
         threats: Dict[str, Tuple[float, float, float]] = {}
         # Would get hero vehicle positions here
 
-        # Update all agents
+        # Update all agents against nearby vehicles only
         agent_list = list(self.agents.values())
-        for agent in agent_list:
-            agent.update(delta_time, agent_list, threats)
+        neighbors = self._neighbor_lists(agent_list, delta_time)
+        for index, agent in enumerate(agent_list):
+            agent.update(delta_time, neighbors[index], threats)
 
             # Despawn if off map
             x, y = agent.state.position[0], agent.state.position[1]
             if abs(x) > 500 or abs(y) > 500:
                 self.despawn_vehicle(agent.id)
 
+    def _neighbor_lists(
+        self,
+        agent_list: List[VehicleAgent],
+        delta_time: float
+    ) -> List[List[VehicleAgent]]:
+        """
+        Find the vehicles each agent must check for collisions.
+
+        Agents further apart than safe_distance plus the distance both
+        can travel this tick cannot trigger a collision check, so a
+        uniform grid query replaces the all-pairs scan.
+
+        Args:
+            agent_list: Agents in update order
+            delta_time: Time step in seconds
+
+        Returns:
+            Candidate neighbours for each agent
+        """
+        if not HAS_NUMPY or len(agent_list) < 2:
+            return [agent_list] * len(agent_list)
+
+        from .traffic_sim import UniformGrid
+
+        radius = self.config.safe_distance + 2 * self.config.max_speed / 3.6 * delta_time
+        grid = UniformGrid(radius)
+        grid.build(np.array([agent.state.position[:2] for agent in agent_list], dtype=np.float64))
+        neighbors: List[List[VehicleAgent]] = [[] for _ in agent_list]
+        for i, j in zip(*(array.tolist() for array in grid.pairs(radius)[:2])):
+            neighbors[i].append(agent_list[j])
+        return neighbors
+
+    def to_simulation(self, seed: Optional[int] = None) -> "TrafficSimulation":
+        """
+        Copy the current agents into a vectorized simulation.
+
+        Args:
+            seed: Random seed for target speeds
+
+        Returns:
+            TrafficSimulation with one row per agent
+        """
+        from .traffic_sim import TrafficSimulation
+
+        simulation = TrafficSimulation(self.config, capacity=max(len(self.agents), 1), seed=seed)
+        for agent in self.agents.values():
+            simulation.spawn(
+                agent.state.position,
+                agent.route[agent.route_index:],
+                heading=agent.state.rotation,
+                speed=agent.state.speed,
+                steering=agent.steering,
+                vehicle_id=agent.id,
+            )
+            # Threats persist in each agent's avoidance system
+            for threat_id, (position, velocity) in agent.avoidance._threats.items():
+                simulation.set_threat(threat_id, position, velocity)
+        return simulation
+
+    def bake(
+        self,
+        frame_count: int,
+        fps: float = 24.0,
+        seed: Optional[int] = None
+    ) -> "TrafficBake":
+        """
+        Simulate traffic headlessly into keyframe arrays.
+
+        Starts from the current agents and keeps spawning vehicles at
+        spawn_rate, without touching Blender objects.
+
+        Args:
+            frame_count: Number of frames to bake
+            fps: Frames per second
+            seed: Random seed for target speeds
+
+        Returns:
+            TrafficBake ready for TrafficBake.to_blender or saving
+        """
+        simulation = self.to_simulation(seed=seed)
+        spawn_timer = self._spawn_timer
+
+        def spawn(sim: "TrafficSimulation", frame: int) -> None:
+            nonlocal spawn_timer
+            spawn_timer += 1.0 / fps
+            if spawn_timer < 1.0 / self.config.spawn_rate:
+                return
+            spawn_timer = 0.0
+            if sim.alive_count >= self.config.max_vehicles:
+                return
+            position = (random.uniform(-100, 100), random.uniform(-100, 100), 0)
+            route = self.road_network.get_random_route(min_length=500)
+            sim.spawn(position, route, vehicle_id=f"vehicle_{self._next_agent_id}")
+            self._next_agent_id += 1
+
+        return simulation.bake(frame_count, fps=fps, spawn_callback=spawn)
+
+    def apply_bake(self, bake: "TrafficBake", frame_start: int = 1) -> Dict[str, Any]:
+        """
+        Keyframe a bake onto Blender objects.
+
+        Existing agent objects are reused; vehicles spawned during the
+        bake get new objects.
+
+        Args:
+            bake: Result of bake()
+            frame_start: Scene frame of the first baked frame
+
+        Returns:
+            Objects by vehicle ID
+        """
+        objects = {
+            agent.id: agent.blender_object
+            for agent in self.agents.values()
+            if agent.blender_object is not None
+        }
+        return bake.to_blender(objects=objects, frame_start=frame_start)
+
     def get_vehicle_positions(self) -> Dict[str, Tuple[float, float, float]]:
         """Get all vehicle positions."""
         return {
@@ -0,0 +1,714 @@
+"""
+Traffic Simulation Core - Struct-of-Arrays Traffic for Background Cars
+
+Vectorized counterpart of VehicleAgent for thousands of background
+vehicles. State lives in NumPy arrays (one row per vehicle) and every
+tick is a handful of array operations:
+
+- Collision checks use a uniform grid, so each vehicle is only compared
+  with vehicles in the neighbouring cells instead of every other
+  vehicle.
+- Waypoint following (lane following) and threat avoidance follow the
+  same rules as VehicleAgent.update, applied to all vehicles at once.
+- Frames are baked headlessly into compact float32 keyframe arrays;
+  Blender objects are only created and keyed in TrafficBake.to_blender.
+
+Usage:
+    from lib.animation.city.traffic_sim import TrafficSimulation
+
+    sim = TrafficSimulation(config, seed=7)
+    for route in routes:
+        sim.spawn(route[0], route)
+
+    bake = sim.bake(frame_count=240, fps=24)
+    bake.save("traffic_bake.npz")
+    bake.to_blender()  # In Blender only
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Guarded bpy import
+try:
+    import bpy
+    BLENDER_AVAILABLE = True
+except ImportError:
+    bpy = None
+    BLENDER_AVAILABLE = False
+
+from .traffic_ai import AgentState, TrafficConfig
+
+
+# State codes stored in the int8 state arrays
+AGENT_STATES: List[AgentState] = list(AgentState)
+STATE_CODES: Dict[AgentState, int] = {state: code for code, state in enumerate(AGENT_STATES)}
+
+# Distance at which a route waypoint counts as reached (matches VehicleAgent)
+WAYPOINT_RADIUS = 5.0
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for the vectorized traffic simulation")
+
+
+class UniformGrid:
+    """
+    Uniform grid over 2D points for fixed-radius neighbour queries.
+
+    Points are bucketed by cell and sorted by cell key; a query looks up
+    the 3x3 block of cells around each point with searchsorted, so the
+    work is proportional to the number of nearby pairs rather than n².
+    """
+
+    def __init__(self, cell_size: float):
+        """
+        Initialize grid.
+
+        Args:
+            cell_size: Cell edge length; queries cover radius <= cell_size
+        """
+        _require_numpy()
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self._points = np.empty((0, 2))
+        self._order = np.empty(0, dtype=np.intp)
+        self._sorted_keys = np.empty(0, dtype=np.int64)
+        self._cells = np.empty((0, 2), dtype=np.int64)
+
+    def _keys(self, cells: "np.ndarray") -> "np.ndarray":
+        # Interleave cell coordinates into one sortable key
+        return (cells[:, 0] << 32) + (cells[:, 1] & 0xFFFFFFFF)
+
+    def build(self, points: Any) -> None:
+        """
+        Index points.
+
+        Args:
+            points: Array of shape (N, 2) or (N, 3); only x and y are used
+        """
+        points = np.asarray(points, dtype=np.float64)[:, :2]
+        self._points = points
+        self._cells = np.floor(points / self.cell_size).astype(np.int64)
+        keys = self._keys(self._cells)
+        self._order = np.argsort(keys, kind="stable")
+        self._sorted_keys = keys[self._order]
+
+    def pairs(self, radius: float) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """
+        Find all ordered pairs of distinct points within radius.
+
+        Args:
+            radius: Search radius (at most cell_size)
+
+        Returns:
+            (i, j, distance) arrays; each unordered pair appears twice
+        """
+        if radius > self.cell_size:
+            raise ValueError("radius must not exceed cell_size")
+
+        count = len(self._points)
+        sources = []
+        targets = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                neighbor_keys = self._keys(self._cells + np.array([dx, dy], dtype=np.int64))
+                lo = np.searchsorted(self._sorted_keys, neighbor_keys, side="left")
+                hi = np.searchsorted(self._sorted_keys, neighbor_keys, side="right")
+                counts = hi - lo
+                total = int(counts.sum())
+                if not total:
+                    continue
+                # Expand [lo, hi) ranges into flat candidate lists
+                source = np.repeat(np.arange(count), counts)
+                offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                sources.append(source)
+                targets.append(self._order[np.repeat(lo, counts) + offsets])
+
+        if not sources:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty, np.empty(0)
+
+        i = np.concatenate(sources)
+        j = np.concatenate(targets)
+        keep = i != j
+        i, j = i[keep], j[keep]
+        delta = self._points[j] - self._points[i]
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        within = distance < radius
+        return i[within], j[within], distance[within]
+
+    def nearest_distance(self, radius: float) -> "np.ndarray":
+        """
+        Distance from each point to its nearest other point.
+
+        Args:
+            radius: Search radius (at most cell_size)
+
+        Returns:
+            Array of distances; inf where no other point is within radius
+        """
+        nearest = np.full(len(self._points), np.inf)
+        i, _, distance = self.pairs(radius)
+        np.minimum.at(nearest, i, distance)
+        return nearest
+
+
+@dataclass
+class TrafficBake:
+    """
+    Baked traffic animation as compact keyframe arrays.
+
+    Attributes:
+        fps: Frames per second the bake was simulated at
+        vehicle_ids: Vehicle names, one per column
+        positions: float32 array (frames, vehicles, 3)
+        headings: float32 array (frames, vehicles), radians
+        alive: bool array (frames, vehicles)
+        states: int8 array (frames, vehicles), indices into AGENT_STATES
+    """
+    fps: float
+    vehicle_ids: List[str]
+    positions: "np.ndarray"
+    headings: "np.ndarray"
+    alive: "np.ndarray"
+    states: "np.ndarray"
+
+    @property
+    def frame_count(self) -> int:
+        """Number of baked frames."""
+        return self.positions.shape[0]
+
+    @property
+    def vehicle_count(self) -> int:
+        """Number of vehicles (spawned at any point)."""
+        return self.positions.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the keyframe arrays."""
+        return self.positions.nbytes + self.headings.nbytes + self.alive.nbytes + self.states.nbytes
+
+    def state_at(self, frame: int, vehicle: int) -> AgentState:
+        """Get a vehicle's state on a baked frame."""
+        return AGENT_STATES[int(self.states[frame, vehicle])]
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Save to a compressed .npz file.
+
+        Args:
+            path: Output path
+
+        Returns:
+            Path written
+        """
+        path = Path(path)
+        np.savez_compressed(
+            path,
+            fps=np.float64(self.fps),
+            vehicle_ids=np.array(self.vehicle_ids),
+            positions=self.positions,
+            headings=self.headings,
+            alive=self.alive,
+            states=self.states,
+        )
+        return path if path.suffix == ".npz" else path.with_name(path.name + ".npz")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TrafficBake":
+        """
+        Load a bake saved with save().
+
+        Args:
+            path: .npz file
+
+        Returns:
+            TrafficBake
+        """
+        _require_numpy()
+        with np.load(path) as data:
+            return cls(
+                fps=float(data["fps"]),
+                vehicle_ids=[str(v) for v in data["vehicle_ids"]],
+                positions=data["positions"],
+                headings=data["headings"],
+                alive=data["alive"],
+                states=data["states"],
+            )
+
+    def to_blender(
+        self,
+        objects: Optional[Dict[str, Any]] = None,
+        vehicle_factory: Optional[Callable[[str], Any]] = None,
+        frame_start: int = 1,
+    ) -> Dict[str, Any]:
+        """
+        Write the bake to Blender objects as keyframes.
+
+        Location and Z rotation curves are filled with foreach_set, one
+        call per curve. Vehicles are hidden on frames where they are not
+        alive.
+
+        Args:
+            objects: Existing objects by vehicle ID
+            vehicle_factory: Creates an object for a vehicle ID
+                (default: a car-proportioned cube)
+            frame_start: Scene frame of the first baked frame
+
+        Returns:
+            Objects by vehicle ID
+        """
+        if not BLENDER_AVAILABLE:
+            return {}
+
+        objects = dict(objects or {})
+        for column, vehicle_id in enumerate(self.vehicle_ids):
+            frames = np.flatnonzero(self.alive[:, column])
+            if not len(frames):
+                continue
+
+            obj = objects.get(vehicle_id)
+            if obj is None:
+                obj = (vehicle_factory or _create_vehicle_object)(vehicle_id)
+                objects[vehicle_id] = obj
+
+            if not obj.animation_data:
+                obj.animation_data_create()
+            if not obj.animation_data.action:
+                obj.animation_data.action = bpy.data.actions.new(f"{obj.name}_Traffic")
+            action = obj.animation_data.action
+
+            keys = frames.astype(np.float32) + frame_start
+            heading = np.unwrap(self.headings[frames, column].astype(np.float64))
+            channels = [
+                ("location", 0, self.positions[frames, column, 0]),
+                ("location", 1, self.positions[frames, column, 1]),
+                ("location", 2, self.positions[frames, column, 2]),
+                ("rotation_euler", 2, heading),
+            ]
+            for data_path, index, values in channels:
+                fc = action.fcurves.find(data_path, index=index)
+                if not fc:
+                    fc = action.fcurves.new(data_path, index=index)
+                co = np.empty(2 * len(frames), dtype=np.float32)
+                co[0::2] = keys
+                co[1::2] = values
+                fc.keyframe_points.add(len(frames))
+                fc.keyframe_points.foreach_set("co", co)
+                fc.update()
+
+            # Visibility only changes at spawn and despawn
+            alive = self.alive[:, column]
+            changes = np.flatnonzero(np.diff(alive.astype(np.int8))) + 1
+            for frame in [0, *changes.tolist()]:
+                hidden = not bool(alive[frame])
+                obj.hide_viewport = hidden
+                obj.hide_render = hidden
+                obj.keyframe_insert("hide_viewport", frame=frame + frame_start)
+                obj.keyframe_insert("hide_render", frame=frame + frame_start)
+
+        return objects
+
+
+def _create_vehicle_object(vehicle_id: str) -> Any:
+    """Create a simple vehicle mesh (matches TrafficController)."""
+    bpy.ops.mesh.primitive_cube_add(size=2)
+    obj = bpy.context.active_object
+    obj.name = f"Traffic_{vehicle_id}"
+    obj.scale = (2, 1, 0.5)  # Car-like proportions
+    return obj
+
+
+class TrafficSimulation:
+    """
+    Struct-of-arrays traffic simulation.
+
+    Each vehicle is a row in the state arrays. step() applies the
+    VehicleAgent rules (threat avoidance, collision slowdown, waypoint
+    steering, speed control) to all vehicles at once.
+
+    Attributes:
+        config: Traffic configuration
+        count: Number of vehicles spawned (alive or not)
+        vehicle_ids: Vehicle names by row
+        positions: (count, 3) positions
+        headings: (count,) headings in radians
+        speeds: (count,) speeds in m/s
+        steering: (count,) steering rates in rad/s
+        alive: (count,) alive flags
+        states: (count,) int8 state codes
+    """
+
+    def __init__(
+        self,
+        config: Optional[TrafficConfig] = None,
+        capacity: int = 256,
+        seed: Optional[int] = None,
+        despawn_extent: Optional[float] = 500.0,
+    ):
+        """
+        Initialize an empty simulation.
+
+        Args:
+            config: Traffic configuration
+            capacity: Initial row capacity (grows as needed)
+            seed: Random seed for target speeds
+            despawn_extent: Vehicles beyond this |x| or |y| are despawned
+                (None to keep all vehicles)
+        """
+        _require_numpy()
+        self.config = config or TrafficConfig()
+        self.despawn_extent = despawn_extent
+        self.rng = np.random.default_rng(seed)
+        self.count = 0
+        self.vehicle_ids: List[str] = []
+
+        self._capacity = 0
+        self._positions = np.empty((0, 3))
+        self._headings = np.empty(0)
+        self._speeds = np.empty(0)
+        self._steering = np.empty(0)
+        self._alive = np.empty(0, dtype=bool)
+        self._states = np.empty(0, dtype=np.int8)
+        self._route_cursor = np.empty(0, dtype=np.intp)
+        self._route_end = np.empty(0, dtype=np.intp)
+        self._grow(capacity)
+
+        # Routes are packed into one (M, 2) waypoint array
+        self._route_chunks: List["np.ndarray"] = []
+        self._route_points = np.empty((0, 2))
+        self._route_length = 0
+        self._routes_dirty = False
+
+        self._threats: Dict[str, Tuple[Tuple[float, float, float], Tuple[float, float, float]]] = {}
+
+    def _grow(self, capacity: int) -> None:
+        """Resize state arrays to hold at least capacity rows."""
+        if capacity <= self._capacity:
+            return
+        capacity = max(capacity, 2 * self._capacity)
+
+        def resized(array: "np.ndarray", fill: Any) -> "np.ndarray":
+            shape = (capacity,) + array.shape[1:]
+            out = np.full(shape, fill, dtype=array.dtype)
+            out[:self.count] = array[:self.count]
+            return out
+
+        self._positions = resized(self._positions, 0.0)
+        self._headings = resized(self._headings, 0.0)
+        self._speeds = resized(self._speeds, 0.0)
+        self._steering = resized(self._steering, 0.0)
+        self._alive = resized(self._alive, False)
+        self._states = resized(self._states, STATE_CODES[AgentState.IDLE])
+        self._route_cursor = resized(self._route_cursor, 0)
+        self._route_end = resized(self._route_end, 0)
+        self._capacity = capacity
+
+    @property
+    def positions(self) -> "np.ndarray":
+        return self._positions[:self.count]
+
+    @property
+    def headings(self) -> "np.ndarray":
+        return self._headings[:self.count]
+
+    @property
+    def speeds(self) -> "np.ndarray":
+        return self._speeds[:self.count]
+
+    @property
+    def steering(self) -> "np.ndarray":
+        return self._steering[:self.count]
+
+    @property
+    def alive(self) -> "np.ndarray":
+        return self._alive[:self.count]
+
+    @property
+    def states(self) -> "np.ndarray":
+        return self._states[:self.count]
+
+    @property
+    def alive_count(self) -> int:
+        """Number of vehicles currently alive."""
+        return int(self.alive.sum())
+
+    def spawn(
+        self,
+        position: Sequence[float],
+        route: Optional[Sequence[Sequence[float]]] = None,
+        heading: float = 0.0,
+        speed: float = 0.0,
+        steering: float = 0.0,
+        vehicle_id: Optional[str] = None,
+    ) -> int:
+        """
+        Add a vehicle.
+
+        Args:
+            position: (x, y, z) start position
+            route: Waypoints to follow
+            heading: Initial heading in radians
+            speed: Initial speed in m/s
+            steering: Initial steering rate
+            vehicle_id: Name (default vehicle_<row>)
+
+        Returns:
+            Row index of the vehicle
+        """
+        row = self.count
+        self._grow(row + 1)
+        self.count += 1
+        self.vehicle_ids.append(vehicle_id or f"vehicle_{row}")
+
+        self._positions[row] = (position[0], position[1], position[2] if len(position) > 2 else 0.0)
+        self._headings[row] = heading
+        self._speeds[row] = speed
+        self._steering[row] = steering
+        self._alive[row] = True
+        self._states[row] = STATE_CODES[AgentState.IDLE]
+
+        if route:
+            waypoints = np.asarray([(p[0], p[1]) for p in route], dtype=np.float64)
+        else:
+            waypoints = np.empty((0, 2))
+        self._route_chunks.append(waypoints)
+        self._route_cursor[row] = self._route_length
+        self._route_length += len(waypoints)
+        self._route_end[row] = self._route_length
+        self._routes_dirty = True
+        return row
+
+    def despawn(self, row: int) -> None:
+        """Mark a vehicle as removed."""
+        self._alive[row] = False
+
+    def set_threat(
+        self,
+        threat_id: str,
+        position: Sequence[float],
+        velocity: Sequence[float] = (0.0, 0.0, 0.0),
+    ) -> None:
+        """Add or move a threat (hero car in chase) to avoid."""
+        self._threats[threat_id] = (tuple(position), tuple(velocity))
+
+    def remove_threat(self, threat_id: str) -> None:
+        """Remove a threat."""
+        self._threats.pop(threat_id, None)
+
+    def _packed_routes(self) -> "np.ndarray":
+        if self._routes_dirty:
+            self._route_points = (
+                np.concatenate(self._route_chunks) if self._route_chunks else np.empty((0, 2))
+            )
+            self._routes_dirty = False
+        return self._route_points
+
+    def _avoidance(self, xy: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Threat avoidance vectors and fleeing mask (AvoidanceSystem rules)."""
+        avoid_x = np.zeros(len(xy))
+        avoid_y = np.zeros(len(xy))
+        fleeing = np.zeros(len(xy), dtype=bool)
+        radius = self.config.avoidance_radius
+
+        for position, _ in self._threats.values():
+            dx = position[0] - xy[:, 0]
+            dy = position[1] - xy[:, 1]
+            dist = np.hypot(dx, dy)
+            near = dist < radius
+            if not near.any():
+                continue
+            strength = np.where(near, 1.0 - dist / radius, 0.0)
+            avoid_angle = np.arctan2(dy, dx) + math.pi / 2
+            avoid_x += np.cos(avoid_angle) * strength * 10
+            avoid_y += np.sin(avoid_angle) * strength * 10
+            fleeing |= dist < radius * 0.5
+
+        return avoid_x, avoid_y, fleeing
+
+    def step(self, delta_time: float) -> None:
+        """
+        Advance all alive vehicles by one time step.
+
+        Args:
+            delta_time: Time step in seconds
+        """
+        rows = np.flatnonzero(self.alive)
+        if not len(rows):
+            return
+
+        config = self.config
+        xy = self._positions[rows, :2]
+        speeds = self._speeds[rows]
+
+        avoid_x, avoid_y, fleeing = self._avoidance(xy)
+
+        # Collision check against vehicles in neighbouring cells only
+        grid = UniformGrid(config.safe_distance)
+        grid.build(xy)
+        colliding = grid.nearest_distance(config.safe_distance) < config.safe_distance
+
+        # State and target speed
+        avoiding = colliding & ~fleeing
+        target_speed = self.rng.uniform(config.min_speed, config.max_speed, len(rows)) / 3.6
+        target_speed = np.where(avoiding, np.maximum(0.0, speeds - 5), target_speed)
+        target_speed = np.where(
+            fleeing, config.max_speed * config.flee_speed_multiplier / 3.6, target_speed
+        )
+        states = np.full(len(rows), STATE_CODES[AgentState.DRIVING], dtype=np.int8)
+        states[avoiding] = STATE_CODES[AgentState.AVOIDING]
+        states[fleeing] = STATE_CODES[AgentState.FLEEING]
+        self._states[rows] = states
+
+        # Waypoint following for vehicles with route remaining
+        cursor = self._route_cursor[rows]
+        routed = cursor < self._route_end[rows]
+        if routed.any():
+            route_points = self._packed_routes()
+            routed_rows = rows[routed]
+            target = route_points[cursor[routed]]
+            dx = target[:, 0] - xy[routed, 0]
+            dy = target[:, 1] - xy[routed, 1]
+            reached = np.hypot(dx, dy) < WAYPOINT_RADIUS
+            self._route_cursor[routed_rows[reached]] += 1
+
+            desired = np.arctan2(dy, dx) + np.arctan2(avoid_y[routed], avoid_x[routed]) * 0.3
+            error = desired - self._headings[routed_rows]
+            error = (error + math.pi) % (2 * math.pi) - math.pi
+            self._steering[routed_rows] = error * 2.0
+
+        # Speed control and integration
+        max_speed = config.max_speed / 3.6
+        speeds = speeds + (target_speed - speeds) * 2.0 * delta_time
+        speeds = np.clip(speeds, 0.0, max_speed)
+        headings = self._headings[rows] + self._steering[rows] * delta_time
+
+        self._speeds[rows] = speeds
+        self._headings[rows] = headings
+        self._positions[rows, 0] += np.cos(headings) * speeds * delta_time
+        self._positions[rows, 1] += np.sin(headings) * speeds * delta_time
+
+        if self.despawn_extent is not None:
+            outside = (
+                (np.abs(self._positions[rows, 0]) > self.despawn_extent) |
+                (np.abs(self._positions[rows, 1]) > self.despawn_extent)
+            )
+            self._alive[rows[outside]] = False
+
+    def bake(
+        self,
+        frame_count: int,
+        fps: float = 24.0,
+        substeps: int = 1,
+        spawn_callback: Optional[Callable[["TrafficSimulation", int], None]] = None,
+    ) -> TrafficBake:
+        """
+        Simulate frames headlessly and record keyframe arrays.
+
+        Frame 0 records the initial state; each later frame is recorded
+        after simulating 1 / fps seconds.
+
+        Args:
+            frame_count: Number of frames to record
+            fps: Frames per second
+            substeps: Simulation steps per frame
+            spawn_callback: Called as (simulation, frame) before each
+                frame is simulated, e.g. to spawn vehicles
+
+        Returns:
+            TrafficBake with one column per vehicle spawned
+        """
+        delta_time = 1.0 / fps / substeps
+        positions: List["np.ndarray"] = []
+        headings: List["np.ndarray"] = []
+        alive: List["np.ndarray"] = []
+        states: List["np.ndarray"] = []
+
+        for frame in range(frame_count):
+            if frame > 0:
+                if spawn_callback is not None:
+                    spawn_callback(self, frame)
+                for _ in range(substeps):
+                    self.step(delta_time)
+            positions.append(self.positions.astype(np.float32))
+            headings.append(self.headings.astype(np.float32))
+            alive.append(self.alive.copy())
+            states.append(self.states.copy())
+
+        # Vehicles spawned mid-bake get empty (not alive) leading frames
+        count = self.count
+        bake = TrafficBake(
+            fps=fps,
+            vehicle_ids=list(self.vehicle_ids),
+            positions=np.zeros((frame_count, count, 3), dtype=np.float32),
+            headings=np.zeros((frame_count, count), dtype=np.float32),
+            alive=np.zeros((frame_count, count), dtype=bool),
+            states=np.full((frame_count, count), STATE_CODES[AgentState.IDLE], dtype=np.int8),
+        )
+        for frame in range(frame_count):
+            n = len(alive[frame])
+            bake.positions[frame, :n] = positions[frame]
+            bake.headings[frame, :n] = headings[frame]
+            bake.alive[frame, :n] = alive[frame]
+            bake.states[frame, :n] = states[frame]
+        return bake
+
+
+def benchmark_traffic_step(
+    vehicle_count: int = 5000,
+    steps: int = 24,
+    extent: float = 2000.0,
+    seed: int = 0,
+) -> Dict[str, float]:
+    """
+    Time vectorized simulation steps on random traffic.
+
+    Args:
+        vehicle_count: Number of vehicles
+        steps: Steps to time
+        extent: Half-size of the square vehicles are placed in
+        seed: Random seed
+
+    Returns:
+        Dictionary with vehicle count and seconds per step
+    """
+    import time
+
+    rng = np.random.default_rng(seed)
+    sim = TrafficSimulation(seed=seed, capacity=vehicle_count, despawn_extent=None)
+    starts = rng.uniform(-extent, extent, (vehicle_count, 2))
+    for start in starts:
+        goal = start + rng.uniform(-200, 200, 2)
+        sim.spawn((start[0], start[1], 0.0), [tuple(goal)], heading=float(rng.uniform(-math.pi, math.pi)))
+
+    start_time = time.perf_counter()
+    for _ in range(steps):
+        sim.step(1 / 24)
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        "vehicles": vehicle_count,
+        "steps": steps,
+        "seconds_per_step": elapsed / steps,
+    }
+
+
+__all__ = [
+    "AGENT_STATES",
+    "UniformGrid",
+    "TrafficBake",
+    "TrafficSimulation",
+    "benchmark_traffic_step",
+]
@@ -2,15 +2,27 @@
 Asset Vault Indexer
 
 Builds and maintains asset indices for fast search.
+
+Stat and metadata I/O run on a thread pool. Updates detect changes
+from mtime + size (optionally confirmed with a content hash) and patch
+the category/tag maps in place. Indices can be stored as JSON or in a
+SQLite database that loads without parsing one large document and
+accepts per-asset delta writes.
 """
 
+import hashlib
 import json
+import os
+import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from .enums import AssetCategory, AssetFormat
+from .metadata import extract_dimensions, extract_metadata
 from .scanner import scan_directory, detect_format, get_file_info
 from .types import AssetInfo, AssetIndex, SecurityConfig
 
@@ -18,24 +30,262 @@ from .types import AssetInfo, AssetIndex, SecurityConfig
 # Index configuration
 INDEX_VERSION = "1.0"
 INDEX_FILENAME = "asset_index.json"
+SQLITE_INDEX_FILENAME = "asset_index.sqlite"
 INDEX_DIR = ".gsd-state"
 
+# Content hashing
+HASH_CHUNK_SIZE = 1 << 20
+MTIME_TOLERANCE = 1e-5  # seconds
+CONTENT_HASH_KEY = "content_hash"
+
+
+def hash_file(path: Path) -> str:
+    """
+    Compute a SHA-1 content hash of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class IndexUpdateStats:
+    """Summary of an incremental index update."""
+    added: int = 0
+    modified: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    hashed: int = 0          # Files whose content hash was computed
+    touched: int = 0         # mtime/size changed but content identical
+    duration_ms: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to JSON-serializable dictionary."""
+        return {
+            "added": self.added,
+            "modified": self.modified,
+            "removed": self.removed,
+            "unchanged": self.unchanged,
+            "hashed": self.hashed,
+            "touched": self.touched,
+            "duration_ms": self.duration_ms,
+        }
+
+
+class SQLiteIndexStore:
+    """
+    SQLite-backed asset index storage.
+
+    Each asset is one row of compact JSON keyed by relative path, so
+    updates write only changed rows. Category and tag maps are derived
+    from the assets on load.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the store.
+
+        Args:
+            path: Database file path
+        """
+        self.path = Path(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("CREATE TABLE IF NOT EXISTS assets (rel_path TEXT PRIMARY KEY, data TEXT NOT NULL)")
+        return conn
+
+    def _write_meta(self, conn: sqlite3.Connection, index: AssetIndex) -> None:
+        meta = {
+            "version": index.version,
+            "created_at": index.created_at.isoformat() if index.created_at else "",
+            "updated_at": index.updated_at.isoformat() if index.updated_at else "",
+            "root_path": str(index.root_path) if index.root_path else "",
+        }
+        conn.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)", meta.items())
+
+    @staticmethod
+    def _encode(info: AssetInfo) -> str:
+        return json.dumps(info.to_dict(), separators=(",", ":"))
+
+    def save(self, index: AssetIndex) -> Path:
+        """
+        Replace the stored index.
+
+        Args:
+            index: Index to save
+
+        Returns:
+            Database path
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM assets")
+                conn.executemany(
+                    "INSERT INTO assets VALUES (?, ?)",
+                    ((rel, self._encode(info)) for rel, info in index.assets.items()),
+                )
+                self._write_meta(conn, index)
+        finally:
+            conn.close()
+        return self.path
+
+    def save_delta(
+        self,
+        index: AssetIndex,
+        changed: Iterable[str],
+        removed: Iterable[str],
+    ) -> Path:
+        """
+        Write only changed and removed assets.
+
+        Args:
+            index: Updated index
+            changed: Relative paths added or modified
+            removed: Relative paths removed
+
+        Returns:
+            Database path
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany("DELETE FROM assets WHERE rel_path = ?", ((r,) for r in removed))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO assets VALUES (?, ?)",
+                    ((rel, self._encode(index.assets[rel])) for rel in changed),
+                )
+                self._write_meta(conn, index)
+        finally:
+            conn.close()
+        return self.path
+
+    def load(self) -> Optional[AssetIndex]:
+        """
+        Load the stored index.
+
+        Returns:
+            AssetIndex, or None if missing or incompatible
+        """
+        if not self.path.exists():
+            return None
+
+        try:
+            conn = sqlite3.connect(str(self.path))
+            try:
+                meta = dict(conn.execute("SELECT key, value FROM meta"))
+                rows = conn.execute("SELECT rel_path, data FROM assets").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+
+        if meta.get("version") != INDEX_VERSION:
+            return None
+
+        index = AssetIndex(
+            version=meta["version"],
+            created_at=datetime.fromisoformat(meta["created_at"]) if meta.get("created_at") else None,
+            updated_at=datetime.fromisoformat(meta["updated_at"]) if meta.get("updated_at") else None,
+            root_path=Path(meta["root_path"]) if meta.get("root_path") else None,
+        )
+        for rel_path, data in rows:
+            info = AssetInfo.from_dict(json.loads(data))
+            index.assets[rel_path] = info
+            _add_to_maps(index, rel_path, info)
+        return index
+
+
+def _add_to_maps(index: AssetIndex, rel_path: str, info: AssetInfo) -> None:
+    """Add an asset to the category and tag maps."""
+    if info.category:
+        index.categories.setdefault(info.category.value, []).append(rel_path)
+    for tag in info.tags:
+        index.tags.setdefault(tag, []).append(rel_path)
+
+
+def _remove_from_maps(index: AssetIndex, removed: Dict[str, AssetInfo]) -> None:
+    """
+    Remove assets from the category and tag maps.
+
+    Only the map entries the removed assets belonged to are rewritten.
+    """
+    by_category: Dict[str, Set[str]] = {}
+    by_tag: Dict[str, Set[str]] = {}
+    for rel_path, info in removed.items():
+        if info.category:
+            by_category.setdefault(info.category.value, set()).add(rel_path)
+        for tag in info.tags:
+            by_tag.setdefault(tag, set()).add(rel_path)
+
+    for mapping, drops in ((index.categories, by_category), (index.tags, by_tag)):
+        for key, paths in drops.items():
+            if key not in mapping:
+                continue
+            remaining = [p for p in mapping[key] if p not in paths]
+            if remaining:
+                mapping[key] = remaining
+            else:
+                del mapping[key]
+
 
 class AssetIndexer:
     """
     Builds and maintains asset indices.
 
-    The index is stored as JSON for human readability and fast loading.
+    The index is stored as JSON for human readability and fast loading,
+    or in SQLite for large libraries.
     """
 
-    def __init__(self, config: Optional[SecurityConfig] = None):
+    def __init__(
+        self,
+        config: Optional[SecurityConfig] = None,
+        max_workers: Optional[int] = None,
+        extract_metadata: bool = False,
+        content_hash: bool = False,
+        storage: str = "json",
+    ):
         """
         Initialize the indexer.
 
         Args:
             config: Security configuration for path validation
+            max_workers: Threads for stat/metadata I/O (1 = serial)
+            extract_metadata: Parse files for materials, objects and dimensions
+            content_hash: Store a content hash and use it to confirm changes
+            storage: Index storage, "json" or "sqlite"
         """
+        if storage not in ("json", "sqlite"):
+            raise ValueError(f"Unknown index storage: {storage}")
+
         self.config = config or SecurityConfig()
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.extract_metadata = extract_metadata
+        self.content_hash = content_hash
+        self.storage = storage
+        self.last_update: Optional[IndexUpdateStats] = None
+
+    def _map(self, func: Callable[[Any], Any], items: List[Any]) -> Iterable[Any]:
+        """Apply func to items on the I/O thread pool, preserving order."""
+        if self.max_workers <= 1 or len(items) < 2:
+            return map(func, items)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            return list(executor.map(func, items))
+        finally:
+            executor.shutdown()
 
     def build_index(
         self,
@@ -74,29 +324,19 @@ class AssetIndexer:
             root_path=library_path,
         )
 
-        for i, asset_path in enumerate(assets):
+        # Stat and extract metadata on the thread pool
+        infos = self._map(lambda p: self._create_asset_info(p, library_path), assets)
+
+        for i, (asset_path, info) in enumerate(zip(assets, infos)):
             if progress_callback:
                 progress_callback(i + 1, total, asset_path)
 
-            # Create AssetInfo
-            info = self._create_asset_info(asset_path, library_path)
-
             # Add to index
             rel_path = str(asset_path.relative_to(library_path))
             index.assets[rel_path] = info
 
-            # Update category mapping
-            if info.category:
-                cat_name = info.category.value
-                if cat_name not in index.categories:
-                    index.categories[cat_name] = []
-                index.categories[cat_name].append(rel_path)
-
-            # Update tag mappings
-            for tag in info.tags:
-                if tag not in index.tags:
-                    index.tags[tag] = []
-                index.tags[tag].append(rel_path)
+            # Update category and tag mappings
+            _add_to_maps(index, rel_path, info)
 
         # Save index
         self.save_index(index)
@@ -129,19 +369,36 @@ class AssetIndexer:
             last_modified=datetime.fromtimestamp(file_info.get("modified_time", 0)),
         )
 
+        if self.extract_metadata and file_info.get("is_readable", False):
+            metadata = extract_metadata(asset_path, info.format)
+            info.metadata.update(metadata)
+            info.materials = list(metadata.get("materials", []))
+            info.objects = list(metadata.get("objects", []))
+            info.dimensions = extract_dimensions(asset_path, info.format)
+
+        if self.content_hash and file_info.get("is_readable", False):
+            info.metadata[CONTENT_HASH_KEY] = hash_file(asset_path)
+
         return info
 
     def update_index(
         self,
         index: AssetIndex,
         check_modified: bool = True,
+        save: bool = False,
     ) -> AssetIndex:
         """
         Update an existing index with new/modified/removed files.
 
+        Files are considered modified when their mtime or size differs
+        from the index. With content hashing enabled, a matching hash
+        turns a modification into a metadata-only touch. Category and
+        tag maps are patched for changed assets only.
+
         Args:
             index: Existing index to update
             check_modified: If True, re-index modified files
+            save: Persist the update (SQLite storage writes only the delta)
 
         Returns:
             Updated AssetIndex
@@ -149,64 +406,133 @@ class AssetIndexer:
         if not index.root_path:
             raise ValueError("Index has no root_path")
 
+        start_time = time.time()
+        stats = IndexUpdateStats()
+        root = index.root_path
+
         # Scan current files
-        current_assets = set(scan_directory(index.root_path, recursive=True, config=self.config))
         current_rel_paths = {
-            str(p.relative_to(index.root_path)): p
-            for p in current_assets
+            str(p.relative_to(root)): p
+            for p in scan_directory(root, recursive=True, config=self.config)
         }
 
         # Find removed assets
-        indexed_paths = set(index.assets.keys())
-        removed = indexed_paths - set(current_rel_paths.keys())
+        removed = {
+            rel_path: index.assets[rel_path]
+            for rel_path in set(index.assets) - set(current_rel_paths)
+        }
+
+        # Stat existing assets in parallel (mtime + size fast path)
+        existing = [r for r in current_rel_paths if r in index.assets]
+        added = [r for r in current_rel_paths if r not in index.assets]
+        modified: List[str] = []
+        touched: List[str] = []
+
+        if check_modified:
+            changes = self._map(
+                lambda r: self._check_modified(index.assets[r], current_rel_paths[r]),
+                existing,
+            )
+            for rel_path, (state, hashed) in zip(existing, changes):
+                stats.hashed += hashed
+                if state == "modified":
+                    modified.append(rel_path)
+                elif state == "touched":
+                    touched.append(rel_path)
+                else:
+                    stats.unchanged += 1
+        else:
+            stats.unchanged = len(existing)
+
+        # Re-index new and modified assets in parallel
+        changed = added + modified
+        infos = self._map(
+            lambda r: self._create_asset_info(current_rel_paths[r], root),
+            changed,
+        )
+
+        # Patch category/tag maps
+        replaced = {r: index.assets[r] for r in modified}
+        replaced.update(removed)
+        _remove_from_maps(index, replaced)
 
-        # Remove deleted assets
         for rel_path in removed:
             del index.assets[rel_path]
 
-        # Find new and modified assets
-        for rel_path, asset_path in current_rel_paths.items():
-            if rel_path not in index.assets:
-                # New asset
-                info = self._create_asset_info(asset_path, index.root_path)
-                index.assets[rel_path] = info
-            elif check_modified:
-                # Check if modified
-                existing = index.assets[rel_path]
-                stat = asset_path.stat()
-                modified = datetime.fromtimestamp(stat.st_mtime)
-
-                if existing.last_modified and modified > existing.last_modified:
-                    # Re-index modified asset
-                    info = self._create_asset_info(asset_path, index.root_path)
-                    index.assets[rel_path] = info
-
-        # Rebuild category/tag mappings
-        index.categories.clear()
-        index.tags.clear()
-
-        for rel_path, info in index.assets.items():
-            if info.category:
-                cat_name = info.category.value
-                if cat_name not in index.categories:
-                    index.categories[cat_name] = []
-                index.categories[cat_name].append(rel_path)
-
-            for tag in info.tags:
-                if tag not in index.tags:
-                    index.tags[tag] = []
-                index.tags[tag].append(rel_path)
+        for rel_path, info in zip(changed, infos):
+            index.assets[rel_path] = info
+            _add_to_maps(index, rel_path, info)
+
+        stats.added = len(added)
+        stats.modified = len(modified)
+        stats.removed = len(removed)
+        stats.touched = len(touched)
+        if self.content_hash:
+            stats.hashed += len(changed)
 
         index.updated_at = datetime.now()
+
+        if save:
+            if self.storage == "sqlite":
+                store = SQLiteIndexStore(self.get_index_path(root))
+                if store.path.exists():
+                    store.save_delta(index, changed + touched, removed)
+                else:
+                    store.save(index)
+            else:
+                self.save_index(index)
+
+        stats.duration_ms = int((time.time() - start_time) * 1000)
+        self.last_update = stats
         return index
 
+    def _check_modified(self, info: AssetInfo, asset_path: Path) -> Tuple[str, int]:
+        """
+        Compare a file against its indexed state.
+
+        Args:
+            info: Indexed asset info
+            asset_path: Current file path
+
+        Returns:
+            Tuple of (state, files hashed); state is "unchanged",
+            "touched" (content identical) or "modified"
+        """
+        try:
+            stat = asset_path.stat()
+        except OSError:
+            return "modified", 0
+
+        # Indexed times are stored with microsecond precision
+        indexed_mtime = info.last_modified.timestamp() if info.last_modified else None
+        if (
+            indexed_mtime is not None
+            and stat.st_size == info.file_size
+            and abs(stat.st_mtime - indexed_mtime) < MTIME_TOLERANCE
+        ):
+            return "unchanged", 0
+
+        stored_hash = info.metadata.get(CONTENT_HASH_KEY)
+        if self.content_hash and stored_hash:
+            try:
+                if hash_file(asset_path) == stored_hash:
+                    # Same content: refresh stat fields only
+                    info.file_size = stat.st_size
+                    info.last_modified = datetime.fromtimestamp(stat.st_mtime)
+                    return "touched", 1
+            except OSError:
+                pass
+            return "modified", 1
+
+        return "modified", 0
+
     def save_index(
         self,
         index: AssetIndex,
         path: Optional[Path] = None,
     ) -> Path:
         """
-        Save index to JSON file.
+        Save index to JSON file (or SQLite database).
 
         Args:
             index: Index to save
@@ -219,7 +545,10 @@ class AssetIndexer:
             raise ValueError("Index has no root_path")
 
         if path is None:
-            path = index.root_path / INDEX_DIR / INDEX_FILENAME
+            path = self.get_index_path(index.root_path)
+
+        if self.storage == "sqlite":
+            return SQLiteIndexStore(path).save(index)
 
         # Ensure directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -234,7 +563,7 @@ class AssetIndexer:
 
     def load_index(self, library_path: Path) -> Optional[AssetIndex]:
         """
-        Load index from JSON file.
+        Load index from JSON file (or SQLite database).
 
         Args:
             library_path: Root directory of the library
@@ -242,7 +571,10 @@ class AssetIndexer:
         Returns:
             AssetIndex if found, None otherwise
         """
-        path = library_path / INDEX_DIR / INDEX_FILENAME
+        path = self.get_index_path(library_path)
+
+        if self.storage == "sqlite":
+            return SQLiteIndexStore(path).load()
 
         if not path.exists():
             return None
@@ -270,6 +602,8 @@ class AssetIndexer:
         Returns:
             Path to index file
         """
+        if self.storage == "sqlite":
+            return library_path / INDEX_DIR / SQLITE_INDEX_FILENAME
         return library_path / INDEX_DIR / INDEX_FILENAME
 
 
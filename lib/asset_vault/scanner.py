@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 from .enums import AssetFormat, EXTENSION_MAP
-from .security import sanitize_path, SecurityConfig, SecurityError
+from .security import sanitize_path, validate_file_access, SecurityConfig
 
 
 # Supported file extensions
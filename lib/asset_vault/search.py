@@ -4,11 +4,13 @@ Asset Vault Search Engine
 Full-text, tag-based, and hybrid search for assets.
 """
 
+import heapq
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional
 
 from .enums import AssetCategory, AssetFormat, SearchMode
+from .search_index import SearchIndex, load_or_build_search_index, tokenize
 from .types import AssetIndex, AssetInfo, SearchResult
 
 
@@ -74,32 +76,29 @@ class SearchEngine:
     - HYBRID: Combined approaches
     """
 
-    def __init__(self, index: AssetIndex):
+    def __init__(
+        self,
+        index: AssetIndex,
+        persist: bool = True,
+        index_path: Optional[Path] = None,
+    ):
         """
         Initialize search engine with an index.
 
+        When the asset index has a root_path, the text index is loaded
+        from {root_path}/.gsd-state if it matches the asset index, and
+        rebuilt (and saved) otherwise.
+
         Args:
             index: Asset index to search
+            persist: Load/save the text index next to the asset index
+                (False: always build in memory)
+            index_path: Override text index file location
         """
         self.index = index
-        self._text_index: Dict[str, List[Tuple[str, float]]] = {}
-        self._build_text_index()
-
-    def _build_text_index(self) -> None:
-        """Build inverted index for text search."""
-        for rel_path, asset in self.index.assets.items():
-            # Tokenize name and path
-            tokens = self._tokenize(asset.name)
-            tokens.extend(self._tokenize(str(asset.path)))
-
-            # Add tokens to index
-            for token in tokens:
-                if token not in self._text_index:
-                    self._text_index[token] = []
-
-                # Score based on position (name > path)
-                score = 1.0 if token in asset.name.lower() else 0.7
-                self._text_index[token].append((rel_path, score))
+        self._search_index: SearchIndex = load_or_build_search_index(
+            index, path=index_path, persist=persist
+        )
 
     def _tokenize(self, text: str) -> List[str]:
         """
@@ -111,10 +110,7 @@ class SearchEngine:
         Returns:
             List of lowercase tokens
         """
-        # Simple tokenization: lowercase, split on non-alphanumeric
-        import re
-        tokens = re.findall(r"[a-z0-9]+", text.lower())
-        return tokens
+        return tokenize(text)
 
     def search(self, query: SearchQuery) -> List[SearchResult]:
         """
@@ -127,7 +123,10 @@ class SearchEngine:
             List of SearchResult, sorted by score descending
         """
         if query.mode == SearchMode.TEXT:
-            results = self.text_search(query.text or "")
+            # Without post-filters only the top results are ever needed
+            unfiltered = not (query.category or query.formats or query.min_score > 0)
+            top_k = query.max_results if unfiltered else None
+            results = self.text_search(query.text or "", top_k=top_k)
         elif query.mode == SearchMode.TAG:
             results = self.tag_search(query.tags or [])
         elif query.mode == SearchMode.HYBRID:
@@ -146,62 +145,37 @@ class SearchEngine:
         # Filter by minimum score
         results = [r for r in results if r.score >= query.min_score]
 
-        # Sort by score and limit
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results[:query.max_results]
+        # Select the best results without sorting everything
+        return heapq.nlargest(query.max_results, results, key=lambda r: r.score)
 
-    def text_search(self, text: str, fuzzy: bool = True) -> List[SearchResult]:
+    def text_search(
+        self,
+        text: str,
+        fuzzy: bool = True,
+        top_k: Optional[int] = None,
+    ) -> List[SearchResult]:
         """
-        Full-text search.
+        Full-text search with BM25 ranking.
 
         Args:
             text: Search text
-            fuzzy: Enable fuzzy (substring) matching
+            fuzzy: Enable fuzzy (prefix) matching
+            top_k: Return only the best k results (None = all)
 
         Returns:
-            List of SearchResult
+            List of SearchResult, best first
         """
         if not text:
             return []
 
-        tokens = self._tokenize(text)
-        if not tokens:
-            return []
-
-        # Aggregate scores per asset
-        scores: Dict[str, float] = {}
-        highlights: Dict[str, List[str]] = {}
-
-        for token in tokens:
-            # Exact match
-            if token in self._text_index:
-                for rel_path, score in self._text_index[token]:
-                    if rel_path not in scores:
-                        scores[rel_path] = 0.0
-                        highlights[rel_path] = []
-                    scores[rel_path] += score
-                    highlights[rel_path].append(token)
-
-            # Fuzzy match (prefix)
-            elif fuzzy:
-                for indexed_token in self._text_index:
-                    if indexed_token.startswith(token):
-                        for rel_path, score in self._text_index[indexed_token]:
-                            if rel_path not in scores:
-                                scores[rel_path] = 0.0
-                                highlights[rel_path] = []
-                            scores[rel_path] += score * 0.7  # Lower score for fuzzy
-                            highlights[rel_path].append(indexed_token)
-
-        # Build results
         results = []
-        for rel_path, score in scores.items():
+        for rel_path, score, highlights in self._search_index.search(text, fuzzy=fuzzy, top_k=top_k):
             if rel_path in self.index.assets:
                 results.append(SearchResult(
                     asset=self.index.assets[rel_path],
-                    score=min(1.0, score / len(tokens)),  # Normalize to 0-1
+                    score=score,
                     match_type="text",
-                    highlights=highlights.get(rel_path, []),
+                    highlights=highlights,
                 ))
 
         return results
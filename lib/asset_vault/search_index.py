@@ -0,0 +1,616 @@
+"""
+Asset Vault Search Index
+
+Persistent inverted index with BM25 ranking for asset text search.
+
+The vocabulary is kept sorted so prefix (fuzzy) lookups are two binary
+searches instead of a scan over every token. Postings are stored in
+flat typed arrays and written to a compact binary file next to the
+asset index, so large libraries load the index instead of rebuilding it.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import re
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .types import AssetIndex
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Index file configuration
+SEARCH_INDEX_VERSION = 1
+SEARCH_INDEX_FILENAME = "asset_search.idx"
+SEARCH_INDEX_MAGIC = b"GSDSIDX1"
+
+# Field weights (name matches count more than path matches)
+NAME_WEIGHT = 1.0
+PATH_WEIGHT = 0.7
+
+# Prefix matches score lower than exact token matches
+FUZZY_WEIGHT = 0.7
+MAX_PREFIX_EXPANSIONS = 64
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Tokenize text for indexing.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of lowercase alphanumeric tokens
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+def index_fingerprint(index: AssetIndex) -> str:
+    """
+    Identify the asset index state a search index was built from.
+
+    The digest covers every asset's relative path, name, modification
+    time and size, so a different asset set of the same size (or an
+    index without updated_at) does not match a stale search index.
+
+    Args:
+        index: Asset index
+
+    Returns:
+        Fingerprint string (update time, asset count and asset digest)
+    """
+    digest = hashlib.sha1()
+    for rel_path in sorted(index.assets):
+        asset = index.assets[rel_path]
+        modified = asset.last_modified.isoformat() if asset.last_modified else ""
+        digest.update(f"{rel_path}\0{asset.name}\0{modified}\0{asset.file_size}\n".encode("utf-8"))
+
+    updated = index.updated_at.isoformat() if index.updated_at else ""
+    return f"{updated}|{len(index.assets)}|{digest.hexdigest()}"
+
+
+class SearchIndex:
+    """
+    BM25 inverted index over asset names and relative paths.
+
+    Attributes:
+        doc_paths: Document id -> asset relative path
+        tokens: Sorted vocabulary
+        fingerprint: Fingerprint of the source AssetIndex
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.doc_paths: List[str] = []
+        self.tokens: List[str] = []
+        self.fingerprint = ""
+        self._token_ids: Dict[str, int] = {}
+        self._offsets = array("I", [0])
+        self._doc_ids = array("I")
+        self._tfs = array("f")
+        self._doc_lengths = array("f")
+        self._avg_length = 0.0
+        self._np_arrays = None
+
+    def __len__(self) -> int:
+        return len(self.doc_paths)
+
+    @classmethod
+    def from_documents(
+        cls,
+        documents: Iterable[Tuple[str, str]],
+        fingerprint: str = "",
+    ) -> "SearchIndex":
+        """
+        Build an index from (relative path, name) pairs.
+
+        Args:
+            documents: Iterable of (relative path, asset name)
+            fingerprint: Source index fingerprint
+
+        Returns:
+            Built SearchIndex
+        """
+        postings: Dict[str, Tuple[array, array]] = {}
+        index = cls()
+        index.fingerprint = fingerprint
+
+        for doc_id, (rel_path, name) in enumerate(documents):
+            weights: Counter = Counter()
+            for token in tokenize(name):
+                weights[token] += NAME_WEIGHT
+            for token in tokenize(rel_path):
+                weights[token] += PATH_WEIGHT
+
+            index.doc_paths.append(rel_path)
+            index._doc_lengths.append(sum(weights.values()))
+
+            for token, tf in weights.items():
+                entry = postings.get(token)
+                if entry is None:
+                    entry = postings[token] = (array("I"), array("f"))
+                entry[0].append(doc_id)
+                entry[1].append(tf)
+
+        index.tokens = sorted(postings)
+        for token in index.tokens:
+            doc_ids, tfs = postings.pop(token)
+            index._doc_ids.extend(doc_ids)
+            index._tfs.extend(tfs)
+            index._offsets.append(len(index._doc_ids))
+
+        index._finalize()
+        return index
+
+    @classmethod
+    def from_asset_index(cls, index: AssetIndex) -> "SearchIndex":
+        """
+        Build an index from an AssetIndex.
+
+        Args:
+            index: Asset index
+
+        Returns:
+            Built SearchIndex
+        """
+        documents = ((rel_path, asset.name) for rel_path, asset in index.assets.items())
+        return cls.from_documents(documents, index_fingerprint(index))
+
+    def _finalize(self) -> None:
+        """Rebuild derived lookup tables."""
+        self._token_ids = {token: i for i, token in enumerate(self.tokens)}
+        count = len(self._doc_lengths)
+        self._avg_length = sum(self._doc_lengths) / count if count else 0.0
+        self._np_arrays = None
+
+    def document_frequency(self, token: str) -> int:
+        """
+        Get the number of documents containing a token.
+
+        Args:
+            token: Exact token
+
+        Returns:
+            Document frequency (0 if unknown)
+        """
+        token_id = self._token_ids.get(token)
+        if token_id is None:
+            return 0
+        return self._offsets[token_id + 1] - self._offsets[token_id]
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """
+        Find vocabulary positions of tokens starting with a prefix.
+
+        Args:
+            prefix: Token prefix
+
+        Returns:
+            Half-open (start, end) range into tokens
+        """
+        start = bisect_left(self.tokens, prefix)
+        end = bisect_left(self.tokens, prefix + "\uffff", start)
+        return start, end
+
+    def expand_prefix(self, prefix: str, limit: int = MAX_PREFIX_EXPANSIONS) -> List[str]:
+        """
+        Get the most frequent tokens starting with a prefix.
+
+        Args:
+            prefix: Token prefix
+            limit: Maximum tokens to return
+
+        Returns:
+            Matching tokens, most frequent first
+        """
+        start, end = self.prefix_range(prefix)
+        candidates = range(start, end)
+        if end - start > limit:
+            candidates = heapq.nlargest(
+                limit, candidates, key=lambda i: self._offsets[i + 1] - self._offsets[i]
+            )
+        return [self.tokens[i] for i in candidates]
+
+    def _idf(self, df: int) -> float:
+        """BM25 inverse document frequency."""
+        n = len(self.doc_paths)
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def search(
+        self,
+        text: str,
+        fuzzy: bool = True,
+        top_k: Optional[int] = None,
+    ) -> List[Tuple[str, float, List[str]]]:
+        """
+        Rank documents for a text query.
+
+        Query tokens found in the vocabulary score as exact matches;
+        with fuzzy enabled, unknown tokens expand to indexed tokens
+        sharing the prefix at reduced weight. Scores are normalized by
+        the maximum attainable BM25 score, giving values in 0-1.
+
+        Args:
+            text: Query text
+            fuzzy: Enable prefix matching for unknown tokens
+            top_k: Return only the best k results (None = all)
+
+        Returns:
+            List of (relative path, score, matched tokens), best first
+        """
+        query_tokens = tokenize(text)
+        if not query_tokens or not self.doc_paths:
+            return []
+
+        # Resolve query tokens to (indexed token, weight) matches
+        expanded: List[List[Tuple[str, float]]] = []
+        for query_token in query_tokens:
+            if query_token in self._token_ids:
+                expanded.append([(query_token, 1.0)])
+            elif fuzzy:
+                expanded.append([(t, FUZZY_WEIGHT) for t in self.expand_prefix(query_token)])
+            else:
+                expanded.append([])
+
+        # Upper bound of each query token's BM25 contribution
+        max_score = 0.0
+        for matches in expanded:
+            if matches:
+                max_score += max(self._idf(self.document_frequency(t)) * w for t, w in matches)
+            else:
+                max_score += self._idf(0)
+        max_score *= BM25_K1 + 1.0
+
+        if HAS_NUMPY:
+            ranked = self._score_numpy(expanded, top_k)
+        else:
+            ranked = self._score_python(expanded, top_k)
+
+        return [
+            (self.doc_paths[doc_id], min(1.0, score / max_score), highlights)
+            for doc_id, score, highlights in ranked
+        ]
+
+    def _score_python(
+        self,
+        expanded: List[List[Tuple[str, float]]],
+        top_k: Optional[int],
+    ) -> List[Tuple[int, float, List[str]]]:
+        """Accumulate BM25 scores with plain Python loops."""
+        k1, b = BM25_K1, BM25_B
+        avg_length = self._avg_length or 1.0
+        lengths = self._doc_lengths
+        scores: Dict[int, float] = {}
+        highlights: Dict[int, List[str]] = {}
+
+        for matches in expanded:
+            for token, weight in matches:
+                token_id = self._token_ids[token]
+                start, end = self._offsets[token_id], self._offsets[token_id + 1]
+                idf = self._idf(end - start) * weight
+
+                for doc_id, tf in zip(self._doc_ids[start:end], self._tfs[start:end]):
+                    norm = k1 * (1.0 - b + b * lengths[doc_id] / avg_length)
+                    score = idf * tf * (k1 + 1.0) / (tf + norm)
+                    if doc_id in scores:
+                        scores[doc_id] += score
+                        highlights[doc_id].append(token)
+                    else:
+                        scores[doc_id] = score
+                        highlights[doc_id] = [token]
+
+        if top_k is None:
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        else:
+            ranked = heapq.nlargest(top_k, scores.items(), key=lambda item: item[1])
+
+        return [(doc_id, score, highlights[doc_id]) for doc_id, score in ranked]
+
+    def _score_numpy(
+        self,
+        expanded: List[List[Tuple[str, float]]],
+        top_k: Optional[int],
+    ) -> List[Tuple[int, float, List[str]]]:
+        """Accumulate BM25 scores over whole posting lists with NumPy."""
+        if self._np_arrays is None:
+            self._np_arrays = (
+                np.frombuffer(self._doc_ids, dtype=np.uint32),
+                np.frombuffer(self._tfs, dtype=np.float32),
+                np.frombuffer(self._doc_lengths, dtype=np.float32),
+            )
+        doc_ids, tfs, lengths = self._np_arrays
+
+        k1, b = BM25_K1, BM25_B
+        avg_length = self._avg_length or 1.0
+        scores = np.zeros(len(self.doc_paths), dtype=np.float64)
+        matched = np.zeros(len(self.doc_paths), dtype=bool)
+        postings: List[Tuple[str, np.ndarray]] = []
+
+        for matches in expanded:
+            for token, weight in matches:
+                token_id = self._token_ids[token]
+                start, end = self._offsets[token_id], self._offsets[token_id + 1]
+                idf = self._idf(end - start) * weight
+
+                ids = doc_ids[start:end]
+                tf = tfs[start:end].astype(np.float64)
+                norm = k1 * (1.0 - b + b * lengths[ids] / avg_length)
+                # Doc ids are unique within one posting list
+                scores[ids] += idf * tf * (k1 + 1.0) / (tf + norm)
+                matched[ids] = True
+                postings.append((token, ids))
+
+        candidates = np.flatnonzero(matched)
+        if top_k is not None and top_k < len(candidates):
+            part = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+            candidates = candidates[part]
+        # Stable sort keeps ascending doc ids for equal scores
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        ranked = []
+        for doc_id in candidates.tolist():
+            ranked.append((doc_id, float(scores[doc_id]), []))
+        if postings:
+            positions = {doc_id: i for i, (doc_id, _, _) in enumerate(ranked)}
+            for token, ids in postings:
+                for doc_id in ids[np.isin(ids, candidates)].tolist():
+                    ranked[positions[doc_id]][2].append(token)
+        return ranked
+
+    def save(self, path: Path) -> Path:
+        """
+        Write the index to a binary file.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Path written
+        """
+        header = json.dumps({
+            "version": SEARCH_INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "byteorder": sys.byteorder,
+            "documents": len(self.doc_paths),
+            "tokens": len(self.tokens),
+            "postings": len(self._doc_ids),
+        }).encode("utf-8")
+
+        sections = [
+            "\0".join(self.doc_paths).encode("utf-8"),
+            "\0".join(self.tokens).encode("utf-8"),
+            self._offsets.tobytes(),
+            self._doc_ids.tobytes(),
+            self._tfs.tobytes(),
+            self._doc_lengths.tobytes(),
+        ]
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(SEARCH_INDEX_MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            for section in sections:
+                f.write(struct.pack("<Q", len(section)))
+                f.write(section)
+        tmp_path.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SearchIndex"]:
+        """
+        Read an index written by save().
+
+        Args:
+            path: Index file path
+
+        Returns:
+            SearchIndex, or None if missing, corrupt or incompatible
+        """
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            if data[:len(SEARCH_INDEX_MAGIC)] != SEARCH_INDEX_MAGIC:
+                return None
+            pos = len(SEARCH_INDEX_MAGIC)
+            (header_len,) = struct.unpack_from("<I", data, pos)
+            pos += 4
+            header = json.loads(data[pos:pos + header_len])
+            pos += header_len
+            if header.get("version") != SEARCH_INDEX_VERSION:
+                return None
+
+            sections = []
+            for _ in range(6):
+                (length,) = struct.unpack_from("<Q", data, pos)
+                pos += 8
+                sections.append(data[pos:pos + length])
+                pos += length
+        except (struct.error, ValueError):
+            return None
+
+        index = cls()
+        index.fingerprint = header.get("fingerprint", "")
+        paths, tokens = (s.decode("utf-8") for s in sections[:2])
+        index.doc_paths = paths.split("\0") if header["documents"] else []
+        index.tokens = tokens.split("\0") if header["tokens"] else []
+
+        index._offsets = array("I")
+        index._doc_ids = array("I")
+        index._tfs = array("f")
+        index._doc_lengths = array("f")
+        arrays = (index._offsets, index._doc_ids, index._tfs, index._doc_lengths)
+        for target, raw in zip(arrays, sections[2:]):
+            target.frombytes(raw)
+            if header.get("byteorder") != sys.byteorder:
+                target.byteswap()
+
+        if (
+            len(index.doc_paths) != header["documents"]
+            or len(index._offsets) != header["tokens"] + 1
+            or len(index._doc_ids) != header["postings"]
+        ):
+            return None
+
+        index._finalize()
+        return index
+
+
+def get_search_index_path(index: AssetIndex) -> Optional[Path]:
+    """
+    Get the persistent search index path for an asset index.
+
+    Args:
+        index: Asset index
+
+    Returns:
+        Path next to the asset index, or None without a root_path
+    """
+    if not index.root_path:
+        return None
+
+    from .indexer import INDEX_DIR
+    return Path(index.root_path) / INDEX_DIR / SEARCH_INDEX_FILENAME
+
+
+def load_or_build_search_index(
+    index: AssetIndex,
+    path: Optional[Path] = None,
+    persist: bool = True,
+) -> SearchIndex:
+    """
+    Load the persisted search index, rebuilding it when stale.
+
+    Indices without a root_path (and no explicit path) are built in
+    memory only.
+
+    Args:
+        index: Asset index to search
+        path: Index file (default: {root_path}/.gsd-state/asset_search.idx)
+        persist: Read and write the index file (False: build in memory)
+
+    Returns:
+        SearchIndex matching the asset index
+    """
+    if path is None:
+        path = get_search_index_path(index)
+    if not persist or path is None:
+        return SearchIndex.from_asset_index(index)
+
+    fingerprint = index_fingerprint(index)
+    search_index = SearchIndex.load(path)
+    if search_index is not None and search_index.fingerprint == fingerprint:
+        return search_index
+
+    search_index = SearchIndex.from_asset_index(index)
+    try:
+        search_index.save(path)
+    except OSError:
+        pass  # Read-only library: keep the in-memory index
+    return search_index
+
+
+def synthetic_documents(count: int, seed: int = 0) -> List[Tuple[str, str]]:
+    """
+    Generate synthetic (relative path, name) pairs for benchmarking.
+
+    Args:
+        count: Number of documents
+        seed: Random seed
+
+    Returns:
+        List of (relative path, name)
+    """
+    import random
+
+    rng = random.Random(seed)
+    styles = ["cyberpunk", "modern", "vintage", "rustic", "scifi", "medieval", "lowpoly", "industrial"]
+    objects = ["car", "chair", "table", "lamp", "robot", "tree", "house", "sword", "truck", "sofa",
+               "crate", "barrel", "door", "window", "drone", "statue", "rock", "bench", "shelf", "bike"]
+    libraries = ["kitbash", "megascans", "sketchfab", "turbosquid", "inhouse"]
+
+    documents = []
+    for i in range(count):
+        style = rng.choice(styles)
+        obj = rng.choice(objects)
+        name = f"{style}_{obj}_{rng.randint(1, 999):03d}"
+        rel_path = f"{rng.choice(libraries)}/{obj}s/{style}/{name}_v{i % 7}.blend"
+        documents.append((rel_path, name))
+    return documents
+
+
+def benchmark_search_index(
+    num_assets: int = 500_000,
+    queries: Optional[List[str]] = None,
+    top_k: int = 20,
+    path: Optional[Path] = None,
+) -> Dict[str, float]:
+    """
+    Benchmark build, persistence and query speed on a synthetic library.
+
+    Args:
+        num_assets: Number of synthetic assets
+        queries: Query strings (default: mixed exact and prefix queries)
+        top_k: Results per query
+        path: Optional file to measure save/load with
+
+    Returns:
+        Dictionary with timings in seconds and index sizes
+    """
+    if queries is None:
+        queries = ["cyberpunk car", "modern chair", "rob", "vint lamp", "kitbash truck 042", "med sw"]
+
+    documents = synthetic_documents(num_assets)
+
+    start = time.perf_counter()
+    index = SearchIndex.from_documents(documents)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for query in queries:
+        index.search(query, top_k=top_k)
+    query_seconds = (time.perf_counter() - start) / len(queries)
+
+    results: Dict[str, float] = {
+        "assets": num_assets,
+        "tokens": len(index.tokens),
+        "build_seconds": build_seconds,
+        "query_seconds": query_seconds,
+        "queries_per_second": 1.0 / query_seconds if query_seconds > 0 else 0.0,
+    }
+
+    if path is not None:
+        start = time.perf_counter()
+        index.save(path)
+        results["save_seconds"] = time.perf_counter() - start
+        start = time.perf_counter()
+        SearchIndex.load(path)
+        results["load_seconds"] = time.perf_counter() - start
+        results["file_bytes"] = path.stat().st_size
+
+    return results
@@ -43,6 +43,12 @@ except ImportError:
     Vector = Any
     Matrix = Any
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 # Charlotte coordinate reference point (origin for local coordinates)
 # Center of Uptown Charlotte
@@ -83,6 +89,9 @@ class BuildingFootprint:
     local_polygon: List[Tuple[float, float]] = field(default_factory=list)
     centroid: Tuple[float, float] = (0.0, 0.0)
 
+    # Nx2 (lon, lat) array of the polygon when NumPy is available
+    polygon_array: Optional[Any] = None
+
 
 class GeoJSONLoader:
     """Loads and parses GeoJSON building data."""
@@ -135,10 +144,15 @@ class GeoJSONLoader:
             # Determine material from building type
             material = self._determine_material(props.get("building", "yes"))
 
+            polygon_array = None
+            if HAS_NUMPY and coords:
+                polygon_array = np.array([c[:2] for c in coords], dtype=np.float64)
+
             building = BuildingFootprint(
                 osm_id=props.get("osm_id", 0),
                 name=props.get("name", ""),
                 polygon=[(c[0], c[1]) for c in coords],
+                polygon_array=polygon_array,
                 height_m=height,
                 floors=floors,
                 building_type=props.get("building", "yes"),
@@ -193,8 +207,18 @@ class CoordinateConverter:
         y = (lat - self.origin_lat) * DEGREE_TO_METERS_LAT
         return (x, y)
 
+    def to_local_array(self, lonlat: Any) -> Any:
+        """Convert an Nx2 (lon, lat) array to a contiguous Nx2 float64 array of local meters."""
+        lonlat = np.asarray(lonlat, dtype=np.float64).reshape(-1, 2)
+        local = np.empty_like(lonlat)
+        local[:, 0] = (lonlat[:, 0] - self.origin_lon) * DEGREE_TO_METERS_LON
+        local[:, 1] = (lonlat[:, 1] - self.origin_lat) * DEGREE_TO_METERS_LAT
+        return local
+
     def polygon_to_local(self, polygon: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
         """Convert entire polygon to local coordinates."""
+        if HAS_NUMPY and len(polygon):
+            return list(map(tuple, self.to_local_array(polygon).tolist()))
         return [self.to_local(lon, lat) for lon, lat in polygon]
 
 
@@ -243,9 +267,19 @@ class CharlotteBuildingGenerator:
         geojson = self.loader.load_geojson(filename)
         self.buildings = self.loader.parse_features(geojson)
 
-        # Convert coordinates and detect LED buildings
+        # Convert all footprints in one array pass
+        arrays = [b.polygon_array for b in self.buildings]
+        if HAS_NUMPY and arrays and all(a is not None for a in arrays):
+            offsets = np.cumsum([len(a) for a in arrays])[:-1]
+            local = self.converter.to_local_array(np.concatenate(arrays))
+            for building, points in zip(self.buildings, np.split(local, offsets)):
+                building.local_polygon = list(map(tuple, points.tolist()))
+        else:
+            for building in self.buildings:
+                building.local_polygon = self.converter.polygon_to_local(building.polygon)
+
+        # Compute centroids and detect LED buildings
         for building in self.buildings:
-            building.local_polygon = self.converter.polygon_to_local(building.polygon)
             building.centroid = self._compute_centroid(building.local_polygon)
             building.has_led = self._is_led_building(building.name)
 
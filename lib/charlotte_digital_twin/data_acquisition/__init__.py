@@ -5,7 +5,10 @@ Base classes and utilities for data acquisition from external APIs.
 """
 
 from .base_client import DataClient, RateLimitedClient
+from .cache_store import CacheStats, CacheStore, get_cache_store
+from .dem_store import DEMGrid
 from .osm_downloader import OSMDownloader
+from .osm_stream import NodeStore, load_osm_file, road_filter, building_filter
 from .overpass_client import OverpassClient
 from .elevation_fetcher import ElevationFetcher
 from .poi_extractor import POIExtractor
@@ -13,8 +16,16 @@ from .poi_extractor import POIExtractor
 __all__ = [
     "DataClient",
     "RateLimitedClient",
+    "CacheStats",
+    "CacheStore",
+    "get_cache_store",
     "OSMDownloader",
+    "NodeStore",
+    "load_osm_file",
+    "road_filter",
+    "building_filter",
     "OverpassClient",
     "ElevationFetcher",
+    "DEMGrid",
     "POIExtractor",
 ]
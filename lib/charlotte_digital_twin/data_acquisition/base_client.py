@@ -9,11 +9,14 @@ import time
 import json
 import hashlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 
+from .cache_store import CacheStore, get_cache_store
+
 
 @dataclass
 class CacheEntry:
@@ -34,7 +37,7 @@ class DataClient(ABC):
 
     Provides:
     - Rate limiting
-    - Caching
+    - Caching (shared on-disk CacheStore plus a small in-memory LRU)
     - Retry logic
     - Error handling
     """
@@ -46,6 +49,8 @@ class DataClient(ABC):
     # Caching
     CACHE_DIR: Path = Path("data/charlotte/cache")
     CACHE_TTL_DAYS: int = 7
+    CACHE_MAX_BYTES: int = 2 * 1024 ** 3  # Shared disk budget per cache directory
+    MEMORY_CACHE_ENTRIES: int = 32
 
     def __init__(
         self,
@@ -61,7 +66,8 @@ class DataClient(ABC):
         self.max_retries = max_retries if max_retries is not None else self.MAX_RETRIES
 
         self._last_request_time: float = 0.0
-        self._cache: Dict[str, CacheEntry] = {}
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.cache_store: CacheStore = get_cache_store(self.cache_dir, self.CACHE_MAX_BYTES)
 
     def _rate_limit_wait(self) -> None:
         """Wait if necessary to respect rate limiting."""
@@ -78,38 +84,64 @@ class DataClient(ABC):
         return hashlib.md5(key_data.encode()).hexdigest()
 
     def _get_cache_path(self, cache_key: str) -> Path:
-        """Get path to cache file."""
+        """Get path to a legacy per-key cache file."""
         return self.cache_dir / f"{cache_key}.json"
 
+    @property
+    def _cache_ttl_seconds(self) -> float:
+        return self.CACHE_TTL_DAYS * 24 * 3600
+
+    def _remember(self, cache_key: str, entry: CacheEntry) -> None:
+        """Put an entry in the bounded in-memory LRU."""
+        self._cache[cache_key] = entry
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.MEMORY_CACHE_ENTRIES:
+            self._cache.popitem(last=False)
+
     def _load_from_cache(self, cache_key: str) -> Optional[Any]:
         """Load data from cache if available and not expired."""
         # Check memory cache first
-        if cache_key in self._cache:
-            entry = self._cache[cache_key]
+        entry = self._cache.get(cache_key)
+        if entry is not None:
             if not entry.is_expired():
+                self._cache.move_to_end(cache_key)
                 return entry.data
+            del self._cache[cache_key]
 
-        # Check file cache
-        cache_path = self._get_cache_path(cache_key)
-        if cache_path.exists():
-            try:
-                with open(cache_path, 'r') as f:
-                    cached = json.load(f)
+        # Check shared disk cache
+        data = self.cache_store.get(cache_key, ttl_seconds=self._cache_ttl_seconds)
+        if data is not None:
+            self._remember(cache_key, CacheEntry(data, time.time(), self._cache_ttl_seconds, ""))
+            return data
 
-                entry = CacheEntry(
-                    data=cached['data'],
-                    timestamp=cached['timestamp'],
-                    ttl_seconds=self.CACHE_TTL_DAYS * 24 * 3600,
-                    source_url=cached.get('source_url', ''),
-                )
+        return self._migrate_legacy_cache(cache_key)
 
-                if not entry.is_expired():
-                    self._cache[cache_key] = entry
-                    return entry.data
-            except (json.JSONDecodeError, KeyError):
-                pass
+    def _migrate_legacy_cache(self, cache_key: str) -> Optional[Any]:
+        """Move a per-key JSON file from the old cache layout into the store."""
+        cache_path = self._get_cache_path(cache_key)
+        if not cache_path.exists():
+            return None
 
-        return None
+        try:
+            with open(cache_path, 'r') as f:
+                cached = json.load(f)
+
+            entry = CacheEntry(
+                data=cached['data'],
+                timestamp=cached['timestamp'],
+                ttl_seconds=self._cache_ttl_seconds,
+                source_url=cached.get('source_url', ''),
+            )
+        except (json.JSONDecodeError, KeyError):
+            return None
+
+        cache_path.unlink()
+        if entry.is_expired():
+            return None
+
+        self.cache_store.put(cache_key, entry.data, entry.source_url)
+        self._remember(cache_key, entry)
+        return entry.data
 
     def _save_to_cache(
         self,
@@ -121,26 +153,74 @@ class DataClient(ABC):
         entry = CacheEntry(
             data=data,
             timestamp=time.time(),
-            ttl_seconds=self.CACHE_TTL_DAYS * 24 * 3600,
+            ttl_seconds=self._cache_ttl_seconds,
             source_url=source_url,
         )
 
         # Save to memory cache
-        self._cache[cache_key] = entry
+        self._remember(cache_key, entry)
 
-        # Save to file cache
-        cache_path = self._get_cache_path(cache_key)
+        # Save to shared disk cache
         try:
-            with open(cache_path, 'w') as f:
-                json.dump({
-                    'data': data,
-                    'timestamp': entry.timestamp,
-                    'source_url': source_url,
-                }, f)
+            self.cache_store.put(cache_key, data, source_url)
         except (TypeError, ValueError):
-            # Data not JSON serializable, skip file cache
+            # Data not JSON serializable, skip disk cache
             pass
 
+    def _cached_fetch(
+        self,
+        cache_key: str,
+        fetch_func,
+        source_url: str = "",
+        use_cache: bool = True,
+    ) -> Any:
+        """
+        Return cached data or fetch it once across all workers.
+
+        Concurrent processes sharing the cache directory that miss on
+        the same key wait for a single fetch.
+
+        Args:
+            cache_key: Cache key
+            fetch_func: Callable returning JSON-serializable data
+            source_url: Origin of the data
+            use_cache: Bypass the cache entirely when False
+
+        Returns:
+            Cached or fetched data
+        """
+        if not use_cache:
+            return fetch_func()
+
+        entry = self._cache.get(cache_key)
+        if entry is not None and not entry.is_expired():
+            self._cache.move_to_end(cache_key)
+            return entry.data
+
+        legacy = self._migrate_legacy_cache(cache_key)
+        if legacy is not None:
+            return legacy
+
+        data = self.cache_store.get_or_fetch(
+            cache_key, fetch_func, ttl_seconds=self._cache_ttl_seconds, source_url=source_url
+        )
+        self._remember(cache_key, CacheEntry(data, time.time(), self._cache_ttl_seconds, source_url))
+        return data
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters for monitoring.
+
+        Returns:
+            Dictionary with this process's counters ("local") and the
+            totals of every process sharing the cache directory ("shared")
+        """
+        return {
+            "local": self.cache_store.stats.to_dict(),
+            "shared": self.cache_store.global_stats(),
+            "memory_entries": len(self._cache),
+        }
+
     def _retry_request(
         self,
         request_func,
@@ -208,12 +288,6 @@ class RateLimitedClient(DataClient):
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
         cache_key = self._get_cache_key(url, params)
 
-        # Check cache
-        if use_cache:
-            cached = self._load_from_cache(cache_key)
-            if cached is not None:
-                return cached
-
         def _request():
             if method.upper() == "GET":
                 response = self._requests.get(url, params=params, timeout=self.timeout)
@@ -223,13 +297,12 @@ class RateLimitedClient(DataClient):
             response.raise_for_status()
             return response.json()
 
-        result = self._retry_request(_request)
-
-        # Cache result
-        if use_cache:
-            self._save_to_cache(cache_key, result, url)
-
-        return result
+        return self._cached_fetch(
+            cache_key,
+            lambda: self._retry_request(_request),
+            source_url=url,
+            use_cache=use_cache,
+        )
 
     def fetch(
         self,
@@ -0,0 +1,446 @@
+"""
+Shared Response Cache Store
+
+Content-addressed, size-bounded on-disk cache shared by all data clients
+(and all processes) that point at the same cache directory.
+
+Layout:
+    <cache_dir>/
+        index.sqlite            # key -> digest, size, timestamps, counters
+        objects/ab/<sha256>.json.gz
+        locks/<key>.lock
+
+- Payloads are JSON encoded, gzip compressed and stored once per
+  content digest, so identical responses under different keys share
+  one file.
+- A single SQLite index tracks entries and their last access time;
+  when the total stored size exceeds max_bytes the least recently used
+  entries are evicted.
+- get_or_fetch takes an exclusive per-key file lock, so concurrent
+  workers missing on the same key wait for one fetch instead of all
+  hitting the remote service.
+- Hit/miss/byte counters are kept per process (CacheStats) and summed
+  across processes in the index (global_stats).
+
+Usage:
+    from lib.charlotte_digital_twin.data_acquisition.cache_store import get_cache_store
+
+    store = get_cache_store(Path("data/charlotte/cache"))
+    data = store.get_or_fetch(key, lambda: fetch_tile(...), ttl_seconds=86400)
+    print(store.stats.to_dict())
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+try:
+    import msvcrt
+    HAS_MSVCRT = True
+except ImportError:
+    HAS_MSVCRT = False
+
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GiB of compressed payloads
+INDEX_FILENAME = "index.sqlite"
+COMPRESS_LEVEL = 6
+
+_MISSING = object()
+
+
+@dataclass
+class CacheStats:
+    """Cache counters for monitoring."""
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    coalesced: int = 0  # Misses served by another worker's fetch
+    bytes_read: int = 0
+    bytes_written: int = 0
+    bytes_evicted: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        result = asdict(self)
+        result["hit_rate"] = self.hit_rate
+        return result
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a lock file.
+
+    Uses fcntl.flock on POSIX and msvcrt.locking on Windows. Where
+    neither is available the lock is a no-op.
+
+    Args:
+        path: Lock file path (created if missing)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as handle:
+        if HAS_FCNTL:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        elif HAS_MSVCRT:
+            handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if HAS_FCNTL:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            elif HAS_MSVCRT:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class CacheStore:
+    """
+    Content-addressed, LRU size-bounded response cache.
+
+    Attributes:
+        root: Cache directory
+        max_bytes: Maximum total size of stored (compressed) objects
+        stats: Counters for this process
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            digest TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created REAL NOT NULL,
+            accessed REAL NOT NULL,
+            source_url TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+        CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+        CREATE TABLE IF NOT EXISTS counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Open (or create) a cache store.
+
+        Args:
+            root: Cache directory
+            max_bytes: Maximum total size of stored objects in bytes
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        (self.root / "objects").mkdir(exist_ok=True)
+        self._index_path = self.root / INDEX_FILENAME
+        with self._connect() as conn:
+            conn.executescript(self._SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open an index connection for one transaction."""
+        conn = sqlite3.connect(str(self._index_path), timeout=60.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.json.gz"
+
+    def _lock_path(self, key: str) -> Path:
+        return self.root / "locks" / f"{hashlib.sha1(key.encode()).hexdigest()}.lock"
+
+    def _count(self, conn: sqlite3.Connection, **deltas: int) -> None:
+        """Update local and shared counters."""
+        for name, delta in deltas.items():
+            if not delta:
+                continue
+            setattr(self.stats, name, getattr(self.stats, name) + delta)
+            conn.execute(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                (name, delta),
+            )
+
+    def _lookup(self, key: str, ttl_seconds: Optional[float]) -> Any:
+        """Read an entry without touching miss counters; returns _MISSING on miss."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT digest, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return _MISSING
+
+            digest, created = row
+            if ttl_seconds is not None and time.time() - created > ttl_seconds:
+                return _MISSING
+
+            try:
+                blob = self._object_path(digest).read_bytes()
+                data = json.loads(gzip.decompress(blob))
+            except (OSError, ValueError, EOFError):
+                # Object missing or corrupt: drop the entry
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return _MISSING
+
+            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._count(conn, hits=1, bytes_read=len(blob))
+            return data
+
+    def get(self, key: str, ttl_seconds: Optional[float] = None, default: Any = None) -> Any:
+        """
+        Get a cached payload.
+
+        Args:
+            key: Cache key
+            ttl_seconds: Treat entries older than this as missing
+            default: Returned on a miss
+
+        Returns:
+            Cached data or default
+        """
+        data = self._lookup(key, ttl_seconds)
+        if data is _MISSING:
+            with self._connect() as conn:
+                self._count(conn, misses=1)
+            return default
+        return data
+
+    def put(self, key: str, data: Any, source_url: str = "") -> int:
+        """
+        Store a JSON-serializable payload.
+
+        Args:
+            key: Cache key
+            data: Payload
+            source_url: Origin of the data (informational)
+
+        Returns:
+            Compressed size in bytes
+
+        Raises:
+            TypeError: If data is not JSON serializable
+        """
+        raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._object_path(digest)
+
+        written = 0
+        if not path.exists():
+            blob = gzip.compress(raw, compresslevel=COMPRESS_LEVEL, mtime=0)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(blob)
+            os.replace(tmp_path, path)
+            written = len(blob)
+        size = written or path.stat().st_size
+
+        now = time.time()
+        with self._connect() as conn:
+            previous = conn.execute(
+                "SELECT digest FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, digest, size, created, accessed, source_url) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, digest, size, now, now, source_url),
+            )
+            self._count(conn, writes=1, bytes_written=written)
+            if previous and previous[0] != digest:
+                self._release_object(conn, previous[0])
+            self._evict(conn)
+        return size
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._release_object(conn, row[0])
+        return True
+
+    def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Any],
+        ttl_seconds: Optional[float] = None,
+        source_url: str = "",
+    ) -> Any:
+        """
+        Get a payload, fetching and storing it once on a miss.
+
+        Concurrent callers (threads or processes) missing on the same key
+        serialize on a per-key lock file; the first one fetches, the rest
+        read its result.
+
+        Args:
+            key: Cache key
+            fetch: Callable producing the payload on a miss
+            ttl_seconds: Treat entries older than this as missing
+            source_url: Origin of the data (informational)
+
+        Returns:
+            Cached or freshly fetched data
+        """
+        data = self._lookup(key, ttl_seconds)
+        if data is not _MISSING:
+            return data
+
+        with file_lock(self._lock_path(key)):
+            data = self._lookup(key, ttl_seconds)
+            if data is not _MISSING:
+                with self._connect() as conn:
+                    self._count(conn, coalesced=1)
+                return data
+
+            with self._connect() as conn:
+                self._count(conn, misses=1)
+            data = fetch()
+            try:
+                self.put(key, data, source_url)
+            except (TypeError, ValueError):
+                pass  # Not JSON serializable, serve uncached
+            return data
+
+    def total_bytes(self) -> int:
+        """Total size of stored objects (shared objects counted once)."""
+        with self._connect() as conn:
+            return self._total_bytes(conn)
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def global_stats(self) -> Dict[str, int]:
+        """
+        Counters summed over every process using this cache directory.
+
+        Returns:
+            Counter name -> value, plus entries and total_bytes
+        """
+        with self._connect() as conn:
+            result = {name: 0 for name in CacheStats.__dataclass_fields__}
+            result.update(dict(conn.execute("SELECT name, value FROM counters")))
+            result["entries"] = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            result["total_bytes"] = self._total_bytes(conn)
+        return result
+
+    def _total_bytes(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT digest, MAX(size) AS size FROM entries GROUP BY digest)"
+        ).fetchone()
+        return row[0]
+
+    def _release_object(self, conn: sqlite3.Connection, digest: str) -> int:
+        """Delete an object file if no entry references it; returns bytes freed."""
+        in_use = conn.execute(
+            "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if in_use:
+            return 0
+        path = self._object_path(digest)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return 0
+        return size
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Evict least recently used entries until under max_bytes."""
+        total = self._total_bytes(conn)
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        freed = 0
+        rows = conn.execute(
+            "SELECT key, digest FROM entries ORDER BY accessed ASC"
+        ).fetchall()
+        for key, digest in rows:
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            released = self._release_object(conn, digest)
+            total -= released
+            freed += released
+            evicted += 1
+        self._count(conn, evictions=evicted, bytes_evicted=freed)
+
+
+_STORES: Dict[Tuple[str, int], CacheStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_cache_store(root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> CacheStore:
+    """
+    Get the process-wide store for a cache directory.
+
+    Clients sharing a directory share one store instance (and its
+    counters).
+
+    Args:
+        root: Cache directory
+        max_bytes: Maximum total size of stored objects in bytes
+
+    Returns:
+        CacheStore instance
+    """
+    key = (str(Path(root).resolve()), max_bytes)
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = CacheStore(root, max_bytes)
+            _STORES[key] = store
+        return store
+
+
+__all__ = [
+    "CacheStats",
+    "CacheStore",
+    "DEFAULT_MAX_BYTES",
+    "file_lock",
+    "get_cache_store",
+]
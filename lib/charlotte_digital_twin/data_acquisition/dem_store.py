@@ -0,0 +1,491 @@
+"""
+Tiled DEM Grid Store
+
+Regular lat/lon elevation grids held as float32 arrays and stored on
+disk as memory-mapped tiles.
+
+Layout:
+    <directory>/
+        index.json              # bounds, steps, shape, tile size, min/max
+        tile_<row>_<col>.npy    # float32 tile, one sample overlap east/north
+
+- Row 0 is the southern edge and column 0 the western edge.
+- Tiles share one row and column with their north/east neighbours, so
+  every bilinear cell lies inside a single tile.
+- Opened grids memory-map their tiles on first access; only the pages
+  touched by a query are read.
+- sample() does bilinear interpolation for many points at once,
+  grouping points by tile.
+
+Usage:
+    from lib.charlotte_digital_twin.data_acquisition.dem_store import DEMGrid
+
+    grid = DEMGrid.from_array(heights, south=35.0, west=-80.9, lat_step=1 / 3600)
+    grid.save(Path("data/charlotte/cache/dem/area"))
+
+    grid = DEMGrid.open(Path("data/charlotte/cache/dem/area"))
+    elevations = grid.sample(lats, lons)
+"""
+
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+DEFAULT_TILE_SIZE = 512
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for gridded DEM data")
+
+
+class DEMGrid:
+    """
+    Regular elevation grid split into float32 tiles.
+
+    Attributes:
+        south: Latitude of row 0
+        west: Longitude of column 0
+        lat_step: Degrees of latitude between rows
+        lon_step: Degrees of longitude between columns
+        shape: (rows, cols) of the full grid
+        tile_size: Rows/columns per tile (excluding overlap)
+        path: Directory the grid was opened from, if any
+    """
+
+    def __init__(
+        self,
+        south: float,
+        west: float,
+        lat_step: float,
+        lon_step: float,
+        shape: Tuple[int, int],
+        tile_size: int,
+        tiles: Optional[Dict[Tuple[int, int], Any]] = None,
+        path: Optional[Path] = None,
+        min_max: Optional[Tuple[float, float]] = None,
+    ):
+        """
+        Initialize grid from tiles.
+
+        Use from_array() or open() rather than calling this directly.
+
+        Args:
+            south: Latitude of row 0
+            west: Longitude of column 0
+            lat_step: Degrees of latitude between rows
+            lon_step: Degrees of longitude between columns
+            shape: (rows, cols) of the full grid
+            tile_size: Rows/columns per tile (excluding overlap)
+            tiles: Loaded tiles keyed by (tile_row, tile_col)
+            path: Directory holding tile files to load on demand
+            min_max: Known elevation range
+        """
+        _require_numpy()
+        self.south = float(south)
+        self.west = float(west)
+        self.lat_step = float(lat_step)
+        self.lon_step = float(lon_step)
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.tile_size = int(tile_size)
+        self.path = Path(path) if path is not None else None
+        self._tiles: Dict[Tuple[int, int], Any] = dict(tiles or {})
+        self._tiles_lock = threading.Lock()
+        self._min_max = min_max
+
+    @classmethod
+    def from_array(
+        cls,
+        heights: Any,
+        south: float,
+        west: float,
+        lat_step: float,
+        lon_step: Optional[float] = None,
+    ) -> "DEMGrid":
+        """
+        Create an in-memory grid from a 2D array.
+
+        Args:
+            heights: Array of shape (rows, cols), row 0 = south
+            south: Latitude of row 0
+            west: Longitude of column 0
+            lat_step: Degrees of latitude between rows
+            lon_step: Degrees of longitude between columns (default lat_step)
+
+        Returns:
+            DEMGrid with a single tile
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If heights is not a non-empty 2D array
+        """
+        _require_numpy()
+        array = np.ascontiguousarray(heights, dtype=np.float32)
+        if array.ndim != 2 or array.size == 0:
+            raise ValueError(f"heights must be a non-empty 2D array, got shape {array.shape}")
+
+        return cls(
+            south=south,
+            west=west,
+            lat_step=lat_step,
+            lon_step=lon_step if lon_step is not None else lat_step,
+            shape=array.shape,
+            tile_size=max(array.shape),
+            tiles={(0, 0): array},
+        )
+
+    @classmethod
+    def from_points(
+        cls,
+        lats: Any,
+        lons: Any,
+        elevations: Any,
+        lat_step: float,
+        lon_step: Optional[float] = None,
+    ) -> Optional["DEMGrid"]:
+        """
+        Create a grid from scattered samples lying on a regular lattice.
+
+        Args:
+            lats: Sample latitudes
+            lons: Sample longitudes
+            elevations: Sample elevations
+            lat_step: Lattice spacing in latitude
+            lon_step: Lattice spacing in longitude (default lat_step)
+
+        Returns:
+            DEMGrid, or None if the samples do not fill a regular lattice
+        """
+        _require_numpy()
+        lon_step = lon_step if lon_step is not None else lat_step
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        if lats.size == 0 or lat_step <= 0 or lon_step <= 0:
+            return None
+
+        south = float(lats.min())
+        west = float(lons.min())
+        rows = np.rint((lats - south) / lat_step).astype(np.intp)
+        cols = np.rint((lons - west) / lon_step).astype(np.intp)
+        shape = (int(rows.max()) + 1, int(cols.max()) + 1)
+        if shape[0] * shape[1] != lats.size:
+            return None
+
+        heights = np.full(shape, np.nan, dtype=np.float32)
+        heights[rows, cols] = np.asarray(elevations, dtype=np.float32)
+        if np.isnan(heights).any():
+            return None
+        return cls.from_array(heights, south, west, lat_step, lon_step)
+
+    @classmethod
+    def open(cls, directory: Path) -> "DEMGrid":
+        """
+        Open a saved grid; tiles are memory-mapped on first access.
+
+        Args:
+            directory: Directory written by save()
+
+        Returns:
+            DEMGrid backed by the tile files
+
+        Raises:
+            ImportError: If NumPy is not installed
+            FileNotFoundError: If the directory has no index
+        """
+        _require_numpy()
+        directory = Path(directory)
+        with open(directory / INDEX_FILENAME, "r") as f:
+            index = json.load(f)
+
+        min_max = None
+        if index.get("min") is not None:
+            min_max = (index["min"], index["max"])
+        return cls(
+            south=index["south"],
+            west=index["west"],
+            lat_step=index["lat_step"],
+            lon_step=index["lon_step"],
+            shape=(index["rows"], index["cols"]),
+            tile_size=index["tile_size"],
+            path=directory,
+            min_max=min_max,
+        )
+
+    @staticmethod
+    def exists(directory: Path) -> bool:
+        """Check whether a saved grid is present in a directory."""
+        return (Path(directory) / INDEX_FILENAME).exists()
+
+    def save(self, directory: Path, tile_size: int = DEFAULT_TILE_SIZE) -> Path:
+        """
+        Write the grid as float32 tiles plus an index.
+
+        Tiles are written to a temporary directory and moved into place,
+        so readers never see a partial grid. If the directory already
+        holds a grid it is left untouched.
+
+        Args:
+            directory: Target directory
+            tile_size: Rows/columns per tile
+
+        Returns:
+            The target directory
+        """
+        directory = Path(directory)
+        if self.exists(directory):
+            return directory
+
+        tmp_dir = directory.with_name(f"{directory.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+
+        rows, cols = self.shape
+        for tile_row in range(0, max(1, -(-rows // tile_size))):
+            for tile_col in range(0, max(1, -(-cols // tile_size))):
+                r0 = tile_row * tile_size
+                c0 = tile_col * tile_size
+                block = self.read_window(
+                    r0, min(r0 + tile_size + 1, rows),
+                    c0, min(c0 + tile_size + 1, cols),
+                )
+                np.save(tmp_dir / f"tile_{tile_row}_{tile_col}.npy", block)
+
+        min_elev, max_elev = self.min_max()
+        index = {
+            "version": INDEX_VERSION,
+            "south": self.south,
+            "west": self.west,
+            "lat_step": self.lat_step,
+            "lon_step": self.lon_step,
+            "rows": rows,
+            "cols": cols,
+            "tile_size": tile_size,
+            "dtype": "float32",
+            "min": min_elev,
+            "max": max_elev,
+        }
+        with open(tmp_dir / INDEX_FILENAME, "w") as f:
+            json.dump(index, f, indent=2)
+
+        try:
+            os.replace(tmp_dir, directory)
+        except OSError:
+            # Another writer got there first
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return directory
+
+    @property
+    def north(self) -> float:
+        """Latitude of the last row."""
+        return self.south + (self.shape[0] - 1) * self.lat_step
+
+    @property
+    def east(self) -> float:
+        """Longitude of the last column."""
+        return self.west + (self.shape[1] - 1) * self.lon_step
+
+    @property
+    def tile_grid_shape(self) -> Tuple[int, int]:
+        """Number of tiles along each axis."""
+        rows, cols = self.shape
+        return (max(1, -(-rows // self.tile_size)), max(1, -(-cols // self.tile_size)))
+
+    def _tile(self, tile_row: int, tile_col: int) -> "np.ndarray":
+        """Get a tile, memory-mapping it on first access."""
+        key = (tile_row, tile_col)
+        tile = self._tiles.get(key)
+        if tile is None:
+            with self._tiles_lock:
+                tile = self._tiles.get(key)
+                if tile is None:
+                    if self.path is None:
+                        raise KeyError(f"Tile {key} not loaded and grid has no path")
+                    tile = np.load(self.path / f"tile_{tile_row}_{tile_col}.npy", mmap_mode="r")
+                    self._tiles[key] = tile
+        return tile
+
+    def read_window(self, row0: int, row1: int, col0: int, col1: int) -> "np.ndarray":
+        """
+        Read a rectangular block of the grid.
+
+        Args:
+            row0: First row (inclusive)
+            row1: Last row (exclusive)
+            col0: First column (inclusive)
+            col1: Last column (exclusive)
+
+        Returns:
+            float32 array of shape (row1 - row0, col1 - col0)
+        """
+        out = np.empty((row1 - row0, col1 - col0), dtype=np.float32)
+        size = self.tile_size
+        for tile_row in range(row0 // size, (row1 - 1) // size + 1):
+            for tile_col in range(col0 // size, (col1 - 1) // size + 1):
+                tile = self._tile(tile_row, tile_col)
+                tr0 = max(row0, tile_row * size)
+                tr1 = min(row1, tile_row * size + size)
+                tc0 = max(col0, tile_col * size)
+                tc1 = min(col1, tile_col * size + size)
+                out[tr0 - row0:tr1 - row0, tc0 - col0:tc1 - col0] = tile[
+                    tr0 - tile_row * size:tr1 - tile_row * size,
+                    tc0 - tile_col * size:tc1 - tile_col * size,
+                ]
+        return out
+
+    def to_array(self) -> "np.ndarray":
+        """Read the whole grid into one float32 array."""
+        return self.read_window(0, self.shape[0], 0, self.shape[1])
+
+    def iter_blocks(self) -> Iterator[Tuple[int, int, "np.ndarray"]]:
+        """
+        Iterate over tiles without their overlap.
+
+        Yields:
+            (first_row, first_col, block) for each tile
+        """
+        size = self.tile_size
+        tile_rows, tile_cols = self.tile_grid_shape
+        for tile_row in range(tile_rows):
+            for tile_col in range(tile_cols):
+                tile = self._tile(tile_row, tile_col)
+                yield tile_row * size, tile_col * size, tile[:size, :size]
+
+    def min_max(self) -> Tuple[float, float]:
+        """Get min and max elevation."""
+        if self._min_max is None:
+            lows = []
+            highs = []
+            for _, _, block in self.iter_blocks():
+                lows.append(float(np.nanmin(block)))
+                highs.append(float(np.nanmax(block)))
+            self._min_max = (min(lows), max(highs))
+        return self._min_max
+
+    def _fractional_index(self, lats: "np.ndarray", lons: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """Convert coordinates to fractional row/column, clamped to the grid."""
+        rows, cols = self.shape
+        r = np.clip((lats - self.south) / self.lat_step, 0, rows - 1)
+        c = np.clip((lons - self.west) / self.lon_step, 0, cols - 1)
+        return r, c
+
+    def nearest(self, lat: float, lon: float) -> float:
+        """
+        Get the elevation of the grid sample closest to a point.
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            Elevation in meters (edge value outside the grid)
+        """
+        rows, cols = self.shape
+        r = min(max(int(round((lat - self.south) / self.lat_step)), 0), rows - 1)
+        c = min(max(int(round((lon - self.west) / self.lon_step)), 0), cols - 1)
+        size = self.tile_size
+        tile = self._tile(r // size, c // size)
+        return float(tile[r % size, c % size])
+
+    def sample(self, lats: Any, lons: Any) -> "np.ndarray":
+        """
+        Bilinearly interpolate elevations at many points.
+
+        Points outside the grid take the value at the nearest edge.
+
+        Args:
+            lats: Latitudes (any shape broadcastable with lons)
+            lons: Longitudes
+
+        Returns:
+            float64 array of elevations with the broadcast shape
+        """
+        lats, lons = np.broadcast_arrays(
+            np.asarray(lats, dtype=np.float64),
+            np.asarray(lons, dtype=np.float64),
+        )
+        out_shape = lats.shape
+        r, c = self._fractional_index(lats.ravel(), lons.ravel())
+
+        rows, cols = self.shape
+        r0 = np.minimum(np.floor(r).astype(np.intp), max(rows - 2, 0))
+        c0 = np.minimum(np.floor(c).astype(np.intp), max(cols - 2, 0))
+        fr = r - r0
+        fc = c - c0
+        r1 = np.minimum(r0 + 1, rows - 1)
+        c1 = np.minimum(c0 + 1, cols - 1)
+
+        out = np.empty(r.shape, dtype=np.float64)
+        size = self.tile_size
+        tile_rows, tile_cols = self.tile_grid_shape
+
+        if tile_rows * tile_cols == 1:
+            groups = [((0, 0), slice(None))]
+        else:
+            # Group points by the tile holding their cell's south-west corner
+            keys = (r0 // size) * tile_cols + (c0 // size)
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+            ends = np.r_[starts[1:], len(order)]
+            groups = [
+                (divmod(int(sorted_keys[s]), tile_cols), order[s:e])
+                for s, e in zip(starts, ends)
+            ]
+
+        for (tile_row, tile_col), idx in groups:
+            tile = self._tile(tile_row, tile_col)
+            lr0 = r0[idx] - tile_row * size
+            lr1 = r1[idx] - tile_row * size
+            lc0 = c0[idx] - tile_col * size
+            lc1 = c1[idx] - tile_col * size
+            wr = fr[idx]
+            wc = fc[idx]
+            south = tile[lr0, lc0] * (1 - wc) + tile[lr0, lc1] * wc
+            north = tile[lr1, lc0] * (1 - wc) + tile[lr1, lc1] * wc
+            out[idx] = south * (1 - wr) + north * wr
+
+        return out.reshape(out_shape)
+
+    def sample_lattice(
+        self,
+        south: float,
+        west: float,
+        north: float,
+        east: float,
+        rows: int,
+        cols: int,
+    ) -> "np.ndarray":
+        """
+        Sample a regular lattice over a bounding box.
+
+        Args:
+            south: Latitude of the first output row
+            west: Longitude of the first output column
+            north: Latitude of the last output row
+            east: Longitude of the last output column
+            rows: Output rows
+            cols: Output columns
+
+        Returns:
+            float64 array of shape (rows, cols), row 0 = south
+        """
+        lats = np.linspace(south, north, rows)[:, None]
+        lons = np.linspace(west, east, cols)[None, :]
+        return self.sample(lats, lons)
+
+
+__all__ = [
+    "DEFAULT_TILE_SIZE",
+    "DEMGrid",
+]
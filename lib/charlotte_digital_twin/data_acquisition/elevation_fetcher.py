@@ -10,16 +10,27 @@ Usage:
     fetcher = ElevationFetcher()
     dem = fetcher.get_elevation_data()
     heightmap = fetcher.to_heightmap(dem, resolution=1024)
+
+    # Bilinear elevations for many points at once
+    elevations = dem.sample(lats, lons)
 """
 
+import hashlib
 import math
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 from .base_client import DataClient
+from .dem_store import DEFAULT_TILE_SIZE, DEMGrid
 
 
 @dataclass
@@ -33,16 +44,26 @@ class ElevationTile:
 
 @dataclass
 class DEMData:
-    """Container for Digital Elevation Model data."""
+    """
+    Container for Digital Elevation Model data.
+
+    Gridded sources keep their samples in ``grid`` (float32 tiles, see
+    DEMGrid) and leave ``tiles`` empty; ``tiles`` holds per-point samples
+    for sources that are not on a regular lattice or when NumPy is not
+    available.
+    """
     tiles: List[ElevationTile] = field(default_factory=list)
     bounds: Dict[str, float] = field(default_factory=dict)
     resolution: float = 1.0  # arc-seconds
     source: str = ""
     crs: str = "EPSG:4326"  # WGS84
     timestamp: str = ""
+    grid: Optional[DEMGrid] = None
 
     def get_min_max(self) -> Tuple[float, float]:
         """Get min and max elevation."""
+        if self.grid is not None:
+            return self.grid.min_max()
         if not self.tiles:
             return (0.0, 0.0)
         elevations = [t.elevation for t in self.tiles]
@@ -50,6 +71,9 @@ class DEMData:
 
     def get_at_point(self, lat: float, lon: float) -> Optional[float]:
         """Get elevation at approximate point."""
+        if self.grid is not None:
+            return self.grid.nearest(lat, lon)
+
         if not self.tiles:
             return None
 
@@ -65,6 +89,68 @@ class DEMData:
 
         return closest.elevation if closest else None
 
+    def ensure_grid(self) -> Optional[DEMGrid]:
+        """
+        Build the grid from per-point tiles if they form a regular lattice.
+
+        Returns:
+            DEMGrid, or None if NumPy is missing or the tiles are irregular
+        """
+        if self.grid is None and self.tiles and HAS_NUMPY:
+            step = self.resolution / 3600.0
+            self.grid = DEMGrid.from_points(
+                [t.lat for t in self.tiles],
+                [t.lon for t in self.tiles],
+                [t.elevation for t in self.tiles],
+                lat_step=step,
+            )
+            if self.grid is not None:
+                self.tiles = []
+        return self.grid
+
+    def iter_points(self) -> Iterator[Tuple[float, float, float]]:
+        """
+        Iterate over all samples.
+
+        Yields:
+            (lat, lon, elevation) tuples
+        """
+        if self.grid is None:
+            for tile in self.tiles:
+                yield tile.lat, tile.lon, tile.elevation
+            return
+
+        grid = self.grid
+        for row0, col0, block in grid.iter_blocks():
+            lats = grid.south + (row0 + np.arange(block.shape[0])) * grid.lat_step
+            lons = grid.west + (col0 + np.arange(block.shape[1])) * grid.lon_step
+            for i, lat in enumerate(lats.tolist()):
+                for lon, elevation in zip(lons.tolist(), block[i].tolist()):
+                    yield lat, lon, elevation
+
+    def sample(
+        self,
+        lats: Union[Sequence[float], "np.ndarray"],
+        lons: Union[Sequence[float], "np.ndarray"],
+    ) -> Union[List[Optional[float]], "np.ndarray"]:
+        """
+        Get elevations at many points.
+
+        Uses bilinear interpolation over the grid when available and falls
+        back to nearest-sample lookups otherwise.
+
+        Args:
+            lats: Latitudes
+            lons: Longitudes
+
+        Returns:
+            float64 array of elevations (list when no grid can be built)
+        """
+        grid = self.ensure_grid()
+        if grid is not None:
+            return grid.sample(lats, lons)
+        return [self.get_at_point(lat, lon) for lat, lon in zip(lats, lons)]
+
 
 class ElevationFetcher(DataClient):
     """
@@ -77,7 +163,7 @@ class ElevationFetcher(DataClient):
 
     Features:
     - Automatic source selection
-    - Response caching
+    - Response caching (grids stored as memory-mapped float32 tiles)
     - Heightmap generation
     """
 
@@ -98,6 +184,7 @@ class ElevationFetcher(DataClient):
     RATE_LIMIT = 1.0
     MAX_RETRIES = 3
     CACHE_TTL_DAYS = 90  # Elevation data rarely changes
+    DEM_TILE_SIZE = DEFAULT_TILE_SIZE
 
     def __init__(
         self,
@@ -114,6 +201,7 @@ class ElevationFetcher(DataClient):
         """
         super().__init__(cache_dir=cache_dir, **kwargs)
         self.preferred_source = preferred_source
+        self.dem_dir = self.cache_dir / "dem"
 
         # Try to import requests
         try:
@@ -146,22 +234,23 @@ class ElevationFetcher(DataClient):
             {"bounds": bounds, "resolution": resolution}
         )
 
-        # Check cache
-        if not force_refresh:
-            cached = self._load_from_cache(cache_key)
-            if cached:
-                return self._dict_to_dem(cached)
+        def _fetch() -> DEMData:
+            # Fetch based on preferred source
+            if self.preferred_source == "usgs":
+                return self._fetch_usgs_3dep(bounds, resolution)
+            return self._fetch_opentopo(bounds, resolution)
 
-        # Fetch based on preferred source
-        if self.preferred_source == "usgs":
-            dem = self._fetch_usgs_3dep(bounds, resolution)
-        else:
-            dem = self._fetch_opentopo(bounds, resolution)
-
-        # Cache result
-        self._save_to_cache(cache_key, self._dem_to_dict(dem))
+        if force_refresh:
+            dem = _fetch()
+            self._save_to_cache(cache_key, self._dem_to_dict(dem))
+            return dem
 
-        return dem
+        # Parallel jobs requesting the same tile coalesce on one fetch
+        cached = self._cached_fetch(cache_key, lambda: self._dem_to_dict(_fetch()))
+        if "grid" in cached and not DEMGrid.exists(self.dem_dir / cached["grid"]):
+            # Tile files were removed after the entry was cached
+            return self.get_elevation_data(bounds, resolution, force_refresh=True)
+        return self._dict_to_dem(cached)
 
     def _fetch_opentopo(
         self,
@@ -244,6 +333,28 @@ class ElevationFetcher(DataClient):
         # 1 arc-second ≈ 30m at this latitude
         step = resolution / 3600.0  # degrees
 
+        if HAS_NUMPY:
+            rows = int(math.floor((bounds["north"] - bounds["south"]) / step + 1e-9)) + 1
+            cols = int(math.floor((bounds["east"] - bounds["west"]) / step + 1e-9)) + 1
+            lats = bounds["south"] + np.arange(rows)[:, None] * step
+            lons = bounds["west"] + np.arange(cols)[None, :] * step
+
+            elevation = base_elevation + 15 * np.sin(lats * 50) * np.cos(lons * 40)
+            elevation = np.where(
+                lons < -80.85,
+                elevation - 20 * (1 - np.abs(lons - (-80.9)) * 20),
+                elevation,
+            )
+            dist_to_center = np.sqrt((lats - 35.2271) ** 2 + (lons - (-80.8431)) ** 2)
+            elevation = np.where(
+                dist_to_center < 0.05,
+                base_elevation - 5 + 3 * np.sin(dist_to_center * 100),
+                elevation,
+            )
+
+            dem.grid = DEMGrid.from_array(elevation, bounds["south"], bounds["west"], step)
+            return dem
+
         lat = bounds["south"]
         while lat <= bounds["north"]:
             lon = bounds["west"]
@@ -297,6 +408,17 @@ class ElevationFetcher(DataClient):
         # Parse elevation grid
         if "elevation" in data:
             elevations = data["elevation"]
+            step = dem.resolution / 3600
+
+            if HAS_NUMPY and elevations and len({len(row) for row in elevations}) == 1:
+                dem.grid = DEMGrid.from_array(
+                    np.asarray(elevations, dtype=np.float32),
+                    bounds["south"],
+                    bounds["west"],
+                    step,
+                )
+                return dem
+
             # Reshape into tiles based on dimensions
             # This is simplified - actual API returns grid data
             for i, row in enumerate(elevations):
@@ -327,15 +449,29 @@ class ElevationFetcher(DataClient):
             normalize: Normalize to 0-1 range
 
         Returns:
-            2D array of elevation values
+            2D array of elevation values (row 0 = south)
         """
-        if not dem.tiles:
+        grid = dem.ensure_grid()
+        if grid is None and not dem.tiles:
             return [[0.0] * resolution for _ in range(resolution)]
 
         # Get bounds
         min_elev, max_elev = dem.get_min_max()
         elev_range = max_elev - min_elev if max_elev != min_elev else 1.0
 
+        if grid is not None:
+            heights = grid.sample_lattice(
+                dem.bounds.get("south", grid.south),
+                dem.bounds.get("west", grid.west),
+                dem.bounds.get("north", grid.north),
+                dem.bounds.get("east", grid.east),
+                resolution,
+                resolution,
+            )
+            if normalize:
+                heights = (heights - min_elev) / elev_range
+            return heights.tolist()
+
         # Create output grid
         heightmap = [[0.0] * resolution for _ in range(resolution)]
 
@@ -390,8 +526,12 @@ class ElevationFetcher(DataClient):
         Returns:
             List of contour line definitions
         """
+        grid = dem.ensure_grid()
         min_elev, max_elev = dem.get_min_max()
 
+        if grid is not None:
+            return self._grid_contour_lines(grid, min_elev, max_elev, interval)
+
         contours = []
         current_elev = math.ceil(min_elev / interval) * interval
 
@@ -416,23 +556,92 @@ class ElevationFetcher(DataClient):
 
         return contours
 
+    def _grid_contour_lines(
+        self,
+        grid: DEMGrid,
+        min_elev: float,
+        max_elev: float,
+        interval: float,
+    ) -> List[Dict[str, Any]]:
+        """Find contour points tile by tile on a gridded DEM."""
+        levels = []
+        current_elev = math.ceil(min_elev / interval) * interval
+        while current_elev <= max_elev:
+            levels.append(current_elev)
+            current_elev += interval
+
+        points: Dict[float, List[Dict[str, float]]] = {level: [] for level in levels}
+        for row0, col0, block in grid.iter_blocks():
+            block = np.asarray(block, dtype=np.float64)
+            for level in levels:
+                rows, cols = np.nonzero(np.abs(block - level) < (interval / 2))
+                if not len(rows):
+                    continue
+                lats = grid.south + (row0 + rows) * grid.lat_step
+                lons = grid.west + (col0 + cols) * grid.lon_step
+                points[level].extend(
+                    {"lat": lat, "lon": lon}
+                    for lat, lon in zip(lats.tolist(), lons.tolist())
+                )
+
+        return [
+            {"elevation": level, "points": points[level]}
+            for level in levels
+            if points[level]
+        ]
+
+    def _store_grid(self, grid: DEMGrid) -> str:
+        """
+        Save a grid under the DEM tile directory.
+
+        Grids are named by a digest of their georeference and samples, so
+        identical responses share one set of tiles.
+
+        Returns:
+            Grid directory name relative to dem_dir
+        """
+        if grid.path is not None and grid.path.parent == self.dem_dir:
+            return grid.path.name
+
+        digest = hashlib.sha256(json.dumps(
+            [grid.south, grid.west, grid.lat_step, grid.lon_step, list(grid.shape)]
+        ).encode())
+        for _, _, block in grid.iter_blocks():
+            digest.update(np.ascontiguousarray(block).tobytes())
+        name = digest.hexdigest()[:32]
+
+        grid.save(self.dem_dir / name, tile_size=self.DEM_TILE_SIZE)
+        return name
+
     def _dem_to_dict(self, dem: DEMData) -> Dict[str, Any]:
-        """Convert DEMData to dictionary for caching."""
-        return {
-            "tiles": [
-                {"lat": t.lat, "lon": t.lon, "elevation": t.elevation, "resolution": t.resolution}
-                for t in dem.tiles
-            ],
+        """
+        Convert DEMData to dictionary for caching.
+
+        Gridded data is written to memory-mappable tiles and only the grid
+        name is stored in the dictionary.
+        """
+        data = {
             "bounds": dem.bounds,
             "resolution": dem.resolution,
             "source": dem.source,
             "crs": dem.crs,
             "timestamp": dem.timestamp,
         }
+        grid = dem.ensure_grid()
+        if grid is not None:
+            data["grid"] = self._store_grid(grid)
+        else:
+            data["tiles"] = [
+                {"lat": t.lat, "lon": t.lon, "elevation": t.elevation, "resolution": t.resolution}
+                for t in dem.tiles
+            ]
+        return data
 
     def _dict_to_dem(self, data: Dict[str, Any]) -> DEMData:
         """Convert dictionary back to DEMData."""
         dem = DEMData()
+        if "grid" in data:
+            dem.grid = DEMGrid.open(self.dem_dir / data["grid"])
         dem.tiles = [
             ElevationTile(
                 lat=t["lat"],
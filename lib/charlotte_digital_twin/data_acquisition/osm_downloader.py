@@ -10,6 +10,9 @@ Usage:
     downloader = OSMDownloader()
     data = downloader.download_charlotte_extract()
     roads = downloader.extract_roads(data)
+
+    # Large local extracts: stream and keep only roads
+    roads = downloader.stream_roads("north-carolina-latest.osm.pbf")
 """
 
 import os
@@ -21,10 +24,17 @@ import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from xml.etree import ElementTree
+from array import array
 
 from .base_client import DataClient, RateLimitedClient
+from .osm_stream import (
+    NodeStore,
+    TagFilter,
+    building_filter,
+    load_osm_file,
+    parse_osm_xml_stream,
+    road_filter,
+)
 
 
 @dataclass
@@ -54,7 +64,12 @@ class OSMRelation:
 
 @dataclass
 class OSMData:
-    """Container for parsed OSM data."""
+    """
+    Container for parsed OSM data.
+
+    Streaming loaders store nodes in a columnar NodeStore, which behaves
+    like a read-mostly Dict[int, OSMNode].
+    """
     nodes: Dict[int, OSMNode] = field(default_factory=dict)
     ways: Dict[int, OSMWay] = field(default_factory=dict)
     relations: Dict[int, OSMRelation] = field(default_factory=dict)
@@ -69,6 +84,24 @@ class OSMData:
             return []
         return [self.nodes[nid] for nid in way.node_ids if nid in self.nodes]
 
+    def get_node_latlon(self, node_id: int) -> Optional[Tuple[float, float]]:
+        """Get (lat, lon) of a node without materializing an OSMNode when possible."""
+        if isinstance(self.nodes, NodeStore):
+            return self.nodes.latlon(node_id)
+        node = self.nodes.get(node_id)
+        if node is None:
+            return None
+        return node.lat, node.lon
+
+    def get_way_coordinates(self, way: OSMWay) -> List[Dict[str, float]]:
+        """Get {"lat", "lon"} dicts for the known nodes of a way."""
+        coords = []
+        for node_id in way.node_ids:
+            latlon = self.get_node_latlon(node_id)
+            if latlon:
+                coords.append({"lat": latlon[0], "lon": latlon[1]})
+        return coords
+
 
 class OSMDownloader(DataClient):
     """
@@ -147,19 +180,18 @@ class OSMDownloader(DataClient):
         bounds = bounds or self.CHARLOTTE_BOUNDS
         cache_key = self._get_cache_key("charlotte_osm", bounds)
 
-        # Check cache
-        if not force_refresh:
-            cached = self._load_from_cache(cache_key)
-            if cached:
-                return self._dict_to_osm_data(cached)
-
-        # Download via Overpass API (smaller area)
-        osm_data = self._download_via_overpass(bounds)
+        if force_refresh:
+            # Download via Overpass API (smaller area)
+            osm_data = self._download_via_overpass(bounds)
+            self._save_to_cache(cache_key, self._osm_data_to_dict(osm_data))
+            return osm_data
 
-        # Cache result
-        self._save_to_cache(cache_key, self._osm_data_to_dict(osm_data))
-
-        return osm_data
+        # Parallel jobs share one download through the cache store
+        cached = self._cached_fetch(
+            cache_key,
+            lambda: self._osm_data_to_dict(self._download_via_overpass(bounds)),
+        )
+        return self._dict_to_osm_data(cached)
 
     def _download_via_overpass(self, bounds: Dict[str, float]) -> OSMData:
         """Download data via Overpass API."""
@@ -194,70 +226,76 @@ class OSMDownloader(DataClient):
 
         raise RuntimeError("All Overpass endpoints failed")
 
-    def _parse_osm_xml(self, xml_content: bytes) -> OSMData:
-        """Parse OSM XML content."""
-        osm_data = OSMData()
+    def _parse_osm_xml(self, xml_content: bytes, **filters: Any) -> OSMData:
+        """
+        Parse OSM XML content.
 
-        try:
-            root = ElementTree.fromstring(xml_content)
-        except ElementTree.ParseError:
-            raise ValueError("Invalid OSM XML")
-
-        # Parse bounds
-        bounds_elem = root.find("bounds")
-        if bounds_elem is not None:
-            osm_data.bounds = {
-                "minlat": float(bounds_elem.get("minlat", 0)),
-                "minlon": float(bounds_elem.get("minlon", 0)),
-                "maxlat": float(bounds_elem.get("maxlat", 0)),
-                "maxlon": float(bounds_elem.get("maxlon", 0)),
-            }
+        The payload is stream-parsed into columnar node storage; see
+        parse_osm_xml_stream for the filter arguments.
+        """
+        return parse_osm_xml_stream(xml_content, source_name="overpass_api", **filters)
 
-        # Parse nodes
-        for node_elem in root.findall("node"):
-            node = OSMNode(
-                id=int(node_elem.get("id")),
-                lat=float(node_elem.get("lat")),
-                lon=float(node_elem.get("lon")),
-            )
-            # Parse tags
-            for tag in node_elem.findall("tag"):
-                node.tags[tag.get("k")] = tag.get("v")
-            osm_data.nodes[node.id] = node
-
-        # Parse ways
-        for way_elem in root.findall("way"):
-            way = OSMWay(
-                id=int(way_elem.get("id")),
-                node_ids=[int(nd.get("ref")) for nd in way_elem.findall("nd")],
-            )
-            # Parse tags
-            for tag in way_elem.findall("tag"):
-                way.tags[tag.get("k")] = tag.get("v")
-            osm_data.ways[way.id] = way
-
-        # Parse relations
-        for rel_elem in root.findall("relation"):
-            relation = OSMRelation(
-                id=int(rel_elem.get("id")),
-                members=[
-                    {
-                        "type": m.get("type"),
-                        "ref": int(m.get("ref")),
-                        "role": m.get("role", ""),
-                    }
-                    for m in rel_elem.findall("member")
-                ],
-            )
-            # Parse tags
-            for tag in rel_elem.findall("tag"):
-                relation.tags[tag.get("k")] = tag.get("v")
-            osm_data.relations[relation.id] = relation
+    def load_file(
+        self,
+        path: Path,
+        way_filter: Optional[TagFilter] = None,
+        node_filter: Optional[TagFilter] = None,
+        relation_filter: Optional[TagFilter] = None,
+    ) -> OSMData:
+        """
+        Load a local OSM XML or PBF extract with streaming parsing.
 
-        osm_data.source = "overpass_api"
-        osm_data.timestamp = datetime.now().isoformat()
+        Args:
+            path: .osm, .osm.gz, .osm.bz2 or .osm.pbf file
+            way_filter: Keep only ways whose tags pass this callback
+            node_filter: Keep tags only for nodes passing this callback
+            relation_filter: Keep only relations passing this callback
 
-        return osm_data
+        Returns:
+            Parsed OSMData
+        """
+        return load_osm_file(
+            path,
+            way_filter=way_filter,
+            node_filter=node_filter,
+            relation_filter=relation_filter,
+        )
+
+    def stream_roads(
+        self,
+        path: Path,
+        highway_types: Optional[Set[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract roads from a local extract, skipping all other ways while parsing.
+
+        Args:
+            path: .osm, .osm.gz, .osm.bz2 or .osm.pbf file
+            highway_types: Filter to specific highway types
+
+        Returns:
+            List of road segments with geometry
+        """
+        osm_data = self.load_file(path, way_filter=road_filter(highway_types))
+        return self.extract_roads(osm_data, highway_types)
+
+    def stream_buildings(
+        self,
+        path: Path,
+        min_height: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract buildings from a local extract, skipping all other ways while parsing.
+
+        Args:
+            path: .osm, .osm.gz, .osm.bz2 or .osm.pbf file
+            min_height: Filter to buildings above this height (meters)
+
+        Returns:
+            List of buildings with geometry
+        """
+        osm_data = self.load_file(path, way_filter=building_filter())
+        return self.extract_buildings(osm_data, min_height)
 
     def extract_roads(
         self,
@@ -292,11 +330,7 @@ class OSMDownloader(DataClient):
                 continue
 
             # Get coordinates
-            coords = []
-            for node_id in way.node_ids:
-                node = osm_data.nodes.get(node_id)
-                if node:
-                    coords.append({"lat": node.lat, "lon": node.lon})
+            coords = osm_data.get_way_coordinates(way)
 
             if len(coords) < 2:
                 continue
@@ -342,11 +376,7 @@ class OSMDownloader(DataClient):
                 continue
 
             # Get footprint coordinates
-            coords = []
-            for node_id in way.node_ids:
-                node = osm_data.nodes.get(node_id)
-                if node:
-                    coords.append({"lat": node.lat, "lon": node.lon})
+            coords = osm_data.get_way_coordinates(way)
 
             if len(coords) < 3:
                 continue
@@ -401,11 +431,7 @@ class OSMDownloader(DataClient):
             if water not in water_types and natural != "water":
                 continue
 
-            coords = []
-            for node_id in way.node_ids:
-                node = osm_data.nodes.get(node_id)
-                if node:
-                    coords.append({"lat": node.lat, "lon": node.lon})
+            coords = osm_data.get_way_coordinates(way)
 
             if len(coords) < 2:
                 continue
@@ -470,14 +496,32 @@ class OSMDownloader(DataClient):
             json.dump(data, f, indent=2)
 
     def _osm_data_to_dict(self, osm_data: OSMData) -> Dict[str, Any]:
-        """Convert OSMData to dictionary for caching."""
+        """
+        Convert OSMData to dictionary for caching.
+
+        Nodes are written column-wise (ids, lat, lon and sparse tags)
+        instead of one object per node.
+        """
+        nodes = osm_data.nodes
+        if isinstance(nodes, NodeStore):
+            node_columns = {
+                "ids": nodes.ids.tolist(),
+                "lat": nodes.lats.tolist(),
+                "lon": nodes.lons.tolist(),
+                "tags": {str(nodes.ids[row]): tags for row, tags in nodes.tags.items()},
+            }
+        else:
+            node_columns = {
+                "ids": list(nodes),
+                "lat": [v.lat for v in nodes.values()],
+                "lon": [v.lon for v in nodes.values()],
+                "tags": {str(k): v.tags for k, v in nodes.items() if v.tags},
+            }
+
         return {
-            "nodes": {
-                k: {"id": v.id, "lat": v.lat, "lon": v.lon, "tags": v.tags}
-                for k, v in osm_data.nodes.items()
-            },
+            "node_columns": node_columns,
             "ways": {
-                k: {"id": v.id, "node_ids": v.node_ids, "tags": v.tags}
+                k: {"id": v.id, "node_ids": list(v.node_ids), "tags": v.tags}
                 for k, v in osm_data.ways.items()
             },
             "relations": {
@@ -493,20 +537,29 @@ class OSMDownloader(DataClient):
         """Convert dictionary back to OSMData."""
         osm_data = OSMData()
 
-        osm_data.nodes = {
-            int(k): OSMNode(
-                id=v["id"],
-                lat=v["lat"],
-                lon=v["lon"],
-                tags=v.get("tags", {}),
-            )
-            for k, v in data.get("nodes", {}).items()
-        }
+        columns = data.get("node_columns")
+        if columns is not None:
+            store = NodeStore()
+            tags = columns.get("tags", {})
+            for node_id, lat, lon in zip(columns["ids"], columns["lat"], columns["lon"]):
+                store.add(node_id, lat, lon, tags.get(str(node_id)))
+            osm_data.nodes = store
+        else:
+            # Caches written before columnar node storage
+            osm_data.nodes = {
+                int(k): OSMNode(
+                    id=v["id"],
+                    lat=v["lat"],
+                    lon=v["lon"],
+                    tags=v.get("tags", {}),
+                )
+                for k, v in data.get("nodes", {}).items()
+            }
 
         osm_data.ways = {
             int(k): OSMWay(
                 id=v["id"],
-                node_ids=v["node_ids"],
+                node_ids=array("q", v["node_ids"]),
                 tags=v.get("tags", {}),
             )
             for k, v in data.get("ways", {}).items()
@@ -0,0 +1,823 @@
+"""
+Streaming OpenStreetMap Loader
+
+Memory-efficient parsing of OSM XML (.osm, .osm.gz, .osm.bz2) and PBF
+(.osm.pbf) files for large metro-area extracts.
+
+- XML is read with ElementTree.iterparse and every element is cleared
+  as soon as it has been consumed, so the document tree is never held
+  in memory.
+- PBF is decoded with a small pure-Python protobuf reader (zlib blobs
+  only), no external dependencies.
+- Node IDs and coordinates are stored column-wise in typed arrays with
+  an ID -> row map (NodeStore). OSMNode objects are only created on
+  access.
+- Tag keys and values are interned per load so repeated strings
+  ("highway", "residential", "yes") are stored once.
+- Filter callbacks are applied while parsing, so unwanted ways and
+  relations are never materialized, and nodes not referenced by a kept
+  way can be pruned.
+
+Usage:
+    from lib.charlotte_digital_twin.data_acquisition.osm_stream import (
+        load_osm_file,
+        road_filter,
+    )
+
+    data = load_osm_file("charlotte.osm.pbf", way_filter=road_filter())
+    print(len(data.nodes), len(data.ways))
+"""
+
+import bz2
+import gzip
+import io
+import struct
+import zlib
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+from collections.abc import Mapping
+from xml.etree import ElementTree
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Filter callback: (tags) -> keep element
+TagFilter = Callable[[Dict[str, str]], bool]
+
+# Default highway types kept by road_filter (matches OSMDownloader.extract_roads)
+DEFAULT_HIGHWAY_TYPES = frozenset({
+    "motorway", "motorway_link",
+    "trunk", "trunk_link",
+    "primary", "primary_link",
+    "secondary", "secondary_link",
+    "tertiary", "tertiary_link",
+    "residential", "service",
+})
+
+# Clear the XML root every N top-level elements to release cleared children
+_ROOT_CLEAR_INTERVAL = 4096
+
+
+class StringInterner:
+    """
+    Per-load string table so identical tag strings share one object.
+
+    Attributes:
+        strings: Mapping of string to its canonical instance
+    """
+
+    def __init__(self):
+        """Initialize empty string table."""
+        self.strings: Dict[str, str] = {}
+
+    def __call__(self, value: str) -> str:
+        """Return the canonical instance of a string."""
+        return self.strings.setdefault(value, value)
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+
+class NodeStore(Mapping):
+    """
+    Columnar node storage with a dict-like OSMNode interface.
+
+    IDs, latitudes and longitudes live in typed arrays; tags are kept
+    only for nodes that have them. Reading ``store[node_id]`` builds an
+    OSMNode on the fly, so existing code that expects
+    ``Dict[int, OSMNode]`` keeps working.
+
+    Attributes:
+        ids: Node IDs (int64)
+        lats: Latitudes in degrees (float64)
+        lons: Longitudes in degrees (float64)
+        index: Node ID -> row
+        tags: Row -> tag dict, for tagged nodes only
+    """
+
+    def __init__(self):
+        """Initialize empty store."""
+        self.ids = array("q")
+        self.lats = array("d")
+        self.lons = array("d")
+        self.index: Dict[int, int] = {}
+        self.tags: Dict[int, Dict[str, str]] = {}
+
+    def add(self, node_id: int, lat: float, lon: float, tags: Optional[Dict[str, str]] = None) -> None:
+        """
+        Add or replace a node.
+
+        Args:
+            node_id: OSM node ID
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+            tags: Optional node tags
+        """
+        row = self.index.get(node_id)
+        if row is None:
+            row = len(self.ids)
+            self.index[node_id] = row
+            self.ids.append(node_id)
+            self.lats.append(lat)
+            self.lons.append(lon)
+        else:
+            self.lats[row] = lat
+            self.lons[row] = lon
+            self.tags.pop(row, None)
+        if tags:
+            self.tags[row] = tags
+
+    def latlon(self, node_id: int) -> Optional[Tuple[float, float]]:
+        """
+        Get the coordinates of a node without creating an OSMNode.
+
+        Args:
+            node_id: OSM node ID
+
+        Returns:
+            (lat, lon) or None if the node is unknown
+        """
+        row = self.index.get(node_id)
+        if row is None:
+            return None
+        return self.lats[row], self.lons[row]
+
+    def latlon_array(self) -> "np.ndarray":
+        """
+        Get all coordinates as an (N, 2) float64 array of (lat, lon).
+
+        Rows follow insertion order, matching ``ids``.
+
+        Returns:
+            C-contiguous coordinate array
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for latlon_array")
+        coords = np.empty((len(self.ids), 2), dtype=np.float64)
+        coords[:, 0] = np.frombuffer(self.lats, dtype=np.float64)
+        coords[:, 1] = np.frombuffer(self.lons, dtype=np.float64)
+        return coords
+
+    def retain(self, keep: Set[int]) -> int:
+        """
+        Drop every node whose ID is not in ``keep``.
+
+        Args:
+            keep: Node IDs to keep
+
+        Returns:
+            Number of nodes removed
+        """
+        ids, lats, lons, tags = self.ids, self.lats, self.lons, self.tags
+        self.__init__()
+        for row, node_id in enumerate(ids):
+            if node_id in keep:
+                self.add(node_id, lats[row], lons[row], tags.get(row))
+        return len(ids) - len(self.ids)
+
+    def __setitem__(self, node_id: int, node: Any) -> None:
+        self.add(node_id, node.lat, node.lon, node.tags)
+
+    def __getitem__(self, node_id: int) -> Any:
+        from .osm_downloader import OSMNode
+
+        row = self.index[node_id]
+        return OSMNode(
+            id=node_id,
+            lat=self.lats[row],
+            lon=self.lons[row],
+            tags=self.tags.get(row, {}),
+        )
+
+    def __contains__(self, node_id: object) -> bool:
+        return node_id in self.index
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def road_filter(highway_types: Optional[Set[str]] = None) -> TagFilter:
+    """
+    Create a way filter that keeps roads.
+
+    Args:
+        highway_types: Highway values to keep (default: DEFAULT_HIGHWAY_TYPES)
+
+    Returns:
+        Tag filter callback
+    """
+    types = frozenset(highway_types) if highway_types is not None else DEFAULT_HIGHWAY_TYPES
+
+    def keep(tags: Dict[str, str]) -> bool:
+        return tags.get("highway") in types
+
+    return keep
+
+
+def building_filter() -> TagFilter:
+    """
+    Create a way filter that keeps buildings.
+
+    Returns:
+        Tag filter callback
+    """
+    def keep(tags: Dict[str, str]) -> bool:
+        return "building" in tags
+
+    return keep
+
+
+def _new_osm_data(source: str) -> Any:
+    """Create an empty OSMData backed by a NodeStore."""
+    from .osm_downloader import OSMData
+
+    return OSMData(nodes=NodeStore(), source=source)
+
+
+def _prune_nodes(osm_data: Any, keep_tagged: bool) -> None:
+    """
+    Keep only nodes referenced by kept ways.
+
+    Args:
+        osm_data: Parsed data with a NodeStore
+        keep_tagged: Also keep tagged nodes (those that passed node_filter)
+    """
+    keep: Set[int] = set()
+    for way in osm_data.ways.values():
+        keep.update(way.node_ids)
+    store = osm_data.nodes
+    if keep_tagged:
+        keep.update(store.ids[row] for row in store.tags)
+    store.retain(keep)
+
+
+# =============================================================================
+# XML
+# =============================================================================
+
+def _open_source(source: Union[str, Path, bytes, BinaryIO]) -> Tuple[BinaryIO, bool]:
+    """
+    Open a path, byte string or file object for binary reading.
+
+    Returns:
+        Tuple of (stream, whether the caller must close it)
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source), True
+    if isinstance(source, (str, Path)):
+        path = str(source)
+        if path.endswith(".gz"):
+            return gzip.open(path, "rb"), True
+        if path.endswith(".bz2"):
+            return bz2.open(path, "rb"), True
+        return open(path, "rb"), True
+    return source, False
+
+
+def parse_osm_xml_stream(
+    source: Union[str, Path, bytes, BinaryIO],
+    way_filter: Optional[TagFilter] = None,
+    node_filter: Optional[TagFilter] = None,
+    relation_filter: Optional[TagFilter] = None,
+    prune_nodes: Optional[bool] = None,
+    source_name: str = "osm_xml",
+) -> Any:
+    """
+    Stream-parse OSM XML into columnar OSMData.
+
+    Args:
+        source: File path, XML bytes or binary file object
+        way_filter: Keep only ways whose tags pass this callback
+        node_filter: Keep tags only for nodes passing this callback
+            (coordinates are always kept for way geometry)
+        relation_filter: Keep only relations passing this callback
+            (default: drop relations when way_filter is set)
+        prune_nodes: Drop nodes not used by kept ways, except tagged
+            nodes passing node_filter (default: when way_filter is set)
+        source_name: Value stored in OSMData.source
+
+    Returns:
+        OSMData with a NodeStore
+
+    Raises:
+        ValueError: If the XML is malformed
+    """
+    from .osm_downloader import OSMRelation, OSMWay
+
+    if prune_nodes is None:
+        prune_nodes = way_filter is not None
+    if relation_filter is None and way_filter is not None:
+        relation_filter = _reject_all
+
+    osm_data = _new_osm_data(source_name)
+    nodes: NodeStore = osm_data.nodes
+    intern = StringInterner()
+
+    stream, close = _open_source(source)
+    try:
+        context = ElementTree.iterparse(stream, events=("start", "end"))
+        _, root = next(context)
+
+        count = 0
+        for event, elem in context:
+            if event != "end":
+                continue
+            tag = elem.tag
+
+            if tag == "node":
+                tags = _xml_tags(elem, intern)
+                if tags and node_filter is not None and not node_filter(tags):
+                    tags = None
+                nodes.add(int(elem.get("id")), float(elem.get("lat")), float(elem.get("lon")), tags)
+            elif tag == "way":
+                tags = _xml_tags(elem, intern) or {}
+                if way_filter is None or way_filter(tags):
+                    way_id = int(elem.get("id"))
+                    refs = array("q", (int(nd.get("ref")) for nd in elem.iter("nd")))
+                    osm_data.ways[way_id] = OSMWay(id=way_id, node_ids=refs, tags=tags)
+            elif tag == "relation":
+                tags = _xml_tags(elem, intern) or {}
+                if relation_filter is None or relation_filter(tags):
+                    rel_id = int(elem.get("id"))
+                    members = [
+                        {
+                            "type": intern(m.get("type")),
+                            "ref": int(m.get("ref")),
+                            "role": intern(m.get("role", "")),
+                        }
+                        for m in elem.iter("member")
+                    ]
+                    osm_data.relations[rel_id] = OSMRelation(id=rel_id, members=members, tags=tags)
+            elif tag == "bounds":
+                osm_data.bounds = {
+                    "minlat": float(elem.get("minlat", 0)),
+                    "minlon": float(elem.get("minlon", 0)),
+                    "maxlat": float(elem.get("maxlat", 0)),
+                    "maxlon": float(elem.get("maxlon", 0)),
+                }
+            else:
+                # Children (tag, nd, member) are read by their parent
+                continue
+
+            elem.clear()
+            count += 1
+            if count % _ROOT_CLEAR_INTERVAL == 0:
+                root.clear()
+    except ElementTree.ParseError:
+        raise ValueError("Invalid OSM XML")
+    finally:
+        if close:
+            stream.close()
+
+    if prune_nodes:
+        _prune_nodes(osm_data, keep_tagged=node_filter is not None)
+
+    osm_data.timestamp = datetime.now().isoformat()
+    return osm_data
+
+
+def _xml_tags(elem: Any, intern: StringInterner) -> Optional[Dict[str, str]]:
+    """Read interned <tag k v> children of an element."""
+    tags = None
+    for tag in elem.iter("tag"):
+        if tags is None:
+            tags = {}
+        tags[intern(tag.get("k"))] = intern(tag.get("v"))
+    return tags
+
+
+def _reject_all(tags: Dict[str, str]) -> bool:
+    return False
+
+
+# =============================================================================
+# PBF
+# =============================================================================
+
+def _read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    """Decode a protobuf varint starting at ``pos``."""
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def _iter_fields(buf: bytes) -> Iterator[Tuple[int, int, Any]]:
+    """
+    Iterate protobuf fields as (field number, wire type, value).
+
+    Length-delimited values are returned as memoryview slices.
+    """
+    view = memoryview(buf)
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        key, pos = _read_varint(buf, pos)
+        number, wire = key >> 3, key & 7
+        if wire == 0:
+            value, pos = _read_varint(buf, pos)
+        elif wire == 2:
+            length, pos = _read_varint(buf, pos)
+            value = view[pos:pos + length]
+            pos += length
+        elif wire == 1:
+            value = buf[pos:pos + 8]
+            pos += 8
+        elif wire == 5:
+            value = buf[pos:pos + 4]
+            pos += 4
+        else:
+            raise ValueError(f"Unsupported protobuf wire type {wire}")
+        yield number, wire, value
+
+
+def _packed_varints(data: Any) -> List[int]:
+    """Decode a packed repeated varint field."""
+    buf = bytes(data)
+    values = []
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        value, pos = _read_varint(buf, pos)
+        values.append(value)
+    return values
+
+
+def _packed_sint(data: Any) -> List[int]:
+    return [_zigzag(v) for v in _packed_varints(data)]
+
+
+def _delta_decode(values: List[int]) -> List[int]:
+    total = 0
+    decoded = []
+    for value in values:
+        total += value
+        decoded.append(total)
+    return decoded
+
+
+def _iter_pbf_blobs(stream: BinaryIO) -> Iterator[Tuple[str, bytes]]:
+    """Yield (blob type, decompressed payload) for each file block."""
+    while True:
+        header_size = stream.read(4)
+        if not header_size:
+            return
+        if len(header_size) < 4:
+            raise ValueError("Truncated PBF block header")
+        (size,) = struct.unpack(">I", header_size)
+
+        blob_type = ""
+        datasize = 0
+        for number, _, value in _iter_fields(stream.read(size)):
+            if number == 1:
+                blob_type = bytes(value).decode("utf-8")
+            elif number == 3:
+                datasize = value
+
+        raw = None
+        zlib_data = None
+        for number, _, value in _iter_fields(stream.read(datasize)):
+            if number == 1:
+                raw = bytes(value)
+            elif number == 3:
+                zlib_data = bytes(value)
+            elif number in (4, 5, 6, 7):
+                raise ValueError("Only raw and zlib compressed PBF blobs are supported")
+
+        if raw is None and zlib_data is not None:
+            raw = zlib.decompress(zlib_data)
+        yield blob_type, raw or b""
+
+
+def _pbf_tags(keys: List[int], vals: List[int], strings: List[str]) -> Dict[str, str]:
+    return {strings[k]: strings[v] for k, v in zip(keys, vals)}
+
+
+def parse_osm_pbf_stream(
+    source: Union[str, Path, bytes, BinaryIO],
+    way_filter: Optional[TagFilter] = None,
+    node_filter: Optional[TagFilter] = None,
+    relation_filter: Optional[TagFilter] = None,
+    prune_nodes: Optional[bool] = None,
+    source_name: str = "osm_pbf",
+) -> Any:
+    """
+    Stream-decode an OSM PBF file into columnar OSMData.
+
+    Blocks are decoded one at a time; only raw and zlib compressed
+    blobs are supported.
+
+    Args:
+        source: File path, PBF bytes or binary file object
+        way_filter: Keep only ways whose tags pass this callback
+        node_filter: Keep tags only for nodes passing this callback
+        relation_filter: Keep only relations passing this callback
+            (default: drop relations when way_filter is set)
+        prune_nodes: Drop nodes not used by kept ways, except tagged
+            nodes passing node_filter (default: when way_filter is set)
+        source_name: Value stored in OSMData.source
+
+    Returns:
+        OSMData with a NodeStore
+
+    Raises:
+        ValueError: If the file is malformed or uses unsupported compression
+    """
+    if prune_nodes is None:
+        prune_nodes = way_filter is not None
+    if relation_filter is None and way_filter is not None:
+        relation_filter = _reject_all
+
+    osm_data = _new_osm_data(source_name)
+    intern = StringInterner()
+    filters = (way_filter, node_filter, relation_filter)
+
+    stream, close = _open_source(source)
+    try:
+        for blob_type, payload in _iter_pbf_blobs(stream):
+            if blob_type == "OSMHeader":
+                _decode_pbf_header(payload, osm_data)
+            elif blob_type == "OSMData":
+                _decode_primitive_block(payload, osm_data, intern, filters)
+    except (IndexError, struct.error, zlib.error) as e:
+        raise ValueError(f"Invalid OSM PBF: {e}")
+    finally:
+        if close:
+            stream.close()
+
+    if prune_nodes:
+        _prune_nodes(osm_data, keep_tagged=node_filter is not None)
+
+    osm_data.timestamp = datetime.now().isoformat()
+    return osm_data
+
+
+def _decode_pbf_header(payload: bytes, osm_data: Any) -> None:
+    """Read the bounding box from an OSMHeader block."""
+    for number, _, value in _iter_fields(payload):
+        if number != 1:
+            continue
+        bbox = {}
+        for field_number, _, coord in _iter_fields(bytes(value)):
+            bbox[field_number] = _zigzag(coord) * 1e-9
+        osm_data.bounds = {
+            "minlat": bbox.get(4, 0.0),
+            "minlon": bbox.get(1, 0.0),
+            "maxlat": bbox.get(3, 0.0),
+            "maxlon": bbox.get(2, 0.0),
+        }
+
+
+def _decode_primitive_block(
+    payload: bytes,
+    osm_data: Any,
+    intern: StringInterner,
+    filters: Tuple[Optional[TagFilter], Optional[TagFilter], Optional[TagFilter]],
+) -> None:
+    """Decode one PrimitiveBlock into osm_data."""
+    strings: List[str] = []
+    groups = []
+    granularity = 100
+    lat_offset = 0
+    lon_offset = 0
+
+    for number, _, value in _iter_fields(payload):
+        if number == 1:
+            strings = [
+                intern(bytes(s).decode("utf-8"))
+                for field_number, _, s in _iter_fields(bytes(value))
+                if field_number == 1
+            ]
+        elif number == 2:
+            groups.append(bytes(value))
+        elif number == 17:
+            granularity = value
+        elif number == 19:
+            lat_offset = value
+        elif number == 20:
+            lon_offset = value
+
+    scale = (granularity, lat_offset, lon_offset)
+    for group in groups:
+        for number, _, value in _iter_fields(group):
+            if number == 1:
+                _decode_pbf_node(bytes(value), osm_data, strings, scale, filters[1])
+            elif number == 2:
+                _decode_dense_nodes(bytes(value), osm_data, strings, scale, filters[1])
+            elif number == 3:
+                _decode_pbf_way(bytes(value), osm_data, strings, filters[0])
+            elif number == 4:
+                _decode_pbf_relation(bytes(value), osm_data, strings, filters[2])
+
+
+def _decode_pbf_node(
+    data: bytes,
+    osm_data: Any,
+    strings: List[str],
+    scale: Tuple[int, int, int],
+    node_filter: Optional[TagFilter],
+) -> None:
+    node_id = lat = lon = 0
+    keys: List[int] = []
+    vals: List[int] = []
+    for number, _, value in _iter_fields(data):
+        if number == 1:
+            node_id = _zigzag(value)
+        elif number == 2:
+            keys = _packed_varints(value)
+        elif number == 3:
+            vals = _packed_varints(value)
+        elif number == 8:
+            lat = _zigzag(value)
+        elif number == 9:
+            lon = _zigzag(value)
+
+    granularity, lat_offset, lon_offset = scale
+    tags = _pbf_tags(keys, vals, strings) or None
+    if tags and node_filter is not None and not node_filter(tags):
+        tags = None
+    osm_data.nodes.add(
+        node_id,
+        1e-9 * (lat_offset + granularity * lat),
+        1e-9 * (lon_offset + granularity * lon),
+        tags,
+    )
+
+
+def _decode_dense_nodes(
+    data: bytes,
+    osm_data: Any,
+    strings: List[str],
+    scale: Tuple[int, int, int],
+    node_filter: Optional[TagFilter],
+) -> None:
+    ids: List[int] = []
+    lats: List[int] = []
+    lons: List[int] = []
+    keys_vals: List[int] = []
+    for number, _, value in _iter_fields(data):
+        if number == 1:
+            ids = _delta_decode(_packed_sint(value))
+        elif number == 8:
+            lats = _delta_decode(_packed_sint(value))
+        elif number == 9:
+            lons = _delta_decode(_packed_sint(value))
+        elif number == 10:
+            keys_vals = _packed_varints(value)
+
+    granularity, lat_offset, lon_offset = scale
+    nodes: NodeStore = osm_data.nodes
+    kv_pos = 0
+    for i, node_id in enumerate(ids):
+        tags = None
+        # keys_vals holds (key, value)* pairs per node, each list ended by 0
+        while kv_pos < len(keys_vals) and keys_vals[kv_pos] != 0:
+            if tags is None:
+                tags = {}
+            tags[strings[keys_vals[kv_pos]]] = strings[keys_vals[kv_pos + 1]]
+            kv_pos += 2
+        kv_pos += 1
+
+        if tags and node_filter is not None and not node_filter(tags):
+            tags = None
+        nodes.add(
+            node_id,
+            1e-9 * (lat_offset + granularity * lats[i]),
+            1e-9 * (lon_offset + granularity * lons[i]),
+            tags,
+        )
+
+
+def _decode_pbf_way(
+    data: bytes,
+    osm_data: Any,
+    strings: List[str],
+    way_filter: Optional[TagFilter],
+) -> None:
+    from .osm_downloader import OSMWay
+
+    way_id = 0
+    keys: List[int] = []
+    vals: List[int] = []
+    refs = None
+    for number, _, value in _iter_fields(data):
+        if number == 1:
+            way_id = value
+        elif number == 2:
+            keys = _packed_varints(value)
+        elif number == 3:
+            vals = _packed_varints(value)
+        elif number == 8:
+            refs = value
+
+    tags = _pbf_tags(keys, vals, strings)
+    if way_filter is not None and not way_filter(tags):
+        return
+
+    node_ids = array("q", _delta_decode(_packed_sint(refs)) if refs is not None else [])
+    osm_data.ways[way_id] = OSMWay(id=way_id, node_ids=node_ids, tags=tags)
+
+
+_PBF_MEMBER_TYPES = ("node", "way", "relation")
+
+
+def _decode_pbf_relation(
+    data: bytes,
+    osm_data: Any,
+    strings: List[str],
+    relation_filter: Optional[TagFilter],
+) -> None:
+    from .osm_downloader import OSMRelation
+
+    rel_id = 0
+    keys: List[int] = []
+    vals: List[int] = []
+    roles: List[int] = []
+    memids: List[int] = []
+    types: List[int] = []
+    for number, _, value in _iter_fields(data):
+        if number == 1:
+            rel_id = value
+        elif number == 2:
+            keys = _packed_varints(value)
+        elif number == 3:
+            vals = _packed_varints(value)
+        elif number == 8:
+            roles = _packed_varints(value)
+        elif number == 9:
+            memids = _delta_decode(_packed_sint(value))
+        elif number == 10:
+            types = _packed_varints(value)
+
+    tags = _pbf_tags(keys, vals, strings)
+    if relation_filter is not None and not relation_filter(tags):
+        return
+
+    members = [
+        {"type": _PBF_MEMBER_TYPES[t], "ref": ref, "role": strings[role]}
+        for t, ref, role in zip(types, memids, roles)
+    ]
+    osm_data.relations[rel_id] = OSMRelation(id=rel_id, members=members, tags=tags)
+
+
+def load_osm_file(
+    path: Union[str, Path],
+    way_filter: Optional[TagFilter] = None,
+    node_filter: Optional[TagFilter] = None,
+    relation_filter: Optional[TagFilter] = None,
+    prune_nodes: Optional[bool] = None,
+) -> Any:
+    """
+    Load an OSM XML or PBF file, choosing the parser by extension.
+
+    Args:
+        path: .osm, .osm.gz, .osm.bz2, .xml or .osm.pbf file
+        way_filter: Keep only ways whose tags pass this callback
+        node_filter: Keep tags only for nodes passing this callback
+        relation_filter: Keep only relations passing this callback
+        prune_nodes: Drop nodes not used by kept ways
+
+    Returns:
+        OSMData with a NodeStore
+    """
+    path = str(path)
+    parser = parse_osm_pbf_stream if path.endswith(".pbf") else parse_osm_xml_stream
+    return parser(
+        path,
+        way_filter=way_filter,
+        node_filter=node_filter,
+        relation_filter=relation_filter,
+        prune_nodes=prune_nodes,
+        source_name=path,
+    )
+
+
+__all__ = [
+    "DEFAULT_HIGHWAY_TYPES",
+    "NodeStore",
+    "StringInterner",
+    "TagFilter",
+    "building_filter",
+    "load_osm_file",
+    "parse_osm_pbf_stream",
+    "parse_osm_xml_stream",
+    "road_filter",
+]
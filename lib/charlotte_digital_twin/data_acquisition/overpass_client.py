@@ -118,38 +118,30 @@ class OverpassClient(DataClient):
 
         cache_key = self._get_cache_key("overpass", {"query": query})
 
-        # Check cache
-        if use_cache:
-            cached = self._load_from_cache(cache_key)
-            if cached:
-                return cached
-
-        # Try each endpoint
-        last_error = None
-        for endpoint in self.ENDPOINTS:
-            try:
-                self._rate_limit_wait()
-                response = self._requests.post(
-                    endpoint,
-                    data={"data": query},
-                    timeout=120,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                elements = data.get("elements", [])
-
-                # Cache results
-                if use_cache:
-                    self._save_to_cache(cache_key, elements)
-
-                return elements
-
-            except Exception as e:
-                last_error = e
-                continue
-
-        raise RuntimeError(f"All Overpass endpoints failed: {last_error}")
+        def _query_endpoints() -> List[Dict[str, Any]]:
+            # Try each endpoint
+            last_error = None
+            for endpoint in self.ENDPOINTS:
+                try:
+                    self._rate_limit_wait()
+                    response = self._requests.post(
+                        endpoint,
+                        data={"data": query},
+                        timeout=120,
+                    )
+                    response.raise_for_status()
+                    data = response.json()
+
+                    return data.get("elements", [])
+
+                except Exception as e:
+                    last_error = e
+                    continue
+
+            raise RuntimeError(f"All Overpass endpoints failed: {last_error}")
+
+        # Concurrent workers issuing the same query share one request
+        return self._cached_fetch(cache_key, _query_endpoints, use_cache=use_cache)
 
     def _parse_poi(self, element: Dict[str, Any], category: str) -> Optional[POI]:
         """Parse POI from Overpass element."""
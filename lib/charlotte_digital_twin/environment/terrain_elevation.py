@@ -7,16 +7,24 @@ Handles terrain elevation data:
 - Height map application
 - Road profiling
 
-Supports integration with real elevation data for Charlotte area.
+Supports integration with real elevation data for Charlotte area:
+elevations for whole road paths are sampled in one batch from a DEM
+(see ElevationFetcher) or from the procedural terrain.
 """
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import math
 import random
 import os
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 try:
     import bpy
     import bmesh
@@ -290,13 +298,63 @@ class TerrainSystem:
 
         return elevation
 
+    def get_elevations(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        config: Optional[TerrainConfig] = None,
+        dem: Optional[Any] = None,
+        transformer: Optional[Any] = None,
+    ) -> Any:
+        """
+        Get terrain elevation at many points at once.
+
+        With a DEM, world positions are converted to lat/lon and the DEM is
+        sampled with bilinear interpolation in one call; otherwise the
+        procedural terrain is evaluated over the whole array.
+
+        Args:
+            xs: X coordinates
+            ys: Y coordinates
+            config: Terrain configuration
+            dem: DEMData (or anything with sample(lats, lons)) to sample
+            transformer: CoordinateTransformer mapping world to lat/lon
+                (default: Charlotte scene origin)
+
+        Returns:
+            Elevations in meters (array with NumPy, list without)
+        """
+        config = config or TerrainConfig()
+
+        if not HAS_NUMPY:
+            if dem is not None:
+                transformer = transformer or _default_transformer()
+                geo = [transformer.world_to_latlon(x, y) for x, y in zip(xs, ys)]
+                return dem.sample([g.lat for g in geo], [g.lon for g in geo])
+            return [self._procedural_elevation(x, y, config) for x, y in zip(xs, ys)]
+
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+
+        if dem is not None:
+            transformer = transformer or _default_transformer()
+            geo = transformer.world_to_latlon_array(np.column_stack([xs, ys]))
+            return np.asarray(dem.sample(geo[:, 0], geo[:, 1]), dtype=np.float64)
+
+        return self._procedural_elevation(xs, ys, config, xp=np)
+
     def _procedural_elevation(
         self,
-        x: float,
-        y: float,
+        x: Any,
+        y: Any,
         config: TerrainConfig,
-    ) -> float:
-        """Generate procedural elevation using layered noise."""
+        xp: Any = math,
+    ) -> Any:
+        """
+        Generate procedural elevation using layered noise.
+
+        x and y may be scalars (xp=math) or NumPy arrays (xp=np).
+        """
         if config.charlotte_elevation_base > 0:
             # Charlotte-specific: gentle rolling terrain
             base = config.charlotte_elevation_base
@@ -316,7 +374,7 @@ class TerrainSystem:
 
             # Pseudo-noise using sin
             noise = (
-                math.sin(nx * 12.9898 + ny * 78.233) * 43758.5453
+                xp.sin(nx * 12.9898 + ny * 78.233) * 43758.5453
             ) % 1.0
 
             elevation += noise * amplitude
@@ -488,29 +546,43 @@ def create_charlotte_terrain(
     return terrain
 
 
+def _default_transformer() -> Any:
+    """World <-> lat/lon transformer for the default scene origin."""
+    from ..geometry.coordinates import CoordinateTransformer
+    return CoordinateTransformer()
+
+
 def apply_elevation_to_road(
     road_points: List[Tuple[float, float]],
     config: Optional[TerrainConfig] = None,
+    dem: Optional[Any] = None,
+    transformer: Optional[Any] = None,
 ) -> List[Tuple[float, float, float]]:
     """
     Apply terrain elevation to a 2D road path.
 
+    All points are sampled in one batch (see TerrainSystem.get_elevations).
+
     Args:
         road_points: 2D road points (x, y)
         config: Terrain configuration
+        dem: DEMData to sample instead of procedural terrain
+        transformer: CoordinateTransformer mapping world to lat/lon
 
     Returns:
         3D road points (x, y, z)
     """
-    system = TerrainSystem()
-    config = config or TerrainConfig()
+    if not road_points:
+        return []
 
-    result = []
-    for x, y in road_points:
-        z = system.get_elevation_at_point(x, y, config)
-        result.append((x, y, z))
+    system = TerrainSystem()
+    xs = [x for x, _ in road_points]
+    ys = [y for _, y in road_points]
+    zs = system.get_elevations(xs, ys, config, dem=dem, transformer=transformer)
+    if HAS_NUMPY:
+        zs = np.asarray(zs, dtype=np.float64).tolist()
 
-    return result
+    return [(x, y, z) for x, y, z in zip(xs, ys, zs)]
 
 
 __all__ = [
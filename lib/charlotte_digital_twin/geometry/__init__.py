@@ -107,6 +107,8 @@ from .road_processor import (
     RoadNode,
     Intersection,
     RoadNetworkProcessor,
+    CoordinateSpatialHash,
+    benchmark_road_processor,
 )
 
 # Road geometry
@@ -180,6 +182,8 @@ __all__ = [
     "CoordinateTransformer",
     "ScaleManager",
     "RoadNetworkProcessor",
+    "CoordinateSpatialHash",
+    "benchmark_road_processor",
     "RoadGeometryGenerator",
     "RoadMaterialMapper",
     "RoadUVGenerator",
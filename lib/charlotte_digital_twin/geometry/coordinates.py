@@ -19,10 +19,19 @@ Usage:
     # Convert multiple coordinates
     coords = [(35.2280, -80.8420), (35.2290, -80.8410)]
     world_coords = transformer.latlon_to_world_batch(coords)
+
+    # Convert large vertex arrays without per-point objects (requires NumPy)
+    world_array = transformer.latlon_to_world_array(np.array(coords))
 """
 
 import math
-from typing import List, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 from .types import (
     GeometryConfig,
@@ -143,6 +152,15 @@ class CoordinateTransformer:
         Returns:
             List of WorldCoordinate objects
         """
+        if HAS_NUMPY and len(coords):
+            try:
+                array = _as_coordinate_array(coords)
+            except ValueError:
+                array = None  # Mixed 2- and 3-tuples
+            if array is not None:
+                world = self.latlon_to_world_array(array)
+                return [WorldCoordinate(x, y, z) for x, y, z in world.tolist()]
+
         results = []
         for coord in coords:
             if len(coord) == 2:
@@ -153,6 +171,38 @@ class CoordinateTransformer:
             results.append(self.latlon_to_world(lat, lon, elevation))
         return results
 
+    def latlon_to_world_array(self, coords: Any, dtype: Any = None) -> "np.ndarray":
+        """
+        Convert an array of lat/lon points to world coordinates.
+
+        Vectorized equivalent of latlon_to_world that creates no
+        per-point objects.
+
+        Args:
+            coords: Array of shape (N, 2) as (lat, lon) or (N, 3) as
+                (lat, lon, elevation)
+            dtype: Output dtype (default float64)
+
+        Returns:
+            C-contiguous array of shape (N, 3) with x, y, z
+        """
+        array = _as_coordinate_array(coords)
+        scale = self.config.scale
+
+        world = np.empty((len(array), 3), dtype=np.float64)
+        world[:, 0] = (array[:, 1] - self.origin.lon) * self._meters_per_deg_lon * scale
+        world[:, 1] = (array[:, 0] - self.origin.lat) * self._meters_per_deg_lat * scale
+
+        if self.config.flatten_to_plane or array.shape[1] == 2:
+            world[:, 2] = self.config.z_offset
+        else:
+            # Zero elevation means "unknown", as in latlon_to_world
+            elevation = array[:, 2]
+            z = np.where(elevation != 0, elevation - self.origin.elevation, 0.0)
+            world[:, 2] = z * scale + self.config.z_offset
+
+        return np.ascontiguousarray(world, dtype=dtype or np.float64)
+
     def world_to_latlon(
         self,
         x: float,
@@ -188,6 +238,29 @@ class CoordinateTransformer:
 
         return GeoCoordinate(lat, lon, elevation)
 
+    def world_to_latlon_array(self, points: Any, dtype: Any = None) -> "np.ndarray":
+        """
+        Convert an array of world coordinates back to lat/lon.
+
+        Args:
+            points: Array of shape (N, 2) as (x, y) or (N, 3) as (x, y, z)
+            dtype: Output dtype (default float64)
+
+        Returns:
+            C-contiguous array of shape (N, 3) with lat, lon, elevation
+        """
+        array = _as_coordinate_array(points, "points")
+        scale = self.config.scale
+
+        geo = np.empty((len(array), 3), dtype=np.float64)
+        geo[:, 0] = self.origin.lat + array[:, 1] / scale / self._meters_per_deg_lat
+        geo[:, 1] = self.origin.lon + array[:, 0] / scale / self._meters_per_deg_lon
+
+        z = array[:, 2] if array.shape[1] == 3 else 0.0
+        geo[:, 2] = (z - self.config.z_offset) / scale + self.origin.elevation
+
+        return np.ascontiguousarray(geo, dtype=dtype or np.float64)
+
     def _latlon_to_utm(
         self,
         lat: float,
@@ -207,56 +280,12 @@ class CoordinateTransformer:
         Returns:
             UTMCoordinate with easting, northing, zone, hemisphere
         """
-        # Convert to radians
-        lat_rad = lat * self.DEG_TO_RAD
-        lon_rad = lon * self.DEG_TO_RAD
-
-        # UTM parameters
-        k0 = 0.9996  # Scale factor
-
-        # Reference meridian for zone
-        lon0 = (zone - 1) * 6 - 180 + 3  # Central meridian
-        lon0_rad = lon0 * self.DEG_TO_RAD
-
-        # Ellipsoid parameters
-        a = self.EARTH_RADIUS_M
-        f = self.EARTH_FLATTENING
-        e = math.sqrt(2 * f - f * f)  # Eccentricity
-
-        # Prime vertical radius of curvature
-        N = a / math.sqrt(1 - e * e * math.sin(lat_rad) ** 2)
-
-        # Tangent of latitude
-        T = math.tan(lat_rad) ** 2
-
-        # Param C
-        C = e * e * math.cos(lat_rad) ** 2 / (1 - e * e)
-
-        # Longitude difference
-        A = (lon_rad - lon0_rad) * math.cos(lat_rad)
-
-        # M - true distance along central meridian from equator to lat
-        M = a * (
-            (1 - e * e / 4 - 3 * e ** 4 / 64 - 5 * e ** 6 / 256) * lat_rad
-            - (3 * e * e / 8 + 3 * e ** 4 / 32 + 45 * e ** 6 / 1024) * math.sin(2 * lat_rad)
-            + (15 * e ** 4 / 256 + 45 * e ** 6 / 1024) * math.sin(4 * lat_rad)
-            - (35 * e ** 6 / 3072) * math.sin(6 * lat_rad)
-        )
-
-        # UTM coordinates
-        easting = k0 * N * (
-            A
-            + (1 - T + C) * A ** 3 / 6
-            + (5 - 18 * T + T ** 2 + 72 * C - 58 * e ** 2) * A ** 5 / 120
-        ) + 500000  # False easting
-
-        northing = k0 * (
-            M
-            + N * math.tan(lat_rad) * (
-                A ** 2 / 2
-                + (5 - T + 9 * C + 4 * C ** 2) * A ** 4 / 24
-                + (61 - 58 * T + T ** 2 + 600 * C - 330 * e ** 2) * A ** 6 / 720
-            )
+        easting, northing = _utm_forward(
+            lat * self.DEG_TO_RAD,
+            lon * self.DEG_TO_RAD,
+            zone,
+            self.EARTH_RADIUS_M,
+            self.EARTH_FLATTENING,
         )
 
         # Southern hemisphere adjustment
@@ -286,69 +315,78 @@ class CoordinateTransformer:
         Returns:
             GeoCoordinate with lat, lon, elevation
         """
-        # UTM parameters
-        k0 = 0.9996
-
-        # Ellipsoid parameters
-        a = self.EARTH_RADIUS_M
-        f = self.EARTH_FLATTENING
-        e = math.sqrt(2 * f - f * f)
-
-        # Reference meridian
-        lon0 = (zone - 1) * 6 - 180 + 3
-
         # Adjust for southern hemisphere
         y = northing
         if hemisphere == "S":
             y -= 10000000
 
-        # Calculate footpoint latitude
-        e1 = (1 - math.sqrt(1 - e * e)) / (1 + math.sqrt(1 - e * e))
-        M = y / k0
-        mu = M / (a * (1 - e * e / 4 - 3 * e ** 4 / 64 - 5 * e ** 6 / 256))
-
-        phi1 = mu + (
-            3 * e1 / 2 - 27 * e1 ** 3 / 32
-        ) * math.sin(2 * mu) + (
-            21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32
-        ) * math.sin(4 * mu) + (
-            151 * e1 ** 3 / 96
-        ) * math.sin(6 * mu) + (
-            1097 * e1 ** 4 / 512
-        ) * math.sin(8 * mu)
-
-        phi1_rad = phi1
-
-        # Calculate other terms
-        N1 = a / math.sqrt(1 - e * e * math.sin(phi1_rad) ** 2)
-        T1 = math.tan(phi1_rad) ** 2
-        C1 = e * e * math.cos(phi1_rad) ** 2 / (1 - e * e)
-        R1 = a * (1 - e * e) / (1 - e * e * math.sin(phi1_rad) ** 2) ** 1.5
-        D = (easting - 500000) / (N1 * k0)
-
-        # Calculate latitude
-        lat = phi1_rad - (
-            N1 * math.tan(phi1_rad) / R1
-        ) * (
-            D ** 2 / 2
-            - (5 + 3 * T1 + 10 * C1 - 4 * C1 ** 2 - 9 * e * e) * D ** 4 / 24
-            + (61 + 90 * T1 + 298 * C1 + 45 * T1 ** 2 - 252 * e * e - 3 * C1 ** 2) * D ** 6 / 720
+        lat_deg, lon_deg = _utm_inverse(
+            easting, y, zone, self.EARTH_RADIUS_M, self.EARTH_FLATTENING
         )
 
-        # Calculate longitude
-        lon = (
-            D
-            - (1 + 2 * T1 + C1) * D ** 3 / 6
-            + (5 - 2 * C1 + 28 * T1 - 3 * C1 ** 2 + 8 * e * e + 24 * T1 ** 2) * D ** 5 / 120
-        ) / math.cos(phi1_rad)
+        return GeoCoordinate(lat_deg, lon_deg, 0.0)
 
-        lon += lon0 * self.DEG_TO_RAD
+    def latlon_to_utm_array(self, coords: Any, zone: Optional[int] = None, dtype: Any = None) -> "np.ndarray":
+        """
+        Convert an array of lat/lon points to UTM coordinates.
 
-        # Convert to degrees
-        lat_deg = lat * self.RAD_TO_DEG
-        lon_deg = lon * self.RAD_TO_DEG
+        Points south of the equator get the southern false northing,
+        matching the scalar conversion.
 
-        return GeoCoordinate(lat_deg, lon_deg, 0.0)
+        Args:
+            coords: Array of shape (N, 2) or (N, 3) starting with (lat, lon)
+            zone: UTM zone number (default: origin zone)
+            dtype: Output dtype (default float64)
+
+        Returns:
+            C-contiguous array of shape (N, 2) with easting, northing
+        """
+        array = _as_coordinate_array(coords)
+        zone = self.origin.utm_zone if zone is None else zone
+
+        easting, northing = _utm_forward(
+            array[:, 0] * self.DEG_TO_RAD,
+            array[:, 1] * self.DEG_TO_RAD,
+            zone,
+            self.EARTH_RADIUS_M,
+            self.EARTH_FLATTENING,
+            np,
+        )
+        northing = np.where(array[:, 0] < 0, northing + 10000000, northing)
+
+        return np.ascontiguousarray(np.column_stack((easting, northing)), dtype=dtype or np.float64)
+
+    def utm_to_latlon_array(
+        self,
+        points: Any,
+        zone: Optional[int] = None,
+        hemisphere: str = "N",
+        dtype: Any = None,
+    ) -> "np.ndarray":
+        """
+        Convert an array of UTM coordinates to lat/lon.
+
+        Args:
+            points: Array of shape (N, 2) with easting, northing
+            zone: UTM zone number (default: origin zone)
+            hemisphere: N or S
+            dtype: Output dtype (default float64)
+
+        Returns:
+            C-contiguous array of shape (N, 2) with lat, lon
+        """
+        array = _as_coordinate_array(points, "points")
+        zone = self.origin.utm_zone if zone is None else zone
+
+        y = array[:, 1]
+        if hemisphere == "S":
+            y = y - 10000000
+
+        lat, lon = _utm_inverse(
+            array[:, 0], y, zone, self.EARTH_RADIUS_M, self.EARTH_FLATTENING, np
+        )
+
+        return np.ascontiguousarray(np.column_stack((lat, lon)), dtype=dtype or np.float64)
 
     def get_distance_meters(
         self,
@@ -416,6 +454,215 @@ class CoordinateTransformer:
         # Normalize to 0-360
         return (bearing + 360) % 360
 
+    def distance_meters_array(self, start: Any, end: Any) -> "np.ndarray":
+        """
+        Calculate Haversine distances between arrays of lat/lon points.
+
+        Args:
+            start: Array of shape (N, 2) or (1, 2) with (lat, lon)
+            end: Array of shape (N, 2) or (1, 2) with (lat, lon)
+
+        Returns:
+            Array of N distances in meters
+        """
+        start = _as_coordinate_array(start, "start")
+        end = _as_coordinate_array(end, "end")
+
+        lat1_rad = start[:, 0] * self.DEG_TO_RAD
+        lat2_rad = end[:, 0] * self.DEG_TO_RAD
+        delta_lat = (end[:, 0] - start[:, 0]) * self.DEG_TO_RAD
+        delta_lon = (end[:, 1] - start[:, 1]) * self.DEG_TO_RAD
+
+        a = (
+            np.sin(delta_lat / 2) ** 2 +
+            np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(delta_lon / 2) ** 2
+        )
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+        return self.EARTH_RADIUS_M * c
+
+    def bearing_degrees_array(self, start: Any, end: Any) -> "np.ndarray":
+        """
+        Calculate bearings between arrays of lat/lon points.
+
+        Args:
+            start: Array of shape (N, 2) or (1, 2) with (lat, lon)
+            end: Array of shape (N, 2) or (1, 2) with (lat, lon)
+
+        Returns:
+            Array of N bearings in degrees (0 = North, 90 = East)
+        """
+        start = _as_coordinate_array(start, "start")
+        end = _as_coordinate_array(end, "end")
+
+        lat1_rad = start[:, 0] * self.DEG_TO_RAD
+        lat2_rad = end[:, 0] * self.DEG_TO_RAD
+        delta_lon = (end[:, 1] - start[:, 1]) * self.DEG_TO_RAD
+
+        x = np.sin(delta_lon) * np.cos(lat2_rad)
+        y = np.cos(lat1_rad) * np.sin(lat2_rad) - \
+            np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(delta_lon)
+
+        bearing = np.arctan2(x, y) * self.RAD_TO_DEG
+
+        return (bearing + 360) % 360
+
+
+def _as_coordinate_array(coords: Any, name: str = "coords") -> "np.ndarray":
+    """
+    Validate an Nx2 or Nx3 coordinate array.
+
+    Args:
+        coords: Array-like of shape (N, 2) or (N, 3)
+        name: Argument name used in error messages
+
+    Returns:
+        float64 array of shape (N, 2) or (N, 3)
+
+    Raises:
+        ImportError: If NumPy is not installed
+        ValueError: If the array has the wrong shape
+    """
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for array coordinate transforms")
+
+    array = np.asarray(coords, dtype=np.float64)
+    if array.size == 0:
+        return array.reshape(0, 2)
+    if array.ndim != 2 or array.shape[1] not in (2, 3):
+        raise ValueError(f"{name} must have shape (N, 2) or (N, 3), got {array.shape}")
+    return array
+
+
+def _utm_forward(lat_rad: Any, lon_rad: Any, zone: int, a: float, f: float, xp: Any = math) -> Tuple[Any, Any]:
+    """
+    UTM projection series shared by the scalar and array transforms.
+
+    Args:
+        lat_rad: Latitude in radians (float or array)
+        lon_rad: Longitude in radians (float or array)
+        zone: UTM zone number
+        a: Ellipsoid semi-major axis
+        f: Ellipsoid flattening
+        xp: Math namespace (math or numpy)
+
+    Returns:
+        Tuple of (easting, northing) without the southern false northing
+    """
+    k0 = 0.9996  # Scale factor
+
+    # Reference meridian for zone
+    lon0 = (zone - 1) * 6 - 180 + 3  # Central meridian
+    lon0_rad = lon0 * CoordinateTransformer.DEG_TO_RAD
+
+    e = math.sqrt(2 * f - f * f)  # Eccentricity
+
+    # Prime vertical radius of curvature
+    N = a / xp.sqrt(1 - e * e * xp.sin(lat_rad) ** 2)
+
+    # Tangent of latitude
+    T = xp.tan(lat_rad) ** 2
+
+    # Param C
+    C = e * e * xp.cos(lat_rad) ** 2 / (1 - e * e)
+
+    # Longitude difference
+    A = (lon_rad - lon0_rad) * xp.cos(lat_rad)
+
+    # M - true distance along central meridian from equator to lat
+    M = a * (
+        (1 - e * e / 4 - 3 * e ** 4 / 64 - 5 * e ** 6 / 256) * lat_rad
+        - (3 * e * e / 8 + 3 * e ** 4 / 32 + 45 * e ** 6 / 1024) * xp.sin(2 * lat_rad)
+        + (15 * e ** 4 / 256 + 45 * e ** 6 / 1024) * xp.sin(4 * lat_rad)
+        - (35 * e ** 6 / 3072) * xp.sin(6 * lat_rad)
+    )
+
+    # UTM coordinates
+    easting = k0 * N * (
+        A
+        + (1 - T + C) * A ** 3 / 6
+        + (5 - 18 * T + T ** 2 + 72 * C - 58 * e ** 2) * A ** 5 / 120
+    ) + 500000  # False easting
+
+    northing = k0 * (
+        M
+        + N * xp.tan(lat_rad) * (
+            A ** 2 / 2
+            + (5 - T + 9 * C + 4 * C ** 2) * A ** 4 / 24
+            + (61 - 58 * T + T ** 2 + 600 * C - 330 * e ** 2) * A ** 6 / 720
+        )
+    )
+
+    return easting, northing
+
+
+def _utm_inverse(easting: Any, y: Any, zone: int, a: float, f: float, xp: Any = math) -> Tuple[Any, Any]:
+    """
+    Inverse UTM series shared by the scalar and array transforms.
+
+    Args:
+        easting: UTM easting in meters (float or array)
+        y: Northing with the southern false northing removed
+        zone: UTM zone number
+        a: Ellipsoid semi-major axis
+        f: Ellipsoid flattening
+        xp: Math namespace (math or numpy)
+
+    Returns:
+        Tuple of (lat, lon) in degrees
+    """
+    k0 = 0.9996
+
+    e = math.sqrt(2 * f - f * f)
+
+    # Reference meridian
+    lon0 = (zone - 1) * 6 - 180 + 3
+
+    # Calculate footpoint latitude
+    e1 = (1 - math.sqrt(1 - e * e)) / (1 + math.sqrt(1 - e * e))
+    M = y / k0
+    mu = M / (a * (1 - e * e / 4 - 3 * e ** 4 / 64 - 5 * e ** 6 / 256))
+
+    phi1 = mu + (
+        3 * e1 / 2 - 27 * e1 ** 3 / 32
+    ) * xp.sin(2 * mu) + (
+        21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32
+    ) * xp.sin(4 * mu) + (
+        151 * e1 ** 3 / 96
+    ) * xp.sin(6 * mu) + (
+        1097 * e1 ** 4 / 512
+    ) * xp.sin(8 * mu)
+
+    phi1_rad = phi1
+
+    # Calculate other terms
+    N1 = a / xp.sqrt(1 - e * e * xp.sin(phi1_rad) ** 2)
+    T1 = xp.tan(phi1_rad) ** 2
+    C1 = e * e * xp.cos(phi1_rad) ** 2 / (1 - e * e)
+    R1 = a * (1 - e * e) / (1 - e * e * xp.sin(phi1_rad) ** 2) ** 1.5
+    D = (easting - 500000) / (N1 * k0)
+
+    # Calculate latitude
+    lat = phi1_rad - (
+        N1 * xp.tan(phi1_rad) / R1
+    ) * (
+        D ** 2 / 2
+        - (5 + 3 * T1 + 10 * C1 - 4 * C1 ** 2 - 9 * e * e) * D ** 4 / 24
+        + (61 + 90 * T1 + 298 * C1 + 45 * T1 ** 2 - 252 * e * e - 3 * C1 ** 2) * D ** 6 / 720
+    )
+
+    # Calculate longitude
+    lon = (
+        D
+        - (1 + 2 * T1 + C1) * D ** 3 / 6
+        + (5 - 2 * C1 + 28 * T1 - 3 * C1 ** 2 + 8 * e * e + 24 * T1 ** 2) * D ** 5 / 120
+    ) / xp.cos(phi1_rad)
+
+    lon += lon0 * CoordinateTransformer.DEG_TO_RAD
+
+    # Convert to degrees
+    return lat * CoordinateTransformer.RAD_TO_DEG, lon * CoordinateTransformer.RAD_TO_DEG
+
 
 # Preset origins for Charlotte landmarks
 CHARLOTTE_ORIGINS = {
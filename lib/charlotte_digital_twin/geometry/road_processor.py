@@ -20,7 +20,10 @@ Usage:
     curves = processor.create_blender_curves(segments)
 """
 
+import json
 import math
+import time
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
@@ -35,6 +38,86 @@ from .types import (
 )
 from .coordinates import CoordinateTransformer
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Coordinates closer than this (meters, per axis) share a network node
+INTERSECTION_TOLERANCE = 0.01
+
+# Bundled footprints used by the real-data benchmark
+CHARLOTTE_BUILDINGS_GEOJSON = (
+    Path(__file__).resolve().parent.parent / "data" / "charlotte_buildings_named.geojson"
+)
+
+
+class CoordinateSpatialHash:
+    """
+    Uniform grid over quantized world coordinates.
+
+    Cells are one tolerance wide, so every point within tolerance of a
+    query lies in the query cell or one of its eight neighbours. Lookups
+    return the earliest inserted match, mirroring a first-match scan.
+    """
+
+    def __init__(self, tolerance: float = INTERSECTION_TOLERANCE):
+        """
+        Initialize spatial hash.
+
+        Args:
+            tolerance: Per-axis match distance in meters (also the cell size)
+        """
+        self.tolerance = tolerance
+        self._cells: Dict[Tuple[int, int], List[Tuple[int, int, float, float]]] = defaultdict(list)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.tolerance), math.floor(y / self.tolerance))
+
+    def insert(self, key: int, x: float, y: float) -> None:
+        """
+        Add a point.
+
+        Args:
+            key: Identifier returned by find()
+            x, y: World coordinates
+        """
+        self._cells[self._cell(x, y)].append((self._count, key, x, y))
+        self._count += 1
+
+    def find(self, x: float, y: float) -> Optional[int]:
+        """
+        Find the first inserted point within tolerance.
+
+        Args:
+            x, y: World coordinates
+
+        Returns:
+            Key of the matching point, or None
+        """
+        tol = self.tolerance
+        cx, cy = math.floor(x / tol), math.floor(y / tol)
+        best: Optional[Tuple[int, int]] = None
+
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                cell = self._cells.get((cx + dx, cy + dy))
+                if not cell:
+                    continue
+                for order, key, px, py in cell:
+                    if abs(px - x) < tol and abs(py - y) < tol:
+                        if best is None or order < best[0]:
+                            best = (order, key)
+                        break  # Cells are in insertion order
+
+        return best[1] if best else None
+
 
 @dataclass
 class RoadNode:
@@ -86,6 +169,8 @@ class RoadNetworkProcessor:
         self._nodes: Dict[int, RoadNode] = {}
         self._segments: List[RoadSegment] = []
         self._intersections: Dict[int, Intersection] = {}
+        self._segment_node_ids: Dict[int, List[int]] = {}
+        self._node_segments: Dict[int, List[int]] = {}
 
     def process(self, osm_data: Any) -> List[RoadSegment]:
         """
@@ -101,16 +186,37 @@ class RoadNetworkProcessor:
         self._nodes = {}
         self._segments = []
         self._intersections = {}
+        self._segment_node_ids = {}
+        self._node_segments = {}
 
         # Build node lookup with world coordinates
-        for node_id, node in osm_data.nodes.items():
-            world = self.transformer.latlon_to_world(node.lat, node.lon)
-            self._nodes[node_id] = RoadNode(
-                node_id=node_id,
-                lat=node.lat,
-                lon=node.lon,
-                world_coord=world,
-            )
+        nodes = osm_data.nodes
+        if HAS_NUMPY and nodes:
+            # One vectorized transform instead of one call per node
+            if hasattr(nodes, "latlon_array"):
+                latlon = nodes.latlon_array()  # Columnar NodeStore
+            else:
+                latlon = np.fromiter(
+                    (v for node in nodes.values() for v in (node.lat, node.lon)),
+                    dtype=np.float64,
+                    count=2 * len(nodes),
+                ).reshape(-1, 2)
+            world = self.transformer.latlon_to_world_array(latlon)
+            for node_id, (lat, lon), (x, y, z) in zip(nodes, latlon.tolist(), world.tolist()):
+                self._nodes[node_id] = RoadNode(
+                    node_id=node_id,
+                    lat=lat,
+                    lon=lon,
+                    world_coord=WorldCoordinate(x, y, z),
+                )
+        else:
+            for node_id, node in nodes.items():
+                self._nodes[node_id] = RoadNode(
+                    node_id=node_id,
+                    lat=node.lat,
+                    lon=node.lon,
+                    world_coord=self.transformer.latlon_to_world(node.lat, node.lon),
+                )
 
         # Process ways to extract roads
         for way_id, way in osm_data.ways.items():
@@ -147,15 +253,20 @@ class RoadNetworkProcessor:
 
         # Get world coordinates for all nodes
         coords = []
+        node_ids = []
         for node_id in way.node_ids:
             if node_id in self._nodes:
                 node = self._nodes[node_id]
                 if node.world_coord:
                     coords.append(node.world_coord)
+                    node_ids.append(node_id)
 
         if len(coords) < 2:
             return None
 
+        # Remember which OSM nodes the coordinates came from
+        self._segment_node_ids[way_id] = node_ids
+
         # Get road properties from tags
         tags = way.tags
 
@@ -198,38 +309,68 @@ class RoadNetworkProcessor:
         )
 
     def _detect_intersections(self) -> None:
-        """Detect road intersections from shared nodes."""
-        # Count how many roads use each node
+        """
+        Detect road intersections from shared nodes.
+
+        Builds the node -> segment adjacency in one pass over segment
+        coordinates. Coordinates map to the first node (in node order)
+        within INTERSECTION_TOLERANCE, found through a spatial hash;
+        OSM node IDs recorded for a segment are resolved the same way,
+        so coincident duplicate nodes still join.
+        """
+        spatial = CoordinateSpatialHash(INTERSECTION_TOLERANCE)
+        for node_id, node in self._nodes.items():
+            if node.world_coord:
+                spatial.insert(node_id, node.world_coord.x, node.world_coord.y)
+
+        canonical: Dict[int, Optional[int]] = {}
         node_usage: Dict[int, List[int]] = defaultdict(list)
+        segment_types = {segment.osm_id: segment.road_type for segment in self._segments}
 
         for segment in self._segments:
+            node_ids = self._segment_node_ids.get(segment.osm_id)
+            if node_ids is not None and len(node_ids) != len(segment.coordinates):
+                node_ids = None
+
             for coord_idx, coord in enumerate(segment.coordinates):
-                # Find node ID for this coordinate
-                for node_id, node in self._nodes.items():
-                    if node.world_coord:
-                        if (abs(node.world_coord.x - coord.x) < 0.01 and
-                            abs(node.world_coord.y - coord.y) < 0.01):
-                            node_usage[node_id].append(segment.osm_id)
-                            node.connections.append(segment.osm_id)
-                            break
+                if node_ids is not None:
+                    osm_node = node_ids[coord_idx]
+                    if osm_node not in canonical:
+                        canonical[osm_node] = spatial.find(coord.x, coord.y)
+                    node_id = canonical[osm_node]
+                else:
+                    node_id = spatial.find(coord.x, coord.y)
+
+                if node_id is None:
+                    continue
+
+                node_usage[node_id].append(segment.osm_id)
+                self._nodes[node_id].connections.append(segment.osm_id)
+
+        self._node_segments = dict(node_usage)
 
         # Nodes used by multiple roads are intersections
         for node_id, road_ids in node_usage.items():
-            if len(set(road_ids)) > 1:
+            if len(road_ids) < 2:
+                continue
+            unique_roads = list(dict.fromkeys(road_ids))
+            if len(unique_roads) > 1:
                 node = self._nodes[node_id]
-                if node.world_coord:
-                    # Get unique road types
-                    road_types = set()
-                    for segment in self._segments:
-                        if segment.osm_id in road_ids:
-                            road_types.add(segment.road_type)
-
-                    self._intersections[node_id] = Intersection(
-                        node_id=node_id,
-                        position=node.world_coord,
-                        roads=list(set(road_ids)),
-                        road_types=road_types,
-                    )
+                self._intersections[node_id] = Intersection(
+                    node_id=node_id,
+                    position=node.world_coord,
+                    roads=unique_roads,
+                    road_types={segment_types[r] for r in unique_roads},
+                )
+
+    def get_node_adjacency(self) -> Dict[int, List[int]]:
+        """
+        Get the node -> road segment adjacency.
+
+        Returns:
+            Mapping of node ID to the OSM IDs of segments passing through it
+        """
+        return self._node_segments
 
     def get_intersections(self) -> List[Intersection]:
         """Get all detected intersections."""
@@ -346,8 +487,164 @@ class RoadNetworkProcessor:
         return stats
 
 
+def synthetic_road_network(num_ways: int = 100_000, shape_points: int = 2) -> Any:
+    """
+    Generate a synthetic grid road network.
+
+    Ways run between neighbouring grid nodes, so every interior grid
+    node is a four-way intersection. Each way has extra shape points.
+
+    Args:
+        num_ways: Approximate number of ways
+        shape_points: Intermediate nodes per way
+
+    Returns:
+        OSMData with nodes and highway ways
+    """
+    from ..data_acquisition.osm_downloader import OSMData, OSMNode, OSMWay
+
+    grid = max(2, int(math.ceil((1 + math.sqrt(1 + 2 * num_ways)) / 2)))
+    spacing = 0.001  # degrees, ~100 m
+    origin_lat, origin_lon = 35.2271, -80.8431
+    data = OSMData(source="synthetic")
+
+    def grid_id(row: int, col: int) -> int:
+        return row * grid + col + 1
+
+    for row in range(grid):
+        for col in range(grid):
+            node_id = grid_id(row, col)
+            data.nodes[node_id] = OSMNode(
+                id=node_id,
+                lat=origin_lat + row * spacing,
+                lon=origin_lon + col * spacing,
+            )
+
+    next_node = grid * grid + 1
+    road_types = ["residential", "tertiary", "secondary", "primary"]
+    way_id = 0
+    for row in range(grid):
+        for col in range(grid):
+            for d_row, d_col in ((0, 1), (1, 0)):
+                if way_id >= num_ways:
+                    break
+                end_row, end_col = row + d_row, col + d_col
+                if end_row >= grid or end_col >= grid:
+                    continue
+
+                start, end = data.nodes[grid_id(row, col)], data.nodes[grid_id(end_row, end_col)]
+                node_ids = [start.id]
+                for k in range(1, shape_points + 1):
+                    t = k / (shape_points + 1)
+                    data.nodes[next_node] = OSMNode(
+                        id=next_node,
+                        lat=start.lat + (end.lat - start.lat) * t,
+                        lon=start.lon + (end.lon - start.lon) * t,
+                    )
+                    node_ids.append(next_node)
+                    next_node += 1
+                node_ids.append(end.id)
+
+                way_id += 1
+                data.ways[way_id] = OSMWay(
+                    id=way_id,
+                    node_ids=node_ids,
+                    tags={"highway": road_types[(row + col) % len(road_types)]},
+                )
+
+    return data
+
+
+def osm_data_from_geojson(path: Path = CHARLOTTE_BUILDINGS_GEOJSON, highway: str = "service") -> Any:
+    """
+    Convert GeoJSON polygon/line features into OSM-style ways.
+
+    Vertices with identical lat/lon become one node, so features sharing
+    vertices (adjacent footprints) share nodes. Used to exercise the
+    processor on real Charlotte geometry.
+
+    Args:
+        path: GeoJSON file
+        highway: Highway tag assigned to every way
+
+    Returns:
+        OSMData with nodes and ways
+    """
+    from ..data_acquisition.osm_downloader import OSMData, OSMNode, OSMWay
+
+    with open(path) as f:
+        features = json.load(f).get("features", [])
+
+    data = OSMData(source=str(path))
+    node_lookup: Dict[Tuple[float, float], int] = {}
+
+    for way_id, feature in enumerate(features, start=1):
+        geometry = feature.get("geometry") or {}
+        rings = geometry.get("coordinates") or []
+        if geometry.get("type") == "Polygon":
+            rings = rings[:1]
+        elif geometry.get("type") == "LineString":
+            rings = [rings]
+        else:
+            continue
+
+        for ring in rings:
+            node_ids = []
+            for lon, lat, *_ in ring:
+                node_id = node_lookup.get((lat, lon))
+                if node_id is None:
+                    node_id = len(node_lookup) + 1
+                    node_lookup[(lat, lon)] = node_id
+                    data.nodes[node_id] = OSMNode(id=node_id, lat=lat, lon=lon)
+                node_ids.append(node_id)
+            data.ways[way_id] = OSMWay(id=way_id, node_ids=node_ids, tags={"highway": highway})
+
+    return data
+
+
+def benchmark_road_processor(osm_data: Any = None, num_ways: int = 100_000) -> Dict[str, Any]:
+    """
+    Time road processing and intersection detection.
+
+    Args:
+        osm_data: OSMData to process (default: synthetic_road_network(num_ways))
+        num_ways: Ways in the synthetic network when osm_data is None
+
+    Returns:
+        Dictionary with counts and timings in seconds
+    """
+    if osm_data is None:
+        osm_data = synthetic_road_network(num_ways)
+
+    processor = RoadNetworkProcessor()
+    start = time.perf_counter()
+    processor.process(osm_data)
+    total_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    processor._intersections = {}
+    for node in processor._nodes.values():
+        node.connections = []
+    processor._detect_intersections()
+    intersection_seconds = time.perf_counter() - start
+
+    return {
+        "nodes": len(osm_data.nodes),
+        "ways": len(osm_data.ways),
+        "segments": len(processor._segments),
+        "intersections": len(processor._intersections),
+        "process_seconds": total_seconds,
+        "intersection_seconds": intersection_seconds,
+    }
+
+
 __all__ = [
     "RoadNode",
     "Intersection",
     "RoadNetworkProcessor",
+    "CoordinateSpatialHash",
+    "INTERSECTION_TOLERANCE",
+    "synthetic_road_network",
+    "osm_data_from_geojson",
+    "benchmark_road_processor",
 ]
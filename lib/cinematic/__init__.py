@@ -86,539 +86,592 @@ Quick Start:
 
     # Apply color preset
     apply_color_preset("agx_default")
+
+Public names are imported from their submodules on first access
+(PEP 562), so e.g. `import lib.cinematic.types` does not load the
+tracking, projection or follow-camera modules.
 """
 
-from .types import (
-    Transform3D,
-    CameraConfig,
-    LightConfig,
-    BackdropConfig,
-    RenderSettings,
-    ShotState,
-    PlumbBobConfig,
-    RigConfig,
-    ImperfectionConfig,
-    MultiCameraLayout,
-    # Lighting types
-    GelConfig,
-    HDRIConfig,
-    LightRigConfig,
-    # Color types
-    ColorConfig,
-    LUTConfig,
-    ExposureLockConfig,
-    # Animation types
-    AnimationConfig,
-    MotionPathConfig,
-    TurntableConfig,
-    # Composition types
-    CompositionConfig,
-    CompleteShotConfig,
-    # Composition constants
-    SHOT_SIZES,
-    LENS_BY_SHOT_SIZE,
-    FSTOP_BY_SHOT_SIZE,
-    CAMERA_ANGLES,
-    CAMERA_POSITIONS,
-    LIGHTING_RATIOS,
-    # Render types
-    CinematicRenderSettings,
-    # Support system types
-    ShuffleConfig,
-    FrameState,
-    DepthLayerConfig,
-    CompositionGuide,
-    LensFXConfig,
-)
-from .enums import (
-    LensType,
-    LightType,
-    QualityTier,
-    ColorSpace,
-    EasingType,
-    # Lighting enum
-    AreaLightShape,
-    # Color enums
-    ViewTransform,
-    WorkingColorSpace,
-    # Render enums
-    RenderEngine,
-    DenoiserType,
-    # Support system enums
-    CompositionGuideType,
-    DepthLayer,
-    LensFXType,
-)
-from .state_manager import (
-    StateManager,
-    FrameStore,
-)
-from .preset_loader import (
-    load_preset,
-    get_lens_preset,
-    get_sensor_preset,
-    get_rig_preset,
-    get_imperfection_preset,
-    list_lens_presets,
-    list_sensor_presets,
-    list_rig_presets,
-    list_imperfection_presets,
-    get_aperture_preset,
-    # Lighting preset loaders
-    get_lighting_rig_preset,
-    get_gel_preset,
-    get_hdri_preset,
-    list_lighting_rig_presets,
-    list_gel_presets,
-    list_hdri_presets,
-    # Backdrop preset loaders
-    get_infinite_curve_preset,
-    get_gradient_preset,
-    get_environment_preset,
-    list_infinite_curve_presets,
-    list_gradient_presets,
-    list_environment_presets,
-    # Color preset loaders
-    get_color_preset,
-    get_technical_lut_preset,
-    get_film_lut_preset,
-    list_color_presets,
-    list_technical_lut_presets,
-    list_film_lut_presets,
-    # Animation preset loaders
-    get_camera_move_preset,
-    get_easing_preset,
-    get_turntable_preset,
-    list_camera_move_presets,
-    list_easing_presets,
-    list_turntable_presets,
-    # Render preset loaders
-    get_quality_profile,
-    get_pass_preset,
-    get_exr_settings,
-    list_quality_profiles,
-    list_pass_presets,
-    list_exr_presets,
-    # Support system preset loaders
-    get_shuffle_preset,
-    get_lens_fx_preset,
-    get_depth_layer_preset,
-    get_composition_guide_preset,
-    list_shuffle_presets,
-    list_lens_fx_presets,
-    list_depth_layer_presets,
-    list_composition_guide_presets,
-)
-from .camera import (
-    create_camera,
-    configure_dof,
-    apply_lens_preset,
-    apply_sensor_preset,
-    get_active_camera,
-    set_active_camera,
-    delete_camera,
-    list_cameras,
-    validate_aperture,
-    set_focus_mode,
-    APERTURE_MIN,
-    APERTURE_MAX,
-    BLENDER_AVAILABLE,
-)
-from .plumb_bob import (
-    calculate_plumb_bob,
-    create_target_empty,
-    calculate_focus_distance,
-    set_camera_focus_target,
-    remove_target_empty,
-    get_or_create_target,
-    apply_plumb_bob_to_rig,
-)
-from .lenses import (
-    setup_compositor_for_lens,
-    apply_lens_imperfections,
-    get_bokeh_blade_count,
-    clear_lens_effects,
-    apply_imperfection_preset,
-    apply_bokeh_to_camera,
-)
-from .rigs import (
-    setup_camera_rig,
-    create_rig_controller,
-    clear_rig_constraints,
-    get_rig_type,
-    apply_rig_preset,
-    create_multi_camera_layout,
-    setup_multi_camera_composite,
-    render_multi_camera_composite,
-    clear_multi_camera_composite,
-)
-from .lighting import (
-    create_light,
-    create_area_light,
-    create_spot_light,
-    create_point_light,
-    create_sun_light,
-    setup_light_linking,
-    apply_lighting_rig,
-    delete_light,
-    list_lights,
-    get_light,
-    set_light_intensity,
-    set_light_color,
-    set_light_temperature,
-)
-from .gel import (
-    apply_gel,
-    create_gel_from_preset,
-    kelvin_to_rgb,
-    combine_gels,
-    list_gel_presets as list_gel_preset_names,
-)
-from .hdri import (
-    setup_hdri,
-    load_hdri_preset,
-    find_hdri_path,
-    clear_hdri,
-    get_hdri_info,
-    list_available_hdris,
-)
-from .light_rigs import (
-    create_light_rig,
-    create_three_point_soft,
-    create_three_point_hard,
-    create_product_hero,
-    create_studio_high_key,
-    create_studio_low_key,
-    position_key_light,
-    position_fill_light,
-    position_back_light,
-    list_light_rig_presets as list_rig_creator_presets,
-)
-from .light_linking import (
-    link_light_to_collection,
-    unlink_light_from_collection,
-    set_light_include_only,
-    set_light_exclude,
-    get_light_links,
-    clear_light_links,
-    get_objects_affected_by_light,
-    copy_light_linking,
-    is_light_linking_supported,
-)
-from .backdrops import (
-    create_infinite_curve,
-    create_gradient_material,
-    apply_gradient_material,
-    setup_shadow_catcher,
-    configure_render_for_shadow_catcher,
-    create_backdrop,
-    create_backdrop_from_preset,
-    delete_backdrop,
-    get_backdrop,
-)
-from .color import (
-    set_view_transform,
-    apply_color_preset,
-    get_current_color_settings,
-    reset_color_settings,
-    get_available_looks,
-    set_working_color_space,
-    validate_lut_file,
-    find_lut_path,
-    load_lut_config,
-    list_available_luts,
-    apply_lut,
-    remove_lut_nodes,
-    get_active_luts,
-    calculate_auto_exposure,
-    apply_exposure_lock,
-    set_exposure,
-    set_gamma,
-    get_exposure_range,
-    get_gamma_range,
-)
-from .shot_builder import (
-    apply_shot_preset,
-    get_shot_preset,
-    list_shot_presets,
-    list_shot_presets_by_category,
-    get_shot_preset_info,
-    get_presets_for_use_case,
-    ShotPreset,
-)
-from .animation import (
-    create_orbit_animation,
-    create_dolly_animation,
-    create_truck_animation,
-    create_crane_animation,
-    create_pan_animation,
-    create_tilt_animation,
-    create_rack_focus_animation,
-    create_push_in_animation,
-    create_turntable_animation,
-    create_animation_from_preset,
-    apply_camera_move_preset,
-    apply_turntable_preset,
-    clear_animation,
-    set_scene_frame_range,
-    apply_easing,
-)
-from .motion_path import (
-    generate_bezier_path,
-    generate_arc_path,
-    generate_orbit_path,
-    interpolate_catmull_rom,
-    create_motion_path_curve,
-    setup_camera_follow_path,
-    create_motion_path_from_config,
-    create_motion_path_from_preset,
-    calculate_path_length,
-    get_point_at_distance,
-    sample_path_uniformly,
-    remove_motion_path,
-)
-from .render import (
-    apply_quality_profile,
-    apply_render_settings,
-    configure_render_passes,
-    setup_cryptomatte,
-    setup_exr_output,
-    detect_optimal_denoiser,
-    enable_denoising,
-    set_render_engine,
-    set_resolution,
-    set_frame_range,
-    render_frame,
-    render_animation,
-    get_render_settings,
-    apply_pass_preset,
-)
-from .shuffler import (
-    generate_variations,
-    apply_variation,
-    randomize_parameter,
-)
-from .frame_store import (
-    capture_frame_state,
-    restore_frame_state,
-    compare_states,
-    save_state_to_file,
-    load_state_from_file,
-)
-from .depth_layers import (
-    organize_depth_layers,
-    assign_object_to_layer,
-    apply_layer_dof,
-    get_objects_by_layer,
-)
-from .composition import (
-    setup_composition_guides,
-    create_rule_of_thirds_overlay,
-    create_golden_ratio_overlay,
-    remove_composition_guides,
-)
-from .lens_fx import (
-    apply_lens_fx,
-    setup_bloom,
-    setup_flare,
-    setup_vignette,
-    setup_chromatic_aberration,
-    remove_lens_fx,
-)
-
-# Shot Assembly (Phase 6.8)
-from .types import ShotTemplateConfig, ShotAssemblyConfig
-from .shot import (
-    assemble_shot,
-    load_shot_yaml,
-    save_shot_state,
-    load_shot_state,
-    render_shot,
-    create_shot_from_template,
-    edit_shot,
-)
-
-# Camera Matching & Audio Sync (Phase 6.9)
-from .types import CameraMatchConfig, TrackingImportConfig, AudioSyncConfig, CameraProfile
-from .camera_match import (
-    match_camera_to_reference,
-    import_tracking_data,
-    estimate_focal_length,
-    detect_horizon_line,
-    apply_camera_profile,
-)
-from .audio_sync import (
-    load_audio,
-    place_beat_markers,
-    detect_bpm,
-    create_animation_markers,
-    get_frame_at_beat,
-    get_beat_at_frame,
-)
-
-# Testing & Benchmarking (Phase 6.10)
-from .types import IntegrationConfig, TestConfig, PerformanceConfig, BenchmarkResult
-from .testing import (
-    run_shot_test,
-    validate_shot_output,
-    compare_to_reference,
-    run_test_suite,
-)
-from .benchmark import (
-    benchmark_shot_assembly,
-    benchmark_render,
-    benchmark_animation,
-    run_all_benchmarks,
-    save_benchmark_results,
-    get_system_info,
-)
-
-# Tracking System (Phase 7.0)
-from .tracking.types import (
-    TrackData, SolveData, SolveReport, FootageMetadata, FootageInfo, TrackingSession
-)
-from .tracking.footage import (
-    extract_metadata, analyze_footage, get_frame_rate
-)
-from .tracking.import_export import (
-    convert_yup_to_zup_position, convert_yup_to_zup_rotation,
-    fov_to_focal_length, import_nuke_chan, import_tracking_data
-)
-from .tracking.session_manager import TrackingSessionManager
-
-# Phase 7.4: Compositing Integration
-from .tracking.compositor import (
-    CompositeConfig,
-    create_stabilization_nodes,
-    create_corner_pin_nodes,
-    create_alpha_over_composite,
-    create_shadow_composite,
-    load_composite_preset,
-    clear_compositor_tree,
-)
-from .tracking.session import (
-    SessionStatus,
-    create_session,
-    resume_tracking,
-    load_session,
-    list_sessions,
-    get_session_status,
-)
-from .tracking.shot_integration import (
-    FootageConfig,
-    TrackingShotConfig,
-    CompositeShotConfig,
-    assemble_shot_with_tracking,
-    setup_tracked_shot,
-    apply_solved_camera,
-    setup_shot_compositing,
-    load_tracking_shot_yaml,
-    validate_tracking_shot_config,
-)
-
-# Batch Processing (Phase 7.5)
-from .batch import (
-    BatchProcessor,
-    BatchCheckpoint,
-    create_batch_from_directory,
-    generate_batch_report,
-    run_batch,
-)
-
-# Object Tracking (Phase 7.5)
-from .tracking.object_tracker import (
-    PlanarTracker, KnobTracker, RigidBodyTracker, FaderTracker, ObjectTracker
-)
-from .tracking.types import (
-    CornerPinData, PlanarTrack, RotationCurve, RigidBodySolve
-)
-
-# Scan Import (Phase 7.5)
-from .tracking.scan_import import (
-    PLYParser, OBJParser, FloorDetector, ScaleDetector, ScanImporter,
-    import_polycam, import_reality_scan, SCAN_FORMATS
-)
-from .tracking.types import FloorPlane, ScaleCalibration, ScanData
-
-# Mocap Import (Phase 7.5)
-from .tracking.mocap import (
-    MocapImporter, MocapRetargeter, ButtonPressDetector, PressEvent,
-    HAND_BONE_NAMES, import_move_ai, import_rokoko
-)
-from .tracking.types import (
-    JointTransform, BoneChannel, MocapData, FingerData, HandFrame, HandAnimation
-)
-
-# Batch Types (from tracking.types)
-from .tracking.types import BatchJob, BatchConfig, BatchResult
-
-# Camera Control System (Unified API)
-from .camera_control import (
-    CameraController,
-    CameraType,
-    RigType,
-    ShakeProfile,
-    MultiCameraController,
-    ShakeConfig,
-    ZoomConfig,
-    FocusPullConfig,
-    CameraState,
-    SHAKE_PROFILES,
-)
-
-# GN Camera Control
-from .gn_camera_control import (
-    GNCameraController,
-    GNCameraNodeTree,
-    ShakeType,
-    FollowMode,
-    ShakeLayer,
-    GNCameraConfig,
-    create_shake_camera,
-    create_follow_orbit_camera,
-    get_shake_node_spec,
-    get_orbit_node_spec,
-    get_follow_node_spec,
-)
-
-# Object Tracking & Follow Focus (Phase 6.2)
-from .tracking_types import (
-    SolveMethod,
-    ExportFormat,
-    TrackingMarker,
-    TrackingData,
-    TrackingConfig,
-    FollowFocusRig,
-    TrackingExportResult,
-)
-from .tracking_solver import (
-    solve_marker_position,
-    solve_tracking_data,
-    calculate_velocities,
-    calculate_accelerations,
-    interpolate_position,
-    predict_position,
-    apply_smoothing,
-    apply_gaussian_smoothing,
-)
-from .follow_focus import (
-    calculate_focus_distance as ff_calculate_focus_distance,
-    create_follow_focus_rig,
-    animate_focus_distance,
-    set_focus_mode,
-    create_focus_target_empty,
-    link_camera_to_focus_target,
-    animate_focus_target,
-    get_camera_focus_info,
-    remove_follow_focus_animation,
-)
-from .tracking_export import (
-    export_tracking_json,
-    export_tracking_ae,
-    export_tracking_nuke,
-    export_tracking_blender,
-    export_tracking,
-)
+import importlib
+
+# Public names by submodule, imported on first attribute access
+_LAZY_IMPORTS = {
+    ".types": [
+        "Transform3D",
+        "CameraConfig",
+        "LightConfig",
+        "BackdropConfig",
+        "RenderSettings",
+        "ShotState",
+        "PlumbBobConfig",
+        "RigConfig",
+        "ImperfectionConfig",
+        "MultiCameraLayout",
+        # Lighting types
+        "GelConfig",
+        "HDRIConfig",
+        "LightRigConfig",
+        # Color types
+        "ColorConfig",
+        "LUTConfig",
+        "ExposureLockConfig",
+        # Animation types
+        "AnimationConfig",
+        "MotionPathConfig",
+        "TurntableConfig",
+        # Composition types
+        "CompositionConfig",
+        "CompleteShotConfig",
+        # Composition constants
+        "SHOT_SIZES",
+        "LENS_BY_SHOT_SIZE",
+        "FSTOP_BY_SHOT_SIZE",
+        "CAMERA_ANGLES",
+        "CAMERA_POSITIONS",
+        "LIGHTING_RATIOS",
+        # Render types
+        "CinematicRenderSettings",
+        # Support system types
+        "ShuffleConfig",
+        "FrameState",
+        "DepthLayerConfig",
+        "CompositionGuide",
+        "LensFXConfig",
+        # Shot Assembly (Phase 6.8)
+        "ShotTemplateConfig",
+        "ShotAssemblyConfig",
+        # Camera Matching & Audio Sync (Phase 6.9)
+        "CameraMatchConfig",
+        "TrackingImportConfig",
+        "AudioSyncConfig",
+        "CameraProfile",
+        # Testing & Benchmarking (Phase 6.10)
+        "IntegrationConfig",
+        "TestConfig",
+        "PerformanceConfig",
+        "BenchmarkResult",
+    ],
+    ".enums": [
+        "LensType",
+        "LightType",
+        "QualityTier",
+        "ColorSpace",
+        "EasingType",
+        # Lighting enum
+        "AreaLightShape",
+        # Color enums
+        "ViewTransform",
+        "WorkingColorSpace",
+        # Render enums
+        "RenderEngine",
+        "DenoiserType",
+        # Support system enums
+        "CompositionGuideType",
+        "DepthLayer",
+        "LensFXType",
+    ],
+    ".state_manager": [
+        "StateManager",
+        "FrameStore",
+    ],
+    ".preset_loader": [
+        "load_preset",
+        "PresetRegistry",
+        "get_preset_registry",
+        "clear_preset_cache",
+        "get_lens_preset",
+        "get_sensor_preset",
+        "get_rig_preset",
+        "get_imperfection_preset",
+        "list_lens_presets",
+        "list_sensor_presets",
+        "list_rig_presets",
+        "list_imperfection_presets",
+        "get_aperture_preset",
+        # Lighting preset loaders
+        "get_lighting_rig_preset",
+        "get_gel_preset",
+        "get_hdri_preset",
+        "list_lighting_rig_presets",
+        "list_gel_presets",
+        "list_hdri_presets",
+        # Backdrop preset loaders
+        "get_infinite_curve_preset",
+        "get_gradient_preset",
+        "get_environment_preset",
+        "list_infinite_curve_presets",
+        "list_gradient_presets",
+        "list_environment_presets",
+        # Color preset loaders
+        "get_color_preset",
+        "get_technical_lut_preset",
+        "get_film_lut_preset",
+        "list_color_presets",
+        "list_technical_lut_presets",
+        "list_film_lut_presets",
+        # Animation preset loaders
+        "get_camera_move_preset",
+        "get_easing_preset",
+        "get_turntable_preset",
+        "list_camera_move_presets",
+        "list_easing_presets",
+        "list_turntable_presets",
+        # Render preset loaders
+        "get_quality_profile",
+        "get_pass_preset",
+        "get_exr_settings",
+        "list_quality_profiles",
+        "list_pass_presets",
+        "list_exr_presets",
+        # Support system preset loaders
+        "get_shuffle_preset",
+        "get_lens_fx_preset",
+        "get_depth_layer_preset",
+        "get_composition_guide_preset",
+        "list_shuffle_presets",
+        "list_lens_fx_presets",
+        "list_depth_layer_presets",
+        "list_composition_guide_presets",
+    ],
+    ".camera": [
+        "create_camera",
+        "configure_dof",
+        "apply_lens_preset",
+        "apply_sensor_preset",
+        "get_active_camera",
+        "set_active_camera",
+        "delete_camera",
+        "list_cameras",
+        "validate_aperture",
+        "APERTURE_MIN",
+        "APERTURE_MAX",
+        "BLENDER_AVAILABLE",
+    ],
+    ".plumb_bob": [
+        "calculate_plumb_bob",
+        "create_target_empty",
+        "calculate_focus_distance",
+        "set_camera_focus_target",
+        "remove_target_empty",
+        "get_or_create_target",
+        "apply_plumb_bob_to_rig",
+    ],
+    ".lenses": [
+        "setup_compositor_for_lens",
+        "apply_lens_imperfections",
+        "get_bokeh_blade_count",
+        "clear_lens_effects",
+        "apply_imperfection_preset",
+        "apply_bokeh_to_camera",
+    ],
+    ".rigs": [
+        "setup_camera_rig",
+        "create_rig_controller",
+        "clear_rig_constraints",
+        "get_rig_type",
+        "apply_rig_preset",
+        "create_multi_camera_layout",
+        "setup_multi_camera_composite",
+        "render_multi_camera_composite",
+        "clear_multi_camera_composite",
+    ],
+    ".lighting": [
+        "create_light",
+        "create_area_light",
+        "create_spot_light",
+        "create_point_light",
+        "create_sun_light",
+        "setup_light_linking",
+        "apply_lighting_rig",
+        "delete_light",
+        "list_lights",
+        "get_light",
+        "set_light_intensity",
+        "set_light_color",
+        "set_light_temperature",
+    ],
+    ".gel": [
+        "apply_gel",
+        "create_gel_from_preset",
+        "kelvin_to_rgb",
+        "combine_gels",
+    ],
+    ".hdri": [
+        "setup_hdri",
+        "load_hdri_preset",
+        "find_hdri_path",
+        "clear_hdri",
+        "get_hdri_info",
+        "list_available_hdris",
+    ],
+    ".light_rigs": [
+        "create_light_rig",
+        "create_three_point_soft",
+        "create_three_point_hard",
+        "create_product_hero",
+        "create_studio_high_key",
+        "create_studio_low_key",
+        "position_key_light",
+        "position_fill_light",
+        "position_back_light",
+    ],
+    ".light_linking": [
+        "link_light_to_collection",
+        "unlink_light_from_collection",
+        "set_light_include_only",
+        "set_light_exclude",
+        "get_light_links",
+        "clear_light_links",
+        "get_objects_affected_by_light",
+        "copy_light_linking",
+        "is_light_linking_supported",
+    ],
+    ".backdrops": [
+        "create_infinite_curve",
+        "create_gradient_material",
+        "apply_gradient_material",
+        "setup_shadow_catcher",
+        "configure_render_for_shadow_catcher",
+        "create_backdrop",
+        "create_backdrop_from_preset",
+        "delete_backdrop",
+        "get_backdrop",
+    ],
+    ".color": [
+        "set_view_transform",
+        "apply_color_preset",
+        "get_current_color_settings",
+        "reset_color_settings",
+        "get_available_looks",
+        "set_working_color_space",
+        "validate_lut_file",
+        "find_lut_path",
+        "load_lut_config",
+        "list_available_luts",
+        "apply_lut",
+        "remove_lut_nodes",
+        "get_active_luts",
+        "calculate_auto_exposure",
+        "apply_exposure_lock",
+        "set_exposure",
+        "set_gamma",
+        "get_exposure_range",
+        "get_gamma_range",
+    ],
+    ".shot_builder": [
+        "apply_shot_preset",
+        "get_shot_preset",
+        "list_shot_presets",
+        "list_shot_presets_by_category",
+        "get_shot_preset_info",
+        "get_presets_for_use_case",
+        "ShotPreset",
+    ],
+    ".animation": [
+        "create_orbit_animation",
+        "create_dolly_animation",
+        "create_truck_animation",
+        "create_crane_animation",
+        "create_pan_animation",
+        "create_tilt_animation",
+        "create_rack_focus_animation",
+        "create_push_in_animation",
+        "create_turntable_animation",
+        "create_animation_from_preset",
+        "apply_camera_move_preset",
+        "apply_turntable_preset",
+        "clear_animation",
+        "set_scene_frame_range",
+        "apply_easing",
+    ],
+    ".motion_path": [
+        "generate_bezier_path",
+        "generate_arc_path",
+        "generate_orbit_path",
+        "interpolate_catmull_rom",
+        "create_motion_path_curve",
+        "setup_camera_follow_path",
+        "create_motion_path_from_config",
+        "create_motion_path_from_preset",
+        "calculate_path_length",
+        "get_point_at_distance",
+        "sample_path_uniformly",
+        "remove_motion_path",
+    ],
+    ".render": [
+        "apply_quality_profile",
+        "apply_render_settings",
+        "configure_render_passes",
+        "setup_cryptomatte",
+        "setup_exr_output",
+        "detect_optimal_denoiser",
+        "enable_denoising",
+        "set_render_engine",
+        "set_resolution",
+        "set_frame_range",
+        "render_frame",
+        "render_animation",
+        "get_render_settings",
+        "apply_pass_preset",
+    ],
+    ".shuffler": [
+        "generate_variations",
+        "apply_variation",
+        "randomize_parameter",
+    ],
+    ".frame_store": [
+        "capture_frame_state",
+        "restore_frame_state",
+        "compare_states",
+        "save_state_to_file",
+        "load_state_from_file",
+    ],
+    ".depth_layers": [
+        "organize_depth_layers",
+        "assign_object_to_layer",
+        "apply_layer_dof",
+        "get_objects_by_layer",
+    ],
+    ".composition": [
+        "setup_composition_guides",
+        "create_rule_of_thirds_overlay",
+        "create_golden_ratio_overlay",
+        "remove_composition_guides",
+    ],
+    ".lens_fx": [
+        "apply_lens_fx",
+        "setup_bloom",
+        "setup_flare",
+        "setup_vignette",
+        "setup_chromatic_aberration",
+        "remove_lens_fx",
+    ],
+    ".shot": [
+        "assemble_shot",
+        "load_shot_yaml",
+        "save_shot_state",
+        "load_shot_state",
+        "render_shot",
+        "create_shot_from_template",
+        "edit_shot",
+    ],
+    ".camera_match": [
+        "match_camera_to_reference",
+        "estimate_focal_length",
+        "detect_horizon_line",
+        "apply_camera_profile",
+    ],
+    ".audio_sync": [
+        "load_audio",
+        "place_beat_markers",
+        "detect_bpm",
+        "create_animation_markers",
+        "get_frame_at_beat",
+        "get_beat_at_frame",
+    ],
+    ".testing": [
+        "run_shot_test",
+        "validate_shot_output",
+        "compare_to_reference",
+        "run_test_suite",
+    ],
+    ".benchmark": [
+        "benchmark_shot_assembly",
+        "benchmark_render",
+        "benchmark_animation",
+        "run_all_benchmarks",
+        "save_benchmark_results",
+        "get_system_info",
+    ],
+    ".tracking.types": [
+        # Tracking System (Phase 7.0)
+        "TrackData",
+        "SolveData",
+        "SolveReport",
+        "FootageMetadata",
+        "FootageInfo",
+        "TrackingSession",
+        "CornerPinData",
+        "PlanarTrack",
+        "RotationCurve",
+        "RigidBodySolve",
+        "FloorPlane",
+        "ScaleCalibration",
+        "ScanData",
+        "JointTransform",
+        "BoneChannel",
+        "MocapData",
+        "FingerData",
+        "HandFrame",
+        "HandAnimation",
+        # Batch Types (from tracking.types)
+        "BatchJob",
+        "BatchConfig",
+        "BatchResult",
+    ],
+    ".tracking.footage": [
+        "extract_metadata",
+        "analyze_footage",
+        "get_frame_rate",
+    ],
+    ".tracking.import_export": [
+        "convert_yup_to_zup_position",
+        "convert_yup_to_zup_rotation",
+        "fov_to_focal_length",
+        "import_nuke_chan",
+        "import_tracking_data",
+    ],
+    ".tracking.session_manager": [
+        "TrackingSessionManager",
+    ],
+    ".tracking.compositor": [
+        # Phase 7.4: Compositing Integration
+        "CompositeConfig",
+        "create_stabilization_nodes",
+        "create_corner_pin_nodes",
+        "create_alpha_over_composite",
+        "create_shadow_composite",
+        "load_composite_preset",
+        "clear_compositor_tree",
+    ],
+    ".tracking.session": [
+        "SessionStatus",
+        "create_session",
+        "resume_tracking",
+        "load_session",
+        "list_sessions",
+        "get_session_status",
+    ],
+    ".tracking.shot_integration": [
+        "FootageConfig",
+        "TrackingShotConfig",
+        "CompositeShotConfig",
+        "assemble_shot_with_tracking",
+        "setup_tracked_shot",
+        "apply_solved_camera",
+        "setup_shot_compositing",
+        "load_tracking_shot_yaml",
+        "validate_tracking_shot_config",
+    ],
+    ".batch": [
+        # Batch Processing (Phase 7.5)
+        "BatchProcessor",
+        "BatchCheckpoint",
+        "BatchWorker",
+        "WorkerPool",
+        "WorkerError",
+        "blender_worker_command",
+        "create_batch_from_directory",
+        "generate_batch_report",
+        "run_batch",
+    ],
+    ".tracking.object_tracker": [
+        # Object Tracking (Phase 7.5)
+        "PlanarTracker",
+        "KnobTracker",
+        "RigidBodyTracker",
+        "FaderTracker",
+        "ObjectTracker",
+    ],
+    ".tracking.scan_import": [
+        # Scan Import (Phase 7.5)
+        "PLYParser",
+        "OBJParser",
+        "FloorDetector",
+        "ScaleDetector",
+        "ScanImporter",
+        "import_polycam",
+        "import_reality_scan",
+        "SCAN_FORMATS",
+    ],
+    ".tracking.mocap": [
+        # Mocap Import (Phase 7.5)
+        "MocapImporter",
+        "MocapRetargeter",
+        "ButtonPressDetector",
+        "PressEvent",
+        "HAND_BONE_NAMES",
+        "import_move_ai",
+        "import_rokoko",
+    ],
+    ".camera_control": [
+        # Camera Control System (Unified API)
+        "CameraController",
+        "CameraType",
+        "RigType",
+        "ShakeProfile",
+        "MultiCameraController",
+        "ShakeConfig",
+        "ZoomConfig",
+        "FocusPullConfig",
+        "CameraState",
+        "SHAKE_PROFILES",
+    ],
+    ".gn_camera_control": [
+        # GN Camera Control
+        "GNCameraController",
+        "GNCameraNodeTree",
+        "ShakeType",
+        "FollowMode",
+        "ShakeLayer",
+        "GNCameraConfig",
+        "create_shake_camera",
+        "create_follow_orbit_camera",
+        "get_shake_node_spec",
+        "get_orbit_node_spec",
+        "get_follow_node_spec",
+    ],
+    ".tracking_types": [
+        # Object Tracking & Follow Focus (Phase 6.2)
+        "SolveMethod",
+        "ExportFormat",
+        "TrackingMarker",
+        "TrackingData",
+        "TrackingConfig",
+        "FollowFocusRig",
+        "TrackingExportResult",
+    ],
+    ".tracking_solver": [
+        "solve_marker_position",
+        "solve_tracking_data",
+        "calculate_velocities",
+        "calculate_accelerations",
+        "interpolate_position",
+        "predict_position",
+        "apply_smoothing",
+        "apply_gaussian_smoothing",
+    ],
+    ".follow_focus": [
+        "create_follow_focus_rig",
+        "animate_focus_distance",
+        "set_focus_mode",
+        "create_focus_target_empty",
+        "link_camera_to_focus_target",
+        "animate_focus_target",
+        "get_camera_focus_info",
+        "remove_follow_focus_animation",
+    ],
+    ".tracking_export": [
+        "export_tracking_json",
+        "export_tracking_ae",
+        "export_tracking_nuke",
+        "export_tracking_blender",
+        "export_tracking",
+    ],
+}
+
+# Public names that rename a submodule attribute
+_LAZY_ALIASES = {
+    "list_gel_preset_names": (".gel", "list_gel_presets"),
+    "list_rig_creator_presets": (".light_rigs", "list_light_rig_presets"),
+    "ff_calculate_focus_distance": (".follow_focus", "calculate_focus_distance"),
+}
+
+_LAZY_ATTRIBUTES = {
+    name: (module, name) for module, names in _LAZY_IMPORTS.items() for name in names
+}
+_LAZY_ATTRIBUTES.update(_LAZY_ALIASES)
+
 
 __all__ = [
     # Core types
@@ -679,6 +732,9 @@ __all__ = [
 
     # Preset loading
     "load_preset",
+    "PresetRegistry",
+    "get_preset_registry",
+    "clear_preset_cache",
     "get_lens_preset",
     "get_sensor_preset",
     "get_rig_preset",
@@ -1021,6 +1077,10 @@ __all__ = [
     # Batch Processing (Phase 7.5)
     "BatchProcessor",
     "BatchCheckpoint",
+    "BatchWorker",
+    "WorkerPool",
+    "WorkerError",
+    "blender_worker_command",
     "create_batch_from_directory",
     "generate_batch_report",
     "run_batch",
@@ -1154,3 +1214,30 @@ __all__ = [
 ]
 
 __version__ = "0.5.0"
+
+
+def __getattr__(name: str):
+    """
+    Lazy import of public names and submodules (PEP 562).
+
+    The resolved value is stored in the package namespace, so each
+    name is imported at most once.
+    """
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is not None:
+        module_name, attribute = target
+        value = getattr(importlib.import_module(module_name, __name__), attribute)
+        globals()[name] = value
+        return value
+
+    # Submodules used to be bound as package attributes by eager imports
+    if not name.startswith("__"):
+        from importlib.util import find_spec
+        if find_spec(f"{__name__}.{name}") is not None:
+            return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
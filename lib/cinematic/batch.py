@@ -5,7 +5,9 @@ Provides parallel batch processing for shot rendering with checkpoint-based
 resume capability, timeout support, and progress tracking.
 
 Key Features:
-- ProcessPoolExecutor for parallel execution (subprocess isolation)
+- Persistent warm worker pool (Blender started once per worker, not per job)
+- Worker recycling after N jobs or above a memory threshold
+- Crash isolation (a crashed or hung worker only fails its own job)
 - Checkpoint-based resume (skips completed jobs on restart)
 - Per-job timeout support
 - Progress tracking and status reporting
@@ -31,16 +33,26 @@ from __future__ import annotations
 
 import json
 import os
+import queue
 import subprocess
 import sys
+import threading
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
 
+from .batch_worker import DEFAULT_HANDLER, PROTOCOL_PREFIX
 from .tracking.types import BatchConfig, BatchJob, BatchResult
 
+# Worker script run by persistent workers
+WORKER_SCRIPT = Path(__file__).resolve().parent / "batch_worker.py"
+
+# Lines of worker output kept for error messages
+WORKER_OUTPUT_TAIL = 40
+
 
 class BatchCheckpoint:
     """
@@ -59,6 +71,7 @@ class BatchCheckpoint:
         """
         self.checkpoint_path = Path(checkpoint_path)
         self._data: Dict[str, Any] = {"jobs": {}, "started_at": None}
+        self._lock = threading.Lock()
 
     def load(self) -> Dict[str, Any]:
         """
@@ -112,13 +125,15 @@ class BatchCheckpoint:
             status: New status (pending, running, completed, failed)
             error: Error message if failed
         """
-        data = self.load()
-        data["jobs"][job_id] = {
-            "status": status,
-            "error": error,
-            "updated_at": datetime.utcnow().isoformat(),
-        }
-        self.save(data)
+        # Jobs report from several dispatch threads
+        with self._lock:
+            data = self.load()
+            data["jobs"][job_id] = {
+                "status": status,
+                "error": error,
+                "updated_at": datetime.utcnow().isoformat(),
+            }
+            self.save(data)
 
     def clear(self) -> None:
         """Clear checkpoint file."""
@@ -214,13 +229,414 @@ else:
     return job
 
 
+def blender_worker_command(
+    blender_path: str = "blender", handler: str = DEFAULT_HANDLER
+) -> List[str]:
+    """
+    Build the command that starts a persistent Blender worker.
+
+    Args:
+        blender_path: Path to Blender executable
+        handler: Job handler as module:function
+
+    Returns:
+        Command argument list
+    """
+    return [
+        blender_path,
+        "--background",
+        "--python",
+        str(WORKER_SCRIPT),
+        "--",
+        "--handler",
+        handler,
+    ]
+
+
+class WorkerError(RuntimeError):
+    """Worker process failed to start or died."""
+
+
+class BatchWorker:
+    """
+    One persistent worker process.
+
+    Talks to lib/cinematic/batch_worker.py over stdin/stdout. A reader
+    thread separates protocol messages from ordinary output, keeping the
+    last lines of output for error messages.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize worker (not started).
+
+        Args:
+            command: Worker command argument list
+            cwd: Working directory for the worker process
+            env: Environment for the worker process
+        """
+        self.command = list(command)
+        self.cwd = cwd
+        self.env = env
+        self.process: Optional[subprocess.Popen] = None
+        self.pid: Optional[int] = None
+        self.jobs_run = 0
+        self.memory_mb = 0.0
+
+        self._messages: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self._output: Deque[str] = deque(maxlen=WORKER_OUTPUT_TAIL)
+        self._reader: Optional[threading.Thread] = None
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the worker process is running."""
+        return self.process is not None and self.process.poll() is None
+
+    def launch(self) -> None:
+        """Start the worker process without waiting for it to be ready."""
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            cwd=self.cwd,
+            env=self.env,
+        )
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+
+    def wait_ready(self, timeout: float = 0) -> None:
+        """
+        Wait for the worker's ready message.
+
+        Args:
+            timeout: Seconds to wait (0 = no timeout)
+
+        Raises:
+            WorkerError: If the worker exits or does not become ready
+        """
+        message = self._next_message(timeout)
+        if message is None or message.get("type") != "ready":
+            self.kill()
+            raise WorkerError(f"Worker failed to start: {self.output_tail()}")
+
+        self.pid = message.get("pid")
+        self.memory_mb = message.get("memory_mb", 0.0)
+
+    def start(self, timeout: float = 0) -> None:
+        """
+        Start the worker process and wait until it is ready.
+
+        Args:
+            timeout: Seconds to wait for startup (0 = no timeout)
+        """
+        self.launch()
+        self.wait_ready(timeout)
+
+    def run(self, job: BatchJob, timeout: int = 0) -> BatchJob:
+        """
+        Run a job on this worker.
+
+        A timed out job kills the worker; the caller should discard it.
+
+        Args:
+            job: BatchJob to execute
+            timeout: Job timeout in seconds (0 = no timeout)
+
+        Returns:
+            Updated BatchJob with results
+        """
+        job.start_time = datetime.utcnow().isoformat()
+        job.status = "running"
+
+        try:
+            self._send({"type": "job", "id": job.id, "job": job.to_dict()})
+            message = self._next_message(timeout)
+            while message is not None and message.get("id") != job.id:
+                message = self._next_message(timeout)
+
+            if message is None:
+                self.kill()
+                job.status = "failed"
+                job.error = self._exit_error()
+            else:
+                self.jobs_run += 1
+                self.memory_mb = message.get("memory_mb", 0.0)
+                job.status = message.get("status", "failed")
+                job.error = message.get("error")
+
+        except queue.Empty:
+            self.kill()
+            job.status = "failed"
+            job.error = f"Job timed out after {timeout} seconds"
+
+        except (OSError, ValueError) as e:
+            # Broken pipe: worker died between jobs
+            self.kill()
+            job.status = "failed"
+            job.error = f"Worker unavailable: {type(e).__name__}: {e}"
+
+        job.end_time = datetime.utcnow().isoformat()
+        return job
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Ask the worker to exit, killing it if it does not.
+
+        Args:
+            timeout: Seconds to wait for a clean exit
+        """
+        if not self.is_alive:
+            return
+
+        try:
+            self._send({"type": "shutdown"})
+            self.process.stdin.close()
+            self.process.wait(timeout=timeout)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self) -> None:
+        """Terminate the worker process immediately."""
+        if self.process is None:
+            return
+        if self.process.poll() is None:
+            self.process.kill()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            pass
+
+    def output_tail(self) -> str:
+        """Get the last lines of worker output."""
+        return "\n".join(self._output)
+
+    def _send(self, message: Dict[str, Any]) -> None:
+        self.process.stdin.write(json.dumps(message) + "\n")
+        self.process.stdin.flush()
+
+    def _next_message(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next protocol message; None once the worker has exited."""
+        return self._messages.get(timeout=timeout if timeout > 0 else None)
+
+    def _exit_error(self) -> str:
+        code = self.process.returncode if self.process else None
+        error = f"Worker exited with code {code}"
+        tail = self.output_tail()
+        if tail:
+            error = f"{error}: {tail}"
+        return error[-500:] if len(error) > 500 else error
+
+    def _read_output(self) -> None:
+        """Reader thread: route protocol lines to the message queue."""
+        for line in self.process.stdout:
+            index = line.find(PROTOCOL_PREFIX)
+            if index < 0:
+                line = line.rstrip()
+                if line:
+                    self._output.append(line)
+                continue
+            try:
+                self._messages.put(json.loads(line[index + len(PROTOCOL_PREFIX):]))
+            except json.JSONDecodeError:
+                self._output.append(line.rstrip())
+        self.process.stdout.close()
+        self._messages.put(None)
+
+
+class WorkerPool:
+    """
+    Pool of persistent, recycled worker processes.
+
+    Each worker imports lib.cinematic (and loads assets) once and then
+    serves many jobs. Workers are replaced after max_jobs_per_worker jobs
+    or once their memory exceeds max_memory_mb; a worker that crashes or
+    times out fails only the job it was running and is replaced.
+
+    The worker command is pluggable, so the pool can be exercised with a
+    plain Python stand-in for Blender.
+
+    Example:
+        with WorkerPool(size=4, max_jobs_per_worker=20) as pool:
+            job = pool.run_job(job, timeout=600)
+    """
+
+    def __init__(
+        self,
+        size: int,
+        command: Optional[Sequence[str]] = None,
+        max_jobs_per_worker: int = 0,
+        max_memory_mb: float = 0,
+        startup_timeout: float = 120.0,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize pool (workers start on demand or via warm()).
+
+        Args:
+            size: Maximum number of worker processes
+            command: Worker command (default: background Blender worker)
+            max_jobs_per_worker: Recycle a worker after this many jobs (0 = never)
+            max_memory_mb: Recycle a worker above this resident memory (0 = no limit)
+            startup_timeout: Seconds to wait for a worker to become ready
+            cwd: Working directory for worker processes
+            env: Environment for worker processes
+        """
+        self.size = max(1, size)
+        self.command = list(command) if command else blender_worker_command()
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_memory_mb = max_memory_mb
+        self.startup_timeout = startup_timeout
+        self.cwd = cwd
+        self.env = env
+
+        self.workers_started = 0
+        self.workers_recycled = 0
+
+        self._idle: "queue.LifoQueue[BatchWorker]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def warm(self, count: Optional[int] = None) -> int:
+        """
+        Start idle workers ahead of the first jobs.
+
+        Workers are launched together, so their startup overlaps.
+
+        Args:
+            count: Number of workers to have idle (default: pool size)
+
+        Returns:
+            Number of workers started
+        """
+        count = min(self.size, self.size if count is None else count)
+        wanted = max(0, count - self._idle.qsize())
+
+        launched = []
+        for _ in range(wanted):
+            worker = self._new_worker()
+            try:
+                worker.launch()
+            except OSError:
+                break
+            launched.append(worker)
+
+        started = 0
+        for worker in launched:
+            try:
+                worker.wait_ready(self.startup_timeout)
+            except WorkerError:
+                continue
+            self._count_started()
+            self._idle.put(worker)
+            started += 1
+        return started
+
+    def run_job(self, job: BatchJob, timeout: int = 0) -> BatchJob:
+        """
+        Run a job on a warm worker.
+
+        Blocks until a worker slot is free.
+
+        Args:
+            job: BatchJob to execute
+            timeout: Job timeout in seconds (0 = no timeout)
+
+        Returns:
+            Updated BatchJob with results
+        """
+        if self._closed:
+            raise RuntimeError("WorkerPool is closed")
+
+        with self._slots:
+            try:
+                worker = self._checkout()
+            except (OSError, WorkerError) as e:
+                job.status = "failed"
+                job.error = f"Could not start worker: {type(e).__name__}: {e}"
+                job.end_time = datetime.utcnow().isoformat()
+                return job
+
+            job = worker.run(job, timeout=timeout)
+            self._checkin(worker)
+            return job
+
+    def close(self) -> None:
+        """Shut down all idle workers."""
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.stop()
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _new_worker(self) -> BatchWorker:
+        return BatchWorker(self.command, cwd=self.cwd, env=self.env)
+
+    def _count_started(self) -> None:
+        with self._lock:
+            self.workers_started += 1
+
+    def _checkout(self) -> BatchWorker:
+        """Take a live idle worker, starting one if none is idle."""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker.is_alive:
+                return worker
+            worker.kill()
+
+        worker = self._new_worker()
+        worker.start(self.startup_timeout)
+        self._count_started()
+        return worker
+
+    def _checkin(self, worker: BatchWorker) -> None:
+        """Return a worker to the pool, or retire it if it must be recycled."""
+        if not worker.is_alive:
+            worker.kill()
+            return
+
+        worn_out = (
+            (self.max_jobs_per_worker > 0 and worker.jobs_run >= self.max_jobs_per_worker)
+            or (self.max_memory_mb > 0 and worker.memory_mb > self.max_memory_mb)
+        )
+        if worn_out or self._closed:
+            worker.stop()
+            if worn_out:
+                with self._lock:
+                    self.workers_recycled += 1
+            return
+
+        self._idle.put(worker)
+
+
 class BatchProcessor:
     """
     Parallel batch processor with checkpoint resume.
 
-    Uses ProcessPoolExecutor for parallel execution with
-    subprocess isolation. Supports resume from checkpoint
-    on failure.
+    Runs jobs on a WorkerPool of persistent worker processes (or one
+    Blender subprocess per job when persistent_workers is off). Jobs
+    are dispatched from threads, since the work itself happens in the
+    worker processes. Supports resume from checkpoint on failure.
 
     Example:
         config = BatchConfig(workers=4, resume_on_failure=True)
@@ -239,6 +655,7 @@ class BatchProcessor:
         self,
         config: Optional[BatchConfig] = None,
         job_runner: Optional[Callable[[BatchJob], BatchJob]] = None,
+        worker_command: Optional[Sequence[str]] = None,
     ):
         """
         Initialize batch processor.
@@ -246,9 +663,13 @@ class BatchProcessor:
         Args:
             config: Batch processing configuration
             job_runner: Custom job runner function (for testing)
+            worker_command: Persistent worker command
+                (default: background Blender running batch_worker.py)
         """
         self.config = config or BatchConfig()
         self._job_runner = job_runner or self._default_job_runner
+        self._worker_command = list(worker_command) if worker_command else None
+        self._pool: Optional[WorkerPool] = None
         self._cancelled = False
         self._checkpoint = BatchCheckpoint(self.config.checkpoint_path)
 
@@ -261,13 +682,30 @@ class BatchProcessor:
             self._workers = self.config.workers
 
     def _default_job_runner(self, job: BatchJob) -> BatchJob:
-        """Default job runner using subprocess."""
+        """Default job runner using the worker pool (or a subprocess per job)."""
+        if self._pool is not None:
+            return self._pool.run_job(job, timeout=self.config.timeout_seconds)
+
         return run_job_subprocess(
             job,
-            blender_path="blender",
+            blender_path=self.config.blender_path,
             timeout=self.config.timeout_seconds,
         )
 
+    def _create_pool(self) -> Optional[WorkerPool]:
+        """Create the worker pool used by the default job runner."""
+        if self._job_runner != self._default_job_runner:
+            return None
+        if not self.config.persistent_workers:
+            return None
+
+        return WorkerPool(
+            size=self._workers,
+            command=self._worker_command or blender_worker_command(self.config.blender_path),
+            max_jobs_per_worker=self.config.max_jobs_per_worker,
+            max_memory_mb=self.config.max_worker_memory_mb,
+        )
+
     def process_batch(self, jobs: List[BatchJob]) -> BatchResult:
         """
         Process a batch of jobs with parallel execution.
@@ -298,42 +736,51 @@ class BatchProcessor:
 
         # Process jobs in parallel
         if pending_jobs:
-            with ProcessPoolExecutor(max_workers=self._workers) as executor:
-                # Submit all jobs
-                future_to_job = {
-                    executor.submit(self._run_with_retry, job): job
-                    for job in pending_jobs
-                }
-
-                # Collect results as they complete
-                for future in as_completed(future_to_job):
-                    if self._cancelled:
-                        executor.shutdown(wait=False, cancel_futures=True)
-                        break
-
-                    job = future_to_job[future]
-                    try:
-                        completed_job = future.result()
-                        result.jobs.append(completed_job)
-
-                        if completed_job.status == "completed":
-                            result.completed += 1
-                            self._checkpoint.mark_job_status(
-                                completed_job.id, "completed"
-                            )
-                        else:
+            self._pool = self._create_pool()
+            if self._pool is not None:
+                self._pool.warm(min(self._workers, len(pending_jobs)))
+
+            try:
+                with ThreadPoolExecutor(max_workers=self._workers) as executor:
+                    # Submit all jobs
+                    future_to_job = {
+                        executor.submit(self._run_with_retry, job): job
+                        for job in pending_jobs
+                    }
+
+                    # Collect results as they complete
+                    for future in as_completed(future_to_job):
+                        if self._cancelled:
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            break
+
+                        job = future_to_job[future]
+                        try:
+                            completed_job = future.result()
+                            result.jobs.append(completed_job)
+
+                            if completed_job.status == "completed":
+                                result.completed += 1
+                                self._checkpoint.mark_job_status(
+                                    completed_job.id, "completed"
+                                )
+                            else:
+                                result.failed += 1
+                                if not self.config.continue_on_error:
+                                    self._cancelled = True
+
+                        except Exception as e:
+                            job.status = "failed"
+                            job.error = str(e)
+                            result.jobs.append(job)
                             result.failed += 1
+
                             if not self.config.continue_on_error:
                                 self._cancelled = True
-
-                    except Exception as e:
-                        job.status = "failed"
-                        job.error = str(e)
-                        result.jobs.append(job)
-                        result.failed += 1
-
-                        if not self.config.continue_on_error:
-                            self._cancelled = True
+            finally:
+                if self._pool is not None:
+                    self._pool.close()
+                    self._pool = None
 
         # Calculate duration
         result.duration_seconds = time.time() - start_time
@@ -0,0 +1,270 @@
+"""
+Batch Worker Process
+
+Worker side of the persistent batch worker pool (see lib.cinematic.batch).
+A worker is started once, imports its job handler once, then runs jobs
+sent by the pool until it is told to shut down. This keeps Blender and
+lib.cinematic warm between jobs. Before each job the scene is reset
+(Blender's startup file is reloaded), so no objects, cameras, colour
+management or render settings carry over from the previous job.
+
+Protocol:
+    Messages are JSON objects, one per line.
+
+    Pool -> worker (stdin):
+        {"type": "job", "id": "...", "job": {...BatchJob.to_dict()...}}
+        {"type": "shutdown"}
+
+    Worker -> pool (stdout, prefixed with PROTOCOL_PREFIX):
+        {"type": "ready", "pid": 1234, "memory_mb": 210.5}
+        {"type": "result", "id": "...", "status": "completed",
+         "error": null, "memory_mb": 254.1}
+
+    Any other stdout/stderr output (Blender logs, prints from the
+    handler) is passed through and kept by the pool for error reports.
+
+This module only uses the standard library so it can be run directly as
+a script, by Blender or by a plain Python interpreter:
+
+    blender --background --python lib/cinematic/batch_worker.py -- \\
+        --handler lib.cinematic.batch_worker:render_shot_job
+
+    python lib/cinematic/batch_worker.py -- --handler my_tests:fake_render \\
+        --reset my_tests:fake_reset
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+# Run as a script, this directory comes first on sys.path and its
+# types.py would shadow the standard library module
+if __name__ == "__main__" and sys.path and (
+    os.path.abspath(sys.path[0]) == os.path.dirname(os.path.abspath(__file__))
+):
+    sys.path.pop(0)
+
+import argparse
+import importlib
+import json
+import traceback
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+# Marks protocol lines among ordinary process output
+PROTOCOL_PREFIX = "@@BATCH_WORKER@@ "
+
+# Handler used by Blender workers
+DEFAULT_HANDLER = "lib.cinematic.batch_worker:render_shot_job"
+
+# Repository root (so handlers in lib/ import without installation)
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+
+JobHandler = Callable[[Dict[str, Any]], Any]
+SceneReset = Callable[[], Any]
+
+
+def current_memory_mb() -> float:
+    """
+    Get resident memory of the current process.
+
+    Returns:
+        Resident set size in megabytes (0.0 if unavailable)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except (ImportError, OSError):
+        return 0.0
+
+
+def load_handler(spec: str) -> JobHandler:
+    """
+    Import a job handler from a "module:function" spec.
+
+    Args:
+        spec: Handler spec, e.g. "lib.cinematic.batch_worker:render_shot_job"
+
+    Returns:
+        Handler callable
+    """
+    module_name, _, attr = spec.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Invalid handler spec (expected module:function): {spec}")
+
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    handler = importlib.import_module(module_name)
+    for part in attr.split("."):
+        handler = getattr(handler, part)
+    return handler
+
+
+def reset_blender_scene() -> None:
+    """
+    Reload Blender's startup file, dropping everything the last job built.
+
+    The scene starts out as it would in a freshly launched Blender, while
+    imported Python modules stay loaded. Does nothing outside Blender.
+    """
+    try:
+        import bpy
+    except ImportError:
+        return
+
+    bpy.ops.wm.read_homefile()
+
+
+def render_shot_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Assemble and render a shot (default Blender job handler).
+
+    Runs from the shot config's directory, like a one-off Blender
+    subprocess would.
+
+    Args:
+        job: BatchJob as a dict
+
+    Returns:
+        Result dict with status and error
+    """
+    from lib.cinematic.shot import assemble_shot, render_shot
+
+    previous_cwd = os.getcwd()
+    shot_config = job.get("shot_config", "")
+    if shot_config:
+        os.chdir(str(Path(shot_config).parent))
+
+    try:
+        if not assemble_shot(shot_config):
+            return {"status": "failed", "error": "Could not assemble shot"}
+        render_shot(output_path=job.get("output_path", ""))
+        return {"status": "completed"}
+    finally:
+        os.chdir(previous_cwd)
+
+
+def _send(stream: TextIO, message: Dict[str, Any]) -> None:
+    # Leading newline keeps the message on its own line even if the
+    # handler left a partial line on stdout
+    stream.write("\n" + PROTOCOL_PREFIX + json.dumps(message) + "\n")
+    stream.flush()
+
+
+def _run_job(
+    handler: JobHandler, job: Dict[str, Any], reset: Optional[SceneReset] = None
+) -> Dict[str, Any]:
+    """Reset the scene and run one job, turning the outcome into a result message."""
+    try:
+        if reset is not None:
+            reset()
+        outcome = handler(job)
+    except Exception as e:
+        return {
+            "status": "failed",
+            "error": f"{type(e).__name__}: {e}\n{traceback.format_exc(limit=5)}",
+        }
+
+    if isinstance(outcome, dict):
+        return {
+            "status": outcome.get("status", "completed"),
+            "error": outcome.get("error"),
+        }
+    if outcome is False:
+        return {"status": "failed", "error": "Job handler reported failure"}
+    return {"status": "completed", "error": None}
+
+
+def worker_main(
+    handler: Optional[JobHandler] = None,
+    stdin: Optional[TextIO] = None,
+    stdout: Optional[TextIO] = None,
+    reset: Optional[SceneReset] = None,
+) -> int:
+    """
+    Serve jobs until shutdown or end of input.
+
+    Args:
+        handler: Job handler (default: from --handler in sys.argv)
+        stdin: Message input stream (default: sys.stdin)
+        stdout: Message output stream (default: sys.stdout)
+        reset: Scene reset run before each job (default: from --reset
+            in sys.argv, else reset_blender_scene)
+
+    Returns:
+        Exit code
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+
+    if handler is None or reset is None:
+        args = _parse_args(sys.argv)
+        if handler is None:
+            handler = load_handler(args.handler)
+        if reset is None:
+            reset = load_handler(args.reset) if args.reset else reset_blender_scene
+
+    _send(stdout, {"type": "ready", "pid": os.getpid(), "memory_mb": current_memory_mb()})
+
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+        if message.get("type") == "shutdown":
+            break
+        if message.get("type") != "job":
+            continue
+
+        result = _run_job(handler, message.get("job", {}), reset)
+        result.update({
+            "type": "result",
+            "id": message.get("id"),
+            "memory_mb": current_memory_mb(),
+        })
+        _send(stdout, result)
+
+    return 0
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    # Blender passes its own arguments; ours follow "--"
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]
+    else:
+        argv = argv[1:]
+
+    parser = argparse.ArgumentParser(description="Persistent batch job worker")
+    parser.add_argument(
+        "--handler",
+        default=DEFAULT_HANDLER,
+        help="Job handler as module:function",
+    )
+    parser.add_argument(
+        "--reset",
+        default="",
+        help="Scene reset run before each job as module:function "
+        "(default: reload Blender's startup file)",
+    )
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
+if __name__ == "__main__":
+    sys.exit(worker_main())
@@ -9,7 +9,12 @@ Follows pattern from lib/cinematic/state_manager.py for YAML/JSON handling.
 
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+import copy
+import json
+import os
+import pickle
+import threading
 
 try:
     import yaml
@@ -32,25 +37,15 @@ BACKDROP_CONFIG_ROOT = Path("configs/cinematic/backdrops")
 CAMERA_PROFILE_ROOT = Path("configs/cinematic/tracking")
 
 
-def load_preset(path: Path) -> Dict[str, Any]:
-    """
-    Load any YAML preset file.
-
-    Args:
-        path: Path to the preset YAML file
+# Preset file types collected into compiled snapshots
+PRESET_SUFFIXES = (".yaml", ".yml", ".json")
 
-    Returns:
-        Dictionary containing preset data
-
-    Raises:
-        FileNotFoundError: If file doesn't exist
-        RuntimeError: If YAML file but PyYAML not available
-    """
-    path = Path(path)
+# Bumped when the snapshot layout changes
+_SNAPSHOT_VERSION = 1
 
-    if not path.exists():
-        raise FileNotFoundError(f"Preset file not found: {path}")
 
+def _parse_preset(path: Path) -> Any:
+    """Read and parse a YAML or JSON preset file."""
     with open(path, "r", encoding="utf-8") as f:
         data_raw = f.read()
 
@@ -61,10 +56,228 @@ def load_preset(path: Path) -> Dict[str, Any]:
             )
         return yaml.safe_load(data_raw)
     else:
-        import json
         return json.loads(data_raw)
 
 
+class PresetRegistry:
+    """
+    Process-wide cache of parsed preset documents.
+
+    Documents are keyed on the absolute path with its mtime and size, so
+    an edited file is parsed again on next use. Cached documents are
+    shared and must not be mutated; the get_* loaders return copies.
+    Resolved shot template inheritance is memoized per version of the
+    templates file.
+
+    A compiled snapshot (pickle) of a whole configs tree lets a cold
+    process load every document from one file. Only load snapshots you
+    wrote yourself.
+
+    Usage:
+        registry = get_preset_registry()
+        registry.compile_snapshot("configs", "build/presets.pickle")
+        # In a fresh process:
+        registry.load_snapshot("build/presets.pickle", "configs")
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.snapshot_entries = 0
+        self._documents: Dict[str, Tuple[int, int, Any]] = {}
+        self._resolved: Dict[str, Tuple[Any, Dict[str, Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: Path) -> Any:
+        """
+        Get a parsed preset document, parsing it on a miss.
+
+        Args:
+            path: Path to the preset file
+
+        Returns:
+            Shared parsed document (do not mutate)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            RuntimeError: If YAML file but PyYAML not available
+        """
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Preset file not found: {path}") from None
+        key = os.path.abspath(path)
+
+        with self._lock:
+            entry = self._documents.get(key)
+            if entry is not None:
+                if entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                    self.hits += 1
+                    return entry[2]
+                self.stale += 1
+
+        data = _parse_preset(path)
+
+        with self._lock:
+            self.misses += 1
+            self._documents[key] = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+
+    def resolve_template(self, path: Path, name: str) -> Dict[str, Any]:
+        """
+        Get a shot template with its inheritance chain resolved.
+
+        Args:
+            path: Path to the templates file
+            name: Template name
+
+        Returns:
+            Shared resolved template (do not mutate)
+
+        Raises:
+            ValueError: If template not found, inheritance is circular or
+                the template is abstract
+        """
+        document = self.load(path)
+        key = os.path.abspath(path)
+
+        with self._lock:
+            cached_document, resolved = self._resolved.get(key, (None, None))
+            if cached_document is not document:
+                resolved = {}
+                self._resolved[key] = (document, resolved)
+            template = resolved.get(name)
+        if template is not None:
+            return template
+
+        templates = (document or {}).get("templates", {})
+        if name not in templates:
+            raise ValueError(f"Shot template '{name}' not found. Available: {list(templates.keys())}")
+        template = resolve_template_inheritance(name, dict(templates))
+
+        with self._lock:
+            resolved[name] = template
+        return template
+
+    def compile_snapshot(self, root: Path, snapshot_path: Path) -> int:
+        """
+        Parse every preset file under root and write a snapshot.
+
+        Args:
+            root: Configuration directory (e.g. "configs")
+            snapshot_path: Snapshot file to write
+
+        Returns:
+            Number of documents written
+        """
+        root = Path(root)
+        entries = {}
+        for path in sorted(root.rglob("*")):
+            if path.suffix.lower() in PRESET_SUFFIXES and path.is_file():
+                self.load(path)
+                with self._lock:
+                    entries[path.relative_to(root).as_posix()] = self._documents[os.path.abspath(path)]
+
+        snapshot_path = Path(snapshot_path)
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(
+                {"version": _SNAPSHOT_VERSION, "entries": entries},
+                f, protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp_path, snapshot_path)
+        return len(entries)
+
+    def load_snapshot(self, snapshot_path: Path, root: Path) -> int:
+        """
+        Fill the cache from a snapshot written by compile_snapshot.
+
+        Entries are still checked against each file's mtime and size on
+        use, so files edited since the snapshot are parsed again.
+
+        Args:
+            snapshot_path: Snapshot file
+            root: Configuration directory the snapshot was compiled from
+
+        Returns:
+            Number of documents loaded (0 for a missing or outdated snapshot)
+        """
+        try:
+            with open(snapshot_path, "rb") as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return 0
+        if not isinstance(payload, dict) or payload.get("version") != _SNAPSHOT_VERSION:
+            return 0
+
+        root = Path(root)
+        entries = payload["entries"]
+        with self._lock:
+            for relative_path, entry in entries.items():
+                self._documents[os.path.abspath(root / relative_path)] = entry
+            self.snapshot_entries += len(entries)
+        return len(entries)
+
+    def clear(self) -> None:
+        """Remove all cached documents and statistics."""
+        with self._lock:
+            self._documents.clear()
+            self._resolved.clear()
+            self.hits = 0
+            self.misses = 0
+            self.stale = 0
+            self.snapshot_entries = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "documents": len(self._documents),
+                "resolved_templates": sum(len(r) for _, r in self._resolved.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "snapshot_entries": self.snapshot_entries,
+            }
+
+
+_preset_registry = PresetRegistry()
+
+
+def get_preset_registry() -> PresetRegistry:
+    """Get the process-wide preset registry."""
+    return _preset_registry
+
+
+def clear_preset_cache() -> None:
+    """Clear the process-wide preset cache."""
+    _preset_registry.clear()
+
+
+def load_preset(path: Path) -> Dict[str, Any]:
+    """
+    Load any YAML preset file.
+
+    Parsed documents are cached by the process-wide PresetRegistry;
+    the returned dictionary is a copy the caller may modify.
+
+    Args:
+        path: Path to the preset YAML file
+
+    Returns:
+        Dictionary containing preset data
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        RuntimeError: If YAML file but PyYAML not available
+    """
+    return copy.deepcopy(_preset_registry.load(path))
+
+
 def get_lens_preset(name: str) -> Dict[str, Any]:
     """
     Load a specific lens preset by name.
@@ -81,7 +294,7 @@ def get_lens_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = CONFIG_ROOT / "lens_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     lenses = data.get("lenses", {})
     if name not in lenses:
@@ -90,7 +303,7 @@ def get_lens_preset(name: str) -> Dict[str, Any]:
             f"Lens preset '{name}' not found. Available: {available}"
         )
 
-    return lenses[name]
+    return copy.deepcopy(lenses[name])
 
 
 def get_sensor_preset(name: str) -> Dict[str, Any]:
@@ -109,7 +322,7 @@ def get_sensor_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = CONFIG_ROOT / "sensor_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     sensors = data.get("sensors", {})
     if name not in sensors:
@@ -118,7 +331,7 @@ def get_sensor_preset(name: str) -> Dict[str, Any]:
             f"Sensor preset '{name}' not found. Available: {available}"
         )
 
-    return sensors[name]
+    return copy.deepcopy(sensors[name])
 
 
 def get_rig_preset(name: str) -> Dict[str, Any]:
@@ -137,7 +350,7 @@ def get_rig_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = CONFIG_ROOT / "rig_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     rigs = data.get("rigs", {})
     if name not in rigs:
@@ -146,7 +359,7 @@ def get_rig_preset(name: str) -> Dict[str, Any]:
             f"Rig preset '{name}' not found. Available: {available}"
         )
 
-    return rigs[name]
+    return copy.deepcopy(rigs[name])
 
 
 def get_imperfection_preset(name: str) -> Dict[str, Any]:
@@ -165,7 +378,7 @@ def get_imperfection_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = CONFIG_ROOT / "imperfection_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     imperfections = data.get("imperfections", {})
     if name not in imperfections:
@@ -174,7 +387,7 @@ def get_imperfection_preset(name: str) -> Dict[str, Any]:
             f"Imperfection preset '{name}' not found. Available: {available}"
         )
 
-    return imperfections[name]
+    return copy.deepcopy(imperfections[name])
 
 
 def list_lens_presets() -> List[str]:
@@ -189,7 +402,7 @@ def list_lens_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = CONFIG_ROOT / "lens_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("lenses", {}).keys())
 
 
@@ -205,7 +418,7 @@ def list_sensor_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = CONFIG_ROOT / "sensor_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("sensors", {}).keys())
 
 
@@ -221,7 +434,7 @@ def list_rig_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = CONFIG_ROOT / "rig_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("rigs", {}).keys())
 
 
@@ -237,7 +450,7 @@ def list_imperfection_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = CONFIG_ROOT / "imperfection_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("imperfections", {}).keys())
 
 
@@ -315,7 +528,7 @@ def get_lighting_rig_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = LIGHTING_CONFIG_ROOT / "rig_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     rigs = data.get("rigs", {})
     if name not in rigs:
@@ -324,7 +537,7 @@ def get_lighting_rig_preset(name: str) -> Dict[str, Any]:
             f"Lighting rig preset '{name}' not found. Available: {available}"
         )
 
-    return rigs[name]
+    return copy.deepcopy(rigs[name])
 
 
 def get_gel_preset(name: str) -> Dict[str, Any]:
@@ -343,7 +556,7 @@ def get_gel_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = LIGHTING_CONFIG_ROOT / "gel_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     gels = data.get("gels", {})
     if name not in gels:
@@ -352,7 +565,7 @@ def get_gel_preset(name: str) -> Dict[str, Any]:
             f"Gel preset '{name}' not found. Available: {available}"
         )
 
-    return gels[name]
+    return copy.deepcopy(gels[name])
 
 
 def get_hdri_preset(name: str) -> Dict[str, Any]:
@@ -371,7 +584,7 @@ def get_hdri_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = LIGHTING_CONFIG_ROOT / "hdri_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     hdris = data.get("hdri", {})
     if name not in hdris:
@@ -380,7 +593,7 @@ def get_hdri_preset(name: str) -> Dict[str, Any]:
             f"HDRI preset '{name}' not found. Available: {available}"
         )
 
-    return hdris[name]
+    return copy.deepcopy(hdris[name])
 
 
 def list_lighting_rig_presets() -> List[str]:
@@ -395,7 +608,7 @@ def list_lighting_rig_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = LIGHTING_CONFIG_ROOT / "rig_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("rigs", {}).keys())
 
 
@@ -411,7 +624,7 @@ def list_gel_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = LIGHTING_CONFIG_ROOT / "gel_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("gels", {}).keys())
 
 
@@ -427,7 +640,7 @@ def list_hdri_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = LIGHTING_CONFIG_ROOT / "hdri_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("hdri", {}).keys())
 
 
@@ -452,7 +665,7 @@ def get_infinite_curve_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = BACKDROP_CONFIG_ROOT / "infinite_curves.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     curves = data.get("curves", {})
     if name not in curves:
@@ -461,7 +674,7 @@ def get_infinite_curve_preset(name: str) -> Dict[str, Any]:
             f"Infinite curve preset '{name}' not found. Available: {available}"
         )
 
-    return curves[name]
+    return copy.deepcopy(curves[name])
 
 
 def get_gradient_preset(name: str) -> Dict[str, Any]:
@@ -480,7 +693,7 @@ def get_gradient_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = BACKDROP_CONFIG_ROOT / "gradients.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     gradients = data.get("gradients", {})
     if name not in gradients:
@@ -489,7 +702,7 @@ def get_gradient_preset(name: str) -> Dict[str, Any]:
             f"Gradient preset '{name}' not found. Available: {available}"
         )
 
-    return gradients[name]
+    return copy.deepcopy(gradients[name])
 
 
 def get_environment_preset(name: str) -> Dict[str, Any]:
@@ -508,7 +721,7 @@ def get_environment_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = BACKDROP_CONFIG_ROOT / "environments.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     environments = data.get("environments", {})
     if name not in environments:
@@ -517,7 +730,7 @@ def get_environment_preset(name: str) -> Dict[str, Any]:
             f"Environment preset '{name}' not found. Available: {available}"
         )
 
-    return environments[name]
+    return copy.deepcopy(environments[name])
 
 
 def list_infinite_curve_presets() -> List[str]:
@@ -532,7 +745,7 @@ def list_infinite_curve_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = BACKDROP_CONFIG_ROOT / "infinite_curves.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("curves", {}).keys())
 
 
@@ -548,7 +761,7 @@ def list_gradient_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = BACKDROP_CONFIG_ROOT / "gradients.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("gradients", {}).keys())
 
 
@@ -564,7 +777,7 @@ def list_environment_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = BACKDROP_CONFIG_ROOT / "environments.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("environments", {}).keys())
 
 
@@ -592,7 +805,7 @@ def get_color_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = COLOR_CONFIG_ROOT / "color_management_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     presets = data.get("presets", {})
     if name not in presets:
@@ -601,7 +814,7 @@ def get_color_preset(name: str) -> Dict[str, Any]:
             f"Color preset '{name}' not found. Available: {available}"
         )
 
-    return presets[name]
+    return copy.deepcopy(presets[name])
 
 
 def get_technical_lut_preset(name: str) -> Dict[str, Any]:
@@ -620,7 +833,7 @@ def get_technical_lut_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = COLOR_CONFIG_ROOT / "technical_luts.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     luts = data.get("technical", {})
     if name not in luts:
@@ -628,7 +841,7 @@ def get_technical_lut_preset(name: str) -> Dict[str, Any]:
             f"Technical LUT '{name}' not found. Available: {list(luts.keys())}"
         )
 
-    return luts[name]
+    return copy.deepcopy(luts[name])
 
 
 def get_film_lut_preset(name: str) -> Dict[str, Any]:
@@ -647,7 +860,7 @@ def get_film_lut_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = COLOR_CONFIG_ROOT / "film_luts.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     luts = data.get("film", {})
     if name not in luts:
@@ -655,7 +868,7 @@ def get_film_lut_preset(name: str) -> Dict[str, Any]:
             f"Film LUT '{name}' not found. Available: {list(luts.keys())}"
         )
 
-    return luts[name]
+    return copy.deepcopy(luts[name])
 
 
 def list_color_presets() -> List[str]:
@@ -670,7 +883,7 @@ def list_color_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = COLOR_CONFIG_ROOT / "color_management_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("presets", {}).keys())
 
 
@@ -686,7 +899,7 @@ def list_technical_lut_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = COLOR_CONFIG_ROOT / "technical_luts.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("technical", {}).keys())
 
 
@@ -702,7 +915,7 @@ def list_film_lut_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = COLOR_CONFIG_ROOT / "film_luts.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("film", {}).keys())
 
 
@@ -730,7 +943,7 @@ def get_camera_move_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = ANIMATION_CONFIG_ROOT / "camera_moves.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     moves = data.get("moves", {})
     if name not in moves:
@@ -739,7 +952,7 @@ def get_camera_move_preset(name: str) -> Dict[str, Any]:
             f"Camera move preset '{name}' not found. Available: {available}"
         )
 
-    return moves[name]
+    return copy.deepcopy(moves[name])
 
 
 def get_easing_preset(name: str) -> Dict[str, Any]:
@@ -758,7 +971,7 @@ def get_easing_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = ANIMATION_CONFIG_ROOT / "easing_curves.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     curves = data.get("easing", {})
     if name not in curves:
@@ -767,7 +980,7 @@ def get_easing_preset(name: str) -> Dict[str, Any]:
             f"Easing preset '{name}' not found. Available: {available}"
         )
 
-    return curves[name]
+    return copy.deepcopy(curves[name])
 
 
 def get_turntable_preset(name: str) -> Dict[str, Any]:
@@ -786,7 +999,7 @@ def get_turntable_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = ANIMATION_CONFIG_ROOT / "turntable_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     presets = data.get("turntables", {})
     if name not in presets:
@@ -795,7 +1008,7 @@ def get_turntable_preset(name: str) -> Dict[str, Any]:
             f"Turntable preset '{name}' not found. Available: {available}"
         )
 
-    return presets[name]
+    return copy.deepcopy(presets[name])
 
 
 def list_camera_move_presets() -> List[str]:
@@ -810,7 +1023,7 @@ def list_camera_move_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = ANIMATION_CONFIG_ROOT / "camera_moves.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("moves", {}).keys())
 
 
@@ -826,7 +1039,7 @@ def list_easing_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = ANIMATION_CONFIG_ROOT / "easing_curves.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("easing", {}).keys())
 
 
@@ -842,7 +1055,7 @@ def list_turntable_presets() -> List[str]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = ANIMATION_CONFIG_ROOT / "turntable_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("turntables", {}).keys())
 
 
@@ -856,11 +1069,11 @@ RENDER_CONFIG_ROOT = Path("configs/cinematic/render")
 def get_quality_profile(name: str) -> Dict[str, Any]:
     """Load quality profile preset by name."""
     path = RENDER_CONFIG_ROOT / "quality_profiles.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     profiles = data.get("profiles", {})
     if name not in profiles:
         raise ValueError(f"Quality profile '{name}' not found. Available: {list(profiles.keys())}")
-    return profiles[name]
+    return copy.deepcopy(profiles[name])
 
 
 def get_pass_preset(name: str) -> Dict[str, Any]:
@@ -879,13 +1092,13 @@ def get_pass_preset(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = RENDER_CONFIG_ROOT / "pass_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     # Check in pass_groups section (from YAML structure)
     presets = data.get("pass_groups", {})
     if name not in presets:
         raise ValueError(f"Pass preset '{name}' not found. Available: {list(presets.keys())}")
-    return presets[name]
+    return copy.deepcopy(presets[name])
 
 
 def get_exr_settings(name: str) -> Dict[str, Any]:
@@ -904,32 +1117,32 @@ def get_exr_settings(name: str) -> Dict[str, Any]:
         RuntimeError: If YAML file but PyYAML not available
     """
     path = RENDER_CONFIG_ROOT / "pass_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     settings = data.get("exr_settings", {})
     if name not in settings:
         raise ValueError(f"EXR preset '{name}' not found. Available: {list(settings.keys())}")
-    return settings[name]
+    return copy.deepcopy(settings[name])
 
 
 def list_quality_profiles() -> List[str]:
     """List all available quality profile names."""
     path = RENDER_CONFIG_ROOT / "quality_profiles.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("profiles", {}).keys())
 
 
 def list_pass_presets() -> List[str]:
     """List all available pass preset names."""
     path = RENDER_CONFIG_ROOT / "pass_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("pass_groups", {}).keys())
 
 
 def list_exr_presets() -> List[str]:
     """List all available EXR preset names."""
     path = RENDER_CONFIG_ROOT / "pass_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("exr_settings", {}).keys())
 
 
@@ -943,68 +1156,68 @@ SUPPORT_CONFIG_ROOT = Path("configs/cinematic/support")
 def get_shuffle_preset(name: str) -> Dict[str, Any]:
     """Load shuffle preset by name."""
     path = SUPPORT_CONFIG_ROOT / "shuffle_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     presets = data.get("shuffle_presets", {})
     if name not in presets:
         raise ValueError(f"Shuffle preset '{name}' not found.")
-    return presets[name]
+    return copy.deepcopy(presets[name])
 
 
 def get_lens_fx_preset(name: str) -> Dict[str, Any]:
     """Load lens FX preset by name."""
     path = SUPPORT_CONFIG_ROOT / "lens_fx_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     presets = data.get("lens_fx_presets", {})
     if name not in presets:
         raise ValueError(f"Lens FX preset '{name}' not found.")
-    return presets[name]
+    return copy.deepcopy(presets[name])
 
 
 def list_shuffle_presets() -> List[str]:
     """List all available shuffle preset names."""
     path = SUPPORT_CONFIG_ROOT / "shuffle_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("shuffle_presets", {}).keys())
 
 
 def list_lens_fx_presets() -> List[str]:
     """List all available lens FX preset names."""
     path = SUPPORT_CONFIG_ROOT / "lens_fx_presets.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("lens_fx_presets", {}).keys())
 
 
 def get_depth_layer_preset(name: str) -> Dict[str, Any]:
     """Load depth layer preset by name."""
     path = SUPPORT_CONFIG_ROOT / "depth_layers.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     layers = data.get("layers", {})
     if name not in layers:
         raise ValueError(f"Depth layer preset '{name}' not found.")
-    return layers[name]
+    return copy.deepcopy(layers[name])
 
 
 def list_depth_layer_presets() -> List[str]:
     """List all available depth layer preset names."""
     path = SUPPORT_CONFIG_ROOT / "depth_layers.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("layers", {}).keys())
 
 
 def get_composition_guide_preset(name: str) -> Dict[str, Any]:
     """Load composition guide preset by name."""
     path = SUPPORT_CONFIG_ROOT / "composition_guides.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     guides = data.get("guides", {})
     if name not in guides:
         raise ValueError(f"Composition guide preset '{name}' not found.")
-    return guides[name]
+    return copy.deepcopy(guides[name])
 
 
 def list_composition_guide_presets() -> List[str]:
     """List all available composition guide preset names."""
     path = SUPPORT_CONFIG_ROOT / "composition_guides.yaml"
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("guides", {}).keys())
 
 
@@ -1032,14 +1245,14 @@ def get_shot_template(name: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Shot templates file not found: {path}")
 
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     templates = data.get("templates", {})
     if name not in templates:
         available = list(templates.keys())
         raise ValueError(f"Shot template '{name}' not found. Available: {available}")
 
-    return templates[name]
+    return copy.deepcopy(templates[name])
 
 
 def resolve_template_inheritance(
@@ -1052,7 +1265,8 @@ def resolve_template_inheritance(
 
     Args:
         template_name: Template to resolve
-        loaded_templates: Cache of already loaded templates
+        loaded_templates: Cache of already loaded templates (default:
+            resolved through the process-wide PresetRegistry)
         _chain: Internal - tracks inheritance chain for circular detection
 
     Returns:
@@ -1062,6 +1276,11 @@ def resolve_template_inheritance(
         ValueError: If circular inheritance detected or abstract template used directly
     """
     if loaded_templates is None:
+        if _chain is None:
+            # Memoized per version of templates.yaml
+            return copy.deepcopy(
+                _preset_registry.resolve_template(SHOT_CONFIG_ROOT / "templates.yaml", template_name)
+            )
         loaded_templates = {}
     if _chain is None:
         _chain = []
@@ -1123,7 +1342,7 @@ def list_shot_templates(include_abstract: bool = False) -> List[str]:
     if not path.exists():
         return []
 
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     templates = data.get("templates", {})
 
     if include_abstract:
@@ -1151,14 +1370,14 @@ def get_shot_assembly(name: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Shot assemblies file not found: {path}")
 
-    data = load_preset(path)
+    data = _preset_registry.load(path)
 
     assemblies = data.get("assemblies", {})
     if name not in assemblies:
         available = list(assemblies.keys())
         raise ValueError(f"Shot assembly '{name}' not found. Available: {available}")
 
-    return assemblies[name]
+    return copy.deepcopy(assemblies[name])
 
 
 def list_shot_assemblies() -> List[str]:
@@ -1176,7 +1395,7 @@ def list_shot_assemblies() -> List[str]:
     if not path.exists():
         return []
 
-    data = load_preset(path)
+    data = _preset_registry.load(path)
     return sorted(data.get("assemblies", {}).keys())
 
 
@@ -1204,15 +1423,14 @@ def get_camera_profile(name: str) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Camera profiles file not found: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _preset_registry.load(path)
 
     profiles = data.get("profiles", {})
     if name not in profiles:
         available = list(profiles.keys())
         raise ValueError(f"Camera profile '{name}' not found. Available: {available}")
 
-    return profiles[name]
+    return copy.deepcopy(profiles[name])
 
 
 def list_camera_profiles() -> List[str]:
@@ -1230,8 +1448,7 @@ def list_camera_profiles() -> List[str]:
     if not path.exists():
         return []
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = _preset_registry.load(path)
 
     return sorted(data.get("profiles", {}).keys())
 
@@ -149,6 +149,86 @@ class LensDistortion:
 
         return x, y
 
+    @staticmethod
+    def apply_brown_conrady_array(x, y, coeffs: DistortionCoefficients):
+        """
+        Apply Brown-Conrady distortion to coordinate arrays.
+
+        Same model as apply_brown_conrady, evaluated over whole numpy
+        arrays with in-place arithmetic to limit temporaries.
+
+        Args:
+            x, y: Arrays of normalized coordinates (centered at 0, 0)
+            coeffs: Distortion coefficients
+
+        Returns:
+            Distorted (x, y) arrays
+        """
+        import numpy as np
+
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        xx = x * x
+        yy = y * y
+        xy = x * y
+        r2 = xx + yy
+
+        # radial = 1 + k1*r2 + k2*r4 + k3*r6 (Horner form)
+        radial = coeffs.k3 * r2
+        radial += coeffs.k2
+        radial *= r2
+        radial += coeffs.k1
+        radial *= r2
+        radial += 1.0
+
+        x_dist = x * radial
+        x_dist += 2 * coeffs.p1 * xy
+        x_dist += coeffs.p2 * (r2 + 2 * xx)
+
+        y_dist = y * radial
+        y_dist += coeffs.p1 * (r2 + 2 * yy)
+        y_dist += 2 * coeffs.p2 * xy
+
+        return x_dist, y_dist
+
+    @staticmethod
+    def remove_brown_conrady_array(
+        x_dist,
+        y_dist,
+        coeffs: DistortionCoefficients,
+        iterations: int = 10,
+    ):
+        """
+        Remove Brown-Conrady distortion from coordinate arrays.
+
+        Runs the same fixed-point iteration as remove_brown_conrady,
+        updating the whole grid at once.
+
+        Args:
+            x_dist, y_dist: Arrays of distorted normalized coordinates
+            coeffs: Distortion coefficients
+            iterations: Number of iterations for convergence
+
+        Returns:
+            Undistorted (x, y) arrays
+        """
+        import numpy as np
+
+        x_dist = np.asarray(x_dist, dtype=np.float64)
+        y_dist = np.asarray(y_dist, dtype=np.float64)
+        x = x_dist.copy()
+        y = y_dist.copy()
+
+        for _ in range(iterations):
+            x_calc, y_calc = LensDistortion.apply_brown_conrady_array(x, y, coeffs)
+            x += x_dist
+            x -= x_calc
+            y += y_dist
+            y -= y_calc
+
+        return x, y
+
     @staticmethod
     def apply_simple_radial(
         x: float,
@@ -4,14 +4,20 @@ Point Tracker Module - Feature Detection and KLT Optical Flow
 Provides feature detection (FAST, Harris, SIFT) and KLT optical flow
 tracking for automatic 2D point tracking.
 
+When OpenCV is not installed, detection falls back to a NumPy
+Shi-Tomasi/Harris corner detector and tracking to a batched pyramidal
+Lucas-Kanade tracker. Image pyramids are cached per frame and shared
+between track_forward, track_backward and auto_track.
+
 Uses Blender API guards for testing outside Blender environment.
 """
 
 from __future__ import annotations
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List, Tuple, Callable
-import math
-import random
+import threading
+import time
 
 # Try to import numpy for calculations
 try:
@@ -132,6 +138,255 @@ class TrackingResult:
         }
 
 
+# Minimum structure-tensor eigenvalue (per window pixel, 0-1 intensities)
+# below which a point has too little texture to track
+MIN_EIGEN_THRESHOLD = 1e-6
+
+# Default number of frame pyramids kept by PointTracker
+DEFAULT_PYRAMID_CACHE_SIZE = 8
+
+# Harris detector free parameter
+HARRIS_K = 0.04
+
+
+def _to_gray(image: Any) -> Any:
+    """Convert an image to a float32 grayscale array in 0-1."""
+    arr = np.asarray(image)
+    scale = 1.0
+    if arr.dtype == np.uint8:
+        scale = 1.0 / 255.0
+    elif arr.dtype == np.uint16:
+        scale = 1.0 / 65535.0
+
+    arr = arr.astype(np.float32)
+    if arr.ndim == 3:
+        if arr.shape[2] >= 3:
+            arr = arr[..., 0] * 0.299 + arr[..., 1] * 0.587 + arr[..., 2] * 0.114
+        else:
+            arr = arr[..., 0]
+
+    if scale != 1.0:
+        arr *= scale
+    return arr
+
+
+def _pyr_down(image: Any) -> Any:
+    """Blur with a 5-tap binomial kernel and drop every other row/column."""
+    padded = np.pad(image, 2, mode="reflect")
+    rows = (
+        padded[:-4] + 4 * padded[1:-3] + 6 * padded[2:-2] + 4 * padded[3:-1] + padded[4:]
+    )
+    cols = (
+        rows[:, :-4] + 4 * rows[:, 1:-3] + 6 * rows[:, 2:-2] + 4 * rows[:, 3:-1] + rows[:, 4:]
+    )
+    return (cols[::2, ::2] * (1.0 / 256.0)).astype(np.float32)
+
+
+def _scharr_gradients(image: Any) -> Tuple[Any, Any]:
+    """Scharr derivatives in pixels^-1 with replicated borders."""
+    p = np.pad(image, 1, mode="edge")
+    smooth_y = 3 * p[:-2] + 10 * p[1:-1] + 3 * p[2:]
+    smooth_x = 3 * p[:, :-2] + 10 * p[:, 1:-1] + 3 * p[:, 2:]
+    gx = (smooth_y[:, 2:] - smooth_y[:, :-2]) * (1.0 / 32.0)
+    gy = (smooth_x[2:] - smooth_x[:-2]) * (1.0 / 32.0)
+    return gx.astype(np.float32), gy.astype(np.float32)
+
+
+def _box_sum(image: Any, radius: int) -> Any:
+    """Sum over a (2r+1)x(2r+1) window using cumulative sums."""
+    size = 2 * radius + 1
+    p = np.pad(image, radius, mode="edge").astype(np.float64)
+    c = np.zeros((p.shape[0] + 1, p.shape[1] + 1))
+    c[1:, 1:] = p.cumsum(0).cumsum(1)
+    return (c[size:, size:] - c[:-size, size:] - c[size:, :-size] + c[:-size, :-size]).astype(np.float32)
+
+
+def _bilinear(image: Any, x: Any, y: Any) -> Any:
+    """Sample an image at float coordinates with clamped borders."""
+    h, w = image.shape
+    x = np.clip(x, 0.0, w - 1.0)
+    y = np.clip(y, 0.0, h - 1.0)
+    x0 = np.minimum(x.astype(np.int64), max(w - 2, 0))
+    y0 = np.minimum(y.astype(np.int64), max(h - 2, 0))
+    fx = (x - x0).astype(np.float32)
+    fy = (y - y0).astype(np.float32)
+
+    flat = image.ravel()
+    idx = y0 * w + x0
+    x_step = 1 if w > 1 else 0
+    y_step = w if h > 1 else 0
+    top = flat[idx] * (1 - fx) + flat[idx + x_step] * fx
+    bottom = flat[idx + y_step] * (1 - fx) + flat[idx + y_step + x_step] * fx
+    return top * (1 - fy) + bottom * fy
+
+
+def _sample_windows(image: Any, cx: Any, cy: Any, radius: int) -> Any:
+    """
+    Bilinearly sample square windows centred on float positions.
+
+    Every sample in a window shares the same fractional offset, so one
+    (2r+2)^2 patch is gathered per point and interpolated with slicing.
+
+    Args:
+        image: (height, width) float32 image
+        cx, cy: (N,) window centres
+        radius: Window radius (window size 2r+1)
+
+    Returns:
+        float32 (N, (2r+1)^2) samples in row-major window order
+    """
+    h, w = image.shape
+    fx0 = np.floor(cx)
+    fy0 = np.floor(cy)
+    fx = (cx - fx0).astype(np.float32)[:, None, None]
+    fy = (cy - fy0).astype(np.float32)[:, None, None]
+
+    span = np.arange(-radius, radius + 2)
+    xs = np.clip(fx0.astype(np.int64)[:, None] + span, 0, w - 1)
+    ys = np.clip(fy0.astype(np.int64)[:, None] + span, 0, h - 1)
+    patch = np.take(image, (ys * w)[:, :, None] + xs[:, None, :])
+
+    # Separable interpolation: along x, then along y
+    rows = patch[:, :, :-1] + (patch[:, :, 1:] - patch[:, :, :-1]) * fx
+    return (rows[:, :-1] + (rows[:, 1:] - rows[:, :-1]) * fy).reshape(len(cx), -1)
+
+
+class ImagePyramid:
+    """
+    Grayscale Gaussian pyramid of one frame with lazily computed gradients.
+
+    Levels are built on demand, so a pyramid created for detection only
+    costs the level-0 conversion. The original image is kept in
+    ``source`` for OpenCV code paths.
+    """
+
+    def __init__(self, image: Any):
+        """
+        Initialize pyramid.
+
+        Args:
+            image: Frame image (grayscale or RGB, uint8/uint16/float)
+        """
+        self.source = image
+        self._levels: List[Any] = [_to_gray(image)]
+        self._gradients: Dict[int, Tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(height, width) of the full resolution level."""
+        return self._levels[0].shape
+
+    def level(self, index: int) -> Any:
+        """Get pyramid level (0 = full resolution)."""
+        with self._lock:
+            while len(self._levels) <= index:
+                self._levels.append(_pyr_down(self._levels[-1]))
+            return self._levels[index]
+
+    def gradients(self, index: int) -> Tuple[Any, Any]:
+        """Get (grad_x, grad_y) of a pyramid level."""
+        image = self.level(index)
+        with self._lock:
+            if index not in self._gradients:
+                self._gradients[index] = _scharr_gradients(image)
+            return self._gradients[index]
+
+    def max_level(self, requested: int, window_size: int) -> int:
+        """Highest usable level that is still larger than the window."""
+        h, w = self.shape
+        level = 0
+        while level < requested and min(h, w) >> (level + 1) >= window_size:
+            level += 1
+        return level
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by levels and gradients."""
+        total = sum(level.nbytes for level in self._levels)
+        total += sum(gx.nbytes + gy.nbytes for gx, gy in self._gradients.values())
+        return total
+
+
+class PyramidCache:
+    """
+    LRU cache of frame pyramids keyed by (frame source, frame number).
+
+    Each frame's pyramid is built once and reused by every pass that
+    touches the frame (forward, backward, replenishment detection).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_PYRAMID_CACHE_SIZE):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum pyramids kept in memory
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[Tuple[Any, int], ImagePyramid]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, frame: int, get_frame_func: Callable[[int], Any]) -> ImagePyramid:
+        """
+        Get the pyramid for a frame, loading it on a miss.
+
+        Args:
+            frame: Frame number
+            get_frame_func: Function to get frame image by frame number
+
+        Returns:
+            ImagePyramid for the frame
+        """
+        key = (get_frame_func, frame)
+        with self._lock:
+            pyramid = self._entries.get(key)
+            if pyramid is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return pyramid
+            self.misses += 1
+
+        pyramid = ImagePyramid(get_frame_func(frame))
+
+        with self._lock:
+            self._entries[key] = pyramid
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return pyramid
+
+    def clear(self) -> None:
+        """Drop all cached pyramids and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "bytes": sum(p.nbytes for p in self._entries.values()),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _as_pyramid(image: Any) -> ImagePyramid:
+    return image if isinstance(image, ImagePyramid) else ImagePyramid(image)
+
+
+def _as_source(image: Any) -> Any:
+    return image.source if isinstance(image, ImagePyramid) else image
+
+
 class FeatureDetectorEngine:
     """
     Feature detection engine supporting multiple algorithms.
@@ -159,20 +414,19 @@ class FeatureDetectorEngine:
         Detect features in an image.
 
         Args:
-            image: Input image (grayscale)
+            image: Input image (grayscale) or ImagePyramid
             mask: Optional mask for detection region
             max_features: Override max features from config
 
         Returns:
             DetectionResult with detected features
         """
-        import time
         start_time = time.time()
 
         max_features = max_features or self.config.max_features
 
         if HAS_OPENCV:
-            features = self._detect_opencv(image, mask, max_features)
+            features = self._detect_opencv(_as_source(image), mask, max_features)
         else:
             features = self._detect_fallback(image, mask, max_features)
 
@@ -204,16 +458,16 @@ class FeatureDetectorEngine:
             )
             keypoints = fd.detect(image, mask)
 
-        elif detector == FeatureDetector.HARRIS:
-            # Harris corner detection via goodFeaturesToTrack
+        elif detector in (FeatureDetector.HARRIS, FeatureDetector.SHI_TOMASI):
+            # Harris / Shi-Tomasi corner detection via goodFeaturesToTrack
             corners = cv2.goodFeaturesToTrack(
                 image,
                 maxCorners=max_features,
                 qualityLevel=self.config.track_threshold,
-                minDistance=10,
+                minDistance=self.config.min_distance,
                 mask=mask,
-                useHarrisDetector=True,
-                k=0.04,
+                useHarrisDetector=detector == FeatureDetector.HARRIS,
+                k=HARRIS_K,
             )
             keypoints = [cv2.KeyPoint(x=c[0][0], y=c[0][1], size=10) for c in corners] if corners is not None else []
 
@@ -251,26 +505,109 @@ class FeatureDetectorEngine:
         mask: Optional[Any],
         max_features: int,
     ) -> List[FeaturePoint]:
-        """Fallback detection for testing without OpenCV."""
-        # Generate mock features for testing
-        features = []
+        """
+        Detect corners with NumPy when OpenCV is unavailable.
 
-        # Create a grid of mock feature points
-        grid_size = int(math.sqrt(max_features))
-        for i in range(grid_size):
-            for j in range(grid_size):
-                x = 0.1 + 0.8 * i / grid_size + random.uniform(-0.02, 0.02)
-                y = 0.1 + 0.8 * j / grid_size + random.uniform(-0.02, 0.02)
-                strength = random.uniform(0.5, 1.0)
-
-                features.append(FeaturePoint(
-                    position=(x, y),
-                    strength=strength,
-                    scale=random.uniform(0.8, 1.2),
-                    angle=random.uniform(0, 2 * math.pi),
-                ))
+        Harris uses the Harris response; every other detector falls back
+        to Shi-Tomasi (minimum eigenvalue), which is what KLT tracks best.
+        """
+        if not HAS_NUMPY:
+            return []
+
+        pyramid = _as_pyramid(image)
+        h, w = pyramid.shape
+        response = self.corner_response(pyramid)
+
+        # Keep features far enough from the border for a full KLT window
+        border = max(1, self.config.flow_window_size // 2)
+        valid = np.zeros((h, w), dtype=bool)
+        valid[border:h - border, border:w - border] = True
+        if mask is not None:
+            valid &= np.asarray(mask).reshape(h, w) > 0
+
+        max_response = response[valid].max() if valid.any() else 0.0
+        if max_response <= 0:
+            return []
+
+        # Quality threshold relative to the strongest corner + 3x3 non-max suppression
+        threshold = max_response * self.config.track_threshold
+        padded = np.pad(response, 1, mode="constant", constant_values=-np.inf)
+        local_max = response.copy()
+        for dy in range(3):
+            for dx in range(3):
+                np.maximum(local_max, padded[dy:dy + h, dx:dx + w], out=local_max)
+        candidates = valid & (response >= threshold) & (response >= local_max)
+
+        ys, xs = np.nonzero(candidates)
+        strengths = response[ys, xs]
+        order = np.argsort(-strengths, kind="stable")
+        xs, ys, strengths = xs[order], ys[order], strengths[order] / max_response
+
+        selected = self._enforce_min_distance(xs, ys, max_features)
+
+        return [
+            FeaturePoint(
+                position=(float(xs[i]) / w, float(ys[i]) / h),
+                strength=float(strengths[i]),
+            )
+            for i in selected
+        ]
+
+    def corner_response(self, image: Any) -> Any:
+        """
+        Compute the per-pixel corner response map.
+
+        Args:
+            image: Image or ImagePyramid
+
+        Returns:
+            float32 (height, width) response (Harris or Shi-Tomasi)
+        """
+        gx, gy = _as_pyramid(image).gradients(0)
+        sxx = _box_sum(gx * gx, 1)
+        syy = _box_sum(gy * gy, 1)
+        sxy = _box_sum(gx * gy, 1)
+
+        if self.config.detector == FeatureDetector.HARRIS:
+            trace = sxx + syy
+            return sxx * syy - sxy * sxy - HARRIS_K * trace * trace
+
+        half_trace = (sxx + syy) * 0.5
+        return half_trace - np.sqrt(((sxx - syy) * 0.5) ** 2 + sxy * sxy)
+
+    def _enforce_min_distance(self, xs: Any, ys: Any, max_features: int) -> List[int]:
+        """Greedy min-distance selection of strength-sorted candidates."""
+        min_distance = self.config.min_distance
+        if min_distance <= 0:
+            return list(range(min(len(xs), max_features)))
+
+        min_dist_sq = min_distance * min_distance
+        grid: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        selected = []
+
+        for i, (x, y) in enumerate(zip(xs.tolist(), ys.tolist())):
+            cell_x = x // min_distance
+            cell_y = y // min_distance
+            too_close = False
+            for gy in range(cell_y - 1, cell_y + 2):
+                for gx in range(cell_x - 1, cell_x + 2):
+                    for px, py in grid.get((gx, gy), ()):
+                        if (px - x) ** 2 + (py - y) ** 2 < min_dist_sq:
+                            too_close = True
+                            break
+                    if too_close:
+                        break
+                if too_close:
+                    break
+            if too_close:
+                continue
+
+            grid.setdefault((cell_x, cell_y), []).append((x, y))
+            selected.append(i)
+            if len(selected) >= max_features:
+                break
 
-        return features[:max_features]
+        return selected
 
 
 class KLTTracker:
@@ -301,15 +638,20 @@ class KLTTracker:
         Track points from previous frame to current frame.
 
         Args:
-            prev_image: Previous frame (grayscale)
-            curr_image: Current frame (grayscale)
+            prev_image: Previous frame (grayscale) or ImagePyramid
+            curr_image: Current frame (grayscale) or ImagePyramid
             prev_points: Points to track in normalized coords
 
         Returns:
             Tuple of (new_points, status, errors)
         """
+        if not prev_points:
+            return [], [], []
+
         if HAS_OPENCV:
-            return self._track_opencv(prev_image, curr_image, prev_points)
+            return self._track_opencv(
+                _as_source(prev_image), _as_source(curr_image), prev_points
+            )
         else:
             return self._track_fallback(prev_image, curr_image, prev_points)
 
@@ -365,25 +707,117 @@ class KLTTracker:
         curr_image: Any,
         prev_points: List[Tuple[float, float]],
     ) -> Tuple[List[Tuple[float, float]], List[bool], List[float]]:
-        """Fallback tracking for testing without OpenCV."""
-        tracked_points = []
-        status = []
-        errors = []
-
-        for x, y in prev_points:
-            # Simulate some motion and tracking failure
-            if random.random() > 0.1:  # 90% success rate
-                dx = random.uniform(-0.01, 0.01)
-                dy = random.uniform(-0.01, 0.01)
-                tracked_points.append((x + dx, y + dy))
-                status.append(True)
-                errors.append(random.uniform(0.0, 0.5))
+        """Track with the NumPy pyramidal KLT when OpenCV is unavailable."""
+        if not HAS_NUMPY:
+            return list(prev_points), [False] * len(prev_points), [1.0] * len(prev_points)
+
+        prev_pyramid = _as_pyramid(prev_image)
+        curr_pyramid = _as_pyramid(curr_image)
+        h, w = prev_pyramid.shape
+
+        points = np.asarray(prev_points, dtype=np.float64).reshape(-1, 2) * (w, h)
+        new_points, status, errors = self.track_pixels(prev_pyramid, curr_pyramid, points)
+
+        normalized = new_points / (w, h)
+        tracked_points = [
+            (float(x), float(y)) if ok else tuple(p)
+            for (x, y), ok, p in zip(normalized.tolist(), status.tolist(), prev_points)
+        ]
+        tracked_errors = [float(e) if ok else 1.0 for e, ok in zip(errors.tolist(), status.tolist())]
+        return tracked_points, status.tolist(), tracked_errors
+
+    def track_pixels(
+        self,
+        prev_image: Any,
+        curr_image: Any,
+        points: Any,
+    ) -> Tuple[Any, Any, Any]:
+        """
+        Track a batch of points with pyramidal Lucas-Kanade in NumPy.
+
+        All points are solved together: window samples are gathered as
+        (points, window) arrays and each Gauss-Newton step updates every
+        unconverged point at once, coarse to fine through the pyramid.
+
+        Args:
+            prev_image: Previous frame or ImagePyramid
+            curr_image: Current frame or ImagePyramid
+            points: (N, 2) pixel coordinates in the previous frame
+
+        Returns:
+            Tuple of (new_points (N, 2), status (N,) bool, errors (N,))
+            where errors are mean absolute residuals in 0-1 intensity
+        """
+        prev_pyramid = _as_pyramid(prev_image)
+        curr_pyramid = _as_pyramid(curr_image)
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        count = len(points)
+
+        h, w = prev_pyramid.shape
+        radius = max(1, self.config.flow_window_size // 2)
+        window_area = (2 * radius + 1) ** 2
+
+        max_level = prev_pyramid.max_level(self.config.flow_max_level, 2 * radius + 1)
+        flow = np.zeros((count, 2))
+        status = np.ones(count, dtype=bool)
+        errors = np.zeros(count)
+
+        for level in range(max_level, -1, -1):
+            scale = 1.0 / (1 << level)
+            prev_level = prev_pyramid.level(level)
+            curr_level = curr_pyramid.level(level)
+            grad_x, grad_y = prev_pyramid.gradients(level)
+
+            cx = points[:, 0] * scale
+            cy = points[:, 1] * scale
+            template = _sample_windows(prev_level, cx, cy, radius)
+            ix = _sample_windows(grad_x, cx, cy, radius)
+            iy = _sample_windows(grad_y, cx, cy, radius)
+
+            gxx = (ix * ix).sum(axis=1, dtype=np.float64)
+            gyy = (iy * iy).sum(axis=1, dtype=np.float64)
+            gxy = (ix * iy).sum(axis=1, dtype=np.float64)
+            det = gxx * gyy - gxy * gxy
+            min_eig = 0.5 * (gxx + gyy - np.sqrt((gxx - gyy) ** 2 + 4 * gxy * gxy))
+            textured = min_eig / window_area > MIN_EIGEN_THRESHOLD
+            if level == 0:
+                status &= textured
+
+            active = np.flatnonzero(textured & status)
+            for _ in range(self.config.flow_max_iterations):
+                if active.size == 0:
+                    break
+
+                warped = _sample_windows(
+                    curr_level, cx[active] + flow[active, 0], cy[active] + flow[active, 1], radius
+                )
+                diff = template[active] - warped
+                bx = (diff * ix[active]).sum(axis=1, dtype=np.float64)
+                by = (diff * iy[active]).sum(axis=1, dtype=np.float64)
+
+                d = det[active]
+                step_x = (gyy[active] * bx - gxy[active] * by) / d
+                step_y = (gxx[active] * by - gxy[active] * bx) / d
+                flow[active, 0] += step_x
+                flow[active, 1] += step_y
+
+                moving = step_x * step_x + step_y * step_y >= self.config.flow_epsilon ** 2
+                active = active[moving]
+
+            if level > 0:
+                flow *= 2.0
             else:
-                tracked_points.append((x, y))
-                status.append(False)
-                errors.append(1.0)
+                warped = _sample_windows(curr_level, cx + flow[:, 0], cy + flow[:, 1], radius)
+                errors = np.abs(template - warped).mean(axis=1)
+
+        new_points = points + flow
+        inside = (
+            (new_points[:, 0] >= 0) & (new_points[:, 0] <= w - 1) &
+            (new_points[:, 1] >= 0) & (new_points[:, 1] <= h - 1)
+        )
+        status &= inside & np.isfinite(new_points).all(axis=1) & (errors <= self.config.max_error)
 
-        return tracked_points, status, errors
+        return new_points, status, errors
 
 
 class PointTracker:
@@ -394,16 +828,48 @@ class PointTracker:
     tracking 50+ features across video frames.
     """
 
-    def __init__(self, config: Optional[TrackingConfig] = None):
+    def __init__(
+        self,
+        config: Optional[TrackingConfig] = None,
+        pyramid_cache: Optional[PyramidCache] = None,
+    ):
         """
         Initialize point tracker.
 
         Args:
             config: Tracking configuration
+            pyramid_cache: Frame pyramid cache (shared by all tracking passes)
         """
         self.config = config or TrackingConfig()
         self.detector = FeatureDetectorEngine(self.config)
         self.klt = KLTTracker(self.config)
+        self.pyramid_cache = pyramid_cache or PyramidCache()
+
+    def _get_frame(self, frame: int, get_frame_func: Callable[[int], Any]) -> ImagePyramid:
+        """Get a frame's cached pyramid."""
+        return self.pyramid_cache.get(frame, get_frame_func)
+
+    def _track_step(
+        self,
+        tracks: List[Track],
+        from_frame: int,
+        prev_image: Any,
+        curr_image: Any,
+    ) -> Tuple[List[Track], List[Tuple[float, float]], List[bool], List[float]]:
+        """Track every OK point of from_frame into the next image as one batch."""
+        prev_points = []
+        active_tracks = []
+        for track in tracks:
+            point = track.get_point_at_frame(from_frame)
+            if point and point.status == TrackStatus.OK:
+                prev_points.append(point.position)
+                active_tracks.append(track)
+
+        if not prev_points:
+            return [], [], [], []
+
+        new_points, status, errors = self.klt.track(prev_image, curr_image, prev_points)
+        return active_tracks, new_points, status, errors
 
     def detect_features(
         self,
@@ -483,7 +949,6 @@ class PointTracker:
         Returns:
             TrackingResult with updated tracks
         """
-        import time
         start_time = time.time()
 
         total_frames = end_frame - start_frame
@@ -491,28 +956,19 @@ class PointTracker:
         tracked_frames = 0
 
         # Get initial frame
-        prev_image = get_frame_func(start_frame)
+        prev_image = self._get_frame(start_frame, get_frame_func)
 
         for frame in range(start_frame + 1, end_frame + 1):
-            curr_image = get_frame_func(frame)
-
-            # Get points from previous frame for each track
-            prev_points = []
-            active_tracks = []
-            for track in tracks:
-                point = track.get_point_at_frame(frame - 1)
-                if point and point.status == TrackStatus.OK:
-                    prev_points.append(point.position)
-                    active_tracks.append(track)
-
-            if not prev_points:
-                break
+            curr_image = self._get_frame(frame, get_frame_func)
 
-            # Track points
-            new_points, status, errors = self.klt.track(
-                prev_image, curr_image, prev_points
+            # Track all active points from the previous frame
+            active_tracks, new_points, status, errors = self._track_step(
+                tracks, frame - 1, prev_image, curr_image
             )
 
+            if not active_tracks:
+                break
+
             # Update tracks with new positions
             for i, track in enumerate(active_tracks):
                 if status[i]:
@@ -575,33 +1031,24 @@ class PointTracker:
         Returns:
             TrackingResult with updated tracks
         """
-        import time
         start_time = time.time()
 
         total_frames = start_frame - end_frame
         lost_count = 0
         tracked_frames = 0
 
-        prev_image = get_frame_func(start_frame)
+        prev_image = self._get_frame(start_frame, get_frame_func)
 
         for frame in range(start_frame - 1, end_frame - 1, -1):
-            curr_image = get_frame_func(frame)
+            curr_image = self._get_frame(frame, get_frame_func)
 
-            prev_points = []
-            active_tracks = []
-            for track in tracks:
-                point = track.get_point_at_frame(frame + 1)
-                if point and point.status == TrackStatus.OK:
-                    prev_points.append(point.position)
-                    active_tracks.append(track)
+            active_tracks, new_points, status, errors = self._track_step(
+                tracks, frame + 1, prev_image, curr_image
+            )
 
-            if not prev_points:
+            if not active_tracks:
                 break
 
-            new_points, status, errors = self.klt.track(
-                prev_image, curr_image, prev_points
-            )
-
             for i, track in enumerate(active_tracks):
                 if status[i]:
                     track.points.insert(0, TrackPoint(  # Insert at start for backward
@@ -653,19 +1100,21 @@ class PointTracker:
         Args:
             session: Tracking session
             get_frame_func: Function to get frame image by frame number
-            start_frame: Start frame (uses session.footage if None)
-            end_frame: End frame (uses session.footure if None)
+            start_frame: Start frame (uses session.frame_start if None)
+            end_frame: End frame (uses session.frame_end if None)
             min_tracks: Minimum active tracks at any time
             progress_callback: Progress callback (progress, stage_name)
 
         Returns:
             TrackingResult with all tracks
         """
+        start_time = time.time()
+
         # Get frame range
         if start_frame is None:
-            start_frame = session.footage.frame_start
+            start_frame = session.frame_start
         if end_frame is None:
-            end_frame = session.footage.frame_end
+            end_frame = session.frame_end
         if min_tracks is None:
             min_tracks = self.config.min_features
 
@@ -673,55 +1122,49 @@ class PointTracker:
         if progress_callback:
             progress_callback(0.0, "detecting")
 
-        initial_image = get_frame_func(start_frame)
+        initial_image = self._get_frame(start_frame, get_frame_func)
         tracks = self.detect_features(start_frame, initial_image)
 
         # Track forward with feature replenishment
         all_tracks = list(tracks)
+        lost_count = 0
 
         for frame in range(start_frame + 1, end_frame + 1):
-            # Count active tracks
-            active_count = sum(
-                1 for t in all_tracks
-                if t.get_point_at_frame(frame - 1) and
-                t.get_point_at_frame(frame - 1).status == TrackStatus.OK
+            prev_image = self._get_frame(frame - 1, get_frame_func)
+            curr_image = self._get_frame(frame, get_frame_func)
+
+            # Track all active tracks as one batch
+            active_tracks, new_points, status, errors = self._track_step(
+                all_tracks, frame - 1, prev_image, curr_image
             )
 
+            for i, track in enumerate(active_tracks):
+                track.points.append(TrackPoint(
+                    frame=frame,
+                    position=new_points[i],
+                    status=TrackStatus.OK if status[i] else TrackStatus.MISSING,
+                    error=errors[i],
+                ))
+                if not status[i]:
+                    lost_count += 1
+
             # Replenish if below minimum
+            active_count = sum(1 for ok in status if ok)
             if active_count < min_tracks:
-                image = get_frame_func(frame)
                 new_tracks = self.detect_features(
-                    frame, image, exclude_existing=all_tracks
+                    frame, curr_image, exclude_existing=all_tracks
                 )
                 all_tracks.extend(new_tracks)
 
-            # Track existing tracks
-            if frame > start_frame:
-                prev_image = get_frame_func(frame - 1)
-                curr_image = get_frame_func(frame)
-
-                for track in all_tracks:
-                    point = track.get_point_at_frame(frame - 1)
-                    if point and point.status == TrackStatus.OK:
-                        # Track single point
-                        new_points, status, errors = self.klt.track(
-                            prev_image, curr_image, [point.position]
-                        )
-
-                        track.points.append(TrackPoint(
-                            frame=frame,
-                            position=new_points[0],
-                            status=TrackStatus.OK if status[0] else TrackStatus.MISSING,
-                            error=errors[0],
-                        ))
-
             if progress_callback:
                 progress = (frame - start_frame) / (end_frame - start_frame)
                 progress_callback(progress, "tracking")
 
         return TrackingResult(
             tracks=all_tracks,
-            tracked_frames=end_frame - start_frame,
+            tracked_frames=max(0, end_frame - start_frame),
+            lost_tracks=lost_count,
+            tracking_time_ms=(time.time() - start_time) * 1000,
         )
 
     def _generate_track_color(self, index: int) -> Tuple[float, float, float]:
@@ -820,3 +1263,128 @@ class PointTracker:
                 cv2.circle(vis, (x, y), 4, (0, 0, 255), 1)
 
         return vis
+
+
+def synthetic_translated_sequence(
+    width: int = 320,
+    height: int = 240,
+    frames: int = 10,
+    shift: Tuple[float, float] = (1.5, -0.75),
+    seed: int = 0,
+) -> List[Any]:
+    """
+    Build a sequence of a smooth random texture translating at constant speed.
+
+    Frame t shows the texture moved by t * shift pixels, so a point at
+    (x, y) in frame 0 is at (x + t*dx, y + t*dy) in frame t.
+
+    Args:
+        width: Frame width
+        height: Frame height
+        frames: Number of frames
+        shift: Per-frame (dx, dy) translation in pixels
+        seed: Random seed
+
+    Returns:
+        List of float32 (height, width) frames in 0-1
+    """
+    rng = np.random.default_rng(seed)
+    margin = int(max(abs(shift[0]), abs(shift[1])) * frames) + 8
+    texture = rng.random((height + 2 * margin, width + 2 * margin)).astype(np.float32)
+    for _ in range(2):
+        texture = _box_sum(texture, 2) / 25.0
+    texture = (texture - texture.min()) / (texture.max() - texture.min())
+
+    ys, xs = np.mgrid[0:height, 0:width].astype(np.float64)
+    return [
+        _bilinear(texture, xs + margin - t * shift[0], ys + margin - t * shift[1])
+        for t in range(frames)
+    ]
+
+
+def benchmark_point_tracker(
+    width: int = 640,
+    height: int = 360,
+    frames: int = 20,
+    point_counts: Tuple[int, ...] = (50, 200, 800),
+    shift: Tuple[float, float] = (1.5, -0.75),
+    seed: int = 0,
+    config: Optional[TrackingConfig] = None,
+) -> Dict[str, Any]:
+    """
+    Measure NumPy detection and KLT throughput on a synthetic sequence.
+
+    Points are chained frame to frame through the whole sequence and
+    compared against the known translation.
+
+    Args:
+        width: Frame width
+        height: Frame height
+        frames: Number of frames
+        point_counts: Batch sizes to benchmark
+        shift: Per-frame (dx, dy) translation in pixels
+        seed: Random seed
+        config: Tracking configuration
+
+    Returns:
+        Dict with "pyramid_seconds", "detection" and per-count "klt" entries
+        (points, frames, seconds, point_frames_per_second, mean_error_px,
+        tracked_fraction)
+    """
+    config = config or TrackingConfig()
+    sequence = synthetic_translated_sequence(width, height, frames, shift, seed)
+    tracker = KLTTracker(config)
+    detector = FeatureDetectorEngine(config)
+
+    start = time.perf_counter()
+    pyramids = [ImagePyramid(frame) for frame in sequence]
+    level_count = pyramids[0].max_level(config.flow_max_level, config.flow_window_size)
+    for pyramid in pyramids:
+        for level in range(level_count + 1):
+            pyramid.gradients(level)
+    pyramid_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    features = detector._detect_fallback(pyramids[0], None, max(point_counts))
+    detection_seconds = time.perf_counter() - start
+
+    # Start points well inside the frame so they stay visible throughout
+    rng = np.random.default_rng(seed)
+    travel = np.abs(np.asarray(shift)) * frames
+    border = config.flow_window_size
+    low = np.array([border, border]) + np.maximum(-np.asarray(shift), 0) * frames
+    high = np.array([width - border, height - border]) - np.maximum(np.asarray(shift), 0) * frames
+    if np.any(high <= low):
+        raise ValueError(f"Frame too small for {travel} pixels of travel")
+
+    klt = {}
+    for count in point_counts:
+        start_points = rng.uniform(low, high, (count, 2))
+        points = start_points.copy()
+        alive = np.ones(count, dtype=bool)
+
+        start = time.perf_counter()
+        for t in range(1, frames):
+            points, status, _ = tracker.track_pixels(pyramids[t - 1], pyramids[t], points)
+            alive &= status
+        seconds = time.perf_counter() - start
+
+        expected = start_points + np.asarray(shift) * (frames - 1)
+        error = np.linalg.norm(points - expected, axis=1)
+        klt[count] = {
+            "points": count,
+            "frames": frames - 1,
+            "seconds": seconds,
+            "point_frames_per_second": count * (frames - 1) / seconds if seconds > 0 else float("inf"),
+            "mean_error_px": float(error[alive].mean()) if alive.any() else float("nan"),
+            "tracked_fraction": float(alive.mean()),
+        }
+
+    return {
+        "pyramid_seconds": pyramid_seconds,
+        "detection": {
+            "features": len(features),
+            "seconds": detection_seconds,
+        },
+        "klt": klt,
+    }
@@ -10,13 +10,29 @@ ST-Map format:
 - Green channel: Y displacement (vertical)
 - Blue channel: Often unused or stores additional data
 - Values encoded as 0-1 normalized coordinates
+
+Maps are generated as float32 HxWx4 arrays in row bands and written
+with streaming OpenEXR/PNG writers, so large maps never exist as
+per-pixel Python objects.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple, Callable, Iterable, Iterator
 from pathlib import Path
-import math
+import hashlib
+import json
+import os
+import struct
+import zlib
+
+# Try to import numpy for array processing
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 # Blender API guard
 try:
@@ -33,6 +49,20 @@ from .calibration import (
 )
 
 
+# Pixels evaluated per generation band
+DEFAULT_BAND_PIXELS = 1 << 18
+
+# OpenEXR constants
+EXR_MAGIC = 20000630
+EXR_HALF = 1
+EXR_FLOAT = 2
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Bytes of compressed PNG data buffered before an IDAT chunk is flushed
+PNG_IDAT_CHUNK = 1 << 16
+
+
 @dataclass
 class STMapConfig:
     """
@@ -88,15 +118,24 @@ class STMapResult:
     Attributes:
         width: Map width
         height: Map height
-        data: Pixel data as list of (r, g, b, a) tuples
+        pixels: Pixel data as float32 array of shape (height, width, 4)
         output_path: Path where map was saved
         generation_time_ms: Time taken to generate
+        cached: True if pixels were loaded from the map cache
     """
     width: int = 0
     height: int = 0
-    data: List[Tuple[float, float, float, float]] = field(default_factory=list)
+    pixels: Optional[Any] = None
     output_path: str = ""
     generation_time_ms: float = 0.0
+    cached: bool = False
+
+    @property
+    def data(self) -> List[Tuple[float, float, float, float]]:
+        """Pixel data as a list of (r, g, b, a) tuples (slow, for compatibility)."""
+        if self.pixels is None:
+            return []
+        return [tuple(p) for p in self.pixels.reshape(-1, 4).tolist()]
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -107,6 +146,11 @@ class STMapResult:
         }
 
 
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for ST-Map processing")
+
+
 class STMapGenerator:
     """
     Generator for UV distortion maps.
@@ -124,30 +168,26 @@ class STMapGenerator:
         """
         self.config = config or STMapConfig()
 
-    def generate(
+    def iter_bands(
         self,
         profile: CameraProfile,
-        progress_callback: Optional[Callable[[float], None]] = None,
-    ) -> STMapResult:
+        band_pixels: int = DEFAULT_BAND_PIXELS,
+    ) -> Iterator[Tuple[int, Any]]:
         """
-        Generate ST-Map for camera profile.
+        Generate the ST-Map in horizontal bands.
+
+        Each band is evaluated with the vectorized Brown-Conrady model,
+        so memory stays bounded by the band size.
 
         Args:
             profile: Camera profile with distortion model
-            progress_callback: Optional progress callback (0.0-1.0)
+            band_pixels: Approximate number of pixels per band
 
-        Returns:
-            STMapResult with generated map data
+        Yields:
+            (first_row, band) tuples, band being float32 (rows, width, 4)
         """
-        import time
-        start_time = time.time()
+        _require_numpy()
 
-        result = STMapResult(
-            width=self.config.resolution_x,
-            height=self.config.resolution_y,
-        )
-
-        # Get distortion coefficients
         coeffs = DistortionCoefficients.from_profile(profile)
 
         # Calculate overscan bounds
@@ -160,52 +200,66 @@ class STMapGenerator:
         width = self.config.resolution_x
         height = self.config.resolution_y
 
-        # Generate pixel data
-        result.data = []
+        # Centered normalized coordinates with overscan
+        cols = x_min + (x_max - x_min) * np.arange(width, dtype=np.float64) / width - 0.5
+        band_rows = max(1, band_pixels // max(width, 1))
 
-        total_pixels = width * height
-        processed = 0
+        for y0 in range(0, height, band_rows):
+            y1 = min(height, y0 + band_rows)
+            rows = y_min + (y_max - y_min) * np.arange(y0, y1, dtype=np.float64) / height - 0.5
+            cx, cy = np.meshgrid(cols, rows)
 
-        for y in range(height):
-            for x in range(width):
-                # Convert pixel coordinate to normalized coordinate
-                # with overscan
-                u = x_min + (x_max - x_min) * x / width
-                v = y_min + (y_max - y_min) * y / height
+            if self.config.encode_undistort:
+                # Map for undistortion: given distorted pixel,
+                # where should we sample from?
+                src_x, src_y = LensDistortion.remove_brown_conrady_array(cx, cy, coeffs)
+            else:
+                # Map for distortion: given undistorted pixel,
+                # where does it map to?
+                src_x, src_y = LensDistortion.apply_brown_conrady_array(cx, cy, coeffs)
 
-                # Center coordinates for distortion calculation
-                cx = u - 0.5
-                cy = v - 0.5
+            band = np.empty((y1 - y0, width, 4), dtype=np.float32)
+            band[..., 0] = src_x + 0.5
+            band[..., 1] = src_y + 0.5
+            band[..., 2] = 0.5  # Blue channel often unused
+            band[..., 3] = 1.0
 
-                if self.config.encode_undistort:
-                    # Map for undistortion: given distorted pixel,
-                    # where should we sample from?
-                    # This requires inverting the distortion
-                    src_x, src_y = LensDistortion.remove_brown_conrady(cx, cy, coeffs)
-                else:
-                    # Map for distortion: given undistorted pixel,
-                    # where does it map to?
-                    src_x, src_y = LensDistortion.apply_brown_conrady(cx, cy, coeffs)
+            if self.config.normalize:
+                # Clamp to valid range
+                np.clip(band[..., :2], 0.0, 1.0, out=band[..., :2])
 
-                # Convert back to 0-1 range and add 0.5 offset
-                r = (src_x + 0.5)
-                g = (src_y + 0.5)
-                b = 0.5  # Blue channel often unused
+            yield y0, band
 
-                if self.config.normalize:
-                    # Clamp to valid range
-                    r = max(0.0, min(1.0, r))
-                    g = max(0.0, min(1.0, g))
+    def generate(
+        self,
+        profile: CameraProfile,
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ) -> STMapResult:
+        """
+        Generate ST-Map for camera profile.
 
-                a = 1.0 if self.config.include_alpha else 1.0
+        Args:
+            profile: Camera profile with distortion model
+            progress_callback: Optional progress callback (0.0-1.0)
 
-                result.data.append((r, g, b, a))
+        Returns:
+            STMapResult with generated map data
+        """
+        import time
+        start_time = time.time()
 
-                processed += 1
+        width = self.config.resolution_x
+        height = self.config.resolution_y
+
+        result = STMapResult(width=width, height=height)
+        _require_numpy()
+        result.pixels = np.empty((height, width, 4), dtype=np.float32)
+
+        for y0, band in self.iter_bands(profile):
+            result.pixels[y0:y0 + band.shape[0]] = band
 
             if progress_callback:
-                progress = (y + 1) / height
-                progress_callback(progress)
+                progress_callback((y0 + band.shape[0]) / height)
 
         result.generation_time_ms = (time.time() - start_time) * 1000
 
@@ -226,13 +280,31 @@ class STMapGenerator:
         Returns:
             STMapResult with generated map
         """
-        manager = CameraProfileManager()
-        profile = manager.get_profile(profile_name)
+        return self.generate(self._resolve_profile(profile_name), progress_callback)
 
-        if not profile:
-            raise ValueError(f"Profile not found: {profile_name}")
+    def generate_to_file(
+        self,
+        profile: CameraProfile,
+        filepath: str,
+    ) -> bool:
+        """
+        Generate an ST-Map and stream it straight to disk.
 
-        return self.generate(profile, progress_callback)
+        The full map is never held in memory; bands are written as they
+        are evaluated. The format follows the file extension.
+
+        Args:
+            profile: Camera profile with distortion model
+            filepath: Output .exr or .png path
+
+        Returns:
+            True if successful
+        """
+        try:
+            rows = self._rows(self.iter_bands(profile))
+            return self._write(rows, filepath)
+        except (OSError, ImportError, ValueError):
+            return False
 
     def save_exr(
         self,
@@ -259,22 +331,17 @@ class STMapGenerator:
 
     def _save_exr_blender(self, result: STMapResult, filepath: str) -> bool:
         """Save using Blender's image API."""
-        import numpy as np
-
-        # Convert to numpy array
-        pixels = np.array(result.data, dtype=np.float32)
-        pixels = pixels.reshape(result.height, result.width, 4)
-
         # Create image
         image = bpy.data.images.new(
             "st_map_temp",
             width=result.width,
             height=result.height,
             alpha=True,
+            float_buffer=True,
         )
 
-        # Flatten for Blender
-        image.pixels = pixels.flatten().tolist()
+        # Blender stores rows bottom-up
+        image.pixels.foreach_set(result.pixels[::-1].ravel())
 
         # Save as EXR
         image.file_format = "OPEN_EXR"
@@ -287,16 +354,15 @@ class STMapGenerator:
         return True
 
     def _save_exr_fallback(self, result: STMapResult, filepath: str) -> bool:
-        """Fallback save for testing without Blender."""
-        # Just write a simple header for testing purposes
-        with open(filepath, "wb") as f:
-            # Write minimal EXR header
-            f.write(b'\x76\x2f\x31\x01')  # Magic number
-            f.write(b'\x02\x00\x00\x00')  # Version
-
-            # In a real implementation, would write proper EXR structure
-            # For testing, just create a valid file
-
+        """Save with the built-in streaming OpenEXR writer."""
+        write_exr(
+            filepath,
+            result.width,
+            result.height,
+            self._rows([(0, result.pixels)]),
+            channels=self._channels(),
+            half=self.config.bit_depth <= 16,
+        )
         return True
 
     def save_png(
@@ -307,6 +373,8 @@ class STMapGenerator:
         """
         Save ST-Map as PNG file (8-bit or 16-bit).
 
+        32-bit configurations are written as 16-bit PNG.
+
         Args:
             result: ST-Map generation result
             filepath: Output file path
@@ -315,68 +383,308 @@ class STMapGenerator:
             True if successful
         """
         try:
-            # Try to use PIL if available
-            from PIL import Image
-            import numpy as np
+            write_png(
+                filepath,
+                result.width,
+                result.height,
+                self._rows([(0, result.pixels)]),
+                bit_depth=8 if self.config.bit_depth == 8 else 16,
+                alpha=self.config.include_alpha,
+            )
+            return True
+        except (OSError, ValueError):
+            return False
 
-            pixels = np.array(result.data, dtype=np.float32)
-            pixels = pixels.reshape(result.height, result.width, 4)
+    def _resolve_profile(self, profile_name: str) -> CameraProfile:
+        manager = CameraProfileManager()
+        profile = manager.get_profile(profile_name)
 
-            if self.config.bit_depth == 8:
-                pixels = (pixels * 255).astype(np.uint8)
-                mode = "RGBA"
-            else:
-                pixels = (pixels * 65535).astype(np.uint16)
-                mode = "RGBA"
+        if not profile:
+            raise ValueError(f"Profile not found: {profile_name}")
 
-            img = Image.fromarray(pixels[:, :, :3], mode="RGB")
-            img.save(filepath)
+        return profile
 
-            return True
+    def _channels(self) -> str:
+        return "RGBA" if self.config.include_alpha else "RGB"
 
-        except ImportError:
-            # Fallback without PIL
-            return self._save_png_fallback(result, filepath)
+    def _rows(self, bands: Iterable[Tuple[int, Any]]) -> Iterator[Any]:
+        """Flatten (first_row, band) pairs into rows of output channels."""
+        count = len(self._channels())
+        for _, band in bands:
+            for row in band:
+                yield row[:, :count]
 
-    def _save_png_fallback(self, result: STMapResult, filepath: str) -> bool:
-        """Fallback PNG save for testing."""
-        # Create a minimal PNG file
-        # In real implementation would use proper PNG library
-        import struct
-        import zlib
+    def _write(self, rows: Iterable[Any], filepath: str) -> bool:
+        width = self.config.resolution_x
+        height = self.config.resolution_y
 
-        with open(filepath, "wb") as f:
-            # PNG signature
-            f.write(b'\x89PNG\r\n\x1a\n')
+        if Path(filepath).suffix.lower() == ".exr":
+            write_exr(
+                filepath, width, height, rows,
+                channels=self._channels(),
+                half=self.config.bit_depth <= 16,
+            )
+        else:
+            write_png(
+                filepath, width, height, rows,
+                bit_depth=8 if self.config.bit_depth == 8 else 16,
+                alpha=self.config.include_alpha,
+            )
+        return True
 
-            width = result.width
-            height = result.height
 
-            # IHDR chunk
-            ihdr_data = struct.pack('>IIBBBBB', width, height, 16, 2, 0, 0, 0)
-            self._write_chunk(f, b'IHDR', ihdr_data)
+def write_exr(
+    filepath: str,
+    width: int,
+    height: int,
+    rows: Iterable[Any],
+    channels: str = "RGBA",
+    half: bool = True,
+) -> None:
+    """
+    Write an uncompressed scanline OpenEXR file, one row at a time.
 
-            # IDAT chunk (simplified - just write header)
-            # In real implementation would compress pixel data
+    Chunk sizes are fixed without compression, so the offset table is
+    written up front and rows are streamed straight to disk.
 
-            # IEND chunk
-            self._write_chunk(f, b'IEND', b'')
+    Args:
+        filepath: Output path
+        width: Image width
+        height: Image height
+        rows: Iterable of float arrays shaped (width, len(channels))
+        channels: Channel names in row order (e.g. "RGBA")
+        half: Write 16-bit half floats instead of 32-bit floats
+    """
+    _require_numpy()
 
-        return True
+    # EXR stores channels sorted by name
+    order = sorted(range(len(channels)), key=lambda i: channels[i])
+    pixel_type = EXR_HALF if half else EXR_FLOAT
+    dtype = np.dtype("<f2") if half else np.dtype("<f4")
+
+    def attribute(name: str, type_name: str, value: bytes) -> bytes:
+        return (
+            name.encode() + b"\0" + type_name.encode() + b"\0"
+            + struct.pack("<i", len(value)) + value
+        )
+
+    chlist = b"".join(
+        channels[i].encode() + b"\0" + struct.pack("<iB3xii", pixel_type, 0, 1, 1)
+        for i in order
+    ) + b"\0"
+    window = struct.pack("<iiii", 0, 0, width - 1, height - 1)
+
+    header = b"".join([
+        struct.pack("<ii", EXR_MAGIC, 2),
+        attribute("channels", "chlist", chlist),
+        attribute("compression", "compression", b"\0"),
+        attribute("dataWindow", "box2i", window),
+        attribute("displayWindow", "box2i", window),
+        attribute("lineOrder", "lineOrder", b"\0"),
+        attribute("pixelAspectRatio", "float", struct.pack("<f", 1.0)),
+        attribute("screenWindowCenter", "v2f", struct.pack("<ff", 0.0, 0.0)),
+        attribute("screenWindowWidth", "float", struct.pack("<f", 1.0)),
+        b"\0",
+    ])
+
+    row_bytes = width * len(channels) * dtype.itemsize
+    first_chunk = len(header) + 8 * height
+    offsets = np.arange(height, dtype="<u8") * (row_bytes + 8) + first_chunk
+
+    written = 0
+    with open(filepath, "wb") as f:
+        f.write(header)
+        f.write(offsets.tobytes())
+
+        for y, row in enumerate(rows):
+            planar = np.ascontiguousarray(np.asarray(row)[:, order].T, dtype=dtype)
+            f.write(struct.pack("<ii", y, row_bytes))
+            f.write(planar.tobytes())
+            written += 1
+
+    if written != height:
+        raise ValueError(f"Expected {height} rows, got {written}")
+
+
+def write_png(
+    filepath: str,
+    width: int,
+    height: int,
+    rows: Iterable[Any],
+    bit_depth: int = 16,
+    alpha: bool = False,
+) -> None:
+    """
+    Write an 8-bit or 16-bit RGB(A) PNG file, one row at a time.
+
+    Rows are quantized and fed through a single zlib stream, flushing
+    IDAT chunks as compressed data accumulates.
+
+    Args:
+        filepath: Output path
+        width: Image width
+        height: Image height
+        rows: Iterable of 0-1 float arrays shaped (width, 3 or 4)
+        bit_depth: 8 or 16
+        alpha: Write RGBA instead of RGB
+    """
+    _require_numpy()
+
+    if bit_depth not in (8, 16):
+        raise ValueError(f"Unsupported PNG bit depth: {bit_depth}")
+
+    channels = 4 if alpha else 3
+    scale = 255.0 if bit_depth == 8 else 65535.0
+    dtype = np.dtype("u1") if bit_depth == 8 else np.dtype(">u2")
+    color_type = 6 if alpha else 2
+
+    compressor = zlib.compressobj(6)
+    pending = []
+    pending_size = 0
+    written = 0
+
+    with open(filepath, "wb") as f:
+        f.write(PNG_SIGNATURE)
+        _write_png_chunk(f, b'IHDR', struct.pack('>IIBBBBB', width, height, bit_depth, color_type, 0, 0, 0))
+
+        for row in rows:
+            values = np.clip(np.asarray(row)[:, :channels], 0.0, 1.0) * scale
+            # Filter type 0 (None) per scanline
+            data = compressor.compress(b"\0" + np.rint(values).astype(dtype).tobytes())
+            written += 1
+
+            if data:
+                pending.append(data)
+                pending_size += len(data)
+            if pending_size >= PNG_IDAT_CHUNK:
+                _write_png_chunk(f, b'IDAT', b"".join(pending))
+                pending = []
+                pending_size = 0
+
+        pending.append(compressor.flush())
+        _write_png_chunk(f, b'IDAT', b"".join(pending))
+        _write_png_chunk(f, b'IEND', b'')
+
+    if written != height:
+        raise ValueError(f"Expected {height} rows, got {written}")
+
+
+def _write_png_chunk(f, chunk_type: bytes, data: bytes) -> None:
+    """Write a PNG chunk."""
+    f.write(struct.pack('>I', len(data)))
+    f.write(chunk_type)
+    f.write(data)
 
-    def _write_chunk(self, f, chunk_type: bytes, data: bytes):
-        """Write a PNG chunk."""
-        import struct
-        import zlib
+    # CRC
+    crc = zlib.crc32(chunk_type + data) & 0xffffffff
+    f.write(struct.pack('>I', crc))
 
-        length = len(data)
-        f.write(struct.pack('>I', length))
-        f.write(chunk_type)
-        f.write(data)
 
-        # CRC
-        crc = zlib.crc32(chunk_type + data) & 0xffffffff
-        f.write(struct.pack('>I', crc))
+def load_st_map(filepath: str):
+    """
+    Load an ST-Map as a float32 (height, width, channels) array.
+
+    Reads uncompressed scanline EXR files and unfiltered PNG files
+    (as written by this module) directly; other PNG/TIFF files are
+    read through PIL and normalized by their bit depth.
+
+    Args:
+        filepath: ST-Map path
+
+    Returns:
+        Float array with values in map coordinates (0-1)
+    """
+    _require_numpy()
+
+    with open(filepath, "rb") as f:
+        data = f.read()
+
+    if data[:4] == struct.pack("<i", EXR_MAGIC):
+        return _read_exr(data)
+
+    if data[:8] == PNG_SIGNATURE:
+        pixels = _read_png(data)
+        if pixels is not None:
+            return pixels
+
+    from PIL import Image
+
+    img = Image.open(filepath)
+    if img.mode in ("I;16", "I;16B", "I"):
+        return np.array(img, dtype=np.float32)[..., None] / 65535.0
+    return np.array(img.convert("RGBA" if "A" in img.getbands() else "RGB"), dtype=np.float32) / 255.0
+
+
+def _read_exr(data: bytes):
+    """Decode an uncompressed scanline EXR file."""
+    pos = 8
+    attributes = {}
+    while data[pos] != 0:
+        name_end = data.index(b"\0", pos)
+        type_end = data.index(b"\0", name_end + 1)
+        size = struct.unpack_from("<i", data, type_end + 1)[0]
+        value_start = type_end + 5
+        attributes[data[pos:name_end].decode()] = data[value_start:value_start + size]
+        pos = value_start + size
+    pos += 1
+
+    if attributes.get("compression", b"\0") != b"\0":
+        raise ValueError("Only uncompressed EXR ST-Maps are supported")
+
+    names = []
+    types = []
+    chlist = attributes["channels"]
+    cpos = 0
+    while chlist[cpos] != 0:
+        end = chlist.index(b"\0", cpos)
+        names.append(chlist[cpos:end].decode())
+        types.append(struct.unpack_from("<i", chlist, end + 1)[0])
+        cpos = end + 17
+
+    x_min, y_min, x_max, y_max = struct.unpack("<iiii", attributes["dataWindow"])
+    width = x_max - x_min + 1
+    height = y_max - y_min + 1
+
+    dtypes = [np.dtype("<f2") if t == EXR_HALF else np.dtype("<f4") for t in types]
+    offsets = np.frombuffer(data, dtype="<u8", count=height, offset=pos)
+
+    planes = np.empty((height, len(names), width), dtype=np.float32)
+    for offset in offsets:
+        y = struct.unpack_from("<i", data, int(offset))[0] - y_min
+        cursor = int(offset) + 8
+        for c, dtype in enumerate(dtypes):
+            planes[y, c] = np.frombuffer(data, dtype=dtype, count=width, offset=cursor)
+            cursor += width * dtype.itemsize
+
+    # Return in R, G, B, A order where present
+    order = sorted(range(len(names)), key=lambda i: "RGBA".find(names[i]) % 5)
+    return np.ascontiguousarray(planes[:, order].transpose(0, 2, 1))
+
+
+def _read_png(data: bytes):
+    """Decode a non-interlaced RGB(A) PNG whose scanlines are all unfiltered."""
+    width, height, bit_depth, color_type, _, _, interlace = struct.unpack_from(">IIBBBBB", data, 16)
+    if color_type not in (2, 6) or bit_depth not in (8, 16) or interlace:
+        return None
+
+    idat = []
+    pos = 8
+    while pos < len(data):
+        length = struct.unpack_from(">I", data, pos)[0]
+        chunk_type = data[pos + 4:pos + 8]
+        if chunk_type == b"IDAT":
+            idat.append(data[pos + 8:pos + 8 + length])
+        pos += 12 + length
+
+    channels = 4 if color_type == 6 else 3
+    dtype = np.dtype("u1") if bit_depth == 8 else np.dtype(">u2")
+    raw = np.frombuffer(zlib.decompress(b"".join(idat)), dtype=np.uint8)
+    raw = raw.reshape(height, 1 + width * channels * dtype.itemsize)
+    if raw[:, 0].any():
+        return None
+
+    values = raw[:, 1:].copy().view(dtype).reshape(height, width, channels)
+    return values.astype(np.float32) / (255.0 if bit_depth == 8 else 65535.0)
 
 
 def generate_st_map(
@@ -417,10 +725,62 @@ def generate_st_map(
     return result
 
 
+def sample_st_map(image, st_map, interpolation: str = "nearest"):
+    """
+    Resample an image array through an ST-Map array.
+
+    The output has the ST-Map's resolution; red/green give the source
+    position in 0-1 image coordinates.
+
+    Args:
+        image: Source image array (height, width[, channels])
+        st_map: ST-Map array (map_height, map_width, >=2)
+        interpolation: "nearest" or "bilinear"
+
+    Returns:
+        Resampled array. Nearest keeps the source dtype; bilinear
+        returns float32.
+    """
+    _require_numpy()
+
+    image = np.asarray(image)
+    height, width = image.shape[:2]
+    src_x = st_map[..., 0] * (width - 1)
+    src_y = st_map[..., 1] * (height - 1)
+
+    if interpolation == "nearest":
+        # Truncate toward zero like int(), then clamp
+        xi = np.clip(src_x.astype(np.int64), 0, width - 1)
+        yi = np.clip(src_y.astype(np.int64), 0, height - 1)
+        return image[yi, xi]
+
+    if interpolation != "bilinear":
+        raise ValueError(f"Unknown interpolation: {interpolation}")
+
+    src_x = np.clip(src_x, 0, width - 1)
+    src_y = np.clip(src_y, 0, height - 1)
+    x0 = np.minimum(src_x.astype(np.int64), max(width - 2, 0))
+    y0 = np.minimum(src_y.astype(np.int64), max(height - 2, 0))
+    x1 = np.minimum(x0 + 1, width - 1)
+    y1 = np.minimum(y0 + 1, height - 1)
+    fx = (src_x - x0).astype(np.float32)
+    fy = (src_y - y0).astype(np.float32)
+
+    img = image.astype(np.float32)
+    if img.ndim == 3:
+        fx = fx[..., None]
+        fy = fy[..., None]
+
+    top = img[y0, x0] * (1 - fx) + img[y0, x1] * fx
+    bottom = img[y1, x0] * (1 - fx) + img[y1, x1] * fx
+    return top * (1 - fy) + bottom * fy
+
+
 def apply_st_map(
     image_path: str,
     st_map_path: str,
     output_path: str,
+    interpolation: str = "nearest",
 ) -> bool:
     """
     Apply ST-Map to an image.
@@ -430,45 +790,26 @@ def apply_st_map(
 
     Args:
         image_path: Input image path
-        st_map_path: ST-Map file path
+        st_map_path: ST-Map file path (EXR or PNG)
         output_path: Output image path
+        interpolation: "nearest" or "bilinear"
 
     Returns:
         True if successful
     """
     try:
         from PIL import Image
-        import numpy as np
 
         # Load image and ST-Map
-        img = Image.open(image_path)
-        st_map = Image.open(st_map_path)
-
-        img_array = np.array(img, dtype=np.float32) / 255.0
-        map_array = np.array(st_map, dtype=np.float32) / 255.0
-
-        height, width = img_array.shape[:2]
+        img = np.array(Image.open(image_path))
+        map_array = load_st_map(st_map_path)
 
-        # Create output array
-        output = np.zeros_like(img_array)
-
-        # Apply ST-Map (simplified nearest-neighbor sampling)
-        for y in range(height):
-            for x in range(width):
-                # Get source coordinates from ST-Map
-                src_x = int(map_array[y, x, 0] * (width - 1))
-                src_y = int(map_array[y, x, 1] * (height - 1))
-
-                # Clamp to valid range
-                src_x = max(0, min(width - 1, src_x))
-                src_y = max(0, min(height - 1, src_y))
-
-                # Sample from source image
-                output[y, x] = img_array[src_y, src_x]
+        output = sample_st_map(img, map_array, interpolation)
+        if output.dtype != img.dtype:
+            output = np.clip(np.rint(output), 0, np.iinfo(img.dtype).max).astype(img.dtype)
 
         # Save output
-        output_img = Image.fromarray((output * 255).astype(np.uint8))
-        output_img.save(output_path)
+        Image.fromarray(output).save(output_path)
 
         return True
 
@@ -476,16 +817,57 @@ def apply_st_map(
         return False
 
 
+def st_map_cache_key(
+    profile: CameraProfile,
+    config: STMapConfig,
+) -> str:
+    """
+    Build the disk cache key for a profile and map configuration.
+
+    Args:
+        profile: Camera profile
+        config: ST-Map configuration
+
+    Returns:
+        Hex digest identifying the generated pixels
+    """
+    payload = {
+        "coefficients": DistortionCoefficients.from_profile(profile).to_dict(),
+        "resolution": [config.resolution_x, config.resolution_y],
+        "encode_undistort": config.encode_undistort,
+        "normalize": config.normalize,
+        "overscan": config.overscan,
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
 class STMapBatchGenerator:
     """
     Batch generator for multiple ST-Maps.
 
     Generates ST-Maps for multiple camera profiles or resolutions.
+    Profiles are processed on a thread pool (the numpy kernels and
+    file writes release the GIL) and generated pixels can be reused
+    from a disk cache keyed by distortion coefficients and resolution.
     """
 
-    def __init__(self, config: Optional[STMapConfig] = None):
-        """Initialize batch generator."""
+    def __init__(
+        self,
+        config: Optional[STMapConfig] = None,
+        cache_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize batch generator.
+
+        Args:
+            config: Generation configuration
+            cache_dir: Optional directory for cached map arrays
+            max_workers: Worker threads (default: CPU count)
+        """
         self.config = config or STMapConfig()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_workers = max_workers or os.cpu_count() or 1
 
     def generate_for_profiles(
         self,
@@ -504,31 +886,24 @@ class STMapBatchGenerator:
         Returns:
             Dict mapping profile name to STMapResult
         """
-        results = {}
-
-        generator = STMapGenerator(self.config)
-
-        for i, name in enumerate(profile_names):
+        def run(name: str) -> STMapResult:
             try:
-                # Generate ST-Map
                 def cb(p):
                     if progress_callback:
                         progress_callback(name, p)
 
-                result = generator.generate_from_name(name, cb)
-
-                # Save to file
                 output_path = str(Path(output_dir) / f"stmap_{name}.exr")
-                generator.save_exr(result, output_path)
-                result.output_path = output_path
-
-                results[name] = result
+                return self._generate(name, self.config, output_path, cb)
 
-            except Exception as e:
+            except Exception:
                 # Log error but continue with other profiles
-                results[name] = STMapResult()
+                return STMapResult()
+
+        workers = max(1, min(self.max_workers, len(profile_names)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run, profile_names))
 
-        return results
+        return dict(zip(profile_names, results))
 
     def generate_for_resolutions(
         self,
@@ -547,9 +922,8 @@ class STMapBatchGenerator:
         Returns:
             List of STMapResults
         """
-        results = []
-
-        for width, height in resolutions:
+        def run(resolution: Tuple[int, int]) -> STMapResult:
+            width, height = resolution
             config = STMapConfig(
                 resolution_x=width,
                 resolution_y=height,
@@ -557,14 +931,69 @@ class STMapBatchGenerator:
                 encode_undistort=self.config.encode_undistort,
             )
 
-            generator = STMapGenerator(config)
-            result = generator.generate_from_name(profile_name)
-
             # Save with resolution in filename
             output_path = str(Path(output_dir) / f"stmap_{profile_name}_{width}x{height}.exr")
-            generator.save_exr(result, output_path)
-            result.output_path = output_path
+            return self._generate(profile_name, config, output_path)
 
-            results.append(result)
+        workers = max(1, min(self.max_workers, len(resolutions)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, resolutions))
+
+    def _generate(
+        self,
+        profile_name: str,
+        config: STMapConfig,
+        output_path: str,
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ) -> STMapResult:
+        """Generate (or load from cache) one map and save it as EXR."""
+        generator = STMapGenerator(config)
+        profile = generator._resolve_profile(profile_name)
+
+        result = self._load_cached(profile, config)
+        if result is None:
+            result = generator.generate(profile, progress_callback)
+            self._store_cached(profile, config, result)
+        elif progress_callback:
+            progress_callback(1.0)
+
+        generator.save_exr(result, output_path)
+        result.output_path = output_path
+        return result
+
+    def _cache_path(self, profile: CameraProfile, config: STMapConfig) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"stmap_{st_map_cache_key(profile, config)}.npy"
+
+    def _load_cached(self, profile: CameraProfile, config: STMapConfig) -> Optional[STMapResult]:
+        path = self._cache_path(profile, config)
+        if path is None or not path.exists():
+            return None
+
+        try:
+            pixels = np.load(path)
+        except (OSError, ValueError):
+            return None
+
+        if pixels.shape != (config.resolution_y, config.resolution_x, 4):
+            return None
+
+        return STMapResult(
+            width=config.resolution_x,
+            height=config.resolution_y,
+            pixels=pixels,
+            cached=True,
+        )
 
-        return results
+    def _store_cached(self, profile: CameraProfile, config: STMapConfig, result: STMapResult) -> None:
+        path = self._cache_path(profile, config)
+        if path is None:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a unique temp file then rename so concurrent workers never see partial data
+        tmp_path = path.with_suffix(f".{os.getpid()}.{id(result)}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, result.pixels)
+        os.replace(tmp_path, path)
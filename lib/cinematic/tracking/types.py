@@ -10,6 +10,7 @@ Follows patterns from lib/cinematic/types.py.
 from __future__ import annotations
 import uuid
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import Dict, Any, Tuple, List, Optional
 
 
@@ -541,6 +542,10 @@ class BatchConfig:
         max_retries: Maximum retry attempts per job
         timeout_seconds: Job timeout (0 = no timeout)
         continue_on_error: Continue batch if job fails
+        persistent_workers: Reuse warm worker processes across jobs
+        max_jobs_per_worker: Recycle a worker after this many jobs (0 = never)
+        max_worker_memory_mb: Recycle a worker above this memory (0 = no limit)
+        blender_path: Path to Blender executable
     """
     workers: int = 0  # 0 = auto-detect
     resume_on_failure: bool = True
@@ -548,6 +553,10 @@ class BatchConfig:
     max_retries: int = 3
     timeout_seconds: int = 0
     continue_on_error: bool = True
+    persistent_workers: bool = True
+    max_jobs_per_worker: int = 25
+    max_worker_memory_mb: int = 0
+    blender_path: str = "blender"
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -557,6 +566,10 @@ class BatchConfig:
             "max_retries": self.max_retries,
             "timeout_seconds": self.timeout_seconds,
             "continue_on_error": self.continue_on_error,
+            "persistent_workers": self.persistent_workers,
+            "max_jobs_per_worker": self.max_jobs_per_worker,
+            "max_worker_memory_mb": self.max_worker_memory_mb,
+            "blender_path": self.blender_path,
         }
 
     @classmethod
@@ -568,6 +581,10 @@ class BatchConfig:
             max_retries=data.get("max_retries", 3),
             timeout_seconds=data.get("timeout_seconds", 0),
             continue_on_error=data.get("continue_on_error", True),
+            persistent_workers=data.get("persistent_workers", True),
+            max_jobs_per_worker=data.get("max_jobs_per_worker", 25),
+            max_worker_memory_mb=data.get("max_worker_memory_mb", 0),
+            blender_path=data.get("blender_path", "blender"),
         )
 
 
@@ -1318,3 +1335,266 @@ class RollingShutterConfig:
             row_count=data.get("row_count", 1080),
             compensation_enabled=data.get("compensation_enabled", True),
         )
+
+
+@dataclass
+class CameraProfile:
+    """
+    Camera device profile with lens distortion model.
+
+    Used by the calibration and ST-Map modules. Distortion coefficients
+    are stored flat so they map directly onto DistortionCoefficients.
+
+    Attributes:
+        name: Profile display name
+        manufacturer: Camera manufacturer
+        model: Camera model
+        sensor_width: Sensor width in mm
+        sensor_height: Sensor height in mm
+        focal_length: Lens focal length in mm
+        crop_factor: Sensor crop factor
+        distortion_model: "none", "simple", "brown_conrady"
+        k1, k2, k3: Radial distortion coefficients
+        p1, p2: Tangential distortion coefficients
+        cx, cy: Principal point offset (normalized)
+    """
+    name: str = ""
+    manufacturer: str = ""
+    model: str = ""
+    sensor_width: float = 36.0
+    sensor_height: float = 24.0
+    focal_length: float = 50.0
+    crop_factor: float = 1.0
+    distortion_model: str = "none"
+    k1: float = 0.0
+    k2: float = 0.0
+    k3: float = 0.0
+    p1: float = 0.0
+    p2: float = 0.0
+    cx: float = 0.0
+    cy: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "name": self.name,
+            "manufacturer": self.manufacturer,
+            "model": self.model,
+            "sensor_width": self.sensor_width,
+            "sensor_height": self.sensor_height,
+            "focal_length": self.focal_length,
+            "crop_factor": self.crop_factor,
+            "distortion_model": self.distortion_model,
+            "k1": self.k1,
+            "k2": self.k2,
+            "k3": self.k3,
+            "p1": self.p1,
+            "p2": self.p2,
+            "cx": self.cx,
+            "cy": self.cy,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CameraProfile":
+        """Create from dictionary."""
+        return cls(
+            name=data.get("name", ""),
+            manufacturer=data.get("manufacturer", ""),
+            model=data.get("model", ""),
+            sensor_width=data.get("sensor_width", 36.0),
+            sensor_height=data.get("sensor_height", 24.0),
+            focal_length=data.get("focal_length", 50.0),
+            crop_factor=data.get("crop_factor", 1.0),
+            distortion_model=data.get("distortion_model", "none"),
+            k1=data.get("k1", 0.0),
+            k2=data.get("k2", 0.0),
+            k3=data.get("k3", 0.0),
+            p1=data.get("p1", 0.0),
+            p2=data.get("p2", 0.0),
+            cx=data.get("cx", 0.0),
+            cy=data.get("cy", 0.0),
+        )
+
+
+class TrackStatus(Enum):
+    """Status of a track at a single frame."""
+    OK = "ok"
+    MISSING = "missing"
+    DISABLED = "disabled"
+
+
+class FeatureDetector(Enum):
+    """Feature detection algorithm."""
+    FAST = "fast"
+    HARRIS = "harris"
+    SHI_TOMASI = "shi_tomasi"
+    SIFT = "sift"
+    ORB = "orb"
+    BRISK = "brisk"
+
+
+@dataclass
+class TrackPoint:
+    """
+    Position of a point track at one frame.
+
+    Attributes:
+        frame: Frame number
+        position: (x, y) position in normalized coordinates (0-1)
+        status: Tracking status at this frame
+        error: Tracking residual (lower is better)
+        weight: Track weight for solving (0-1)
+    """
+    frame: int = 0
+    position: Tuple[float, float] = (0.0, 0.0)
+    status: TrackStatus = TrackStatus.OK
+    error: float = 0.0
+    weight: float = 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "frame": self.frame,
+            "position": list(self.position),
+            "status": self.status.value,
+            "error": self.error,
+            "weight": self.weight,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TrackPoint":
+        """Create from dictionary."""
+        return cls(
+            frame=data.get("frame", 0),
+            position=tuple(data.get("position", (0.0, 0.0))),
+            status=TrackStatus(data.get("status", "ok")),
+            error=data.get("error", 0.0),
+            weight=data.get("weight", 1.0),
+        )
+
+
+@dataclass
+class Track:
+    """
+    2D point track produced by the automatic point tracker.
+
+    Attributes:
+        name: Track identifier name
+        points: Per-frame track points
+        pattern_size: Pattern size in pixels
+        search_size: Search area size in pixels
+        color: Track display color (RGB 0-1)
+        is_keyframe: Frames marked as keyframes
+    """
+    name: str = ""
+    points: List[TrackPoint] = field(default_factory=list)
+    pattern_size: int = 21
+    search_size: int = 71
+    color: Tuple[float, float, float] = (1.0, 0.0, 0.0)
+    is_keyframe: List[int] = field(default_factory=list)
+
+    def get_point_at_frame(self, frame: int) -> Optional[TrackPoint]:
+        """Get the track point at a frame, or None."""
+        for point in self.points:
+            if point.frame == frame:
+                return point
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "name": self.name,
+            "points": [p.to_dict() for p in self.points],
+            "pattern_size": self.pattern_size,
+            "search_size": self.search_size,
+            "color": list(self.color),
+            "is_keyframe": self.is_keyframe,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Track":
+        """Create from dictionary."""
+        return cls(
+            name=data.get("name", ""),
+            points=[TrackPoint.from_dict(p) for p in data.get("points", [])],
+            pattern_size=data.get("pattern_size", 21),
+            search_size=data.get("search_size", 71),
+            color=tuple(data.get("color", (1.0, 0.0, 0.0))),
+            is_keyframe=data.get("is_keyframe", []),
+        )
+
+
+@dataclass
+class TrackingConfig:
+    """
+    Configuration for automatic feature detection and KLT tracking.
+
+    Attributes:
+        detector: Feature detection algorithm
+        max_features: Maximum features to detect per frame
+        min_features: Minimum active tracks before replenishing
+        track_threshold: Detector quality level relative to strongest corner (0-1)
+        min_distance: Minimum distance between detected features in pixels
+        pattern_size: Pattern size in pixels for new tracks
+        search_size: Search area size in pixels for new tracks
+        flow_window_size: KLT integration window size in pixels
+        flow_max_level: Highest pyramid level used by KLT (0 = full resolution only)
+        flow_max_iterations: Maximum Gauss-Newton iterations per pyramid level
+        flow_epsilon: Convergence threshold on the update step in pixels
+        max_error: Maximum mean absolute residual (0-1 intensity) before a track is lost
+        auto_keyframe: Mark keyframes automatically while tracking
+        keyframe_interval: Frame interval for automatic keyframes
+    """
+    detector: FeatureDetector = FeatureDetector.HARRIS
+    max_features: int = 200
+    min_features: int = 50
+    track_threshold: float = 0.01
+    min_distance: int = 10
+    pattern_size: int = 21
+    search_size: int = 71
+    flow_window_size: int = 21
+    flow_max_level: int = 3
+    flow_max_iterations: int = 30
+    flow_epsilon: float = 0.01
+    max_error: float = 0.05
+    auto_keyframe: bool = True
+    keyframe_interval: int = 10
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "detector": self.detector.value,
+            "max_features": self.max_features,
+            "min_features": self.min_features,
+            "track_threshold": self.track_threshold,
+            "min_distance": self.min_distance,
+            "pattern_size": self.pattern_size,
+            "search_size": self.search_size,
+            "flow_window_size": self.flow_window_size,
+            "flow_max_level": self.flow_max_level,
+            "flow_max_iterations": self.flow_max_iterations,
+            "flow_epsilon": self.flow_epsilon,
+            "max_error": self.max_error,
+            "auto_keyframe": self.auto_keyframe,
+            "keyframe_interval": self.keyframe_interval,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TrackingConfig":
+        """Create from dictionary."""
+        return cls(
+            detector=FeatureDetector(data.get("detector", "harris")),
+            max_features=data.get("max_features", 200),
+            min_features=data.get("min_features", 50),
+            track_threshold=data.get("track_threshold", 0.01),
+            min_distance=data.get("min_distance", 10),
+            pattern_size=data.get("pattern_size", 21),
+            search_size=data.get("search_size", 71),
+            flow_window_size=data.get("flow_window_size", 21),
+            flow_max_level=data.get("flow_max_level", 3),
+            flow_max_iterations=data.get("flow_max_iterations", 30),
+            flow_epsilon=data.get("flow_epsilon", 0.01),
+            max_error=data.get("max_error", 0.05),
+            auto_keyframe=data.get("auto_keyframe", True),
+            keyframe_interval=data.get("keyframe_interval", 10),
+        )
@@ -33,6 +33,7 @@ Scene Generation Components (Phase 6):
     AssetInstanceLibrary: Manage asset instances
     LODManager: Level-of-detail system
     CullingManager: Frustum and distance culling
+    InstanceBVH: Bounding volume hierarchy for batched culling
 
 Usage:
     from lib.geometry_nodes import NodeTreeBuilder, SimulationBuilder
@@ -184,6 +185,7 @@ __all__ = [
     "LODLevel",
     "LODConfig",
     "LODState",
+    "LODStateArrays",
     "DEFAULT_LOD_CONFIGS",
     "LODManager",
     "LODSelector",
@@ -195,6 +197,10 @@ __all__ = [
     "CullingConfig",
     "CullingResult",
     "InstanceBounds",
+    "InstanceArrays",
+    "InstanceBVH",
+    "CameraFrame",
+    "BatchCullingResult",
     "CullingManager",
     "OcclusionCuller",
     "create_frustum_from_camera",
@@ -348,6 +354,7 @@ from .lod_system import (
     LODLevel,
     LODConfig,
     LODState,
+    LODStateArrays,
     DEFAULT_LOD_CONFIGS,
     LODManager,
     LODSelector,
@@ -359,6 +366,10 @@ from .culling import (
     CullingConfig,
     CullingResult,
     InstanceBounds,
+    InstanceArrays,
+    InstanceBVH,
+    CameraFrame,
+    BatchCullingResult,
     CullingManager,
     OcclusionCuller,
     create_frustum_from_camera,
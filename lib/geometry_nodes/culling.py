@@ -5,14 +5,65 @@ Implements frustum, distance, and occlusion culling for scene optimization.
 Reduces render load by skipping invisible or distant objects.
 
 Implements REQ-GN-08: Culling Strategy (NEW - Council).
+
+Large instance sets are culled in batches: InstanceArrays holds
+positions and radii as arrays, and InstanceBVH groups them so whole
+clusters are accepted or rejected per camera frame.
 """
 
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List, Tuple, Set
 from enum import Enum
+import base64
 import math
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Per-instance culling codes used by the batched API
+VISIBLE = 0
+CULLED_DISTANCE = 1
+CULLED_FRUSTUM = 2
+CULLED_SMALL_OBJECT = 3
+CULLED_OCCLUSION = 4
+
+# Cull reason for each code (as used in CullingResult.culled)
+CULL_REASONS = ("", "distance", "frustum", "small_object", "occlusion")
+
+DEFAULT_BVH_LEAF_SIZE = 128
+
+# Instances tested per batch in exact (per-instance) culling
+_CULL_CHUNK = 1 << 20
+
+# Conservative margin for accepting/rejecting whole BVH nodes
+_NODE_EPSILON = 1e-6
+
+# Corner indices (see _box_corners) of the six faces of a box
+_BOX_FACES = (
+    (0, 2, 6, 4), (1, 3, 7, 5),
+    (0, 1, 5, 4), (2, 3, 7, 6),
+    (0, 1, 3, 2), (4, 5, 7, 6),
+)
+
+# Box edges as (corner, corner, face, face), faces indexing _BOX_FACES
+_BOX_EDGES = (
+    (0, 1, 2, 4), (2, 3, 3, 4), (4, 5, 2, 5), (6, 7, 3, 5),
+    (0, 2, 0, 4), (1, 3, 1, 4), (4, 6, 0, 5), (5, 7, 1, 5),
+    (0, 4, 0, 2), (1, 5, 1, 2), (2, 6, 0, 3), (3, 7, 1, 3),
+)
+
+# Occluders and pixel tests per rasterization batch
+_RASTER_CHUNK = 1 << 16
+_RASTER_PIXELS = 1 << 22
+
+# Boxes per occlusion query batch
+_QUERY_CHUNK = 1 << 18
+
 
 class CullingType(Enum):
     """Culling type classification."""
@@ -201,6 +252,10 @@ class Frustum:
 
         return True
 
+    def as_array(self) -> "np.ndarray":
+        """Planes as a (P, 4) float64 array."""
+        return np.asarray(self.planes, dtype=np.float64).reshape(-1, 4)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -298,6 +353,443 @@ class InstanceBounds:
         }
 
 
+@dataclass
+class InstanceArrays:
+    """
+    Struct-of-arrays instance bounds for batched culling.
+
+    Attributes:
+        positions: (N, 3) world positions (bounding sphere centers)
+        radii: (N,) bounding sphere radii
+        screen_sizes: Optional (N,) precomputed screen sizes; when None,
+            screen size is estimated per camera from radius and distance
+        ids: Optional instance identifiers (index order)
+    """
+    positions: "np.ndarray"
+    radii: "np.ndarray"
+    screen_sizes: Optional["np.ndarray"] = None
+    ids: Optional[List[str]] = None
+
+    def __post_init__(self):
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for batched culling")
+        self.positions = np.asarray(self.positions, dtype=np.float64).reshape(-1, 3)
+        self.radii = np.broadcast_to(
+            np.asarray(self.radii, dtype=np.float64), (len(self.positions),)
+        )
+        if self.screen_sizes is not None:
+            self.screen_sizes = np.asarray(self.screen_sizes, dtype=np.float64).reshape(-1)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @classmethod
+    def from_instances(cls, instances: List[InstanceBounds]) -> "InstanceArrays":
+        """
+        Create from InstanceBounds objects.
+
+        Args:
+            instances: Instance bounds
+
+        Returns:
+            InstanceArrays with their precomputed screen sizes
+        """
+        return cls(
+            positions=np.array([i.position for i in instances], dtype=np.float64).reshape(-1, 3),
+            radii=np.array([i.radius for i in instances], dtype=np.float64),
+            screen_sizes=np.array([i.screen_size for i in instances], dtype=np.float64),
+            ids=[i.instance_id for i in instances],
+        )
+
+
+@dataclass
+class CameraFrame:
+    """
+    Camera state for one frame of a camera path.
+
+    Attributes:
+        frame: Frame number
+        position: Camera world position
+        forward: Camera forward direction (normalized)
+        up: Camera up direction (normalized)
+        right: Camera right direction (normalized)
+        fov: Vertical field of view in degrees
+        aspect: Aspect ratio (width / height)
+        near: Near clip distance
+        far: Far clip distance
+    """
+    frame: int = 1
+    position: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    forward: Tuple[float, float, float] = (0.0, 0.0, -1.0)
+    up: Tuple[float, float, float] = (0.0, 1.0, 0.0)
+    right: Tuple[float, float, float] = (1.0, 0.0, 0.0)
+    fov: float = 60.0
+    aspect: float = 16.0 / 9.0
+    near: float = 0.1
+    far: float = 1000.0
+
+
+@dataclass
+class BatchCullingResult:
+    """
+    Result of batched culling.
+
+    Attributes:
+        codes: (N,) uint8 culling code per instance (VISIBLE or a
+            CULLED_* reason), in instance order
+        statistics: Culling statistics
+        frame: Frame number (camera path culling)
+    """
+    codes: "np.ndarray"
+    statistics: Dict[str, int] = field(default_factory=dict)
+    frame: Optional[int] = None
+
+    @property
+    def visible(self) -> "np.ndarray":
+        """(N,) boolean visibility mask."""
+        return self.codes == VISIBLE
+
+    def visible_indices(self) -> "np.ndarray":
+        """Indices of visible instances."""
+        return np.flatnonzero(self.codes == VISIBLE)
+
+    def bitset(self) -> "np.ndarray":
+        """Visibility packed 8 instances per byte (bit i % 8 of byte i // 8)."""
+        return np.packbits(self.visible, bitorder="little")
+
+    def to_culling_result(self, ids: List[str]) -> CullingResult:
+        """
+        Convert to a CullingResult keyed by instance ID.
+
+        Args:
+            ids: Instance identifiers (index order)
+
+        Returns:
+            CullingResult
+        """
+        result = CullingResult(statistics=dict(self.statistics))
+        for instance_id, code in zip(ids, self.codes.tolist()):
+            if code == VISIBLE:
+                result.visible.append(instance_id)
+            else:
+                result.culled[instance_id] = CULL_REASONS[code]
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (visibility as a base64 bitset)."""
+        return {
+            "frame": self.frame,
+            "count": int(len(self.codes)),
+            "statistics": self.statistics,
+            "visibility": encode_bitset(self.bitset()),
+        }
+
+
+def encode_bitset(bits: "np.ndarray") -> str:
+    """Encode a packed bitset as base64 text."""
+    return base64.b64encode(np.ascontiguousarray(bits, dtype=np.uint8).tobytes()).decode("ascii")
+
+
+def decode_bitset(data: str, count: int) -> "np.ndarray":
+    """
+    Decode a base64 bitset.
+
+    Args:
+        data: Base64 text from encode_bitset
+        count: Number of instances
+
+    Returns:
+        (count,) boolean array
+    """
+    bits = np.frombuffer(base64.b64decode(data), dtype=np.uint8)
+    return np.unpackbits(bits, count=count, bitorder="little").astype(bool)
+
+
+@dataclass
+class _CullParams:
+    """Culling tests in effect for one camera."""
+    camera: "np.ndarray"
+    planes: Optional["np.ndarray"] = None
+    max_distance: Optional[float] = None
+    min_screen_size: Optional[float] = None
+    fov: Optional[float] = None
+
+    def screen_sizes(self, radii: "np.ndarray", distances: "np.ndarray") -> "np.ndarray":
+        """Screen size estimate (as CullingManager.estimate_screen_size)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            angular = np.degrees(2 * np.arctan(radii / distances))
+        return np.where(distances > 0, angular / self.fov, 1.0)
+
+    def classify(
+        self,
+        positions: "np.ndarray",
+        radii: "np.ndarray",
+        sizes: Optional["np.ndarray"],
+    ) -> "np.ndarray":
+        """Exact culling codes for instances (same rules as cull_instances)."""
+        codes = np.zeros(len(positions), dtype=np.uint8)
+        for start in range(0, len(positions), _CULL_CHUNK):
+            chunk = slice(start, start + _CULL_CHUNK)
+            p = positions[chunk]
+            r = radii[chunk]
+            out = codes[chunk]
+
+            distances = None
+            if self.max_distance is not None or (self.min_screen_size is not None and sizes is None):
+                distances = np.sqrt(((p - self.camera) ** 2).sum(axis=1))
+
+            if self.min_screen_size is not None:
+                s = sizes[chunk] if sizes is not None else self.screen_sizes(r, distances)
+                out[s < self.min_screen_size] = CULLED_SMALL_OBJECT
+            if self.planes is not None:
+                plane_distances = p @ self.planes[:, :3].T + self.planes[:, 3]
+                out[(plane_distances < -r[:, None]).any(axis=1)] = CULLED_FRUSTUM
+            if self.max_distance is not None:
+                out[distances > self.max_distance] = CULLED_DISTANCE
+        return codes
+
+
+@dataclass
+class _BVHLevel:
+    """Nodes of one BVH level (leaves are level 0)."""
+    start: "np.ndarray"         # First instance (BVH order)
+    count: "np.ndarray"         # Instances under the node
+    center_min: "np.ndarray"    # Bounds of sphere centers
+    center_max: "np.ndarray"
+    sphere_min: "np.ndarray"    # Bounds of whole spheres
+    sphere_max: "np.ndarray"
+    radius_min: "np.ndarray"
+    radius_max: "np.ndarray"
+    size_min: Optional["np.ndarray"] = None     # Precomputed screen sizes
+    size_max: Optional["np.ndarray"] = None
+
+    def merge_pairs(self) -> "_BVHLevel":
+        """Parent level: nodes 2i and 2i + 1 share parent i."""
+        n = len(self.start)
+        left = np.arange(0, n, 2)
+        right = np.minimum(left + 1, n - 1)
+        count = self.count[left] + np.where(left + 1 < n, self.count[right], 0)
+
+        def pair(values, reduce):
+            return None if values is None else reduce(values[left], values[right])
+
+        return _BVHLevel(
+            start=self.start[left],
+            count=count,
+            center_min=pair(self.center_min, np.minimum),
+            center_max=pair(self.center_max, np.maximum),
+            sphere_min=pair(self.sphere_min, np.minimum),
+            sphere_max=pair(self.sphere_max, np.maximum),
+            radius_min=pair(self.radius_min, np.minimum),
+            radius_max=pair(self.radius_max, np.maximum),
+            size_min=pair(self.size_min, np.minimum),
+            size_max=pair(self.size_max, np.maximum),
+        )
+
+
+def _morton_codes(positions: "np.ndarray") -> "np.ndarray":
+    """30-bit Morton codes of positions quantized to their bounds."""
+    low = positions.min(axis=0)
+    extent = np.maximum(positions.max(axis=0) - low, 1e-12)
+    cells = ((positions - low) / extent * 1023).astype(np.uint64)
+
+    def spread(x):
+        x = (x | (x << np.uint64(16))) & np.uint64(0x030000FF)
+        x = (x | (x << np.uint64(8))) & np.uint64(0x0300F00F)
+        x = (x | (x << np.uint64(4))) & np.uint64(0x030C30C3)
+        x = (x | (x << np.uint64(2))) & np.uint64(0x09249249)
+        return x
+
+    return spread(cells[:, 0]) | (spread(cells[:, 1]) << np.uint64(1)) | (spread(cells[:, 2]) << np.uint64(2))
+
+
+def _index_ranges(starts: "np.ndarray", counts: "np.ndarray") -> "np.ndarray":
+    """Concatenated ranges start..start+count."""
+    total = int(counts.sum())
+    offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + offsets
+
+
+class InstanceBVH:
+    """
+    Bounding volume hierarchy over instance bounding spheres.
+
+    Instances are sorted along a Morton curve and grouped into leaves of
+    leaf_size neighbours; parents pair up nodes level by level. Culling
+    walks the tree breadth first, deciding whole nodes when all of their
+    instances share one outcome and testing only the remaining leaves
+    per instance. Build once and reuse for every frame of a camera path.
+
+    Usage:
+        bvh = InstanceBVH(InstanceArrays(positions, radii))
+        result = manager.cull_arrays(instances, bvh=bvh)
+    """
+
+    def __init__(self, instances: InstanceArrays, leaf_size: int = DEFAULT_BVH_LEAF_SIZE):
+        """
+        Build hierarchy.
+
+        Args:
+            instances: Instance bounds
+            leaf_size: Instances per leaf node
+        """
+        self.leaf_size = max(1, leaf_size)
+        self.count = len(instances)
+        self.order = np.argsort(_morton_codes(instances.positions), kind="stable") if self.count else (
+            np.zeros(0, dtype=np.intp)
+        )
+        self.positions = instances.positions[self.order]
+        self.radii = np.ascontiguousarray(instances.radii[self.order])
+        self.screen_sizes = None
+        if instances.screen_sizes is not None:
+            self.screen_sizes = instances.screen_sizes[self.order]
+        self.levels: List[_BVHLevel] = []
+
+        # Work done by the last classify() call
+        self.last_nodes_visited = 0
+        self.last_instances_tested = 0
+
+        if self.count:
+            self._build()
+
+    def _build(self) -> None:
+        """Create leaf nodes, then merge pairs up to the root."""
+        starts = np.arange(0, self.count, self.leaf_size)
+        counts = np.minimum(self.leaf_size, self.count - starts)
+        radii = self.radii[:, None]
+
+        leaves = _BVHLevel(
+            start=starts,
+            count=counts,
+            center_min=np.minimum.reduceat(self.positions, starts, axis=0),
+            center_max=np.maximum.reduceat(self.positions, starts, axis=0),
+            sphere_min=np.minimum.reduceat(self.positions - radii, starts, axis=0),
+            sphere_max=np.maximum.reduceat(self.positions + radii, starts, axis=0),
+            radius_min=np.minimum.reduceat(self.radii, starts),
+            radius_max=np.maximum.reduceat(self.radii, starts),
+        )
+        if self.screen_sizes is not None:
+            leaves.size_min = np.minimum.reduceat(self.screen_sizes, starts)
+            leaves.size_max = np.maximum.reduceat(self.screen_sizes, starts)
+
+        self.levels = [leaves]
+        while len(self.levels[-1].start) > 1:
+            self.levels.append(self.levels[-1].merge_pairs())
+
+    @property
+    def node_count(self) -> int:
+        """Total nodes across all levels."""
+        return sum(len(level.start) for level in self.levels)
+
+    def classify(self, params: _CullParams) -> "np.ndarray":
+        """
+        Culling codes for all instances.
+
+        Args:
+            params: Culling tests for the camera
+
+        Returns:
+            (N,) uint8 codes in instance order
+        """
+        codes = np.empty(self.count, dtype=np.uint8)
+        self.last_nodes_visited = 0
+        self.last_instances_tested = 0
+        if not self.count:
+            return codes
+
+        frontier = np.zeros(1, dtype=np.intp)
+        for depth in range(len(self.levels) - 1, -1, -1):
+            level = self.levels[depth]
+            self.last_nodes_visited += len(frontier)
+            decided = self._classify_nodes(level, frontier, params)
+
+            done = decided != 255
+            if done.any():
+                nodes = frontier[done]
+                codes[_index_ranges(level.start[nodes], level.count[nodes])] = np.repeat(
+                    decided[done], level.count[nodes]
+                )
+
+            open_nodes = frontier[~done]
+            if depth == 0:
+                if len(open_nodes):
+                    index = _index_ranges(level.start[open_nodes], level.count[open_nodes])
+                    self.last_instances_tested = len(index)
+                    sizes = self.screen_sizes[index] if self.screen_sizes is not None else None
+                    codes[index] = params.classify(self.positions[index], self.radii[index], sizes)
+                break
+
+            children = np.stack([open_nodes * 2, open_nodes * 2 + 1], axis=1).ravel()
+            frontier = children[children < len(self.levels[depth - 1].start)]
+
+        result = np.empty_like(codes)
+        result[self.order] = codes
+        return result
+
+    def _classify_nodes(
+        self,
+        level: _BVHLevel,
+        nodes: "np.ndarray",
+        params: _CullParams,
+    ) -> "np.ndarray":
+        """Code shared by all instances of each node, or 255 if mixed."""
+        n = len(nodes)
+        center_min = level.center_min[nodes]
+        center_max = level.center_max[nodes]
+
+        # Each test: all instances culled by it / none culled by it
+        all_far = np.zeros(n, dtype=bool)
+        none_far = np.ones(n, dtype=bool)
+        distance_min = distance_max = None
+        if params.max_distance is not None or (params.min_screen_size is not None and level.size_min is None):
+            nearest = np.maximum(np.maximum(center_min - params.camera, params.camera - center_max), 0)
+            farthest = np.maximum(np.abs(params.camera - center_min), np.abs(params.camera - center_max))
+            distance_min = np.sqrt((nearest ** 2).sum(axis=1))
+            distance_max = np.sqrt((farthest ** 2).sum(axis=1))
+        if params.max_distance is not None:
+            all_far = distance_min > params.max_distance + _NODE_EPSILON
+            none_far = distance_max <= params.max_distance - _NODE_EPSILON
+
+        all_outside = np.zeros(n, dtype=bool)
+        none_outside = np.ones(n, dtype=bool)
+        if params.planes is not None:
+            sphere_min = level.sphere_min[nodes]
+            sphere_max = level.sphere_max[nodes]
+            center = (sphere_min + sphere_max) * 0.5
+            extent = (sphere_max - sphere_min) * 0.5
+            normals = params.planes[:, :3]
+            plane_distance = center @ normals.T + params.planes[:, 3]
+            reach = extent @ np.abs(normals).T
+            all_outside = (plane_distance + reach < -_NODE_EPSILON).any(axis=1)
+            none_outside = (plane_distance - reach >= _NODE_EPSILON).all(axis=1)
+
+        all_small = np.zeros(n, dtype=bool)
+        none_small = np.ones(n, dtype=bool)
+        if params.min_screen_size is not None:
+            if level.size_min is not None:
+                size_min = level.size_min[nodes]
+                size_max = level.size_max[nodes]
+            else:
+                size_min = params.screen_sizes(level.radius_min[nodes], distance_max)
+                # Instances at the camera count as size 1.0
+                size_min = np.where(distance_min > 0, size_min, np.minimum(size_min, 1.0))
+                size_max = np.where(
+                    distance_min > 0,
+                    params.screen_sizes(level.radius_max[nodes], distance_min),
+                    np.inf,
+                )
+            all_small = size_max < params.min_screen_size - _NODE_EPSILON
+            none_small = size_min >= params.min_screen_size + _NODE_EPSILON
+
+        # Same priority as per instance: distance, frustum, small object
+        decided = np.full(n, 255, dtype=np.uint8)
+        decided[none_far & none_outside & none_small] = VISIBLE
+        decided[none_far & none_outside & all_small] = CULLED_SMALL_OBJECT
+        decided[none_far & all_outside] = CULLED_FRUSTUM
+        decided[all_far] = CULLED_DISTANCE
+        return decided
+
+
 class CullingManager:
     """
     Manages culling for scene instances.
@@ -308,6 +800,11 @@ class CullingManager:
         manager = CullingManager()
         manager.set_frustum_from_camera(...)
         result = manager.cull_instances(instances)
+
+        # Millions of instances along a camera path
+        arrays = InstanceArrays(positions, radii)
+        results = manager.cull_camera_path(arrays, camera_frames)
+        gn_data = manager.to_gn_input()  # includes per-frame bitsets
     """
 
     def __init__(self, config: Optional[CullingConfig] = None):
@@ -320,6 +817,9 @@ class CullingManager:
         self.config = config or CullingConfig()
         self.frustum: Optional[Frustum] = None
         self.camera_position: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        self.fov: Optional[float] = None
+        self.frame_visibility: Dict[int, "np.ndarray"] = {}
+        self.visibility_count = 0
 
     def set_frustum(self, frustum: Frustum) -> None:
         """Set camera frustum."""
@@ -338,6 +838,7 @@ class CullingManager:
     ) -> None:
         """Set frustum from camera parameters."""
         self.camera_position = position
+        self.fov = fov
         self.frustum = Frustum.from_camera(
             position, forward, up, right, fov, aspect, near, far
         )
@@ -355,6 +856,10 @@ class CullingManager:
         Returns:
             CullingResult with visible and culled lists
         """
+        if HAS_NUMPY and instances:
+            arrays = InstanceArrays.from_instances(instances)
+            return self.cull_arrays(arrays).to_culling_result(arrays.ids)
+
         result = CullingResult()
         stats = {
             "total": len(instances),
@@ -399,6 +904,101 @@ class CullingManager:
         result.statistics = stats
         return result
 
+    def cull_arrays(
+        self,
+        instances: InstanceArrays,
+        bvh: Optional[InstanceBVH] = None,
+        occlusion: Optional["OcclusionCuller"] = None,
+    ) -> BatchCullingResult:
+        """
+        Cull a batch of instances for the current camera.
+
+        Applies the same tests as cull_instances. Without precomputed
+        screen sizes, small object culling estimates them from radius
+        and distance (needs a frustum set from camera parameters).
+
+        Args:
+            instances: Instance bounds as arrays
+            bvh: Hierarchy built over the same instances (None tests
+                every instance)
+            occlusion: Occlusion culler rendered for the current camera;
+                instances passing the other tests are checked against it
+
+        Returns:
+            BatchCullingResult
+        """
+        params = self._cull_params(instances)
+        if bvh is not None:
+            codes = bvh.classify(params)
+        else:
+            codes = params.classify(instances.positions, instances.radii, instances.screen_sizes)
+
+        if occlusion is not None and occlusion.depth_buffer is not None:
+            visible = np.flatnonzero(codes == VISIBLE)
+            hidden = occlusion.occluded_spheres(instances.positions[visible], instances.radii[visible])
+            codes[visible[hidden]] = CULLED_OCCLUSION
+
+        return BatchCullingResult(codes=codes, statistics=_culling_statistics(codes))
+
+    def cull_camera_path(
+        self,
+        instances: InstanceArrays,
+        cameras: List[CameraFrame],
+        bvh: Optional[InstanceBVH] = None,
+        leaf_size: int = DEFAULT_BVH_LEAF_SIZE,
+        occlusion: Optional["OcclusionCuller"] = None,
+    ) -> List[BatchCullingResult]:
+        """
+        Cull instances for every frame of a camera path.
+
+        The BVH is built once and reused for all frames; per-frame
+        visibility bitsets are kept for to_gn_input.
+
+        Args:
+            instances: Instance bounds as arrays
+            cameras: Camera state per frame
+            bvh: Prebuilt hierarchy (built here if None)
+            leaf_size: Instances per BVH leaf when building
+            occlusion: Occlusion culler with occluders added; its depth
+                buffer is rendered for each frame
+
+        Returns:
+            BatchCullingResult per camera frame
+        """
+        if bvh is None:
+            bvh = InstanceBVH(instances, leaf_size=leaf_size)
+
+        results = []
+        self.frame_visibility = {}
+        self.visibility_count = len(instances)
+        for camera in cameras:
+            self.set_frustum_from_camera(
+                camera.position, camera.forward, camera.up, camera.right,
+                camera.fov, camera.aspect, camera.near, camera.far,
+            )
+            if occlusion is not None:
+                occlusion.set_camera_frame(camera)
+                occlusion.render()
+            result = self.cull_arrays(instances, bvh=bvh, occlusion=occlusion)
+            result.frame = camera.frame
+            self.frame_visibility[camera.frame] = result.bitset()
+            results.append(result)
+        return results
+
+    def _cull_params(self, instances: InstanceArrays) -> _CullParams:
+        """Culling tests enabled by the config for the current camera."""
+        params = _CullParams(camera=np.asarray(self.camera_position, dtype=np.float64))
+        if self.config.enable_distance_culling:
+            params.max_distance = self.config.max_distance
+        if self.config.enable_frustum_culling and self.frustum and self.frustum.planes:
+            params.planes = self.frustum.as_array()
+        if self.config.enable_small_object_culling and (
+            instances.screen_sizes is not None or self.fov
+        ):
+            params.min_screen_size = self.config.min_screen_size
+            params.fov = self.fov
+        return params
+
     def _calculate_distance(self, position: Tuple[float, float, float]) -> float:
         """Calculate distance from camera to position."""
         dx = position[0] - self.camera_position[0]
@@ -444,21 +1044,66 @@ class CullingManager:
         Returns:
             GN-compatible dictionary
         """
-        return {
+        gn_input = {
             "version": "1.0",
             "config": self.config.to_dict(),
             "frustum": self.frustum.to_dict() if self.frustum else None,
             "camera_position": list(self.camera_position),
         }
+        if self.frame_visibility:
+            # Packed little-endian bitsets, base64 encoded per frame
+            gn_input["visibility"] = {
+                "instance_count": self.visibility_count,
+                "encoding": "bitset_base64",
+                "frames": {
+                    str(frame): encode_bitset(bits)
+                    for frame, bits in self.frame_visibility.items()
+                },
+            }
+        return gn_input
+
+
+def _culling_statistics(codes: "np.ndarray") -> Dict[str, int]:
+    """Statistics matching cull_instances from culling codes."""
+    counts = np.bincount(codes, minlength=len(CULL_REASONS))
+    return {
+        "total": int(len(codes)),
+        "frustum_culled": int(counts[CULLED_FRUSTUM]),
+        "distance_culled": int(counts[CULLED_DISTANCE]),
+        "small_object_culled": int(counts[CULLED_SMALL_OBJECT]),
+        "occlusion_culled": int(counts[CULLED_OCCLUSION]),
+        "visible": int(counts[VISIBLE]),
+    }
 
 
 class OcclusionCuller:
     """
     Hierarchical Z-Buffer occlusion culling.
 
-    Uses hierarchical depth buffer for efficient occlusion queries.
+    Occluder boxes and triangle meshes are rasterized into a float32
+    buffer of view depth (distance along the camera forward axis), and a
+    max-depth mip pyramid is built from it. A query box is occluded when
+    its nearest depth lies behind the farthest depth stored over its
+    screen rectangle, read from the pyramid level where that rectangle
+    spans at most 2x2 texels.
+
+    Both sides are conservative: occluders only cover pixels they cover
+    completely, at the farthest depth of their surface within the pixel
+    (boxes through their silhouette, so faces leave no cracks between
+    them), and queries that cross the near plane or leave the screen are never
+    reported occluded. Occluders must therefore lie inside the geometry
+    they stand for (e.g. building volumes, not bounding boxes of trees).
+    Occluders crossing the near plane are skipped.
+
     This is a Python implementation for pre-calculation; actual
     runtime occlusion should use GPU-based methods in Blender.
+
+    Usage:
+        culler = OcclusionCuller(resolution=256)
+        culler.add_occluder_boxes(building_min, building_max)
+        culler.set_camera(position, forward, up, fov=50.0, aspect=16 / 9)
+        culler.render()
+        hidden = culler.occluded_boxes(query_min, query_max)
     """
 
     def __init__(self, resolution: int = 256):
@@ -466,93 +1111,514 @@ class OcclusionCuller:
         Initialize occlusion culler.
 
         Args:
-            resolution: Hi-Z buffer resolution
+            resolution: Hi-Z buffer resolution (width in pixels)
         """
         self.resolution = resolution
-        self.depth_buffer: Optional[List[List[float]]] = None
+        self.depth_buffer: Optional["np.ndarray"] = None
+        self.pyramid: List["np.ndarray"] = []
+        self._boxes: List[Tuple["np.ndarray", "np.ndarray"]] = []
+        self._polygons: List["np.ndarray"] = []
+
+        # Camera (set_camera)
+        self.camera_position = (0.0, 0.0, 0.0)
+        self.near = 0.1
+        self.far = 1000.0
+        self._basis: Optional["np.ndarray"] = None
+        self._scale = (1.0, 1.0)
+        self._aspect = 1.0
+
+    @property
+    def width(self) -> int:
+        """Buffer width in pixels."""
+        return self.resolution
+
+    @property
+    def height(self) -> int:
+        """Buffer height in pixels (resolution / aspect)."""
+        return max(1, int(round(self.resolution / self._aspect)))
+
+    # -------------------------------------------------------------------------
+    # Occluders
+    # -------------------------------------------------------------------------
+
+    def add_occluder_boxes(self, min_corners: "np.ndarray", max_corners: "np.ndarray") -> None:
+        """
+        Add axis-aligned box occluders.
+
+        Args:
+            min_corners: (N, 3) world-space minimum corners
+            max_corners: (N, 3) world-space maximum corners
+        """
+        self._boxes.append((
+            np.asarray(min_corners, dtype=np.float64).reshape(-1, 3),
+            np.asarray(max_corners, dtype=np.float64).reshape(-1, 3),
+        ))
+
+    def add_occluder_mesh(self, vertices: "np.ndarray", faces: "np.ndarray") -> None:
+        """
+        Add a mesh occluder made of convex planar faces.
+
+        Each face is rasterized on its own, so pixels along edges shared
+        between faces stay uncovered; prefer a few large faces (quads for
+        walls and floors) over finely triangulated meshes.
+
+        Args:
+            vertices: (V, 3) world-space vertex positions
+            faces: (F, K) vertex indices, K >= 3 (e.g. triangles or quads)
+        """
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        faces = np.asarray(faces, dtype=np.intp)
+        if faces.ndim != 2 or faces.shape[1] < 3:
+            raise ValueError("faces must be an (F, K) index array with K >= 3")
+        self._polygons.append(vertices[faces])
+
+    def clear_occluders(self) -> None:
+        """Remove all occluders."""
+        self._boxes = []
+        self._polygons = []
+
+    # -------------------------------------------------------------------------
+    # Camera and rasterization
+    # -------------------------------------------------------------------------
+
+    def set_camera(
+        self,
+        position: Tuple[float, float, float],
+        forward: Tuple[float, float, float],
+        up: Optional[Tuple[float, float, float]] = None,
+        fov: float = 60.0,
+        aspect: float = 1.0,
+        near: float = 0.1,
+        far: float = 1000.0,
+    ) -> None:
+        """
+        Set the camera used by render() and queries.
+
+        Args:
+            position: Camera world position
+            forward: Camera forward direction
+            up: Camera up direction (default: world +Z, or +Y when
+                looking straight up or down)
+            fov: Vertical field of view in degrees
+            aspect: Aspect ratio (width / height)
+            near: Near clip distance
+            far: Far clip distance
+        """
+        forward_axis = _unit(np.asarray(forward, dtype=np.float64))
+        if up is None:
+            up = (0.0, 1.0, 0.0) if abs(forward_axis[2]) > 0.999 else (0.0, 0.0, 1.0)
+        right_axis = _unit(np.cross(forward_axis, np.asarray(up, dtype=np.float64)))
+        up_axis = np.cross(right_axis, forward_axis)
+
+        self.camera_position = tuple(float(v) for v in position)
+        self._basis = np.stack([right_axis, up_axis, forward_axis], axis=1)
+        self._aspect = aspect
+        self.near = near
+        self.far = far
+
+        tan_half_fov = math.tan(math.radians(fov / 2))
+        self._scale = (
+            self.width / (2 * tan_half_fov * aspect),
+            self.height / (2 * tan_half_fov),
+        )
+
+    def set_camera_frame(self, camera: CameraFrame) -> None:
+        """Set the camera from a CameraFrame."""
+        self.set_camera(
+            camera.position, camera.forward, camera.up,
+            camera.fov, camera.aspect, camera.near, camera.far,
+        )
+
+    def render(self) -> None:
+        """Rasterize all occluders and rebuild the Hi-Z pyramid."""
+        if self._basis is None:
+            raise ValueError("Camera not set; call set_camera() first")
+
+        depth = np.full((self.height, self.width), self.far, dtype=np.float32)
+        for min_corners, max_corners in self._boxes:
+            for start in range(0, len(min_corners), _RASTER_CHUNK):
+                chunk = slice(start, start + _RASTER_CHUNK)
+                self._rasterize_boxes(depth, min_corners[chunk], max_corners[chunk])
+        for polygons in self._polygons:
+            for start in range(0, len(polygons), _RASTER_CHUNK):
+                self._rasterize_polygons(depth, polygons[start:start + _RASTER_CHUNK])
+
+        self.depth_buffer = depth
+        self.pyramid = _max_pyramid(depth, self.far)
 
     def build_depth_buffer(
         self,
         occluders: List[InstanceBounds],
         camera_position: Tuple[float, float, float],
         camera_forward: Tuple[float, float, float],
+        camera_up: Optional[Tuple[float, float, float]] = None,
+        fov: float = 60.0,
+        aspect: float = 1.0,
+        near: float = 0.1,
+        far: float = 1000.0,
     ) -> None:
         """
         Build hierarchical depth buffer from occluders.
 
+        Each occluder uses its AABB, or the cube inscribed in its
+        bounding sphere when the AABB does not contain its position.
+
         Args:
             occluders: List of potential occluding objects
             camera_position: Camera position
             camera_forward: Camera forward direction
+            camera_up: Camera up direction (see set_camera)
+            fov: Vertical field of view in degrees
+            aspect: Aspect ratio (width / height)
+            near: Near clip distance
+            far: Far clip distance
         """
-        # Initialize depth buffer with far plane
-        self.depth_buffer = [[1.0] * self.resolution for _ in range(self.resolution)]
+        self.clear_occluders()
+        if occluders:
+            boxes = [_instance_box(o, inscribed=True) for o in occluders]
+            self.add_occluder_boxes([b[0] for b in boxes], [b[1] for b in boxes])
+        self.set_camera(camera_position, camera_forward, camera_up, fov, aspect, near, far)
+        self.render()
+
+    def _to_view(self, points: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """View-space x (right), y (up) and depth of world points."""
+        view = (points - np.asarray(self.camera_position)) @ self._basis
+        return view[..., 0], view[..., 1], view[..., 2]
+
+    def _to_screen(
+        self,
+        x: "np.ndarray",
+        y: "np.ndarray",
+        depth: "np.ndarray",
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Pixel coordinates (origin top-left) of view-space points."""
+        screen_x = self.width * 0.5 + x / depth * self._scale[0]
+        screen_y = self.height * 0.5 - y / depth * self._scale[1]
+        return screen_x, screen_y
+
+    def _rasterize_boxes(
+        self,
+        depth_buffer: "np.ndarray",
+        min_corners: "np.ndarray",
+        max_corners: "np.ndarray",
+    ) -> None:
+        """Write boxes into the depth buffer through their silhouettes."""
+        x, y, z = self._to_view(_box_corners(min_corners, max_corners))
+        position = np.asarray(self.camera_position)
+        front = np.stack([position < min_corners, position > max_corners], axis=2).reshape(-1, 6)
+        keep = (z > self.near).all(axis=1) & (z.min(axis=1) < self.far) & front.any(axis=1)
+        x, y, z, front = x[keep], y[keep], z[keep], front[keep]
+        if not len(z):
+            return
+        sx, sy = self._to_screen(x, y, z)
+
+        # The front surface of a convex body lies at the farthest of its
+        # front face planes, so those planes bound depth without cracks
+        face = np.asarray(_BOX_FACES)[:, :3]
+        planes, well_defined = _screen_planes(sx[:, face], sy[:, face], 1.0 / z[:, face])
+        usable = ~(front & ~well_defined).any(axis=1)
+
+        # Silhouette edges separate a front face from a back face
+        corner = np.asarray(_BOX_EDGES)[:, :2]
+        faces = np.asarray(_BOX_EDGES)[:, 2:]
+        silhouette = front[:, faces[:, 0]] != front[:, faces[:, 1]]
+        start_x, start_y = sx[:, corner[:, 0]], sy[:, corner[:, 0]]
+        edge_x, edge_y = sx[:, corner[:, 1]] - start_x, sy[:, corner[:, 1]] - start_y
+        center_x = sx.mean(axis=1, keepdims=True)
+        center_y = sy.mean(axis=1, keepdims=True)
+        inner = np.sign(edge_x * (center_y - start_y) - edge_y * (center_x - start_x))
+
+        self._fill(
+            depth_buffer, sx[usable], sy[usable],
+            start_x[usable], start_y[usable], edge_x[usable], edge_y[usable],
+            (inner * silhouette)[usable], planes[usable], front[usable],
+        )
 
-        # Rasterize occluders (simplified)
-        for occluder in occluders:
-            self._rasterize_occluder(occluder, camera_position, camera_forward)
+    def _rasterize_polygons(self, depth_buffer: "np.ndarray", polygons: "np.ndarray") -> None:
+        """Write convex planar polygons (F, K, 3) into the depth buffer."""
+        x, y, z = self._to_view(polygons)
+        keep = (z > self.near).all(axis=1) & (z.min(axis=1) < self.far)
+        x, y, z = x[keep], y[keep], z[keep]
+        if not len(z):
+            return
+        sx, sy = self._to_screen(x, y, z)
+
+        # Winding and size from the shoelace formula
+        edge_x = np.roll(sx, -1, axis=1) - sx
+        edge_y = np.roll(sy, -1, axis=1) - sy
+        area = 0.5 * (sx * edge_y - sy * edge_x).sum(axis=1)
+        planes, well_defined = _screen_planes(sx[:, :3], sy[:, :3], 1.0 / z[:, :3])
+
+        usable = (np.abs(area) > 0.25) & well_defined
+        inner = np.broadcast_to(np.sign(area)[:, None], edge_x.shape)
+        self._fill(
+            depth_buffer, sx[usable], sy[usable],
+            sx[usable], sy[usable], edge_x[usable], edge_y[usable],
+            inner[usable], planes[usable, None], np.ones((int(usable.sum()), 1), dtype=bool),
+        )
 
-    def _rasterize_occluder(
+    def _fill(
         self,
-        occluder: InstanceBounds,
-        camera_position: Tuple[float, float, float],
-        camera_forward: Tuple[float, float, float],
+        depth_buffer: "np.ndarray",
+        sx: "np.ndarray",
+        sy: "np.ndarray",
+        start_x: "np.ndarray",
+        start_y: "np.ndarray",
+        edge_x: "np.ndarray",
+        edge_y: "np.ndarray",
+        inner: "np.ndarray",
+        planes: "np.ndarray",
+        plane_mask: "np.ndarray",
     ) -> None:
-        """Rasterize single occluder to depth buffer."""
-        # Simplified: just use bounding sphere
-        distance = math.sqrt(
-            (occluder.position[0] - camera_position[0]) ** 2 +
-            (occluder.position[1] - camera_position[1]) ** 2 +
-            (occluder.position[2] - camera_position[2]) ** 2
+        """
+        Inner-conservative fill of convex screen regions (min depth).
+
+        Args:
+            depth_buffer: Buffer updated in place
+            sx, sy: (F, K) screen vertices bounding each region
+            start_x, start_y: (F, E) edge start points
+            edge_x, edge_y: (F, E) edge vectors
+            inner: (F, E) sign of the inner side of each edge (0 ignores it)
+            planes: (F, P, 3) 1/depth planes (a, b, c) in screen space
+            plane_mask: (F, P) planes bounding each region's depth
+        """
+        height, width = depth_buffer.shape
+        x0 = np.clip(np.floor(sx.min(axis=1)), 0, width).astype(np.intp)
+        x1 = np.clip(np.ceil(sx.max(axis=1)), 0, width).astype(np.intp)
+        y0 = np.clip(np.floor(sy.min(axis=1)), 0, height).astype(np.intp)
+        y1 = np.clip(np.ceil(sy.max(axis=1)), 0, height).astype(np.intp)
+
+        box_width = x1 - x0
+        pixel_counts = np.where(y1 > y0, box_width * (y1 - y0), 0)
+        margin = 0.5 * (np.abs(edge_x) + np.abs(edge_y)) * np.abs(inner)
+        plane_margin = 0.5 * (np.abs(planes[..., 0]) + np.abs(planes[..., 1]))
+        flat_depth = depth_buffer.reshape(-1)
+
+        # Split regions so each batch tests a bounded number of pixels
+        ends = np.cumsum(pixel_counts)
+        first = 0
+        while first < len(pixel_counts):
+            budget = (ends[first - 1] if first else 0) + _RASTER_PIXELS
+            last = max(first + 1, int(np.searchsorted(ends, budget, side="right")))
+            batch = slice(first, last)
+            first = last
+
+            counts = pixel_counts[batch]
+            if not counts.sum():
+                continue
+            region = np.repeat(np.arange(batch.start, batch.stop), counts)
+            offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            px = x0[region] + offset % box_width[region]
+            py = y0[region] + offset // box_width[region]
+            cx = px + 0.5
+            cy = py + 0.5
+
+            # Inner-conservative: the whole pixel lies inside every edge
+            inside = np.ones(len(region), dtype=bool)
+            for k in range(edge_x.shape[1]):
+                edge = (
+                    edge_x[region, k] * (cy - start_y[region, k])
+                    - edge_y[region, k] * (cx - start_x[region, k])
+                )
+                inside &= edge * inner[region, k] >= margin[region, k]
+            region, px, py, cx, cy = region[inside], px[inside], py[inside], cx[inside], cy[inside]
+
+            # Farthest depth of the bounding planes over the pixel
+            min_inverse = np.full(len(region), np.inf)
+            for k in range(planes.shape[1]):
+                plane_inverse = (
+                    planes[region, k, 0] * cx + planes[region, k, 1] * cy
+                    + planes[region, k, 2] - plane_margin[region, k]
+                )
+                min_inverse = np.where(
+                    plane_mask[region, k], np.minimum(min_inverse, plane_inverse), min_inverse
+                )
+            valid = (min_inverse > 0) & np.isfinite(min_inverse)
+            index = (py * width + px)[valid]
+            # Round up so float32 storage never moves the surface closer
+            farthest = (1.0 + 1e-6) / min_inverse[valid]
+            np.minimum.at(flat_depth, index, farthest.astype(np.float32))
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def occluded_boxes(self, min_corners: "np.ndarray", max_corners: "np.ndarray") -> "np.ndarray":
+        """
+        Test axis-aligned boxes against the Hi-Z pyramid.
+
+        Args:
+            min_corners: (N, 3) world-space minimum corners
+            max_corners: (N, 3) world-space maximum corners
+
+        Returns:
+            (N,) boolean array, True where the box is certainly hidden
+        """
+        min_corners = np.asarray(min_corners, dtype=np.float64).reshape(-1, 3)
+        max_corners = np.asarray(max_corners, dtype=np.float64).reshape(-1, 3)
+        result = np.zeros(len(min_corners), dtype=bool)
+        if self.depth_buffer is None:
+            return result
+
+        for start in range(0, len(result), _QUERY_CHUNK):
+            chunk = slice(start, start + _QUERY_CHUNK)
+            result[chunk] = self._occluded_chunk(min_corners[chunk], max_corners[chunk])
+        return result
+
+    def occluded_spheres(self, positions: "np.ndarray", radii: "np.ndarray") -> "np.ndarray":
+        """
+        Test bounding spheres (via their bounding boxes).
+
+        Args:
+            positions: (N, 3) sphere centers
+            radii: (N,) sphere radii
+
+        Returns:
+            (N,) boolean array, True where the sphere is certainly hidden
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), (len(positions),))[:, None]
+        return self.occluded_boxes(positions - radii, positions + radii)
+
+    def _occluded_chunk(self, min_corners: "np.ndarray", max_corners: "np.ndarray") -> "np.ndarray":
+        """Occlusion test for one batch of boxes."""
+        occluded = np.zeros(len(min_corners), dtype=bool)
+        x, y, z = self._to_view(_box_corners(min_corners, max_corners))
+
+        # Boxes crossing the near plane are never reported hidden
+        nearest = z.min(axis=1)
+        candidates = np.flatnonzero(nearest > self.near)
+        if not len(candidates):
+            return occluded
+        sx, sy = self._to_screen(x[candidates], y[candidates], z[candidates])
+
+        height, width = self.depth_buffer.shape
+        left, right = sx.min(axis=1), sx.max(axis=1)
+        top, bottom = sy.min(axis=1), sy.max(axis=1)
+        on_screen = (right > 0) & (left < width) & (bottom > 0) & (top < height)
+        candidates = candidates[on_screen]
+        if not len(candidates):
+            return occluded
+
+        x0 = np.clip(np.floor(left[on_screen]), 0, width - 1).astype(np.intp)
+        x1 = np.clip(np.ceil(right[on_screen]) - 1, 0, width - 1).astype(np.intp)
+        y0 = np.clip(np.floor(top[on_screen]), 0, height - 1).astype(np.intp)
+        y1 = np.clip(np.ceil(bottom[on_screen]) - 1, 0, height - 1).astype(np.intp)
+        x1 = np.maximum(x1, x0)
+        y1 = np.maximum(y1, y0)
+
+        # Level where the rectangle spans at most 2x2 texels
+        span = np.maximum(x1 - x0, y1 - y0) + 1
+        levels = np.minimum(
+            np.ceil(np.log2(span)).astype(np.intp), len(self.pyramid) - 1
         )
 
-        # Calculate screen-space bounds (simplified)
-        # In reality, would project and rasterize properly
-        screen_x = int(self.resolution * 0.5)  # Center
-        screen_y = int(self.resolution * 0.5)
-
-        # Update depth at center
-        normalized_depth = distance / 1000.0  # Assume 1000m far plane
-        if 0 <= screen_x < self.resolution and 0 <= screen_y < self.resolution:
-            self.depth_buffer[screen_y][screen_x] = min(
-                self.depth_buffer[screen_y][screen_x],
-                normalized_depth
+        farthest = np.empty(len(candidates), dtype=np.float32)
+        for level in np.unique(levels):
+            texels = self.pyramid[level]
+            rows, cols = texels.shape
+            select = levels == level
+            tx0, tx1 = x0[select] >> level, np.minimum(x1[select] >> level, cols - 1)
+            ty0, ty1 = y0[select] >> level, np.minimum(y1[select] >> level, rows - 1)
+            farthest[select] = np.maximum(
+                np.maximum(texels[ty0, tx0], texels[ty0, tx1]),
+                np.maximum(texels[ty1, tx0], texels[ty1, tx1]),
             )
 
+        occluded[candidates] = nearest[candidates] > farthest
+        return occluded
+
     def is_occluded(
         self,
         instance: InstanceBounds,
-        camera_position: Tuple[float, float, float],
+        camera_position: Optional[Tuple[float, float, float]] = None,
     ) -> bool:
         """
         Check if instance is occluded.
 
         Args:
-            instance: Instance to test
-            camera_position: Camera position
+            instance: Instance to test (its AABB, or its bounding
+                sphere's box when the AABB does not contain its position)
+            camera_position: Unused; the buffer's camera is used
 
         Returns:
             True if occluded
         """
-        if not self.depth_buffer:
+        if self.depth_buffer is None:
             return False
+        low, high = _instance_box(instance, inscribed=False)
+        return bool(self.occluded_boxes([low], [high])[0])
+
+
+def _unit(vector: "np.ndarray") -> "np.ndarray":
+    length = np.linalg.norm(vector)
+    return vector / length if length > 0 else vector
+
+
+def _box_corners(min_corners: "np.ndarray", max_corners: "np.ndarray") -> "np.ndarray":
+    """(N, 8, 3) corners; bit k of the corner index selects max on axis k."""
+    min_corners = np.asarray(min_corners, dtype=np.float64).reshape(-1, 1, 3)
+    max_corners = np.asarray(max_corners, dtype=np.float64).reshape(-1, 1, 3)
+    use_max = ((np.arange(8)[:, None] >> np.arange(3)) & 1).astype(bool)
+    return np.where(use_max, max_corners, min_corners)
 
-        # Simplified occlusion test
-        distance = math.sqrt(
-            (instance.position[0] - camera_position[0]) ** 2 +
-            (instance.position[1] - camera_position[1]) ** 2 +
-            (instance.position[2] - camera_position[2]) ** 2
-        )
 
-        normalized_depth = distance / 1000.0
-        screen_x = int(self.resolution * 0.5)
-        screen_y = int(self.resolution * 0.5)
+def _instance_box(
+    instance: InstanceBounds,
+    inscribed: bool,
+) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
+    """AABB of an instance, falling back to its bounding sphere."""
+    contains = all(
+        lo <= p <= hi
+        for lo, p, hi in zip(instance.min_corner, instance.position, instance.max_corner)
+    )
+    if contains:
+        return instance.min_corner, instance.max_corner
+
+    # Occluders must stay inside the object: inscribed cube of the sphere
+    half = instance.radius / math.sqrt(3) if inscribed else instance.radius
+    return (
+        tuple(p - half for p in instance.position),
+        tuple(p + half for p in instance.position),
+    )
 
-        if 0 <= screen_x < self.resolution and 0 <= screen_y < self.resolution:
-            # If our depth is greater than buffer, we're occluded
-            return normalized_depth > self.depth_buffer[screen_y][screen_x]
 
-        return False
+def _screen_planes(
+    sx: "np.ndarray",
+    sy: "np.ndarray",
+    inverse: "np.ndarray",
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Screen-space planes through three points of 1/depth.
+
+    1/depth is affine in screen space over a planar polygon.
+
+    Returns:
+        (..., 3) plane coefficients (a, b, c) and a mask of planes whose
+        points are not collinear on screen
+    """
+    dx1, dy1, dw1 = sx[..., 1] - sx[..., 0], sy[..., 1] - sy[..., 0], inverse[..., 1] - inverse[..., 0]
+    dx2, dy2, dw2 = sx[..., 2] - sx[..., 0], sy[..., 2] - sy[..., 0], inverse[..., 2] - inverse[..., 0]
+    det = dx1 * dy2 - dx2 * dy1
+    well_defined = np.abs(det) > 1e-9
+    det = np.where(well_defined, det, 1.0)
+
+    plane_a = (dw1 * dy2 - dw2 * dy1) / det
+    plane_b = (dx1 * dw2 - dx2 * dw1) / det
+    plane_c = inverse[..., 0] - plane_a * sx[..., 0] - plane_b * sy[..., 0]
+    return np.stack([plane_a, plane_b, plane_c], axis=-1), well_defined
+
+
+def _max_pyramid(depth: "np.ndarray", fill: float) -> List["np.ndarray"]:
+    """Max-depth mip chain down to 1x1 (odd edges padded with fill)."""
+    levels = [depth]
+    while max(levels[-1].shape) > 1:
+        level = levels[-1]
+        rows, cols = level.shape
+        padded = np.full((rows + rows % 2, cols + cols % 2), fill, dtype=level.dtype)
+        padded[:rows, :cols] = level
+        levels.append(padded.reshape(padded.shape[0] // 2, 2, padded.shape[1] // 2, 2).max(axis=(1, 3)))
+    return levels
 
 
 # =============================================================================
@@ -645,15 +1711,28 @@ def cull_instances(
 __all__ = [
     # Enums
     "CullingType",
+    # Constants
+    "VISIBLE",
+    "CULLED_DISTANCE",
+    "CULLED_FRUSTUM",
+    "CULLED_SMALL_OBJECT",
+    "CULLED_OCCLUSION",
+    "CULL_REASONS",
     # Data classes
     "Frustum",
     "CullingConfig",
     "CullingResult",
     "InstanceBounds",
+    "InstanceArrays",
+    "CameraFrame",
+    "BatchCullingResult",
     # Classes
+    "InstanceBVH",
     "CullingManager",
     "OcclusionCuller",
     # Functions
     "create_frustum_from_camera",
     "cull_instances",
+    "encode_bitset",
+    "decode_bitset",
 ]
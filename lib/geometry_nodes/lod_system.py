@@ -11,8 +11,15 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List, Tuple, Callable
 from enum import Enum
+import base64
 import math
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 class LODStrategy(Enum):
     """LOD selection strategy."""
@@ -121,33 +128,80 @@ class LODConfig:
             transition_speed=data.get("transition_speed", 0.1),
         )
 
-    def get_level_for_distance(self, distance: float, previous_level: int = 0) -> int:
+    def get_level_for_distance(self, distance: float, previous_level: Optional[int] = None) -> int:
         """
         Get appropriate LOD level for distance.
 
-        Uses hysteresis to prevent rapid switching.
+        Uses hysteresis to prevent rapid switching: the previous level is
+        kept while the distance stays within that level's range widened
+        by `hysteresis` on both sides. Same rule as get_levels_for_distances.
 
         Args:
             distance: Distance to camera
-            previous_level: Previous LOD level (for hysteresis)
+            previous_level: Previous LOD level (None selects by distance only)
 
         Returns:
             LOD level index
         """
-        for i, level in enumerate(self.levels):
-            # Apply hysteresis
-            if previous_level > i:
-                # Going to higher detail - require closer distance
-                min_dist = level.distance_min + self.hysteresis
-            else:
-                min_dist = level.distance_min
-
-            if min_dist <= distance < level.distance_max:
+        if previous_level is not None:
+            for level in self.levels:
+                if (
+                    level.level == previous_level
+                    and level.distance_min - self.hysteresis <= distance < level.distance_max + self.hysteresis
+                ):
+                    return level.level
+
+        for level in self.levels:
+            if level.distance_min <= distance < level.distance_max:
                 return level.level
 
         # Return lowest detail if nothing matches
         return self.levels[-1].level if self.levels else 0
 
+    def get_levels_for_distances(
+        self,
+        distances: "np.ndarray",
+        previous_levels: Optional["np.ndarray"] = None,
+    ) -> "np.ndarray":
+        """
+        Get LOD levels for many distances at once.
+
+        Applies the same hysteresis rule as get_level_for_distance: an
+        instance keeps its previous level while its distance stays within
+        that level's range widened by `hysteresis` on both sides.
+
+        Args:
+            distances: (N,) distances to camera
+            previous_levels: Optional (N,) previous LOD levels; levels
+                not in this config (e.g. -1) select by distance only
+
+        Returns:
+            (N,) int16 LOD levels
+        """
+        distances = np.asarray(distances, dtype=np.float64)
+        if not self.levels:
+            return np.zeros(distances.shape, dtype=np.int16)
+
+        result = np.full(distances.shape, self.levels[-1].level, dtype=np.int16)
+        unmatched = np.ones(distances.shape, dtype=bool)
+        for level in self.levels:
+            match = unmatched & (distances >= level.distance_min) & (distances < level.distance_max)
+            result[match] = level.level
+            unmatched &= ~match
+
+        if previous_levels is not None:
+            previous = np.asarray(previous_levels)
+            keep = np.zeros(distances.shape, dtype=bool)
+            for level in self.levels:
+                keep |= (
+                    (previous == level.level)
+                    & (distances >= level.distance_min - self.hysteresis)
+                    & (distances < level.distance_max + self.hysteresis)
+                )
+            result = np.where(keep, previous, result).astype(np.int16)
+
+        return result
+
 
 @dataclass
 class LODState:
@@ -178,6 +232,137 @@ class LODState:
         }
 
 
+class LODStateArrays:
+    """
+    Columnar LOD state for large instance counts.
+
+    Instance IDs map to integer rows; per-row state is held in NumPy
+    arrays that grow by doubling instead of one LODState per instance.
+    Rows not yet updated have level -1.
+
+    Attributes:
+        ids: Instance identifier per row
+        rows: Row per instance identifier
+        config_ids: LOD configuration identifiers referenced by rows
+    """
+
+    _COLUMNS = (
+        ("current_level", "int16", -1),
+        ("target_level", "int16", -1),
+        ("transition_progress", "float32", 1.0),
+        ("last_distance", "float32", 0.0),
+        ("config_index", "int16", 0),
+    )
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize state arrays.
+
+        Args:
+            capacity: Initial row capacity
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for columnar LOD state")
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.config_ids: List[str] = []
+        self._columns = {
+            name: np.full(max(1, capacity), fill, dtype=dtype)
+            for name, dtype, fill in self._COLUMNS
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, instance_id: object) -> bool:
+        return instance_id in self.rows
+
+    @property
+    def current_level(self) -> "np.ndarray":
+        """(N,) displayed LOD level per row."""
+        return self._columns["current_level"][:len(self.ids)]
+
+    @property
+    def target_level(self) -> "np.ndarray":
+        """(N,) LOD level being transitioned to per row."""
+        return self._columns["target_level"][:len(self.ids)]
+
+    @property
+    def transition_progress(self) -> "np.ndarray":
+        """(N,) transition progress (0-1) per row."""
+        return self._columns["transition_progress"][:len(self.ids)]
+
+    @property
+    def last_distance(self) -> "np.ndarray":
+        """(N,) distance to the nearest camera at the last update."""
+        return self._columns["last_distance"][:len(self.ids)]
+
+    @property
+    def config_index(self) -> "np.ndarray":
+        """(N,) index into config_ids per row."""
+        return self._columns["config_index"][:len(self.ids)]
+
+    def add(self, instance_ids: List[str], config_id: str = "default") -> "np.ndarray":
+        """
+        Assign rows to instances, appending unknown IDs.
+
+        Args:
+            instance_ids: Instance identifiers
+            config_id: LOD configuration for these instances
+
+        Returns:
+            (N,) row per instance identifier
+        """
+        rows = np.empty(len(instance_ids), dtype=np.intp)
+        for i, instance_id in enumerate(instance_ids):
+            row = self.rows.get(instance_id)
+            if row is None:
+                row = len(self.ids)
+                self.rows[instance_id] = row
+                self.ids.append(instance_id)
+            rows[i] = row
+        self._reserve(len(self.ids))
+
+        if config_id not in self.config_ids:
+            self.config_ids.append(config_id)
+        self.config_index[rows] = self.config_ids.index(config_id)
+        return rows
+
+    def get_state(self, instance_id: str) -> Optional[LODState]:
+        """Get LOD state for instance as an LODState."""
+        row = self.rows.get(instance_id)
+        if row is None:
+            return None
+        return LODState(
+            instance_id=instance_id,
+            current_level=int(self.current_level[row]),
+            target_level=int(self.target_level[row]),
+            transition_progress=float(self.transition_progress[row]),
+            last_distance=float(self.last_distance[row]),
+        )
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self.ids = []
+        self.rows = {}
+        self.config_ids = []
+        for name, _, fill in self._COLUMNS:
+            self._columns[name].fill(fill)
+
+    def _reserve(self, count: int) -> None:
+        """Grow columns to hold at least count rows."""
+        capacity = len(self._columns["current_level"])
+        if count <= capacity:
+            return
+        while capacity < count:
+            capacity *= 2
+        for name, dtype, fill in self._COLUMNS:
+            column = np.full(capacity, fill, dtype=dtype)
+            old = self._columns[name]
+            column[:len(old)] = old
+            self._columns[name] = column
+
+
 # =============================================================================
 # PRESET LOD CONFIGURATIONS
 # =============================================================================
@@ -257,6 +442,11 @@ class LODManager:
         manager.set_camera_position((0, 0, 0))
         manager.update_instances(instances)
         gn_data = manager.to_gn_input()
+
+    For large instance counts, use the columnar API instead:
+        manager.register_instances(ids, config_id="foliage")
+        manager.set_camera_positions([camera_a, camera_b])
+        levels = manager.update_arrays(positions, frame=1)
     """
 
     def __init__(self, config: Optional[LODConfig] = None):
@@ -270,6 +460,9 @@ class LODManager:
         self.configs: Dict[str, LODConfig] = dict(DEFAULT_LOD_CONFIGS)
         self.states: Dict[str, LODState] = {}
         self.camera_position: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        self.camera_positions: List[Tuple[float, float, float]] = [self.camera_position]
+        self.arrays: Optional[LODStateArrays] = LODStateArrays() if HAS_NUMPY else None
+        self.frame_levels: Dict[int, "np.ndarray"] = {}
         self._update_count = 0
 
     def set_config(self, config_id: str, config: LODConfig) -> None:
@@ -283,6 +476,21 @@ class LODManager:
     def set_camera_position(self, position: Tuple[float, float, float]) -> None:
         """Set camera position for distance calculations."""
         self.camera_position = position
+        self.camera_positions = [position]
+
+    def set_camera_positions(self, positions: List[Tuple[float, float, float]]) -> None:
+        """
+        Set several cameras for update_arrays.
+
+        Each instance uses the distance to its nearest camera.
+
+        Args:
+            positions: Camera world positions
+        """
+        if not positions:
+            raise ValueError("At least one camera position is required")
+        self.camera_positions = [tuple(p) for p in positions]
+        self.camera_position = self.camera_positions[0]
 
     def calculate_distance(self, instance_position: Tuple[float, float, float]) -> float:
         """Calculate distance from camera to instance."""
@@ -311,14 +519,15 @@ class LODManager:
         config = self.get_config(config_id)
         distance = self.calculate_distance(position)
 
-        # Get or create state
+        # Get or create state; new instances select by distance only
         state = self.states.get(instance_id)
+        previous_level = state.current_level if state else None
         if not state:
             state = LODState(instance_id=instance_id)
             self.states[instance_id] = state
 
         # Calculate new LOD level
-        new_level = config.get_level_for_distance(distance, state.current_level)
+        new_level = config.get_level_for_distance(distance, previous_level)
 
         # Update state
         state.last_distance = distance
@@ -357,6 +566,7 @@ class LODManager:
         """
         config_map = config_map or {}
         results = {}
+        # One LODState per instance; see update_arrays for large counts
 
         for instance in instances:
             instance_id = instance.get("instance_id", "")
@@ -373,9 +583,128 @@ class LODManager:
         self._update_count += 1
         return results
 
+    def register_instances(
+        self,
+        instance_ids: List[str],
+        config_id: str = "default",
+    ) -> "np.ndarray":
+        """
+        Add instances to the columnar state store.
+
+        Args:
+            instance_ids: Instance identifiers
+            config_id: LOD configuration to use for them
+
+        Returns:
+            (N,) state rows, the order update_arrays expects positions in
+        """
+        if self.arrays is None:
+            raise ImportError("NumPy is required for columnar LOD state")
+        return self.arrays.add(instance_ids, config_id)
+
+    def update_arrays(
+        self,
+        positions: "np.ndarray",
+        rows: Optional["np.ndarray"] = None,
+        frame: Optional[int] = None,
+    ) -> "np.ndarray":
+        """
+        Update LOD for registered instances in one vectorized pass.
+
+        Targets come from LODConfig.get_levels_for_distances using the
+        nearest camera. A changed target restarts the transition, which
+        advances by the config's transition_speed per update and switches
+        the current level at the halfway point.
+
+        Args:
+            positions: (N, 3) instance world positions
+            rows: Optional (N,) state rows of the positions (default: all
+                registered instances in row order)
+            frame: Frame number to keep a level buffer for (to_gn_input)
+
+        Returns:
+            (N,) current LOD levels
+        """
+        arrays = self.arrays
+        if arrays is None:
+            raise ImportError("NumPy is required for columnar LOD state")
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        if rows is None:
+            rows = slice(None)
+            count = len(arrays)
+        else:
+            rows = np.asarray(rows, dtype=np.intp)
+            count = len(rows)
+        if count != len(positions):
+            raise ValueError(f"Expected {count} positions, got {len(positions)}")
+
+        distances = self._nearest_camera_distances(positions)
+        previous = arrays.target_level[rows]
+        current = arrays.current_level[rows]
+        config_index = arrays.config_index[rows]
+
+        targets = np.empty(len(positions), dtype=np.int16)
+        speed = np.empty(len(positions), dtype=np.float32)
+        for index, config_id in enumerate(arrays.config_ids):
+            select = config_index == index
+            if not select.any():
+                continue
+            config = self.get_config(config_id)
+            targets[select] = config.get_levels_for_distances(distances[select], previous[select])
+            speed[select] = config.transition_speed
+
+        # New instances start at their target; returning to the current
+        # level needs no transition
+        fresh = previous < 0
+        retarget = (targets != previous) & ~fresh
+        progress = np.where(
+            retarget,
+            (targets == current).astype(np.float32),
+            np.minimum(1.0, arrays.transition_progress[rows] + speed),
+        )
+        progress[fresh] = 1.0
+        current = np.where(progress >= 0.5, targets, current).astype(np.int16)
+
+        arrays.current_level[rows] = current
+        arrays.target_level[rows] = targets
+        arrays.transition_progress[rows] = progress
+        arrays.last_distance[rows] = distances
+
+        if frame is not None:
+            self.frame_levels[frame] = arrays.current_level.copy()
+        self._update_count += 1
+        return current
+
+    def get_level_buffer(self) -> "np.ndarray":
+        """
+        Current LOD level per registered instance, in row order.
+
+        The int32 buffer can be written straight into an integer point
+        attribute (e.g. attribute.data.foreach_set("value", buffer)).
+        Instances never updated have level -1.
+
+        Returns:
+            (N,) int32 LOD levels
+        """
+        if self.arrays is None:
+            raise ImportError("NumPy is required for columnar LOD state")
+        return self.arrays.current_level.astype(np.int32)
+
+    def _nearest_camera_distances(self, positions: "np.ndarray") -> "np.ndarray":
+        """Distance from each position to its nearest camera."""
+        nearest = None
+        for camera in self.camera_positions:
+            offset = positions - np.asarray(camera, dtype=np.float64)
+            squared = np.einsum("ij,ij->i", offset, offset)
+            nearest = squared if nearest is None else np.minimum(nearest, squared)
+        return np.sqrt(nearest)
+
     def get_instance_state(self, instance_id: str) -> Optional[LODState]:
         """Get LOD state for instance."""
-        return self.states.get(instance_id)
+        state = self.states.get(instance_id)
+        if state is None and self.arrays is not None:
+            state = self.arrays.get_state(instance_id)
+        return state
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get LOD statistics."""
@@ -384,8 +713,14 @@ class LODManager:
             level = state.current_level
             level_counts[level] = level_counts.get(level, 0) + 1
 
+        array_count = len(self.arrays) if self.arrays is not None else 0
+        if array_count:
+            levels, counts = np.unique(self.arrays.current_level, return_counts=True)
+            for level, count in zip(levels.tolist(), counts.tolist()):
+                level_counts[level] = level_counts.get(level, 0) + count
+
         return {
-            "total_instances": len(self.states),
+            "total_instances": len(self.states) + array_count,
             "level_distribution": level_counts,
             "update_count": self._update_count,
             "camera_position": list(self.camera_position),
@@ -398,16 +733,30 @@ class LODManager:
         Returns:
             GN-compatible dictionary
         """
-        return {
+        gn_input = {
             "version": "1.0",
             "states": {k: v.to_dict() for k, v in self.states.items()},
             "statistics": self.get_statistics(),
             "configs": {k: v.to_dict() for k, v in self.configs.items()},
         }
+        if self.frame_levels:
+            # uint8 level per instance row (255 = never updated), base64 per frame
+            gn_input["lod_levels"] = {
+                "instance_ids": list(self.arrays.ids),
+                "encoding": "uint8_base64",
+                "frames": {
+                    str(frame): base64.b64encode(levels.astype(np.uint8).tobytes()).decode("ascii")
+                    for frame, levels in self.frame_levels.items()
+                },
+            }
+        return gn_input
 
     def reset(self) -> None:
         """Reset all LOD states."""
         self.states.clear()
+        if self.arrays is not None:
+            self.arrays.clear()
+        self.frame_levels = {}
         self._update_count = 0
 
 
@@ -508,6 +857,7 @@ __all__ = [
     "LODLevel",
     "LODConfig",
     "LODState",
+    "LODStateArrays",
     # Constants
     "DEFAULT_LOD_CONFIGS",
     # Classes
@@ -24,6 +24,12 @@ import json
 from pathlib import Path
 from typing import Any, Tuple, Optional, Union, List
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 # ============================================================
 # NUMBER COMPARISON
@@ -479,17 +485,20 @@ def images_similar(
             f"Image size mismatch: {img1.size} vs {img2.size}"
         )
 
-    pixels1 = list(img1.getdata())
-    pixels2 = list(img2.getdata())
+    if HAS_NUMPY:
+        diff_ratio = _different_pixel_ratio(img1, img2, color_threshold)
+    else:
+        pixels1 = list(img1.getdata())
+        pixels2 = list(img2.getdata())
 
-    total = len(pixels1)
-    different = 0
+        total = len(pixels1)
+        different = 0
 
-    for p1, p2 in zip(pixels1, pixels2):
-        if not _pixels_similar(p1, p2, color_threshold):
-            different += 1
+        for p1, p2 in zip(pixels1, pixels2):
+            if not _pixels_similar(p1, p2, color_threshold):
+                different += 1
 
-    diff_ratio = different / total
+        diff_ratio = different / total
 
     if diff_ratio > pixel_tolerance:
         raise AssertionError(
@@ -500,6 +509,28 @@ def images_similar(
     return True, diff_ratio
 
 
+def _different_pixel_ratio(img1, img2, threshold: int) -> float:
+    """Fraction of pixels with any channel differing by more than threshold."""
+    # Same values as getdata() (1-bit images read 0/255)
+    arrays = []
+    for img in (img1, img2):
+        data = np.asarray(img.convert("L") if img.mode == "1" else img)
+        arrays.append(data.reshape(data.shape[0], data.shape[1], -1))
+    a, b = arrays
+
+    # Pixels with different band counts never match
+    if a.shape != b.shape:
+        return 1.0
+
+    if a.dtype.kind in "ui" and b.dtype.kind in "ui":
+        diff = np.abs(a.astype(np.int64) - b.astype(np.int64))
+    else:
+        diff = np.abs(a.astype(np.float64) - b.astype(np.float64))
+
+    different = np.count_nonzero((diff > threshold).any(axis=2))
+    return different / (a.shape[0] * a.shape[1])
+
+
 def _pixels_similar(p1: tuple, p2: tuple, threshold: int) -> bool:
     """Check if two pixels are similar within threshold."""
     if len(p1) != len(p2):
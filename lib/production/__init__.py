@@ -117,12 +117,33 @@ from .parallel_executor import (
     ExecutionGraph,
     ParallelExecutor,
     BatchProcessor,
+    ShotDependencyGraph,
+    ShotDurationHistory,
+    WorkStealingQueue,
+    DAGScheduler,
+    ScheduleReport,
     analyze_dependencies,
+    build_shot_dependency_graph,
     create_execution_graph,
     get_parallel_estimate,
     optimize_worker_count,
 )
 
+from .checkpoint_journal import (
+    CheckpointJournal,
+    journal_path_for,
+    replay_journal,
+)
+
+from .shot_worker import (
+    ShotResult,
+    ShotWorkerPool,
+    default_shot_renderer,
+    check_renderer_spec,
+    resolve_renderer,
+    run_shot_task,
+)
+
 # Master config (Phase 14.2)
 from .config_schema import (
     # Types
@@ -234,6 +255,9 @@ __all__ = [
     "ExecutionEngine",
     "execute_production",
     "resume_production",
+    "CheckpointJournal",
+    "journal_path_for",
+    "replay_journal",
 
     # Parallel
     "DependencyGroup",
@@ -244,6 +268,18 @@ __all__ = [
     "create_execution_graph",
     "get_parallel_estimate",
     "optimize_worker_count",
+    "ShotDependencyGraph",
+    "ShotDurationHistory",
+    "WorkStealingQueue",
+    "DAGScheduler",
+    "ScheduleReport",
+    "build_shot_dependency_graph",
+    "ShotResult",
+    "ShotWorkerPool",
+    "default_shot_renderer",
+    "check_renderer_spec",
+    "resolve_renderer",
+    "run_shot_task",
 
     # Master config (Phase 14.2)
     "OutputCodec",
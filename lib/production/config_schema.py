@@ -324,6 +324,7 @@ class ShotDef:
         frame_range: Frame range tuple (start, end)
         notes: Director notes
         variations: Number of variations to generate
+        depends_on: Names of shots that must finish before this one
     """
     scene: int = 0
     template: str = ""
@@ -335,6 +336,7 @@ class ShotDef:
     frame_range: Tuple[int, int] = (0, 0)  # (0, 0) = auto
     notes: str = ""
     variations: int = 0
+    depends_on: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -349,6 +351,7 @@ class ShotDef:
             "frame_range": list(self.frame_range),
             "notes": self.notes,
             "variations": self.variations,
+            "depends_on": list(self.depends_on),
         }
 
     @classmethod
@@ -365,6 +368,7 @@ class ShotDef:
             frame_range=tuple(data.get("frame_range", (0, 0))),
             notes=data.get("notes", ""),
             variations=data.get("variations", 0),
+            depends_on=list(data.get("depends_on", [])),
         )
 
     def to_shot_config(self, index: int = 0) -> ShotConfig:
@@ -382,6 +386,7 @@ class ShotDef:
             frame_range=frame_range,
             notes=self.notes,
             variations=self.variations,
+            depends_on=list(self.depends_on),
         )
 
 
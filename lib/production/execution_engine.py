@@ -14,6 +14,7 @@ Part of Phase 14.1: Production Orchestrator
 from __future__ import annotations
 import os
 import json
+import threading
 import time
 import traceback
 from datetime import datetime
@@ -29,6 +30,7 @@ from .production_types import (
     EXECUTION_PHASES,
 )
 from .production_validator import validate_for_execution
+from .checkpoint_journal import CheckpointJournal, journal_path_for, replay_journal
 from .production_loader import save_yaml
 
 
@@ -43,6 +45,7 @@ class ExecutionEngine:
         config: Production configuration
         state: Current execution state
         checkpoint_interval: Shots between checkpoints
+        journal: Append-only shot journal (None = full checkpoints only)
         on_progress: Optional progress callback
         on_phase_start: Optional phase start callback
         on_shot_complete: Optional shot complete callback
@@ -64,6 +67,11 @@ class ExecutionEngine:
         self.checkpoint_interval = 10  # shots
         self.start_time: float = 0.0
 
+        self.journal: Optional[CheckpointJournal] = None
+
+        # Guards state updates arriving from parallel workers
+        self._state_lock = threading.RLock()
+
         # Callbacks
         self.on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
         self.on_phase_start: Optional[Callable[[str], None]] = None
@@ -180,8 +188,9 @@ class ExecutionEngine:
             return False
 
         shot = self.config.shots[shot_index]
-        self.state.current_shot = shot_index
-        self.state.touch()
+        with self._state_lock:
+            self.state.current_shot = shot_index
+            self.state.touch()
 
         try:
             # Use custom renderer if set
@@ -190,57 +199,111 @@ class ExecutionEngine:
             else:
                 success = self._render_shot(shot)
 
+        except Exception as e:
+            self.record_shot_result(shot_index, False, f"Shot {shot_index} error: {e}")
+
+            if self.on_error:
+                self.on_error(f"shot_{shot_index}", e)
+
+            return False
+
+        self.record_shot_result(shot_index, success)
+        return success
+
+    def record_shot_result(self, shot_index: int, success: bool, error: str = "") -> None:
+        """
+        Apply a shot outcome to the execution state.
+
+        Used both for in-process rendering and for results reported back
+        by worker processes, which cannot touch this engine's state.
+
+        Args:
+            shot_index: Index of shot in config
+            success: Whether the shot rendered successfully
+            error: Error message for failed shots
+        """
+        with self._state_lock:
             if success:
                 self.state.complete_shot(shot_index)
             else:
                 self.state.fail_shot(shot_index)
+                if error:
+                    self.state.error_message = error
 
             if self.on_shot_complete:
                 self.on_shot_complete(shot_index, success)
 
-            # Checkpoint periodically
-            if (shot_index + 1) % self.checkpoint_interval == 0:
+            if self.journal is not None:
+                # One appended record per shot, compacted periodically
+                self.journal.append(shot_index, success, error)
+                if self.journal.needs_compaction:
+                    self.save_checkpoint()
+            elif (shot_index + 1) % self.checkpoint_interval == 0:
+                # Checkpoint periodically
                 self.save_checkpoint()
 
-            return success
+    def enable_journal(
+        self,
+        fsync_every: int = 32,
+        fsync_seconds: float = 1.0,
+        compact_every: int = 1000,
+    ) -> CheckpointJournal:
+        """
+        Switch to incremental checkpointing.
 
-        except Exception as e:
-            self.state.fail_shot(shot_index)
-            self.state.error_message = f"Shot {shot_index} error: {e}"
+        Every shot outcome is appended to a journal next to the checkpoint
+        file; the full state is only rewritten when the journal is
+        compacted, on phase/status changes and at the end of execution.
 
-            if self.on_error:
-                self.on_error(f"shot_{shot_index}", e)
+        Args:
+            fsync_every: Records written between fsyncs
+            fsync_seconds: Maximum seconds between fsyncs
+            compact_every: Records between snapshot compactions
 
-            return False
+        Returns:
+            The engine's journal
+        """
+        self.journal = CheckpointJournal(
+            journal_path_for(self._checkpoint_path()),
+            fsync_every=fsync_every,
+            fsync_seconds=fsync_seconds,
+            compact_every=compact_every,
+        )
+        return self.journal
 
     def save_checkpoint(self) -> None:
         """Save execution state to checkpoint file."""
-        if not self.state.checkpoint_path:
-            # Create default checkpoint path
-            checkpoint_dir = os.path.join(
-                self.config.base_path or ".",
-                ".gsd-state",
-                "production"
-            )
-            os.makedirs(checkpoint_dir, exist_ok=True)
-            self.state.checkpoint_path = os.path.join(
-                checkpoint_dir,
-                f"{self.state.production_id}_checkpoint.json"
-            )
-
-        checkpoint_data = {
-            "state": self.state.to_dict(),
-            "config_path": getattr(self.config, "_source_path", ""),
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        with open(self.state.checkpoint_path, "w") as f:
-            json.dump(checkpoint_data, f, indent=2)
+        checkpoint_path = self._checkpoint_path()
+
+        with self._state_lock:
+            checkpoint_data = {
+                "state": self.state.to_dict(),
+                "config_path": getattr(self.config, "_source_path", ""),
+                "timestamp": datetime.now().isoformat(),
+            }
+
+            if self.journal is None:
+                with open(checkpoint_path, "w") as f:
+                    json.dump(checkpoint_data, f, indent=2)
+                return
+
+            # Compact: atomically replace the snapshot, then drop the journal.
+            # A crash in between only replays records already in the snapshot.
+            tmp_path = f"{checkpoint_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(checkpoint_data, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, checkpoint_path)
+            self.journal.reset()
 
     def load_checkpoint(self, path: str) -> None:
         """
         Load execution state from checkpoint.
 
+        If a journal exists next to the checkpoint, its records are
+        replayed on top of the snapshot and journaling stays enabled.
+
         Args:
             path: Path to checkpoint file
         """
@@ -250,6 +313,28 @@ class ExecutionEngine:
         self.state = ExecutionState.from_dict(checkpoint_data["state"])
         self.state.checkpoint_path = path
 
+        journal_path = journal_path_for(path)
+        if os.path.exists(journal_path):
+            journal = self.journal or self.enable_journal()
+            journal.path = journal_path
+            journal.pending_records = replay_journal(self.state, journal.read())
+
+    def _checkpoint_path(self) -> str:
+        """Get the checkpoint path, creating the default location if unset."""
+        if not self.state.checkpoint_path:
+            # Create default checkpoint path
+            checkpoint_dir = os.path.join(
+                self.config.base_path or ".",
+                ".gsd-state",
+                "production"
+            )
+            os.makedirs(checkpoint_dir, exist_ok=True)
+            self.state.checkpoint_path = os.path.join(
+                checkpoint_dir,
+                f"{self.state.production_id}_checkpoint.json"
+            )
+        return self.state.checkpoint_path
+
     def estimate_remaining_time(self) -> float:
         """
         Estimate time remaining in seconds.
@@ -337,6 +422,11 @@ class ExecutionEngine:
         """
         self._shot_renderer = renderer
 
+    @property
+    def shot_renderer(self) -> Optional[Callable[[ShotConfig], bool]]:
+        """Custom shot renderer, or None for the built-in renderer."""
+        return self._shot_renderer
+
     def _update_progress(self) -> None:
         """Update progress percentage."""
         total_phases = len(EXECUTION_PHASES)
@@ -511,6 +601,10 @@ def resume_production(checkpoint_path: str, config: ProductionConfig) -> Product
     """
     Resume production from checkpoint.
 
+    Journaled checkpoints are replayed (snapshot + journal) before
+    resuming. A journaled run that was interrupted while still running
+    can be resumed as well.
+
     Args:
         checkpoint_path: Path to checkpoint file
         config: Production configuration
@@ -521,7 +615,11 @@ def resume_production(checkpoint_path: str, config: ProductionConfig) -> Product
     engine = ExecutionEngine(config)
     engine.load_checkpoint(checkpoint_path)
 
-    if engine.state.status not in (ExecutionStatus.PAUSED.value, ExecutionStatus.FAILED.value):
+    resumable = [ExecutionStatus.PAUSED.value, ExecutionStatus.FAILED.value]
+    if engine.journal is not None:
+        resumable.append(ExecutionStatus.RUNNING.value)
+
+    if engine.state.status not in resumable:
         raise ValueError(f"Cannot resume from status: {engine.state.status}")
 
     engine.resume()
@@ -7,21 +7,30 @@ Requirements:
 - REQ-ORCH-05: Parallel execution where possible
 - Dependency analysis and execution graph
 
+Shots are scheduled on a per-shot dependency DAG: a shot is submitted
+as soon as its own predecessors finish, ready shots are ordered by
+critical-path rank from historical durations, and idle workers steal
+work from busy ones.
+
 Part of Phase 14.1: Production Orchestrator
 """
 
 from __future__ import annotations
+import heapq
+import json
 import os
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, as_completed
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Any, Optional, Callable
+from typing import Dict, List, Set, Any, Optional, Callable, Tuple
 
 from .production_types import (
     ShotConfig,
     ParallelConfig,
 )
 from .execution_engine import ExecutionEngine
+from .shot_worker import RendererSpec, ShotWorkerPool, check_renderer_spec
 
 
 @dataclass
@@ -58,29 +67,509 @@ class ExecutionGraph:
         return sum(1 for g in self.groups if len(g.shot_indices) > 1)
 
 
+@dataclass
+class ShotDependencyGraph:
+    """
+    Per-shot dependency DAG.
+
+    Attributes:
+        shot_count: Number of shots (nodes)
+        predecessors: Shot index -> indices that must finish first
+        successors: Shot index -> indices waiting on it
+        edge_kinds: (before, after) -> edge reason (character, location, explicit)
+    """
+    shot_count: int = 0
+    predecessors: Dict[int, Set[int]] = field(default_factory=dict)
+    successors: Dict[int, Set[int]] = field(default_factory=dict)
+    edge_kinds: Dict[Tuple[int, int], str] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for i in range(self.shot_count):
+            self.predecessors.setdefault(i, set())
+            self.successors.setdefault(i, set())
+
+    @property
+    def edge_count(self) -> int:
+        """Number of dependency edges."""
+        return len(self.edge_kinds)
+
+    def add_edge(self, before: int, after: int, kind: str) -> None:
+        """
+        Add a dependency edge.
+
+        Args:
+            before: Shot that must finish first
+            after: Shot that waits
+            kind: Edge reason
+        """
+        if before == after:
+            raise ValueError(f"Shot {after} cannot depend on itself")
+        self.predecessors[after].add(before)
+        self.successors[before].add(after)
+        self.edge_kinds.setdefault((before, after), kind)
+
+    def roots(self) -> List[int]:
+        """Shots without predecessors."""
+        return [i for i in range(self.shot_count) if not self.predecessors[i]]
+
+    def topological_order(self) -> List[int]:
+        """
+        Get shots in dependency order.
+
+        Returns:
+            Shot indices, predecessors first
+
+        Raises:
+            ValueError: If the graph contains a cycle
+        """
+        remaining = {i: len(self.predecessors[i]) for i in range(self.shot_count)}
+        ready = sorted(i for i, count in remaining.items() if count == 0)
+        order: List[int] = []
+
+        while ready:
+            node = ready.pop()
+            order.append(node)
+            for succ in self.successors[node]:
+                remaining[succ] -= 1
+                if remaining[succ] == 0:
+                    ready.append(succ)
+
+        if len(order) != self.shot_count:
+            cycle = sorted(i for i, count in remaining.items() if count > 0)
+            raise ValueError(f"Dependency cycle between shots: {cycle}")
+
+        return order
+
+    def upward_ranks(self, durations: List[float]) -> List[float]:
+        """
+        Compute critical-path rank of every shot.
+
+        The rank is the shot's duration plus the longest chain of
+        durations through its successors, i.e. the earliest time the
+        production can finish once the shot starts.
+
+        Args:
+            durations: Estimated duration per shot
+
+        Returns:
+            Rank per shot index
+        """
+        ranks = [0.0] * self.shot_count
+        for node in reversed(self.topological_order()):
+            tail = max((ranks[s] for s in self.successors[node]), default=0.0)
+            ranks[node] = durations[node] + tail
+        return ranks
+
+    def critical_path(self, durations: List[float]) -> Tuple[float, List[int]]:
+        """
+        Find the longest duration chain through the graph.
+
+        Args:
+            durations: Estimated duration per shot
+
+        Returns:
+            Tuple of (path length, shot indices along the path)
+        """
+        if not self.shot_count:
+            return 0.0, []
+
+        ranks = self.upward_ranks(durations)
+        node = max(self.roots(), key=lambda i: ranks[i])
+        path = [node]
+        while self.successors[node]:
+            node = max(self.successors[node], key=lambda i: ranks[i])
+            path.append(node)
+        return ranks[path[0]], path
+
+
+@dataclass
+class ScheduleReport:
+    """
+    Outcome of a DAG-scheduled parallel run.
+
+    Attributes:
+        total_shots: Shots scheduled
+        workers: Worker count
+        makespan_seconds: Wall time from first start to last finish
+        busy_seconds: Sum of individual shot durations
+        achieved_parallelism: busy_seconds / makespan_seconds
+        max_concurrency: Highest number of shots running at once
+        steals: Shots taken from another worker's queue
+        critical_path_seconds: Estimated critical path length before the run
+        critical_path: Shot indices on the estimated critical path
+        predicted: get_parallel_estimate() result for the same shots
+        shot_timings: Shot index -> (start, end, worker) relative to run start
+    """
+    total_shots: int = 0
+    workers: int = 0
+    makespan_seconds: float = 0.0
+    busy_seconds: float = 0.0
+    achieved_parallelism: float = 0.0
+    max_concurrency: int = 0
+    steals: int = 0
+    critical_path_seconds: float = 0.0
+    critical_path: List[int] = field(default_factory=list)
+    predicted: Dict[str, Any] = field(default_factory=dict)
+    shot_timings: Dict[int, Tuple[float, float, int]] = field(default_factory=dict)
+
+    @property
+    def predicted_speedup(self) -> float:
+        """Speedup predicted by the group-based estimate."""
+        return self.predicted.get("speedup_factor", 1.0)
+
+    @property
+    def parallelism_ratio(self) -> float:
+        """Achieved parallelism relative to the predicted speedup."""
+        predicted = self.predicted_speedup
+        return self.achieved_parallelism / predicted if predicted > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "total_shots": self.total_shots,
+            "workers": self.workers,
+            "makespan_seconds": self.makespan_seconds,
+            "busy_seconds": self.busy_seconds,
+            "achieved_parallelism": self.achieved_parallelism,
+            "max_concurrency": self.max_concurrency,
+            "steals": self.steals,
+            "critical_path_seconds": self.critical_path_seconds,
+            "critical_path": self.critical_path,
+            "predicted": self.predicted,
+            "predicted_speedup": self.predicted_speedup,
+            "parallelism_ratio": self.parallelism_ratio,
+            "shot_timings": {str(k): list(v) for k, v in self.shot_timings.items()},
+        }
+
+
+class ShotDurationHistory:
+    """
+    Historical shot render durations used for scheduling priority.
+
+    Durations are smoothed per shot name. Shots without history are
+    estimated from the average seconds per frame of known shots, or
+    from frame count alone (120 frames = 1 unit) when nothing is known.
+
+    Attributes:
+        path: JSON file backing the history (None = memory only)
+        smoothing: Weight of the newest measurement (0-1)
+    """
+
+    DEFAULT_FRAMES_PER_UNIT = 120
+
+    def __init__(self, path: Optional[str] = None, smoothing: float = 0.5):
+        """
+        Initialize history.
+
+        Args:
+            path: Optional JSON file to load from and save to
+            smoothing: Weight of the newest measurement (0-1)
+        """
+        self.path = path
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, float]] = {}
+        if path and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self) -> None:
+        """Load history from disk."""
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self._lock:
+            self._entries = dict(data.get("shots", {}))
+
+    def save(self) -> None:
+        """Save history to disk (no-op without a path)."""
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._lock:
+            data = {"shots": self._entries}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def record(self, shot: ShotConfig, seconds: float) -> None:
+        """
+        Record a measured shot duration.
+
+        Args:
+            shot: Shot configuration
+            seconds: Measured render time
+        """
+        with self._lock:
+            entry = self._entries.get(shot.name)
+            if entry is None:
+                self._entries[shot.name] = {
+                    "seconds": seconds,
+                    "frames": shot.duration,
+                    "runs": 1,
+                }
+            else:
+                entry["seconds"] += self.smoothing * (seconds - entry["seconds"])
+                entry["frames"] = shot.duration
+                entry["runs"] += 1
+
+    def estimate(self, shot: ShotConfig) -> float:
+        """
+        Estimate a shot's duration.
+
+        Args:
+            shot: Shot configuration
+
+        Returns:
+            Estimated seconds (or frame-based units without history)
+        """
+        with self._lock:
+            entry = self._entries.get(shot.name)
+            if entry is not None:
+                return entry["seconds"]
+
+            frames = sum(e["frames"] for e in self._entries.values())
+            if frames > 0:
+                seconds = sum(e["seconds"] for e in self._entries.values())
+                return seconds / frames * max(shot.duration, 1)
+
+        return max(shot.duration, 1) / self.DEFAULT_FRAMES_PER_UNIT
+
+
+class WorkStealingQueue:
+    """
+    Per-worker priority queues with work stealing.
+
+    Each worker pops the highest-priority item from its own queue; when
+    that is empty it steals the best item from another worker. Items
+    unlocked by a worker are pushed to that worker's queue, so dependent
+    shots tend to stay on the worker that has their scene state warm.
+    """
+
+    def __init__(self, workers: int):
+        """
+        Initialize queue.
+
+        Args:
+            workers: Number of workers
+        """
+        self.workers = max(1, workers)
+        self._heaps: List[List[Tuple[float, int, Any]]] = [[] for _ in range(self.workers)]
+        self._condition = threading.Condition()
+        self._sequence = 0
+        self._closed = False
+        self.steals = 0
+
+    def push(self, item: Any, priority: float, worker: Optional[int] = None) -> None:
+        """
+        Add an item.
+
+        Args:
+            item: Item to queue
+            priority: Higher runs first
+            worker: Owning worker (default: shortest queue)
+        """
+        with self._condition:
+            if worker is None:
+                worker = min(range(self.workers), key=lambda w: len(self._heaps[w]))
+            self._sequence += 1
+            heapq.heappush(self._heaps[worker], (-priority, self._sequence, item))
+            self._condition.notify_all()
+
+    def pop(self, worker: int) -> Optional[Any]:
+        """
+        Take the next item for a worker, blocking until one is available.
+
+        Args:
+            worker: Worker index
+
+        Returns:
+            Item, or None once the queue is closed
+        """
+        with self._condition:
+            while True:
+                own = self._heaps[worker]
+                if own:
+                    return heapq.heappop(own)[2]
+
+                victim = None
+                for other, heap in enumerate(self._heaps):
+                    if heap and (victim is None or heap[0] < self._heaps[victim][0]):
+                        victim = other
+                if victim is not None:
+                    self.steals += 1
+                    return heapq.heappop(self._heaps[victim])[2]
+
+                if self._closed:
+                    return None
+                self._condition.wait()
+
+    def close(self) -> None:
+        """Wake all workers and stop handing out items."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+
+class DAGScheduler:
+    """
+    Run shots over a dependency DAG with critical-path priority.
+
+    A shot becomes ready as soon as all of its own predecessors have
+    finished (successfully or not); ready shots are ordered by upward
+    rank and distributed through a work-stealing queue.
+
+    Attributes:
+        graph: Shot dependency graph
+        priorities: Rank per shot (higher runs first)
+        max_workers: Worker thread count
+    """
+
+    def __init__(
+        self,
+        graph: ShotDependencyGraph,
+        priorities: List[float],
+        max_workers: int,
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            graph: Shot dependency graph
+            priorities: Rank per shot (higher runs first)
+            max_workers: Worker thread count
+        """
+        self.graph = graph
+        self.priorities = priorities
+        self.max_workers = max(1, max_workers)
+
+    def run(
+        self,
+        run_shot: Callable[[int], bool],
+    ) -> Tuple[Dict[int, bool], ScheduleReport]:
+        """
+        Execute every shot once its predecessors are done.
+
+        Args:
+            run_shot: Function executing one shot index, returning success
+
+        Returns:
+            Tuple of (shot index -> success, ScheduleReport)
+        """
+        graph = self.graph
+        total = graph.shot_count
+        report = ScheduleReport(total_shots=total, workers=self.max_workers)
+        results: Dict[int, bool] = {}
+        if total == 0:
+            return results, report
+
+        queue = WorkStealingQueue(self.max_workers)
+        waiting = {i: len(graph.predecessors[i]) for i in range(total)}
+        lock = threading.Lock()
+        state = {"done": 0, "running": 0}
+        origin = time.perf_counter()
+
+        for node in graph.roots():
+            queue.push(node, self.priorities[node])
+
+        def worker(worker_id: int) -> None:
+            while True:
+                node = queue.pop(worker_id)
+                if node is None:
+                    return
+
+                with lock:
+                    state["running"] += 1
+                    report.max_concurrency = max(report.max_concurrency, state["running"])
+                start = time.perf_counter() - origin
+                try:
+                    success = bool(run_shot(node))
+                except Exception:
+                    success = False
+                end = time.perf_counter() - origin
+
+                with lock:
+                    state["running"] -= 1
+                    results[node] = success
+                    report.shot_timings[node] = (start, end, worker_id)
+                    for succ in graph.successors[node]:
+                        waiting[succ] -= 1
+                        if waiting[succ] == 0:
+                            queue.push(succ, self.priorities[succ], worker_id)
+                    state["done"] += 1
+                    if state["done"] == total:
+                        queue.close()
+
+        threads = [
+            threading.Thread(target=worker, args=(w,), name=f"shot-worker-{w}", daemon=True)
+            for w in range(min(self.max_workers, total))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        timings = report.shot_timings.values()
+        report.makespan_seconds = max(end for _, end, _ in timings) - min(start for start, _, _ in timings)
+        report.busy_seconds = sum(end - start for start, end, _ in timings)
+        report.achieved_parallelism = (
+            report.busy_seconds / report.makespan_seconds if report.makespan_seconds > 0 else 1.0
+        )
+        report.steals = queue.steals
+        return results, report
+
+
 class ParallelExecutor:
     """
     Execute shots in parallel.
 
-    Analyzes shot dependencies and executes independent shots
-    concurrently for improved performance.
+    Builds a per-shot dependency graph and submits each shot as soon as
+    its own predecessors finish, critical path first.
+
+    With the process backend, shots are rendered by a reusable
+    ShotWorkerPool and only serialized ShotConfigs cross the process
+    boundary; results are applied to the engine state in this process.
 
     Attributes:
         config: Parallel execution configuration
         engine: Execution engine reference
         errors: Errors encountered during execution
+        history: Shot duration history used for prioritization
+        last_report: Schedule report of the most recent shot run
+        worker_pool: Shot worker processes (process backend only)
     """
 
-    def __init__(self, config: ParallelConfig):
+    def __init__(
+        self,
+        config: ParallelConfig,
+        history: Optional[ShotDurationHistory] = None,
+        renderer: RendererSpec = None,
+        worker_pool: Optional[ShotWorkerPool] = None,
+    ):
         """
         Initialize parallel executor.
 
         Args:
             config: Parallel execution configuration
+            history: Optional shot duration history (default: per production)
+            renderer: Picklable callable or "module:function" used by
+                worker processes (process backend only; default: the
+                engine's shot renderer)
+            worker_pool: Optional pre-started worker pool to reuse
         """
         self.config = config
         self.engine: Optional[ExecutionEngine] = None
         self.errors: List[str] = []
+        self.history = history
+        self.last_report: Optional[ScheduleReport] = None
+        self.worker_pool = worker_pool
+        self._renderer = renderer
+        self._owns_pool = worker_pool is None
         self._results: Dict[int, bool] = {}
 
     def execute_shots_parallel(
@@ -97,45 +586,47 @@ class ParallelExecutor:
 
         Returns:
             Dictionary mapping shot index to success status
+
+        Raises:
+            ValueError: If the process backend cannot send the renderer
+                to worker processes
         """
         self.engine = engine
         self._results = {}
         self.errors = []
 
-        # Analyze dependencies
-        graph = create_execution_graph(shots)
+        history = self.history or self._default_history(engine)
+        graph = build_shot_dependency_graph(shots)
+        durations = [history.estimate(shot) for shot in shots]
+        ranks = graph.upward_ranks(durations)
+        critical_seconds, critical_path = graph.critical_path(durations)
 
-        # Choose executor based on config
+        worker_pool = None
         if self.config.backend == "process":
-            executor_class = ProcessPoolExecutor
-        else:
-            executor_class = ThreadPoolExecutor
+            worker_pool = self._get_worker_pool(self._process_renderer(engine))
 
-        with executor_class(max_workers=self.config.max_workers) as executor:
-            # Execute groups in order
-            for group in graph.groups:
-                # Wait for dependencies
-                self._wait_for_dependencies(group, executor)
-
-                # Submit group shots
-                futures: Dict[Future, int] = {}
-                for shot_idx in group.shot_indices:
-                    future = executor.submit(
-                        self._execute_shot_safe,
-                        shot_idx,
-                        shots[shot_idx]
-                    )
-                    futures[future] = shot_idx
-
-                # Wait for group completion
-                for future in as_completed(futures):
-                    shot_idx = futures[future]
-                    try:
-                        success = future.result()
-                        self._results[shot_idx] = success
-                    except Exception as e:
-                        self._results[shot_idx] = False
-                        self.errors.append(f"Shot {shot_idx} failed: {e}")
+        def run_shot(shot_idx: int) -> bool:
+            if worker_pool is not None:
+                return self._execute_shot_process(worker_pool, shot_idx, shots[shot_idx], history)
+
+            start = time.perf_counter()
+            success = self._execute_shot_safe(shot_idx, shots[shot_idx])
+            if success:
+                history.record(shots[shot_idx], time.perf_counter() - start)
+            return success
+
+        scheduler = DAGScheduler(graph, ranks, self.config.max_workers)
+        self._results, report = scheduler.run(run_shot)
+
+        report.critical_path_seconds = critical_seconds
+        report.critical_path = critical_path
+        report.predicted = get_parallel_estimate(shots, self.config.max_workers)
+        self.last_report = report
+
+        try:
+            history.save()
+        except OSError as e:
+            self.errors.append(f"Could not save shot history: {e}")
 
         return self._results
 
@@ -199,15 +690,89 @@ class ParallelExecutor:
             self.errors.append(f"Shot {shot_index} error: {e}")
             return False
 
-    def _wait_for_dependencies(
+    def _execute_shot_process(
         self,
-        group: DependencyGroup,
-        executor: Any
-    ) -> None:
-        """Wait for dependent groups to complete."""
-        # In current implementation, groups are executed sequentially
-        # Dependencies are implicit in group ordering
-        pass
+        worker_pool: ShotWorkerPool,
+        shot_index: int,
+        shot: ShotConfig,
+        history: ShotDurationHistory,
+    ) -> bool:
+        """
+        Render a shot in a worker process and apply the result here.
+
+        Args:
+            worker_pool: Shot worker pool
+            shot_index: Shot index
+            shot: Shot configuration
+            history: Duration history to update
+
+        Returns:
+            True if successful
+        """
+        try:
+            result = worker_pool.submit(shot_index, shot).result()
+        except Exception as e:
+            # Worker crashed or the shot could not be serialized
+            error = f"Shot {shot_index} failed: {e}"
+            self.errors.append(error)
+            if self.engine:
+                self.engine.record_shot_result(shot_index, False, error)
+            return False
+
+        if result.success:
+            history.record(shot, result.seconds)
+        else:
+            self.errors.append(result.error)
+
+        if self.engine:
+            self.engine.record_shot_result(shot_index, result.success, result.error)
+        return result.success
+
+    def _process_renderer(self, engine: ExecutionEngine) -> RendererSpec:
+        """
+        Get the renderer worker processes should run.
+
+        Falls back to the engine's shot renderer so set_shot_renderer()
+        applies to both backends.
+
+        Raises:
+            ValueError: If the renderer cannot be sent to worker processes
+        """
+        renderer = self._renderer if self._renderer is not None else engine.shot_renderer
+        return check_renderer_spec(renderer)
+
+    def _get_worker_pool(self, renderer: RendererSpec) -> ShotWorkerPool:
+        """Get the shot worker pool, (re)creating it when the renderer changes."""
+        if self.worker_pool is not None and self._owns_pool and self.worker_pool.renderer != renderer:
+            self.worker_pool.close()
+            self.worker_pool = None
+
+        if self.worker_pool is None:
+            self.worker_pool = ShotWorkerPool(
+                max_workers=self.config.max_workers,
+                renderer=renderer,
+            )
+            self._owns_pool = True
+        return self.worker_pool
+
+    def close(self) -> None:
+        """Shut down worker processes kept alive between runs."""
+        if self.worker_pool is not None:
+            self.worker_pool.close()
+
+    def _default_history(self, engine: ExecutionEngine) -> ShotDurationHistory:
+        """Create duration history stored next to the production checkpoint."""
+        base_path = getattr(engine.config, "base_path", "")
+        path = None
+        if base_path:
+            path = os.path.join(
+                base_path,
+                ".gsd-state",
+                "production",
+                f"{engine.state.production_id}_shot_times.json",
+            )
+        self.history = ShotDurationHistory(path)
+        return self.history
 
 
 def analyze_dependencies(shots: List[ShotConfig]) -> List[Set[int]]:
@@ -274,6 +839,63 @@ def analyze_dependencies(shots: List[ShotConfig]) -> List[Set[int]]:
     return groups
 
 
+def build_shot_dependency_graph(
+    shots: List[ShotConfig],
+    location_edges: bool = False,
+) -> ShotDependencyGraph:
+    """
+    Build per-shot dependency edges.
+
+    Edges are added for:
+    - Character usage (a shot waits for the previous shot with the same character)
+    - Location usage (optional, previous shot in the same location)
+    - Explicit ``depends_on`` entries (shot names or indices)
+
+    Unlike analyze_dependencies, scene changes do not serialize shots.
+
+    Args:
+        shots: List of shot configurations
+        location_edges: Also chain shots sharing a location
+
+    Returns:
+        ShotDependencyGraph over shot indices
+
+    Raises:
+        ValueError: On unknown or cyclic dependencies
+    """
+    graph = ShotDependencyGraph(shot_count=len(shots))
+    names = {shot.name: i for i, shot in enumerate(shots) if shot.name}
+
+    character_last: Dict[str, int] = {}
+    location_last: Dict[str, int] = {}
+
+    for i, shot in enumerate(shots):
+        if shot.character:
+            if shot.character in character_last:
+                graph.add_edge(character_last[shot.character], i, "character")
+            character_last[shot.character] = i
+
+        if shot.location:
+            if location_edges and shot.location in location_last:
+                graph.add_edge(location_last[shot.location], i, "location")
+            location_last[shot.location] = i
+
+        for dep in getattr(shot, "depends_on", None) or []:
+            if isinstance(dep, int):
+                if not 0 <= dep < len(shots):
+                    raise ValueError(f"Shot {shot.name or i} depends on unknown index {dep}")
+                before = dep
+            elif dep in names:
+                before = names[dep]
+            else:
+                raise ValueError(f"Shot {shot.name or i} depends on unknown shot '{dep}'")
+            graph.add_edge(before, i, "explicit")
+
+    # Validate acyclic
+    graph.topological_order()
+    return graph
+
+
 def create_execution_graph(shots: List[ShotConfig]) -> ExecutionGraph:
     """
     Create dependency graph for execution.
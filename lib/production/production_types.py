@@ -231,6 +231,7 @@ class ShotConfig:
         frame_range: Start and end frame (start, end)
         notes: Additional notes
         variations: Number of variations to generate
+        depends_on: Names of shots that must finish before this one
     """
     name: str = ""
     template: str = ""
@@ -241,6 +242,7 @@ class ShotConfig:
     frame_range: Tuple[int, int] = (1, 120)
     notes: str = ""
     variations: int = 0
+    depends_on: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -254,6 +256,7 @@ class ShotConfig:
             "frame_range": list(self.frame_range),
             "notes": self.notes,
             "variations": self.variations,
+            "depends_on": list(self.depends_on),
         }
 
     @classmethod
@@ -269,6 +272,7 @@ class ShotConfig:
             frame_range=tuple(data.get("frame_range", (1, 120))),
             notes=data.get("notes", ""),
             variations=data.get("variations", 0),
+            depends_on=list(data.get("depends_on", [])),
         )
 
 
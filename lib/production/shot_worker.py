@@ -0,0 +1,319 @@
+"""
+Shot Worker
+
+Process-pool entrypoint for rendering shots in worker processes.
+
+Workers are shared-nothing: each task receives only the shot index and
+a serialized ShotConfig, and sends back a ShotResult. The parent applies
+results to its ExecutionEngine state (and checkpoints) as they arrive,
+since writes made inside a worker process would be lost.
+
+Worker processes are reused across shots. The renderer is resolved and
+warmed up once per process by the pool initializer, so imports and
+template loading are paid once per worker instead of once per shot.
+
+Part of Phase 14.1: Production Orchestrator
+"""
+
+from __future__ import annotations
+import importlib
+import os
+import pickle
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .production_types import ShotConfig
+
+
+# Renderer: callable taking a ShotConfig, or "package.module:function"
+RendererSpec = Union[str, Callable[[ShotConfig], bool], None]
+
+
+@dataclass
+class ShotResult:
+    """
+    Outcome of a shot rendered in a worker process.
+
+    Attributes:
+        shot_index: Index of shot in the production
+        success: Whether the shot rendered successfully
+        seconds: Render time measured in the worker
+        error: Error message for failed shots
+        worker_pid: Process ID of the worker
+        worker_shots: Shots rendered by this worker so far (including this one)
+    """
+    shot_index: int = 0
+    success: bool = False
+    seconds: float = 0.0
+    error: str = ""
+    worker_pid: int = 0
+    worker_shots: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "shot_index": self.shot_index,
+            "success": self.success,
+            "seconds": self.seconds,
+            "error": self.error,
+            "worker_pid": self.worker_pid,
+            "worker_shots": self.worker_shots,
+        }
+
+
+# Per-process worker state, populated by init_shot_worker
+_WORKER_STATE: Dict[str, Any] = {
+    "renderer": None,
+    "shots": 0,
+}
+
+
+def default_shot_renderer(shot: ShotConfig) -> bool:
+    """
+    Default worker renderer.
+
+    Placeholder matching ExecutionEngine._render_shot until the
+    cinematic system is wired in.
+
+    Args:
+        shot: Shot configuration
+
+    Returns:
+        True if successful
+    """
+    return True
+
+
+def resolve_renderer(spec: RendererSpec) -> Callable[[ShotConfig], bool]:
+    """
+    Resolve a renderer specification.
+
+    Args:
+        spec: Callable, "module:function" path, or None for the default
+
+    Returns:
+        Renderer callable
+
+    Raises:
+        ValueError: If a string spec is malformed
+    """
+    if spec is None:
+        return default_shot_renderer
+    if callable(spec):
+        return spec
+
+    module_name, sep, attr = spec.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError(f"Renderer must be 'module:function', got '{spec}'")
+
+    module = importlib.import_module(module_name)
+    return getattr(module, attr)
+
+
+def check_renderer_spec(spec: RendererSpec) -> RendererSpec:
+    """
+    Check a renderer can be sent to worker processes.
+
+    Args:
+        spec: Callable, "module:function" path, or None for the default
+
+    Returns:
+        The unchanged spec
+
+    Raises:
+        ValueError: If the spec is malformed or cannot be pickled
+    """
+    if spec is None:
+        return spec
+    if isinstance(spec, str):
+        module_name, sep, attr = spec.partition(":")
+        if not sep or not module_name or not attr:
+            raise ValueError(f"Renderer must be 'module:function', got '{spec}'")
+        return spec
+
+    try:
+        pickle.dumps(spec)
+    except Exception as e:
+        raise ValueError(
+            f"Renderer {spec!r} cannot be sent to worker processes ({e}); "
+            "use a module-level function or a 'module:function' path"
+        ) from e
+    return spec
+
+
+def init_shot_worker(renderer: RendererSpec = None, warmup: Optional[Callable[[], None]] = None) -> None:
+    """
+    Initialize a worker process.
+
+    Runs once per worker process: resolves (and imports) the renderer and
+    runs the optional warmup hook, e.g. to preload shot templates.
+
+    Args:
+        renderer: Renderer specification
+        warmup: Optional picklable function called once per worker
+    """
+    _WORKER_STATE["renderer"] = resolve_renderer(renderer)
+    _WORKER_STATE["shots"] = 0
+    if warmup is not None:
+        warmup()
+
+
+def run_shot_task(shot_index: int, shot_data: Dict[str, Any]) -> ShotResult:
+    """
+    Worker entrypoint: render one serialized shot.
+
+    Never raises; failures are reported through the result.
+
+    Args:
+        shot_index: Index of shot in the production
+        shot_data: ShotConfig.to_dict() output
+
+    Returns:
+        ShotResult for the parent process
+    """
+    renderer = _WORKER_STATE["renderer"]
+    if renderer is None:
+        renderer = resolve_renderer(None)
+        _WORKER_STATE["renderer"] = renderer
+
+    _WORKER_STATE["shots"] += 1
+    result = ShotResult(
+        shot_index=shot_index,
+        worker_pid=os.getpid(),
+        worker_shots=_WORKER_STATE["shots"],
+    )
+
+    start = time.perf_counter()
+    try:
+        result.success = bool(renderer(ShotConfig.from_dict(shot_data)))
+        if not result.success:
+            result.error = f"Shot {shot_index} render returned failure"
+    except Exception as e:
+        result.success = False
+        result.error = f"Shot {shot_index} error: {e}\n{traceback.format_exc()}"
+    result.seconds = time.perf_counter() - start
+
+    return result
+
+
+class ShotWorkerPool:
+    """
+    Reusable pool of shot worker processes.
+
+    The underlying process pool is created lazily and kept alive across
+    submissions and productions until close() is called. It is safe to
+    submit from several threads. If a worker process dies, the broken
+    pool is replaced on the next submission.
+
+    Attributes:
+        max_workers: Number of worker processes
+        renderer: Renderer specification passed to each worker
+        warmup: Optional per-worker warmup hook
+        restarts: Number of times a broken pool was replaced
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        renderer: RendererSpec = None,
+        warmup: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize worker pool.
+
+        Args:
+            max_workers: Number of worker processes
+            renderer: Callable or "module:function" renderer
+            warmup: Optional picklable function called once per worker
+        """
+        self.max_workers = max(1, max_workers)
+        self.renderer = renderer
+        self.warmup = warmup
+        self.submitted = 0
+        self.restarts = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def started(self) -> bool:
+        """Whether worker processes have been started."""
+        return self._executor is not None
+
+    def submit(self, shot_index: int, shot: ShotConfig) -> Future:
+        """
+        Submit a shot to the pool.
+
+        Args:
+            shot_index: Index of shot in the production
+            shot: Shot configuration (sent serialized)
+
+        Returns:
+            Future resolving to a ShotResult
+        """
+        shot_data = shot.to_dict()
+        executor = self._get_executor()
+        try:
+            future = executor.submit(run_shot_task, shot_index, shot_data)
+        except BrokenProcessPool:
+            # A worker died during an earlier shot; start a fresh pool
+            executor = self._get_executor(broken=executor)
+            future = executor.submit(run_shot_task, shot_index, shot_data)
+
+        with self._lock:
+            self.submitted += 1
+        return future
+
+    def _get_executor(self, broken: Optional[ProcessPoolExecutor] = None) -> ProcessPoolExecutor:
+        """
+        Get the process pool, creating it on first use.
+
+        Args:
+            broken: Pool that failed; replaced unless another thread
+                already did so
+
+        Returns:
+            Process pool
+        """
+        with self._lock:
+            if self._executor is not None and self._executor is broken:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+                self.restarts += 1
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=init_shot_worker,
+                    initargs=(self.renderer, self.warmup),
+                )
+            return self._executor
+
+    def map(self, shots: List[ShotConfig]) -> List[ShotResult]:
+        """
+        Render shots and collect results in order.
+
+        Args:
+            shots: Shot configurations
+
+        Returns:
+            ShotResult per shot
+        """
+        futures = [self.submit(i, shot) for i, shot in enumerate(shots)]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Shut down worker processes."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def __enter__(self) -> ShotWorkerPool:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
@@ -258,6 +258,9 @@ class CompleteShotConfig:
     notes: str = ""
     variations: int = 0
 
+    # Scheduling
+    depends_on: List[str] = field(default_factory=list)
+
     def to_shot_def(self) -> ShotDef:
         """Convert back to ShotDef."""
         return ShotDef(
@@ -271,6 +274,7 @@ class CompleteShotConfig:
             frame_range=self.frame_range,
             notes=self.notes,
             variations=self.variations,
+            depends_on=list(self.depends_on),
         )
 
     def to_shot_config(self) -> ShotConfig:
@@ -285,6 +289,7 @@ class CompleteShotConfig:
             frame_range=self.frame_range,
             notes=self.notes,
             variations=self.variations,
+            depends_on=list(self.depends_on),
         )
 
 
@@ -368,6 +373,7 @@ def expand_shot_templates(
             style=style,
             notes=shot.notes,
             variations=shot.variations,
+            depends_on=list(shot.depends_on),
         )
 
         expanded.append(complete)
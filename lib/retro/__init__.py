@@ -9,6 +9,7 @@ Modules:
 - pixel_types: Data structures and type definitions
 - pixelator: Core pixelation engine
 - quantizer: Color quantization algorithms
+- palette_match: Cached palette lookup cubes and mini-batch k-means
 - preset_loader: YAML profile loading
 - pixel_compositor: Blender compositor integration
 - dither_types: Dithering data structures
@@ -27,6 +28,7 @@ Modules:
 - phosphor: Phosphor mask effects
 - curvature: Screen curvature and vignette
 - crt_effects: Additional CRT effects (bloom, aberration, noise)
+- crt_pipeline: Streaming multi-frame CRT processor with cached masks
 - crt_compositor: Blender compositor integration for CRT
 - crt_preset_loader: CRT preset loading from YAML
 
@@ -79,512 +81,523 @@ Example Usage:
         chromatic_aberration=0.003
     )
     result = apply_all_effects(image, config)
-"""
-
-from lib.retro.pixel_types import (
-    # Enums
-    PixelMode,
-    AspectRatioMode,
-    ScalingFilter,
-    DitherMode,
-    SubPixelLayout,
-    # Dataclasses
-    PixelStyle,
-    PixelationConfig,
-    PixelationResult,
-    ColorPalette,
-    # Built-in palettes
-    GAMEBOY_PALETTE,
-    NES_PALETTE,
-    PICO8_PALETTE,
-    CGA_PALETTE,
-    MACPLUS_PALETTE,
-    EGA_PALETTE,
-    BUILTIN_PALETTES,
-    # Functions
-    get_palette,
-    list_palettes as list_builtin_palettes,
-)
-
-from lib.retro.pixelator import (
-    # Main functions
-    pixelate,
-    downscale_image,
-    pixelate_block,
-    enhance_edges,
-    posterize,
-    quantize_colors as pixelator_quantize_colors,
-    quantize_to_palette,
-    extract_palette,
-    # Mode-specific
-    pixelate_32bit,
-    pixelate_16bit,
-    pixelate_8bit,
-    pixelate_4bit,
-    pixelate_2bit,
-    pixelate_1bit,
-)
-
-from lib.retro.quantizer import (
-    quantize_colors,
-    quantize_to_palette as quantizer_quantize_to_palette,
-    extract_palette as quantizer_extract_palette,
-    median_cut_quantize,
-    kmeans_quantize,
-    octree_quantize,
-    nearest_color_match,
-    build_weighted_palette,
-    count_colors,
-    get_color_histogram,
-    OctreeNode,
-)
-
-from lib.retro.preset_loader import (
-    load_pixel_profile,
-    list_profiles,
-    load_palette,
-    list_palettes,
-    load_resolution,
-    list_resolutions,
-    get_snes_config,
-    get_nes_config,
-    get_gameboy_config,
-    get_pico8_config,
-)
-
-# Blender compositor integration (optional)
-try:
-    from lib.retro.pixel_compositor import (
-        create_pixelator_nodes,
-        setup_pixelator_pass,
-        bake_pixelation,
-        create_scale_node,
-        create_posterize_node,
-        create_color_ramp_quantize,
-        setup_pixel_preview,
-        apply_pixel_style_to_scene,
-        get_pixel_node_group,
-    )
-    HAS_COMPOSITOR = True
-except ImportError:
-    HAS_COMPOSITOR = False
 
+Public names are imported from their submodules on first access
+(PEP 562), so e.g. `import lib.retro.pixel_types` does not load the
+dithering, CRT or sprite sheet modules.
+"""
 
-# =============================================================================
-# Dithering Module Imports
-# =============================================================================
-
-from lib.retro.dither_types import (
-    # Enums
-    DitherMode as DitherModeEnum,
-    DitherColorSpace,
-    # Dataclasses
-    DitherConfig,
-    DitherMatrix,
-    # Built-in matrices
-    BAYER_2X2,
-    BAYER_4X4,
-    BAYER_8X8,
-    CHECKERBOARD,
-    BUILTIN_MATRICES,
-    # Functions
-    get_matrix,
-    list_matrices,
-)
-
-from lib.retro.dither_ordered import (
-    # Main functions
-    ordered_dither,
-    bayer_dither,
-    checkerboard_dither,
-    halftone_dither,
-    diagonal_dither,
-    blue_noise_dither,
-    # Matrix functions
-    generate_bayer_matrix,
-    normalize_matrix,
-    get_bayer_threshold,
-    # Constants
-    BAYER_2X2_INT,
-    BAYER_4X4_INT,
-    BAYER_8X8_INT,
-)
-
-from lib.retro.dither_error import (
-    # Main functions
-    error_diffusion_dither,
-    floyd_steinberg_dither,
-    atkinson_dither,
-    sierra_dither,
-    jarvis_judice_ninke_dither,
-    stucki_dither,
-    burkes_dither,
-    # Utility functions
-    find_nearest_color,
-    quantize_to_level,
-    rgb_distance,
-    lab_distance,
-    get_kernel,
-    get_kernel_names,
-    # Constants
-    FLOYD_STEINBERG,
-    ATKINSON,
-    SIERRA_LITE,
-    SIERRA_3,
-    JARVIS_JUDICE_NINKE,
-    STUCKI,
-    BURKES,
-    ERROR_DIFFUSION_KERNELS,
-)
-
-from lib.retro.dither_patterns import (
-    # Main functions
-    pattern_dither,
-    custom_pattern_dither,
-    custom_matrix_dither,
-    stipple_dither,
-    newsprint_dither,
-    woodcut_dither,
-    # Pattern generation
-    generate_diagonal_pattern,
-    generate_dot_pattern,
-    generate_circle_pattern,
-    generate_crosshatch_pattern,
-    tile_pattern,
-    # Utility
-    list_patterns,
-    get_pattern,
-    # Constants
-    DIAGONAL_LINES,
-    HORIZONTAL_LINES,
-    VERTICAL_LINES,
-    CROSSHATCH,
-    DIAMOND,
-    DOTS_2X2,
-    DOTS_3X3,
-    CIRCLES_4X4,
-    HERRINGBONE,
-    BRICK,
-    WEAVE,
-    PATTERNS,
-)
-
-from lib.retro.dither import (
-    # Main function
-    dither,
-    # Convenience functions
-    dither_1bit,
-    dither_gameboy,
-    dither_macplus,
-    dither_newspaper,
-    # Utility functions
-    get_available_modes,
-    list_all_modes,
-    is_valid_mode,
-    get_mode_description,
-)
-
-
-# =============================================================================
-# Isometric & Side-Scroller Module Imports
-# =============================================================================
-
-from lib.retro.isometric_types import (
-    # Enums
-    IsometricAngle,
-    ViewDirection,
-    SpriteFormat,
-    TileFormat,
-    # Dataclasses
-    IsometricConfig,
-    SideScrollerConfig,
-    SpriteSheetConfig,
-    TileConfig,
-    IsometricRenderResult,
-    SpriteSheetResult,
-    TileSetResult,
-    # Angle presets
-    ISOMETRIC_ANGLES,
-    get_isometric_angle,
-    list_isometric_angles,
-    # Tile sizes
-    TILE_SIZES,
-    get_tile_size,
-    list_tile_sizes,
-)
-
-from lib.retro.isometric import (
-    # Camera config
-    CameraConfig,
-    # Main functions
-    create_isometric_camera_config,
-    set_isometric_angle,
-    calculate_isometric_rotation,
-    calculate_camera_position,
-    # Projection functions
-    project_to_isometric,
-    project_to_screen,
-    # Depth sorting
-    depth_sort_objects,
-    get_isometric_depth,
-    # Grid functions
-    create_isometric_grid_data,
-    snap_to_isometric_grid,
-    # Rendering
-    render_isometric_tile,
-    render_isometric_tile_set,
-    # Utility
-    get_tile_bounds,
-    world_to_tile,
-    tile_to_world,
-    calculate_tile_neighbors,
-)
-
-from lib.retro.side_scroller import (
-    # Dataclasses
-    ParallaxLayer,
-    SideScrollerCameraConfig,
-    # Camera functions
-    create_side_scroller_camera_config,
-    get_camera_rotation_for_view,
-    # Parallax functions
-    separate_parallax_layers,
-    calculate_parallax_offset,
-    calculate_layer_scroll_speed,
-    get_parallax_positions,
-    # Rendering
-    render_parallax_layer,
-    render_all_parallax_layers,
-    # Animation
-    create_parallax_animation,
-    animate_parallax_layers,
-    # Depth assignment
-    assign_depth_by_z,
-    assign_depth_by_collection,
-    assign_depth_by_name_pattern,
-    # Utility
-    get_layer_visibility_at_depth,
-    calculate_optimal_layer_count,
-    generate_layer_depths,
-    merge_parallax_layers,
-)
-
-from lib.retro.sprites import (
-    # Dataclasses
-    SpriteFrame,
-    # Main functions
-    generate_sprite_sheet,
-    trim_sprite,
-    calculate_pivot,
-    calculate_pivot_world,
-    # Metadata generation
-    generate_sprite_metadata,
-    export_phaser_json,
-    export_unity_json,
-    export_godot_json,
-    export_generic_json,
-    # Animation helpers
-    extract_animation_frames,
-    generate_walk_cycle_sheet,
-    generate_animation_sheet,
-    # Utility
-    get_frame_position,
-    get_frame_bounds,
-    calculate_frame_count,
-    optimize_sheet_layout,
-)
-
-from lib.retro.tiles import (
-    # Dataclasses
-    Tile,
-    TileSet,
-    # Tile set generation
-    render_tile_set,
-    create_tile_set_from_images,
-    # Tile map generation
-    generate_tile_map,
-    generate_tile_map_from_positions,
-    # Tile map export
-    export_tile_map,
-    export_tile_map_csv,
-    export_tile_map_json,
-    export_tile_map_tmx,
-    # Autotile
-    AUTOTILE_MASKS,
-    calculate_autotile_index,
-    get_autotile_neighbors,
-    create_autotile_template,
-    apply_autotile,
-    # Collision map
-    generate_collision_map,
-    export_collision_map,
-    # Utility
-    get_tile_at_position,
-    world_to_tile as tile_world_to_tile,
-    tile_to_world as tile_tile_to_world,
-    resize_tile_map,
-    flip_tile_map_horizontal,
-    flip_tile_map_vertical,
-    rotate_tile_map_90,
-)
-
-from lib.retro.view_preset_loader import (
-    # Isometric presets
-    load_isometric_preset,
-    list_isometric_presets,
-    get_isometric_preset,
-    # Side-scroller presets
-    load_side_scroller_preset,
-    list_side_scroller_presets,
-    get_side_scroller_preset,
-    # Sprite sheet presets
-    load_sprite_sheet_preset,
-    list_sprite_sheet_presets,
-    get_sprite_sheet_preset,
-    # Tile presets
-    load_tile_preset,
-    list_tile_presets,
-    get_tile_preset,
-    # Generic
-    load_view_preset,
-    list_view_presets,
-    # Cache management
-    clear_preset_cache,
-    reload_presets,
-)
-
-
-# =============================================================================
-# CRT Display Effects Module Imports
-# =============================================================================
-
-from lib.retro.crt_types import (
-    # Enums
-    ScanlineMode,
-    PhosphorPattern,
-    DisplayType,
-    # Dataclasses
-    ScanlineConfig,
-    PhosphorConfig,
-    CurvatureConfig,
-    CRTConfig,
-    # Built-in presets
-    CRT_PRESETS,
-    # Functions
-    get_preset as get_crt_preset_builtin,
-    list_presets as list_crt_presets_builtin,
-    get_preset_description,
-    create_custom_preset,
-    validate_config as validate_crt_config,
-)
-
-from lib.retro.scanlines import (
-    # Pattern generators
-    alternate_scanlines,
-    every_line_scanlines,
-    random_scanlines,
-    # Overlay creation
-    create_scanline_overlay,
-    create_scanline_texture,
-    # Main functions
-    apply_scanlines,
-    apply_scanlines_fast,
-    apply_scanlines_gpu,
-    get_scanline_shader_code,
-    # Utility functions
-    calculate_brightness_loss,
-    recommend_brightness_compensation,
-    estimate_scanline_visibility,
-)
-
-from lib.retro.phosphor import (
-    # Pattern generators
-    create_rgb_stripe_mask,
-    create_aperture_grille_mask,
-    create_slot_mask,
-    create_shadow_mask,
-    create_phosphor_mask,
-    # Application functions
-    apply_phosphor_mask,
-    apply_phosphor_mask_fast,
-    # Utility functions
-    get_phosphor_brightness_factor,
-    list_phosphor_patterns,
-    get_pattern_description as get_phosphor_pattern_description,
-    estimate_mask_visibility,
-    # Constants
-    PHOSPHOR_PATTERNS,
-)
-
-from lib.retro.curvature import (
-    # UV transformation
-    calculate_curved_uv,
-    calculate_barrel_distortion_grid,
-    # Vignette
-    create_vignette_mask,
-    create_corner_mask,
-    apply_vignette,
-    # Main functions
-    apply_curvature,
-    bilinear_sample,
-    apply_border,
-    combine_curvature_vignette,
-    # Utility functions
-    calculate_edge_stretch,
-    estimate_content_loss,
-    recommend_border_size,
-)
-
-from lib.retro.crt_effects import (
-    # Individual effects
-    apply_bloom,
-    apply_chromatic_aberration,
-    apply_flicker,
-    apply_interlace,
-    apply_pixel_jitter,
-    apply_noise,
-    apply_ghosting,
-    apply_color_adjustments,
-    # Pipeline
-    apply_all_effects,
-    apply_effects_fast,
-)
-
-from lib.retro.crt_compositor import (
-    # Node creation
-    create_crt_node_group,
-    create_scanline_node_config,
-    create_phosphor_node_config,
-    # Setup
-    setup_crt_compositing,
-    create_curvature_node,
-    create_scanline_node,
-    # Utilities
-    get_crt_node_group_name,
-    list_crt_node_templates,
-    get_node_template_description,
-    create_preset_nodes,
-    export_node_setup_python,
-    # Constants
-    CRT_NODE_GROUP_NAME,
-    CRT_NODE_TEMPLATES,
-)
-
-from lib.retro.crt_preset_loader import (
-    # Preset loading
-    load_crt_preset,
-    list_crt_presets,
-    get_crt_preset,
-    get_crt_preset_description,
-    # Cache management
-    clear_preset_cache as clear_crt_preset_cache,
-    reload_presets as reload_crt_presets,
-    # Convenience functions
-    get_arcade_80s,
-    get_crt_tv,
-    get_pvm,
-    get_gameboy,
-)
+import importlib
+import sys
+import types
+
+# Public names by submodule, imported on first attribute access
+_LAZY_IMPORTS = {
+    "lib.retro.pixel_types": [
+        # Enums
+        "PixelMode",
+        "AspectRatioMode",
+        "ScalingFilter",
+        "DitherMode",
+        "SubPixelLayout",
+        # Dataclasses
+        "PixelStyle",
+        "PixelationConfig",
+        "PixelationResult",
+        "ColorPalette",
+        # Built-in palettes
+        "GAMEBOY_PALETTE",
+        "NES_PALETTE",
+        "PICO8_PALETTE",
+        "CGA_PALETTE",
+        "MACPLUS_PALETTE",
+        "EGA_PALETTE",
+        "BUILTIN_PALETTES",
+        # Functions
+        "get_palette",
+    ],
+    "lib.retro.pixelator": [
+        # Main functions
+        "pixelate",
+        "downscale_image",
+        "pixelate_block",
+        "enhance_edges",
+        "posterize",
+        "quantize_to_palette",
+        "extract_palette",
+        # Mode-specific
+        "pixelate_32bit",
+        "pixelate_16bit",
+        "pixelate_8bit",
+        "pixelate_4bit",
+        "pixelate_2bit",
+        "pixelate_1bit",
+    ],
+    "lib.retro.quantizer": [
+        "quantize_colors",
+        "median_cut_quantize",
+        "kmeans_quantize",
+        "octree_quantize",
+        "nearest_color_match",
+        "build_weighted_palette",
+        "count_colors",
+        "get_color_histogram",
+        "OctreeNode",
+    ],
+    "lib.retro.palette_match": [
+        "PaletteLUTCache",
+        "build_palette_lut",
+        "get_palette_lut",
+        "get_lut_cache",
+        "palette_hash",
+        "match_palette_indices",
+        "match_to_palette",
+        "minibatch_kmeans",
+    ],
+    "lib.retro.preset_loader": [
+        "load_pixel_profile",
+        "list_profiles",
+        "load_palette",
+        "list_palettes",
+        "load_resolution",
+        "list_resolutions",
+        "get_snes_config",
+        "get_nes_config",
+        "get_gameboy_config",
+        "get_pico8_config",
+    ],
+    "lib.retro.pixel_compositor": [
+        # Blender compositor integration (optional)
+        "create_pixelator_nodes",
+        "setup_pixelator_pass",
+        "bake_pixelation",
+        "create_scale_node",
+        "create_posterize_node",
+        "create_color_ramp_quantize",
+        "setup_pixel_preview",
+        "apply_pixel_style_to_scene",
+        "get_pixel_node_group",
+    ],
+    "lib.retro.dither_types": [
+        # =============================================================================
+        # Dithering Module Imports
+        # =============================================================================
+        # Enums
+        "DitherColorSpace",
+        # Dataclasses
+        "DitherConfig",
+        "DitherMatrix",
+        # Built-in matrices
+        "BAYER_2X2",
+        "BAYER_4X4",
+        "BAYER_8X8",
+        "CHECKERBOARD",
+        "BUILTIN_MATRICES",
+        # Functions
+        "get_matrix",
+        "list_matrices",
+    ],
+    "lib.retro.dither_ordered": [
+        # Main functions
+        "ordered_dither",
+        "bayer_dither",
+        "checkerboard_dither",
+        "halftone_dither",
+        "diagonal_dither",
+        "blue_noise_dither",
+        # Matrix functions
+        "generate_bayer_matrix",
+        "normalize_matrix",
+        "get_bayer_threshold",
+        # Constants
+        "BAYER_2X2_INT",
+        "BAYER_4X4_INT",
+        "BAYER_8X8_INT",
+    ],
+    "lib.retro.dither_error": [
+        # Main functions
+        "error_diffusion_dither",
+        "floyd_steinberg_dither",
+        "atkinson_dither",
+        "sierra_dither",
+        "jarvis_judice_ninke_dither",
+        "stucki_dither",
+        "burkes_dither",
+        # Utility functions
+        "find_nearest_color",
+        "quantize_to_level",
+        "rgb_distance",
+        "lab_distance",
+        "get_kernel",
+        "get_kernel_names",
+        "benchmark_error_diffusion",
+        # Constants
+        "FLOYD_STEINBERG",
+        "ATKINSON",
+        "SIERRA_LITE",
+        "SIERRA_3",
+        "JARVIS_JUDICE_NINKE",
+        "STUCKI",
+        "BURKES",
+        "ERROR_DIFFUSION_KERNELS",
+    ],
+    "lib.retro.dither_patterns": [
+        # Main functions
+        "pattern_dither",
+        "custom_pattern_dither",
+        "custom_matrix_dither",
+        "stipple_dither",
+        "newsprint_dither",
+        "woodcut_dither",
+        # Pattern generation
+        "generate_diagonal_pattern",
+        "generate_dot_pattern",
+        "generate_circle_pattern",
+        "generate_crosshatch_pattern",
+        "tile_pattern",
+        # Utility
+        "list_patterns",
+        "get_pattern",
+        # Constants
+        "DIAGONAL_LINES",
+        "HORIZONTAL_LINES",
+        "VERTICAL_LINES",
+        "CROSSHATCH",
+        "DIAMOND",
+        "DOTS_2X2",
+        "DOTS_3X3",
+        "CIRCLES_4X4",
+        "HERRINGBONE",
+        "BRICK",
+        "WEAVE",
+        "PATTERNS",
+    ],
+    "lib.retro.dither": [
+        # Main function
+        "dither",
+        # Convenience functions
+        "dither_1bit",
+        "dither_gameboy",
+        "dither_macplus",
+        "dither_newspaper",
+        # Utility functions
+        "get_available_modes",
+        "list_all_modes",
+        "is_valid_mode",
+        "get_mode_description",
+    ],
+    "lib.retro.isometric_types": [
+        # =============================================================================
+        # Isometric & Side-Scroller Module Imports
+        # =============================================================================
+        # Enums
+        "IsometricAngle",
+        "ViewDirection",
+        "SpriteFormat",
+        "TileFormat",
+        # Dataclasses
+        "IsometricConfig",
+        "SideScrollerConfig",
+        "SpriteSheetConfig",
+        "TileConfig",
+        "IsometricRenderResult",
+        "SpriteSheetResult",
+        "TileSetResult",
+        # Angle presets
+        "ISOMETRIC_ANGLES",
+        "get_isometric_angle",
+        "list_isometric_angles",
+        # Tile sizes
+        "TILE_SIZES",
+        "get_tile_size",
+        "list_tile_sizes",
+    ],
+    "lib.retro.isometric": [
+        # Camera config
+        "CameraConfig",
+        # Main functions
+        "create_isometric_camera_config",
+        "set_isometric_angle",
+        "calculate_isometric_rotation",
+        "calculate_camera_position",
+        # Projection functions
+        "project_to_isometric",
+        "project_to_screen",
+        # Depth sorting
+        "depth_sort_objects",
+        "get_isometric_depth",
+        # Grid functions
+        "create_isometric_grid_data",
+        "snap_to_isometric_grid",
+        # Rendering
+        "render_isometric_tile",
+        "render_isometric_tile_set",
+        # Utility
+        "get_tile_bounds",
+        "world_to_tile",
+        "tile_to_world",
+        "calculate_tile_neighbors",
+    ],
+    "lib.retro.side_scroller": [
+        # Dataclasses
+        "ParallaxLayer",
+        "SideScrollerCameraConfig",
+        # Camera functions
+        "create_side_scroller_camera_config",
+        "get_camera_rotation_for_view",
+        # Parallax functions
+        "separate_parallax_layers",
+        "calculate_parallax_offset",
+        "calculate_layer_scroll_speed",
+        "get_parallax_positions",
+        # Rendering
+        "render_parallax_layer",
+        "render_all_parallax_layers",
+        # Animation
+        "create_parallax_animation",
+        "animate_parallax_layers",
+        # Depth assignment
+        "assign_depth_by_z",
+        "assign_depth_by_collection",
+        "assign_depth_by_name_pattern",
+        # Utility
+        "get_layer_visibility_at_depth",
+        "calculate_optimal_layer_count",
+        "generate_layer_depths",
+        "merge_parallax_layers",
+    ],
+    "lib.retro.sprites": [
+        # Dataclasses
+        "SpriteFrame",
+        # Main functions
+        "generate_sprite_sheet",
+        "trim_sprite",
+        "calculate_pivot",
+        "calculate_pivot_world",
+        # Metadata generation
+        "generate_sprite_metadata",
+        "export_phaser_json",
+        "export_unity_json",
+        "export_godot_json",
+        "export_generic_json",
+        # Animation helpers
+        "extract_animation_frames",
+        "generate_walk_cycle_sheet",
+        "generate_animation_sheet",
+        # Utility
+        "get_frame_position",
+        "get_frame_bounds",
+        "calculate_frame_count",
+        "optimize_sheet_layout",
+    ],
+    "lib.retro.tiles": [
+        # Dataclasses
+        "Tile",
+        "TileSet",
+        # Tile set generation
+        "render_tile_set",
+        "create_tile_set_from_images",
+        # Tile map generation
+        "generate_tile_map",
+        "generate_tile_map_from_positions",
+        # Tile map export
+        "export_tile_map",
+        "export_tile_map_csv",
+        "export_tile_map_json",
+        "export_tile_map_tmx",
+        # Autotile
+        "AUTOTILE_MASKS",
+        "calculate_autotile_index",
+        "get_autotile_neighbors",
+        "create_autotile_template",
+        "apply_autotile",
+        # Collision map
+        "generate_collision_map",
+        "export_collision_map",
+        # Utility
+        "get_tile_at_position",
+        "resize_tile_map",
+        "flip_tile_map_horizontal",
+        "flip_tile_map_vertical",
+        "rotate_tile_map_90",
+    ],
+    "lib.retro.view_preset_loader": [
+        # Isometric presets
+        "load_isometric_preset",
+        "list_isometric_presets",
+        "get_isometric_preset",
+        # Side-scroller presets
+        "load_side_scroller_preset",
+        "list_side_scroller_presets",
+        "get_side_scroller_preset",
+        # Sprite sheet presets
+        "load_sprite_sheet_preset",
+        "list_sprite_sheet_presets",
+        "get_sprite_sheet_preset",
+        # Tile presets
+        "load_tile_preset",
+        "list_tile_presets",
+        "get_tile_preset",
+        # Generic
+        "load_view_preset",
+        "list_view_presets",
+        # Cache management
+        "clear_preset_cache",
+        "reload_presets",
+    ],
+    "lib.retro.crt_types": [
+        # =============================================================================
+        # CRT Display Effects Module Imports
+        # =============================================================================
+        # Enums
+        "ScanlineMode",
+        "PhosphorPattern",
+        "DisplayType",
+        # Dataclasses
+        "ScanlineConfig",
+        "PhosphorConfig",
+        "CurvatureConfig",
+        "CRTConfig",
+        # Built-in presets
+        "CRT_PRESETS",
+        # Functions
+        "get_preset_description",
+        "create_custom_preset",
+    ],
+    "lib.retro.scanlines": [
+        # Pattern generators
+        "alternate_scanlines",
+        "every_line_scanlines",
+        "random_scanlines",
+        # Overlay creation
+        "create_scanline_overlay",
+        "create_scanline_texture",
+        # Main functions
+        "apply_scanlines",
+        "apply_scanlines_fast",
+        "apply_scanlines_gpu",
+        "get_scanline_shader_code",
+        # Utility functions
+        "calculate_brightness_loss",
+        "recommend_brightness_compensation",
+        "estimate_scanline_visibility",
+    ],
+    "lib.retro.phosphor": [
+        # Pattern generators
+        "create_rgb_stripe_mask",
+        "create_aperture_grille_mask",
+        "create_slot_mask",
+        "create_shadow_mask",
+        "create_phosphor_mask",
+        # Application functions
+        "apply_phosphor_mask",
+        "apply_phosphor_mask_fast",
+        # Utility functions
+        "get_phosphor_brightness_factor",
+        "list_phosphor_patterns",
+        "estimate_mask_visibility",
+        # Constants
+        "PHOSPHOR_PATTERNS",
+    ],
+    "lib.retro.curvature": [
+        # UV transformation
+        "calculate_curved_uv",
+        "calculate_barrel_distortion_grid",
+        # Vignette
+        "create_vignette_mask",
+        "create_corner_mask",
+        "apply_vignette",
+        # Main functions
+        "apply_curvature",
+        "bilinear_sample",
+        "apply_border",
+        "combine_curvature_vignette",
+        # Utility functions
+        "calculate_edge_stretch",
+        "estimate_content_loss",
+        "recommend_border_size",
+    ],
+    "lib.retro.crt_effects": [
+        # Individual effects
+        "apply_bloom",
+        "apply_chromatic_aberration",
+        "apply_flicker",
+        "apply_interlace",
+        "apply_pixel_jitter",
+        "apply_noise",
+        "apply_ghosting",
+        "apply_color_adjustments",
+        # Pipeline
+        "apply_all_effects",
+        "apply_effects_fast",
+    ],
+    "lib.retro.crt_pipeline": [
+        "CRTFrameContext",
+        "CRTSequenceProcessor",
+        "build_frame_context",
+        "get_frame_context",
+    ],
+    "lib.retro.crt_compositor": [
+        # Node creation
+        "create_crt_node_group",
+        "create_scanline_node_config",
+        "create_phosphor_node_config",
+        # Setup
+        "setup_crt_compositing",
+        "create_curvature_node",
+        "create_scanline_node",
+        # Utilities
+        "get_crt_node_group_name",
+        "list_crt_node_templates",
+        "get_node_template_description",
+        "create_preset_nodes",
+        "export_node_setup_python",
+        # Constants
+        "CRT_NODE_GROUP_NAME",
+        "CRT_NODE_TEMPLATES",
+    ],
+    "lib.retro.crt_preset_loader": [
+        # Preset loading
+        "load_crt_preset",
+        "list_crt_presets",
+        "get_crt_preset",
+        "get_crt_preset_description",
+        # Cache management
+        # Convenience functions
+        "get_arcade_80s",
+        "get_crt_tv",
+        "get_pvm",
+        "get_gameboy",
+    ],
+}
+
+# Public names exported under a different name than in their submodule
+_LAZY_ALIASES = {
+    "list_builtin_palettes": ("lib.retro.pixel_types", "list_palettes"),
+    "pixelator_quantize_colors": ("lib.retro.pixelator", "quantize_colors"),
+    "quantizer_quantize_to_palette": ("lib.retro.quantizer", "quantize_to_palette"),
+    "quantizer_extract_palette": ("lib.retro.quantizer", "extract_palette"),
+    "DitherModeEnum": ("lib.retro.dither_types", "DitherMode"),
+    "tile_world_to_tile": ("lib.retro.tiles", "world_to_tile"),
+    "tile_tile_to_world": ("lib.retro.tiles", "tile_to_world"),
+    "get_crt_preset_builtin": ("lib.retro.crt_types", "get_preset"),
+    "list_crt_presets_builtin": ("lib.retro.crt_types", "list_presets"),
+    "validate_crt_config": ("lib.retro.crt_types", "validate_config"),
+    "get_phosphor_pattern_description": ("lib.retro.phosphor", "get_pattern_description"),
+    "clear_crt_context_cache": ("lib.retro.crt_pipeline", "clear_context_cache"),
+    "process_crt_frame_array": ("lib.retro.crt_pipeline", "process_frame_array"),
+    "process_crt_sequence": ("lib.retro.crt_pipeline", "process_sequence"),
+    "clear_crt_preset_cache": ("lib.retro.crt_preset_loader", "clear_preset_cache"),
+    "reload_crt_presets": ("lib.retro.crt_preset_loader", "reload_presets"),
+}
+
+_LAZY_ATTRIBUTES = {
+    name: (module, name) for module, names in _LAZY_IMPORTS.items() for name in names
+}
+_LAZY_ATTRIBUTES.update(_LAZY_ALIASES)
+
+# Public names that are also submodule names
+_SHADOWED_SUBMODULES = {"dither"}
 
 
 # =============================================================================
@@ -679,8 +692,27 @@ __all__ = [
     "get_color_histogram",
     "OctreeNode",
 
-    # Compositor (optional)
+    # Palette matching
+    "PaletteLUTCache",
+    "build_palette_lut",
+    "get_palette_lut",
+    "get_lut_cache",
+    "palette_hash",
+    "match_palette_indices",
+    "match_to_palette",
+    "minibatch_kmeans",
+
+    # Compositor (pixel_compositor guards bpy itself)
     "HAS_COMPOSITOR",
+    "create_pixelator_nodes",
+    "setup_pixelator_pass",
+    "bake_pixelation",
+    "create_scale_node",
+    "create_posterize_node",
+    "create_color_ramp_quantize",
+    "setup_pixel_preview",
+    "apply_pixel_style_to_scene",
+    "get_pixel_node_group",
 
     # ==========================================================================
     # Dithering API
@@ -753,6 +785,8 @@ __all__ = [
     "get_mode_description",
     "get_kernel",
     "get_kernel_names",
+    "build_palette_lut",
+    "benchmark_error_diffusion",
 
     # Dither constants
     "BAYER_2X2",
@@ -1032,6 +1066,15 @@ __all__ = [
     "apply_all_effects",
     "apply_effects_fast",
 
+    # CRT Pipeline
+    "CRTFrameContext",
+    "CRTSequenceProcessor",
+    "build_frame_context",
+    "get_frame_context",
+    "clear_crt_context_cache",
+    "process_crt_frame_array",
+    "process_crt_sequence",
+
     # CRT Compositor
     "create_crt_node_group",
     "create_scanline_node_config",
@@ -1060,20 +1103,6 @@ __all__ = [
     "get_gameboy",
 ]
 
-# Add compositor functions to exports if available
-if HAS_COMPOSITOR:
-    __all__.extend([
-        "create_pixelator_nodes",
-        "setup_pixelator_pass",
-        "bake_pixelation",
-        "create_scale_node",
-        "create_posterize_node",
-        "create_color_ramp_quantize",
-        "setup_pixel_preview",
-        "apply_pixel_style_to_scene",
-        "get_pixel_node_group",
-    ])
-
 
 # =============================================================================
 # Module info
@@ -1091,16 +1120,72 @@ def get_version() -> str:
 
 def info() -> dict:
     """Get module information."""
+    retro = sys.modules[__name__]
     return {
         "version": __version__,
         "author": __author__,
         "description": __description__,
-        "has_compositor": HAS_COMPOSITOR,
-        "builtin_palettes": list_builtin_palettes(),
-        "profiles_available": list_profiles() if list_profiles() else [],
-        "isometric_presets": list_isometric_presets(),
-        "side_scroller_presets": list_side_scroller_presets(),
-        "sprite_sheet_presets": list_sprite_sheet_presets(),
-        "tile_presets": list_tile_presets(),
-        "crt_presets": list_crt_presets(),
+        "has_compositor": retro.HAS_COMPOSITOR,
+        "builtin_palettes": retro.list_builtin_palettes(),
+        "profiles_available": retro.list_profiles() if retro.list_profiles() else [],
+        "isometric_presets": retro.list_isometric_presets(),
+        "side_scroller_presets": retro.list_side_scroller_presets(),
+        "sprite_sheet_presets": retro.list_sprite_sheet_presets(),
+        "tile_presets": retro.list_tile_presets(),
+        "crt_presets": retro.list_crt_presets(),
     }
+
+
+def _has_compositor() -> bool:
+    """Check whether the Blender compositor integration imports."""
+    try:
+        importlib.import_module("lib.retro.pixel_compositor")
+    except ImportError:
+        return False
+    return True
+
+
+def __getattr__(name: str):
+    """
+    Lazy import of public names and submodules (PEP 562).
+
+    The resolved value is stored in the package namespace, so each
+    name is imported at most once.
+    """
+    if name == "HAS_COMPOSITOR":
+        value = _has_compositor()
+        globals()[name] = value
+        return value
+
+    target = _LAZY_ATTRIBUTES.get(name)
+    if target is not None:
+        module_name, attribute = target
+        value = getattr(importlib.import_module(module_name), attribute)
+        globals()[name] = value
+        return value
+
+    # Submodules used to be bound as package attributes by eager imports
+    if not name.startswith("__"):
+        from importlib.util import find_spec
+        if find_spec(f"{__name__}.{name}") is not None:
+            return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"HAS_COMPOSITOR"})
+
+
+class _RetroModule(types.ModuleType):
+    """Package module that keeps exported functions over same-named submodules."""
+
+    def __setattr__(self, name, value):
+        # Importing lib.retro.dither binds the submodule on the package,
+        # which would replace the exported dither() function
+        if name in _SHADOWED_SUBMODULES and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _RetroModule
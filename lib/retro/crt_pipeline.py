@@ -0,0 +1,595 @@
+"""
+CRT Sequence Pipeline Module
+
+Streams image sequences through the full CRT effect chain with all
+geometry-dependent work done once per (resolution, CRTConfig).
+
+apply_all_effects() rebuilds the scanline overlay, phosphor mask,
+vignette mask and curvature remap grid for every frame. For a shot those
+are identical on every frame, so CRTSequenceProcessor precomputes them
+into a CRTFrameContext and runs each frame through a single fused pass:
+
+    color adjustments -> curvature -> chromatic aberration -> scanlines ->
+    phosphor -> bloom -> interlace -> noise -> flicker -> jitter -> ghosting
+
+Frames are processed on a thread pool (the heavy work is NumPy and
+releases the GIL) and yielded in order. Ghosting is the only step that
+depends on another frame; it blends each frame with the previous
+finished (ghosted) frame, as apply_all_effects does when fed its
+previous output, and runs serially as frames are yielded.
+
+Example Usage:
+    from lib.retro.crt_pipeline import CRTSequenceProcessor
+    from lib.retro.crt_types import get_preset
+
+    processor = CRTSequenceProcessor(get_preset("arcade_80s"), seed=7)
+    for frame_number, result in enumerate(processor.process_sequence(frames)):
+        result.save(f"out/frame_{frame_number:04d}.png")
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple, Optional, Any, Iterable, Iterator, List, Union
+import json
+import math
+import os
+import random
+import threading
+
+# Handle PIL import for image processing
+try:
+    from PIL import Image
+    import numpy as np
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    Image = None
+    np = None
+
+try:
+    from scipy import ndimage
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+from lib.retro.crt_types import CRTConfig
+
+
+# Number of frame contexts kept by the context cache
+CONTEXT_CACHE_SIZE = 8
+
+
+# =============================================================================
+# Precomputed Frame Context
+# =============================================================================
+
+@dataclass
+class CRTFrameContext:
+    """
+    Per-resolution precomputed masks and remap tables.
+
+    Attributes:
+        width: Frame width in pixels
+        height: Frame height in pixels
+        remap_index: Flat source indices (4, H*W) for bilinear curvature sampling
+        remap_weights: Bilinear weights (4, H*W, 1)
+        curvature_mask: Vignette, corner and border multipliers (H, W, 1)
+        scanline_mask: Scanline multipliers (H, 1, 1)
+        phosphor_mask: Intensity-blended phosphor multipliers (H, W, 3)
+        interlace_masks: Row multipliers (H, 1, 1) for field 0 and field 1
+        aberration_offset: Chromatic aberration shift in pixels
+    """
+    width: int
+    height: int
+    remap_index: Optional["np.ndarray"] = None
+    remap_weights: Optional["np.ndarray"] = None
+    curvature_mask: Optional["np.ndarray"] = None
+    scanline_mask: Optional["np.ndarray"] = None
+    phosphor_mask: Optional["np.ndarray"] = None
+    interlace_masks: Optional[Tuple["np.ndarray", "np.ndarray"]] = None
+    aberration_offset: int = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total memory held by the precomputed arrays."""
+        arrays = [
+            self.remap_index, self.remap_weights, self.curvature_mask,
+            self.scanline_mask, self.phosphor_mask,
+        ]
+        if self.interlace_masks:
+            arrays.extend(self.interlace_masks)
+        return sum(a.nbytes for a in arrays if a is not None)
+
+
+def build_frame_context(
+    width: int,
+    height: int,
+    config: CRTConfig,
+    seed: Optional[int] = None
+) -> CRTFrameContext:
+    """
+    Precompute all geometry-dependent CRT data for one resolution.
+
+    Args:
+        width: Frame width in pixels
+        height: Frame height in pixels
+        config: CRT configuration
+        seed: Random seed (affects random-mode scanlines only)
+
+    Returns:
+        CRTFrameContext
+    """
+    if not HAS_PIL:
+        raise ImportError("PIL and numpy required for CRT effects")
+
+    from lib.retro.scanlines import create_scanline_overlay
+    from lib.retro.phosphor import create_phosphor_mask
+    from lib.retro.curvature import (
+        calculate_barrel_distortion_grid,
+        create_vignette_mask,
+    )
+
+    context = CRTFrameContext(width=width, height=height)
+
+    curvature = config.curvature
+    if curvature.enabled:
+        u_map, v_map = calculate_barrel_distortion_grid(width, height, curvature.amount)
+        u = np.clip(u_map * (width - 1), 0, width - 1).astype(np.float32)
+        v = np.clip(v_map * (height - 1), 0, height - 1).astype(np.float32)
+
+        u0 = np.floor(u).astype(np.int64)
+        v0 = np.floor(v).astype(np.int64)
+        u1 = np.minimum(u0 + 1, width - 1)
+        v1 = np.minimum(v0 + 1, height - 1)
+        fu = (u - u0).ravel()
+        fv = (v - v0).ravel()
+
+        context.remap_index = np.stack([
+            (v0 * width + u0).ravel(),
+            (v0 * width + u1).ravel(),
+            (v1 * width + u0).ravel(),
+            (v1 * width + u1).ravel(),
+        ])
+        context.remap_weights = np.stack([
+            (1 - fu) * (1 - fv),
+            fu * (1 - fv),
+            (1 - fu) * fv,
+            fu * fv,
+        ]).astype(np.float32)[:, :, np.newaxis]
+
+        mask = np.ones((height, width), dtype=np.float32)
+        if curvature.vignette_amount > 0 or curvature.corner_radius > 0:
+            mask = create_vignette_mask(
+                width, height, curvature.vignette_amount, curvature.corner_radius
+            )
+        if curvature.border_size > 0:
+            b = curvature.border_size
+            mask = mask.copy()
+            mask[:b, :] = 0
+            mask[-b:, :] = 0
+            mask[:, :b] = 0
+            mask[:, -b:] = 0
+        context.curvature_mask = mask[:, :, np.newaxis]
+
+    if config.chromatic_aberration > 0:
+        context.aberration_offset = int(config.chromatic_aberration * width)
+
+    if config.scanlines.enabled:
+        overlay = create_scanline_overlay(1, height, config.scanlines, seed)
+        if config.scanlines.brightness_compensation != 1.0:
+            overlay = overlay * config.scanlines.brightness_compensation
+        context.scanline_mask = overlay.astype(np.float32).reshape(height, 1, 1)
+
+    if config.phosphor.enabled:
+        mask = create_phosphor_mask(width, height, config.phosphor)
+        intensity = config.phosphor.intensity
+        context.phosphor_mask = ((1.0 - intensity) + mask * intensity).astype(np.float32)
+
+    if config.interlace:
+        even = np.ones((height, 1, 1), dtype=np.float32)
+        odd = np.ones((height, 1, 1), dtype=np.float32)
+        even[1::2] = 0.5
+        odd[0::2] = 0.5
+        context.interlace_masks = (even, odd)
+
+    return context
+
+
+def _context_key(width: int, height: int, config: CRTConfig, seed: Optional[int]) -> str:
+    """Cache key for a frame context."""
+    return json.dumps([width, height, config.to_dict(), seed], sort_keys=True)
+
+
+_CONTEXT_CACHE: "OrderedDict[str, CRTFrameContext]" = OrderedDict()
+_CONTEXT_LOCK = threading.Lock()
+
+
+def get_frame_context(
+    width: int,
+    height: int,
+    config: CRTConfig,
+    seed: Optional[int] = None
+) -> CRTFrameContext:
+    """
+    Get the cached frame context for a resolution and configuration.
+
+    Args:
+        width: Frame width in pixels
+        height: Frame height in pixels
+        config: CRT configuration
+        seed: Random seed
+
+    Returns:
+        CRTFrameContext shared by all callers with the same key
+    """
+    key = _context_key(width, height, config, seed)
+
+    with _CONTEXT_LOCK:
+        context = _CONTEXT_CACHE.get(key)
+        if context is not None:
+            _CONTEXT_CACHE.move_to_end(key)
+            return context
+
+        # Built under the lock: random-mode scanlines reseed the global RNG
+        context = build_frame_context(width, height, config, seed)
+        _CONTEXT_CACHE[key] = context
+        while len(_CONTEXT_CACHE) > CONTEXT_CACHE_SIZE:
+            _CONTEXT_CACHE.popitem(last=False)
+
+    return context
+
+
+def clear_context_cache() -> None:
+    """Drop all cached frame contexts."""
+    with _CONTEXT_LOCK:
+        _CONTEXT_CACHE.clear()
+
+
+# =============================================================================
+# Fused Per-Frame Pass
+# =============================================================================
+
+def box_blur(arr: "np.ndarray", radius: int) -> "np.ndarray":
+    """
+    Vectorized box blur with edge padding.
+
+    Same result as crt_effects.simple_blur, computed with cumulative sums
+    along each axis instead of a per-pixel loop.
+
+    Args:
+        arr: Image array (H, W) or (H, W, C)
+        radius: Blur radius in pixels
+
+    Returns:
+        Blurred array
+    """
+    if radius < 1:
+        return arr.copy()
+
+    size = radius * 2 + 1
+    result = arr.astype(np.float64)
+    for axis in (0, 1):
+        pad = [(0, 0)] * result.ndim
+        pad[axis] = (radius + 1, radius)
+        padded = np.pad(result, pad, mode="edge")
+        padded = np.take(padded, range(1, padded.shape[axis]), axis=axis)
+        csum = np.cumsum(padded, axis=axis)
+        zero = np.zeros_like(np.take(csum, [0], axis=axis))
+        csum = np.concatenate([zero, csum], axis=axis)
+        n = arr.shape[axis]
+        upper = np.take(csum, range(size, size + n), axis=axis)
+        lower = np.take(csum, range(0, n), axis=axis)
+        result = (upper - lower) / size
+    return result.astype(arr.dtype)
+
+
+def _blur_bloom(bright: "np.ndarray", amount: float) -> "np.ndarray":
+    """Blur bright areas for bloom, matching crt_effects.apply_bloom."""
+    if HAS_SCIPY:
+        sigma = 5 * amount
+        if bright.ndim == 3:
+            return ndimage.gaussian_filter(bright, sigma=(sigma, sigma, 0))
+        return ndimage.gaussian_filter(bright, sigma=sigma)
+    return box_blur(bright, int(5 * amount))
+
+
+def process_frame_array(
+    arr: "np.ndarray",
+    config: CRTConfig,
+    context: CRTFrameContext,
+    frame: int = 0,
+    seed: Optional[int] = None
+) -> "np.ndarray":
+    """
+    Run one float32 (H, W, 3) frame in [0, 1] through the fused CRT pass.
+
+    Ghosting is not applied here; see CRTSequenceProcessor.
+
+    Args:
+        arr: Frame array
+        config: CRT configuration
+        context: Precomputed context for this resolution
+        frame: Frame number for animated effects
+        seed: Random seed for reproducibility
+
+    Returns:
+        Processed float32 array in [0, 1]
+    """
+    height, width = arr.shape[:2]
+    seed_value = frame if seed is None else seed + frame
+
+    # 1. Color adjustments
+    arr = arr * config.brightness
+    arr = (arr - 0.5) * config.contrast + 0.5
+    if config.saturation != 1.0:
+        gray = 0.299 * arr[:, :, 0] + 0.587 * arr[:, :, 1] + 0.114 * arr[:, :, 2]
+        arr = gray[:, :, np.newaxis] * (1 - config.saturation) + arr * config.saturation
+    if config.gamma != 1.0:
+        arr = np.power(np.clip(arr, 0, 1), 1.0 / config.gamma)
+    arr = np.clip(arr, 0, 1).astype(np.float32)
+
+    # 2. Curvature (remap + vignette/border)
+    if context.remap_index is not None:
+        flat = arr.reshape(-1, arr.shape[2])
+        w = context.remap_weights
+        idx = context.remap_index
+        arr = (
+            flat[idx[0]] * w[0] + flat[idx[1]] * w[1] +
+            flat[idx[2]] * w[2] + flat[idx[3]] * w[3]
+        ).reshape(height, width, -1)
+        arr = np.clip(arr * context.curvature_mask, 0, 1)
+
+    # 3. Chromatic aberration (row shift, as in apply_chromatic_aberration)
+    offset = context.aberration_offset
+    if offset > 0:
+        shifted = arr.copy()
+        shifted[offset:, :, 0] = arr[:-offset, :, 0]
+        shifted[:offset, :, 0] = arr[0, :, 0]
+        shifted[:-offset, :, 2] = arr[offset:, :, 2]
+        shifted[-offset:, :, 2] = arr[-1, :, 2]
+        arr = shifted
+
+    # 4. Scanlines
+    if context.scanline_mask is not None:
+        arr = np.clip(arr * context.scanline_mask, 0, 1)
+
+    # 5. Phosphor mask
+    if context.phosphor_mask is not None:
+        arr = np.clip(arr * context.phosphor_mask, 0, 1)
+
+    # 6. Bloom
+    if config.bloom > 0:
+        luminance = 0.299 * arr[:, :, 0] + 0.587 * arr[:, :, 1] + 0.114 * arr[:, :, 2]
+        bright = arr * (luminance > 0.8)[:, :, np.newaxis]
+        arr = np.clip(arr + _blur_bloom(bright, config.bloom) * config.bloom, 0, 1)
+
+    # 7. Interlace
+    if context.interlace_masks is not None:
+        arr = arr * context.interlace_masks[frame % 2]
+
+    # 8. Noise
+    if config.noise > 0:
+        noise = np.random.RandomState(seed_value).uniform(
+            -config.noise, config.noise, arr.shape
+        ).astype(np.float32)
+        arr = np.clip(arr + noise, 0, 1)
+
+    # 9. Flicker
+    if config.flicker > 0:
+        rng = random.Random(seed_value)
+        base_flicker = math.sin(frame * 0.5) * 0.5 + 0.5
+        total_flicker = base_flicker * 0.3 + rng.uniform(-0.5, 0.5) * 0.7
+        arr = np.clip(arr * (1.0 + total_flicker * config.flicker * 0.1), 0, 1)
+
+    # 10. Pixel jitter
+    if config.pixel_jitter > 0:
+        rng = random.Random(seed_value)
+        max_jitter = max(1, int(config.pixel_jitter * 3))
+        offsets = np.array([rng.randint(-max_jitter, max_jitter) for _ in range(height)])
+        columns = np.clip(np.arange(width)[np.newaxis, :] + offsets[:, np.newaxis], 0, width - 1)
+        arr = np.take_along_axis(arr, columns[:, :, np.newaxis], axis=1)
+
+    return arr.astype(np.float32, copy=False)
+
+
+def _load_frame(frame: Any) -> Tuple["np.ndarray", bool]:
+    """Convert a path, PIL image or array to float32 RGB in [0, 1]."""
+    if isinstance(frame, (str, Path)):
+        frame = Image.open(frame)
+
+    if isinstance(frame, Image.Image):
+        if frame.mode != "RGB":
+            frame = frame.convert("RGB")
+        return np.asarray(frame, dtype=np.float32) / 255.0, True
+
+    arr = np.asarray(frame, dtype=np.float32)
+    if arr.ndim == 2:
+        arr = np.repeat(arr[:, :, np.newaxis], 3, axis=2)
+    if arr.max() > 1.0:
+        arr = arr / 255.0
+    return arr[:, :, :3], False
+
+
+# =============================================================================
+# Sequence Processor
+# =============================================================================
+
+class CRTSequenceProcessor:
+    """
+    Streams frame sequences through the CRT effect chain.
+
+    Masks and remap grids are built once per frame resolution and shared
+    across frames and worker threads.
+
+    Attributes:
+        config: CRT configuration
+        seed: Random seed for animated effects
+        workers: Worker thread count
+    """
+
+    def __init__(
+        self,
+        config: CRTConfig,
+        seed: Optional[int] = None,
+        workers: Optional[int] = None
+    ):
+        if not HAS_PIL:
+            raise ImportError("PIL and numpy required for CRT effects")
+
+        self.config = config
+        self.seed = seed
+        self.workers = workers or min(8, os.cpu_count() or 1)
+
+    def context_for(self, width: int, height: int) -> CRTFrameContext:
+        """Get the precomputed context for a frame size."""
+        return get_frame_context(width, height, self.config, self.seed)
+
+    def _render(self, frame_input: Any, frame: int) -> Tuple["np.ndarray", bool]:
+        """Load and process one frame, without ghosting."""
+        arr, is_pil = _load_frame(frame_input)
+        context = self.context_for(arr.shape[1], arr.shape[0])
+        return process_frame_array(arr, self.config, context, frame, self.seed), is_pil
+
+    def _finish(self, arr: "np.ndarray", previous: Any, is_pil: bool) -> Tuple[Any, Optional["np.ndarray"]]:
+        """
+        Apply ghosting and convert back to the input type.
+
+        Returns:
+            (output, float32 copy of the output to ghost the next frame
+            with, or None when ghosting is off)
+        """
+        amount = self.config.ghosting
+        if amount <= 0:
+            if is_pil:
+                return Image.fromarray((arr * 255).astype(np.uint8)), None
+            return arr, None
+
+        if previous is not None:
+            if isinstance(previous, Image.Image):
+                previous = np.asarray(previous, dtype=np.float32) / 255.0
+            if previous.shape == arr.shape:
+                arr = np.clip(arr * (1 - amount) + previous * amount, 0, 1)
+
+        if is_pil:
+            output = Image.fromarray((arr * 255).astype(np.uint8))
+            # Ghost from the quantized image, as apply_ghosting would
+            return output, np.asarray(output, dtype=np.float32) / 255.0
+        return arr, arr
+
+    def process_frame(self, image: Any, frame: int = 0, previous: Any = None) -> Any:
+        """
+        Process a single frame.
+
+        Args:
+            image: PIL Image, numpy array or file path
+            frame: Frame number for animated effects
+            previous: Previous frame's finished output (PIL Image or
+                float32 array), blended in by ghosting
+
+        Returns:
+            Processed frame (PIL Image for PIL/path input, float32 array otherwise)
+        """
+        arr, is_pil = self._render(image, frame)
+        return self._finish(arr, previous, is_pil)[0]
+
+    def process_sequence(
+        self,
+        frames: Iterable[Any],
+        start_frame: int = 0
+    ) -> Iterator[Any]:
+        """
+        Process a sequence of frames, yielding results in order.
+
+        At most 2 * workers frames are in flight, so arbitrarily long
+        sequences stream in bounded memory.
+
+        Args:
+            frames: Iterable of PIL Images, arrays or file paths
+            start_frame: Frame number of the first frame
+
+        Yields:
+            Processed frames
+        """
+        window = self.workers * 2
+        previous = None
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending: "OrderedDict[int, Any]" = OrderedDict()
+            frame_iter = iter(frames)
+            frame_number = start_frame
+            exhausted = False
+
+            while pending or not exhausted:
+                while not exhausted and len(pending) < window:
+                    try:
+                        frame_input = next(frame_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending[frame_number] = executor.submit(self._render, frame_input, frame_number)
+                    frame_number += 1
+
+                if not pending:
+                    break
+
+                _, future = pending.popitem(last=False)
+                arr, is_pil = future.result()
+                output, previous = self._finish(arr, previous, is_pil)
+                yield output
+
+    def render_sequence(
+        self,
+        input_paths: Iterable[Union[str, Path]],
+        output_dir: Union[str, Path],
+        start_frame: int = 0,
+        pattern: str = "frame_{:04d}.png"
+    ) -> List[Path]:
+        """
+        Process image files and write results to a directory.
+
+        Args:
+            input_paths: Input image paths in frame order
+            output_dir: Output directory (created if missing)
+            start_frame: Frame number of the first frame
+            pattern: Output filename pattern formatted with the frame number
+
+        Returns:
+            List of written file paths
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        written = []
+        for offset, result in enumerate(self.process_sequence(input_paths, start_frame)):
+            path = output_dir / pattern.format(start_frame + offset)
+            result.save(path)
+            written.append(path)
+
+        return written
+
+
+def process_sequence(
+    frames: Iterable[Any],
+    config: CRTConfig,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    start_frame: int = 0
+) -> Iterator[Any]:
+    """
+    Convenience wrapper around CRTSequenceProcessor.process_sequence.
+
+    Args:
+        frames: Iterable of PIL Images, arrays or file paths
+        config: CRT configuration
+        seed: Random seed
+        workers: Worker thread count
+        start_frame: Frame number of the first frame
+
+    Yields:
+        Processed frames
+    """
+    processor = CRTSequenceProcessor(config, seed=seed, workers=workers)
+    yield from processor.process_sequence(frames, start_frame)
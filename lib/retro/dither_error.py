@@ -13,8 +13,9 @@ Popular algorithms include:
 """
 
 from __future__ import annotations
-from typing import Tuple, List, Optional, Any, Dict
+from typing import Tuple, List, Optional, Any, Dict, Callable
 import math
+import time
 
 try:
     import numpy as np
@@ -28,6 +29,8 @@ try:
 except ImportError:
     HAS_PIL = False
 
+from lib.retro.palette_match import get_palette_lut, DEFAULT_LUT_BITS
+
 
 # =============================================================================
 # Error Diffusion Kernels
@@ -299,7 +302,8 @@ def error_diffusion_dither(
     levels: int = 2,
     serpentine: bool = True,
     color_space: str = "rgb",
-    strength: float = 1.0
+    strength: float = 1.0,
+    lut_bits: int = DEFAULT_LUT_BITS
 ) -> Any:
     """
     Apply error diffusion dithering.
@@ -312,6 +316,7 @@ def error_diffusion_dither(
         serpentine: Alternate direction each row (reduces directional artifacts)
         color_space: Color space for distance calculation (rgb, lab, luma)
         strength: Error distribution strength (0.0-1.0)
+        lut_bits: Palette lookup cube precision in bits per channel
 
     Returns:
         Dithered PIL Image
@@ -331,7 +336,9 @@ def error_diffusion_dither(
         image = image.convert("RGB")
 
     if HAS_NUMPY:
-        return _error_diffusion_numpy(image, kernel, palette, levels, serpentine, color_space, strength)
+        return _error_diffusion_numpy(
+            image, kernel, palette, levels, serpentine, color_space, strength, lut_bits
+        )
     else:
         return _error_diffusion_slow(image, kernel, palette, levels, serpentine, color_space, strength)
 
@@ -343,10 +350,217 @@ def _error_diffusion_numpy(
     levels: int,
     serpentine: bool,
     color_space: str,
-    strength: float
+    strength: float,
+    lut_bits: int = DEFAULT_LUT_BITS
 ) -> Any:
     """
     NumPy-optimized error diffusion dithering.
+
+    Error pushed to following rows is propagated a whole row at a time with
+    array slices. Raster (non-serpentine) scans go further and process every
+    pixel on an anti-diagonal wavefront in one batch, since no pixel on the
+    wavefront depends on another. Palette matching uses a precomputed LUT.
+    """
+    work = np.array(image, dtype=np.float64)[..., :3]
+    kernel_def = kernel["kernel"]
+
+    if serpentine:
+        work = _diffuse_rows(work, kernel_def, palette, levels, True, color_space, strength, lut_bits)
+    else:
+        work = _diffuse_wavefront(work, kernel_def, palette, levels, color_space, strength, lut_bits)
+
+    result = np.clip(work, 0, 255).astype(np.uint8)
+    return Image.fromarray(result)
+
+
+def _make_scalar_quantizer(
+    palette: Optional[List[Tuple[int, int, int]]],
+    levels: int,
+    color_space: str,
+    lut_bits: int
+) -> Callable[[float, float, float], Tuple[float, float, float]]:
+    """Build a per-pixel quantizer operating on plain Python floats."""
+    if palette:
+        lut = get_palette_lut(palette, color_space, lut_bits).ravel().tolist()
+        colors = [(float(c[0]), float(c[1]), float(c[2])) for c in palette]
+        shift = 8 - lut_bits
+        g_shift = lut_bits
+        r_shift = lut_bits * 2
+
+        def quantize(r: float, g: float, b: float) -> Tuple[float, float, float]:
+            ri = 0 if r < 0 else (255 if r > 255 else int(r))
+            gi = 0 if g < 0 else (255 if g > 255 else int(g))
+            bi = 0 if b < 0 else (255 if b > 255 else int(b))
+            return colors[lut[((ri >> shift) << r_shift) | ((gi >> shift) << g_shift) | (bi >> shift)]]
+
+        return quantize
+
+    if levels <= 1:
+        return lambda r, g, b: (0.0, 0.0, 0.0)
+
+    step = 255.0 / (levels - 1)
+
+    def quantize(r: float, g: float, b: float) -> Tuple[float, float, float]:
+        return (round(r / step) * step, round(g / step) * step, round(b / step) * step)
+
+    return quantize
+
+
+def _make_array_quantizer(
+    palette: Optional[List[Tuple[int, int, int]]],
+    levels: int,
+    color_space: str,
+    lut_bits: int
+) -> Callable[[Any], Any]:
+    """Build a quantizer operating on (N, 3) float arrays."""
+    if palette:
+        lut = get_palette_lut(palette, color_space, lut_bits)
+        colors = np.asarray([c[:3] for c in palette], dtype=np.float64)
+        shift = 8 - lut_bits
+
+        def quantize(values: Any) -> Any:
+            idx = np.clip(values, 0, 255).astype(np.intp) >> shift
+            return colors[lut[idx[:, 0], idx[:, 1], idx[:, 2]]]
+
+        return quantize
+
+    if levels <= 1:
+        return lambda values: np.zeros_like(values)
+
+    step = 255.0 / (levels - 1)
+    return lambda values: np.round(values / step) * step
+
+
+def _diffuse_rows(
+    work: Any,
+    kernel_def: List[Tuple[int, int, float]],
+    palette: Optional[List[Tuple[int, int, int]]],
+    levels: int,
+    serpentine: bool,
+    color_space: str,
+    strength: float,
+    lut_bits: int
+) -> Any:
+    """
+    Row-at-a-time error diffusion supporting serpentine scanning.
+
+    Only the in-row error chain is walked pixel by pixel; error destined for
+    rows below is accumulated per row and added with shifted array slices.
+    """
+    height, width = work.shape[:2]
+    quantize = _make_scalar_quantizer(palette, levels, color_space, lut_bits)
+    in_row = [(dx, w) for dx, dy, w in kernel_def if dy == 0]
+    below = [(dx, dy, w) for dx, dy, w in kernel_def if dy > 0]
+
+    for y in range(height):
+        reverse = serpentine and y % 2 == 1
+        row = work[y].tolist()
+        errors = [None] * width
+        x_range = range(width - 1, -1, -1) if reverse else range(width)
+        row_in = [(-dx if reverse else dx, w) for dx, w in in_row]
+
+        for x in x_range:
+            r, g, b = row[x]
+            qr, qg, qb = quantize(r, g, b)
+            row[x] = (qr, qg, qb)
+            er = (r - qr) * strength
+            eg = (g - qg) * strength
+            eb = (b - qb) * strength
+            errors[x] = (er, eg, eb)
+
+            for dx, w in row_in:
+                nx = x + dx
+                if 0 <= nx < width:
+                    target = row[nx]
+                    row[nx] = (target[0] + er * w, target[1] + eg * w, target[2] + eb * w)
+
+        work[y] = row
+        err = np.asarray(errors, dtype=np.float64)
+
+        for dx, dy, w in below:
+            ny = y + dy
+            if ny >= height:
+                continue
+            if reverse:
+                dx = -dx
+            if dx >= 0:
+                work[ny, dx:] += err[:width - dx] * w
+            else:
+                work[ny, :width + dx] += err[-dx:] * w
+
+    return work
+
+
+def _wavefront_skew(kernel_def: List[Tuple[int, int, float]]) -> int:
+    """
+    Smallest per-row skew s so that every kernel source (x - dx, y - dy)
+    lies on an earlier wavefront x + s * y than its target.
+    """
+    skew = 1
+    for dx, dy, _ in kernel_def:
+        if dy > 0:
+            skew = max(skew, (-dx) // dy + 1)
+    return skew
+
+
+def _diffuse_wavefront(
+    work: Any,
+    kernel_def: List[Tuple[int, int, float]],
+    palette: Optional[List[Tuple[int, int, int]]],
+    levels: int,
+    color_space: str,
+    strength: float,
+    lut_bits: int
+) -> Any:
+    """
+    Raster-order error diffusion evaluated one anti-diagonal wavefront at a time.
+
+    Pixels with equal x + skew * y are mutually independent, so each
+    wavefront is quantized and scattered as a single batch.
+    """
+    height, width = work.shape[:2]
+    quantize = _make_array_quantizer(palette, levels, color_space, lut_bits)
+    skew = _wavefront_skew(kernel_def)
+    flat = work.reshape(-1, 3)
+
+    for t in range(width + skew * (height - 1)):
+        y_lo = max(0, -(-(t - width + 1) // skew))
+        y_hi = min(height - 1, t // skew)
+        if y_lo > y_hi:
+            continue
+
+        ys = np.arange(y_lo, y_hi + 1)
+        xs = t - skew * ys
+        idx = ys * width + xs
+
+        old = flat[idx]
+        new = quantize(old)
+        flat[idx] = new
+        error = (old - new) * strength
+
+        for dx, dy, w in kernel_def:
+            nx = xs + dx
+            valid = (nx >= 0) & (nx < width) & (ys + dy < height)
+            if not valid.any():
+                continue
+            flat[idx[valid] + (dy * width + dx)] += error[valid] * w
+
+    return work
+
+
+def _error_diffusion_reference(
+    image: Any,
+    kernel: Dict[str, Any],
+    palette: Optional[List[Tuple[int, int, int]]],
+    levels: int,
+    serpentine: bool,
+    color_space: str,
+    strength: float
+) -> Any:
+    """
+    Per-pixel error diffusion with exact palette matching.
+
+    Kept as the reference implementation for benchmarks and accuracy checks.
     """
     img_array = np.array(image, dtype=np.float64)
     height, width = img_array.shape[:2]
@@ -666,3 +880,66 @@ def get_kernel(name: str) -> Optional[Dict[str, Any]]:
         Kernel dictionary or None if not found
     """
     return ERROR_DIFFUSION_KERNELS.get(name.lower())
+
+
+# =============================================================================
+# Benchmarking
+# =============================================================================
+
+def benchmark_error_diffusion(
+    width: int = 96,
+    height: int = 64,
+    kernels: Optional[List[str]] = None,
+    palette: Optional[List[Tuple[int, int, int]]] = None,
+    levels: int = 2,
+    serpentine: bool = True,
+    seed: int = 0
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compare the vectorized engine against the per-pixel reference path.
+
+    Runs both implementations on the same synthetic gradient-plus-noise
+    image for each kernel.
+
+    Args:
+        width: Test image width
+        height: Test image height
+        kernels: Kernel names to run (defaults to get_kernel_names())
+        palette: Optional palette (levels quantization if None)
+        levels: Output levels per channel when no palette is given
+        serpentine: Serpentine scanning
+        seed: Random seed for the synthetic image
+
+    Returns:
+        Dictionary of kernel name -> {reference_seconds, vectorized_seconds,
+        speedup, mismatch_fraction}
+    """
+    if not HAS_NUMPY or not HAS_PIL:
+        raise ImportError("NumPy and PIL/Pillow are required for benchmarking")
+
+    rng = np.random.default_rng(seed)
+    gradient = np.linspace(0, 255, width)[None, :, None] * np.ones((height, 1, 3))
+    noise = rng.normal(0, 24, (height, width, 3))
+    image = Image.fromarray(np.clip(gradient + noise, 0, 255).astype(np.uint8))
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name in kernels or get_kernel_names():
+        kernel = ERROR_DIFFUSION_KERNELS[name]
+
+        start = time.perf_counter()
+        reference = _error_diffusion_reference(image, kernel, palette, levels, serpentine, "rgb", 1.0)
+        reference_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vectorized = _error_diffusion_numpy(image, kernel, palette, levels, serpentine, "rgb", 1.0)
+        vectorized_seconds = time.perf_counter() - start
+
+        mismatch = np.any(np.asarray(reference) != np.asarray(vectorized), axis=-1).mean()
+        results[name] = {
+            "reference_seconds": reference_seconds,
+            "vectorized_seconds": vectorized_seconds,
+            "speedup": reference_seconds / max(vectorized_seconds, 1e-9),
+            "mismatch_fraction": float(mismatch),
+        }
+
+    return results
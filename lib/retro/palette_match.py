@@ -0,0 +1,451 @@
+"""
+Palette Matching Subsystem
+
+Bounded-memory nearest-color matching shared by the quantizer, the
+pixelator and the error diffusion ditherer.
+
+Components:
+- PaletteLUTCache: LRU cache of 3D nearest-color lookup cubes keyed by palette hash
+- match_palette_indices: Tile-by-tile palette matching (exact or LUT)
+- minibatch_kmeans: Sampled k-means for palette extraction
+
+A lookup cube has (2^bits)^3 cells, each holding the index of the palette
+color nearest to the cell center. Matching a pixel is then a single table
+lookup instead of a distance computation against every palette entry.
+The cube is approximate (every pixel in a cell gets the cell center's
+match), so matching is exact unless lut_bits is given.
+
+Example Usage:
+    from lib.retro.palette_match import match_to_palette, minibatch_kmeans
+
+    result = match_to_palette(image, [(0, 0, 0), (255, 255, 255)])
+    palette = minibatch_kmeans(np.array(image).reshape(-1, 3), 16)
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Tuple, List, Any, Dict, Optional
+import hashlib
+import threading
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+
+# Bits per channel used to index the lookup cube (6 -> 64x64x64 cells)
+DEFAULT_LUT_BITS = 6
+
+# Maximum number of lookup cubes kept by the default cache
+DEFAULT_LUT_CACHE_SIZE = 32
+
+# Upper bound on (pixels x palette) distance elements evaluated at once
+DEFAULT_TILE_ELEMENTS = 1 << 20
+
+# Upper bound on pixels matched per tile through a lookup cube
+DEFAULT_TILE_PIXELS = 1 << 20
+
+
+# =============================================================================
+# Color Space Helpers
+# =============================================================================
+
+def rgb_to_lab_array(rgb: Any) -> Any:
+    """
+    Vectorized sRGB (0-255) to CIE Lab conversion (D65).
+
+    Args:
+        rgb: Array of shape (..., 3)
+
+    Returns:
+        Float64 array of shape (..., 3) with L, a, b
+    """
+    c = np.asarray(rgb, dtype=np.float64)[..., :3] / 255.0
+    c = np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+
+    x = (c[..., 0] * 0.4124564 + c[..., 1] * 0.3575761 + c[..., 2] * 0.1804375) / 0.95047
+    y = c[..., 0] * 0.2126729 + c[..., 1] * 0.7151522 + c[..., 2] * 0.0721750
+    z = (c[..., 0] * 0.0193339 + c[..., 1] * 0.1191920 + c[..., 2] * 0.9503041) / 1.08883
+
+    delta = 6 / 29
+    xyz = np.stack([x, y, z], axis=-1)
+    f = np.where(xyz > delta, np.cbrt(xyz), xyz / (3 * delta ** 2) + 4 / 29)
+
+    L = 116 * f[..., 1] - 16
+    a = 500 * (f[..., 0] - f[..., 1])
+    b = 200 * (f[..., 1] - f[..., 2])
+    return np.stack([L, a, b], axis=-1)
+
+
+def _to_match_space(values: Any, color_space: str) -> Any:
+    """Convert RGB values into the space distances are measured in."""
+    if color_space == "rgb":
+        return np.asarray(values, dtype=np.float64)
+    return rgb_to_lab_array(values)
+
+
+def nearest_palette_indices(
+    pixels: Any,
+    palette: List[Tuple[int, int, int]],
+    color_space: str = "rgb",
+    max_elements: int = DEFAULT_TILE_ELEMENTS
+) -> Any:
+    """
+    Exact nearest palette index for each pixel, in bounded memory.
+
+    Uses squared distances (no sqrt) and evaluates at most max_elements
+    pixel/palette pairs at a time.
+
+    Args:
+        pixels: Array of shape (N, 3)
+        palette: List of palette colors
+        color_space: Color space for distance calculation (rgb, lab)
+        max_elements: Maximum pixel x palette pairs per chunk
+
+    Returns:
+        Int array of shape (N,) with palette indices
+    """
+    colors = _to_match_space(np.asarray([c[:3] for c in palette]), color_space)
+    colors_sq = (colors ** 2).sum(axis=1)
+    pixels = np.asarray(pixels)[:, :3]
+
+    result = np.empty(len(pixels), dtype=np.intp)
+    chunk = max(1, max_elements // len(colors))
+    for start in range(0, len(pixels), chunk):
+        block = _to_match_space(pixels[start:start + chunk], color_space)
+        # |p - c|^2 = |p|^2 - 2 p.c + |c|^2; |p|^2 is constant per row
+        dist = colors_sq[None, :] - 2.0 * (block @ colors.T)
+        result[start:start + chunk] = np.argmin(dist, axis=1)
+
+    return result
+
+
+# =============================================================================
+# Lookup Cube Cache
+# =============================================================================
+
+def palette_hash(
+    palette: List[Tuple[int, int, int]],
+    color_space: str = "rgb",
+    bits: int = DEFAULT_LUT_BITS
+) -> str:
+    """
+    Stable hash identifying a palette lookup cube.
+
+    Args:
+        palette: List of palette colors
+        color_space: Color space for distance calculation
+        bits: Bits per channel of the cube
+
+    Returns:
+        Hex digest string
+    """
+    data = np.asarray([c[:3] for c in palette], dtype=np.uint8).tobytes()
+    digest = hashlib.sha1(data)
+    digest.update(f"{color_space}:{bits}".encode("ascii"))
+    return digest.hexdigest()
+
+
+def build_palette_lut(
+    palette: List[Tuple[int, int, int]],
+    color_space: str = "rgb",
+    bits: int = DEFAULT_LUT_BITS
+) -> Any:
+    """
+    Build a nearest-color lookup cube for a palette (uncached).
+
+    Args:
+        palette: List of palette colors (R, G, B)
+        color_space: Color space for distance calculation (rgb, lab, luma)
+        bits: Bits per channel used to index the cube (1-8)
+
+    Returns:
+        NumPy array of shape (2^bits, 2^bits, 2^bits) with palette indices
+    """
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for palette lookup tables")
+    if not palette:
+        raise ValueError("Palette must contain at least one color")
+    if not 1 <= bits <= 8:
+        raise ValueError(f"LUT bits must be between 1 and 8, got {bits}")
+
+    size = 1 << bits
+    step = 256 / size
+    centers = np.arange(size, dtype=np.float64) * step + (step - 1) / 2.0
+    grid = np.stack(np.meshgrid(centers, centers, centers, indexing="ij"), axis=-1).reshape(-1, 3)
+
+    indices = nearest_palette_indices(grid, palette, "rgb" if color_space == "rgb" else "lab")
+    dtype = np.uint8 if len(palette) <= 256 else np.int32
+    return indices.astype(dtype).reshape(size, size, size)
+
+
+class PaletteLUTCache:
+    """
+    Thread-safe LRU cache of palette lookup cubes.
+
+    Cubes are keyed by palette_hash(); the least recently used cube is
+    evicted once max_entries is exceeded.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_LUT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        palette: List[Tuple[int, int, int]],
+        color_space: str = "rgb",
+        bits: int = DEFAULT_LUT_BITS
+    ) -> Any:
+        """
+        Get (building if needed) the lookup cube for a palette.
+
+        Args:
+            palette: List of palette colors
+            color_space: Color space for distance calculation
+            bits: Bits per channel of the cube
+
+        Returns:
+            Lookup cube array
+        """
+        key = palette_hash(palette, color_space, bits)
+
+        with self._lock:
+            lut = self._entries.get(key)
+            if lut is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return lut
+            self.misses += 1
+
+        lut = build_palette_lut(palette, color_space, bits)
+
+        with self._lock:
+            self._entries[key] = lut
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return lut
+
+    def clear(self) -> None:
+        """Remove all cached cubes and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entries, hits, misses, evictions and bytes
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "bytes": sum(lut.nbytes for lut in self._entries.values()),
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_LUT_CACHE = PaletteLUTCache()
+
+
+def get_lut_cache() -> PaletteLUTCache:
+    """Get the process-wide palette lookup cube cache."""
+    return _LUT_CACHE
+
+
+def get_palette_lut(
+    palette: List[Tuple[int, int, int]],
+    color_space: str = "rgb",
+    bits: int = DEFAULT_LUT_BITS
+) -> Any:
+    """
+    Get the cached lookup cube for a palette.
+
+    Args:
+        palette: List of palette colors
+        color_space: Color space for distance calculation
+        bits: Bits per channel of the cube
+
+    Returns:
+        Lookup cube array
+    """
+    return _LUT_CACHE.get(palette, color_space, bits)
+
+
+# =============================================================================
+# Tiled Matching
+# =============================================================================
+
+def match_palette_indices(
+    pixels: Any,
+    palette: List[Tuple[int, int, int]],
+    color_space: str = "rgb",
+    lut_bits: Optional[int] = None,
+    tile_pixels: int = DEFAULT_TILE_PIXELS
+) -> Any:
+    """
+    Nearest palette index for every pixel, processed tile by tile.
+
+    Args:
+        pixels: Array of shape (..., 3) with 0-255 values
+        palette: List of palette colors
+        color_space: Color space for distance calculation (rgb, lab)
+        lut_bits: Match through a lookup cube with this many bits per
+            channel (faster, approximate); None matches exactly
+        tile_pixels: Maximum pixels per tile
+
+    Returns:
+        Int array of shape pixels.shape[:-1] with palette indices
+    """
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for palette matching")
+    if not palette:
+        raise ValueError("Palette must contain at least one color")
+
+    pixels = np.asarray(pixels)
+    shape = pixels.shape[:-1]
+    flat = pixels.reshape(-1, pixels.shape[-1])[:, :3]
+
+    if lut_bits is None:
+        return nearest_palette_indices(flat, palette, color_space).reshape(shape)
+
+    lut = get_palette_lut(palette, color_space, lut_bits)
+    shift = 8 - lut_bits
+    result = np.empty(len(flat), dtype=lut.dtype)
+
+    for start in range(0, len(flat), tile_pixels):
+        tile = flat[start:start + tile_pixels]
+        if tile.dtype != np.uint8:
+            tile = np.clip(tile, 0, 255).astype(np.uint8)
+        idx = tile >> shift
+        result[start:start + tile_pixels] = lut[idx[:, 0], idx[:, 1], idx[:, 2]]
+
+    return result.reshape(shape)
+
+
+def match_to_palette(
+    image: Any,
+    palette: List[Tuple[int, int, int]],
+    color_space: str = "rgb",
+    lut_bits: Optional[int] = None,
+    tile_pixels: int = DEFAULT_TILE_PIXELS
+) -> Any:
+    """
+    Replace every pixel of an image by its nearest palette color.
+
+    Args:
+        image: PIL Image (converted to RGB)
+        palette: List of palette colors
+        color_space: Color space for distance calculation (rgb, lab)
+        lut_bits: Match through a lookup cube with this many bits per
+            channel (faster, approximate); None matches exactly
+        tile_pixels: Maximum pixels per tile
+
+    Returns:
+        RGB PIL Image
+    """
+    if not HAS_PIL:
+        raise ImportError("PIL/Pillow is required for image processing")
+
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    img_array = np.asarray(image)
+    indices = match_palette_indices(img_array, palette, color_space, lut_bits, tile_pixels)
+    colors = np.asarray([c[:3] for c in palette], dtype=np.uint8)
+    return Image.fromarray(colors[indices])
+
+
+# =============================================================================
+# Mini-Batch K-Means
+# =============================================================================
+
+def minibatch_kmeans(
+    pixels: Any,
+    num_colors: int,
+    batch_size: int = 4096,
+    max_iterations: int = 50,
+    tolerance: float = 0.5,
+    seed: int = 42
+) -> List[Tuple[int, int, int]]:
+    """
+    Mini-batch k-means palette extraction.
+
+    Each iteration assigns a random batch of pixels to the nearest
+    centroid and moves centroids with a per-centroid learning rate of
+    1 / (samples seen), so cost is independent of image size.
+
+    Args:
+        pixels: Array of shape (N, 3)
+        num_colors: Number of centroids
+        batch_size: Pixels sampled per iteration
+        max_iterations: Maximum iterations
+        tolerance: Stop when no centroid moves further than this
+        seed: Random seed
+
+    Returns:
+        List of RGB color tuples
+    """
+    if not HAS_NUMPY:
+        raise ImportError("NumPy is required for k-means")
+
+    pixels = np.asarray(pixels).reshape(-1, np.asarray(pixels).shape[-1])[:, :3]
+    if len(pixels) == 0 or num_colors <= 0:
+        return []
+
+    rng = np.random.default_rng(seed)
+    init = rng.choice(len(pixels), num_colors, replace=len(pixels) < num_colors)
+    centroids = pixels[init].astype(np.float64)
+    counts = np.zeros(num_colors, dtype=np.float64)
+
+    for _ in range(max_iterations):
+        batch = pixels[rng.integers(0, len(pixels), min(batch_size, len(pixels)))].astype(np.float64)
+
+        dist = (centroids ** 2).sum(axis=1)[None, :] - 2.0 * (batch @ centroids.T)
+        labels = np.argmin(dist, axis=1)
+
+        batch_counts = np.bincount(labels, minlength=num_colors).astype(np.float64)
+        sums = np.stack([
+            np.bincount(labels, weights=batch[:, ch], minlength=num_colors)
+            for ch in range(3)
+        ], axis=1)
+
+        counts += batch_counts
+        seen = batch_counts > 0
+        rate = np.zeros(num_colors)
+        rate[seen] = batch_counts[seen] / counts[seen]
+
+        means = np.zeros_like(sums)
+        means[seen] = sums[seen] / batch_counts[seen, None]
+        new_centroids = centroids + rate[:, None] * (means - centroids)
+
+        shift = np.sqrt(((new_centroids - centroids) ** 2).sum(axis=1)).max()
+        centroids = new_centroids
+        if shift < tolerance:
+            break
+
+    return [tuple(int(v) for v in np.clip(np.rint(c), 0, 255)) for c in centroids]
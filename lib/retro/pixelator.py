@@ -28,6 +28,7 @@ from lib.retro.pixel_types import (
     ColorPalette,
     get_palette,
 )
+from lib.retro.palette_match import match_to_palette, minibatch_kmeans
 
 
 def pixelate(
@@ -305,7 +306,8 @@ def quantize_colors(
 
 def quantize_to_palette(
     image: Any,
-    palette: List[Tuple[int, int, int]]
+    palette: List[Tuple[int, int, int]],
+    lut_bits: Optional[int] = None
 ) -> Any:
     """
     Reduce image to specific palette.
@@ -313,6 +315,8 @@ def quantize_to_palette(
     Args:
         image: PIL Image to quantize
         palette: List of RGB color tuples
+        lut_bits: Match through a palette lookup cube with this many bits
+            per channel (faster, approximate); None matches exactly
 
     Returns:
         PIL Image quantized to palette
@@ -334,27 +338,8 @@ def quantize_to_palette(
         # Fallback: create palette image and use quantize
         return _quantize_to_palette_slow(image, palette)
 
-    # Fast numpy-based quantization
-    img_array = np.array(image)
-
-    # Reshape for distance calculation
-    pixels = img_array.reshape(-1, 3)
-
-    # Create palette array
-    palette_array = np.array(palette)
-
-    # Calculate distances to all palette colors for each pixel
-    # Using broadcasting for efficiency
-    distances = np.sqrt(((pixels[:, np.newaxis] - palette_array) ** 2).sum(axis=2))
-
-    # Find nearest palette index for each pixel
-    nearest_indices = np.argmin(distances, axis=1)
-
-    # Map back to colors
-    new_pixels = palette_array[nearest_indices]
-    new_array = new_pixels.reshape(img_array.shape)
-
-    return Image.fromarray(new_array.astype(np.uint8))
+    # Fast tiled matching (lookup cube if lut_bits is set)
+    return match_to_palette(image, palette, lut_bits=lut_bits)
 
 
 def _quantize_to_palette_slow(
@@ -504,7 +489,7 @@ def pixelate_8bit(image: Any, config: PixelStyle) -> Any:
 
     # Limit colors
     color_limit = min(config.color_limit, 64)
-    image = quantize_colors(image, color_limit)
+    image = _quantize_adaptive(image, color_limit)
 
     return image
 
@@ -529,7 +514,7 @@ def pixelate_4bit(image: Any, config: PixelStyle) -> Any:
 
     # Limit to 4-16 colors
     color_limit = min(config.color_limit, 16)
-    image = quantize_colors(image, color_limit)
+    image = _quantize_adaptive(image, color_limit)
 
     return image
 
@@ -590,6 +575,24 @@ def pixelate_1bit(image: Any, config: PixelStyle) -> Any:
     return image
 
 
+def _quantize_adaptive(image: Any, color_count: int) -> Any:
+    """
+    Reduce image to an extracted palette of color_count colors.
+
+    Extracts the palette with mini-batch k-means and maps pixels through
+    the shared palette lookup cube. Falls back to PIL quantization
+    without numpy.
+    """
+    if not HAS_NUMPY:
+        return quantize_colors(image, color_count)
+
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    palette = minibatch_kmeans(np.asarray(image).reshape(-1, 3), color_count)
+    return match_to_palette(image, palette)
+
+
 def _apply_bayer_dither(image: Any) -> Any:
     """Apply 4x4 Bayer matrix dithering."""
     if not HAS_PIL or not HAS_NUMPY:
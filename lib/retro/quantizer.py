@@ -28,6 +28,8 @@ try:
 except ImportError:
     HAS_PIL = False
 
+from lib.retro.palette_match import match_to_palette, minibatch_kmeans
+
 
 def quantize_colors(
     image: Any,
@@ -68,7 +70,8 @@ def quantize_colors(
 
 def quantize_to_palette(
     image: Any,
-    palette: List[Tuple[int, int, int]]
+    palette: List[Tuple[int, int, int]],
+    lut_bits: Optional[int] = None
 ) -> Any:
     """
     Reduce image to specific palette.
@@ -76,6 +79,8 @@ def quantize_to_palette(
     Args:
         image: PIL Image to quantize
         palette: List of RGB color tuples
+        lut_bits: Match through a palette lookup cube with this many bits
+            per channel (faster, approximate); None matches exactly
 
     Returns:
         PIL Image quantized to palette
@@ -94,7 +99,7 @@ def quantize_to_palette(
         image = image.convert("RGB")
 
     if HAS_NUMPY:
-        return _fast_palette_match(image, palette)
+        return _fast_palette_match(image, palette, lut_bits)
     else:
         return _slow_palette_match(image, palette)
 
@@ -286,39 +291,21 @@ def _kmeans_extract(
     max_iterations: int = 20,
     tolerance: float = 1.0
 ) -> List[Tuple[int, int, int]]:
-    """Extract palette using k-means clustering."""
-    # Get pixel data
-    img_array = np.array(image)
-    pixels = img_array.reshape(-1, 3).astype(np.float32)
-
-    # Initialize centroids randomly
-    np.random.seed(42)  # For reproducibility
-    indices = np.random.choice(len(pixels), num_colors, replace=False)
-    centroids = pixels[indices].copy()
-
-    for _ in range(max_iterations):
-        # Assign pixels to nearest centroid
-        distances = np.sqrt(((pixels[:, np.newaxis] - centroids) ** 2).sum(axis=2))
-        labels = np.argmin(distances, axis=1)
-
-        # Update centroids
-        new_centroids = np.zeros_like(centroids)
-        for k in range(num_colors):
-            mask = labels == k
-            if np.any(mask):
-                new_centroids[k] = pixels[mask].mean(axis=0)
-            else:
-                new_centroids[k] = centroids[k]
-
-        # Check convergence
-        shift = np.sqrt(((new_centroids - centroids) ** 2).sum(axis=1)).max()
-        centroids = new_centroids
-
-        if shift < tolerance:
-            break
+    """
+    Extract palette using k-means clustering.
+
+    Uses mini-batch k-means, so each iteration samples a fixed number of
+    pixels instead of assigning every pixel in the image.
+    """
+    img_array = np.asarray(image)
+    pixels = img_array.reshape(-1, 3)
 
-    # Convert to integer tuples
-    return [tuple(c.astype(int)) for c in centroids]
+    return minibatch_kmeans(
+        pixels,
+        num_colors,
+        max_iterations=max_iterations,
+        tolerance=tolerance,
+    )
 
 
 # =============================================================================
@@ -461,24 +448,13 @@ def nearest_color_match(
     return quantize_to_palette(image, palette)
 
 
-def _fast_palette_match(image: Any, palette: List[Tuple[int, int, int]]) -> Any:
-    """Fast numpy-based palette matching."""
-    img_array = np.array(image)
-    pixels = img_array.reshape(-1, 3)
-
-    palette_array = np.array(palette)
-
-    # Calculate distances
-    distances = np.sqrt(((pixels[:, np.newaxis] - palette_array) ** 2).sum(axis=2))
-
-    # Find nearest
-    nearest_indices = np.argmin(distances, axis=1)
-
-    # Map to colors
-    new_pixels = palette_array[nearest_indices]
-    new_array = new_pixels.reshape(img_array.shape)
-
-    return Image.fromarray(new_array.astype(np.uint8))
+def _fast_palette_match(
+    image: Any,
+    palette: List[Tuple[int, int, int]],
+    lut_bits: Optional[int] = None
+) -> Any:
+    """Fast numpy-based palette matching (lookup cube if lut_bits is set)."""
+    return match_to_palette(image, palette, lut_bits=lut_bits)
 
 
 def _slow_palette_match(image: Any, palette: List[Tuple[int, int, int]]) -> Any:
@@ -0,0 +1,201 @@
+"""
+Unit tests for CRT Pipeline module.
+
+Tests for frame context caching, the fused per-frame pass and
+sequence streaming.
+"""
+
+import pytest
+import numpy as np
+
+# Skip all tests if PIL not available
+pytest.importorskip("PIL")
+
+from PIL import Image
+
+from lib.retro.crt_pipeline import (
+    CRTSequenceProcessor,
+    build_frame_context,
+    get_frame_context,
+    clear_context_cache,
+    process_frame_array,
+    process_sequence,
+    box_blur,
+)
+from lib.retro.crt_types import (
+    CRTConfig,
+    ScanlineConfig,
+    PhosphorConfig,
+    CurvatureConfig,
+)
+from lib.retro.scanlines import apply_scanlines
+from lib.retro.phosphor import apply_phosphor_mask
+from lib.retro.curvature import apply_curvature
+from lib.retro import crt_effects
+
+
+def _geometry_config():
+    """Config exercising every precomputed mask."""
+    return CRTConfig(
+        scanlines=ScanlineConfig(enabled=True, intensity=0.4),
+        phosphor=PhosphorConfig(enabled=True, pattern="slot_mask"),
+        curvature=CurvatureConfig(
+            enabled=True, amount=0.2, vignette_amount=0.3, corner_radius=4, border_size=2
+        ),
+        gamma=1.0,
+    )
+
+
+def _frames(count, width=48, height=32, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.random((height, width, 3)).astype(np.float32) for _ in range(count)]
+
+
+class TestFrameContext:
+    """Tests for precomputed frame contexts."""
+
+    def test_context_cached_per_resolution(self):
+        """Same resolution and config share one context."""
+        clear_context_cache()
+        config = _geometry_config()
+
+        a = get_frame_context(48, 32, config)
+        b = get_frame_context(48, 32, config)
+        c = get_frame_context(64, 32, config)
+
+        assert a is b
+        assert c is not a
+        assert c.width == 64
+
+    def test_context_keyed_on_config(self):
+        """Changing the config builds a new context."""
+        clear_context_cache()
+        a = get_frame_context(48, 32, _geometry_config())
+        other = _geometry_config()
+        other.scanlines.intensity = 0.1
+        assert get_frame_context(48, 32, other) is not a
+
+    def test_disabled_effects_have_no_masks(self):
+        """Disabled effects do not allocate masks."""
+        context = build_frame_context(48, 32, CRTConfig(scanlines=ScanlineConfig(enabled=False)))
+        assert context.remap_index is None
+        assert context.scanline_mask is None
+        assert context.phosphor_mask is None
+        assert context.nbytes == 0
+
+
+class TestFusedPass:
+    """Tests for the fused per-frame pass."""
+
+    def test_matches_individual_effects(self):
+        """Fused pass reproduces curvature -> scanlines -> phosphor."""
+        config = _geometry_config()
+        frame = _frames(1)[0]
+        context = build_frame_context(48, 32, config)
+
+        result = process_frame_array(frame, config, context)
+
+        expected = np.clip((frame - 0.5) * config.contrast + 0.5, 0, 1)
+        expected = apply_curvature(expected, config.curvature)
+        expected = apply_scanlines(expected, config.scanlines)
+        expected = apply_phosphor_mask(expected, config.phosphor)
+
+        np.testing.assert_allclose(result, expected, atol=1e-5)
+
+    @pytest.mark.skipif(not crt_effects.HAS_PIL, reason="crt_effects dependencies missing")
+    def test_matches_apply_all_effects(self):
+        """Fused pass matches apply_all_effects for animated effects."""
+        config = _geometry_config()
+        config.chromatic_aberration = 0.05
+        config.noise = 0.05
+        config.flicker = 0.5
+        config.pixel_jitter = 0.5
+        config.interlace = True
+        frame = _frames(1)[0]
+        context = build_frame_context(48, 32, config, seed=5)
+
+        result = process_frame_array(frame, config, context, frame=3, seed=5)
+        expected = crt_effects.apply_all_effects(frame, config, frame=3, seed=5)
+
+        np.testing.assert_allclose(result, expected, atol=1e-5)
+
+    def test_box_blur_matches_loop(self):
+        """Vectorized box blur equals a direct windowed mean."""
+        arr = _frames(1, 12, 9)[0]
+        radius = 2
+        size = radius * 2 + 1
+        padded = np.pad(arr, ((radius, radius), (radius, radius), (0, 0)), mode="edge")
+        expected = np.empty_like(arr)
+        for i in range(arr.shape[0]):
+            for j in range(arr.shape[1]):
+                expected[i, j] = padded[i:i + size, j:j + size].mean(axis=(0, 1))
+
+        np.testing.assert_allclose(box_blur(arr, radius), expected, atol=1e-5)
+
+
+class TestSequenceProcessor:
+    """Tests for sequence streaming."""
+
+    def test_sequence_order_and_types(self):
+        """PIL frames come back as PIL images, in order."""
+        frames = [Image.fromarray((f * 255).astype(np.uint8)) for f in _frames(5)]
+        processor = CRTSequenceProcessor(_geometry_config(), workers=3)
+
+        results = list(processor.process_sequence(frames))
+        assert len(results) == 5
+        for frame_input, result in zip(frames, results):
+            assert isinstance(result, Image.Image)
+            assert result.size == frame_input.size
+            single = processor.process_frame(frame_input)
+            np.testing.assert_array_equal(np.array(single), np.array(result))
+
+    def test_ghosting_uses_previous_frame(self):
+        """Ghosting blends with the previous frame's finished output."""
+        config = CRTConfig(scanlines=ScanlineConfig(enabled=False), gamma=1.0, ghosting=0.5)
+        frames = _frames(3)
+
+        results = list(process_sequence(frames, config, workers=2))
+        context = get_frame_context(48, 32, config)
+        raw = [process_frame_array(f, config, context, i) for i, f in enumerate(frames)]
+
+        np.testing.assert_allclose(results[0], raw[0], atol=1e-6)
+        np.testing.assert_allclose(results[1], np.clip(raw[1] * 0.5 + results[0] * 0.5, 0, 1), atol=1e-6)
+        np.testing.assert_allclose(results[2], np.clip(raw[2] * 0.5 + results[1] * 0.5, 0, 1), atol=1e-6)
+
+    @pytest.mark.skipif(not crt_effects.HAS_PIL, reason="crt_effects dependencies missing")
+    def test_ghosting_matches_apply_all_effects_feedback(self):
+        """The ghost trail matches apply_all_effects fed its previous output."""
+        config = CRTConfig(scanlines=ScanlineConfig(enabled=False), gamma=1.0, ghosting=0.4)
+        frames = _frames(4)
+
+        results = list(process_sequence(frames, config, workers=2))
+        previous = None
+        for i, frame in enumerate(frames):
+            expected = crt_effects.apply_all_effects(frame, config, frame=i, previous_frame=previous)
+            np.testing.assert_allclose(results[i], expected, atol=1e-5)
+            previous = expected
+
+    def test_animated_effects_depend_on_frame_number(self):
+        """Noise differs between frames but is reproducible with a seed."""
+        config = CRTConfig(scanlines=ScanlineConfig(enabled=False), gamma=1.0, noise=0.1)
+        frame = _frames(1)[0]
+
+        first = list(process_sequence([frame, frame], config, seed=1, workers=2))
+        second = list(process_sequence([frame, frame], config, seed=1, workers=1))
+
+        assert not np.allclose(first[0], first[1])
+        np.testing.assert_array_equal(first[1], second[1])
+
+    def test_render_sequence_writes_files(self, tmp_path):
+        """Files are read from disk and written per frame."""
+        inputs = []
+        for i, frame in enumerate(_frames(3)):
+            path = tmp_path / f"in_{i}.png"
+            Image.fromarray((frame * 255).astype(np.uint8)).save(path)
+            inputs.append(path)
+
+        processor = CRTSequenceProcessor(_geometry_config(), workers=2)
+        written = processor.render_sequence(inputs, tmp_path / "out", start_frame=10)
+
+        assert [p.name for p in written] == ["frame_0010.png", "frame_0011.png", "frame_0012.png"]
+        assert all(p.exists() for p in written)
@@ -60,8 +60,11 @@ from lib.retro.dither_error import (
     FLOYD_STEINBERG,
     ATKINSON,
     SIERRA_LITE,
+    benchmark_error_diffusion,
 )
 
+from lib.retro.palette_match import build_palette_lut, get_palette_lut
+
 from lib.retro.dither_patterns import (
     list_patterns,
     get_pattern,
@@ -373,6 +376,47 @@ class TestDitherError(unittest.TestCase):
         self.assertAlmostEqual(fs_sum, 1.0, places=2)
 
 
+@unittest.skipUnless(HAS_NUMPY and HAS_PIL, "NumPy and PIL/Pillow required")
+class TestDitherErrorEngine(unittest.TestCase):
+    """Tests for the vectorized error diffusion engine."""
+
+    def test_vectorized_matches_reference_all_kernels(self):
+        """Vectorized engine reproduces the per-pixel path for every kernel."""
+        for serpentine in (True, False):
+            results = benchmark_error_diffusion(
+                width=24, height=16, levels=3, serpentine=serpentine
+            )
+            self.assertEqual(sorted(results), sorted(get_kernel_names()))
+            for name, stats in results.items():
+                self.assertEqual(stats["mismatch_fraction"], 0.0, name)
+                self.assertGreater(stats["speedup"], 0.0)
+
+    def test_palette_lut_matches_nearest_color(self):
+        """LUT cells resolve to the same color as an exact palette scan."""
+        palette = [(0, 0, 0), (255, 255, 255), (255, 0, 0), (0, 128, 255), (40, 200, 60)]
+        lut = build_palette_lut(palette, bits=8)
+        self.assertEqual(lut.shape, (256, 256, 256))
+
+        rng = np.random.default_rng(1)
+        for r, g, b in rng.integers(0, 256, (200, 3)):
+            expected = find_nearest_color((r, g, b), palette)
+            self.assertEqual(palette[lut[r, g, b]], expected)
+
+    def test_palette_lut_cached(self):
+        """LUTs are built once per palette."""
+        palette = [(0, 0, 0), (255, 255, 255)]
+        self.assertIs(get_palette_lut(palette), get_palette_lut(palette))
+
+    def test_palette_dither_uses_palette_colors(self):
+        """Palette dithering only emits palette colors."""
+        palette = [(0, 0, 0), (255, 255, 255), (255, 0, 0)]
+        image = Image.new("RGB", (20, 12), (180, 60, 60))
+        for serpentine in (True, False):
+            result = floyd_steinberg_dither(image, palette=palette, serpentine=serpentine)
+            colors = {c for _, c in result.getcolors()}
+            self.assertTrue(colors.issubset(set(palette)))
+
+
 # =============================================================================
 # Test Pattern Dithering
 # =============================================================================
@@ -0,0 +1,181 @@
+"""
+Tests for palette_match module.
+
+Run with: pytest lib/retro/test_palette_match.py -v
+"""
+
+import pytest
+
+# Check for optional dependencies
+try:
+    from PIL import Image
+    import numpy as np
+    HAS_DEPS = True
+except ImportError:
+    HAS_DEPS = False
+
+from lib.retro.palette_match import (
+    DEFAULT_LUT_BITS,
+    PaletteLUTCache,
+    build_palette_lut,
+    palette_hash,
+    nearest_palette_indices,
+    match_palette_indices,
+    match_to_palette,
+    minibatch_kmeans,
+)
+
+
+PALETTE = [(0, 0, 0), (255, 255, 255), (255, 0, 0), (0, 128, 255), (40, 200, 60)]
+
+
+@pytest.fixture
+def noise_pixels():
+    """Random RGB pixels."""
+    if not HAS_DEPS:
+        pytest.skip("PIL and numpy required")
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (4000, 3)).astype(np.uint8)
+
+
+def _brute_force(pixels, palette):
+    """Reference nearest-color search."""
+    colors = np.asarray(palette, dtype=np.float64)
+    dist = ((pixels[:, None, :].astype(np.float64) - colors[None]) ** 2).sum(axis=2)
+    return np.argmin(dist, axis=1)
+
+
+class TestNearestPaletteIndices:
+    """Tests for exact chunked matching."""
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_matches_brute_force(self, noise_pixels):
+        """Chunked squared distances agree with a full distance matrix."""
+        result = nearest_palette_indices(noise_pixels, PALETTE, max_elements=64)
+        assert np.array_equal(result, _brute_force(noise_pixels, PALETTE))
+
+
+class TestPaletteLUT:
+    """Tests for lookup cube construction and caching."""
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_full_resolution_lut_is_exact(self, noise_pixels):
+        """An 8-bit cube gives the exact nearest color."""
+        lut = build_palette_lut(PALETTE, bits=8)
+        idx = lut[noise_pixels[:, 0], noise_pixels[:, 1], noise_pixels[:, 2]]
+        assert np.array_equal(idx, _brute_force(noise_pixels, PALETTE))
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_lut_shape_and_dtype(self):
+        """Small palettes use compact uint8 cubes."""
+        lut = build_palette_lut(PALETTE, bits=4)
+        assert lut.shape == (16, 16, 16)
+        assert lut.dtype == np.uint8
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_invalid_bits(self):
+        """Out-of-range bit depth is rejected."""
+        with pytest.raises(ValueError):
+            build_palette_lut(PALETTE, bits=9)
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_palette_hash(self):
+        """Hash depends on colors, color space and bit depth."""
+        assert palette_hash(PALETTE) == palette_hash(list(PALETTE))
+        assert palette_hash(PALETTE) != palette_hash(PALETTE[:-1])
+        assert palette_hash(PALETTE, "rgb") != palette_hash(PALETTE, "lab")
+        assert palette_hash(PALETTE, bits=5) != palette_hash(PALETTE, bits=6)
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_cache_hits_and_eviction(self):
+        """Cache reuses cubes and evicts least recently used."""
+        cache = PaletteLUTCache(max_entries=2)
+        a = [(0, 0, 0), (255, 255, 255)]
+        b = [(255, 0, 0), (0, 255, 0)]
+        c = [(0, 0, 255), (255, 255, 0)]
+
+        first = cache.get(a, bits=4)
+        assert cache.get(a, bits=4) is first
+        cache.get(b, bits=4)
+        cache.get(a, bits=4)
+        cache.get(c, bits=4)
+
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+        assert stats["evictions"] == 1
+        # b was least recently used
+        cache.get(a, bits=4)
+        assert cache.stats()["hits"] == 3
+
+
+class TestTiledMatching:
+    """Tests for tile-by-tile matching."""
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_tiles_do_not_change_result(self, noise_pixels):
+        """Tile size does not affect the output."""
+        image = noise_pixels.reshape(40, 100, 3)
+        whole = match_palette_indices(image, PALETTE, lut_bits=DEFAULT_LUT_BITS)
+        tiled = match_palette_indices(image, PALETTE, lut_bits=DEFAULT_LUT_BITS, tile_pixels=333)
+        assert whole.shape == (40, 100)
+        assert np.array_equal(whole, tiled)
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_exact_by_default(self, noise_pixels):
+        """Without lut_bits matching equals brute force."""
+        result = match_palette_indices(noise_pixels, PALETTE)
+        assert np.array_equal(result, _brute_force(noise_pixels, PALETTE))
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="PIL and numpy required")
+    def test_palette_colors_map_to_themselves(self):
+        """A pixel equal to a palette color keeps it, even in a shared cube cell."""
+        palette = [(0, 0, 0), (3, 3, 3), (255, 255, 255)]
+        img = Image.new("RGB", (4, 4), (3, 3, 3))
+        assert match_to_palette(img, palette).getpixel((0, 0)) == (3, 3, 3)
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_lut_mode_close_to_exact(self, noise_pixels):
+        """Default cube precision agrees with exact matching almost everywhere."""
+        lut = match_palette_indices(noise_pixels, PALETTE, lut_bits=DEFAULT_LUT_BITS)
+        exact = _brute_force(noise_pixels, PALETTE)
+        assert (lut == exact).mean() > 0.97
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="PIL and numpy required")
+    def test_match_to_palette_image(self):
+        """Output only contains palette colors."""
+        img = Image.new("RGB", (30, 20), (200, 40, 30))
+        result = match_to_palette(img, PALETTE)
+        assert result.mode == "RGB"
+        assert result.size == img.size
+        assert {c for _, c in result.getcolors()} == {(255, 0, 0)}
+
+
+class TestMiniBatchKMeans:
+    """Tests for mini-batch k-means."""
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_recovers_clusters(self):
+        """Well separated clusters are recovered."""
+        rng = np.random.default_rng(3)
+        centers = np.array([[20, 20, 20], [230, 30, 30], [30, 220, 40], [40, 40, 230]])
+        pixels = np.concatenate([c + rng.normal(0, 4, (5000, 3)) for c in centers])
+        pixels = np.clip(pixels, 0, 255).astype(np.uint8)
+
+        palette = minibatch_kmeans(pixels, 4, batch_size=1024)
+        assert len(palette) == 4
+        for center in centers:
+            nearest = min(palette, key=lambda p: sum((a - b) ** 2 for a, b in zip(p, center)))
+            assert all(abs(a - b) < 12 for a, b in zip(nearest, center))
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_more_colors_than_pixels(self):
+        """Requesting more colors than pixels still returns num_colors entries."""
+        pixels = np.array([[10, 10, 10], [200, 200, 200]], dtype=np.uint8)
+        assert len(minibatch_kmeans(pixels, 4)) == 4
+
+    @pytest.mark.skipif(not HAS_DEPS, reason="numpy required")
+    def test_empty(self):
+        """Empty input returns an empty palette."""
+        assert minibatch_kmeans(np.zeros((0, 3), dtype=np.uint8), 4) == []
@@ -123,6 +123,19 @@ class TestQuantizeToPalette:
         pixels = list(result.getdata())
         assert all(p == (128, 128, 128) for p in pixels)
 
+    @pytest.mark.skipif(not HAS_DEPS, reason="PIL and numpy required")
+    def test_quantize_is_exact_by_default(self, gradient_image):
+        """Every pixel gets its nearest palette color unless lut_bits is set."""
+        palette = [(i, i, i) for i in range(0, 256, 3)]
+        result = np.asarray(quantize_to_palette(gradient_image, palette), dtype=np.int64)
+        source = np.asarray(gradient_image.convert("RGB"), dtype=np.int64)
+        colors = np.asarray(palette)
+        best = ((source[..., None, :] - colors) ** 2).sum(axis=-1).min(axis=-1)
+        assert np.array_equal(((source - result) ** 2).sum(axis=-1), best)
+
+        approximate = quantize_to_palette(gradient_image, palette, lut_bits=4)
+        assert approximate.size == gradient_image.size
+
 
 class TestExtractPalette:
     """Tests for extract_palette function."""
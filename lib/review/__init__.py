@@ -50,6 +50,7 @@ __all__ = [
     # Classes
     "ValidationEngine",
     "ComparisonTool",
+    "ImageCache",
     "ChecklistManager",
     "ReportGenerator",
     "ApprovalWorkflow",
@@ -80,6 +81,7 @@ from .comparison import (
     ComparisonResult,
     # Classes
     ComparisonTool,
+    ImageCache,
 )
 
 from .checklists import (
@@ -4,14 +4,50 @@ Visual Comparison Tool
 Compare renders and scenes for visual difference detection.
 
 Implements REQ-QA-02: Visual Comparison.
+
+Metrics are computed with NumPy on images decoded by Pillow:
+- SSIM over 7x7 windows (separable box filters)
+- Per-channel histogram distances
+- Connected regions of differing pixels (8-connectivity)
+
+Decoded images are kept in a size-bounded ImageCache, and directory
+comparisons can run across worker processes.
 """
 
 from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 from pathlib import Path
 import json
 import hashlib
+import math
+import os
+import threading
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+    Image = None
+
+
+# SSIM stabilizing constants (Wang et al. 2004) for data in [0, 1]
+SSIM_K1 = 0.01
+SSIM_K2 = 0.03
+
+HISTOGRAM_METHODS = ("intersection", "chi_square", "bhattacharyya")
+
+# Decoded images kept per process (~20 RGB 1080p frames as float32)
+DEFAULT_CACHE_BYTES = 512 * 1024 * 1024
 
 
 @dataclass
@@ -75,6 +111,426 @@ class ComparisonResult:
         return self.ssim_score > 0.95 and self.difference_pixels < 5.0
 
 
+# =============================================================================
+# IMAGE DECODING
+# =============================================================================
+
+def decode_image(path: str) -> "np.ndarray":
+    """
+    Decode an image to a float array.
+
+    Args:
+        path: Image path
+
+    Returns:
+        (H, W, C) float32 array in [0, 1] with 1 (L), 2 (LA), 3 (RGB)
+        or 4 (RGBA) channels
+    """
+    if not HAS_NUMPY or not HAS_PIL:
+        raise ImportError("NumPy and Pillow are required for image comparison")
+
+    with Image.open(path) as img:
+        # 16-bit grayscale (PNG) and float images keep their precision
+        if img.mode == "I" or img.mode.startswith("I;16"):
+            return (np.asarray(img, dtype=np.float32) / 65535.0)[..., None]
+        if img.mode == "F":
+            return np.asarray(img, dtype=np.float32)[..., None]
+        if img.mode not in ("L", "LA", "RGB", "RGBA"):
+            has_alpha = "A" in img.mode or "transparency" in img.info
+            img = img.convert("RGBA" if has_alpha else "RGB")
+        data = np.asarray(img)
+
+    if data.ndim == 2:
+        data = data[..., None]
+    return data.astype(np.float32) / 255.0
+
+
+class ImageCache:
+    """
+    Size-bounded LRU cache of decoded images.
+
+    Entries are keyed on the resolved path with its mtime and size, so
+    a rewritten file is decoded again. Cached arrays are read-only.
+
+    Usage:
+        cache = ImageCache(max_bytes=256 * 1024 * 1024)
+        pixels = cache.load("render.0001.png")
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Maximum bytes of decoded pixels kept
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int, int], np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def load(self, path: str) -> "np.ndarray":
+        """
+        Get a decoded image, decoding it on a miss.
+
+        Args:
+            path: Image path
+
+        Returns:
+            Read-only (H, W, C) float32 array (see decode_image)
+        """
+        stat = os.stat(path)
+        key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            pixels = self._entries.get(key)
+            if pixels is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return pixels
+
+        pixels = decode_image(path)
+        pixels.setflags(write=False)
+
+        with self._lock:
+            self.misses += 1
+            if key not in self._entries and pixels.nbytes <= self.max_bytes:
+                self._entries[key] = pixels
+                self._bytes += pixels.nbytes
+                while self._bytes > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes -= evicted.nbytes
+        return pixels
+
+    def clear(self) -> None:
+        """Remove all cached images."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Shared by ComparisonTool instances in this process
+_default_cache = ImageCache()
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+def _to_rgba(image: "np.ndarray") -> "np.ndarray":
+    """Expand L/LA/RGB to RGBA (opaque where there is no alpha)."""
+    channels = image.shape[2]
+    if channels == 4:
+        return image
+    color = image[..., :1].repeat(3, axis=2) if channels in (1, 2) else image[..., :3]
+    alpha = image[..., 1:2] if channels == 2 else np.ones(image.shape[:2] + (1,), dtype=image.dtype)
+    return np.concatenate([color, alpha], axis=2)
+
+
+def _matching_channels(a: "np.ndarray", b: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Bring two images to the same channel layout."""
+    if a.shape[2] == b.shape[2]:
+        return a, b
+    return _to_rgba(a), _to_rgba(b)
+
+
+def _color_channels(image: "np.ndarray") -> "np.ndarray":
+    """Color channels without alpha."""
+    return image[..., :1] if image.shape[2] <= 2 else image[..., :3]
+
+
+def difference_map(a: "np.ndarray", b: "np.ndarray") -> "np.ndarray":
+    """
+    Per-pixel difference between two images.
+
+    Args:
+        a: (H, W, C) image in [0, 1]
+        b: (H, W, C) image in [0, 1]
+
+    Returns:
+        (H, W) float32 largest absolute channel difference
+    """
+    a, b = _matching_channels(a, b)
+    # Reduce channel by channel; max over a short last axis is slow
+    result = np.abs(a[..., 0] - b[..., 0])
+    for channel in range(1, a.shape[2]):
+        np.maximum(result, np.abs(a[..., channel] - b[..., channel]), out=result)
+    return result
+
+
+def _box_mean(values: "np.ndarray", window: int) -> "np.ndarray":
+    """
+    Mean over every window x window block ("valid" positions only).
+
+    Separable running sums of window terms stay accurate in float32
+    (cumulative sums over a whole row would not).
+    """
+    height, width = values.shape
+    rows = values[:height - window + 1].copy()
+    for offset in range(1, window):
+        rows += values[offset:height - window + 1 + offset]
+    cols = rows[:, :width - window + 1].copy()
+    for offset in range(1, window):
+        cols += rows[:, offset:width - window + 1 + offset]
+    cols *= 1.0 / (window * window)
+    return cols
+
+
+def ssim_map(a: "np.ndarray", b: "np.ndarray", window: int = 7) -> "np.ndarray":
+    """
+    Structural similarity for every window position.
+
+    Uses uniform windows with sample covariance, averaged over color
+    channels (alpha is left to the pixel difference).
+
+    Args:
+        a: (H, W, C) image in [0, 1]
+        b: (H, W, C) image in [0, 1]
+        window: Window size
+
+    Returns:
+        (H - window + 1, W - window + 1) float32 SSIM values
+    """
+    a, b = _matching_channels(a, b)
+    a, b = _color_channels(a), _color_channels(b)
+    height, width = a.shape[:2]
+    if window < 2 or min(height, width) < window:
+        raise ValueError(f"Image of {width}x{height} is smaller than the {window}px SSIM window")
+
+    count = window * window
+    covariance_norm = count / (count - 1)
+    c1 = SSIM_K1 ** 2
+    c2 = SSIM_K2 ** 2
+
+    total = np.zeros((height - window + 1, width - window + 1), dtype=np.float32)
+    for channel in range(a.shape[2]):
+        x = np.ascontiguousarray(a[..., channel], dtype=np.float32)
+        y = np.ascontiguousarray(b[..., channel], dtype=np.float32)
+        mean_x = _box_mean(x, window)
+        mean_y = _box_mean(y, window)
+        mean_xy = mean_x * mean_y
+        mean_sq = mean_x * mean_x
+        mean_sq += mean_y * mean_y
+
+        # var_x + var_y and cov from second moments
+        variance = _box_mean(x * x, window)
+        variance += _box_mean(y * y, window)
+        variance -= mean_sq
+        variance *= covariance_norm
+        cov = _box_mean(x * y, window)
+        cov -= mean_xy
+        cov *= covariance_norm
+
+        numerator = (2 * mean_xy + c1) * (2 * cov + c2)
+        denominator = (mean_sq + c1) * (variance + c2)
+        total += numerator / denominator
+
+    total /= a.shape[2]
+    return total
+
+
+def ssim(a: "np.ndarray", b: "np.ndarray", window: int = 7) -> float:
+    """
+    Mean structural similarity of two images.
+
+    Args:
+        a: (H, W, C) image in [0, 1]
+        b: (H, W, C) image in [0, 1]
+        window: Window size
+
+    Returns:
+        SSIM (1.0 for identical images)
+    """
+    return float(ssim_map(a, b, window).mean())
+
+
+def histogram_distances(
+    a: "np.ndarray",
+    b: "np.ndarray",
+    bins: int = 256,
+    method: str = "intersection",
+) -> Dict[str, float]:
+    """
+    Compare per-channel color histograms.
+
+    Methods (all 0 for identical histograms, 1 for disjoint ones):
+    - intersection: 1 - sum(min(p, q))
+    - chi_square: 0.5 * sum((p - q)^2 / (p + q))
+    - bhattacharyya: sqrt(1 - sum(sqrt(p * q)))
+
+    Args:
+        a: (H, W, C) image in [0, 1]
+        b: (H, W, C) image in [0, 1]
+        bins: Histogram bins per channel
+        method: Distance method
+
+    Returns:
+        Distance per channel ("red", "green", "blue") and "overall"
+    """
+    if method not in HISTOGRAM_METHODS:
+        raise ValueError(f"Unknown histogram method: {method} (expected one of {HISTOGRAM_METHODS})")
+
+    distances: Dict[str, float] = {}
+    for channel, name in enumerate(("red", "green", "blue")):
+        # Gray images use their single channel for all three
+        p = _histogram(a[..., channel if a.shape[2] > 2 else 0], bins)
+        q = _histogram(b[..., channel if b.shape[2] > 2 else 0], bins)
+        if method == "intersection":
+            distance = 1.0 - np.minimum(p, q).sum()
+        elif method == "chi_square":
+            total = p + q
+            nonzero = total > 0
+            distance = 0.5 * (((p - q) ** 2)[nonzero] / total[nonzero]).sum()
+        else:
+            distance = math.sqrt(max(0.0, 1.0 - np.sqrt(p * q).sum()))
+        distances[name] = float(max(0.0, distance))
+
+    distances["overall"] = sum(distances.values()) / 3
+    return distances
+
+
+def _histogram(values: "np.ndarray", bins: int) -> "np.ndarray":
+    """Normalized histogram of values in [0, 1]."""
+    scaled = values * np.float32(bins)
+    np.clip(scaled, 0, bins - 1, out=scaled)
+    counts = np.bincount(scaled.astype(np.intp).ravel(), minlength=bins)
+    return counts / max(1, values.size)
+
+
+def find_regions(
+    mask: "np.ndarray",
+    difference: Optional["np.ndarray"] = None,
+    min_size: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    Find 8-connected regions of a boolean mask.
+
+    Works on horizontal runs of set pixels: runs in neighbouring rows
+    that touch are merged, so cost scales with the number of runs
+    rather than pixels.
+
+    Args:
+        mask: (H, W) boolean mask
+        difference: Optional (H, W) values summarized per region
+        min_size: Minimum region size in pixels
+
+    Returns:
+        Regions, largest first, with x, y, width, height (top-left
+        origin), pixel_count and mean/max difference
+    """
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    run_rows, run_starts = np.nonzero(edges == 1)
+    _, run_ends = np.nonzero(edges == -1)
+    if run_rows.size == 0:
+        return []
+
+    labels = _merge_runs(run_rows, run_starts, run_ends, width)
+    _, labels = np.unique(labels, return_inverse=True)
+    count = int(labels.max()) + 1
+    lengths = run_ends - run_starts
+
+    pixel_count = np.bincount(labels, weights=lengths, minlength=count)
+    y_min = np.full(count, height)
+    y_max = np.full(count, -1)
+    x_min = np.full(count, width)
+    x_max = np.full(count, -1)
+    np.minimum.at(y_min, labels, run_rows)
+    np.maximum.at(y_max, labels, run_rows)
+    np.minimum.at(x_min, labels, run_starts)
+    np.maximum.at(x_max, labels, run_ends - 1)
+
+    if difference is not None:
+        # Per-run sums from row prefix sums, per-run maxima by reduceat
+        prefix = np.zeros((height, width + 1))
+        np.cumsum(difference, axis=1, out=prefix[:, 1:])
+        run_sums = prefix[run_rows, run_ends] - prefix[run_rows, run_starts]
+        flat = np.append(difference.ravel(), 0.0)
+        bounds = np.empty(2 * run_rows.size, dtype=np.intp)
+        bounds[0::2] = run_rows * width + run_starts
+        bounds[1::2] = run_rows * width + run_ends
+        run_max = np.maximum.reduceat(flat, bounds)[0::2]
+
+        mean_difference = np.bincount(labels, weights=run_sums, minlength=count) / pixel_count
+        max_difference = np.zeros(count)
+        np.maximum.at(max_difference, labels, run_max)
+
+    regions = []
+    for index in np.argsort(-pixel_count, kind="stable"):
+        if pixel_count[index] < min_size:
+            break
+        region = {
+            "x": int(x_min[index]),
+            "y": int(y_min[index]),
+            "width": int(x_max[index] - x_min[index] + 1),
+            "height": int(y_max[index] - y_min[index] + 1),
+            "pixel_count": int(pixel_count[index]),
+        }
+        if difference is not None:
+            region["mean_difference"] = float(mean_difference[index])
+            region["max_difference"] = float(max_difference[index])
+        regions.append(region)
+    return regions
+
+
+def _merge_runs(
+    rows: "np.ndarray",
+    starts: "np.ndarray",
+    ends: "np.ndarray",
+    width: int,
+) -> "np.ndarray":
+    """Label runs (sorted by row, then column) by connected component."""
+    # Flat keys keep runs ordered across rows: row * stride + column
+    stride = width + 2
+    start_keys = rows * stride + starts
+    end_keys = rows * stride + ends
+
+    # Runs in the row above touching [start - 1, end] (8-connectivity)
+    above = (rows - 1) * stride
+    first = np.searchsorted(end_keys, above + starts, side="left")
+    last = np.searchsorted(start_keys, above + ends, side="right")
+    counts = np.maximum(last - first, 0)
+
+    run_index = np.repeat(np.arange(rows.size), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    neighbor = np.repeat(first, counts) + offsets
+
+    # Hook to the smallest label along each edge, then shortcut chains
+    labels = np.arange(rows.size)
+    while True:
+        lowest = np.minimum(labels[run_index], labels[neighbor])
+        merged = labels.copy()
+        for targets in (run_index, neighbor, labels[run_index], labels[neighbor]):
+            np.minimum.at(merged, targets, lowest)
+        while True:
+            jumped = merged[merged]
+            if np.array_equal(jumped, merged):
+                break
+            merged = jumped
+        if np.array_equal(merged, labels):
+            return labels
+        labels = merged
+
+
+# =============================================================================
+# COMPARISON TOOL
+# =============================================================================
+
 class ComparisonTool:
     """
     Visual comparison tool.
@@ -85,16 +541,35 @@ class ComparisonTool:
         tool = ComparisonTool()
         result = tool.compare("render_v1.png", "render_v2.png")
         tool.generate_diff_image("render_v1.png", "render_v2.png", "diff.png")
+
+        # Stream results for two render directories from worker processes
+        for result in tool.iter_compare_directories("baseline/", "current/"):
+            print(result.source_a, result.ssim_score)
     """
 
-    def __init__(self, threshold: float = 0.01):
+    def __init__(
+        self,
+        threshold: float = 0.01,
+        ssim_window: int = 7,
+        histogram_bins: int = 256,
+        min_region_size: int = 100,
+        cache: Optional[ImageCache] = None,
+    ):
         """
         Initialize comparison tool.
 
         Args:
             threshold: Pixel difference threshold
+            ssim_window: SSIM window size in pixels
+            histogram_bins: Histogram bins per channel
+            min_region_size: Minimum difference region size in pixels
+            cache: Decoded image cache (default: shared per process)
         """
         self.threshold = threshold
+        self.ssim_window = ssim_window
+        self.histogram_bins = histogram_bins
+        self.min_region_size = min_region_size
+        self.cache = cache if cache is not None else _default_cache
         self._comparison_counter = 0
 
     def compare(
@@ -129,35 +604,106 @@ class ComparisonTool:
         path_b = Path(source_b)
 
         if not path_a.exists():
-            result.metadata["error"] = f"Source A not found: {source_a}"
-            return result
+            return self._failed(result, f"Source A not found: {source_a}")
 
         if not path_b.exists():
-            result.metadata["error"] = f"Source B not found: {source_b}"
-            return result
+            return self._failed(result, f"Source B not found: {source_b}")
+
+        try:
+            image_a, image_b = self._load_pair(source_a, source_b)
+        except (ImportError, OSError, ValueError) as e:
+            return self._failed(result, str(e))
+
+        difference = difference_map(image_a, image_b)
+        changed = difference > self.threshold
+
+        try:
+            result.ssim_score = ssim(image_a, image_b, self.ssim_window)
+        except ValueError as e:
+            # Too small for the window: fall back to pixel agreement
+            result.ssim_score = 1.0 - float(changed.mean())
+            result.metadata["ssim_error"] = str(e)
+
+        histograms = histogram_distances(image_a, image_b, self.histogram_bins)
+        result.histogram_diff = histograms["overall"]
+        result.difference_score = float(difference.mean())
+        result.difference_pixels = float(changed.mean()) * 100.0
+        result.regions = find_regions(changed, difference, self.min_region_size)
+        result.metadata.update({
+            "width": int(image_a.shape[1]),
+            "height": int(image_a.shape[0]),
+            "max_difference": float(difference.max()),
+            "histograms": histograms,
+        })
+
+        if generate_diff and diff_path:
+            self._write_diff_image(image_a, difference, diff_path)
+            result.metadata["diff_path"] = diff_path
 
-        # In actual implementation, would use PIL/numpy for comparison
-        # Here we provide structure for the comparison
+        return result
 
-        # Placeholder values - actual implementation would:
-        # 1. Load both images
-        # 2. Calculate pixel-by-pixel difference
-        # 3. Compute SSIM score
-        # 4. Generate histogram comparison
-        # 5. Find significant difference regions
+    def iter_compare_directories(
+        self,
+        dir_a: str,
+        dir_b: str,
+        pattern: str = "*.png",
+        workers: Optional[int] = None,
+        chunk_size: int = 8,
+    ) -> Iterator[ComparisonResult]:
+        """
+        Compare matching files in two directories, yielding results as
+        they complete.
 
-        result.histogram_diff = 0.0
-        result.ssim_score = 1.0
-        result.difference_score = 0.0
-        result.difference_pixels = 0.0
+        Pairs are sent to worker processes in chunks; each worker keeps
+        its own image cache.
 
-        return result
+        Args:
+            dir_a: First directory
+            dir_b: Second directory
+            pattern: File pattern to match
+            workers: Worker processes (default: CPU count; 1 compares here)
+            chunk_size: Pairs per worker task
+
+        Yields:
+            ComparisonResult in completion order
+        """
+        pairs = self._directory_pairs(dir_a, dir_b, pattern)
+        if not pairs:
+            return
+
+        workers = min(workers or os.cpu_count() or 1, len(pairs))
+        if workers <= 1:
+            for file_a, file_b in pairs:
+                yield self.compare(file_a, file_b)
+            return
+
+        chunk_size = max(1, chunk_size)
+        chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+        options = {
+            "threshold": self.threshold,
+            "ssim_window": self.ssim_window,
+            "histogram_bins": self.histogram_bins,
+            "min_region_size": self.min_region_size,
+        }
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [executor.submit(_compare_pairs, options, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                for result in future.result():
+                    # Number results here so ids are unique across workers
+                    self._comparison_counter += 1
+                    result.comparison_id = f"comp_{self._comparison_counter:06d}"
+                    yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def compare_directories(
         self,
         dir_a: str,
         dir_b: str,
         pattern: str = "*.png",
+        workers: Optional[int] = None,
     ) -> List[ComparisonResult]:
         """
         Compare all matching files in directories.
@@ -166,24 +712,13 @@ class ComparisonTool:
             dir_a: First directory
             dir_b: Second directory
             pattern: File pattern to match
+            workers: Worker processes (default: CPU count; 1 compares here)
 
         Returns:
-            List of ComparisonResult
+            List of ComparisonResult, ordered by file name
         """
-        results = []
-
-        path_a = Path(dir_a)
-        path_b = Path(dir_b)
-
-        if not path_a.exists() or not path_b.exists():
-            return results
-
-        for file_a in path_a.glob(pattern):
-            file_b = path_b / file_a.name
-            if file_b.exists():
-                result = self.compare(str(file_a), str(file_b))
-                results.append(result)
-
+        results = list(self.iter_compare_directories(dir_a, dir_b, pattern, workers))
+        results.sort(key=lambda r: r.source_a)
         return results
 
     def generate_diff_image(
@@ -196,6 +731,10 @@ class ComparisonTool:
         """
         Generate difference visualization image.
 
+        Pixels differing by more than the threshold are drawn in the
+        highlight color (stronger for larger differences) over a dimmed
+        grayscale copy of the first image.
+
         Args:
             source_a: First image path
             source_b: Second image path
@@ -205,18 +744,21 @@ class ComparisonTool:
         Returns:
             Success status
         """
-        # Placeholder - actual implementation would:
-        # 1. Load both images
-        # 2. Calculate pixel differences
-        # 3. Create visualization with highlights
-        # 4. Save to output_path
+        if not (Path(source_a).exists() and Path(source_b).exists()):
+            return False
 
-        return Path(source_a).exists() and Path(source_b).exists()
+        try:
+            image_a, image_b = self._load_pair(source_a, source_b)
+            self._write_diff_image(image_a, difference_map(image_a, image_b), output_path, highlight_color)
+        except (ImportError, OSError, ValueError):
+            return False
+        return True
 
     def compare_histograms(
         self,
         source_a: str,
         source_b: str,
+        method: str = "intersection",
     ) -> Dict[str, float]:
         """
         Compare color histograms.
@@ -224,17 +766,19 @@ class ComparisonTool:
         Args:
             source_a: First image path
             source_b: Second image path
+            method: "intersection", "chi_square" or "bhattacharyya"
 
         Returns:
-            Dictionary with histogram comparison per channel
+            Dictionary with histogram comparison per channel (0 = same
+            distribution; NaN if an image cannot be read)
         """
-        # Placeholder - actual implementation would use numpy/cv2
-        return {
-            "red": 0.0,
-            "green": 0.0,
-            "blue": 0.0,
-            "overall": 0.0,
-        }
+        try:
+            image_a = self.cache.load(source_a)
+            image_b = self.cache.load(source_b)
+        except (ImportError, OSError, ValueError):
+            return {name: float("nan") for name in ("red", "green", "blue", "overall")}
+
+        return histogram_distances(image_a, image_b, self.histogram_bins, method)
 
     def find_difference_regions(
         self,
@@ -253,20 +797,85 @@ class ComparisonTool:
         Returns:
             List of regions with bounding boxes
         """
-        # Placeholder - actual implementation would:
-        # 1. Calculate difference map
-        # 2. Threshold and find contours
-        # 3. Filter by minimum size
-        # 4. Return bounding boxes
+        try:
+            image_a, image_b = self._load_pair(source_a, source_b)
+        except (ImportError, OSError, ValueError):
+            return []
 
-        return []
+        difference = difference_map(image_a, image_b)
+        return find_regions(difference > self.threshold, difference, min_size)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get comparison statistics."""
         return {
             "total_comparisons": self._comparison_counter,
+            "cache": self.cache.get_statistics(),
         }
 
+    def _load_pair(self, source_a: str, source_b: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Load two images of the same size."""
+        image_a = self.cache.load(source_a)
+        image_b = self.cache.load(source_b)
+        if image_a.shape[:2] != image_b.shape[:2]:
+            raise ValueError(
+                f"Image size mismatch: {image_a.shape[1]}x{image_a.shape[0]} "
+                f"vs {image_b.shape[1]}x{image_b.shape[0]}"
+            )
+        return image_a, image_b
+
+    def _write_diff_image(
+        self,
+        image_a: "np.ndarray",
+        difference: "np.ndarray",
+        output_path: str,
+        highlight_color: Tuple[int, int, int] = (255, 0, 0),
+    ) -> None:
+        """Save a highlight visualization of a difference map."""
+        color = _color_channels(image_a)
+        gray = color.mean(axis=2, keepdims=True) * 0.35
+        output = np.repeat(gray, 3, axis=2)
+
+        changed = difference > self.threshold
+        if changed.any():
+            peak = float(difference.max())
+            strength = np.clip(difference[changed] / peak, 0.25, 1.0)[:, None]
+            highlight = np.asarray(highlight_color, dtype=np.float32) / 255.0
+            output[changed] = output[changed] * (1 - strength) + highlight * strength
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(np.round(np.clip(output, 0, 1) * 255).astype(np.uint8), "RGB").save(output_path)
+
+    def _directory_pairs(self, dir_a: str, dir_b: str, pattern: str) -> List[Tuple[str, str]]:
+        """Matching (file_a, file_b) paths, sorted by name."""
+        path_a = Path(dir_a)
+        path_b = Path(dir_b)
+
+        if not path_a.exists() or not path_b.exists():
+            return []
+
+        pairs = []
+        for file_a in sorted(path_a.glob(pattern)):
+            file_b = path_b / file_a.name
+            if file_b.exists():
+                pairs.append((str(file_a), str(file_b)))
+        return pairs
+
+    @staticmethod
+    def _failed(result: ComparisonResult, error: str) -> ComparisonResult:
+        """Mark a result as failed so it never counts as similar."""
+        result.metadata["error"] = error
+        result.ssim_score = 0.0
+        result.difference_score = 1.0
+        result.difference_pixels = 100.0
+        result.histogram_diff = 1.0
+        return result
+
+
+def _compare_pairs(options: Dict[str, Any], pairs: List[Tuple[str, str]]) -> List[ComparisonResult]:
+    """Compare a chunk of image pairs in a worker process."""
+    tool = ComparisonTool(**options)
+    return [tool.compare(file_a, file_b) for file_a, file_b in pairs]
+
 
 # =============================================================================
 # EXPORTS
@@ -277,4 +886,12 @@ __all__ = [
     "ComparisonResult",
     # Classes
     "ComparisonTool",
+    "ImageCache",
+    # Functions
+    "decode_image",
+    "difference_map",
+    "ssim",
+    "ssim_map",
+    "histogram_distances",
+    "find_regions",
 ]
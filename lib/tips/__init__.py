@@ -79,8 +79,8 @@ else:
 # RENDER PRESETS
 # =============================================================================
 
+# Render presets for different scenarios
 RENDER_PRESETS: Dict[str, Dict[str, Any]] = {
-    """Render presets for different scenarios."""
     "preview": {
         "resolution_percentage": 25,
         "samples": 64,
@@ -102,7 +102,7 @@ RENDER_PRESETS: Dict[str, Dict[str, Any]] = {
 }
 
 
-def apply_render_preset(preset_name: str) None:
+def apply_render_preset(preset_name: str) -> Optional[Any]:
     """
     Apply a render preset to the current scene.
 
@@ -134,8 +134,8 @@ def apply_render_preset(preset_name: str) None:
 # MATERIAL PRESETS
 # =============================================================================
 
+# Material presets for common surface types
 MATERIAL_PRESETS: Dict[str, Dict[str, Any]] = {
-    """Material presets for common surface types."""
     "metal_shiny": {
         "metallic": 0.9,
         "roughness": 0.1,
@@ -170,7 +170,7 @@ MATERIAL_PRESETS: Dict[str, Dict[str, Any]] = {
 }
 
 
-def apply_material_preset(material: Any, preset_name: str) None:
+def apply_material_preset(material: Any, preset_name: str) -> Optional[Any]:
     """
     Apply a material preset to a material.
 
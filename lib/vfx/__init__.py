@@ -11,6 +11,8 @@ Modules:
 - layer_compositor: Layer management and compositing
 - blend_modes: Blend mode implementations
 - color_correction: Color correction functions
+- array_ops: Vectorized blend modes and color correction (NumPy)
+- array_compositor: Tile-based NumPy compositing engine
 - cryptomatte: Cryptomatte matte extraction
 - compositor_blender: Blender integration
 """
@@ -108,6 +110,21 @@ from .color_correction import (
     apply_preset,
 )
 
+from .array_ops import (
+    ARRAY_BLEND_MODES,
+    ARRAY_BLEND_MODES_RGB,
+    get_array_blend_function,
+    blend_arrays,
+)
+
+from .array_compositor import (
+    ArrayCompositor,
+    LayerCacheEntry,
+    resolve_frame_path,
+    load_image,
+    save_image,
+)
+
 from .cryptomatte import (
     # Dataclasses
     CryptomatteManifestEntry,
@@ -213,6 +230,16 @@ __all__ = [
     "COLOR_PRESETS",
     "get_color_preset",
     "apply_preset",
+    # Array Compositing
+    "ARRAY_BLEND_MODES",
+    "ARRAY_BLEND_MODES_RGB",
+    "get_array_blend_function",
+    "blend_arrays",
+    "ArrayCompositor",
+    "LayerCacheEntry",
+    "resolve_frame_path",
+    "load_image",
+    "save_image",
     # Cryptomatte
     "CryptomatteManifestEntry",
     "CryptomatteManifest",
@@ -0,0 +1,627 @@
+"""
+Array Compositor
+
+NumPy compositing engine behind LayerCompositor.render_frame.
+
+Layers are evaluated on float32 RGBA buffers:
+
+1. Load the layer source (solid, gradient or image file)
+2. Apply the 2D transform (bilinear resampling)
+3. Apply color correction (array_ops)
+4. Apply mask and opacity
+5. Blend onto the stack with the layer's blend mode
+
+The frame is processed in horizontal tiles of tile_rows rows, so
+intermediate buffers stay tile-sized. Evaluated layers can be kept in a
+cache keyed on the layer settings plus the source file's mtime, so
+unchanged layers (solids, gradients, held plates) are not recomputed on
+the next frame.
+
+Part of Phase 12.1: Compositor (REQ-COMP-01)
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import hashlib
+import json
+import math
+import os
+import re
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+from .compositor_types import (
+    BlendMode,
+    CompLayer,
+    CompositeConfig,
+    LayerSource,
+    OutputFormat,
+)
+from . import array_ops
+
+# Default tile height in rows
+DEFAULT_TILE_ROWS = 256
+
+# Output formats that can be written without Blender
+IMAGE_EXTENSIONS = {
+    OutputFormat.PNG: ".png",
+    OutputFormat.JPEG: ".jpg",
+    OutputFormat.TIFF: ".tif",
+}
+
+# Source types read from files (source is a path or sequence pattern)
+FILE_SOURCES = (LayerSource.IMAGE_SEQUENCE, LayerSource.RENDER_PASS)
+
+# Loader for custom sources: (layer, source_frame) -> (H, W, 4) float32 RGBA
+SourceLoader = Callable[[CompLayer, int], Any]
+
+_HASH_RUN = re.compile(r"#+")
+_PRINTF_FRAME = re.compile(r"%0?(\d*)d")
+
+
+def resolve_frame_path(pattern: str, frame: int) -> str:
+    """
+    Resolve a frame number into a sequence path.
+
+    Supports "####" padding, printf "%04d" and "{frame}" / "{frame:04d}".
+
+    Args:
+        pattern: Path or sequence pattern
+        frame: Frame number
+
+    Returns:
+        Path for the frame (pattern unchanged if it has no frame field)
+    """
+    if "{frame" in pattern:
+        return pattern.format(frame=frame)
+    if _HASH_RUN.search(pattern):
+        return _HASH_RUN.sub(lambda m: str(frame).zfill(len(m.group(0))), pattern)
+    if _PRINTF_FRAME.search(pattern):
+        return _PRINTF_FRAME.sub(lambda m: str(frame).zfill(int(m.group(1) or 0)), pattern)
+    return pattern
+
+
+def has_frame_field(pattern: str) -> bool:
+    """Whether a path pattern contains a frame number field."""
+    return resolve_frame_path(pattern, 0) != resolve_frame_path(pattern, 1)
+
+
+def load_image(path: str) -> "np.ndarray":
+    """
+    Load an image as float32 straight RGBA, row 0 at the top.
+
+    Args:
+        path: .npy array or any image PIL can read
+
+    Returns:
+        (H, W, 4) float32 array in 0-1 (HDR values kept for .npy)
+    """
+    if path.lower().endswith(".npy"):
+        data = np.load(path).astype(np.float32)
+        if data.ndim == 2:
+            data = data[:, :, None]
+        channels = data.shape[2]
+        if channels == 4:
+            return data
+        rgba = np.ones(data.shape[:2] + (4,), dtype=np.float32)
+        rgba[:, :, :3] = data[:, :, :1] if channels == 1 else data[:, :, :3]
+        if channels == 2:
+            rgba[:, :, 3] = data[:, :, 1]
+        return rgba
+
+    if not HAS_PIL:
+        raise ImportError(f"PIL is required to read {path}")
+
+    with Image.open(path) as image:
+        if image.mode in ("I;16", "I;16B", "I;16L", "I"):
+            gray = np.asarray(image, dtype=np.float32) / 65535.0
+            rgba = np.ones(gray.shape + (4,), dtype=np.float32)
+            rgba[:, :, :3] = gray[:, :, None]
+            return rgba
+        return np.asarray(image.convert("RGBA"), dtype=np.float32) / 255.0
+
+
+def save_image(
+    path: str,
+    image: "np.ndarray",
+    output_format: OutputFormat = OutputFormat.PNG,
+    quality: int = 90,
+) -> str:
+    """
+    Save a float RGBA image as 8-bit PNG, JPEG or TIFF.
+
+    Args:
+        path: Output path
+        image: (H, W, 4) float array in 0-1
+        output_format: Output format
+        quality: JPEG quality
+
+    Returns:
+        Path written
+    """
+    if output_format not in IMAGE_EXTENSIONS:
+        raise ValueError(
+            f"Output format '{output_format.value}' requires the Blender compositor"
+        )
+    if not HAS_PIL:
+        raise ImportError("PIL is required to write composite images")
+
+    pixels = np.round(np.clip(image, 0.0, 1.0) * 255).astype(np.uint8)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    if output_format == OutputFormat.JPEG:
+        Image.fromarray(pixels[:, :, :3], "RGB").save(path, quality=quality)
+    else:
+        Image.fromarray(pixels, "RGBA").save(path)
+    return path
+
+
+# ==================== Source Generation ====================
+
+def solid_image(color: Tuple[float, float, float, float], width: int, height: int) -> "np.ndarray":
+    """Read-only (H, W, 4) view of a solid color (no per-pixel storage)."""
+    rgba = np.asarray(color, dtype=np.float32)
+    return np.broadcast_to(rgba, (height, width, 4))
+
+
+def gradient_image(layer: CompLayer, width: int, height: int) -> "np.ndarray":
+    """
+    Render a linear gradient layer.
+
+    The gradient runs across the frame along gradient_angle (degrees,
+    0 = left to right, 90 = bottom to top).
+
+    Args:
+        layer: Gradient layer
+        width: Frame width
+        height: Frame height
+
+    Returns:
+        (H, W, 4) float32 RGBA
+    """
+    stops = sorted(layer.gradient_stops, key=lambda s: s.position)
+    if not stops:
+        return solid_image((0.0, 0.0, 0.0, 0.0), width, height)
+
+    angle = math.radians(layer.gradient_angle)
+    dx, dy = math.cos(angle), math.sin(angle)
+    xs = (np.arange(width, dtype=np.float32) + 0.5) / width - 0.5
+    ys = 0.5 - (np.arange(height, dtype=np.float32) + 0.5) / height
+
+    # Project onto the gradient direction and normalize to 0-1 over the frame
+    extent = (abs(dx) + abs(dy)) / 2
+    t = (xs[None, :] * dx + ys[:, None] * dy) / (2 * extent) + 0.5
+
+    positions = np.array([s.position for s in stops], dtype=np.float32)
+    colors = np.array([s.color for s in stops], dtype=np.float32)
+    image = np.empty((height, width, 4), dtype=np.float32)
+    for channel in range(4):
+        image[:, :, channel] = np.interp(t, positions, colors[:, channel])
+    return image
+
+
+# ==================== Masks ====================
+
+def _box_blur(mask: "np.ndarray", radius: int, axis: int) -> "np.ndarray":
+    """Box blur along one axis with edge clamping."""
+    pad = [(0, 0), (0, 0)]
+    pad[axis] = (radius + 1, radius)
+    padded = np.pad(mask, pad, mode="edge")
+    summed = np.cumsum(padded, axis=axis, dtype=np.float64)
+    size = mask.shape[axis]
+    upper = np.take(summed, np.arange(2 * radius + 1, 2 * radius + 1 + size), axis=axis)
+    lower = np.take(summed, np.arange(0, size), axis=axis)
+    return ((upper - lower) / (2 * radius + 1)).astype(np.float32)
+
+
+def feather_mask(mask: "np.ndarray", feather: float) -> "np.ndarray":
+    """Soften a mask (three box blurs approximate a Gaussian of sigma ~ feather / 2)."""
+    radius = int(round(feather / 2))
+    if radius < 1:
+        return mask
+    for _ in range(3):
+        mask = _box_blur(_box_blur(mask, radius, 0), radius, 1)
+    return mask
+
+
+def expand_mask(mask: "np.ndarray", expansion: float) -> "np.ndarray":
+    """Grow (positive) or shrink (negative) a mask by whole pixels."""
+    radius = int(round(abs(expansion)))
+    if radius < 1:
+        return mask
+    reduce = np.maximum if expansion > 0 else np.minimum
+    for axis in (0, 1):
+        pad = [(0, 0), (0, 0)]
+        pad[axis] = (radius, radius)
+        padded = np.pad(mask, pad, mode="edge")
+        size = mask.shape[axis]
+        result = np.take(padded, np.arange(0, size), axis=axis)
+        for shift in range(1, 2 * radius + 1):
+            result = reduce(result, np.take(padded, np.arange(shift, shift + size), axis=axis))
+        mask = result
+    return mask
+
+
+def _fit_to_frame(mask: "np.ndarray", width: int, height: int) -> "np.ndarray":
+    """Nearest-neighbour resize of a mask to the frame size."""
+    if mask.shape == (height, width):
+        return mask
+    rows = np.minimum((np.arange(height) + 0.5) * mask.shape[0] / height, mask.shape[0] - 1).astype(np.intp)
+    cols = np.minimum((np.arange(width) + 0.5) * mask.shape[1] / width, mask.shape[1] - 1).astype(np.intp)
+    return mask[rows[:, None], cols[None, :]]
+
+
+# ==================== Engine ====================
+
+@dataclass
+class LayerCacheEntry:
+    """Evaluated layer pixels and the key they were computed for."""
+    key: str
+    pixels: "np.ndarray"  # (H, W, 4) straight RGB + coverage
+
+
+class _Transform:
+    """Inverse 2D transform from frame pixels to source pixels."""
+
+    def __init__(self, layer: CompLayer, source_shape: Tuple[int, int], frame_shape: Tuple[int, int]):
+        transform = layer.transform
+        src_h, src_w = source_shape
+        height, width = frame_shape
+
+        self.source_shape = source_shape
+        self.identity = (
+            tuple(transform.position) == (0.0, 0.0)
+            and transform.rotation == 0.0
+            and tuple(transform.scale) == (1.0, 1.0)
+            and source_shape == frame_shape
+        )
+        self.visible = transform.scale[0] != 0 and transform.scale[1] != 0
+
+        # Work in y-up coordinates: position +y moves up, rotation is
+        # counter-clockwise in radians, anchor (0, 0) is bottom-left
+        ax, ay = transform.anchor
+        self.pivot_src = (ax * src_w, ay * src_h)
+        self.pivot_frame = (
+            width / 2 + (self.pivot_src[0] - src_w / 2) + transform.position[0],
+            height / 2 + (self.pivot_src[1] - src_h / 2) + transform.position[1],
+        )
+        self.cos = math.cos(-transform.rotation)
+        self.sin = math.sin(-transform.rotation)
+        if self.visible:
+            self.inv_scale = (1.0 / transform.scale[0], 1.0 / transform.scale[1])
+        self.height = height
+        self.width = width
+
+    def source_coords(self, y0: int, y1: int) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Source (row, col) coordinates for frame rows y0..y1, pixel-centered."""
+        xs = np.arange(self.width, dtype=np.float32) + 0.5
+        ys = self.height - (np.arange(y0, y1, dtype=np.float32) + 0.5)
+        px = xs[None, :] - self.pivot_frame[0]
+        py = ys[:, None] - self.pivot_frame[1]
+
+        qx = (self.cos * px - self.sin * py) * self.inv_scale[0] + self.pivot_src[0]
+        qy = (self.sin * px + self.cos * py) * self.inv_scale[1] + self.pivot_src[1]
+        rows = self.source_shape[0] - qy - 0.5
+        cols = qx - 0.5
+        return rows, cols
+
+
+def _bilinear(padded: "np.ndarray", rows: "np.ndarray", cols: "np.ndarray") -> "np.ndarray":
+    """
+    Sample premultiplied RGBA padded by _premultiply.
+
+    Coordinates are clamped onto the transparent border, so everything
+    outside the source samples as transparent without per-tap masking.
+    """
+    height, width = padded.shape[0] - 3, padded.shape[1] - 3
+    rows = np.clip(rows, -1.0, height, dtype=np.float32)
+    cols = np.clip(cols, -1.0, width, dtype=np.float32)
+    r0 = np.floor(rows)
+    c0 = np.floor(cols)
+    wr = (rows - r0)[..., None]
+    wc = (cols - c0)[..., None]
+
+    # Flat indices into the padded image (the +1 border offset included)
+    stride = width + 3
+    top = (r0.astype(np.intp) + 1) * stride + (c0.astype(np.intp) + 1)
+    flat = padded.reshape(-1, 4)
+
+    upper = flat[top]
+    upper += (flat[top + 1] - upper) * wc
+    lower = flat[top + stride]
+    lower += (flat[top + stride + 1] - lower) * wc
+    upper += (lower - upper) * wr
+    return upper
+
+
+def _premultiply(image: "np.ndarray") -> "np.ndarray":
+    """Premultiplied copy with a transparent border for _bilinear."""
+    height, width = image.shape[:2]
+    padded = np.zeros((height + 3, width + 3, 4), dtype=np.float32)
+    inner = padded[1:height + 1, 1:width + 1]
+    inner[...] = image
+    inner[..., :3] *= inner[..., 3:4]
+    return padded
+
+
+def _unpremultiply(rgba: "np.ndarray") -> "np.ndarray":
+    # Premultiplied color is already zero wherever alpha is
+    alpha = rgba[..., 3:4]
+    np.divide(rgba[..., :3], alpha, out=rgba[..., :3], where=alpha > 0)
+    return rgba
+
+
+class _LayerJob:
+    """Per-frame state for evaluating one layer tile by tile."""
+
+    def __init__(self, layer: CompLayer, source: "np.ndarray", frame_shape: Tuple[int, int]):
+        self.layer = layer
+        self.source = source
+        self.transform = _Transform(layer, source.shape[:2], frame_shape)
+        self.premultiplied: Optional["np.ndarray"] = None
+        self.mask: Optional["np.ndarray"] = None
+        self.self_mask = False
+
+    def sample(self, y0: int, y1: int) -> "np.ndarray":
+        """Transformed straight RGBA for frame rows y0..y1."""
+        if self.transform.identity:
+            return np.array(self.source[y0:y1], dtype=np.float32)
+        if not self.transform.visible:
+            return np.zeros((y1 - y0, self.transform.width, 4), dtype=np.float32)
+        if self.premultiplied is None:
+            self.premultiplied = _premultiply(self.source)
+        rows, cols = self.transform.source_coords(y0, y1)
+        return _unpremultiply(_bilinear(self.premultiplied, rows, cols))
+
+    def evaluate(self, y0: int, y1: int) -> "np.ndarray":
+        """Color-corrected RGB plus final coverage for rows y0..y1."""
+        rgba = self.sample(y0, y1)
+        rgba[..., :3] = array_ops.apply_color_correction(rgba[..., :3], self.layer.color_correction)
+
+        coverage = rgba[..., 3]
+        if self.mask is not None:
+            mask = self.mask[y0:y1]
+            coverage = mask if self.self_mask else coverage * mask
+        rgba[..., 3] = np.clip(coverage * self.layer.opacity, 0.0, 1.0)
+        return rgba
+
+
+class ArrayCompositor:
+    """
+    Tile-based NumPy compositor for a CompositeConfig.
+
+    Example:
+        engine = ArrayCompositor(config)
+        image = engine.composite(frame=1)  # (H, W, 4) float32
+    """
+
+    def __init__(
+        self,
+        config: CompositeConfig,
+        tile_rows: int = DEFAULT_TILE_ROWS,
+        source_loaders: Optional[Dict[LayerSource, SourceLoader]] = None,
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            config: Composite configuration
+            tile_rows: Rows processed per tile
+            source_loaders: Loaders for source types without a built-in
+                loader (render passes from Blender, video, procedural)
+        """
+        if not HAS_NUMPY:
+            raise ImportError("NumPy is required for array compositing")
+        self.config = config
+        self.tile_rows = max(1, tile_rows)
+        self.source_loaders = dict(source_loaders or {})
+
+    @property
+    def frame_shape(self) -> Tuple[int, int]:
+        """(height, width) of the output frame."""
+        width, height = self.config.resolution
+        return int(height), int(width)
+
+    def composite(
+        self,
+        frame: int,
+        layer_cache: Optional[Dict[str, Any]] = None,
+    ) -> "np.ndarray":
+        """
+        Composite all enabled layers for a frame.
+
+        Args:
+            frame: Frame number
+            layer_cache: Dict of LayerCacheEntry by layer name; evaluated
+                layers are stored here and reused while their key matches
+                (None to evaluate tile by tile without keeping layers)
+
+        Returns:
+            (H, W, 4) float32 RGBA (premultiplied if config.premultiplied_alpha)
+        """
+        height, width = self.frame_shape
+        layers = [layer for layer in self.config.get_enabled_layers() if self._is_active(layer, frame)]
+
+        # Resolve each layer to cached pixels or a tile job
+        plans: List[Tuple[CompLayer, Optional["np.ndarray"], Optional[_LayerJob], Optional["np.ndarray"]]] = []
+        computed: Dict[str, LayerCacheEntry] = {}
+        for layer in layers:
+            key = self.layer_key(layer, frame)
+            entry = layer_cache.get(layer.name) if layer_cache is not None else None
+            if isinstance(entry, LayerCacheEntry) and entry.key == key and entry.pixels.shape[:2] == (height, width):
+                plans.append((layer, entry.pixels, None, None))
+                continue
+
+            job = self._layer_job(layer, frame)
+            store = None
+            if layer_cache is not None:
+                store = np.empty((height, width, 4), dtype=np.float32)
+                computed[layer.name] = LayerCacheEntry(key, store)
+            plans.append((layer, None, job, store))
+
+        output = np.empty((height, width, 4), dtype=np.float32)
+        # Premultiplied background, blended into per-tile accumulators
+        background = np.asarray(self.config.background_color, dtype=np.float32)
+        background_rgb = background[:3] * background[3]
+        acc_rgb_buffer = np.empty((self.tile_rows, width, 3), dtype=np.float32)
+        acc_alpha_buffer = np.empty((self.tile_rows, width, 1), dtype=np.float32)
+
+        for y0 in range(0, height, self.tile_rows):
+            y1 = min(y0 + self.tile_rows, height)
+            acc_rgb = acc_rgb_buffer[:y1 - y0]
+            acc_alpha = acc_alpha_buffer[:y1 - y0]
+            acc_rgb[...] = background_rgb
+            acc_alpha[...] = background[3]
+
+            for layer, cached, job, store in plans:
+                if cached is not None:
+                    pixels = cached[y0:y1]
+                else:
+                    pixels = job.evaluate(y0, y1)
+                    if store is not None:
+                        store[y0:y1] = pixels
+                self._blend_tile(acc_rgb, acc_alpha, pixels, layer.blend_mode)
+
+            tile = output[y0:y1]
+            tile[..., :3] = acc_rgb
+            tile[..., 3:4] = acc_alpha
+            if not self.config.premultiplied_alpha:
+                _unpremultiply(tile)
+
+        # Only fully evaluated layers enter the cache
+        if layer_cache is not None:
+            layer_cache.update(computed)
+        return output
+
+    def layer_key(self, layer: CompLayer, frame: int) -> str:
+        """
+        Cache key for a layer's evaluated pixels on a frame.
+
+        Combines the layer settings, output resolution and, for file
+        sources and masks, the resolved path with its mtime and size.
+
+        Args:
+            layer: Layer
+            frame: Frame number
+
+        Returns:
+            Hex digest
+        """
+        parts: Dict[str, Any] = {
+            "layer": layer.to_dict(),
+            "resolution": list(self.frame_shape),
+        }
+        source_frame = frame + layer.frame_offset
+        if layer.source_type in FILE_SOURCES:
+            parts["source"] = _file_stamp(resolve_frame_path(layer.source, source_frame))
+        elif layer.source_type not in (LayerSource.SOLID, LayerSource.GRADIENT):
+            parts["frame"] = source_frame
+        if layer.mask and layer.mask.source != "alpha":
+            parts["mask"] = _file_stamp(resolve_frame_path(layer.mask.source, source_frame))
+
+        encoded = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _is_active(self, layer: CompLayer, frame: int) -> bool:
+        if layer.start_frame is not None and frame < layer.start_frame:
+            return False
+        if layer.end_frame is not None and frame > layer.end_frame:
+            return False
+        return True
+
+    def _load_source(self, layer: CompLayer, frame: int) -> "np.ndarray":
+        """Load a layer's source as (H, W, 4) straight RGBA."""
+        height, width = self.frame_shape
+        source_frame = frame + layer.frame_offset
+
+        if layer.source_type in self.source_loaders:
+            return np.asarray(self.source_loaders[layer.source_type](layer, source_frame), dtype=np.float32)
+        if layer.source_type == LayerSource.SOLID:
+            return solid_image(layer.solid_color, width, height)
+        if layer.source_type == LayerSource.GRADIENT:
+            return gradient_image(layer, width, height)
+        if layer.source_type in FILE_SOURCES:
+            path = resolve_frame_path(layer.source, source_frame)
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Layer '{layer.name}' source not found: {path}")
+            return load_image(path)
+        raise ValueError(
+            f"No loader for layer '{layer.name}' source type '{layer.source_type.value}'"
+        )
+
+    def _layer_job(self, layer: CompLayer, frame: int) -> _LayerJob:
+        job = _LayerJob(layer, self._load_source(layer, frame), self.frame_shape)
+        if layer.mask:
+            job.mask, job.self_mask = self._build_mask(job, frame)
+        return job
+
+    def _build_mask(self, job: _LayerJob, frame: int) -> Tuple["np.ndarray", bool]:
+        """Full-frame mask for a layer (masks need neighbours to feather)."""
+        height, width = self.frame_shape
+        mask_config = job.layer.mask
+
+        if mask_config.source == "alpha":
+            mask = np.empty((height, width), dtype=np.float32)
+            for y0 in range(0, height, self.tile_rows):
+                y1 = min(y0 + self.tile_rows, height)
+                mask[y0:y1] = job.sample(y0, y1)[..., 3]
+            self_mask = True
+        else:
+            path = resolve_frame_path(mask_config.source, frame + job.layer.frame_offset)
+            image = load_image(path)
+            mask = _fit_to_frame(array_ops.luminance_of(image[..., :3]) * image[..., 3], width, height)
+            self_mask = False
+
+        mask = expand_mask(mask, mask_config.expansion)
+        mask = feather_mask(mask, mask_config.feather)
+        mask = np.clip(mask, 0.0, 1.0)
+        if mask_config.invert:
+            mask = 1.0 - mask
+        return mask, self_mask
+
+    def _blend_tile(
+        self,
+        acc_rgb: "np.ndarray",
+        acc_alpha: "np.ndarray",
+        pixels: "np.ndarray",
+        mode: BlendMode,
+    ) -> None:
+        """Blend one layer tile onto the premultiplied accumulator in place."""
+        alpha = pixels[..., 3:4]
+        color = pixels[..., :3]
+
+        if mode == BlendMode.NORMAL:
+            mixed = color - acc_rgb
+        else:
+            base = np.divide(acc_rgb, acc_alpha, out=np.zeros_like(acc_rgb), where=acc_alpha > 0)
+            blended = array_ops.blend_arrays(mode, base, color)
+            # Where the base is transparent the layer shows unblended
+            mixed = (1 - acc_alpha) * color + acc_alpha * blended
+            mixed -= acc_rgb
+
+        # acc = alpha * mixed + (1 - alpha) * acc, without temporaries
+        mixed *= alpha
+        acc_rgb += mixed
+        covered = 1 - acc_alpha
+        covered *= alpha
+        acc_alpha += covered
+
+
+def _file_stamp(path: str) -> List[Any]:
+    """Path with mtime and size (so edited sources change the cache key)."""
+    try:
+        stat = os.stat(path)
+        return [path, stat.st_mtime_ns, stat.st_size]
+    except OSError:
+        return [path, None, None]
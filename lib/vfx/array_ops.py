@@ -0,0 +1,572 @@
+"""
+Array Operations
+
+Vectorized blend modes and color correction over float32 image arrays.
+
+Each function mirrors its scalar counterpart in blend_modes.py or
+color_correction.py (same name, same formula), but takes NumPy arrays
+of shape (..., C) or (...,) so a whole frame or tile is processed in a
+few array operations instead of one call per channel value.
+
+Part of Phase 12.1: Compositor (REQ-COMP-02, REQ-COMP-03)
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from .compositor_types import BlendMode, ColorCorrection
+
+# Type alias for opacity (scalar or per-pixel array broadcastable to the image)
+Opacity = Union[float, Any]
+
+# Rec. 709 luminance weights (matches color_correction.apply_saturation)
+LUMA_WEIGHTS = (0.2126, 0.7152, 0.0722)
+
+
+def _f32(value: Any) -> "np.ndarray":
+    return np.asarray(value, dtype=np.float32)
+
+
+def _clamp(value: "np.ndarray", min_val: float = 0.0, max_val: float = 1.0) -> "np.ndarray":
+    """Clamp array values to a range."""
+    return np.clip(value, min_val, max_val)
+
+
+def _apply_opacity(base: "np.ndarray", over: "np.ndarray", opacity: Opacity) -> "np.ndarray":
+    """Apply opacity blending."""
+    return base * (1 - opacity) + over * opacity
+
+
+# ==================== Basic Blend Modes ====================
+
+def blend_normal(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Normal blend mode (alpha blending)."""
+    return _apply_opacity(_f32(base), _f32(over), opacity)
+
+
+def blend_multiply(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Multiply blend mode."""
+    base, over = _f32(base), _f32(over)
+    return _apply_opacity(base, base * over, opacity)
+
+
+def blend_screen(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Screen blend mode."""
+    base, over = _f32(base), _f32(over)
+    return _apply_opacity(base, 1 - (1 - base) * (1 - over), opacity)
+
+
+def blend_add(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Additive blend (Linear Dodge)."""
+    base, over = _f32(base), _f32(over)
+    return _apply_opacity(base, _clamp(base + over), opacity)
+
+
+def blend_subtract(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Subtract blend mode."""
+    base, over = _f32(base), _f32(over)
+    return _apply_opacity(base, _clamp(base - over), opacity)
+
+
+def blend_difference(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Difference blend mode."""
+    base, over = _f32(base), _f32(over)
+    return _apply_opacity(base, np.abs(base - over), opacity)
+
+
+# ==================== Contrast Blend Modes ====================
+
+def blend_overlay(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Overlay blend mode."""
+    base, over = _f32(base), _f32(over)
+    result = np.where(
+        base < 0.5,
+        2 * base * over,
+        1 - 2 * (1 - base) * (1 - over),
+    )
+    return _apply_opacity(base, result, opacity)
+
+
+def blend_soft_light(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Soft light blend mode."""
+    base, over = _f32(base), _f32(over)
+    d = _clamp(2 * over - 1)
+    light = np.where(
+        base < 0.25,
+        base + d * ((16 * base - 12) * base + 3) * base,
+        base + d * (np.sqrt(np.maximum(base, 0)) - base),
+    )
+    result = np.where(over < 0.5, base - (1 - 2 * over) * base * (1 - base), light)
+    return _apply_opacity(base, result, opacity)
+
+
+def blend_hard_light(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Hard light blend mode (overlay with swapped operands)."""
+    return blend_overlay(over, base, opacity)
+
+
+# ==================== Dodge/Burn Blend Modes ====================
+
+def blend_color_dodge(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Color dodge blend mode."""
+    base, over = _f32(base), _f32(over)
+    dodge = np.divide(base, 1 - over, out=np.ones_like(base * over), where=over < 1.0)
+    result = np.where(over >= 1.0, 1.0, _clamp(dodge))
+    return _apply_opacity(base, result, opacity)
+
+
+def blend_color_burn(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Color burn blend mode."""
+    base, over = _f32(base), _f32(over)
+    burn = np.divide(1 - base, over, out=np.ones_like(base * over), where=over > 0.0)
+    result = np.where(over <= 0.0, 0.0, _clamp(1 - burn))
+    return _apply_opacity(base, result, opacity)
+
+
+def blend_linear_dodge(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Linear dodge (same as Add)."""
+    return blend_add(base, over, opacity)
+
+
+def blend_linear_burn(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Linear burn blend mode."""
+    base, over = _f32(base), _f32(over)
+    return _apply_opacity(base, _clamp(base + over - 1), opacity)
+
+
+# ==================== Comparative Blend Modes ====================
+
+def blend_darken(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Darken (Min) blend mode."""
+    base, over = _f32(base), _f32(over)
+    return _apply_opacity(base, np.minimum(base, over), opacity)
+
+
+def blend_lighten(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Lighten (Max) blend mode."""
+    base, over = _f32(base), _f32(over)
+    return _apply_opacity(base, np.maximum(base, over), opacity)
+
+
+def blend_exclusion(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Exclusion blend mode."""
+    base, over = _f32(base), _f32(over)
+    return _apply_opacity(base, base + over - 2 * base * over, opacity)
+
+
+def blend_pin_light(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Pin light blend mode."""
+    base, over = _f32(base), _f32(over)
+    result = np.where(
+        over < 0.5,
+        np.minimum(base, 2 * over),
+        np.maximum(base, 2 * (over - 0.5)),
+    )
+    return _apply_opacity(base, result, opacity)
+
+
+def blend_hard_mix(base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Hard mix blend mode."""
+    base, over = _f32(base), _f32(over)
+    result = (base + over >= 1).astype(np.float32)
+    return _apply_opacity(base, result, opacity)
+
+
+# ==================== Color Space Helpers ====================
+
+def rgb_to_hsl(rgb: Any) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Convert RGB (..., 3) in 0-1 to H, S, L arrays in 0-1."""
+    rgb = _f32(rgb)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    max_c = np.maximum(np.maximum(r, g), b)
+    min_c = np.minimum(np.minimum(r, g), b)
+    light = (max_c + min_c) / 2
+
+    d = max_c - min_c
+    chromatic = d != 0
+    safe_d = np.where(chromatic, d, 1)
+    s_high = np.divide(d, 2 - max_c - min_c, out=np.zeros_like(d), where=chromatic)
+    s_low = np.divide(d, max_c + min_c, out=np.zeros_like(d), where=chromatic)
+    s = np.where(light > 0.5, s_high, s_low)
+
+    h = np.select(
+        [max_c == r, max_c == g],
+        [(g - b) / safe_d + np.where(g < b, 6, 0), (b - r) / safe_d + 2],
+        (r - g) / safe_d + 4,
+    ) / 6
+    h = np.where(chromatic, h, 0)
+    s = np.where(chromatic, s, 0)
+    return h.astype(np.float32), s.astype(np.float32), light
+
+
+def _hue_to_rgb(p: "np.ndarray", q: "np.ndarray", t: "np.ndarray") -> "np.ndarray":
+    t = np.where(t < 0, t + 1, t)
+    t = np.where(t > 1, t - 1, t)
+    return np.select(
+        [t < 1 / 6, t < 1 / 2, t < 2 / 3],
+        [p + (q - p) * 6 * t, q, p + (q - p) * (2 / 3 - t) * 6],
+        p,
+    )
+
+
+def hsl_to_rgb(h: Any, s: Any, light: Any) -> "np.ndarray":
+    """Convert H, S, L arrays in 0-1 to RGB (..., 3)."""
+    h, s, light = _f32(h), _f32(s), _f32(light)
+    q = np.where(light < 0.5, light * (1 + s), light + s - light * s)
+    p = 2 * light - q
+
+    rgb = np.stack([
+        _hue_to_rgb(p, q, h + 1 / 3),
+        _hue_to_rgb(p, q, h),
+        _hue_to_rgb(p, q, h - 1 / 3),
+    ], axis=-1)
+    gray = (s == 0)[..., None]
+    return np.where(gray, light[..., None], rgb).astype(np.float32)
+
+
+# ==================== Component Blend Modes ====================
+
+def blend_hue(base_rgb: Any, over_rgb: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Hue blend mode (hue from over, saturation/luminosity from base)."""
+    base_rgb = _f32(base_rgb)
+    _, base_s, base_l = rgb_to_hsl(base_rgb)
+    over_h, _, _ = rgb_to_hsl(over_rgb)
+    return _apply_opacity(base_rgb, hsl_to_rgb(over_h, base_s, base_l), opacity)
+
+
+def blend_saturation(base_rgb: Any, over_rgb: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Saturation blend mode (saturation from over)."""
+    base_rgb = _f32(base_rgb)
+    base_h, _, base_l = rgb_to_hsl(base_rgb)
+    _, over_s, _ = rgb_to_hsl(over_rgb)
+    return _apply_opacity(base_rgb, hsl_to_rgb(base_h, over_s, base_l), opacity)
+
+
+def blend_color(base_rgb: Any, over_rgb: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Color blend mode (hue and saturation from over)."""
+    base_rgb = _f32(base_rgb)
+    _, _, base_l = rgb_to_hsl(base_rgb)
+    over_h, over_s, _ = rgb_to_hsl(over_rgb)
+    return _apply_opacity(base_rgb, hsl_to_rgb(over_h, over_s, base_l), opacity)
+
+
+def blend_luminosity(base_rgb: Any, over_rgb: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """Luminosity blend mode (luminosity from over)."""
+    base_rgb = _f32(base_rgb)
+    base_h, base_s, _ = rgb_to_hsl(base_rgb)
+    _, _, over_l = rgb_to_hsl(over_rgb)
+    return _apply_opacity(base_rgb, hsl_to_rgb(base_h, base_s, over_l), opacity)
+
+
+# ==================== Blend Mode Registry ====================
+
+ARRAY_BLEND_MODES: Dict[str, Callable] = {
+    BlendMode.NORMAL.value: blend_normal,
+    BlendMode.MULTIPLY.value: blend_multiply,
+    BlendMode.SCREEN.value: blend_screen,
+    BlendMode.ADD.value: blend_add,
+    BlendMode.DIFFERENCE.value: blend_difference,
+    BlendMode.OVERLAY.value: blend_overlay,
+    BlendMode.SOFT_LIGHT.value: blend_soft_light,
+    BlendMode.HARD_LIGHT.value: blend_hard_light,
+    BlendMode.COLOR_DODGE.value: blend_color_dodge,
+    BlendMode.COLOR_BURN.value: blend_color_burn,
+    BlendMode.LINEAR_DODGE.value: blend_linear_dodge,
+    BlendMode.LINEAR_BURN.value: blend_linear_burn,
+    BlendMode.DARKEN.value: blend_darken,
+    BlendMode.LIGHTEN.value: blend_lighten,
+}
+
+# RGB blend modes (operate on the whole color, not per channel)
+ARRAY_BLEND_MODES_RGB: Dict[str, Callable] = {
+    BlendMode.HUE.value: blend_hue,
+    BlendMode.SATURATION.value: blend_saturation,
+    BlendMode.COLOR.value: blend_color,
+    BlendMode.LUMINOSITY.value: blend_luminosity,
+}
+
+
+def get_array_blend_function(mode: BlendMode) -> Callable:
+    """Get the array blend function for a mode (defaults to normal)."""
+    mode_str = mode.value if isinstance(mode, BlendMode) else mode
+    if mode_str in ARRAY_BLEND_MODES:
+        return ARRAY_BLEND_MODES[mode_str]
+    if mode_str in ARRAY_BLEND_MODES_RGB:
+        return ARRAY_BLEND_MODES_RGB[mode_str]
+    return blend_normal
+
+
+def blend_arrays(mode: BlendMode, base: Any, over: Any, opacity: Opacity = 1.0) -> "np.ndarray":
+    """
+    Blend two RGB arrays.
+
+    Args:
+        mode: Blend mode
+        base: Base RGB array (..., 3)
+        over: Over RGB array (..., 3)
+        opacity: Scalar or per-pixel opacity broadcastable to (..., 1)
+
+    Returns:
+        Blended RGB array (float32)
+    """
+    return get_array_blend_function(mode)(base, over, opacity).astype(np.float32, copy=False)
+
+
+# ==================== Basic Adjustments ====================
+
+def apply_exposure(value: Any, exposure: float) -> "np.ndarray":
+    """Apply exposure adjustment in stops (EV)."""
+    return _f32(value) * (2 ** exposure)
+
+
+def apply_gamma(value: Any, gamma: float) -> "np.ndarray":
+    """Apply gamma correction."""
+    value = _f32(value)
+    if gamma <= 0:
+        return np.zeros_like(value)
+    return value ** (1.0 / gamma)
+
+
+def apply_contrast(value: Any, contrast: float) -> "np.ndarray":
+    """Apply contrast adjustment (1.0 is neutral)."""
+    return _clamp((_f32(value) - 0.5) * contrast + 0.5)
+
+
+def apply_saturation(rgb: Any, saturation: float) -> "np.ndarray":
+    """Apply saturation adjustment to an RGB array (..., 3)."""
+    rgb = _f32(rgb)
+    luminance = luminance_of(rgb)[..., None]
+    return _clamp(luminance + saturation * (rgb - luminance))
+
+
+def luminance_of(rgb: Any) -> "np.ndarray":
+    """Rec. 709 luminance of an RGB array (..., 3)."""
+    rgb = _f32(rgb)
+    return (
+        LUMA_WEIGHTS[0] * rgb[..., 0]
+        + LUMA_WEIGHTS[1] * rgb[..., 1]
+        + LUMA_WEIGHTS[2] * rgb[..., 2]
+    )
+
+
+# ==================== Lift/Gamma/Gain ====================
+
+def apply_lift_gamma_gain(value: Any, lift: Any, gamma: float, gain: Any) -> "np.ndarray":
+    """
+    Apply lift/gamma/gain.
+
+    lift and gain may be scalars or per-channel arrays broadcastable to value.
+    """
+    value = _f32(value)
+    lift, gain = _f32(lift), _f32(gain)
+    result = (value + lift * (1 - value)) * gain
+    if gamma > 0:
+        positive = result > 0
+        result = np.where(positive, np.maximum(result, 0) ** (1.0 / gamma), result)
+    return _clamp(result)
+
+
+def apply_lgg_rgb(
+    rgb: Any,
+    lift: Tuple[float, float, float],
+    gamma: float,
+    gain: Tuple[float, float, float],
+) -> "np.ndarray":
+    """Apply per-channel lift/gamma/gain to an RGB array (..., 3)."""
+    return apply_lift_gamma_gain(rgb, lift, gamma, gain)
+
+
+# ==================== Offset/Power/Slope (ASC CDL) ====================
+
+def apply_cdl(value: Any, slope: Any, offset: Any, power: Any) -> "np.ndarray":
+    """Apply ASC CDL: (value * slope + offset) ^ power."""
+    value = _f32(value)
+    slope, offset, power = _f32(slope), _f32(offset), _f32(power)
+    result = value * slope + offset
+    powered = (result > 0) & (power > 0)
+    safe_power = np.where(power > 0, power, 1)
+    result = np.where(powered, np.maximum(result, 0) ** safe_power, result)
+    return _clamp(result)
+
+
+def apply_cdl_rgb(
+    rgb: Any,
+    slope: Tuple[float, float, float],
+    offset: Tuple[float, float, float],
+    power: Tuple[float, float, float],
+) -> "np.ndarray":
+    """Apply per-channel ASC CDL to an RGB array (..., 3)."""
+    return apply_cdl(rgb, slope, offset, power)
+
+
+# ==================== Curves ====================
+
+def apply_curve(value: Any, curve_points: List[Tuple[float, float]]) -> "np.ndarray":
+    """Apply a piecewise-linear curve (clamped to the end points)."""
+    value = _f32(value)
+    if not curve_points:
+        return value
+    points = sorted(curve_points, key=lambda p: p[0])
+    xs = np.array([p[0] for p in points], dtype=np.float32)
+    ys = np.array([p[1] for p in points], dtype=np.float32)
+    return np.interp(value, xs, ys).astype(np.float32)
+
+
+def apply_rgb_curves(
+    rgb: Any,
+    rgb_curve: List[Tuple[float, float]],
+    r_curve: Optional[List[Tuple[float, float]]] = None,
+    g_curve: Optional[List[Tuple[float, float]]] = None,
+    b_curve: Optional[List[Tuple[float, float]]] = None,
+) -> "np.ndarray":
+    """Apply RGB master and individual channel curves to (..., 3)."""
+    result = apply_curve(rgb, rgb_curve).copy()
+    for channel, curve in enumerate((r_curve, g_curve, b_curve)):
+        if curve:
+            result[..., channel] = apply_curve(result[..., channel], curve)
+    return result
+
+
+# ==================== Levels ====================
+
+def apply_levels(
+    value: Any,
+    input_black: float = 0.0,
+    input_white: float = 1.0,
+    gamma: float = 1.0,
+    output_black: float = 0.0,
+    output_white: float = 1.0,
+) -> "np.ndarray":
+    """Apply levels adjustment (input range, gamma, output range)."""
+    value = _f32(value)
+    if input_white != input_black:
+        result = (value - input_black) / (input_white - input_black)
+    else:
+        result = np.full_like(value, 0.5)
+
+    result = _clamp(result)
+    if gamma > 0:
+        result = result ** (1.0 / gamma)
+    result = result * (output_white - output_black) + output_black
+    return _clamp(result)
+
+
+# ==================== HSV Adjustments ====================
+
+def rgb_to_hsv(rgb: Any) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Convert RGB (..., 3) to H, S, V arrays (H normalized to 0-1)."""
+    rgb = _f32(rgb)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    max_c = np.maximum(np.maximum(r, g), b)
+    min_c = np.minimum(np.minimum(r, g), b)
+    diff = max_c - min_c
+    safe_diff = np.where(diff != 0, diff, 1)
+
+    h = np.select(
+        [max_c == min_c, max_c == r, max_c == g],
+        [
+            0.0,
+            (60 * ((g - b) / safe_diff) + 360) % 360,
+            (60 * ((b - r) / safe_diff) + 120) % 360,
+        ],
+        (60 * ((r - g) / safe_diff) + 240) % 360,
+    )
+    s = np.divide(diff, max_c, out=np.zeros_like(diff), where=max_c != 0)
+    return (h / 360.0).astype(np.float32), s, max_c
+
+
+def hsv_to_rgb(h: Any, s: Any, v: Any) -> "np.ndarray":
+    """Convert H, S, V arrays (H in 0-1) to RGB (..., 3)."""
+    h, s, v = _f32(h) * 360, _f32(s), _f32(v)
+    sector = np.floor(h / 60)
+    i = sector.astype(np.int64) % 6
+    f = h / 60 - sector
+    p = v * (1 - s)
+    q = v * (1 - f * s)
+    t = v * (1 - (1 - f) * s)
+
+    r = np.choose(i, [v, q, p, p, t, v])
+    g = np.choose(i, [t, v, v, q, p, p])
+    b = np.choose(i, [p, p, t, v, v, q])
+    rgb = np.stack([r, g, b], axis=-1)
+    gray = (s == 0)[..., None]
+    return np.where(gray, v[..., None], rgb).astype(np.float32)
+
+
+def apply_hsv_adjustment(
+    rgb: Any,
+    hue_shift: float = 0.0,
+    saturation_mult: float = 1.0,
+    value_mult: float = 1.0,
+) -> "np.ndarray":
+    """Apply hue rotation and saturation/value multipliers to (..., 3)."""
+    h, s, v = rgb_to_hsv(rgb)
+    h = (h + hue_shift + 1.0) % 1.0
+    s = _clamp(s * saturation_mult)
+    v = _clamp(v * value_mult)
+    return hsv_to_rgb(h, s, v)
+
+
+# ==================== Temperature/Tint ====================
+
+def apply_white_balance(rgb: Any, temperature: float = 0.0, tint: float = 0.0) -> "np.ndarray":
+    """Apply white balance to (..., 3); temperature and tint in -100..100."""
+    rgb = _f32(rgb)
+    temp_factor = temperature / 100.0
+    tint_factor = tint / 100.0
+
+    r_scale = 1 + temp_factor * 0.1
+    g_scale = 1 - abs(tint_factor) * 0.05
+    b_scale = 1 - temp_factor * 0.1
+    if tint_factor > 0:
+        # Magenta - add to R and B
+        r_scale *= 1 + tint_factor * 0.03
+        b_scale *= 1 + tint_factor * 0.03
+
+    scale = np.array([r_scale, g_scale, b_scale], dtype=np.float32)
+    return _clamp(rgb * scale)
+
+
+# ==================== Highlights/Shadows ====================
+
+def apply_highlights_shadows(value: Any, highlights: float = 0.0, shadows: float = 0.0) -> "np.ndarray":
+    """Apply highlights/shadows adjustment (each -100..100)."""
+    value = _f32(value)
+    shadow_adj = shadows / 100.0 * 0.3
+    highlight_adj = highlights / 100.0 * 0.3
+    return _clamp(value + shadow_adj * (1 - value) + highlight_adj * value)
+
+
+# ==================== Combined Color Correction ====================
+
+def is_identity_correction(cc: ColorCorrection) -> bool:
+    """Whether cc only clamps (all settings at their defaults)."""
+    return cc.to_dict() == ColorCorrection().to_dict()
+
+
+def apply_color_correction(rgb: Any, cc: ColorCorrection) -> "np.ndarray":
+    """
+    Apply all color correction settings to an RGB array (..., 3).
+
+    Same order and formulas as color_correction.apply_color_correction.
+    """
+    rgb = _f32(rgb)
+    if is_identity_correction(cc):
+        # Every step is neutral apart from clamping
+        return _clamp(rgb)
+
+    rgb = apply_white_balance(rgb, cc.temperature, cc.tint)
+    rgb = apply_exposure(rgb, cc.exposure)
+    rgb = apply_highlights_shadows(rgb, cc.highlights, cc.shadows)
+    rgb = apply_lgg_rgb(rgb, cc.lift, cc.gamma, cc.gain)
+    rgb = apply_contrast(rgb, cc.contrast)
+    rgb = apply_saturation(rgb, cc.saturation)
+    if cc.hue_shift != 0:
+        rgb = apply_hsv_adjustment(rgb, cc.hue_shift)
+    return _clamp(rgb)
@@ -7,9 +7,12 @@ Part of Phase 12.1: Compositor (REQ-COMP-01)
 """
 
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any, Callable, Tuple
 import json
+import os
+import time
 from pathlib import Path
 
 from .compositor_types import (
@@ -20,6 +23,16 @@ from .compositor_types import (
     ColorCorrection,
     Transform2D,
 )
+from .array_compositor import (
+    HAS_NUMPY,
+    DEFAULT_TILE_ROWS,
+    IMAGE_EXTENSIONS,
+    ArrayCompositor,
+    SourceLoader,
+    has_frame_field,
+    resolve_frame_path,
+    save_image,
+)
 
 
 @dataclass
@@ -36,13 +49,33 @@ class LayerCompositor:
     """
     Manage composite layers and perform compositing operations.
 
-    This is a pure Python implementation that works with configuration.
-    For actual rendering, use the Blender integration module.
+    Frames are rendered with the NumPy engine in array_compositor
+    (float32 buffers, processed tile by tile). Evaluated layers are kept
+    in _layer_cache, so only layers whose settings or source files
+    changed are recomputed on the next frame. For rendering through
+    Blender's compositor, use the Blender integration module.
     """
 
-    def __init__(self, config: Optional[CompositeConfig] = None):
+    def __init__(
+        self,
+        config: Optional[CompositeConfig] = None,
+        tile_rows: int = DEFAULT_TILE_ROWS,
+        cache_layers: bool = True,
+    ):
+        """
+        Initialize compositor.
+
+        Args:
+            config: Composite configuration
+            tile_rows: Rows processed per tile when rendering
+            cache_layers: Keep evaluated layers between frames (uses one
+                frame-sized buffer per layer)
+        """
         self.config = config or CompositeConfig(name="Composite")
+        self.tile_rows = tile_rows
+        self.cache_layers = cache_layers
         self._layer_cache: Dict[str, Any] = {}
+        self._source_loaders: Dict[LayerSource, SourceLoader] = {}
         self._on_layer_change: Optional[Callable[[str], None]] = None
 
     # ==================== Layer Management ====================
@@ -280,38 +313,136 @@ class LayerCompositor:
         self.add_layer(layer)
         return layer
 
-    # ==================== Rendering (Stub) ====================
+    # ==================== Rendering ====================
+
+    def register_source_loader(self, source_type: LayerSource, loader: SourceLoader) -> None:
+        """
+        Register a loader for a layer source type.
+
+        Built in: solid, gradient, and image files for image sequence and
+        render pass layers (source is a path, "####" sequence pattern
+        allowed). Loaders receive (layer, source_frame) and return
+        (H, W, 4) float RGBA.
+        """
+        self._source_loaders[source_type] = loader
+        self._layer_cache.clear()
+
+    def composite_frame(self, frame: int) -> Any:
+        """
+        Composite a frame into an array.
+
+        Args:
+            frame: Frame number
+
+        Returns:
+            (H, W, 4) float32 RGBA array
+        """
+        engine = ArrayCompositor(self.config, self.tile_rows, self._source_loaders)
+        cache = self._layer_cache if self.cache_layers else None
+        return engine.composite(frame, cache)
 
     def render_frame(self, frame: int) -> CompositeResult:
         """
         Render a single frame.
 
-        Note: This is a stub. Actual rendering requires Blender integration.
+        Composites all enabled layers and writes the result to the
+        frame's output path (if config.output_path is set).
         """
-        import time
         start = time.time()
 
-        # In real implementation, this would:
-        # 1. Load all enabled layer sources
-        # 2. Apply transforms
-        # 3. Apply color corrections
-        # 4. Composite with blend modes
-        # 5. Apply masks
-        # 6. Output result
+        if not HAS_NUMPY:
+            return CompositeResult(
+                success=False,
+                frame=frame,
+                error="NumPy is required for compositing",
+            )
+
+        output_path = self.frame_output_path(frame)
+        try:
+            image = self.composite_frame(frame)
+            if output_path:
+                save_image(
+                    output_path,
+                    image,
+                    self.config.output_format,
+                    self.config.output_quality,
+                )
+        except (OSError, ValueError, ImportError) as e:
+            return CompositeResult(
+                success=False,
+                frame=frame,
+                output_path=output_path,
+                error=str(e),
+                timing_ms=(time.time() - start) * 1000,
+            )
 
         elapsed = (time.time() - start) * 1000
 
         return CompositeResult(
             success=True,
             frame=frame,
-            output_path=self.config.output_path,
+            output_path=output_path,
             timing_ms=elapsed,
         )
 
-    def render_all(self) -> List[CompositeResult]:
-        """Render all frames in the frame range."""
+    def render_all(self, workers: Optional[int] = None) -> List[CompositeResult]:
+        """
+        Render all frames in the frame range.
+
+        Frames are split into contiguous chunks, one per worker process,
+        so each worker's layer cache is reused across neighbouring frames.
+
+        Args:
+            workers: Worker processes (default: CPU count; 1 renders here)
+
+        Returns:
+            Results in frame order
+        """
         start, end = self.config.frame_range
-        return [self.render_frame(f) for f in range(start, end + 1)]
+        frames = list(range(start, end + 1))
+        workers = min(workers or os.cpu_count() or 1, len(frames))
+
+        # Custom loaders may not survive pickling; render them in-process
+        if workers <= 1 or self._source_loaders:
+            return [self.render_frame(f) for f in frames]
+
+        chunk = -(-len(frames) // workers)
+        chunks = [frames[i:i + chunk] for i in range(0, len(frames), chunk)]
+        config_data = self.config.to_dict()
+
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [
+                executor.submit(
+                    _render_frames, config_data, frame_chunk, self.tile_rows, self.cache_layers
+                )
+                for frame_chunk in chunks
+            ]
+            results: List[CompositeResult] = []
+            for future in futures:
+                results.extend(future.result())
+        return results
+
+    def frame_output_path(self, frame: int) -> str:
+        """
+        Get the output file path for a frame.
+
+        output_path may be a sequence pattern ("comp_####.png"), a file
+        path (frame number is appended to the stem) or a directory.
+
+        Returns:
+            Output path, or "" when no output path is configured
+        """
+        output_path = self.config.output_path
+        if not output_path:
+            return ""
+        if has_frame_field(output_path):
+            return resolve_frame_path(output_path, frame)
+
+        path = Path(output_path)
+        if path.suffix:
+            return str(path.with_name(f"{path.stem}_{frame:04d}{path.suffix}"))
+        extension = IMAGE_EXTENSIONS.get(self.config.output_format, f".{self.config.output_format.value}")
+        return str(path / f"{self.config.name}_{frame:04d}{extension}")
 
     # ==================== Serialization ====================
 
@@ -353,6 +484,21 @@ class LayerCompositor:
         self._on_layer_change = callback
 
 
+def _render_frames(
+    config_data: Dict[str, Any],
+    frames: List[int],
+    tile_rows: int,
+    cache_layers: bool,
+) -> List[CompositeResult]:
+    """Render a chunk of frames in a worker process."""
+    compositor = LayerCompositor(
+        CompositeConfig.from_dict(config_data),
+        tile_rows=tile_rows,
+        cache_layers=cache_layers,
+    )
+    return [compositor.render_frame(frame) for frame in frames]
+
+
 # ==================== Convenience Functions ====================
 
 def create_compositor(
@@ -68,6 +68,7 @@ from lib.production.production_validator import (
 from lib.production.execution_engine import (
     ExecutionEngine,
     execute_production,
+    resume_production,
 )
 
 from lib.production.parallel_executor import (
@@ -77,7 +78,34 @@ from lib.production.parallel_executor import (
     optimize_worker_count,
     ParallelExecutor,
     BatchProcessor,
+    ShotDurationHistory,
+    WorkStealingQueue,
+    DAGScheduler,
+    build_shot_dependency_graph,
 )
+from lib.production.checkpoint_journal import (
+    CheckpointJournal,
+    journal_path_for,
+    replay_journal,
+)
+from lib.production.shot_worker import (
+    ShotWorkerPool,
+    resolve_renderer,
+    run_shot_task,
+    default_shot_renderer,
+)
+
+
+def failing_shot_renderer(shot):
+    """Module-level renderer that fails every shot (picklable)."""
+    return False
+
+
+def crashing_shot_renderer(shot):
+    """Module-level renderer that kills its worker on shots named 'crash'."""
+    if shot.name == "crash":
+        os._exit(1)
+    return True
 
 
 # =============================================================================
@@ -616,8 +644,9 @@ class TestExecutionEngine:
         assert progress["shots_total"] == 3
         assert progress["shots_completed"] == 0
 
-    def test_execute_production(self, sample_production_config):
+    def test_execute_production(self, sample_production_config, temp_dir):
         """Test production execution."""
+        sample_production_config.base_path = temp_dir
         result = execute_production(sample_production_config)
 
         assert result is not None
@@ -645,6 +674,92 @@ class TestExecutionEngine:
         assert remaining >= 0
 
 
+class TestCheckpointJournal:
+    """Tests for journaled checkpoints."""
+
+    def test_journal_appends_instead_of_rewriting(self, sample_production_config, temp_dir):
+        """Test shot outcomes go to the journal, not the snapshot."""
+        engine = ExecutionEngine(sample_production_config)
+        engine.state.checkpoint_path = os.path.join(temp_dir, "prod_checkpoint.json")
+        engine.checkpoint_interval = 1
+        journal = engine.enable_journal(fsync_every=2)
+
+        engine.record_shot_result(0, True)
+        engine.record_shot_result(1, False, "boom")
+        engine.record_shot_result(1, True)
+
+        assert not os.path.exists(engine.state.checkpoint_path)
+        assert journal.path == os.path.join(temp_dir, "prod_checkpoint.journal")
+        journal.sync()
+        assert [r["s"] for r in journal.read()] == [0, 1, 1]
+
+    def test_compaction(self, sample_production_config, temp_dir):
+        """Test journal is folded into the snapshot."""
+        engine = ExecutionEngine(sample_production_config)
+        engine.state.checkpoint_path = os.path.join(temp_dir, "prod_checkpoint.json")
+        journal = engine.enable_journal(compact_every=2)
+
+        engine.record_shot_result(0, True)
+        engine.record_shot_result(1, True)
+        engine.record_shot_result(2, False)
+        journal.sync()
+
+        with open(engine.state.checkpoint_path) as f:
+            assert json.load(f)["state"]["completed_shots"] == [0, 1]
+        assert [r["s"] for r in journal.read()] == [2]
+
+    def test_replay_matches_state_methods(self):
+        """Test linear replay equals applying records one by one."""
+        records = [
+            {"s": 0, "ok": 1},
+            {"s": 1, "ok": 0, "e": "bad"},
+            {"s": 2, "ok": 1},
+            {"s": 1, "ok": 1},
+            {"s": 2, "ok": 0},
+        ]
+        expected = ExecutionState(completed_shots=[5])
+        for record in records:
+            if record["ok"]:
+                expected.complete_shot(record["s"])
+            else:
+                expected.fail_shot(record["s"])
+
+        state = ExecutionState(completed_shots=[5])
+        assert replay_journal(state, records) == len(records)
+        assert state.completed_shots == expected.completed_shots
+        assert state.failed_shots == expected.failed_shots
+        assert state.error_message == "bad"
+
+    def test_truncated_record_ignored(self, temp_dir):
+        """Test a partially written final line is skipped."""
+        path = os.path.join(temp_dir, "x.journal")
+        with open(path, "w") as f:
+            f.write('{"s":0,"ok":1}\n{"s":1,"o')
+        assert CheckpointJournal(path).read() == [{"s": 0, "ok": 1}]
+
+    def test_resume_after_crash(self, sample_production_config, temp_dir):
+        """Test an interrupted journaled run resumes from snapshot + journal."""
+        checkpoint_path = os.path.join(temp_dir, "prod_checkpoint.json")
+        engine = ExecutionEngine(sample_production_config)
+        engine.state.checkpoint_path = checkpoint_path
+        engine.state.status = ExecutionStatus.RUNNING.value
+        engine.enable_journal()
+        engine.save_checkpoint()
+        engine.record_shot_result(0, True)
+        engine.record_shot_result(1, True)
+        engine.journal.close()  # Simulated crash: no final snapshot
+
+        restored = ExecutionEngine(sample_production_config)
+        restored.load_checkpoint(checkpoint_path)
+        assert restored.state.completed_shots == [0, 1]
+        assert restored.journal is not None
+        assert restored.journal.path == journal_path_for(checkpoint_path)
+
+        result = resume_production(checkpoint_path, sample_production_config)
+        assert {0, 1} <= set(result.state.completed_shots)
+        assert not os.path.exists(journal_path_for(checkpoint_path))
+
+
 # =============================================================================
 # Parallel Executor Tests
 # =============================================================================
@@ -701,6 +816,247 @@ class TestParallelExecutor:
         executor = ParallelExecutor(config)
         assert executor.config.max_workers == 4
 
+    def test_shot_dependency_graph_edges(self):
+        """Test per-shot dependency edges."""
+        shots = [
+            ShotConfig(name="a", scene=1, character="hero", location="lab"),
+            ShotConfig(name="b", scene=2, character="villain", location="lab"),
+            ShotConfig(name="c", scene=3, character="hero"),
+            ShotConfig(name="d", scene=3, depends_on=["b"]),
+        ]
+
+        graph = build_shot_dependency_graph(shots)
+        assert graph.edge_kinds == {(0, 2): "character", (1, 3): "explicit"}
+        assert sorted(graph.roots()) == [0, 1]
+
+        graph = build_shot_dependency_graph(shots, location_edges=True)
+        assert graph.edge_kinds[(0, 1)] == "location"
+
+    def test_shot_dependency_graph_errors(self):
+        """Test unknown and cyclic dependencies are rejected."""
+        with pytest.raises(ValueError):
+            build_shot_dependency_graph([ShotConfig(name="a", depends_on=["missing"])])
+
+        with pytest.raises(ValueError):
+            build_shot_dependency_graph([
+                ShotConfig(name="a", depends_on=["b"]),
+                ShotConfig(name="b", depends_on=["a"]),
+            ])
+
+    def test_critical_path(self):
+        """Test critical path ranks."""
+        shots = [
+            ShotConfig(name="a", character="hero"),
+            ShotConfig(name="b", character="hero"),
+            ShotConfig(name="c"),
+        ]
+        graph = build_shot_dependency_graph(shots)
+
+        ranks = graph.upward_ranks([1.0, 2.0, 2.5])
+        assert ranks == [3.0, 2.0, 2.5]
+        assert graph.critical_path([1.0, 2.0, 2.5]) == (3.0, [0, 1])
+
+    def test_duration_history(self, temp_dir):
+        """Test duration history estimates and persistence."""
+        path = os.path.join(temp_dir, "times.json")
+        history = ShotDurationHistory(path)
+        history.record(ShotConfig(name="a", duration=100), 10.0)
+        history.record(ShotConfig(name="a", duration=100), 20.0)
+        history.save()
+
+        loaded = ShotDurationHistory(path)
+        assert loaded.estimate(ShotConfig(name="a", duration=100)) == pytest.approx(15.0)
+        assert loaded.estimate(ShotConfig(name="new", duration=50)) == pytest.approx(7.5)
+        assert ShotDurationHistory().estimate(ShotConfig(name="x", duration=240)) == 2.0
+
+    def test_work_stealing_queue(self):
+        """Test priority order and stealing from other workers."""
+        queue = WorkStealingQueue(2)
+        queue.push("low", 1.0, worker=0)
+        queue.push("high", 5.0, worker=0)
+
+        assert queue.pop(1) == "high"
+        assert queue.steals == 1
+        assert queue.pop(0) == "low"
+
+        queue.close()
+        assert queue.pop(0) is None
+
+    def test_scheduler_does_not_wait_for_slow_shot(self):
+        """Test independent shots run while a slow shot is in flight."""
+        import time
+        import threading
+
+        shots = [
+            ShotConfig(name="slow", scene=1, character="hero"),
+            ShotConfig(name="after_slow", scene=1, character="hero"),
+        ] + [ShotConfig(name=f"quick_{i}", scene=2 + i) for i in range(4)]
+        graph = build_shot_dependency_graph(shots)
+        finished = []
+        lock = threading.Lock()
+
+        def run_shot(idx):
+            time.sleep(0.2 if idx == 0 else 0.02)
+            with lock:
+                finished.append(idx)
+            return True
+
+        results, report = DAGScheduler(graph, [1.0] * len(shots), 2).run(run_shot)
+
+        assert all(results.values()) and len(results) == len(shots)
+        assert finished.index(1) > finished.index(0)
+        # All quick shots finish on the other worker before the slow one
+        assert set(finished[:4]) == {2, 3, 4, 5}
+        assert report.max_concurrency == 2
+        assert report.achieved_parallelism > 1.0
+
+    def test_execute_shots_parallel_report(self, sample_production_config, temp_dir):
+        """Test executor runs every shot and reports against the estimate."""
+        sample_production_config.base_path = temp_dir
+        engine = ExecutionEngine(sample_production_config)
+        shots = sample_production_config.shots
+        executor = ParallelExecutor(ParallelConfig(max_workers=2), history=ShotDurationHistory())
+
+        results = executor.execute_shots_parallel(shots, engine)
+
+        assert len(results) == len(shots)
+        report = executor.last_report
+        assert report.total_shots == len(shots)
+        assert report.predicted == get_parallel_estimate(shots, 2)
+        assert report.to_dict()["predicted_speedup"] == report.predicted_speedup
+        assert len(executor.history) == sum(1 for ok in results.values() if ok)
+
+
+class TestShotWorker:
+    """Tests for process-pool shot workers."""
+
+    def test_run_shot_task_in_process(self):
+        """Test worker entrypoint with a serialized shot."""
+        shot = ShotConfig(name="shot_1", scene=1, duration=48)
+        result = run_shot_task(3, shot.to_dict())
+
+        assert result.shot_index == 3
+        assert result.success
+        assert result.worker_pid == os.getpid()
+
+    def test_resolve_renderer(self):
+        """Test renderer specifications."""
+        assert resolve_renderer(None) is default_shot_renderer
+        assert resolve_renderer("lib.production.shot_worker:default_shot_renderer") is default_shot_renderer
+
+        with pytest.raises(ValueError):
+            resolve_renderer("no_function_here")
+
+    def test_worker_pool_reuses_processes(self):
+        """Test workers are reused across shots and pool runs."""
+        shots = [ShotConfig(name=f"shot_{i}") for i in range(6)]
+
+        with ShotWorkerPool(max_workers=2) as pool:
+            first = pool.map(shots)
+            second = pool.map(shots)
+
+        results = first + second
+        assert all(r.success for r in results)
+        assert [r.shot_index for r in first] == list(range(6))
+        assert len({r.worker_pid for r in results}) <= 2
+        assert os.getpid() not in {r.worker_pid for r in results}
+        assert max(r.worker_shots for r in results) > 1
+
+    def test_concurrent_first_submits_share_one_pool(self, monkeypatch):
+        """Threads submitting at once start a single process pool."""
+        import threading
+        import time
+        from concurrent.futures import ProcessPoolExecutor
+        from lib.production import shot_worker
+
+        created = []
+
+        class CountingPool(ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                created.append(self)
+                time.sleep(0.05)  # Widen the window for racing threads
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(shot_worker, "ProcessPoolExecutor", CountingPool)
+        barrier = threading.Barrier(4)
+        futures = []
+
+        def submit(index):
+            barrier.wait()
+            futures.append(pool.submit(index, ShotConfig(name=f"shot_{index}")))
+
+        with ShotWorkerPool(max_workers=2) as pool:
+            threads = [threading.Thread(target=submit, args=(i,)) for i in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert all(future.result().success for future in futures)
+
+        assert len(created) == 1
+        assert pool.submitted == 4
+
+    def test_pool_recovers_after_worker_crash(self):
+        """A dead worker breaks one shot, not every later shot."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        with ShotWorkerPool(max_workers=1, renderer=crashing_shot_renderer) as pool:
+            with pytest.raises(BrokenProcessPool):
+                pool.submit(0, ShotConfig(name="crash")).result()
+
+            results = pool.map([ShotConfig(name=f"shot_{i}") for i in range(3)])
+
+        assert all(r.success for r in results)
+        assert pool.restarts == 1
+
+    def test_process_backend_updates_parent_state(self, sample_production_config, temp_dir):
+        """Test worker results are applied to the parent engine state."""
+        sample_production_config.base_path = temp_dir
+        engine = ExecutionEngine(sample_production_config)
+        engine.checkpoint_interval = 1
+        shots = sample_production_config.shots
+        executor = ParallelExecutor(ParallelConfig(max_workers=2, backend="process"))
+
+        try:
+            results = executor.execute_shots_parallel(shots, engine)
+            assert executor.worker_pool.started
+        finally:
+            executor.close()
+
+        assert all(results.values())
+        assert sorted(engine.state.completed_shots) == list(range(len(shots)))
+        with open(engine.state.checkpoint_path) as f:
+            checkpoint = json.load(f)
+        assert len(checkpoint["state"]["completed_shots"]) == len(shots)
+
+    def test_process_backend_uses_engine_renderer(self, sample_production_config, temp_dir):
+        """Test set_shot_renderer() applies to worker processes."""
+        sample_production_config.base_path = temp_dir
+        engine = ExecutionEngine(sample_production_config)
+        engine.set_shot_renderer(failing_shot_renderer)
+        shots = sample_production_config.shots
+        executor = ParallelExecutor(ParallelConfig(max_workers=2, backend="process"))
+
+        try:
+            results = executor.execute_shots_parallel(shots, engine)
+        finally:
+            executor.close()
+
+        assert results == {i: False for i in range(len(shots))}
+        assert engine.state.completed_shots == []
+        assert sorted(engine.state.failed_shots) == list(range(len(shots)))
+
+    def test_process_backend_rejects_unpicklable_renderer(self, sample_production_config, temp_dir):
+        """Test a renderer workers cannot receive raises instead of being ignored."""
+        sample_production_config.base_path = temp_dir
+        engine = ExecutionEngine(sample_production_config)
+        engine.set_shot_renderer(lambda shot: False)
+        executor = ParallelExecutor(ParallelConfig(max_workers=2, backend="process"))
+
+        with pytest.raises(ValueError, match="cannot be sent"):
+            executor.execute_shots_parallel(sample_production_config.shots, engine)
+        assert executor.worker_pool is None
+
 
 # =============================================================================
 # Integration Tests
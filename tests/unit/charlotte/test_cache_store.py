@@ -0,0 +1,183 @@
+"""
+Unit tests for Charlotte Digital Twin shared response cache.
+
+Tests the content-addressed cache store and DataClient integration
+against a local HTTP stand-in.
+
+Note: bpy and mathutils are mocked in conftest.py before any imports.
+"""
+
+import gzip
+import json
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from lib.charlotte_digital_twin.data_acquisition.base_client import DataClient
+from lib.charlotte_digital_twin.data_acquisition.cache_store import CacheStore
+
+
+class _TileHandler(BaseHTTPRequestHandler):
+    """Serves a JSON tile and counts requests."""
+
+    requests = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            type(self).requests += 1
+        time.sleep(0.2)  # Slow enough for workers to overlap
+        body = json.dumps({"path": self.path, "heights": list(range(100))}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def tile_server():
+    """Local HTTP server standing in for a tile API."""
+    _TileHandler.requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TileHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class _TileClient(DataClient):
+    """Minimal client fetching JSON over urllib."""
+
+    RATE_LIMIT = 0.0
+
+    def fetch(self, url):
+        def _request():
+            with urllib.request.urlopen(url, timeout=10) as response:
+                return json.loads(response.read())
+
+        return self._cached_fetch(self._get_cache_key(url), _request, source_url=url)
+
+
+class TestCacheStore:
+    """Tests for CacheStore."""
+
+    def test_roundtrip_compressed(self, tmp_path):
+        """Payloads are stored gzip compressed and read back."""
+        store = CacheStore(tmp_path)
+        data = {"values": [1.5] * 1000, "name": "tile"}
+        size = store.put("a", data)
+
+        assert store.get("a") == data
+        assert size < len(json.dumps(data))
+        objects = list((tmp_path / "objects").rglob("*.json.gz"))
+        assert len(objects) == 1
+        assert json.loads(gzip.decompress(objects[0].read_bytes())) == data
+
+    def test_content_addressed(self, tmp_path):
+        """Identical payloads share one object file."""
+        store = CacheStore(tmp_path)
+        store.put("a", {"x": 1})
+        store.put("b", {"x": 1})
+
+        assert len(list((tmp_path / "objects").rglob("*.json.gz"))) == 1
+        assert store.delete("a")
+        assert store.get("b") == {"x": 1}
+        assert store.delete("b")
+        assert list((tmp_path / "objects").rglob("*.json.gz")) == []
+
+    def test_lru_eviction(self, tmp_path):
+        """Least recently used entries go first when over budget."""
+        store = CacheStore(tmp_path, max_bytes=10 ** 9)
+        payload_size = store.put("probe", list(range(200)))
+        store.delete("probe")
+        store.max_bytes = int(payload_size * 3.5)
+
+        for i in range(3):
+            store.put(f"k{i}", list(range(200)) + [i])
+            time.sleep(0.01)
+        store.get("k0")  # k0 becomes most recent
+        store.put("k3", list(range(200)) + [3])
+
+        assert store.get("k1") is None
+        assert store.get("k0") is not None
+        assert store.total_bytes() <= store.max_bytes
+        assert store.stats.evictions >= 1
+
+    def test_ttl_and_counters(self, tmp_path):
+        """Expired entries miss; counters track hits, misses and bytes."""
+        store = CacheStore(tmp_path)
+        store.put("a", [1, 2, 3])
+        assert store.get("a", ttl_seconds=3600) == [1, 2, 3]
+        assert store.get("a", ttl_seconds=-1) is None
+        assert store.get("missing") is None
+
+        stats = store.stats.to_dict()
+        assert (stats["hits"], stats["misses"], stats["writes"]) == (1, 2, 1)
+        assert stats["bytes_read"] > 0 and stats["bytes_written"] > 0
+
+        shared = CacheStore(tmp_path).global_stats()
+        assert shared["hits"] == 1 and shared["entries"] == 1
+
+
+class TestDataClientCache:
+    """Tests for DataClient on top of the shared store."""
+
+    def test_concurrent_workers_coalesce(self, tmp_path, tile_server):
+        """Parallel cold fetches of one tile hit the server once."""
+        url = f"{tile_server}/tile/1"
+        results = []
+
+        def worker():
+            client = _TileClient(cache_dir=tmp_path)
+            results.append(client.fetch(url))
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert _TileHandler.requests == 1
+        assert len(results) == 6
+        assert all(r == results[0] for r in results)
+
+        stats = _TileClient(cache_dir=tmp_path).cache_stats()
+        assert stats["shared"]["misses"] == 1
+        assert stats["shared"]["hits"] == 5
+        assert stats["shared"]["coalesced"] >= 1
+
+    def test_shared_between_clients(self, tmp_path, tile_server):
+        """A second client reuses the first client's response."""
+        url = f"{tile_server}/tile/2"
+        _TileClient(cache_dir=tmp_path).fetch(url)
+        again = _TileClient(cache_dir=tmp_path).fetch(url)
+
+        assert again["path"] == "/tile/2"
+        assert _TileHandler.requests == 1
+
+    def test_legacy_file_migrated(self, tmp_path):
+        """Old per-key JSON files are moved into the store."""
+        client = _TileClient(cache_dir=tmp_path)
+        key = client._get_cache_key("legacy")
+        legacy = tmp_path / f"{key}.json"
+        legacy.write_text(json.dumps({"data": {"v": 1}, "timestamp": time.time()}))
+
+        assert client._load_from_cache(key) == {"v": 1}
+        assert not legacy.exists()
+        assert client.cache_store.get(key) == {"v": 1}
+
+    def test_memory_cache_bounded(self, tmp_path):
+        """The in-memory layer keeps only MEMORY_CACHE_ENTRIES items."""
+        client = _TileClient(cache_dir=tmp_path)
+        for i in range(client.MEMORY_CACHE_ENTRIES + 10):
+            client._save_to_cache(f"k{i}", i)
+        assert len(client._cache) == client.MEMORY_CACHE_ENTRIES
+        assert client._load_from_cache("k0") == 0  # Still on disk
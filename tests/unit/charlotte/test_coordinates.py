@@ -9,6 +9,7 @@ Note: bpy and mathutils are mocked in conftest.py before any imports.
 import pytest
 import math
 
+from lib.charlotte_digital_twin.geometry import coordinates as coordinates_module
 from lib.charlotte_digital_twin.geometry.coordinates import (
     CoordinateTransformer,
     CHARLOTTE_ORIGINS,
@@ -422,3 +423,117 @@ class TestAccuracy:
         # Should still be quite accurate
         assert result.lat == pytest.approx(original_lat, abs=1e-6)
         assert result.lon == pytest.approx(original_lon, abs=1e-6)
+
+
+@pytest.mark.skipif(not coordinates_module.HAS_NUMPY, reason="numpy required")
+class TestArrayTransforms:
+    """Tests for vectorized array transforms against the scalar versions."""
+
+    POINTS = [
+        (35.2271, -80.8431, 0.0),
+        (35.2380, -80.8300, 245.0),
+        (35.1517, -80.8095, 250.0),
+        (-33.8688, 151.2093, 12.0),
+    ]
+
+    def test_latlon_to_world_matches_scalar(self):
+        """Array LTP conversion equals latlon_to_world per point."""
+        import numpy as np
+
+        config = GeometryConfig(scale=0.5, z_offset=2.0, flatten_to_plane=False)
+        transformer = CoordinateTransformer(config)
+        world = transformer.latlon_to_world_array(np.array(self.POINTS))
+
+        assert world.shape == (4, 3)
+        assert world.dtype == np.float64
+        assert world.flags["C_CONTIGUOUS"]
+        for row, (lat, lon, elevation) in zip(world, self.POINTS):
+            expected = transformer.latlon_to_world(lat, lon, elevation)
+            assert tuple(row) == (expected.x, expected.y, expected.z)
+
+    def test_latlon_to_world_float32_and_nx2(self):
+        """Nx2 input works and the output dtype is selectable."""
+        import numpy as np
+
+        transformer = CoordinateTransformer()
+        world = transformer.latlon_to_world_array(
+            np.array(self.POINTS)[:, :2], dtype=np.float32
+        )
+        assert world.dtype == np.float32
+        assert world[0, 0] == pytest.approx(0.0, abs=1e-3)
+        assert transformer.latlon_to_world_array([]).shape == (0, 3)
+
+    def test_batch_uses_same_results(self):
+        """latlon_to_world_batch returns the same objects with or without NumPy."""
+        transformer = CoordinateTransformer()
+        fast = transformer.latlon_to_world_batch(self.POINTS)
+        expected = [transformer.latlon_to_world(*p) for p in self.POINTS]
+        assert [(w.x, w.y, w.z) for w in fast] == [(w.x, w.y, w.z) for w in expected]
+
+    def test_world_to_latlon_roundtrip(self):
+        """Array inverse matches world_to_latlon."""
+        import numpy as np
+
+        transformer = CoordinateTransformer()
+        world = transformer.latlon_to_world_array(np.array(self.POINTS[:3]))
+        geo = transformer.world_to_latlon_array(world)
+
+        for row, point in zip(geo, world):
+            expected = transformer.world_to_latlon(*point)
+            assert tuple(row) == (expected.lat, expected.lon, expected.elevation)
+
+    def test_utm_matches_scalar(self):
+        """Array UTM forward and inverse equal the scalar conversions."""
+        import numpy as np
+
+        transformer = CoordinateTransformer()
+        coords = np.array(self.POINTS[:3])
+        utm = transformer.latlon_to_utm_array(coords, zone=17)
+        back = transformer.utm_to_latlon_array(utm, zone=17)
+
+        for (lat, lon, _), (easting, northing), roundtrip in zip(coords, utm, back):
+            expected = transformer._latlon_to_utm(lat, lon, 17)
+            assert easting == pytest.approx(expected.easting, rel=1e-12)
+            assert northing == pytest.approx(expected.northing, rel=1e-12)
+
+            inverse = transformer.utm_to_latlon(easting, northing, 17)
+            assert roundtrip[0] == pytest.approx(inverse.lat, rel=1e-12)
+            assert roundtrip[1] == pytest.approx(inverse.lon, rel=1e-12)
+
+    def test_utm_southern_hemisphere(self):
+        """Southern points get the false northing."""
+        import numpy as np
+
+        transformer = CoordinateTransformer()
+        utm = transformer.latlon_to_utm_array(np.array([self.POINTS[3]]), zone=56)
+        expected = transformer._latlon_to_utm(-33.8688, 151.2093, 56)
+        assert utm[0, 1] == pytest.approx(expected.northing, rel=1e-12)
+
+        back = transformer.utm_to_latlon_array(utm, zone=56, hemisphere="S")
+        assert back[0, 0] == pytest.approx(-33.8688, abs=1e-5)
+
+    def test_distance_and_bearing_match_scalar(self):
+        """Array distance and bearing equal the scalar versions, with broadcasting."""
+        import numpy as np
+
+        transformer = CoordinateTransformer()
+        start = np.array([[35.2271, -80.8431]])
+        end = np.array(self.POINTS)[:, :2]
+
+        distances = transformer.distance_meters_array(start, end)
+        bearings = transformer.bearing_degrees_array(start, end)
+
+        assert distances.shape == (4,)
+        for (lat, lon), distance, bearing in zip(end, distances, bearings):
+            assert distance == pytest.approx(
+                transformer.get_distance_meters(35.2271, -80.8431, lat, lon), rel=1e-12, abs=1e-9
+            )
+            assert bearing == pytest.approx(
+                transformer.get_bearing_degrees(35.2271, -80.8431, lat, lon), rel=1e-12
+            )
+
+    def test_rejects_bad_shape(self):
+        """Arrays without 2 or 3 columns are rejected."""
+        transformer = CoordinateTransformer()
+        with pytest.raises(ValueError):
+            transformer.latlon_to_world_array([[1.0, 2.0, 3.0, 4.0]])
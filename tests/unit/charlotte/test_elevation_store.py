@@ -0,0 +1,200 @@
+"""
+Unit tests for Charlotte Digital Twin gridded elevation data.
+
+Tests the tiled DEM store, batch sampling, heightmaps and terrain
+following without network access.
+
+Note: bpy and mathutils are mocked in conftest.py before any imports.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from lib.charlotte_digital_twin.data_acquisition.dem_store import DEMGrid
+from lib.charlotte_digital_twin.data_acquisition.elevation_fetcher import (
+    DEMData,
+    ElevationFetcher,
+    ElevationTile,
+)
+from lib.charlotte_digital_twin.environment.terrain_elevation import (
+    TerrainConfig,
+    TerrainSystem,
+    apply_elevation_to_road,
+)
+from lib.charlotte_digital_twin.geometry.coordinates import CoordinateTransformer
+
+
+SMALL_BOUNDS = {"north": 35.24, "south": 35.22, "east": -80.83, "west": -80.85}
+
+
+def _plane_grid(rows=40, cols=30, step=0.001):
+    """Grid whose elevation is linear in lat and lon."""
+    lats = 35.0 + np.arange(rows)[:, None] * step
+    lons = -80.9 + np.arange(cols)[None, :] * step
+    heights = 200 + 1000 * (lats - 35.0) + 500 * (lons + 80.9)
+    return DEMGrid.from_array(heights, 35.0, -80.9, step), heights
+
+
+class TestDEMGrid:
+    """Tests for DEMGrid."""
+
+    def test_bilinear_on_plane(self):
+        """Bilinear sampling reproduces a linear surface exactly."""
+        grid, _ = _plane_grid()
+        lats = np.array([35.0123, 35.0301, 35.0005])
+        lons = np.array([-80.8877, -80.8712, -80.8999])
+
+        expected = 200 + 1000 * (lats - 35.0) + 500 * (lons + 80.9)
+        np.testing.assert_allclose(grid.sample(lats, lons), expected, atol=1e-3)
+
+    def test_clamps_outside(self):
+        """Points outside the grid take the nearest edge value."""
+        grid, heights = _plane_grid()
+        assert grid.sample([34.0], [-81.0])[0] == pytest.approx(heights[0, 0])
+        assert grid.sample([36.0], [-80.0])[0] == pytest.approx(heights[-1, -1], rel=1e-6)
+
+    def test_tiled_matches_in_memory(self, tmp_path):
+        """A saved grid split into small tiles samples like the original."""
+        grid, heights = _plane_grid(rows=37, cols=23)
+        rng = np.random.default_rng(1)
+        heights = heights + rng.normal(0, 5, heights.shape)
+        grid = DEMGrid.from_array(heights, 35.0, -80.9, 0.001)
+
+        grid.save(tmp_path / "grid", tile_size=8)
+        opened = DEMGrid.open(tmp_path / "grid")
+
+        assert opened.tile_grid_shape == (5, 3)
+        assert len(list((tmp_path / "grid").glob("tile_*.npy"))) == 15
+        assert isinstance(opened._tile(0, 0), np.memmap)
+
+        lats = rng.uniform(35.0, 35.036, 500)
+        lons = rng.uniform(-80.9, -80.878, 500)
+        np.testing.assert_allclose(opened.sample(lats, lons), grid.sample(lats, lons), rtol=1e-6)
+        np.testing.assert_array_equal(opened.to_array(), grid.to_array())
+        assert opened.min_max() == pytest.approx(grid.min_max())
+        assert opened.nearest(35.0101, -80.8989) == pytest.approx(heights[10, 1], rel=1e-6)
+
+    def test_from_points_requires_lattice(self):
+        """Scattered samples build a grid only when they fill a lattice."""
+        grid = DEMGrid.from_points(
+            [35.0, 35.0, 35.001, 35.001], [-80.9, -80.899, -80.9, -80.899],
+            [1.0, 2.0, 3.0, 4.0], lat_step=0.001,
+        )
+        assert grid.shape == (2, 2)
+        assert grid.sample([35.0005], [-80.8995])[0] == pytest.approx(2.5)
+
+        assert DEMGrid.from_points([35.0, 35.002], [-80.9, -80.9], [1.0, 2.0], 0.001) is None
+
+
+class TestElevationFetcher:
+    """Tests for ElevationFetcher on gridded data."""
+
+    def test_simulated_dem_is_gridded(self, tmp_path):
+        """Simulated DEMs are float32 grids matching the point formula."""
+        fetcher = ElevationFetcher(cache_dir=tmp_path)
+        dem = fetcher._generate_simulated_dem(SMALL_BOUNDS, resolution=3.0)
+
+        assert dem.tiles == []
+        assert dem.grid.to_array().dtype == np.float32
+        assert dem.grid.shape == (25, 25)
+
+        lat, lon = 35.22 + 3 * 3 / 3600, -80.85 + 7 * 3 / 3600
+        expected = 230.0 + 15 * math.sin(lat * 50) * math.cos(lon * 40)
+        dist = math.sqrt((lat - 35.2271) ** 2 + (lon + 80.8431) ** 2)
+        if dist < 0.05:
+            expected = 225.0 + 3 * math.sin(dist * 100)
+        assert dem.get_at_point(lat, lon) == pytest.approx(expected, abs=1e-3)
+
+    def test_cache_stores_tiles(self, tmp_path):
+        """Cached DEMs reference memory-mapped tiles instead of JSON grids."""
+        fetcher = ElevationFetcher(cache_dir=tmp_path, preferred_source="usgs")
+        dem = fetcher.get_elevation_data(SMALL_BOUNDS, resolution=3.0)
+
+        cached = fetcher.cache_store.get(next(iter(fetcher._cache)))
+        assert "tiles" not in cached
+        assert DEMGrid.exists(tmp_path / "dem" / cached["grid"])
+
+        again = ElevationFetcher(cache_dir=tmp_path, preferred_source="usgs")
+        loaded = again.get_elevation_data(SMALL_BOUNDS, resolution=3.0)
+        assert loaded.grid.path is not None
+        np.testing.assert_array_equal(loaded.grid.to_array(), dem.grid.to_array())
+
+    def test_legacy_tiles_still_load(self, tmp_path):
+        """Old cache entries holding per-point tiles become grids on use."""
+        fetcher = ElevationFetcher(cache_dir=tmp_path)
+        step = 1 / 3600
+        legacy = {
+            "tiles": [
+                {"lat": 35.0 + i * step, "lon": -80.9 + j * step, "elevation": float(i + j)}
+                for i in range(3) for j in range(4)
+            ],
+            "bounds": {"south": 35.0, "west": -80.9, "north": 35.0 + 2 * step, "east": -80.9 + 3 * step},
+            "resolution": 1.0,
+        }
+        dem = fetcher._dict_to_dem(legacy)
+
+        assert dem.sample([35.0 + 0.5 * step], [-80.9 + 1.5 * step])[0] == pytest.approx(2.0)
+        assert dem.tiles == []
+        assert dem.get_min_max() == (0.0, 5.0)
+
+    def test_heightmap_and_contours(self, tmp_path):
+        """Heightmaps and contours are computed from the grid."""
+        fetcher = ElevationFetcher(cache_dir=tmp_path)
+        dem = fetcher._generate_simulated_dem(SMALL_BOUNDS, resolution=3.0)
+
+        heightmap = fetcher.to_heightmap(dem, resolution=16)
+        assert len(heightmap) == 16 and len(heightmap[0]) == 16
+        values = np.array(heightmap)
+        assert values.min() >= 0.0 and values.max() <= 1.0
+
+        contours = fetcher.get_contour_lines(dem, interval=2.0)
+        heights = dem.grid.to_array()
+        expected = sum(int((np.abs(heights - c["elevation"]) < 1.0).sum()) for c in contours)
+        assert contours
+        assert sum(len(c["points"]) for c in contours) == expected
+
+    def test_point_list_fallback(self):
+        """Irregular point data keeps nearest-tile lookups."""
+        dem = DEMData(tiles=[
+            ElevationTile(35.0, -80.9, 10.0, 1.0),
+            ElevationTile(35.1, -80.7, 20.0, 1.0),
+        ])
+        assert dem.sample([35.09], [-80.71]) == [20.0]
+
+
+class TestTerrainFollowing:
+    """Tests for batch terrain elevation."""
+
+    def test_procedural_batch_matches_scalar(self):
+        """Array evaluation equals the per-point procedural terrain."""
+        system = TerrainSystem()
+        config = TerrainConfig()
+        xs = np.linspace(-500.5, 500.5, 50)
+        ys = np.linspace(300.25, -200.75, 50)
+
+        batch = system.get_elevations(xs, ys, config)
+        scalar = [system._procedural_elevation(x, y, config) for x, y in zip(xs, ys)]
+        np.testing.assert_allclose(batch, scalar, atol=1e-6)
+
+    def test_road_follows_dem(self, tmp_path):
+        """Road points take elevations sampled from the DEM."""
+        transformer = CoordinateTransformer()
+        grid, _ = _plane_grid(rows=400, cols=400, step=0.0005)
+        grid.south, grid.west = 35.13, -80.94
+        dem = DEMData(grid=grid)
+
+        road = [(0.0, 0.0), (120.0, 40.0), (250.0, -80.0)]
+        result = apply_elevation_to_road(road, dem=dem, transformer=transformer)
+
+        for (x, y), (rx, ry, z) in zip(road, result):
+            geo = transformer.world_to_latlon(x, y)
+            assert (rx, ry) == (x, y)
+            assert z == pytest.approx(
+                200 + 1000 * (geo.lat - 35.13) + 500 * (geo.lon + 80.94), abs=1e-2
+            )
+
+    def test_empty_road(self):
+        """An empty path yields no points."""
+        assert apply_elevation_to_road([]) == []
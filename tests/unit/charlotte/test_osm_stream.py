@@ -0,0 +1,317 @@
+"""
+Unit tests for Charlotte Digital Twin streaming OSM loader.
+
+Tests XML and PBF streaming, columnar node storage and parse-time filters.
+
+Note: bpy and mathutils are mocked in conftest.py before any imports.
+"""
+
+import struct
+import zlib
+
+import pytest
+
+from lib.charlotte_digital_twin.data_acquisition.osm_downloader import (
+    OSMData,
+    OSMDownloader,
+    OSMNode,
+)
+from lib.charlotte_digital_twin.data_acquisition.osm_stream import (
+    NodeStore,
+    building_filter,
+    load_osm_file,
+    parse_osm_pbf_stream,
+    parse_osm_xml_stream,
+    road_filter,
+)
+
+
+SAMPLE_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<osm version="0.6">
+  <bounds minlat="35.22" minlon="-80.85" maxlat="35.23" maxlon="-80.84"/>
+  <node id="1" lat="35.2271" lon="-80.8431"/>
+  <node id="2" lat="35.2281" lon="-80.8431"/>
+  <node id="3" lat="35.2281" lon="-80.8421">
+    <tag k="amenity" v="cafe"/>
+  </node>
+  <node id="4" lat="35.2271" lon="-80.8421"/>
+  <node id="5" lat="35.2290" lon="-80.8400"/>
+  <way id="10">
+    <nd ref="1"/><nd ref="2"/>
+    <tag k="highway" v="residential"/>
+    <tag k="name" v="Tryon St"/>
+  </way>
+  <way id="11">
+    <nd ref="1"/><nd ref="2"/><nd ref="3"/><nd ref="4"/><nd ref="1"/>
+    <tag k="building" v="office"/>
+    <tag k="height" v="120m"/>
+  </way>
+  <way id="12">
+    <nd ref="4"/><nd ref="5"/>
+    <tag k="highway" v="residential"/>
+  </way>
+  <relation id="20">
+    <member type="way" ref="10" role="outer"/>
+    <tag k="type" v="route"/>
+  </relation>
+</osm>
+"""
+
+
+# -----------------------------------------------------------------------------
+# Minimal PBF writer for tests
+# -----------------------------------------------------------------------------
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _sint(value):
+    return _varint((value << 1) ^ (value >> 63))
+
+
+def _field(number, wire, payload):
+    key = _varint((number << 3) | wire)
+    if wire == 2:
+        return key + _varint(len(payload)) + payload
+    return key + payload
+
+
+def _packed(values, encode=_varint):
+    return b"".join(encode(v) for v in values)
+
+
+def _deltas(values):
+    previous = 0
+    out = []
+    for value in values:
+        out.append(value - previous)
+        previous = value
+    return out
+
+
+def _blob(blob_type, payload):
+    blob = _field(2, 0, _varint(len(payload))) + _field(3, 2, zlib.compress(payload))
+    header = _field(1, 2, blob_type.encode()) + _field(3, 0, _varint(len(blob)))
+    return struct.pack(">I", len(header)) + header + blob
+
+
+def _make_pbf(nodes, ways):
+    """Encode nodes [(id, lat, lon, tags)] and ways [(id, refs, tags)] as PBF."""
+    strings = [""]
+
+    def sid(text):
+        if text not in strings:
+            strings.append(text)
+        return strings.index(text)
+
+    keys_vals = []
+    for _, _, _, tags in nodes:
+        for k, v in tags.items():
+            keys_vals += [sid(k), sid(v)]
+        keys_vals.append(0)
+    dense = (
+        _field(1, 2, _packed(_deltas([n[0] for n in nodes]), _sint))
+        + _field(8, 2, _packed(_deltas([round(n[1] * 1e7) for n in nodes]), _sint))
+        + _field(9, 2, _packed(_deltas([round(n[2] * 1e7) for n in nodes]), _sint))
+        + _field(10, 2, _packed(keys_vals))
+    )
+
+    way_msgs = b""
+    for way_id, refs, tags in ways:
+        way = (
+            _field(1, 0, _varint(way_id))
+            + _field(2, 2, _packed([sid(k) for k in tags]))
+            + _field(3, 2, _packed([sid(v) for v in tags.values()]))
+            + _field(8, 2, _packed(_deltas(refs), _sint))
+        )
+        way_msgs += _field(3, 2, way)
+
+    group = _field(2, 2, dense) + way_msgs
+    table = b"".join(_field(1, 2, s.encode()) for s in strings)
+    block = _field(1, 2, table) + _field(2, 2, group)
+
+    bbox = _field(1, 0, _sint(-80_850_000_000)) + _field(2, 0, _sint(-80_840_000_000))
+    bbox += _field(3, 0, _sint(35_230_000_000)) + _field(4, 0, _sint(35_220_000_000))
+    header = _field(1, 2, bbox)
+    return _blob("OSMHeader", header) + _blob("OSMData", block)
+
+
+PBF_NODES = [
+    (1, 35.2271, -80.8431, {}),
+    (2, 35.2281, -80.8431, {}),
+    (3, 35.2281, -80.8421, {"amenity": "cafe"}),
+    (4, 35.2271, -80.8421, {}),
+]
+PBF_WAYS = [
+    (10, [1, 2], {"highway": "primary"}),
+    (11, [1, 2, 3, 4, 1], {"building": "yes"}),
+]
+
+
+class TestNodeStore:
+    """Tests for columnar node storage."""
+
+    def test_mapping_interface(self):
+        """Store behaves like Dict[int, OSMNode]."""
+        store = NodeStore()
+        store.add(5, 35.0, -80.0)
+        store[7] = OSMNode(7, 35.1, -80.1, {"name": "A"})
+
+        assert len(store) == 2
+        assert 5 in store and 6 not in store
+        assert store[7] == OSMNode(7, 35.1, -80.1, {"name": "A"})
+        assert store.get(6) is None
+        assert store.latlon(5) == (35.0, -80.0)
+        assert list(store) == [5, 7]
+
+    def test_retain(self):
+        """Retaining a subset keeps coordinates and tags aligned."""
+        store = NodeStore()
+        for i in range(5):
+            store.add(i, float(i), -float(i), {"n": str(i)} if i % 2 else None)
+        assert store.retain({1, 4}) == 3
+        assert store[1].tags == {"n": "1"}
+        assert store.latlon(4) == (4.0, -4.0)
+        assert store[4].tags == {}
+
+    def test_latlon_array(self):
+        """Coordinates are available as an Nx2 array."""
+        pytest.importorskip("numpy")
+        store = NodeStore()
+        store.add(1, 35.0, -80.0)
+        store.add(2, 35.5, -80.5)
+        assert store.latlon_array().tolist() == [[35.0, -80.0], [35.5, -80.5]]
+
+
+class TestXMLStream:
+    """Tests for streaming XML parsing."""
+
+    def test_full_parse(self):
+        """Everything is parsed when no filter is given."""
+        data = parse_osm_xml_stream(SAMPLE_XML)
+
+        assert len(data.nodes) == 5
+        assert data.nodes[3].tags == {"amenity": "cafe"}
+        assert list(data.ways[11].node_ids) == [1, 2, 3, 4, 1]
+        assert data.relations[20].members == [{"type": "way", "ref": 10, "role": "outer"}]
+        assert data.bounds["maxlat"] == 35.23
+
+    def test_tag_strings_interned(self):
+        """Repeated tag strings share one object."""
+        data = parse_osm_xml_stream(SAMPLE_XML)
+        first = next(k for k in data.ways[10].tags if k == "highway")
+        second = next(k for k in data.ways[12].tags if k == "highway")
+        assert first is second
+        assert data.ways[10].tags["highway"] is data.ways[12].tags["highway"]
+
+    def test_road_filter_prunes(self):
+        """Only roads and their nodes are kept."""
+        data = parse_osm_xml_stream(SAMPLE_XML, way_filter=road_filter())
+
+        assert sorted(data.ways) == [10, 12]
+        assert sorted(data.nodes) == [1, 2, 4, 5]
+        assert data.relations == {}
+
+    def test_invalid_xml(self):
+        """Malformed XML raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_osm_xml_stream(b"<osm><node id='1'")
+
+    def test_gzip_file(self, tmp_path):
+        """Compressed files are detected by extension."""
+        import gzip
+
+        path = tmp_path / "sample.osm.gz"
+        path.write_bytes(gzip.compress(SAMPLE_XML))
+        data = load_osm_file(path, way_filter=building_filter())
+        assert list(data.ways) == [11]
+
+
+class TestPBFStream:
+    """Tests for the pure-Python PBF decoder."""
+
+    def test_dense_nodes_and_ways(self):
+        """Dense nodes, tags and delta-coded refs decode correctly."""
+        data = parse_osm_pbf_stream(_make_pbf(PBF_NODES, PBF_WAYS))
+
+        assert sorted(data.nodes) == [1, 2, 3, 4]
+        lat, lon = data.nodes.latlon(3)
+        assert lat == pytest.approx(35.2281, abs=1e-9)
+        assert lon == pytest.approx(-80.8421, abs=1e-9)
+        assert data.nodes[3].tags == {"amenity": "cafe"}
+        assert list(data.ways[11].node_ids) == [1, 2, 3, 4, 1]
+        assert data.ways[10].tags == {"highway": "primary"}
+        assert data.bounds["minlon"] == pytest.approx(-80.85)
+
+    def test_filter_and_file(self, tmp_path):
+        """PBF files are loaded by extension with filters."""
+        path = tmp_path / "sample.osm.pbf"
+        path.write_bytes(_make_pbf(PBF_NODES + [(9, 35.3, -80.9, {})], PBF_WAYS))
+
+        data = load_osm_file(path, way_filter=road_filter())
+        assert list(data.ways) == [10]
+        assert sorted(data.nodes) == [1, 2]
+
+    def test_matches_xml(self, tmp_path):
+        """PBF and XML of the same data give the same roads."""
+        xml = b"<osm>" + b"".join(
+            b'<node id="%d" lat="%r" lon="%r"/>' % (i, lat, lon) for i, lat, lon, _ in PBF_NODES
+        ) + b'<way id="10"><nd ref="1"/><nd ref="2"/><tag k="highway" v="primary"/></way></osm>'
+
+        downloader = OSMDownloader(cache_dir=tmp_path)
+        from_xml = downloader.extract_roads(parse_osm_xml_stream(xml))
+        from_pbf = downloader.extract_roads(parse_osm_pbf_stream(_make_pbf(PBF_NODES, PBF_WAYS)))
+
+        assert len(from_xml) == len(from_pbf) == 1
+        for a, b in zip(from_xml[0]["coordinates"], from_pbf[0]["coordinates"]):
+            assert a["lat"] == pytest.approx(b["lat"], abs=1e-9)
+            assert a["lon"] == pytest.approx(b["lon"], abs=1e-9)
+
+
+class TestDownloaderIntegration:
+    """Tests for OSMDownloader on top of the streaming loader."""
+
+    def test_stream_roads_and_buildings(self, tmp_path):
+        """Filtered streaming extraction matches full-parse extraction."""
+        path = tmp_path / "sample.osm"
+        path.write_bytes(SAMPLE_XML)
+        downloader = OSMDownloader(cache_dir=tmp_path / "cache")
+        full = downloader._parse_osm_xml(SAMPLE_XML)
+
+        assert downloader.stream_roads(path) == downloader.extract_roads(full)
+        buildings = downloader.stream_buildings(path, min_height=100)
+        assert buildings == downloader.extract_buildings(full, min_height=100)
+        assert buildings[0]["height"] == 120.0
+
+    def test_cache_roundtrip(self, tmp_path):
+        """Columnar cache dicts load back identically, legacy dicts still load."""
+        downloader = OSMDownloader(cache_dir=tmp_path / "cache")
+        data = downloader._parse_osm_xml(SAMPLE_XML)
+
+        cached = downloader._osm_data_to_dict(data)
+        assert "node_columns" in cached
+        restored = downloader._dict_to_osm_data(cached)
+        assert dict(restored.nodes) == dict(data.nodes)
+        assert list(restored.ways[11].node_ids) == [1, 2, 3, 4, 1]
+
+        legacy = {"nodes": {"1": {"id": 1, "lat": 35.0, "lon": -80.0, "tags": {}}}}
+        assert downloader._dict_to_osm_data(legacy).nodes[1].lat == 35.0
+
+    def test_plain_dict_nodes(self, tmp_path):
+        """Hand-built OSMData with dict nodes still works."""
+        data = OSMData()
+        data.nodes = {1: OSMNode(1, 35.0, -80.0), 2: OSMNode(2, 35.1, -80.0)}
+        data.ways = parse_osm_xml_stream(
+            b'<osm><way id="1"><nd ref="1"/><nd ref="2"/><tag k="highway" v="primary"/></way></osm>'
+        ).ways
+        roads = OSMDownloader(cache_dir=tmp_path).extract_roads(data)
+        assert roads[0]["coordinates"] == [{"lat": 35.0, "lon": -80.0}, {"lat": 35.1, "lon": -80.0}]
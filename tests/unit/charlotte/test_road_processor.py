@@ -0,0 +1,129 @@
+"""
+Unit tests for Charlotte Digital Twin road processor module.
+
+Tests intersection detection and the spatial hash without Blender dependencies.
+
+Note: bpy and mathutils are mocked in conftest.py before any imports.
+"""
+
+from lib.charlotte_digital_twin.data_acquisition.osm_downloader import OSMData, OSMNode, OSMWay
+from lib.charlotte_digital_twin.geometry.road_processor import (
+    CoordinateSpatialHash,
+    RoadNetworkProcessor,
+    benchmark_road_processor,
+    osm_data_from_geojson,
+    synthetic_road_network,
+)
+from lib.charlotte_digital_twin.geometry.types import RoadType
+
+
+def _reference_intersections(processor):
+    """Original all-pairs matching of segment coordinates to nodes."""
+    usage = {}
+    for segment in processor._segments:
+        for coord in segment.coordinates:
+            for node_id, node in processor._nodes.items():
+                if (abs(node.world_coord.x - coord.x) < 0.01 and
+                        abs(node.world_coord.y - coord.y) < 0.01):
+                    usage.setdefault(node_id, []).append(segment.osm_id)
+                    break
+    return {
+        node_id: sorted(set(roads))
+        for node_id, roads in usage.items()
+        if len(set(roads)) > 1
+    }
+
+
+class TestCoordinateSpatialHash:
+    """Tests for CoordinateSpatialHash."""
+
+    def test_find_within_tolerance(self):
+        """Points within tolerance are found across cell borders."""
+        spatial = CoordinateSpatialHash(0.01)
+        spatial.insert(1, 0.0099, 5.0)
+        assert spatial.find(0.0101, 5.0) == 1
+        assert spatial.find(0.03, 5.0) is None
+
+    def test_first_inserted_wins(self):
+        """The earliest inserted match is returned."""
+        spatial = CoordinateSpatialHash(0.01)
+        spatial.insert(7, 1.001, 1.0)
+        spatial.insert(3, 0.999, 1.0)
+        assert spatial.find(1.0, 1.0) == 7
+        assert len(spatial) == 2
+
+
+class TestIntersectionDetection:
+    """Tests for RoadNetworkProcessor intersection detection."""
+
+    def test_grid_matches_reference(self):
+        """Spatial hash detection equals the original all-pairs scan."""
+        processor = RoadNetworkProcessor()
+        processor.process(synthetic_road_network(40))
+
+        expected = _reference_intersections(processor)
+        found = {i.node_id: sorted(i.roads) for i in processor.get_intersections()}
+        assert found == expected
+        assert len(found) > 0
+
+    def test_coincident_nodes_join(self):
+        """Distinct OSM nodes at the same position form one intersection."""
+        data = OSMData()
+        data.nodes = {
+            1: OSMNode(1, 35.2271, -80.8431),
+            2: OSMNode(2, 35.2281, -80.8431),
+            3: OSMNode(3, 35.2271, -80.8431),  # Duplicate of node 1
+            4: OSMNode(4, 35.2271, -80.8421),
+        }
+        data.ways = {
+            10: OSMWay(10, [1, 2], {"highway": "primary"}),
+            11: OSMWay(11, [3, 4], {"highway": "residential"}),
+        }
+
+        processor = RoadNetworkProcessor()
+        processor.process(data)
+        intersections = processor.get_intersections()
+
+        assert len(intersections) == 1
+        assert intersections[0].node_id == 1
+        assert sorted(intersections[0].roads) == [10, 11]
+        assert intersections[0].road_types == {RoadType.PRIMARY, RoadType.RESIDENTIAL}
+        assert processor.get_node_adjacency()[1] == [10, 11]
+
+    def test_segments_without_node_ids(self):
+        """Segments added without OSM node IDs fall back to coordinates."""
+        processor = RoadNetworkProcessor()
+        processor.process(synthetic_road_network(12))
+        expected = {i.node_id: sorted(i.roads) for i in processor.get_intersections()}
+
+        processor._segment_node_ids = {}
+        processor._intersections = {}
+        processor._detect_intersections()
+        found = {i.node_id: sorted(i.roads) for i in processor.get_intersections()}
+        assert found == expected
+
+
+class TestBenchmarks:
+    """Tests for benchmark helpers."""
+
+    def test_synthetic_network_size(self):
+        """Synthetic network has the requested number of ways."""
+        data = synthetic_road_network(500, shape_points=1)
+        assert len(data.ways) == 500
+        assert all(len(w.node_ids) == 3 for w in data.ways.values())
+
+    def test_benchmark_synthetic(self):
+        """Benchmark reports counts and timings."""
+        result = benchmark_road_processor(num_ways=200)
+        assert result["segments"] == 200
+        assert result["intersections"] > 0
+        assert result["process_seconds"] > 0
+
+    def test_bundled_charlotte_footprints(self):
+        """Bundled Charlotte footprints convert to ways with shared nodes."""
+        data = osm_data_from_geojson()
+        assert len(data.ways) > 1000
+
+        result = benchmark_road_processor(data)
+        assert result["segments"] == len(data.ways)
+        assert result["intersections"] > 0
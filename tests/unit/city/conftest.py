@@ -0,0 +1,52 @@
+"""
+Fixtures for lib.animation.city unit tests.
+
+The lib.animation.city package __init__ does not import outside Blender,
+so submodules are loaded under a bare package that shares its directory
+without executing the __init__.
+"""
+
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+CITY_DIR = Path(__file__).resolve().parents[3] / "lib" / "animation" / "city"
+CITY_PACKAGE = "_city_under_test"
+
+
+def load_city_module(name):
+    """Import lib/animation/city/<name>.py with working relative imports."""
+    if CITY_PACKAGE not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            CITY_PACKAGE, CITY_DIR / "__init__.py", submodule_search_locations=[str(CITY_DIR)]
+        )
+        sys.modules[CITY_PACKAGE] = importlib.util.module_from_spec(spec)
+    return importlib.import_module(f"{CITY_PACKAGE}.{name}")
+
+
+@pytest.fixture
+def road_graph():
+    return load_city_module("road_graph")
+
+
+@pytest.fixture
+def road_network():
+    return load_city_module("road_network")
+
+
+@pytest.fixture
+def chase_coordinator():
+    return load_city_module("chase_coordinator")
+
+
+@pytest.fixture
+def traffic_ai():
+    return load_city_module("traffic_ai")
+
+
+@pytest.fixture
+def traffic_sim():
+    return load_city_module("traffic_sim")
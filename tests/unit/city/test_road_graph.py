@@ -0,0 +1,317 @@
+"""
+Unit tests for lib/animation/city/road_graph.py and RoadNetwork routing.
+
+Routes are checked against a plain Dijkstra over brute-force adjacency.
+"""
+
+import heapq
+import math
+import random
+from types import SimpleNamespace
+
+import pytest
+
+
+def _random_segments(count, seed=0, size=400.0, link=90.0):
+    """Random road segments between nearby points, in random directions."""
+    rng = random.Random(seed)
+    points = [(rng.uniform(0, size), rng.uniform(0, size), 0.0) for _ in range(count)]
+    segments = []
+    for i, a in enumerate(points):
+        for b in points[i + 1:]:
+            if math.hypot(a[0] - b[0], a[1] - b[1]) < link and rng.random() < 0.5:
+                start, end = (a, b) if rng.random() < 0.5 else (b, a)
+                segments.append(SimpleNamespace(id=f"s{len(segments)}", start=start, end=end))
+    return segments
+
+
+def _length(segment):
+    return math.dist(segment.start, segment.end)
+
+
+def _touches(a, b, tolerance=1.0):
+    return abs(a[0] - b[0]) < tolerance and abs(a[1] - b[1]) < tolerance
+
+
+def _dijkstra_cost(segments, start_id, end_id):
+    """Reference shortest path weight using the RoadGraph junction rule."""
+    adjacency = {s.id: [] for s in segments}
+    for a in segments:
+        for b in segments:
+            if a is not b and (_touches(a.end, b.start) or _touches(a.start, b.end)):
+                adjacency[a.id].append((b.id, (_length(a) + _length(b)) / 2))
+
+    dist = {start_id: 0.0}
+    heap = [(0.0, start_id)]
+    while heap:
+        cost, node = heapq.heappop(heap)
+        if node == end_id:
+            return cost
+        if cost > dist[node]:
+            continue
+        for other, weight in adjacency[node]:
+            if cost + weight < dist.get(other, math.inf):
+                dist[other] = cost + weight
+                heapq.heappush(heap, (cost + weight, other))
+    return None
+
+
+def _path_cost(segments, path):
+    """Weight of a segment path, asserting consecutive segments connect."""
+    by_id = {s.id: s for s in segments}
+    cost = 0.0
+    for a, b in zip(path, path[1:]):
+        sa, sb = by_id[a], by_id[b]
+        assert _touches(sa.end, sb.start) or _touches(sa.start, sb.end)
+        cost += (_length(sa) + _length(sb)) / 2
+    return cost
+
+
+def _build_graph(road_graph, segments):
+    graph = road_graph.RoadGraph()
+    for segment in segments:
+        graph.add(segment)
+    return graph
+
+
+class TestEndpointKDTree:
+    """Tests for nearest-endpoint lookup."""
+
+    def test_matches_brute_force(self, road_graph):
+        """Nearest point and distance equal a linear scan."""
+        rng = random.Random(1)
+        points = [(rng.uniform(0, 100), rng.uniform(0, 100), i) for i in range(300)]
+        tree = road_graph.EndpointKDTree(points)
+
+        for _ in range(200):
+            x, y = rng.uniform(-10, 110), rng.uniform(-10, 110)
+            expected = min(points, key=lambda p: (math.hypot(p[0] - x, p[1] - y), p[2]))
+            label, distance = tree.nearest(x, y)
+            assert label == expected[2]
+            assert distance == pytest.approx(math.hypot(expected[0] - x, expected[1] - y))
+
+    def test_ties_prefer_smaller_label(self, road_graph):
+        """Equidistant points resolve to the earliest label."""
+        tree = road_graph.EndpointKDTree([(1.0, 0.0, 5), (-1.0, 0.0, 2), (0.0, 1.0, 9)])
+        assert tree.nearest(0.0, 0.0)[0] == 2
+
+    def test_empty(self, road_graph):
+        """An empty tree has no nearest point."""
+        assert road_graph.EndpointKDTree([]).nearest(0.0, 0.0) is None
+
+
+class TestRoadGraph:
+    """Tests for A* routing and the contraction hierarchy."""
+
+    def test_astar_matches_dijkstra(self, road_graph):
+        """A* finds valid paths with the reference shortest weight."""
+        segments = _random_segments(60, seed=2)
+        graph = _build_graph(road_graph, segments)
+        rng = random.Random(3)
+
+        for _ in range(40):
+            a, b = rng.sample(segments, 2)
+            expected = _dijkstra_cost(segments, a.id, b.id)
+            path = graph.shortest_path(a.id, b.id)
+            if expected is None:
+                assert path == []
+            else:
+                assert path[0] == a.id and path[-1] == b.id
+                assert _path_cost(segments, path) == pytest.approx(expected)
+
+    def test_hierarchy_matches_astar(self, road_graph):
+        """Contraction hierarchy queries return paths as short as A*."""
+        segments = _random_segments(60, seed=4)
+        graph = _build_graph(road_graph, segments)
+        hierarchy = graph.build_contraction_hierarchy()
+        assert hierarchy.version == graph.version
+        rng = random.Random(5)
+
+        for _ in range(60):
+            a, b = rng.sample(segments, 2)
+            astar = graph.shortest_path(a.id, b.id)
+            ch = hierarchy.shortest_path(a.id, b.id)
+            if not astar:
+                assert ch == []
+            else:
+                assert ch[0] == a.id and ch[-1] == b.id
+                assert _path_cost(segments, ch) == pytest.approx(_path_cost(segments, astar))
+
+        assert hierarchy.shortest_path(a.id, a.id) == [a.id]
+
+    def test_incremental_edits_match_rebuild(self, road_graph):
+        """Adjacency after removals equals a graph built from scratch."""
+        segments = _random_segments(40, seed=6)
+        graph = _build_graph(road_graph, segments)
+        removed = segments[::3]
+        for segment in removed:
+            assert graph.remove(segment.id)
+        assert not graph.remove(removed[0].id)
+
+        kept = [s for s in segments if s not in removed]
+        fresh = _build_graph(road_graph, kept)
+        assert len(graph) == len(fresh) == len(kept)
+        for segment in kept:
+            assert sorted(graph.neighbors(segment.id)) == sorted(fresh.neighbors(segment.id))
+
+    def test_nearest_segment(self, road_graph):
+        """Nearest segment is the one owning the closest endpoint."""
+        graph = _build_graph(road_graph, [
+            SimpleNamespace(id="a", start=(0, 0, 0), end=(100, 0, 0)),
+            SimpleNamespace(id="b", start=(100, 0, 0), end=(100, 100, 0)),
+        ])
+        assert graph.nearest_segment(-5.0, 2.0) == "a"
+        assert graph.nearest_segment(98.0, 90.0) == "b"
+        assert graph.successors("a") == ["b"]
+
+
+def _grid_network(road_network, size=4, spacing=100.0):
+    """Grid of two-way streets, one segment per direction."""
+    network = road_network.RoadNetwork()
+    for i in range(size):
+        for j in range(size - 1):
+            for a, b in [((j * spacing, i * spacing, 0), ((j + 1) * spacing, i * spacing, 0)),
+                         ((i * spacing, j * spacing, 0), (i * spacing, (j + 1) * spacing, 0))]:
+                network.add_road_segment(a, b)
+                network.add_road_segment(b, a)
+    return network
+
+
+def _detour_network(road_network):
+    """One-way chain from (0, 0) to (300, 0) with a detour around x=100..200."""
+    network = road_network.RoadNetwork()
+    points = [(0, 0, 0), (100, 0, 0), (100, 100, 0), (200, 100, 0), (200, 0, 0), (300, 0, 0)]
+    for a, b in zip(points, points[1:]):
+        network.add_road_segment(a, b)
+    return network
+
+
+def _route_ids(network):
+    return [s.id for s in network.find_route((0, 0), (300, 0))]
+
+
+DETOUR = ["road_0", "road_1", "road_2", "road_3", "road_4"]
+
+
+class TestRoadNetworkRouting:
+    """Tests for RoadNetwork.find_route and its caches."""
+
+    def test_find_route_shortest(self, road_network):
+        """find_route returns connected segments from the nearest start to end."""
+        network = _grid_network(road_network)
+        route = network.find_route((0, 0), (300, 300))
+
+        assert route
+        assert tuple(route[0].start)[:2] == (0, 0)
+        assert tuple(route[-1].end)[:2] == (300, 300)
+        assert sum(s.length for s in route) == pytest.approx(600.0)
+
+    def test_hierarchy_route(self, road_network):
+        """Routes from the contraction hierarchy have the same length."""
+        network = _grid_network(road_network)
+        expected = sum(s.length for s in network.find_route((0, 0), (300, 200), use_cache=False))
+
+        network.build_contraction_hierarchy()
+        route = network.find_route((0, 0), (300, 200), use_cache=False)
+        assert sum(s.length for s in route) == pytest.approx(expected)
+
+    @pytest.mark.parametrize("use_hierarchy", [False, True])
+    def test_cache_invalidated_by_add_segment(self, road_network, use_hierarchy):
+        """A new shortcut replaces the cached route for the same endpoints."""
+        network = _detour_network(road_network)
+        if use_hierarchy:
+            network.build_contraction_hierarchy()
+        assert _route_ids(network) == DETOUR
+
+        shortcut = network.add_road_segment((100, 0, 0), (200, 0, 0))
+        assert _route_ids(network) == ["road_0", shortcut.id, "road_4"]
+
+    @pytest.mark.parametrize("use_hierarchy", [False, True])
+    def test_direct_segment_replacement_rebuilds(self, road_network, use_hierarchy):
+        """Replacing a segment through the mapping rebuilds the graph."""
+        network = _detour_network(road_network)
+        shortcut = network.add_road_segment((100, 0, 0), (200, 0, 0))
+        if use_hierarchy:
+            network.build_contraction_hierarchy()
+        assert shortcut.id in _route_ids(network)
+
+        network.segments[shortcut.id] = road_network.RoadSegment(shortcut.id, (500, 500, 0), (600, 500, 0))
+        assert _route_ids(network) == DETOUR
+
+        del network.segments[shortcut.id]
+        assert _route_ids(network) == DETOUR
+        network.segments.update({shortcut.id: shortcut})
+        assert shortcut.id in _route_ids(network)
+
+    @pytest.mark.parametrize("use_hierarchy", [False, True])
+    def test_in_place_edit_rebuilds(self, road_network, use_hierarchy):
+        """Moving a segment's endpoint rebuilds the graph and hierarchy."""
+        network = _detour_network(road_network)
+        shortcut = network.add_road_segment((100, 0, 0), (200, 0, 0))
+        if use_hierarchy:
+            network.build_contraction_hierarchy()
+        assert shortcut.id in _route_ids(network)
+
+        shortcut.end = (150.0, -50.0, 0.0)
+        assert _route_ids(network) == DETOUR
+
+    def test_edit_in_other_network_keeps_graph(self, road_network):
+        """Editing another network's segment does not rebuild this network."""
+        network = _detour_network(road_network)
+        network.build_contraction_hierarchy()
+        assert _route_ids(network) == DETOUR
+        graph, hierarchy = network._road_graph, network._hierarchy
+
+        other = _detour_network(road_network)
+        other.segments["road_2"].end = (900.0, 900.0, 0.0)
+        assert _route_ids(other) == []
+
+        assert _route_ids(network) == DETOUR
+        assert network._road_graph is graph
+        assert network._hierarchy is hierarchy
+
+    def test_add_after_direct_edit(self, road_network):
+        """add_segment does not hide a pending direct edit."""
+        network = _detour_network(road_network)
+        network.segments["road_2"].start = (900.0, 900.0, 0.0)
+        network.add_road_segment((1000, 1000, 0), (1100, 1000, 0))
+        assert _route_ids(network) == []
+
+    def test_removed_segment_not_routed(self, road_network):
+        """remove_segment drops the segment from cached routes."""
+        network = _detour_network(road_network)
+        shortcut = network.add_road_segment((100, 0, 0), (200, 0, 0))
+        assert shortcut.id in _route_ids(network)
+
+        assert network.remove_segment(shortcut.id)
+        assert _route_ids(network) == DETOUR
+
+    def test_waypoints_follow_travel_direction(self, road_network):
+        """Waypoints run start to end with shared junctions listed once."""
+        network = _grid_network(road_network, size=3)
+        waypoints = network.find_route_waypoints((200, 200), (0, 0))
+
+        assert waypoints[0][:2] == (200.0, 200.0)
+        assert waypoints[-1][:2] == (0.0, 0.0)
+        assert len(waypoints) == len(set(waypoints))
+        assert all(len(point) == 3 for point in waypoints)
+
+
+class TestChaseRouting:
+    """Tests for chase_coordinator's use of road routing."""
+
+    def test_plan_route_uses_waypoints(self, road_network, chase_coordinator):
+        """PathPlanner follows the road network's waypoint polyline."""
+        network = _grid_network(road_network, size=3)
+        planner = chase_coordinator.PathPlanner(network)
+
+        route = planner.plan_route((0, 0), (200, 100))
+        assert route == network.find_route_waypoints((0, 0), (200, 100))
+        assert planner.main_route == route
+
+    def test_plan_route_without_roads(self, road_network, chase_coordinator):
+        """An empty network falls back to a procedural route."""
+        planner = chase_coordinator.PathPlanner(road_network.RoadNetwork())
+        route = planner.plan_route((0, 0), (300, 0))
+        assert route[0] == (0, 0, 0)
+        assert len(route) > 2
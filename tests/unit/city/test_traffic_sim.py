@@ -0,0 +1,199 @@
+"""
+Unit tests for lib/animation/city/traffic_sim.py and the TrafficController
+grid neighbours, bake and apply_bake.
+"""
+
+import copy
+import math
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def _brute_force_pairs(points, radius):
+    pairs = set()
+    for i, a in enumerate(points):
+        for j, b in enumerate(points):
+            if i != j and math.hypot(a[0] - b[0], a[1] - b[1]) < radius:
+                pairs.add((i, j))
+    return pairs
+
+
+class TestUniformGrid:
+    """Tests for grid neighbour queries."""
+
+    def test_pairs_match_brute_force(self, traffic_sim):
+        """Grid pairs equal an all-pairs scan, including negative cells."""
+        points = np.random.default_rng(0).uniform(-60, 60, (300, 2))
+        grid = traffic_sim.UniformGrid(10.0)
+        grid.build(points)
+
+        for radius in (10.0, 4.0):
+            i, j, distance = grid.pairs(radius)
+            assert set(zip(i.tolist(), j.tolist())) == _brute_force_pairs(points, radius)
+            assert np.allclose(distance, np.hypot(*(points[j] - points[i]).T))
+
+    def test_nearest_distance(self, traffic_sim):
+        """Nearest distance is the closest other point, or inf."""
+        points = np.array([[0.0, 0.0], [3.0, 4.0], [100.0, 100.0]])
+        grid = traffic_sim.UniformGrid(10.0)
+        grid.build(points)
+        assert grid.nearest_distance(10.0).tolist() == [5.0, 5.0, math.inf]
+
+    def test_radius_limited_by_cell_size(self, traffic_sim):
+        """Queries wider than a cell are rejected."""
+        grid = traffic_sim.UniformGrid(5.0)
+        grid.build(np.zeros((2, 2)))
+        with pytest.raises(ValueError):
+            grid.pairs(6.0)
+        with pytest.raises(ValueError):
+            traffic_sim.UniformGrid(0.0)
+
+
+def _controller(traffic_ai, road_network, **config):
+    config = traffic_ai.TrafficConfig(**{"min_speed": 40.0, "max_speed": 40.0, **config})
+    return traffic_ai.TrafficController(road_network.RoadNetwork(), config)
+
+
+def _spawn_scene(controller):
+    """Vehicles clearly inside or outside safe distance, some near a threat."""
+    rng = np.random.default_rng(1)
+    for k in range(12):
+        x, y = (k % 4) * 40.0, (k // 4) * 40.0
+        route = [(x + 30.0, y + rng.uniform(-20, 20), 0.0), (x + 60.0, y, 0.0)]
+        agent = controller.spawn_vehicle((x, y, 0.0), route)
+        agent.state.rotation = float(rng.uniform(-math.pi, math.pi))
+        agent.state.speed = float(rng.uniform(0, 10))
+    # Two pairs well within safe_distance (10 m)
+    controller.spawn_vehicle((3.0, 2.0, 0.0), [(50.0, 2.0, 0.0)])
+    controller.spawn_vehicle((83.0, 40.0, 0.0), [(120.0, 80.0, 0.0)])
+    for agent in controller.agents.values():
+        agent.avoidance.add_threat("hero", (82.0, 45.0, 0.0), (0.0, 0.0, 0.0))
+
+
+class TestTrafficSimulation:
+    """Tests for the vectorized step against VehicleAgent."""
+
+    def test_step_matches_vehicle_agents(self, traffic_ai, traffic_sim, road_network):
+        """One vectorized step equals updating each agent against the same snapshot."""
+        controller = _controller(traffic_ai, road_network)
+        _spawn_scene(controller)
+        simulation = controller.to_simulation(seed=0)
+        delta_time = 1 / 24
+
+        agents = list(controller.agents.values())
+        snapshot = copy.deepcopy(agents)
+        for agent in agents:
+            agent.update(delta_time, snapshot, {})
+        simulation.step(delta_time)
+
+        states = [traffic_sim.AGENT_STATES[code] for code in simulation.states]
+        assert states == [agent.state.state for agent in agents]
+        assert {traffic_ai.AgentState.AVOIDING, traffic_ai.AgentState.FLEEING} <= set(states)
+        assert np.allclose(simulation.positions, [agent.state.position for agent in agents])
+        assert np.allclose(simulation.headings, [agent.state.rotation for agent in agents])
+        assert np.allclose(simulation.speeds, [agent.state.speed for agent in agents])
+
+    def test_waypoints_advance_and_despawn(self, traffic_sim):
+        """Vehicles follow their route and leave the simulation beyond the extent."""
+        simulation = traffic_sim.TrafficSimulation(seed=0, despawn_extent=100.0)
+        simulation.spawn((0.0, 0.0, 0.0), [(4.0, 0.0), (200.0, 0.0)], speed=15.0)
+        simulation.step(0.1)
+        assert simulation._route_cursor[0] == 1
+
+        for _ in range(200):
+            simulation.step(0.1)
+        assert simulation.alive_count == 0
+
+
+class TestTrafficController:
+    """Tests for controller integration with the simulation core."""
+
+    def test_neighbor_lists_cover_safe_distance(self, traffic_ai, road_network):
+        """Every vehicle within reach is a candidate neighbour."""
+        controller = _controller(traffic_ai, road_network)
+        rng = np.random.default_rng(2)
+        for x, y in rng.uniform(-80, 80, (150, 2)):
+            controller.spawn_vehicle((float(x), float(y), 0.0), [])
+        agents = list(controller.agents.values())
+        delta_time = 1 / 24
+
+        neighbors = controller._neighbor_lists(agents, delta_time)
+        radius = controller.config.safe_distance + 2 * controller.config.max_speed / 3.6 * delta_time
+        points = [agent.state.position for agent in agents]
+        expected = _brute_force_pairs(points, radius)
+        found = {(i, agents.index(other)) for i, group in enumerate(neighbors) for other in group}
+        assert found == expected
+
+    def test_bake_round_trip(self, traffic_ai, traffic_sim, road_network, tmp_path, monkeypatch):
+        """A bake survives save/load and apply_bake keys its exact values."""
+        controller = _controller(traffic_ai, road_network, spawn_rate=0.01)
+        _spawn_scene(controller)
+        for agent in controller.agents.values():
+            agent.blender_object = _FakeObject(agent.id)
+
+        bake = controller.bake(frame_count=12, fps=24, seed=3)
+        assert bake.frame_count == 12
+        assert bake.vehicle_count == len(controller.agents)
+        assert bake.alive[0].all()
+
+        loaded = traffic_sim.TrafficBake.load(bake.save(tmp_path / "traffic"))
+        assert loaded.vehicle_ids == bake.vehicle_ids
+        assert loaded.fps == bake.fps
+        for name in ("positions", "headings", "alive", "states"):
+            assert np.array_equal(getattr(loaded, name), getattr(bake, name))
+
+        monkeypatch.setattr(traffic_sim, "BLENDER_AVAILABLE", True)
+        objects = controller.apply_bake(loaded, frame_start=10)
+        for column, vehicle_id in enumerate(loaded.vehicle_ids):
+            action = objects[vehicle_id].animation_data.action
+            frames, x = action.curve("location", 0)
+            assert frames.tolist() == list(range(10, 22))
+            assert np.array_equal(x, loaded.positions[:, column, 0])
+            _, heading = action.curve("rotation_euler", 2)
+            assert np.allclose(np.angle(np.exp(1j * heading)), loaded.headings[:, column], atol=1e-5)
+
+
+class _FakeKeyframes:
+    def __init__(self):
+        self.co = np.empty(0, dtype=np.float32)
+
+    def add(self, count):
+        self.co = np.zeros(2 * count, dtype=np.float32)
+
+    def foreach_set(self, attribute, values):
+        self.co[:] = values
+
+
+class _FakeAction:
+    def __init__(self):
+        self.curves = {}
+        self.fcurves = SimpleNamespace(find=self._find, new=self._new)
+
+    def _find(self, data_path, index=0):
+        return self.curves.get((data_path, index))
+
+    def _new(self, data_path, index=0):
+        curve = SimpleNamespace(keyframe_points=_FakeKeyframes(), update=lambda: None)
+        self.curves[(data_path, index)] = curve
+        return curve
+
+    def curve(self, data_path, index):
+        co = self.curves[(data_path, index)].keyframe_points.co
+        return co[0::2], co[1::2]
+
+
+class _FakeObject:
+    """Stands in for a Blender object with an existing action."""
+
+    def __init__(self, name):
+        self.name = name
+        self.animation_data = SimpleNamespace(action=_FakeAction())
+        self.hide_viewport = False
+        self.hide_render = False
+        self.keys = []
+
+    def keyframe_insert(self, data_path, frame):
+        self.keys.append((data_path, frame))
@@ -11,6 +11,7 @@ Tests the culling strategy system including:
 - OcclusionCuller class
 - create_frustum_from_camera function
 - cull_instances function
+- Batched culling (InstanceArrays, InstanceBVH, camera paths)
 """
 
 import pytest
@@ -24,8 +25,13 @@ from lib.geometry_nodes.culling import (
     InstanceBounds,
     CullingManager,
     OcclusionCuller,
+    InstanceArrays,
+    InstanceBVH,
+    CameraFrame,
+    CULLED_OCCLUSION,
     create_frustum_from_camera,
     cull_instances,
+    decode_bitset,
 )
 
 
@@ -709,3 +715,270 @@ class TestCullingManagerStatistics:
         assert result.statistics["total"] == 3
         # At least some culling should happen
         assert result.statistics["frustum_culled"] + result.statistics["distance_culled"] + result.statistics["small_object_culled"] > 0
+
+
+def _random_scene(np, count, seed=0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(-300.0, 300.0, (count, 3))
+    radii = rng.uniform(0.05, 6.0, count)
+    return InstanceArrays(positions, radii)
+
+
+def _camera_frames(frames):
+    cameras = []
+    for frame in range(frames):
+        yaw = frame * 0.3
+        cameras.append(CameraFrame(
+            frame=frame + 1,
+            position=(frame * 5.0, 2.0, 0.0),
+            forward=(math.sin(yaw), 0.0, -math.cos(yaw)),
+            up=(0.0, 1.0, 0.0),
+            right=(math.cos(yaw), 0.0, math.sin(yaw)),
+            fov=50.0,
+            aspect=1.5,
+            near=0.1,
+            far=250.0,
+        ))
+    return cameras
+
+
+class TestBatchedCulling:
+    """Tests for array-based culling with InstanceBVH."""
+
+    def test_cull_arrays_matches_instances(self):
+        """Batched culling gives the same result as per-instance culling."""
+        np = pytest.importorskip("numpy")
+        scene = _random_scene(np, 500)
+        sizes = np.linspace(0.0, 0.05, len(scene))
+        instances = [
+            InstanceBounds(
+                instance_id=f"inst_{i}",
+                position=tuple(scene.positions[i]),
+                radius=float(scene.radii[i]),
+                screen_size=float(sizes[i]),
+            )
+            for i in range(len(scene))
+        ]
+        manager = CullingManager(CullingConfig(max_distance=250.0, min_screen_size=0.02))
+        manager.set_frustum(_manager_frustum())
+
+        expected = CullingResult(statistics={})
+        for instance in instances:
+            reason = _scalar_reason(manager, instance)
+            if reason:
+                expected.culled[instance.instance_id] = reason
+            else:
+                expected.visible.append(instance.instance_id)
+
+        result = manager.cull_instances(instances)
+        assert result.visible == expected.visible
+        assert result.culled == expected.culled
+
+    @pytest.mark.parametrize("leaf_size", [1, 5, 64])
+    def test_bvh_matches_brute_force(self, leaf_size):
+        """BVH traversal classifies every instance like the flat test."""
+        np = pytest.importorskip("numpy")
+        scene = _random_scene(np, 2000, seed=leaf_size)
+        bvh = InstanceBVH(scene, leaf_size=leaf_size)
+        manager = CullingManager(CullingConfig(max_distance=200.0, min_screen_size=0.01))
+
+        for camera in _camera_frames(4):
+            manager.set_frustum_from_camera(
+                camera.position, camera.forward, camera.up, camera.right,
+                camera.fov, camera.aspect, camera.near, camera.far,
+            )
+            flat = manager.cull_arrays(scene)
+            tree = manager.cull_arrays(scene, bvh=bvh)
+            np.testing.assert_array_equal(tree.codes, flat.codes)
+            assert tree.statistics == flat.statistics
+
+    def test_bvh_rejects_clusters(self):
+        """Clusters behind the camera are rejected without per-instance tests."""
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(1)
+        ahead = rng.uniform(-5.0, 5.0, (1000, 3)) + (0.0, 0.0, -50.0)
+        behind = rng.uniform(-5.0, 5.0, (1000, 3)) + (0.0, 0.0, 50.0)
+        scene = InstanceArrays(np.vstack([ahead, behind]), 0.1)
+        bvh = InstanceBVH(scene, leaf_size=32)
+
+        manager = CullingManager(CullingConfig(enable_small_object_culling=False))
+        manager.set_frustum_from_camera(
+            (0.0, 0.0, 0.0), (0.0, 0.0, -1.0), (0.0, 1.0, 0.0), (1.0, 0.0, 0.0),
+            90.0, 1.0, 0.1, 100.0,
+        )
+        result = manager.cull_arrays(scene, bvh=bvh)
+
+        assert result.visible[:1000].all()
+        assert not result.visible[1000:].any()
+        assert bvh.last_instances_tested < len(scene) // 2
+
+    def test_camera_path_bitsets(self):
+        """Camera path culling keeps a visibility bitset per frame for GN."""
+        np = pytest.importorskip("numpy")
+        scene = _random_scene(np, 300)
+        manager = CullingManager(CullingConfig(max_distance=200.0))
+
+        results = manager.cull_camera_path(scene, _camera_frames(3), leaf_size=16)
+
+        assert [r.frame for r in results] == [1, 2, 3]
+        gn_data = manager.to_gn_input()
+        visibility = gn_data["visibility"]
+        assert visibility["instance_count"] == 300
+        assert set(visibility["frames"]) == {"1", "2", "3"}
+        for result in results:
+            assert len(result.bitset()) == 38
+            decoded = decode_bitset(visibility["frames"][str(result.frame)], 300)
+            np.testing.assert_array_equal(decoded, result.visible)
+
+
+def _manager_frustum():
+    return Frustum.from_camera(
+        (0.0, 0.0, 0.0), (0.0, 0.0, -1.0), (0.0, 1.0, 0.0), (1.0, 0.0, 0.0),
+        60.0, 1.5, 0.1, 200.0,
+    )
+
+
+def _scalar_reason(manager, instance):
+    """Cull reason using the scalar tests, in cull_instances order."""
+    if manager._calculate_distance(instance.position) > manager.config.max_distance:
+        return "distance"
+    if not manager.frustum.is_sphere_inside(instance.position, instance.radius):
+        return "frustum"
+    if instance.screen_size < manager.config.min_screen_size:
+        return "small_object"
+    return ""
+
+
+def _city_blocks(np, blocks=8, block=40.0, street=12.0, seed=0):
+    """Grid of building boxes (Z up) separated by streets."""
+    rng = np.random.default_rng(seed)
+    gx, gy = np.meshgrid(np.arange(blocks), np.arange(blocks))
+    low = np.stack([gx.ravel() * (block + street), gy.ravel() * (block + street), np.zeros(gx.size)], axis=1)
+    size = np.stack([
+        np.full(gx.size, block), np.full(gx.size, block), rng.uniform(10.0, 60.0, gx.size),
+    ], axis=1)
+    return low, low + size
+
+
+def _segments_blocked(np, start, points, low, high):
+    """Whether each segment start->point passes through any box."""
+    direction = points - start
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse = 1.0 / direction
+        t1 = (low[None] - start) * inverse[:, None]
+        t2 = (high[None] - start) * inverse[:, None]
+    enter = np.nanmax(np.minimum(t1, t2), axis=2)
+    leave = np.nanmin(np.maximum(t1, t2), axis=2)
+    return ((leave >= np.maximum(enter, 0.0)) & (enter < 1.0 - 1e-9) & (leave > 0.0)).any(axis=1)
+
+
+class TestHiZOcclusion:
+    """Tests for the rasterizing Hi-Z occlusion culler."""
+
+    def test_depth_from_instance_bounds(self):
+        """Sphere-only occluders use their inscribed cube."""
+        pytest.importorskip("numpy")
+        culler = OcclusionCuller(resolution=64)
+        culler.build_depth_buffer(
+            [InstanceBounds(instance_id="occ1", position=(0.0, 0.0, -5.0), radius=2.0)],
+            camera_position=(0.0, 0.0, 0.0),
+            camera_forward=(0.0, 0.0, -1.0),
+        )
+
+        assert culler.depth_buffer[32, 32] == pytest.approx(5.0 - 2.0 / math.sqrt(3), rel=1e-3)
+        assert culler.depth_buffer[0, 0] == culler.far
+        assert culler.is_occluded(InstanceBounds(position=(0.0, 0.0, -10.0), radius=0.5))
+        assert not culler.is_occluded(InstanceBounds(position=(0.0, 0.0, -2.0), radius=0.5))
+        assert not culler.is_occluded(InstanceBounds(position=(4.0, 0.0, -10.0), radius=0.5))
+
+    def test_mesh_occluder(self):
+        """Mesh walls hide boxes behind them."""
+        np = pytest.importorskip("numpy")
+        culler = OcclusionCuller(resolution=128)
+        wall = [(-5.0, 10.0, -1.0), (5.0, 10.0, -1.0), (5.0, 10.0, 6.0), (-5.0, 10.0, 6.0)]
+        culler.add_occluder_mesh(wall, [(0, 1, 2, 3)])
+        culler.set_camera((0.0, 0.0, 1.5), (0.0, 1.0, 0.0), fov=60.0, aspect=1.0)
+        culler.render()
+
+        hidden = culler.occluded_boxes(
+            [(-1.0, 20.0, 0.0), (8.0, 20.0, 0.0), (-1.0, 5.0, 0.0), (-1.0, -20.0, 0.0)],
+            [(1.0, 22.0, 2.0), (10.0, 22.0, 2.0), (1.0, 7.0, 2.0), (1.0, -18.0, 2.0)],
+        )
+        np.testing.assert_array_equal(hidden, [True, False, False, False])
+
+        with pytest.raises(ValueError):
+            culler.add_occluder_mesh(wall, [(0, 1)])
+
+    def test_city_blocks_conservative_and_effective(self):
+        """Never hides visible boxes, and finds most hidden ones."""
+        np = pytest.importorskip("numpy")
+        low, high = _city_blocks(np)
+        camera = np.array([3 * 52.0 - 6.0, -20.0, 1.7])
+        forward = np.array([0.3, 1.0, 0.0])
+
+        culler = OcclusionCuller(resolution=192)
+        culler.add_occluder_boxes(low, high)
+        culler.set_camera(tuple(camera), tuple(forward), fov=60.0, aspect=16 / 9, far=1000.0)
+        culler.render()
+
+        rng = np.random.default_rng(1)
+        count = 400
+        centers = np.column_stack([
+            rng.uniform(-10.0, 420.0, count), rng.uniform(0.0, 420.0, count), rng.uniform(0.5, 3.0, count),
+        ])
+        half = rng.uniform(0.3, 2.0, (count, 3))
+        hidden = culler.occluded_boxes(centers - half, centers + half)
+
+        false_hidden = truly_hidden = found = 0
+        for i in range(count):
+            offsets = rng.uniform(-1.0, 1.0, (24, 3)) * half[i]
+            points = np.vstack([centers[i] + offsets, centers[i] + half[i] * [-1, -1, -1], centers[i] + half[i]])
+            x, y, z = culler._to_view(points)
+            sx, sy = culler._to_screen(x, y, z)
+            on_screen = (z > culler.near) & (sx >= 0) & (sx < culler.width) & (sy >= 0) & (sy < culler.height)
+            if not on_screen.any() or (z <= culler.near).any():
+                continue
+            all_blocked = _segments_blocked(np, camera, points[on_screen], low, high).all()
+            false_hidden += bool(hidden[i] and not all_blocked)
+            truly_hidden += bool(all_blocked)
+            found += bool(all_blocked and hidden[i])
+
+        assert false_hidden == 0
+        assert truly_hidden > 50
+        assert found >= 0.7 * truly_hidden
+
+    def test_city_blocks_throughput(self):
+        """Thousands of boxes are answered per call in well under a second."""
+        np = pytest.importorskip("numpy")
+        import time
+
+        low, high = _city_blocks(np, blocks=20)
+        culler = OcclusionCuller(resolution=256)
+        culler.add_occluder_boxes(low, high)
+        culler.set_camera((254.0, -30.0, 1.7), (0.3, 1.0, 0.0), fov=60.0, aspect=16 / 9, far=2000.0)
+
+        start = time.perf_counter()
+        culler.render()
+        rng = np.random.default_rng(2)
+        centers = rng.uniform((0.0, 0.0, 0.5), (1040.0, 1040.0, 3.0), (50000, 3))
+        hidden = culler.occluded_spheres(centers, 1.0)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2.0
+        assert 0.3 < hidden.mean() < 0.95
+
+    def test_cull_arrays_with_occlusion(self):
+        """Occluded instances are reported with the occlusion reason."""
+        np = pytest.importorskip("numpy")
+        culler = OcclusionCuller(resolution=64)
+        culler.add_occluder_boxes([(-3.0, -3.0, -8.0)], [(3.0, 3.0, -6.0)])
+
+        manager = CullingManager(CullingConfig(enable_small_object_culling=False))
+        scene = InstanceArrays([(0.0, 0.0, -20.0), (0.0, 0.0, -4.0)], 0.5)
+        camera = CameraFrame(frame=1, fov=60.0, aspect=1.0, far=100.0)
+
+        results = manager.cull_camera_path(scene, [camera], occlusion=culler)
+
+        np.testing.assert_array_equal(results[0].codes, [CULLED_OCCLUSION, 0])
+        assert results[0].statistics["occlusion_culled"] == 1
+        assert results[0].to_culling_result(["a", "b"]).culled == {"a": "occlusion"}
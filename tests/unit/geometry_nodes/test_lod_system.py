@@ -220,6 +220,11 @@ class TestLODConfig:
         # Going from high detail to low detail - no hysteresis
         assert config.get_level_for_distance(25.0, previous_level=0) == 1
 
+        # Previous level is kept within its range widened by hysteresis
+        assert config.get_level_for_distance(24.0, previous_level=0) == 0
+        assert config.get_level_for_distance(16.0, previous_level=1) == 1
+        assert config.get_level_for_distance(14.0, previous_level=1) == 0
+
         # Test basic distance selection still works
         assert config.get_level_for_distance(10.0) == 0
         assert config.get_level_for_distance(30.0) == 1
@@ -655,3 +660,164 @@ class TestLODManagerIntegration:
         # Both should have states
         assert manager.get_instance_state("default_inst") is not None
         assert manager.get_instance_state("custom_inst") is not None
+
+
+class TestColumnarLOD:
+    """Tests for the array-backed LOD path."""
+
+    def test_levels_for_distances_matches_scalar(self):
+        """Without hysteresis, vectorized selection matches get_level_for_distance."""
+        np = pytest.importorskip("numpy")
+        config = DEFAULT_LOD_CONFIGS["default"]
+        distances = np.array([0.0, 10.0, 20.0, 49.9, 50.0, 99.0, 500.0, 2000.0])
+
+        levels = config.get_levels_for_distances(distances)
+
+        expected = [config.get_level_for_distance(float(d)) for d in distances]
+        assert levels.tolist() == expected
+        assert LODConfig().get_levels_for_distances(distances).tolist() == [0] * 8
+
+    def test_hysteresis_dead_band(self):
+        """Instances keep their level until they leave the widened range."""
+        np = pytest.importorskip("numpy")
+        config = DEFAULT_LOD_CONFIGS["default"]  # hysteresis 2.0, boundary at 20
+        distances = np.array([21.0, 23.0, 19.0, 17.0, 21.0])
+        previous = np.array([0, 0, 1, 1, -1])
+
+        levels = config.get_levels_for_distances(distances, previous)
+
+        assert levels.tolist() == [0, 1, 1, 0, 1]
+
+    def test_hysteresis_matches_scalar(self):
+        """Vectorized and scalar selection apply the same hysteresis rule."""
+        np = pytest.importorskip("numpy")
+        config = LODConfig(
+            levels=[
+                LODLevel(level=0, distance_min=0.0, distance_max=10.0),
+                LODLevel(level=1, distance_min=10.0, distance_max=50.0),
+            ],
+            hysteresis=2.0,
+        )
+        assert config.get_levels_for_distances(np.array([9.0]), np.array([1])).tolist() == [1]
+        assert config.get_level_for_distance(9.0, previous_level=1) == 1
+
+        rng = np.random.default_rng(0)
+        config = DEFAULT_LOD_CONFIGS["default"]
+        distances = rng.uniform(0.0, 250.0, 500)
+        previous = rng.integers(-1, 4, 500)
+
+        levels = config.get_levels_for_distances(distances, previous)
+
+        expected = [
+            config.get_level_for_distance(float(d), None if p < 0 else int(p))
+            for d, p in zip(distances, previous)
+        ]
+        assert levels.tolist() == expected
+
+    def test_register_rows(self):
+        """IDs map to stable rows; re-registering keeps rows."""
+        manager = LODManager()
+        pytest.importorskip("numpy")
+        rows = manager.register_instances(["a", "b", "c"])
+        again = manager.register_instances(["c", "d"], config_id="foliage")
+
+        assert rows.tolist() == [0, 1, 2]
+        assert again.tolist() == [2, 3]
+        assert manager.arrays.config_ids == ["default", "foliage"]
+        assert manager.arrays.config_index.tolist() == [0, 0, 1, 1]
+
+    def test_update_arrays_transitions(self):
+        """New rows start at their target; changes switch at the halfway point."""
+        pytest.importorskip("numpy")
+        manager = LODManager()
+        manager.set_config("default", LODConfig(
+            levels=DEFAULT_LOD_CONFIGS["default"].levels, hysteresis=2.0, transition_speed=0.25,
+        ))
+        manager.register_instances(["near", "far"])
+
+        levels = manager.update_arrays([(0.0, 0.0, -5.0), (0.0, 0.0, -75.0)])
+        assert levels.tolist() == [0, 2]
+        assert manager.arrays.transition_progress.tolist() == [1.0, 1.0]
+
+        positions = [(0.0, 0.0, -30.0), (0.0, 0.0, -75.0)]
+        assert manager.update_arrays(positions).tolist() == [0, 2]
+        assert manager.arrays.target_level.tolist() == [1, 2]
+        assert manager.update_arrays(positions).tolist() == [0, 2]
+        assert manager.update_arrays(positions).tolist() == [1, 2]
+
+        state = manager.get_instance_state("near")
+        assert (state.current_level, state.target_level) == (1, 1)
+        assert state.transition_progress == pytest.approx(0.5)
+        assert state.last_distance == pytest.approx(30.0)
+
+    def test_update_subset_rows(self):
+        """Positions can be supplied for a subset of rows."""
+        pytest.importorskip("numpy")
+        manager = LODManager()
+        manager.register_instances(["a", "b", "c"])
+
+        manager.update_arrays([(0.0, 0.0, 75.0)], rows=[1])
+
+        assert manager.get_level_buffer().tolist() == [-1, 2, -1]
+        with pytest.raises(ValueError):
+            manager.update_arrays([(0.0, 0.0, 1.0)])
+
+    def test_multiple_cameras_use_nearest(self):
+        """Distance is measured to the nearest camera."""
+        pytest.importorskip("numpy")
+        manager = LODManager()
+        manager.set_camera_positions([(0.0, 0.0, 0.0), (200.0, 0.0, 0.0)])
+        manager.register_instances(["a", "b", "c"])
+
+        levels = manager.update_arrays([(5.0, 0.0, 0.0), (195.0, 0.0, 0.0), (100.0, 0.0, 0.0)])
+
+        assert levels.tolist() == [0, 0, 3]
+        assert manager.arrays.last_distance.tolist() == [5.0, 5.0, 100.0]
+        assert manager.camera_position == (0.0, 0.0, 0.0)
+
+    def test_frame_level_buffers(self):
+        """Per-frame level buffers are exported for geometry nodes."""
+        np = pytest.importorskip("numpy")
+        import base64
+
+        manager = LODManager()
+        manager.register_instances(["a", "b"])
+        manager.update_arrays([(0.0, 0.0, 5.0), (0.0, 0.0, 150.0)], frame=1)
+        manager.set_camera_position((0.0, 0.0, 150.0))
+        manager.update_arrays([(0.0, 0.0, 5.0), (0.0, 0.0, 150.0)], frame=2)
+
+        buffer = manager.get_level_buffer()
+        assert buffer.dtype == np.int32
+
+        gn_data = manager.to_gn_input()
+        lod_levels = gn_data["lod_levels"]
+        assert lod_levels["instance_ids"] == ["a", "b"]
+        frames = {
+            frame: list(base64.b64decode(data))
+            for frame, data in lod_levels["frames"].items()
+        }
+        assert frames == {"1": [0, 3], "2": [0, 3]}
+        assert gn_data["statistics"]["total_instances"] == 2
+
+        manager.reset()
+        assert len(manager.arrays) == 0
+        assert "lod_levels" not in manager.to_gn_input()
+
+    def test_million_instances(self):
+        """A million instances update in well under a second per frame."""
+        np = pytest.importorskip("numpy")
+        import time
+
+        count = 1_000_000
+        manager = LODManager()
+        manager.register_instances([f"tree_{i}" for i in range(count)], config_id="foliage")
+        positions = np.random.default_rng(0).uniform(-500.0, 500.0, (count, 3))
+
+        start = time.perf_counter()
+        manager.update_arrays(positions, frame=1)
+        manager.set_camera_positions([(10.0, 0.0, 0.0), (-200.0, 50.0, 0.0)])
+        levels = manager.update_arrays(positions, frame=2)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2.0
+        assert set(np.unique(levels).tolist()) <= {0, 1, 2, 3}
@@ -10,6 +10,14 @@ import os
 from pathlib import Path
 
 
+def _save_image(path, pixels):
+    """Write a uint8 array as an image and return its path."""
+    from PIL import Image
+
+    Image.fromarray(pixels).save(path)
+    return str(path)
+
+
 class TestComparisonResult:
     """Tests for ComparisonResult dataclass."""
 
@@ -204,31 +212,40 @@ class TestComparisonTool:
 
         assert results == []
 
-    def test_generate_diff_image(self):
+    def test_generate_diff_image(self, tmp_path):
         """Test generating difference image."""
+        np = pytest.importorskip("numpy")
+        Image = pytest.importorskip("PIL.Image")
         from lib.review.comparison import ComparisonTool
 
-        # Create temp files
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
-            temp_a = f.name
-            f.write(b"image a")
+        base = np.full((20, 30, 3), 128, dtype=np.uint8)
+        changed = base.copy()
+        changed[5:10, 10:20] = 255
+        path_a = _save_image(tmp_path / "a.png", base)
+        path_b = _save_image(tmp_path / "b.png", changed)
+        diff_path = tmp_path / "diff" / "ab.png"
 
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
-            temp_b = f.name
-            f.write(b"image b")
+        tool = ComparisonTool()
+        result = tool.generate_diff_image(path_a, path_b, str(diff_path))
+        assert result is True
+
+        diff = np.asarray(Image.open(diff_path))
+        assert tuple(diff[7, 15]) == (255, 0, 0)
+        assert diff[0, 0, 0] == diff[0, 0, 1] < 128
+
+    def test_generate_diff_image_unreadable(self):
+        """Test generating diff from files that are not images."""
+        from lib.review.comparison import ComparisonTool
 
         with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
-            temp_diff = f.name
+            temp_a = f.name
+            f.write(b"image a")
 
         try:
             tool = ComparisonTool()
-            result = tool.generate_diff_image(temp_a, temp_b, temp_diff)
-            assert result is True
+            assert tool.generate_diff_image(temp_a, temp_a, "/tmp/diff.png") is False
         finally:
             os.unlink(temp_a)
-            os.unlink(temp_b)
-            if os.path.exists(temp_diff):
-                os.unlink(temp_diff)
 
     def test_generate_diff_image_missing_source(self):
         """Test generating diff with missing source."""
@@ -265,6 +282,123 @@ class TestComparisonTool:
 
         assert isinstance(regions, list)
 
+    def test_compare_identical_images(self, tmp_path):
+        """Test comparing an image with itself."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("PIL")
+        from lib.review.comparison import ComparisonTool
+
+        rng = np.random.default_rng(0)
+        path = _save_image(tmp_path / "a.png", rng.integers(0, 256, (24, 32, 3), dtype=np.uint8))
+
+        result = ComparisonTool().compare(path, path)
+        assert result.ssim_score == pytest.approx(1.0, abs=1e-5)
+        assert result.difference_pixels == 0.0
+        assert result.histogram_diff == pytest.approx(0.0)
+        assert result.regions == []
+        assert result.is_similar is True
+
+    def test_compare_detects_changed_region(self, tmp_path):
+        """Test that a changed block lowers SSIM and is reported as a region."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("PIL")
+        from lib.review.comparison import ComparisonTool
+
+        rng = np.random.default_rng(1)
+        base = rng.integers(0, 256, (40, 60, 3), dtype=np.uint8)
+        changed = base.copy()
+        changed[10:20, 30:45] = 0
+        path_a = _save_image(tmp_path / "a.png", base)
+        path_b = _save_image(tmp_path / "b.png", changed)
+
+        result = ComparisonTool(min_region_size=10).compare(path_a, path_b)
+
+        assert result.ssim_score < 0.95
+        assert result.difference_pixels == pytest.approx(150 / 2400 * 100, rel=0.05)
+        assert result.is_similar is False
+        assert len(result.regions) == 1
+        region = result.regions[0]
+        assert (region["x"], region["y"], region["width"], region["height"]) == (30, 10, 15, 10)
+        assert region["max_difference"] > 0.5
+
+    def test_compare_size_mismatch(self, tmp_path):
+        """Test that differently sized images are reported, not compared."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("PIL")
+        from lib.review.comparison import ComparisonTool
+
+        path_a = _save_image(tmp_path / "a.png", np.zeros((10, 10, 3), dtype=np.uint8))
+        path_b = _save_image(tmp_path / "b.png", np.zeros((12, 10, 3), dtype=np.uint8))
+
+        result = ComparisonTool().compare(path_a, path_b)
+        assert "size mismatch" in result.metadata["error"]
+        assert result.is_similar is False
+
+    def test_compare_histograms_distances(self, tmp_path):
+        """Test per-channel histogram distances."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("PIL")
+        from lib.review.comparison import ComparisonTool
+
+        base = np.zeros((8, 8, 3), dtype=np.uint8)
+        shifted = base.copy()
+        shifted[:4, :, 0] = 255
+        path_a = _save_image(tmp_path / "a.png", base)
+        path_b = _save_image(tmp_path / "b.png", shifted)
+
+        tool = ComparisonTool()
+        result = tool.compare_histograms(path_a, path_b)
+        assert result["red"] == pytest.approx(0.5)
+        assert result["green"] == result["blue"] == 0.0
+        assert result["overall"] == pytest.approx(0.5 / 3)
+
+        with pytest.raises(ValueError):
+            tool.compare_histograms(path_a, path_b, method="emd")
+
+    def test_image_cache_reuses_and_invalidates(self, tmp_path):
+        """Test that decoded images are cached until the file changes."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("PIL")
+        from lib.review.comparison import ImageCache
+
+        path = tmp_path / "a.png"
+        _save_image(path, np.zeros((4, 4, 3), dtype=np.uint8))
+        cache = ImageCache()
+
+        first = cache.load(str(path))
+        assert cache.load(str(path)) is first
+        assert cache.hits == 1
+
+        _save_image(path, np.full((4, 4, 3), 255, dtype=np.uint8))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.load(str(path))[0, 0, 0] == 1.0
+        assert cache.misses == 2
+
+    def test_compare_directories_workers(self, tmp_path):
+        """Test comparing directories across worker processes."""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("PIL")
+        from lib.review.comparison import ComparisonTool
+
+        dir_a = tmp_path / "a"
+        dir_b = tmp_path / "b"
+        dir_a.mkdir()
+        dir_b.mkdir()
+        for i in range(5):
+            pixels = np.full((8, 8, 3), i * 40, dtype=np.uint8)
+            _save_image(dir_a / f"frame_{i}.png", pixels)
+            _save_image(dir_b / f"frame_{i}.png", pixels if i != 3 else 255 - pixels)
+
+        tool = ComparisonTool()
+        streamed = list(tool.iter_compare_directories(str(dir_a), str(dir_b), workers=2))
+        results = tool.compare_directories(str(dir_a), str(dir_b), workers=2)
+
+        assert len(streamed) == 5
+        assert len({r.comparison_id for r in streamed + results}) == 10
+        assert [Path(r.source_a).name for r in results] == [f"frame_{i}.png" for i in range(5)]
+        assert [r.is_similar for r in results] == [True, True, True, False, True]
+
     def test_get_statistics(self):
         """Test getting comparison statistics."""
         from lib.review.comparison import ComparisonTool
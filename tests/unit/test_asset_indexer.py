@@ -0,0 +1,162 @@
+"""
+Asset Vault Indexer Tests
+
+Tests for: lib/asset_vault/indexer.py (parallel and incremental indexing)
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from lib.asset_vault import security
+from lib.asset_vault.indexer import (
+    CONTENT_HASH_KEY,
+    AssetIndexer,
+    SQLiteIndexStore,
+    hash_file,
+)
+from lib.asset_vault.enums import AssetCategory
+
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    """Small asset library inside the allowed paths."""
+    monkeypatch.setattr(security, "ALLOWED_PATHS", [tmp_path.resolve()])
+    root = tmp_path.resolve()
+    (root / "cars").mkdir()
+    (root / "props").mkdir()
+    (root / "cars" / "sedan.obj").write_text("o Sedan\nv 0 0 0\nv 4 1.5 2\nusemtl paint\n")
+    (root / "cars" / "truck.obj").write_text("o Truck\nv 0 0 0\nv 6 3 2.5\n")
+    (root / "props" / "crate.obj").write_text("v 0 0 0\nv 1 1 1\n")
+    return root
+
+
+def _touch(path: Path, offset: float) -> None:
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + offset))
+
+
+def _tag_everything(index):
+    for rel_path, info in index.assets.items():
+        info.category = AssetCategory.VEHICLE if rel_path.startswith("cars") else AssetCategory.PROP
+        info.tags = [rel_path.split(os.sep)[0]]
+        index.categories.setdefault(info.category.value, []).append(rel_path)
+        for tag in info.tags:
+            index.tags.setdefault(tag, []).append(rel_path)
+
+
+class TestBuildIndex:
+    """Tests for full index builds."""
+
+    def test_parallel_matches_serial(self, library):
+        """Thread pool indexing gives the same result as serial indexing."""
+        serial = AssetIndexer(max_workers=1).build_index(library, force_rebuild=True)
+        parallel = AssetIndexer(max_workers=4).build_index(library, force_rebuild=True)
+
+        assert list(serial.assets) == list(parallel.assets)
+        for rel_path in serial.assets:
+            assert serial.assets[rel_path].to_dict() == parallel.assets[rel_path].to_dict()
+
+    def test_metadata_and_hash(self, library):
+        """Optional metadata extraction and content hashing."""
+        indexer = AssetIndexer(extract_metadata=True, content_hash=True)
+        index = indexer.build_index(library, force_rebuild=True)
+
+        sedan = index.assets[os.path.join("cars", "sedan.obj")]
+        assert sedan.materials == ["paint"]
+        assert sedan.objects == ["Sedan"]
+        assert sedan.dimensions == (4.0, 1.5, 2.0)
+        assert sedan.metadata[CONTENT_HASH_KEY] == hash_file(library / "cars" / "sedan.obj")
+
+    def test_progress_callback(self, library):
+        """Progress is reported for every asset."""
+        calls = []
+        AssetIndexer().build_index(
+            library, force_rebuild=True, progress_callback=lambda i, n, p: calls.append((i, n))
+        )
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+
+
+class TestUpdateIndex:
+    """Tests for incremental updates."""
+
+    def test_detects_changes(self, library):
+        """New, modified and removed files are detected."""
+        indexer = AssetIndexer()
+        index = indexer.build_index(library, force_rebuild=True)
+        _tag_everything(index)
+
+        (library / "props" / "barrel.obj").write_text("v 0 0 0\n")
+        (library / "cars" / "truck.obj").write_text("o Truck\nv 0 0 0\nv 9 9 9\n")
+        _touch(library / "cars" / "truck.obj", 5)
+        (library / "props" / "crate.obj").unlink()
+
+        indexer.update_index(index)
+        stats = indexer.last_update
+
+        assert (stats.added, stats.modified, stats.removed, stats.unchanged) == (1, 1, 1, 1)
+        assert os.path.join("props", "crate.obj") not in index.assets
+        assert "prop" not in index.categories
+        # The re-indexed truck has no category yet; sedan keeps its own
+        assert index.categories["vehicle"] == [os.path.join("cars", "sedan.obj")]
+        assert index.tags["cars"] == [os.path.join("cars", "sedan.obj")]
+
+    def test_unchanged_library(self, library):
+        """No work when nothing changed."""
+        indexer = AssetIndexer()
+        index = indexer.build_index(library, force_rebuild=True)
+        indexer.update_index(index)
+        assert indexer.last_update.unchanged == 3
+        assert indexer.last_update.modified == 0
+
+    def test_content_hash_confirms_change(self, library):
+        """A touched but identical file is not re-indexed."""
+        indexer = AssetIndexer(content_hash=True)
+        index = indexer.build_index(library, force_rebuild=True)
+        _tag_everything(index)
+        sedan = os.path.join("cars", "sedan.obj")
+
+        _touch(library / "cars" / "sedan.obj", 10)
+        indexer.update_index(index)
+
+        assert indexer.last_update.touched == 1
+        assert indexer.last_update.modified == 0
+        # Tags survive because the asset was not re-indexed
+        assert index.assets[sedan].tags == ["cars"]
+        assert abs(index.assets[sedan].last_modified.timestamp() - (library / sedan).stat().st_mtime) < 1e-5
+
+
+class TestSQLiteStore:
+    """Tests for the SQLite index store."""
+
+    def test_roundtrip(self, library):
+        """Index saved to SQLite loads back identically."""
+        indexer = AssetIndexer(storage="sqlite")
+        index = indexer.build_index(library, force_rebuild=True)
+        assert indexer.get_index_path(library).suffix == ".sqlite"
+
+        loaded = indexer.load_index(library)
+        assert loaded is not None
+        assert loaded.root_path == index.root_path
+        assert {k: v.to_dict() for k, v in loaded.assets.items()} == {
+            k: v.to_dict() for k, v in index.assets.items()
+        }
+
+    def test_delta_save(self, library):
+        """Incremental updates write only the delta."""
+        indexer = AssetIndexer(storage="sqlite")
+        index = indexer.build_index(library, force_rebuild=True)
+
+        (library / "props" / "crate.obj").unlink()
+        (library / "props" / "lamp.obj").write_text("v 0 0 0\n")
+        indexer.update_index(index, save=True)
+
+        loaded = SQLiteIndexStore(indexer.get_index_path(library)).load()
+        assert sorted(loaded.assets) == sorted(index.assets)
+        assert os.path.join("props", "lamp.obj") in loaded.assets
+
+    def test_invalid_storage(self):
+        """Unknown storage backends are rejected."""
+        with pytest.raises(ValueError):
+            AssetIndexer(storage="xml")
@@ -0,0 +1,218 @@
+"""
+Asset Vault Search Index Tests
+
+Tests for: lib/asset_vault/search_index.py and SearchEngine text search
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from lib.asset_vault.enums import AssetCategory, AssetFormat, SearchMode
+from lib.asset_vault.search import SearchEngine, SearchQuery
+from lib.asset_vault import search_index as search_index_module
+from lib.asset_vault.search_index import (
+    SEARCH_INDEX_FILENAME,
+    SearchIndex,
+    benchmark_search_index,
+    get_search_index_path,
+    load_or_build_search_index,
+    synthetic_documents,
+)
+from lib.asset_vault.types import AssetIndex, AssetInfo
+
+
+def _make_index(root: Path) -> AssetIndex:
+    names = {
+        "vehicles/cyberpunk_car.blend": ("cyberpunk_car", AssetCategory.VEHICLE),
+        "vehicles/cyber_truck.fbx": ("cyber_truck", AssetCategory.VEHICLE),
+        "furniture/modern_chair.blend": ("modern_chair", AssetCategory.FURNITURE),
+        "furniture/chair_rustic.obj": ("chair_rustic", AssetCategory.FURNITURE),
+        "props/carpet_red.glb": ("carpet_red", AssetCategory.PROP),
+    }
+    index = AssetIndex(root_path=root, updated_at=datetime(2024, 1, 1))
+    for rel_path, (name, category) in names.items():
+        index.assets[rel_path] = AssetInfo(
+            path=root / rel_path,
+            name=name,
+            format=AssetFormat.from_extension(Path(rel_path).suffix),
+            category=category,
+        )
+    return index
+
+
+class TestSearchIndex:
+    """Tests for the inverted index."""
+
+    def test_prefix_range_matches_scan(self):
+        """Binary-searched prefix range equals a linear startswith scan."""
+        index = SearchIndex.from_documents(synthetic_documents(500))
+
+        for prefix in ["c", "cy", "ro", "zzz", "0"]:
+            start, end = index.prefix_range(prefix)
+            expected = [t for t in index.tokens if t.startswith(prefix)]
+            assert index.tokens[start:end] == expected
+
+    def test_bm25_prefers_rare_and_name_matches(self):
+        """Rare tokens and name matches rank higher."""
+        index = SearchIndex.from_documents([
+            ("common/lamp_a.blend", "lamp_a"),
+            ("common/lamp_b.blend", "lamp_b"),
+            ("common/neon_lamp.blend", "neon_lamp"),
+            ("neon/lamp_c.blend", "lamp_c"),
+        ])
+        results = index.search("neon lamp")
+        assert results[0][0] == "common/neon_lamp.blend"
+        assert all(0.0 < score <= 1.0 for _, score, _ in results)
+
+    def test_top_k_equals_full_ranking(self):
+        """Heap selection returns the head of the full ranking."""
+        index = SearchIndex.from_documents(synthetic_documents(2000))
+        full = index.search("modern car")
+        top = index.search("modern car", top_k=10)
+        assert [s for _, s, _ in top] == [s for _, s, _ in full[:10]]
+
+    def test_fuzzy_prefix(self):
+        """Unknown tokens fall back to prefix matches at lower weight."""
+        index = SearchIndex.from_documents([
+            ("a/robot_arm.blend", "robot_arm"),
+            ("a/rock.blend", "rock"),
+        ])
+        results = index.search("robo")
+        assert [r[0] for r in results] == ["a/robot_arm.blend"]
+        assert results[0][2] == ["robot"]
+        assert index.search("robo", fuzzy=False) == []
+
+    @pytest.mark.skipif(not search_index_module.HAS_NUMPY, reason="numpy required")
+    def test_numpy_matches_python(self, monkeypatch):
+        """Vectorized scoring agrees with the pure Python path."""
+        index = SearchIndex.from_documents(synthetic_documents(1500))
+        fast = index.search("rustic cr", top_k=25)
+
+        monkeypatch.setattr(search_index_module, "HAS_NUMPY", False)
+        slow = index.search("rustic cr", top_k=25)
+
+        assert [round(s, 6) for _, s, _ in fast] == [round(s, 6) for _, s, _ in slow]
+        fast_map = {p: sorted(h) for p, _, h in fast}
+        for path, _, highlights in slow:
+            if path in fast_map:
+                assert fast_map[path] == sorted(highlights)
+
+    def test_save_load_roundtrip(self, tmp_path):
+        """Binary file reproduces the same rankings."""
+        index = SearchIndex.from_documents(synthetic_documents(300), fingerprint="abc")
+        path = index.save(tmp_path / "search.idx")
+
+        loaded = SearchIndex.load(path)
+        assert loaded.fingerprint == "abc"
+        assert loaded.tokens == index.tokens
+        assert loaded.search("vintage lamp", top_k=5) == index.search("vintage lamp", top_k=5)
+
+    def test_load_rejects_corrupt_file(self, tmp_path):
+        """Corrupt files are ignored."""
+        path = tmp_path / "search.idx"
+        path.write_bytes(b"not an index")
+        assert SearchIndex.load(path) is None
+        assert SearchIndex.load(tmp_path / "missing.idx") is None
+
+    def test_benchmark_small(self, tmp_path):
+        """Benchmark runs and reports timings."""
+        results = benchmark_search_index(num_assets=1000, path=tmp_path / "bench.idx")
+        assert results["assets"] == 1000
+        assert results["query_seconds"] > 0
+        assert results["file_bytes"] > 0
+
+
+class TestPersistentSearchIndex:
+    """Tests for index persistence next to the asset index."""
+
+    def test_saved_under_gsd_state(self, tmp_path):
+        """Index is written to .gsd-state and reused while fresh."""
+        index = _make_index(tmp_path)
+        path = get_search_index_path(index)
+        assert path == tmp_path / ".gsd-state" / SEARCH_INDEX_FILENAME
+
+        load_or_build_search_index(index)
+        assert path.exists()
+        mtime = path.stat().st_mtime_ns
+
+        load_or_build_search_index(index)
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_rebuilt_when_stale(self, tmp_path):
+        """A changed asset index triggers a rebuild."""
+        index = _make_index(tmp_path)
+        load_or_build_search_index(index)
+
+        index.assets["props/lamp.blend"] = AssetInfo(
+            path=tmp_path / "props/lamp.blend", name="lamp", format=AssetFormat.BLEND
+        )
+        index.updated_at = datetime(2024, 2, 1)
+        assert len(load_or_build_search_index(index)) == 6
+
+    def test_rebuilt_for_same_size_asset_set(self, tmp_path):
+        """A different asset set of the same size is not served stale postings."""
+        def make(rel_path):
+            index = AssetIndex(root_path=tmp_path)
+            index.assets[rel_path] = AssetInfo(
+                path=tmp_path / rel_path, name=Path(rel_path).stem, format=AssetFormat.BLEND
+            )
+            return index
+
+        SearchEngine(make("chair.blend"))
+        engine = SearchEngine(make("table.blend"))
+
+        assert [r.asset.name for r in engine.text_search("table")] == ["table"]
+
+    def test_search_engine_persists_by_default(self, tmp_path):
+        """A plain SearchEngine reuses the saved index instead of rebuilding."""
+        index = _make_index(tmp_path)
+        SearchEngine(index)
+        path = get_search_index_path(index)
+        assert path.exists()
+        mtime = path.stat().st_mtime_ns
+
+        engine = SearchEngine(index)
+        assert path.stat().st_mtime_ns == mtime
+        assert {r.asset.name for r in engine.text_search("chair")} == {"modern_chair", "chair_rustic"}
+
+    def test_not_written_when_disabled(self, tmp_path):
+        """persist=False keeps the text index in memory."""
+        index = _make_index(tmp_path)
+        SearchEngine(index, persist=False)
+        assert not get_search_index_path(index).exists()
+
+    def test_in_memory_without_root_path(self):
+        """Indices without a root path are searchable without persistence."""
+        index = AssetIndex()
+        index.assets["chair.blend"] = AssetInfo(
+            path=Path("chair.blend"), name="chair", format=AssetFormat.BLEND
+        )
+        assert [r.asset.name for r in SearchEngine(index).text_search("chair")] == ["chair"]
+
+
+class TestSearchEngineText:
+    """Tests for SearchEngine on top of the index."""
+
+    def test_text_search(self, tmp_path):
+        """Exact and prefix queries find assets."""
+        engine = SearchEngine(_make_index(tmp_path))
+
+        names = [r.asset.name for r in engine.text_search("chair")]
+        assert set(names) == {"modern_chair", "chair_rustic"}
+
+        names = [r.asset.name for r in engine.text_search("cyb")]
+        assert set(names) == {"cyberpunk_car", "cyber_truck"}
+
+    def test_search_query_filters_and_limit(self, tmp_path):
+        """Filters apply before the result limit."""
+        engine = SearchEngine(_make_index(tmp_path), persist=False)
+
+        query = SearchQuery(text="red chair", mode=SearchMode.TEXT, category=AssetCategory.PROP)
+        assert [r.asset.name for r in engine.search(query)] == ["carpet_red"]
+
+        query = SearchQuery(text="chair", mode=SearchMode.TEXT, max_results=1)
+        results = engine.search(query)
+        assert len(results) == 1
+        assert results[0].score == max(r.score for r in engine.text_search("chair"))
@@ -0,0 +1,192 @@
+"""
+Batch Worker Pool Unit Tests
+
+Tests for: lib/cinematic/batch.py (WorkerPool, BatchProcessor),
+lib/cinematic/batch_worker.py
+
+Workers run a plain Python stand-in for Blender, so no Blender install
+is needed.
+"""
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+from lib.cinematic.batch import (
+    WORKER_SCRIPT,
+    BatchProcessor,
+    WorkerPool,
+)
+from lib.cinematic.tracking.types import BatchConfig, BatchJob
+
+
+FAKE_BLENDER = textwrap.dedent(
+    """
+    import os
+    import time
+    from pathlib import Path
+
+    # Stands in for bpy.data: whatever a job builds stays until reset
+    SCENE = {"objects": [], "camera": None}
+
+    def reset_scene():
+        SCENE["objects"].clear()
+        SCENE["camera"] = None
+
+    def render(job):
+        name = job["name"]
+        if name.startswith("scene"):
+            if SCENE["objects"] or SCENE["camera"]:
+                return {"status": "failed", "error": f"leftover scene state: {SCENE}"}
+            SCENE["objects"].append(f"{name}_backdrop")
+            SCENE["camera"] = f"{name}_camera"
+        if name.startswith("sleep"):
+            time.sleep(float(name.split("_")[1]))
+        if name == "crash":
+            os._exit(3)
+        if name == "fail":
+            return {"status": "failed", "error": "could not assemble"}
+        if name == "raise":
+            raise ValueError("bad shot")
+
+        print("rendering", name)
+        if job["output_path"]:
+            Path(job["output_path"]).write_text(str(os.getpid()))
+        return True
+    """
+)
+
+
+@pytest.fixture
+def worker_command(tmp_path):
+    """Command starting batch_worker.py with a stand-in render handler."""
+    (tmp_path / "fake_blender.py").write_text(FAKE_BLENDER)
+    return [sys.executable, str(WORKER_SCRIPT), "--", "--handler", "fake_blender:render"]
+
+
+@pytest.fixture
+def worker_env(tmp_path):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(tmp_path), env.get("PYTHONPATH", "")])
+    return env
+
+
+def _job(name, output_path=""):
+    return BatchJob(name=name, shot_config="", output_path=output_path)
+
+
+class TestWorkerPool:
+    """Tests for the persistent worker pool."""
+
+    def test_workers_are_reused(self, worker_command, worker_env, tmp_path):
+        """Several jobs run in one warm worker process."""
+        with WorkerPool(1, command=worker_command, env=worker_env) as pool:
+            jobs = [
+                pool.run_job(_job(f"shot_{i}", str(tmp_path / f"out_{i}.txt")))
+                for i in range(4)
+            ]
+            assert pool.workers_started == 1
+
+        assert [job.status for job in jobs] == ["completed"] * 4
+        pids = {(tmp_path / f"out_{i}.txt").read_text() for i in range(4)}
+        assert len(pids) == 1
+        assert jobs[0].start_time and jobs[0].end_time
+
+    def test_scene_reset_between_jobs(self, worker_command, worker_env):
+        """Scene state from one job is gone when the next starts in the same worker."""
+        command = worker_command + ["--reset", "fake_blender:reset_scene"]
+        with WorkerPool(1, command=command, env=worker_env) as pool:
+            jobs = [pool.run_job(_job(f"scene_{i}")) for i in range(3)]
+            assert pool.workers_started == 1
+
+        assert [job.status for job in jobs] == ["completed"] * 3
+
+    def test_recycles_after_job_limit(self, worker_command, worker_env):
+        """Workers are replaced after max_jobs_per_worker jobs."""
+        with WorkerPool(1, command=worker_command, env=worker_env, max_jobs_per_worker=2) as pool:
+            jobs = [pool.run_job(_job(f"shot_{i}")) for i in range(5)]
+            assert pool.workers_started == 3
+            assert pool.workers_recycled == 2
+
+        assert all(job.status == "completed" for job in jobs)
+
+    def test_recycles_above_memory_limit(self, worker_command, worker_env):
+        """Workers above the memory threshold are replaced after their job."""
+        with WorkerPool(1, command=worker_command, env=worker_env, max_memory_mb=0.001) as pool:
+            for i in range(3):
+                assert pool.run_job(_job(f"shot_{i}")).status == "completed"
+            assert pool.workers_recycled == 3
+
+    def test_timeout_kills_only_that_job(self, worker_command, worker_env):
+        """A hung job times out and the pool carries on with a new worker."""
+        with WorkerPool(1, command=worker_command, env=worker_env) as pool:
+            hung = pool.run_job(_job("sleep_30"), timeout=1)
+            after = pool.run_job(_job("shot_after"))
+            assert pool.workers_started == 2
+
+        assert hung.status == "failed"
+        assert "timed out after 1 seconds" in hung.error
+        assert after.status == "completed"
+
+    def test_crash_isolation(self, worker_command, worker_env):
+        """A crashing worker fails its job with the exit code."""
+        with WorkerPool(1, command=worker_command, env=worker_env) as pool:
+            crashed = pool.run_job(_job("crash"))
+            after = pool.run_job(_job("shot_after"))
+
+        assert crashed.status == "failed"
+        assert "exited with code 3" in crashed.error
+        assert after.status == "completed"
+
+    def test_handler_failures_keep_worker(self, worker_command, worker_env):
+        """Failed and raising jobs are reported without restarting the worker."""
+        with WorkerPool(1, command=worker_command, env=worker_env) as pool:
+            failed = pool.run_job(_job("fail"))
+            raised = pool.run_job(_job("raise"))
+            assert pool.workers_started == 1
+
+        assert failed.status == "failed" and failed.error == "could not assemble"
+        assert raised.status == "failed" and "ValueError: bad shot" in raised.error
+
+    def test_missing_executable(self):
+        """A worker that cannot start fails the job instead of raising."""
+        with WorkerPool(1, command=["/nonexistent/blender"]) as pool:
+            job = pool.run_job(_job("shot"))
+
+        assert job.status == "failed"
+        assert "Could not start worker" in job.error
+
+
+class TestBatchProcessorWorkers:
+    """Tests for BatchProcessor on persistent workers."""
+
+    def test_process_batch(self, worker_command, worker_env, tmp_path, monkeypatch):
+        """A batch runs on the pool and reports per-job results."""
+        monkeypatch.setenv("PYTHONPATH", worker_env["PYTHONPATH"])
+        config = BatchConfig(
+            workers=2,
+            max_retries=0,
+            checkpoint_path=str(tmp_path / "checkpoint.json"),
+        )
+        processor = BatchProcessor(config, worker_command=worker_command)
+        jobs = [_job(f"shot_{i}", str(tmp_path / f"out_{i}.txt")) for i in range(6)]
+        jobs.append(_job("fail"))
+
+        result = processor.process_batch(jobs)
+
+        assert result.completed == 6
+        assert result.failed == 1
+        pids = {(tmp_path / f"out_{i}.txt").read_text() for i in range(6)}
+        assert 1 <= len(pids) <= 2
+
+    def test_config_round_trip(self):
+        """Worker pool settings survive to_dict/from_dict."""
+        config = BatchConfig(
+            persistent_workers=False,
+            max_jobs_per_worker=3,
+            max_worker_memory_mb=2048,
+            blender_path="/opt/blender/blender",
+        )
+        assert BatchConfig.from_dict(config.to_dict()) == config
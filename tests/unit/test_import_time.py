@@ -0,0 +1,150 @@
+"""
+Import-time benchmarks for packages with lazy public APIs.
+
+lib.cinematic and lib.retro resolve their public names on first access
+(PEP 562). These tests run `python -X importtime` in a fresh interpreter
+and guard against regressions that load the whole package tree again.
+
+The sys.modules checks are the regression guard. The wall-clock budgets
+depend on machine load, so they only run when GSD_IMPORT_BUDGETS=1.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import budgets in microseconds; eager loading took over
+# 200 ms for lib.cinematic.types and lib.retro
+IMPORT_BUDGETS_US = {
+    "lib.cinematic": 150_000,
+    "lib.cinematic.types": 150_000,
+    "lib.retro": 150_000,
+    "lib.tips": 150_000,
+}
+
+
+def run_import(statement: str):
+    """
+    Run an import statement with -X importtime in a fresh interpreter.
+
+    Returns:
+        Tuple of (cumulative microseconds by module, loaded module names)
+    """
+    code = f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, total, name = line.split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total)
+
+    return cumulative, set(json.loads(result.stdout))
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    os.environ.get("GSD_IMPORT_BUDGETS") != "1",
+    reason="wall-clock budget; set GSD_IMPORT_BUDGETS=1 to run",
+)
+class TestImportBudget:
+    """Package imports stay within their time budget."""
+
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_US))
+    def test_import_budget(self, module):
+        """Best of three cold imports stays under budget."""
+        timings = [run_import(f"import {module}")[0][module] for _ in range(3)]
+        assert min(timings) < IMPORT_BUDGETS_US[module], (
+            f"import {module} took {min(timings) / 1000:.1f} ms"
+        )
+
+
+class TestLazyLoading:
+    """Package imports do not load their heavy submodules."""
+
+    def test_cinematic_types_only(self):
+        """Importing lib.cinematic.types skips the rest of the package."""
+        _, loaded = run_import("import lib.cinematic.types")
+
+        assert "lib.cinematic.types" in loaded
+        for module in ("tracking", "projection", "follow_cam", "animation", "render"):
+            assert f"lib.cinematic.{module}" not in loaded
+
+    def test_retro_package_only(self):
+        """Importing lib.retro loads no submodules or numpy."""
+        _, loaded = run_import("import lib.retro")
+
+        assert not [name for name in loaded if name.startswith("lib.retro.")]
+        assert "numpy" not in loaded
+
+    def test_names_resolve_on_access(self):
+        """Public names import their submodule on first access."""
+        _, loaded = run_import(
+            "import lib.cinematic\n"
+            "assert lib.cinematic.CameraConfig.__module__ == 'lib.cinematic.types'"
+        )
+
+        assert "lib.cinematic.types" in loaded
+        assert "lib.cinematic.tracking" not in loaded
+
+
+class TestLazyAttributes:
+    """Lazy packages expose the same public names as before."""
+
+    def test_all_names_resolve(self):
+        """Every name in __all__ is reachable on the package."""
+        pytest.importorskip("numpy")
+        import lib.retro
+
+        missing = [name for name in lib.retro.__all__ if not hasattr(lib.retro, name)]
+        assert missing == []
+
+    def test_aliases(self):
+        """Renamed exports resolve to their source functions."""
+        from lib.cinematic import list_gel_preset_names, set_focus_mode
+        from lib.cinematic.follow_focus import set_focus_mode as follow_focus_mode
+        from lib.cinematic.gel import list_gel_presets
+
+        assert list_gel_preset_names is list_gel_presets
+        assert set_focus_mode is follow_focus_mode
+
+    def test_dither_function_not_shadowed(self):
+        """lib.retro.dither stays the function after its module loads."""
+        pytest.importorskip("numpy")
+        import importlib
+
+        import lib.retro
+
+        importlib.import_module("lib.retro.dither")
+        assert callable(lib.retro.dither)
+        assert lib.retro.dither.__module__ == "lib.retro.dither"
+
+    def test_unknown_name(self):
+        """Unknown names still raise AttributeError."""
+        import lib.retro
+
+        with pytest.raises(AttributeError):
+            lib.retro.not_a_public_name
+
+    def test_dir_lists_lazy_names(self):
+        """dir() includes names that are not imported yet."""
+        import lib.cinematic
+
+        assert "CameraConfig" in dir(lib.cinematic)
+        assert "create_camera" in dir(lib.cinematic)
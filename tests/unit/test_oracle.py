@@ -22,6 +22,7 @@ from lib.oracle import (
     exit_code_zero,
     no_stderr,
     all_pass,
+    images_similar,
 )
 
 
@@ -345,6 +346,42 @@ class TestAllPass:
         assert "Validation failures (2)" in str(exc_info.value)
 
 
+class TestImagesSimilar:
+    """Unit tests for images_similar function."""
+
+    def _save(self, path, pixels):
+        Image = pytest.importorskip("PIL.Image")
+        Image.fromarray(pixels).save(path)
+        return path
+
+    def test_counts_different_pixels(self, tmp_path):
+        """Pixels over the channel threshold count as different."""
+        np = pytest.importorskip("numpy")
+        base = np.full((10, 10, 3), 100, dtype=np.uint8)
+        changed = base.copy()
+        changed[0, :5, 1] = 111   # over threshold
+        changed[1, :5, 2] = 110   # at threshold
+
+        a = self._save(tmp_path / "a.png", base)
+        b = self._save(tmp_path / "b.png", changed)
+
+        matches, ratio = images_similar(a, b, pixel_tolerance=0.1, color_threshold=10)
+        assert matches is True
+        assert ratio == pytest.approx(0.05)
+
+        with pytest.raises(AssertionError, match="Images differ by 5.00%"):
+            images_similar(a, b, pixel_tolerance=0.01)
+
+    def test_band_count_mismatch(self, tmp_path):
+        """Images with different band counts never match."""
+        np = pytest.importorskip("numpy")
+        a = self._save(tmp_path / "a.png", np.zeros((4, 4, 3), dtype=np.uint8))
+        b = self._save(tmp_path / "b.png", np.zeros((4, 4, 4), dtype=np.uint8))
+
+        with pytest.raises(AssertionError, match="100.00%"):
+            images_similar(a, b)
+
+
 # Run tests if executed directly
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,236 @@
+"""
+Unit tests for Point Tracker module
+
+Tests for:
+- Image pyramids and the shared pyramid cache
+- NumPy Shi-Tomasi/Harris feature detection
+- Batched pyramidal KLT tracking
+- PointTracker forward/backward/auto tracking
+- Throughput benchmark
+"""
+
+import pytest
+import numpy as np
+
+from lib.cinematic.tracking import point_tracker
+from lib.cinematic.tracking.point_tracker import (
+    FeatureDetectorEngine,
+    ImagePyramid,
+    KLTTracker,
+    PointTracker,
+    PyramidCache,
+    benchmark_point_tracker,
+    synthetic_translated_sequence,
+)
+from lib.cinematic.tracking.types import (
+    FeatureDetector,
+    Track,
+    TrackPoint,
+    TrackStatus,
+    TrackingConfig,
+    TrackingSession,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_opencv(monkeypatch):
+    """Exercise the NumPy code paths even if OpenCV is installed."""
+    monkeypatch.setattr(point_tracker, "HAS_OPENCV", False)
+
+
+def _squares_image(width=96, height=64):
+    """Dark background with bright squares whose corners are features."""
+    image = np.zeros((height, width), dtype=np.uint8)
+    image[16:32, 16:32] = 255
+    image[30:50, 56:80] = 200
+    return image
+
+
+class TestImagePyramid:
+    """Tests for pyramid construction and caching."""
+
+    def test_levels_and_gradients(self):
+        """Levels halve in size; gradients are computed once."""
+        pyramid = ImagePyramid(np.zeros((64, 100), dtype=np.uint8))
+        assert pyramid.level(2).shape == (16, 25)
+        assert pyramid.level(0).dtype == np.float32
+        assert pyramid.gradients(1) is pyramid.gradients(1)
+
+    def test_max_level_limited_by_window(self):
+        """Levels smaller than the tracking window are not used."""
+        pyramid = ImagePyramid(np.zeros((64, 64)))
+        assert pyramid.max_level(5, 21) == 1
+        assert pyramid.max_level(0, 21) == 0
+
+    def test_rgb_input(self):
+        """RGB frames are converted to grayscale."""
+        pyramid = ImagePyramid(np.full((8, 8, 3), 255, dtype=np.uint8))
+        assert pyramid.shape == (8, 8)
+        np.testing.assert_allclose(pyramid.level(0), 1.0, atol=1e-5)
+
+    def test_cache_hits_and_eviction(self):
+        """Frames are loaded once and evicted least recently used."""
+        loads = []
+
+        def get_frame(frame):
+            loads.append(frame)
+            return np.zeros((8, 8))
+
+        cache = PyramidCache(max_entries=2)
+        first = cache.get(1, get_frame)
+        assert cache.get(1, get_frame) is first
+        cache.get(2, get_frame)
+        cache.get(3, get_frame)
+        cache.get(1, get_frame)
+
+        assert loads == [1, 2, 3, 1]
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["hits"] == 1
+        assert stats["misses"] == 4
+
+
+class TestFeatureDetection:
+    """Tests for NumPy corner detection."""
+
+    @pytest.mark.parametrize("detector", [FeatureDetector.SHI_TOMASI, FeatureDetector.HARRIS])
+    def test_finds_square_corners(self, detector):
+        """Strongest features sit on the square corners."""
+        config = TrackingConfig(detector=detector, flow_window_size=9, min_distance=5)
+        result = FeatureDetectorEngine(config).detect(_squares_image(), max_features=8)
+
+        corners = np.array([
+            (16, 16), (31, 16), (16, 31), (31, 31),
+            (56, 30), (79, 30), (56, 49), (79, 49),
+        ], dtype=float)
+        found = np.array([f.position for f in result.features]) * (96, 64)
+        assert len(found) == 8
+        distances = np.linalg.norm(found[:, None] - corners[None], axis=2).min(axis=1)
+        assert distances.max() <= 2.0
+        assert result.features[0].strength == pytest.approx(1.0)
+
+    def test_min_distance_and_max_features(self):
+        """Features respect spacing and the requested count."""
+        frame = synthetic_translated_sequence(120, 90, 1)[0]
+        config = TrackingConfig(min_distance=12, flow_window_size=9)
+        features = FeatureDetectorEngine(config).detect(frame, max_features=20).features
+
+        assert len(features) == 20
+        pixels = np.array([f.position for f in features]) * (120, 90)
+        gaps = np.linalg.norm(pixels[:, None] - pixels[None], axis=2)
+        assert gaps[~np.eye(20, dtype=bool)].min() >= 12
+
+    def test_mask_and_flat_image(self):
+        """Masked-out regions and textureless images yield no features."""
+        engine = FeatureDetectorEngine(TrackingConfig(flow_window_size=9))
+        mask = np.zeros((64, 96), dtype=np.uint8)
+        mask[:, 48:] = 1
+        features = engine.detect(_squares_image(), mask=mask).features
+        assert features and all(f.position[0] >= 0.5 for f in features)
+        assert engine.detect(np.zeros((64, 96))).features == []
+
+
+class TestKLTTracker:
+    """Tests for the batched pyramidal Lucas-Kanade tracker."""
+
+    def test_subpixel_translation(self):
+        """Points follow a sub-pixel translation."""
+        frames = synthetic_translated_sequence(160, 120, 2, shift=(0.4, -0.7))
+        points = np.array([[40.0, 40.0], [80.5, 60.25], [120.0, 80.0]])
+
+        new_points, status, errors = KLTTracker().track_pixels(frames[0], frames[1], points)
+
+        assert status.all()
+        np.testing.assert_allclose(new_points, points + (0.4, -0.7), atol=0.05)
+        assert (errors < 0.01).all()
+
+    def test_large_motion_uses_pyramid(self):
+        """Motion larger than the window radius is recovered coarse to fine."""
+        frames = synthetic_translated_sequence(320, 240, 2, shift=(14.0, 9.0))
+        points = np.array([[60.0, 60.0], [100.0, 70.0]])
+
+        pyramidal, status, _ = KLTTracker().track_pixels(frames[0], frames[1], points)
+        assert status.all()
+        np.testing.assert_allclose(pyramidal, points + (14.0, 9.0), atol=0.1)
+
+        single = TrackingConfig(flow_max_level=0, flow_window_size=9)
+        flat, _, _ = KLTTracker(single).track_pixels(frames[0], frames[1], points)
+        assert np.abs(flat - (points + (14.0, 9.0))).max() > 1.0
+
+    def test_lost_points(self):
+        """Textureless and out-of-frame points are reported lost."""
+        frame = synthetic_translated_sequence(100, 100, 1)[0].copy()
+        frame[:, :40] = 0.5
+        shifted = np.roll(frame, 6, axis=1)
+        points = np.array([[15.0, 50.0], [70.0, 50.0], [98.0, 50.0]])
+
+        _, status, _ = KLTTracker().track_pixels(frame, shifted, points)
+        assert status.tolist() == [False, True, False]
+
+    def test_normalized_interface(self):
+        """track() works in normalized coordinates and keeps lost points in place."""
+        frames = synthetic_translated_sequence(100, 80, 2, shift=(2.0, 1.0))
+        new_points, status, errors = KLTTracker().track(
+            frames[0], frames[1], [(0.5, 0.5), (2.0, 2.0)]
+        )
+        assert status == [True, False]
+        assert new_points[0] == pytest.approx((0.52, 0.5125), abs=1e-3)
+        assert new_points[1] == (2.0, 2.0)
+        assert errors[1] == 1.0
+
+
+class TestPointTracker:
+    """Tests for the combined tracker."""
+
+    def _tracks(self, positions, frame):
+        return [
+            Track(name=f"t{i}", points=[TrackPoint(frame=frame, position=p)])
+            for i, p in enumerate(positions)
+        ]
+
+    def test_forward_then_backward_shares_pyramids(self):
+        """Each frame is loaded once across forward and backward passes."""
+        frames = synthetic_translated_sequence(120, 90, 6, shift=(1.0, 0.5))
+        loads = []
+
+        def get_frame(frame):
+            loads.append(frame)
+            return frames[frame]
+
+        tracker = PointTracker(TrackingConfig(keyframe_interval=2))
+        forward = self._tracks([(0.4, 0.4), (0.6, 0.5)], frame=2)
+        tracker.track_forward(forward, 2, 5, get_frame)
+        backward = self._tracks([(0.4, 0.4), (0.6, 0.5)], frame=2)
+        result = tracker.track_backward(backward, 2, 0, get_frame)
+
+        assert sorted(loads) == [0, 1, 2, 3, 4, 5]
+        assert result.tracked_frames == 2
+        point = forward[0].get_point_at_frame(5)
+        assert point.status == TrackStatus.OK
+        assert point.position == pytest.approx((0.4 + 3 / 120, 0.4 + 1.5 / 90), abs=1e-3)
+        assert backward[0].points[0].frame == 0
+        assert 4 in forward[0].is_keyframe
+
+    def test_auto_track(self):
+        """Auto tracking detects, tracks and keeps most features."""
+        frames = synthetic_translated_sequence(160, 120, 5, shift=(1.0, -0.5))
+        session = TrackingSession(frame_start=0, frame_end=4)
+        tracker = PointTracker(TrackingConfig(max_features=30, min_features=5))
+
+        result = tracker.auto_track(session, lambda f: frames[f])
+
+        assert result.tracked_frames == 4
+        complete = [t for t in result.tracks if t.get_point_at_frame(4)]
+        assert len(complete) >= 20
+        assert tracker.pyramid_cache.stats()["misses"] == 5
+
+
+def test_benchmark_reports_throughput():
+    """Benchmark tracks the synthetic sequence accurately."""
+    result = benchmark_point_tracker(width=160, height=120, frames=4, point_counts=(10, 40))
+
+    assert set(result["klt"]) == {10, 40}
+    for entry in result["klt"].values():
+        assert entry["point_frames_per_second"] > 0
+        assert entry["tracked_fraction"] == 1.0
+        assert entry["mean_error_px"] < 0.1
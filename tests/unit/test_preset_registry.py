@@ -0,0 +1,191 @@
+"""
+Unit tests for the preset registry in lib/cinematic/preset_loader.py
+
+Tests parsed-document caching, memoized template inheritance and
+compiled snapshots. All tests run without Blender.
+"""
+
+import os
+import pickle
+
+import pytest
+
+pytest.importorskip("yaml")
+
+from lib.cinematic import preset_loader
+from lib.cinematic.preset_loader import (
+    PresetRegistry,
+    get_lens_preset,
+    list_lens_presets,
+    load_preset,
+    resolve_template_inheritance,
+)
+
+
+LENSES_YAML = """
+lenses:
+  50mm_normal:
+    focal_length: 50
+    tags: [normal]
+  85mm_portrait:
+    focal_length: 85
+"""
+
+TEMPLATES_YAML = """
+templates:
+  base:
+    abstract: true
+    camera: {focal_length: 50, f_stop: 4.0}
+    lighting: soft
+  product:
+    extends: base
+    camera: {focal_length: 85}
+  product_hero:
+    extends: product
+    lighting: dramatic
+"""
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Fresh process-wide registry for each test."""
+    fresh = PresetRegistry()
+    monkeypatch.setattr(preset_loader, "_preset_registry", fresh)
+    return fresh
+
+
+def _rewrite(path, text):
+    """Rewrite a file and move its mtime forward."""
+    stat = os.stat(path)
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestPresetRegistry:
+    """Tests for parsed-document caching."""
+
+    def test_documents_parsed_once(self, registry, tmp_path):
+        """Repeated loads hit the cache and loaders return copies."""
+        path = tmp_path / "lens_presets.yaml"
+        path.write_text(LENSES_YAML)
+
+        first = load_preset(path)
+        first["lenses"].clear()
+        second = load_preset(path)
+
+        assert sorted(second["lenses"]) == ["50mm_normal", "85mm_portrait"]
+        stats = registry.get_statistics()
+        assert (stats["misses"], stats["hits"], stats["documents"]) == (1, 1, 1)
+
+    def test_edited_file_is_reparsed(self, registry, tmp_path):
+        """A changed mtime or size invalidates the cached document."""
+        path = tmp_path / "lens_presets.yaml"
+        path.write_text(LENSES_YAML)
+        registry.load(path)
+
+        _rewrite(path, "lenses: {35mm_wide: {focal_length: 35}}\n")
+
+        assert list(registry.load(path)["lenses"]) == ["35mm_wide"]
+        assert registry.get_statistics()["stale"] == 1
+
+    def test_missing_file(self, registry, tmp_path):
+        """Missing presets raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_preset(tmp_path / "missing.yaml")
+
+    def test_getters_use_cache(self, registry, tmp_path, monkeypatch):
+        """Named getters parse once and return independent copies."""
+        (tmp_path / "lens_presets.yaml").write_text(LENSES_YAML)
+        monkeypatch.setattr(preset_loader, "CONFIG_ROOT", tmp_path)
+
+        lens = get_lens_preset("50mm_normal")
+        lens["tags"].append("modified")
+
+        assert get_lens_preset("50mm_normal")["tags"] == ["normal"]
+        assert list_lens_presets() == ["50mm_normal", "85mm_portrait"]
+        assert registry.get_statistics()["misses"] == 1
+        with pytest.raises(ValueError, match="not found"):
+            get_lens_preset("missing")
+
+
+class TestTemplateResolution:
+    """Tests for memoized template inheritance."""
+
+    @pytest.fixture
+    def templates(self, tmp_path, monkeypatch):
+        path = tmp_path / "templates.yaml"
+        path.write_text(TEMPLATES_YAML)
+        monkeypatch.setattr(preset_loader, "SHOT_CONFIG_ROOT", tmp_path)
+        return path
+
+    def test_resolved_once(self, registry, templates):
+        """Chains resolve against one parsed document and are memoized."""
+        hero = resolve_template_inheritance("product_hero")
+        hero["camera"]["focal_length"] = 24
+
+        again = resolve_template_inheritance("product_hero")
+        assert again["camera"] == {"focal_length": 85, "f_stop": 4.0}
+        assert again["lighting"] == "dramatic"
+
+        stats = registry.get_statistics()
+        assert stats["misses"] == 1
+        assert stats["resolved_templates"] == 1
+
+    def test_matches_uncached_resolution(self, registry, templates):
+        """Memoized results equal the explicit loaded_templates path."""
+        for name in ("product", "product_hero"):
+            assert resolve_template_inheritance(name) == resolve_template_inheritance(name, {})
+
+    def test_errors(self, registry, templates):
+        """Abstract and unknown templates still raise."""
+        with pytest.raises(ValueError, match="abstract"):
+            resolve_template_inheritance("base")
+        with pytest.raises(ValueError, match="not found"):
+            resolve_template_inheritance("missing")
+
+    def test_edit_invalidates(self, registry, templates):
+        """Editing templates.yaml drops resolved templates."""
+        resolve_template_inheritance("product")
+        _rewrite(templates, TEMPLATES_YAML.replace("focal_length: 85", "focal_length: 135"))
+
+        assert resolve_template_inheritance("product")["camera"]["focal_length"] == 135
+
+
+class TestPresetSnapshot:
+    """Tests for compiled snapshots."""
+
+    def test_round_trip(self, tmp_path):
+        """A snapshot fills a cold registry without parsing."""
+        root = tmp_path / "configs"
+        (root / "cameras").mkdir(parents=True)
+        (root / "cameras" / "lens_presets.yaml").write_text(LENSES_YAML)
+        (root / "shots").mkdir()
+        (root / "shots" / "templates.yaml").write_text(TEMPLATES_YAML)
+        (root / "notes.txt").write_text("not a preset")
+        snapshot = tmp_path / "build" / "presets.pickle"
+
+        assert PresetRegistry().compile_snapshot(root, snapshot) == 2
+
+        cold = PresetRegistry()
+        assert cold.load_snapshot(snapshot, root) == 2
+        assert "85mm_portrait" in cold.load(root / "cameras" / "lens_presets.yaml")["lenses"]
+        resolved = cold.resolve_template(root / "shots" / "templates.yaml", "product_hero")
+        assert resolved["camera"]["focal_length"] == 85
+
+        stats = cold.get_statistics()
+        assert (stats["misses"], stats["hits"], stats["snapshot_entries"]) == (0, 2, 2)
+
+    def test_outdated_snapshot_ignored(self, tmp_path):
+        """Missing or foreign snapshots load nothing."""
+        path = tmp_path / "presets.pickle"
+        assert PresetRegistry().load_snapshot(path, tmp_path) == 0
+
+        path.write_bytes(pickle.dumps({"version": -1, "entries": {}}))
+        assert PresetRegistry().load_snapshot(path, tmp_path) == 0
+
+    def test_repository_configs(self, tmp_path):
+        """Every config in the repository compiles into a snapshot."""
+        if not os.path.isdir("configs/cinematic"):
+            pytest.skip("configs/ not available")
+        count = PresetRegistry().compile_snapshot("configs", tmp_path / "presets.pickle")
+        assert count > 0
@@ -0,0 +1,253 @@
+"""
+Unit tests for ST-Map module
+
+Tests for:
+- Vectorized Brown-Conrady distortion
+- Array-backed ST-Map generation
+- Streaming EXR/PNG writers and loader
+- ST-Map application
+- Parallel batch generation with disk cache
+"""
+
+import pytest
+import numpy as np
+
+from lib.cinematic.tracking.calibration import (
+    CameraProfileManager,
+    DistortionCoefficients,
+    LensDistortion,
+)
+from lib.cinematic.tracking import st_map as st_map_module
+from lib.cinematic.tracking.st_map import (
+    STMapConfig,
+    STMapGenerator,
+    STMapBatchGenerator,
+    apply_st_map,
+    load_st_map,
+    sample_st_map,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_blender(monkeypatch):
+    """Use the built-in writers even when bpy is mocked."""
+    monkeypatch.setattr(st_map_module, "HAS_BLENDER", False)
+
+
+@pytest.fixture
+def profile():
+    """Profile with noticeable radial and tangential distortion."""
+    return CameraProfileManager().get_profile("iphone_14_pro_ultra_wide")
+
+
+def _reference_map(profile, config):
+    """Per-pixel ST-Map as computed by the scalar model."""
+    coeffs = DistortionCoefficients.from_profile(profile)
+    span = 1.0 + 2 * config.overscan
+    pixels = np.zeros((config.resolution_y, config.resolution_x, 4), dtype=np.float32)
+    for y in range(config.resolution_y):
+        for x in range(config.resolution_x):
+            cx = -config.overscan + span * x / config.resolution_x - 0.5
+            cy = -config.overscan + span * y / config.resolution_y - 0.5
+            if config.encode_undistort:
+                sx, sy = LensDistortion.remove_brown_conrady(cx, cy, coeffs)
+            else:
+                sx, sy = LensDistortion.apply_brown_conrady(cx, cy, coeffs)
+            pixels[y, x] = (
+                max(0.0, min(1.0, sx + 0.5)),
+                max(0.0, min(1.0, sy + 0.5)),
+                0.5,
+                1.0,
+            )
+    return pixels
+
+
+class TestVectorizedDistortion:
+    """Tests for array Brown-Conrady methods."""
+
+    def test_array_matches_scalar(self, profile):
+        """Array forward/inverse equal the scalar implementation."""
+        coeffs = DistortionCoefficients.from_profile(profile)
+        rng = np.random.default_rng(0)
+        x = rng.uniform(-0.6, 0.6, 50)
+        y = rng.uniform(-0.6, 0.6, 50)
+
+        ax, ay = LensDistortion.apply_brown_conrady_array(x, y, coeffs)
+        ux, uy = LensDistortion.remove_brown_conrady_array(x, y, coeffs)
+        for i in range(len(x)):
+            assert (ax[i], ay[i]) == pytest.approx(
+                LensDistortion.apply_brown_conrady(x[i], y[i], coeffs), abs=1e-12
+            )
+            assert (ux[i], uy[i]) == pytest.approx(
+                LensDistortion.remove_brown_conrady(x[i], y[i], coeffs), abs=1e-12
+            )
+
+    def test_inverse_round_trip(self, profile):
+        """Removing then applying distortion returns the input."""
+        coeffs = DistortionCoefficients.from_profile(profile)
+        x, y = np.meshgrid(np.linspace(-0.5, 0.5, 9), np.linspace(-0.5, 0.5, 7))
+        ux, uy = LensDistortion.remove_brown_conrady_array(x, y, coeffs)
+        dx, dy = LensDistortion.apply_brown_conrady_array(ux, uy, coeffs)
+        np.testing.assert_allclose(dx, x, atol=1e-6)
+        np.testing.assert_allclose(dy, y, atol=1e-6)
+
+
+class TestSTMapGenerator:
+    """Tests for array-backed generation."""
+
+    @pytest.mark.parametrize("undistort", [True, False])
+    def test_matches_scalar_reference(self, profile, undistort):
+        """Vectorized generation reproduces the per-pixel model."""
+        config = STMapConfig(resolution_x=31, resolution_y=17, encode_undistort=undistort)
+        result = STMapGenerator(config).generate(profile)
+
+        assert result.pixels.shape == (17, 31, 4)
+        assert result.pixels.dtype == np.float32
+        np.testing.assert_allclose(result.pixels, _reference_map(profile, config), atol=1e-6)
+
+    def test_bands_cover_map(self, profile):
+        """Small bands produce the same map and report progress."""
+        config = STMapConfig(resolution_x=16, resolution_y=10)
+        generator = STMapGenerator(config)
+        full = generator.generate(profile)
+
+        bands = list(generator.iter_bands(profile, band_pixels=48))
+        assert [y0 for y0, _ in bands] == [0, 3, 6, 9]
+        np.testing.assert_array_equal(np.concatenate([b for _, b in bands]), full.pixels)
+
+        progress = []
+        generator.generate(profile, progress.append)
+        assert progress[-1] == 1.0
+
+    def test_data_compatibility(self, profile):
+        """Legacy tuple view mirrors the pixel array."""
+        result = STMapGenerator(STMapConfig(resolution_x=4, resolution_y=3)).generate(profile)
+        assert len(result.data) == 12
+        assert result.data[5] == pytest.approx(tuple(result.pixels[1, 1]))
+
+
+class TestSTMapFiles:
+    """Tests for the streaming writers and loader."""
+
+    @pytest.mark.parametrize("bit_depth", [16, 32])
+    def test_exr_round_trip(self, profile, tmp_path, bit_depth):
+        """EXR output reloads within half/float precision."""
+        config = STMapConfig(resolution_x=24, resolution_y=12, bit_depth=bit_depth, include_alpha=True)
+        generator = STMapGenerator(config)
+        result = generator.generate(profile)
+        path = str(tmp_path / "map.exr")
+
+        assert generator.save_exr(result, path)
+        loaded = load_st_map(path)
+        assert loaded.shape == (12, 24, 4)
+        np.testing.assert_allclose(loaded, result.pixels, atol=1e-3 if bit_depth == 16 else 0)
+
+    @pytest.mark.parametrize("bit_depth", [8, 16])
+    def test_png_round_trip(self, profile, tmp_path, bit_depth):
+        """PNG output reloads within quantization error."""
+        config = STMapConfig(resolution_x=24, resolution_y=12, bit_depth=bit_depth)
+        generator = STMapGenerator(config)
+        result = generator.generate(profile)
+        path = str(tmp_path / "map.png")
+
+        assert generator.save_png(result, path)
+        loaded = load_st_map(path)
+        assert loaded.shape == (12, 24, 3)
+        np.testing.assert_allclose(loaded, result.pixels[..., :3], atol=0.51 / (2 ** bit_depth - 1))
+
+    def test_png_readable_by_pil(self, profile, tmp_path):
+        """Written PNG is a valid file for other readers."""
+        Image = pytest.importorskip("PIL.Image")
+        config = STMapConfig(resolution_x=24, resolution_y=12, bit_depth=8)
+        generator = STMapGenerator(config)
+        path = str(tmp_path / "map.png")
+        generator.save_png(generator.generate(profile), path)
+
+        img = Image.open(path)
+        assert img.size == (24, 12)
+        assert img.mode == "RGB"
+
+    def test_generate_to_file_streams(self, profile, tmp_path):
+        """Streaming straight to disk matches generate + save."""
+        config = STMapConfig(resolution_x=20, resolution_y=9, bit_depth=32)
+        generator = STMapGenerator(config)
+
+        assert generator.generate_to_file(profile, str(tmp_path / "streamed.exr"))
+        generator.save_exr(generator.generate(profile), str(tmp_path / "saved.exr"))
+        assert (tmp_path / "streamed.exr").read_bytes() == (tmp_path / "saved.exr").read_bytes()
+
+
+class TestApplySTMap:
+    """Tests for ST-Map application."""
+
+    def test_nearest_matches_loop(self):
+        """Vectorized nearest sampling equals the per-pixel lookup."""
+        rng = np.random.default_rng(1)
+        image = rng.integers(0, 256, (10, 14, 3)).astype(np.uint8)
+        st_map = rng.uniform(-0.1, 1.1, (10, 14, 2)).astype(np.float32)
+
+        expected = np.zeros_like(image)
+        for y in range(10):
+            for x in range(14):
+                sx = max(0, min(13, int(st_map[y, x, 0] * 13)))
+                sy = max(0, min(9, int(st_map[y, x, 1] * 9)))
+                expected[y, x] = image[sy, sx]
+
+        np.testing.assert_array_equal(sample_st_map(image, st_map), expected)
+
+    def test_bilinear_identity(self):
+        """An identity map reproduces the image."""
+        rng = np.random.default_rng(2)
+        image = rng.random((6, 8)).astype(np.float32)
+        gx, gy = np.meshgrid(np.linspace(0, 1, 8), np.linspace(0, 1, 6))
+        st_map = np.stack([gx, gy], axis=-1)
+
+        np.testing.assert_allclose(sample_st_map(image, st_map, "bilinear"), image, atol=1e-5)
+
+    def test_apply_st_map_files(self, tmp_path):
+        """File-level application with an EXR map."""
+        Image = pytest.importorskip("PIL.Image")
+        rng = np.random.default_rng(3)
+        image = rng.integers(0, 256, (12, 16, 3)).astype(np.uint8)
+        Image.fromarray(image).save(tmp_path / "in.png")
+
+        # Horizontal flip map
+        config = STMapConfig(resolution_x=16, resolution_y=12, bit_depth=32)
+        gx, gy = np.meshgrid(np.linspace(1, 0, 16), np.linspace(0, 1, 12))
+        pixels = np.stack([gx, gy, np.full_like(gx, 0.5), np.ones_like(gx)], axis=-1).astype(np.float32)
+        from lib.cinematic.tracking.st_map import STMapResult
+        STMapGenerator(config).save_exr(
+            STMapResult(width=16, height=12, pixels=pixels), str(tmp_path / "flip.exr")
+        )
+
+        assert apply_st_map(str(tmp_path / "in.png"), str(tmp_path / "flip.exr"), str(tmp_path / "out.png"))
+        np.testing.assert_array_equal(np.array(Image.open(tmp_path / "out.png")), image[:, ::-1])
+
+
+class TestSTMapBatchGenerator:
+    """Tests for parallel batch generation."""
+
+    def test_parallel_profiles_with_cache(self, tmp_path):
+        """Profiles run in parallel; second run is served from cache."""
+        config = STMapConfig(resolution_x=16, resolution_y=8)
+        names = ["iphone_14_pro_main", "iphone_14_pro_ultra_wide", "not_a_profile"]
+        batch = STMapBatchGenerator(config, cache_dir=str(tmp_path / "cache"), max_workers=3)
+
+        first = batch.generate_for_profiles(names, str(tmp_path))
+        second = batch.generate_for_profiles(names, str(tmp_path))
+
+        assert list(first) == names
+        assert first["not_a_profile"].pixels is None
+        for name in names[:2]:
+            assert not first[name].cached
+            assert second[name].cached
+            np.testing.assert_array_equal(first[name].pixels, second[name].pixels)
+            assert (tmp_path / f"stmap_{name}.exr").exists()
+        assert len(list((tmp_path / "cache").glob("*.npy"))) == 2
+
+    def test_resolutions(self, tmp_path):
+        """One map per resolution, in order."""
+        batch = STMapBatchGenerator(STMapConfig())
+        results = batch.generate_for_resolutions("iphone_14_pro_main", [(8, 4), (12, 6)], str(tmp_path))
+        assert [(r.width, r.height) for r in results] == [(8, 4), (12, 6)]
+        assert results[1].pixels.shape == (6, 12, 4)
@@ -0,0 +1,221 @@
+"""
+Tests for lib/vfx/array_compositor.py and LayerCompositor rendering
+
+Composites small frames with the NumPy engine without Blender (bpy).
+"""
+
+import os
+
+import pytest
+
+from lib.vfx import array_ops
+from lib.vfx.array_compositor import (
+    ArrayCompositor,
+    LayerCacheEntry,
+    expand_mask,
+    feather_mask,
+    resolve_frame_path,
+)
+from lib.vfx.compositor_types import (
+    BlendMode,
+    ColorCorrection,
+    CompLayer,
+    CompositeConfig,
+    GradientStop,
+    LayerMask,
+    LayerSource,
+    Transform2D,
+)
+from lib.vfx.layer_compositor import LayerCompositor
+
+np = pytest.importorskip("numpy")
+
+
+def _config(**kwargs):
+    kwargs.setdefault("resolution", (16, 12))
+    kwargs.setdefault("frame_range", (1, 4))
+    kwargs.setdefault("background_color", (0.0, 0.0, 0.0, 1.0))
+    return CompositeConfig(name="Test", **kwargs)
+
+
+def _write_npy(path, rgba):
+    np.save(path, np.asarray(rgba, dtype=np.float32))
+    return str(path)
+
+
+class TestArrayCompositor:
+    """Tests for the compositing engine."""
+
+    def test_background_only(self):
+        """An empty stack yields the background color."""
+        config = _config(background_color=(0.2, 0.3, 0.4, 1.0))
+        image = ArrayCompositor(config).composite(1)
+
+        assert image.shape == (12, 16, 4)
+        assert image.dtype == np.float32
+        np.testing.assert_allclose(image[5, 5], (0.2, 0.3, 0.4, 1.0), atol=1e-6)
+
+    def test_blend_matches_scalar_on_opaque_base(self):
+        """Over an opaque base, layers blend like the scalar functions."""
+        config = _config(background_color=(0.6, 0.4, 0.2, 1.0))
+        config.add_layer(CompLayer(
+            name="Over", source="solid", source_type=LayerSource.SOLID,
+            solid_color=(0.3, 0.8, 0.5, 1.0), blend_mode=BlendMode.OVERLAY, opacity=0.5,
+        ))
+        image = ArrayCompositor(config).composite(1)
+
+        expected = array_ops.blend_overlay([0.6, 0.4, 0.2], [0.3, 0.8, 0.5], 0.5)
+        np.testing.assert_allclose(image[0, 0, :3], expected, atol=1e-5)
+        assert image[0, 0, 3] == pytest.approx(1.0)
+
+    def test_tiles_match_single_pass(self, tmp_path):
+        """Tile height does not change the result."""
+        rng = np.random.default_rng(3)
+        plate = _write_npy(tmp_path / "plate.npy", rng.uniform(0, 1, (12, 16, 4)))
+        config = _config()
+        config.add_layer(CompLayer(
+            name="Plate", source=plate, source_type=LayerSource.IMAGE_SEQUENCE,
+            transform=Transform2D(position=(2.5, -1.0), rotation=0.3, scale=(1.2, 0.9)),
+            color_correction=ColorCorrection(exposure=0.3, saturation=0.7),
+            mask=LayerMask(source="alpha", feather=2.0),
+            blend_mode=BlendMode.SCREEN,
+        ))
+
+        whole = ArrayCompositor(config, tile_rows=64).composite(1)
+        tiled = ArrayCompositor(config, tile_rows=5).composite(1)
+        np.testing.assert_allclose(tiled, whole, atol=1e-6)
+
+    def test_transform_translates(self, tmp_path):
+        """Position moves the layer in pixels (+y is up)."""
+        plate = np.zeros((12, 16, 4), dtype=np.float32)
+        plate[4, 6] = (1.0, 1.0, 1.0, 1.0)
+        config = _config()
+        config.add_layer(CompLayer(
+            name="Dot", source=_write_npy(tmp_path / "dot.npy", plate),
+            source_type=LayerSource.IMAGE_SEQUENCE,
+            transform=Transform2D(position=(3.0, 2.0)),
+        ))
+        image = ArrayCompositor(config).composite(1)
+
+        assert image[2, 9, 0] == pytest.approx(1.0)
+        assert image[4, 6, 0] == pytest.approx(0.0)
+
+    def test_gradient_and_mask(self, tmp_path):
+        """Gradients interpolate across the frame; masks cut coverage."""
+        mask = np.zeros((12, 16), dtype=np.float32)
+        mask[:, 8:] = 1.0
+        config = _config()
+        config.add_layer(CompLayer(
+            name="Ramp", source="gradient", source_type=LayerSource.GRADIENT,
+            gradient_stops=[
+                GradientStop(0.0, (0.0, 0.0, 0.0, 1.0)),
+                GradientStop(1.0, (1.0, 1.0, 1.0, 1.0)),
+            ],
+            mask=LayerMask(source=_write_npy(tmp_path / "mask.npy", mask)),
+        ))
+        image = ArrayCompositor(config).composite(1)
+
+        assert np.all(image[:, :8, :3] == 0.0)
+        row = image[0, 8:, 0]
+        assert np.all(np.diff(row) > 0)
+        assert row[-1] == pytest.approx(15.5 / 16, abs=1e-5)
+
+    def test_layer_timing(self):
+        """Layers only composite between start_frame and end_frame."""
+        config = _config()
+        config.add_layer(CompLayer(
+            name="Flash", source="solid", source_type=LayerSource.SOLID,
+            solid_color=(1.0, 1.0, 1.0, 1.0), start_frame=2, end_frame=3,
+        ))
+        engine = ArrayCompositor(config)
+
+        assert engine.composite(1)[0, 0, 0] == 0.0
+        assert engine.composite(2)[0, 0, 0] == 1.0
+        assert engine.composite(4)[0, 0, 0] == 0.0
+
+    def test_missing_loader(self):
+        """Sources without a loader raise a clear error."""
+        config = _config()
+        config.add_layer(CompLayer(name="Video", source="clip.mov", source_type=LayerSource.VIDEO))
+        with pytest.raises(ValueError, match="No loader"):
+            ArrayCompositor(config).composite(1)
+
+    def test_mask_helpers(self):
+        """Expansion grows masks and feathering softens edges."""
+        mask = np.zeros((21, 21), dtype=np.float32)
+        mask[10, 10] = 1.0
+        grown = expand_mask(mask, 1)
+        assert grown.sum() == 9
+        assert expand_mask(grown, -1).sum() == 1
+
+        soft = feather_mask(grown, 4)
+        assert soft.sum() == pytest.approx(9, rel=1e-4)
+        assert 0 < soft.max() < 1
+
+    def test_resolve_frame_path(self):
+        """Sequence patterns are resolved per frame."""
+        assert resolve_frame_path("plate.####.exr", 7) == "plate.0007.exr"
+        assert resolve_frame_path("plate.%03d.png", 12) == "plate.012.png"
+        assert resolve_frame_path("plate_{frame:05d}.png", 3) == "plate_00003.png"
+        assert resolve_frame_path("still.png", 3) == "still.png"
+
+
+class TestLayerCompositorRendering:
+    """Tests for LayerCompositor rendering and caching."""
+
+    def test_static_layers_are_cached(self):
+        """Unchanged layers are reused across frames."""
+        comp = LayerCompositor(_config())
+        comp.create_solid_layer("Fill", (0.2, 0.4, 0.6, 1.0))
+        comp.render_frame(1)
+
+        entry = comp._layer_cache["Fill"]
+        assert isinstance(entry, LayerCacheEntry)
+        comp.render_frame(2)
+        assert comp._layer_cache["Fill"] is entry
+
+        comp.set_opacity("Fill", 0.5)
+        assert "Fill" not in comp._layer_cache
+
+    def test_source_mtime_invalidates(self, tmp_path):
+        """Rewriting a source file recomputes only that layer."""
+        plate_path = tmp_path / "plate.npy"
+        _write_npy(plate_path, np.full((12, 16, 4), (0.25, 0.25, 0.25, 1.0)))
+        comp = LayerCompositor(_config())
+        comp.create_solid_layer("Fill", (0.1, 0.1, 0.1, 1.0))
+        comp.create_image_layer("Plate", str(plate_path), opacity=0.5)
+
+        comp.composite_frame(1)
+        fill_entry = comp._layer_cache["Fill"]
+        plate_entry = comp._layer_cache["Plate"]
+
+        _write_npy(plate_path, np.full((12, 16, 4), (0.75, 0.75, 0.75, 1.0)))
+        stat = os.stat(plate_path)
+        os.utime(plate_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        image = comp.composite_frame(1)
+
+        assert comp._layer_cache["Fill"] is fill_entry
+        assert comp._layer_cache["Plate"] is not plate_entry
+        assert image[0, 0, 0] == pytest.approx(0.1 * 0.5 + 0.75 * 0.5)
+
+    def test_render_writes_sequence(self, tmp_path):
+        """render_all writes one image per frame across worker processes."""
+        pytest.importorskip("PIL")
+        comp = LayerCompositor(_config(output_path=str(tmp_path / "comp_####.png")))
+        comp.create_solid_layer("Fill", (1.0, 0.5, 0.0, 1.0))
+
+        results = comp.render_all(workers=2)
+
+        assert [r.frame for r in results] == [1, 2, 3, 4]
+        assert all(r.success for r in results)
+        assert results[0].output_path == str(tmp_path / "comp_0001.png")
+        assert sorted(os.listdir(tmp_path)) == [f"comp_000{i}.png" for i in range(1, 5)]
+
+    def test_render_reports_errors(self):
+        """A missing source fails the frame instead of raising."""
+        comp = LayerCompositor(_config())
+        comp.create_image_layer("Plate", "/nonexistent/plate_####.png")
+
+        result = comp.render_frame(1)
+        assert result.success is False
+        assert "not found" in result.error
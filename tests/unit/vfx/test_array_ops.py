@@ -0,0 +1,129 @@
+"""
+Tests for lib/vfx/array_ops.py
+
+Checks that the vectorized blend modes and color correction match the
+scalar implementations in blend_modes.py and color_correction.py.
+"""
+
+import pytest
+
+from lib.vfx import array_ops, blend_modes, color_correction
+from lib.vfx.compositor_types import BlendMode, ColorCorrection
+
+np = pytest.importorskip("numpy")
+
+
+SEPARABLE_MODES = [
+    "normal", "multiply", "screen", "add", "subtract", "difference",
+    "overlay", "soft_light", "hard_light", "color_dodge", "color_burn",
+    "linear_dodge", "linear_burn", "darken", "lighten", "exclusion",
+    "pin_light", "hard_mix",
+]
+
+RGB_MODES = ["hue", "saturation", "color", "luminosity"]
+
+
+@pytest.fixture
+def pixels():
+    """Random base/over colors including edge values and grays."""
+    rng = np.random.default_rng(0)
+    base = rng.uniform(0, 1, (300, 3)).astype(np.float32)
+    over = rng.uniform(0, 1, (300, 3)).astype(np.float32)
+    over[:10] = 1.0
+    over[10:20] = 0.0
+    base[20:30] = base[20:30, :1]
+    return base, over
+
+
+def _scalar_rgb(func, *arrays, **kwargs):
+    return np.array([
+        func(*[float(v) for a in row for v in a], **kwargs)
+        for row in zip(*arrays)
+    ])
+
+
+class TestArrayBlendModes:
+    """Tests for vectorized blend modes."""
+
+    @pytest.mark.parametrize("name", SEPARABLE_MODES)
+    def test_matches_scalar(self, pixels, name):
+        """Per-channel modes match the scalar functions."""
+        base, over = pixels
+        scalar = np.vectorize(getattr(blend_modes, f"blend_{name}"))
+        result = getattr(array_ops, f"blend_{name}")(base, over, 0.7)
+
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, scalar(base, over, 0.7), atol=1e-5)
+
+    @pytest.mark.parametrize("name", RGB_MODES)
+    def test_rgb_modes_match_scalar(self, pixels, name):
+        """HSL component modes match the scalar functions."""
+        base, over = pixels
+        scalar = getattr(blend_modes, f"blend_{name}")
+        expected = np.array([
+            scalar(tuple(map(float, b)), tuple(map(float, o)), 0.7)
+            for b, o in zip(base, over)
+        ])
+        result = getattr(array_ops, f"blend_{name}")(base, over, 0.7)
+        np.testing.assert_allclose(result, expected, atol=1e-4)
+
+    def test_per_pixel_opacity(self, pixels):
+        """Opacity can vary per pixel."""
+        base, over = pixels
+        opacity = np.linspace(0, 1, len(base), dtype=np.float32)[:, None]
+        result = array_ops.blend_arrays(BlendMode.SCREEN, base, over, opacity)
+        np.testing.assert_allclose(result[0], base[0])
+        np.testing.assert_allclose(result[-1], array_ops.blend_screen(base[-1], over[-1]))
+
+    def test_registry_covers_blend_mode_enum(self):
+        """Every BlendMode has an array implementation."""
+        registered = set(array_ops.ARRAY_BLEND_MODES) | set(array_ops.ARRAY_BLEND_MODES_RGB)
+        assert registered == {mode.value for mode in BlendMode}
+
+
+class TestArrayColorCorrection:
+    """Tests for vectorized color correction."""
+
+    @pytest.mark.parametrize("cc", [
+        ColorCorrection(),
+        ColorCorrection(
+            exposure=0.5, contrast=1.2, saturation=0.8, gamma=1.3,
+            lift=(0.1, 0.0, 0.05), gain=(1.1, 0.9, 1.0), hue_shift=0.1,
+            temperature=30, tint=20, highlights=-10, shadows=15,
+        ),
+        ColorCorrection(tint=-40, gamma=0.7, hue_shift=-0.3),
+    ])
+    def test_matches_scalar(self, pixels, cc):
+        """The combined correction matches apply_color_correction."""
+        rgb = pixels[0] * 1.5 - 0.1
+        expected = _scalar_rgb(color_correction.apply_color_correction, rgb, cc=cc)
+        np.testing.assert_allclose(array_ops.apply_color_correction(rgb, cc), expected, atol=1e-4)
+
+    def test_hsv_round_trip(self, pixels):
+        """HSV conversion matches the scalar helpers."""
+        rgb = pixels[0]
+        h, s, v = array_ops.rgb_to_hsv(rgb)
+        expected = _scalar_rgb(color_correction.rgb_to_hsv, rgb)
+        np.testing.assert_allclose(np.stack([h, s, v], axis=-1), expected, atol=1e-5)
+        np.testing.assert_allclose(array_ops.hsv_to_rgb(h, s, v), rgb, atol=1e-5)
+
+    def test_curves_levels_and_cdl(self, pixels):
+        """Single-value operations match their scalar counterparts."""
+        values = pixels[0][:, 0] * 1.2 - 0.1
+        points = [(0.0, 0.0), (0.3, 0.5), (1.0, 1.0)]
+
+        np.testing.assert_allclose(
+            array_ops.apply_curve(values, points),
+            [color_correction.apply_curve(float(v), points) for v in values],
+            atol=1e-6,
+        )
+        np.testing.assert_allclose(
+            array_ops.apply_levels(values, 0.1, 0.9, 1.2, 0.05, 0.95),
+            [color_correction.apply_levels(float(v), 0.1, 0.9, 1.2, 0.05, 0.95) for v in values],
+            atol=1e-5,
+        )
+        np.testing.assert_allclose(
+            array_ops.apply_cdl(values, 1.1, 0.01, 1.2),
+            [color_correction.apply_cdl(float(v), 1.1, 0.01, 1.2) for v in values],
+            atol=1e-5,
+        )